@@ -0,0 +1,90 @@
+import json
+import time
+import base64
+import socket
+import argparse
+import statistics
+
+from pathlib import Path
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Benchmark tunnel setup through a running proxy, with the proxy side DNS time split out.')
+    parser.add_argument('--proxy', required=True, help='Proxy to benchmark as ip:port, e.g. the ip_address and port of the action')
+    parser.add_argument('--hosts', default='github.com,pypi.org,files.pythonhosted.org', help='Comma separated hosts to open tunnels to on port 443')
+    parser.add_argument('--runs', type=int, default=20, help='Number of tunnels per host and address kind')
+    parser.add_argument('--basic-auth', default='', help='Proxy credentials as username:password (empty means none)')
+    parser.add_argument('--output', default='proxy_bench.json', help='Path to save the JSON results to')
+
+    return parser.parse_args()
+
+
+def time_tunnel(proxy_host, proxy_port, target, auth_header, timeout=10):
+    """Time the proxy connect and the CONNECT round trip, which includes the proxy resolving the target."""
+    start = time.perf_counter()
+    with socket.create_connection((proxy_host, proxy_port), timeout=timeout) as sock:
+        connected = time.perf_counter()
+        sock.sendall(f'CONNECT {target}:443 HTTP/1.1\r\nHost: {target}:443\r\n{auth_header}\r\n'.encode())
+        response = b''
+        while b'\r\n\r\n' not in response:
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            response += chunk
+        tunneled = time.perf_counter()
+
+    status = response.split(b'\r\n', 1)[0].decode(errors='replace')
+    if ' 200' not in status:
+        raise RuntimeError(f"CONNECT {target} through the proxy failed with '{status}'")
+    return connected - start, tunneled - connected
+
+
+def bench_host(proxy_host, proxy_port, host, runs, auth_header):
+    """Open tunnels to the host by name and by address, alternating so both see the same conditions."""
+    # resolved here, so the proxy does not have to when the tunnel targets the address
+    address = socket.getaddrinfo(host, 443, socket.AF_INET, socket.SOCK_STREAM)[0][4][0]
+    by_name, by_address, proxy_connect = [], [], []
+    for _ in range(runs):
+        connect_secs, tunnel_secs = time_tunnel(proxy_host, proxy_port, host, auth_header)
+        proxy_connect.append(connect_secs)
+        by_name.append(tunnel_secs)
+        connect_secs, tunnel_secs = time_tunnel(proxy_host, proxy_port, address, auth_header)
+        proxy_connect.append(connect_secs)
+        by_address.append(tunnel_secs)
+
+    return {
+        'host': host,
+        'address': address,
+        'proxy_connect_median_secs': statistics.median(proxy_connect),
+        'tunnel_by_name_median_secs': statistics.median(by_name),
+        'tunnel_by_address_median_secs': statistics.median(by_address),
+        # the only difference between the two tunnels is the lookup the proxy does
+        'dns_median_secs': max(0.0, statistics.median(by_name) - statistics.median(by_address)),
+        'tunnel_by_name_runs': by_name,
+        'tunnel_by_address_runs': by_address,
+    }
+
+
+def main():
+    args = parse_arguments()
+
+    proxy_host, proxy_port = args.proxy.rsplit(':', 1)
+    auth_header = ''
+    if args.basic_auth != '':
+        auth_header = f'Proxy-Authorization: Basic {base64.b64encode(args.basic_auth.encode()).decode()}\r\n'
+
+    results = []
+    for host in args.hosts.split(','):
+        result = bench_host(proxy_host, int(proxy_port), host.strip(), args.runs, auth_header)
+        results.append(result)
+        print(f"{result['host']:<28} connect={result['proxy_connect_median_secs'] * 1000:.1f}ms "
+              f"tunnel={result['tunnel_by_name_median_secs'] * 1000:.1f}ms "
+              f"dns={result['dns_median_secs'] * 1000:.1f}ms")
+
+    Path(args.output).write_text(json.dumps({'proxy': args.proxy, 'results': results}, indent=2))
+    print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import sys
+import json
+import time
+import shutil
+import argparse
+import statistics
+import subprocess
+
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = [
+    ROOT / 'start' / 'start.py',
+    ROOT / 'stop' / 'stop_js' / 'stop.py',
+    ROOT / 'cleanup' / 'stop_all.py',
+]
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Benchmark how long the provisioning scripts take to start up.')
+    parser.add_argument('--runs', type=int, default=5, help='Number of timed runs per script and launcher')
+    parser.add_argument('--python', default=sys.executable, help='Python of the prepared project environment')
+    parser.add_argument('--compare-uv-with', action='store_true', help='Also time the old "uv run --with oci" launcher')
+    parser.add_argument('--output', default='startup_bench.json', help='Path to save the JSON results to')
+
+    return parser.parse_args()
+
+
+def time_command(cmd, runs):
+    """Time a command that exits right after argument parsing, after one untimed warm-up run."""
+    subprocess.run(cmd, check=True, capture_output=True)
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, check=True, capture_output=True)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def top_imports(python, script, count=5):
+    """Get the slowest top level imports of a script from -X importtime."""
+    result = subprocess.run([python, '-X', 'importtime', str(script), '--help'],
+                            check=True, capture_output=True, text=True)
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not name.startswith('  '):
+            imports.append((name.strip(), int(cumulative) / 1e6))
+    return sorted(imports, key=lambda i: i[1], reverse=True)[:count]
+
+
+def main():
+    args = parse_arguments()
+
+    launchers = {'project-env': [args.python]}
+    if args.compare_uv_with:
+        if shutil.which('uv') is None:
+            raise RuntimeError("uv is needed to compare with 'uv run --with oci'")
+        launchers['uv-run-with-oci'] = ['uv', 'run', '--with', 'oci']
+
+    results = []
+    for script in SCRIPTS:
+        for launcher, prefix in launchers.items():
+            durations = time_command(prefix + [str(script), '--help'], args.runs)
+            result = {
+                'script': str(script.relative_to(ROOT)),
+                'launcher': launcher,
+                'runs': durations,
+                'median_secs': statistics.median(durations),
+            }
+            if launcher == 'project-env':
+                result['top_imports'] = top_imports(args.python, script)
+            results.append(result)
+            print(f"{result['script']:<24} {launcher:<16} median={result['median_secs']:.3f}s")
+
+    Path(args.output).write_text(json.dumps({'python': args.python, 'results': results}, indent=2))
+    print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+import sys
+import json
+import time
+import argparse
+import datetime
+import tracemalloc
+import contextlib
+from types import SimpleNamespace
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import stop_all
+from oci_proxy.clients import RateLimiter, ThrottledClient
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Benchmark the cleanup sweep against a local OCI stand-in.')
+    parser.add_argument('--sizes', default='10,100,1000', help='Comma separated numbers of leaked proxy stacks to benchmark')
+    parser.add_argument('--extra-resources', type=int, default=100, help='Unrelated instances and VCNs in the compartment')
+    parser.add_argument('--api-latency-ms', type=float, default=0.0, help='Simulated latency of every API call in ms')
+    parser.add_argument('--page-limit', type=int, default=100, help='Items returned per page by the list calls')
+    parser.add_argument('--output', default='cleanup_bench.json', help='Path to save the JSON results to')
+
+    return parser.parse_args()
+
+
+class FakeCloud:
+    """In-memory stand-in for a compartment, counting every API call made against it."""
+
+    def __init__(self, compartment_id, api_latency_ms=0.0, page_limit=100):
+        self.compartment_id = compartment_id
+        self.api_latency_secs = api_latency_ms / 1000
+        self.page_limit = page_limit
+        self.calls = Counter()
+        self.resources = defaultdict(dict)
+        self.next_id = 0
+
+    def record(self, method):
+        self.calls[method] += 1
+        if self.api_latency_secs > 0:
+            time.sleep(self.api_latency_secs)
+
+    def add(self, kind, **attrs):
+        self.next_id += 1
+        resource = SimpleNamespace(id=f'ocid1.{kind}.fake.{self.next_id}',
+                                   compartment_id=self.compartment_id,
+                                   **attrs)
+        self.resources[kind][resource.id] = resource
+        return resource
+
+    def list(self, kind, page=None, **filters):
+        """Return one page of the matching resources, with the opc-next-page header set when more follow."""
+        matches = [r for r in self.resources[kind].values()
+                   if all(getattr(r, f) == v for f, v in filters.items())]
+        start = int(page or 0)
+        end = start + self.page_limit
+        headers = {'opc-next-page': str(end)} if end < len(matches) else {}
+        return stop_all.oci.response.Response(200, headers, matches[start:end], None)
+
+    def remove(self, resource_id):
+        kind = resource_id.split('.')[1]
+        resource = self.resources[kind].pop(resource_id)
+        resource.lifecycle_state = 'TERMINATED'
+
+    def add_stack(self, suffix, time_created):
+        """Add the resources start.py creates for one proxy."""
+        vcn = self.add('vcn', display_name=f'vcn-{suffix}', lifecycle_state='AVAILABLE')
+        ig = self.add('internetgateway', vcn_id=vcn.id, display_name=f'ig-{suffix}', lifecycle_state='AVAILABLE')
+        self.add('routetable', vcn_id=vcn.id, display_name=f'Default Route Table for {vcn.display_name}',
+                 route_rules=[SimpleNamespace(destination='0.0.0.0/0', network_entity_id=ig.id)])
+        self.add('securitylist', vcn_id=vcn.id, display_name=f'Default Security List for {vcn.display_name}')
+        sl = self.add('securitylist', vcn_id=vcn.id, display_name=f'sl-{suffix}')
+        self.add('subnet', vcn_id=vcn.id, display_name=f'subnet-{suffix}', lifecycle_state='AVAILABLE',
+                 security_list_ids=[sl.id])
+        self.add('instance', display_name=f'proxy-{suffix}', lifecycle_state='RUNNING', time_created=time_created)
+
+
+class FakeComputeClient:
+    def __init__(self, cloud):
+        self.cloud = cloud
+
+    def list_instances(self, compartment_id, page=None):
+        self.cloud.record('list_instances')
+        return self.cloud.list('instance', page, compartment_id=compartment_id)
+
+    def terminate_instance(self, instance_id):
+        self.cloud.record('terminate_instance')
+        self.cloud.remove(instance_id)
+
+    def get_instance(self, instance_id):
+        self.cloud.record('get_instance')
+
+
+class FakeComputeManagementClient:
+    def __init__(self, cloud):
+        self.cloud = cloud
+
+    def list_instance_pools(self, compartment_id, page=None):
+        self.cloud.record('list_instance_pools')
+        return self.cloud.list('instancepool', page, compartment_id=compartment_id)
+
+
+class FakeVirtualNetworkClient:
+    def __init__(self, cloud):
+        self.cloud = cloud
+
+    def __getattr__(self, name):
+        kinds = {
+            'vcn': 'vcn',
+            'vcns': 'vcn',
+            'subnet': 'subnet',
+            'subnets': 'subnet',
+            'route_tables': 'routetable',
+            'security_list': 'securitylist',
+            'security_lists': 'securitylist',
+            'internet_gateway': 'internetgateway',
+            'internet_gateways': 'internetgateway',
+        }
+        action, _, kind = name.partition('_')
+        if kind not in kinds:
+            raise AttributeError(name)
+
+        def call(*args, **kwargs):
+            self.cloud.record(name)
+            if action == 'list':
+                return self.cloud.list(kinds[kind], **kwargs)
+            if action == 'delete':
+                self.cloud.remove(args[0])
+
+        return call
+
+    def update_route_table(self, route_table_id, details):
+        self.cloud.record('update_route_table')
+        self.cloud.resources['routetable'][route_table_id].route_rules = details.route_rules
+
+
+def fake_wait_until(client, response, *args, **kwargs):
+    """Resources in the stand-in change state immediately, so waiting is a no-op."""
+    return response
+
+
+def build_cloud(num_stacks, extra_resources, api_latency_ms, page_limit):
+    """Build a compartment with leaked proxy stacks plus unrelated young resources."""
+    cloud = FakeCloud('ocid1.compartment.fake', api_latency_ms, page_limit)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    old = now - datetime.timedelta(hours=2)
+    for i in range(num_stacks):
+        cloud.add_stack(f'{1700000000 + i}', old)
+    for i in range(extra_resources):
+        cloud.add('instance', display_name=f'other-{i}', lifecycle_state='RUNNING', time_created=now)
+        cloud.add('vcn', display_name=f'other-vcn-{i}', lifecycle_state='AVAILABLE')
+    return cloud
+
+
+def measure(name, num_stacks, cloud, func):
+    """Run func once, recording API calls, wall time and peak memory."""
+    cloud.calls.clear()
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(None):
+        func()
+    wall_time = time.perf_counter() - start
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result = {
+        'phase': name,
+        'stacks': num_stacks,
+        'api_calls': sum(cloud.calls.values()),
+        'api_calls_by_method': dict(cloud.calls),
+        'wall_time_secs': wall_time,
+        'peak_memory_bytes': peak_memory,
+    }
+    print(f"{name:<28} stacks={num_stacks:<6} api_calls={result['api_calls']:<8} "
+          f"wall={wall_time:.3f}s peak_mem={peak_memory / 1024:.0f}KiB")
+    return result
+
+
+def run_size(num_stacks, args):
+    """Benchmark the sweep phases for one compartment size."""
+    results = []
+    max_duration_secs = 3600
+
+    # the limiter is left effectively unthrottled so only the sweep itself is measured
+    limiter = RateLimiter(1e9, 1e9, 0)
+
+    cloud = build_cloud(num_stacks, args.extra_resources, args.api_latency_ms, args.page_limit)
+    compute = ThrottledClient(FakeComputeClient(cloud), 'compute', limiter)
+    network = ThrottledClient(FakeVirtualNetworkClient(cloud), 'network', limiter)
+    compute_management = ThrottledClient(FakeComputeManagementClient(cloud), 'compute_management', limiter)
+
+    results.append(measure('get_long_running_instances', num_stacks, cloud,
+                           lambda: stop_all.get_long_running_instances(compute, cloud.compartment_id, max_duration_secs)))
+    results.append(measure('get_suffix_list', num_stacks, cloud,
+                           lambda: stop_all.get_suffix_list(compute, cloud.compartment_id, max_duration_secs)))
+    results.append(measure('sweep_compartment', num_stacks, cloud,
+                           lambda: stop_all.sweep_compartment(compute, network, compute_management,
+                                                                     cloud.compartment_id, max_duration_secs)))
+
+    leaked = [r for resources in cloud.resources.values() for r in resources.values()
+              if not r.display_name.startswith(('other-', 'Default '))]
+    if leaked:
+        raise RuntimeError(f"Sweep left {len(leaked)} proxy resources behind")
+    return results
+
+
+def main():
+    args = parse_arguments()
+
+    stop_all.oci.wait_until = fake_wait_until
+    # load the lazily imported models up front so the first size does not pay for it
+    stop_all.oci.core.models.UpdateRouteTableDetails
+
+    results = []
+    for size in args.sizes.split(','):
+        results.extend(run_size(int(size), args))
+
+    report = {
+        'python': sys.version.split()[0],
+        'extra_resources': args.extra_resources,
+        'api_latency_ms': args.api_latency_ms,
+        'page_limit': args.page_limit,
+        'results': results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
 import argparse
-
 import datetime
 from datetime import timezone
 from pathlib import Path
-import oci
+
+from oci_proxy import lazy_import
+from oci_proxy.clients import RateLimiter, create_clients, create_compute_management_client
+from oci_proxy.lookups import get_instance_by_name
+from oci_proxy.teardown import terminate_instance, delete_vcn
+
+oci = lazy_import('oci')
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -11,16 +16,24 @@ def parse_arguments():
     parser.add_argument('--config-file', required=True, help='Location of config file')
     parser.add_argument('--compartment-name', required=True, help='Name of the compartment')
     parser.add_argument('--max-duration-secs', required=True, help='Maximum run time after which  instance is eligible for cleanup')
+    parser.add_argument('--regions', default='', help='Comma separated regions to clean up (empty means the config region)')
+
+    parser.add_argument('--api-rate', type=float, default=2.0, help='Sustained OCI API calls per second allowed per service')
+    parser.add_argument('--api-burst', type=int, default=4, help='Burst size of the per service OCI API token bucket')
+    parser.add_argument('--retry-budget', type=int, default=30, help='Total number of OCI API retries allowed for this run')
 
     return parser.parse_args()
  
+
+
 def get_compartment_id_by_name(config, identity_client, compartment_name):
     """Get compartment ID by name."""
     # First, get the root compartment (tenancy) ID
     tenancy_id = config.get("tenancy")
     
     # List all compartments in the tenancy
-    response = identity_client.list_compartments(
+    response = oci.pagination.list_call_get_all_results(
+        identity_client.list_compartments,
         compartment_id=tenancy_id,
         compartment_id_in_subtree=True
     )
@@ -33,65 +46,57 @@ def get_compartment_id_by_name(config, identity_client, compartment_name):
     # If not found
     raise ValueError(f"Compartment with name '{compartment_name}' not found.")
 
-def get_instance_by_name(compute, compartment_id, instance_name):
-    """Get instance by name."""
-    instances = compute.list_instances(
+def find_instance_pool(compute_management, compartment_id, pool_name):
+    """Find a live instance pool by name, None when the proxy was not launched through a pool."""
+    pools = oci.pagination.list_call_get_all_results(
+        compute_management.list_instance_pools,
         compartment_id=compartment_id
     ).data
-    
-    for instance in instances:
-        if instance.display_name == instance_name and instance.lifecycle_state != "TERMINATED":
-            return instance
-    
-    raise ValueError(f"Instance with name '{instance_name}' not found.")
 
+    for pool in pools:
+        if pool.display_name == pool_name and pool.lifecycle_state not in ('TERMINATING', 'TERMINATED'):
+            return pool
+    return None
 
-def terminate_instance(compute, instance_id, wait=True):
-    """Terminate a compute instance."""
-    print(f"Terminating instance: {instance_id}...")
-    compute.terminate_instance(instance_id)
-    
-    if wait:
-        try:
-            oci.wait_until(
-                compute,
-                compute.get_instance(instance_id),
-                'lifecycle_state',
-                'TERMINATED',
-                max_wait_seconds=300
-            )
-            print(f"Instance {instance_id} terminated successfully.")
-        except oci.exceptions.ServiceError as e:
-            if e.status == 404:
-                print(f"Instance {instance_id} terminated successfully.")
-            else:
-                raise
 
-def delete_vcn(network, vcn_id, wait=True):
-    """Delete a VCN."""
-    print(f"Deleting VCN: {vcn_id}...")
-    network.delete_vcn(vcn_id)
-    
+def terminate_instance_pool(compute_management, pool_id, wait=True):
+    """Terminate an instance pool together with all of its instances."""
+    print(f"Terminating instance pool: {pool_id}...")
+    compute_management.terminate_instance_pool(pool_id)
+
     if wait:
         try:
-            oci.wait_until(
-                network,
-                network.get_vcn(vcn_id),
+            compute_management.wait_until(
+                compute_management.get_instance_pool(pool_id),
                 'lifecycle_state',
                 'TERMINATED',
-                max_wait_seconds=300
+                max_wait_seconds=600
             )
-            print(f"VCN {vcn_id} deleted successfully.")
+            print(f"Instance pool {pool_id} terminated successfully.")
         except oci.exceptions.ServiceError as e:
             if e.status == 404:
-                print(f"VCN {vcn_id} deleted successfully.")
+                print(f"Instance pool {pool_id} terminated successfully.")
             else:
                 raise
 
 
+def delete_instance_configuration(compute_management, compartment_id, configuration_name):
+    """Delete the instance configuration a pool was launched from, if there is one."""
+    configurations = oci.pagination.list_call_get_all_results(
+        compute_management.list_instance_configurations,
+        compartment_id=compartment_id
+    ).data
+
+    for configuration in configurations:
+        if configuration.display_name == configuration_name:
+            print(f"Deleting instance configuration: {configuration.id}...")
+            compute_management.delete_instance_configuration(configuration.id)
+
+
 def get_vcn_by_name(network, compartment_id, vcn_name):
     """Get VCN by name."""
-    vcns = network.list_vcns(
+    vcns = oci.pagination.list_call_get_all_results(
+        network.list_vcns,
         compartment_id=compartment_id
     ).data
     
@@ -108,8 +113,7 @@ def delete_internet_gateway(network, ig_id, wait=True):
     
     if wait:
         try:
-            oci.wait_until(
-                network,
+            network.wait_until(
                 network.get_internet_gateway(ig_id),
                 'lifecycle_state',
                 'TERMINATED',
@@ -124,7 +128,8 @@ def delete_internet_gateway(network, ig_id, wait=True):
 
 def get_internet_gateways(network, compartment_id, vcn_id):
     """Get all internet gateways for a VCN."""
-    return network.list_internet_gateways(
+    return oci.pagination.list_call_get_all_results(
+        network.list_internet_gateways,
         compartment_id=compartment_id,
         vcn_id=vcn_id
     ).data
@@ -147,8 +152,7 @@ def delete_security_list(network, security_list_id, wait=True):
     
     if wait:
         try:
-            oci.wait_until(
-                network,
+            network.wait_until(
                 network.get_security_list(security_list_id),
                 'lifecycle_state',
                 'TERMINATED',
@@ -163,21 +167,24 @@ def delete_security_list(network, security_list_id, wait=True):
 
 def get_route_tables(network, compartment_id, vcn_id):
     """Get all route tables for a VCN."""
-    return network.list_route_tables(
+    return oci.pagination.list_call_get_all_results(
+        network.list_route_tables,
         compartment_id=compartment_id,
         vcn_id=vcn_id
     ).data
 
 def get_security_lists(network, compartment_id, vcn_id):
     """Get all security lists for a VCN."""
-    return network.list_security_lists(
+    return oci.pagination.list_call_get_all_results(
+        network.list_security_lists,
         compartment_id=compartment_id,
         vcn_id=vcn_id
     ).data
 
 def get_subnet_by_name(network, compartment_id, vcn_id, subnet_name):
     """Get subnet by name."""
-    subnets = network.list_subnets(
+    subnets = oci.pagination.list_call_get_all_results(
+        network.list_subnets,
         compartment_id=compartment_id,
         vcn_id=vcn_id
     ).data
@@ -195,8 +202,7 @@ def delete_subnet(network, subnet_id, wait=True):
     
     if wait:
         try:
-            oci.wait_until(
-                network,
+            network.wait_until(
                 network.get_subnet(subnet_id),
                 'lifecycle_state',
                 'TERMINATED',
@@ -226,7 +232,7 @@ def get_long_running_instances(compute_client, compartment_id, max_duration_secs
     now = datetime.datetime.now(timezone.utc)
     
     # List all instances in the compartment
-    response = compute_client.list_instances(compartment_id=compartment_id)
+    response = oci.pagination.list_call_get_all_results(compute_client.list_instances, compartment_id=compartment_id)
     
     long_running_instances = []
     
@@ -262,27 +268,30 @@ def get_suffix_list(compute_client, compartment_id, max_duration_secs):
 
     return suffixes
 
-def main():
-    # Parse command line arguments
-    args = parse_arguments()
-
-    config = oci.config.from_file(file_location=args.config_file)
-    
-    compute_client = oci.core.ComputeClient(config)
-    network_client = oci.core.VirtualNetworkClient(config)
-    identity_client = oci.identity.IdentityClient(config)
-
+def get_pool_suffix_list(compute_management_client, compartment_id, max_duration_secs):
+    """Get the suffixes of the proxy pools that have been up for longer than the given seconds."""
+    now = datetime.datetime.now(timezone.utc)
+    pools = oci.pagination.list_call_get_all_results(compute_management_client.list_instance_pools, compartment_id=compartment_id).data
 
-    compartment_id = get_compartment_id_by_name(config,
-                                                identity_client,
-                                                args.compartment_name)
+    return [pool.display_name[len('pool-'):] for pool in pools
+            if pool.display_name.startswith('pool-') and
+            pool.lifecycle_state not in ('TERMINATING', 'TERMINATED') and
+            (now - pool.time_created).total_seconds() > max_duration_secs]
 
-    suffix_list = get_suffix_list(compute_client, compartment_id, int(args.max_duration_secs))
+def sweep_compartment(compute_client, network_client, compute_management_client, compartment_id, max_duration_secs):
+    """Tear down every proxy stack in the compartment that has been running for too long."""
+    pool_suffix_list = get_pool_suffix_list(compute_management_client, compartment_id, max_duration_secs)
+    suffix_list = get_suffix_list(compute_client, compartment_id, max_duration_secs) + pool_suffix_list
     print(f'{suffix_list=}')
     for suffix in suffix_list:
         try:
-            instance = get_instance_by_name(compute_client, compartment_id, f'proxy-{suffix}')
-            terminate_instance(compute_client, instance.id)
+            if suffix in pool_suffix_list:
+                pool = find_instance_pool(compute_management_client, compartment_id, f'pool-{suffix}')
+                terminate_instance_pool(compute_management_client, pool.id)
+                delete_instance_configuration(compute_management_client, compartment_id, f'ic-{suffix}')
+            else:
+                instance = get_instance_by_name(compute_client, compartment_id, f'proxy-{suffix}')
+                terminate_instance(compute_client, instance.id)
         except Exception as ex:
             print(f'ERROR: deleting instance proxy-{suffix} failed with ex: {ex}.. continuing')
 
@@ -314,6 +323,30 @@ def main():
         # delete vcn
         delete_vcn(network_client, vcn.id)
 
+def main():
+    # Parse command line arguments
+    args = parse_arguments()
+
+    config = oci.config.from_file(file_location=args.config_file)
+    
+    limiter = RateLimiter(args.api_rate, args.api_burst, args.retry_budget)
+
+    regions = [r.strip() for r in args.regions.split(',') if r.strip() != '']
+    for region in (regions or [config['region']]):
+        print(f"Cleaning up region: {region}")
+        config['region'] = region
+        compute_client, network_client, identity_client = create_clients(config, limiter)
+        compute_management_client = create_compute_management_client(config, limiter)
+
+        compartment_id = get_compartment_id_by_name(config,
+                                                    identity_client,
+                                                    args.compartment_name)
+
+        sweep_compartment(compute_client, network_client, compute_management_client,
+                          compartment_id, int(args.max_duration_secs))
+
+    print(f"OCI API stats: {limiter.metrics}")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,114 @@
+import json
+import argparse
+import statistics
+
+from pathlib import Path
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Convert proxy provisioning events to a trace and a summary table.')
+    parser.add_argument('events_files', nargs='+', help='JSON line event files written by start.py and stop.py')
+    parser.add_argument('--trace-out', default='', help='Path to save a Chrome trace / Perfetto JSON file to (empty means no trace)')
+    parser.add_argument('--summary-out', default='', help='Path to append a markdown summary table to, like $GITHUB_STEP_SUMMARY (empty means stdout)')
+    parser.add_argument('--summary-run', default='', help='Only summarize the events of this run, like stop once the start events were summarized (empty means all runs)')
+    parser.add_argument('--latest-run-id', action='store_true', help='Only summarize the events of the job that wrote the last event, skipping those earlier jobs left in the workspace')
+
+    return parser.parse_args()
+
+
+def read_events(paths):
+    """Read events from JSON line files, skipping blank lines."""
+    events = []
+    for path in paths:
+        for line in Path(path).read_text().splitlines():
+            if line.strip() != '':
+                events.append(json.loads(line))
+    return events
+
+
+def run_id(event):
+    """Get the job an event comes from, events written before run ids were added share an empty one."""
+    return event.get('run_id', '')
+
+
+def to_chrome_trace(events):
+    """Convert events to the Chrome trace event format, one process per job and one track per run in it."""
+    trace_events = []
+    run_ids = sorted({run_id(event) for event in events})
+    runs = sorted({(run_id(event), event['run']) for event in events})
+    for event in events:
+        if event['phase'] == 'api_stats':
+            continue
+        args = {k: v for k, v in event.items() if k not in ('ts', 'phase', 'run_id', 'run', 'duration_secs')}
+        trace_events.append({
+            'name': event['phase'],
+            'cat': event['resource_type'],
+            'ph': 'X',
+            'ts': event['ts'] * 1e6,
+            'dur': event['duration_secs'] * 1e6,
+            'pid': run_ids.index(run_id(event)) + 1,
+            'tid': runs.index((run_id(event), event['run'])),
+            'args': args,
+        })
+    for pid, job in enumerate(run_ids, 1):
+        trace_events.append({'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': job}})
+    for tid, (job, run) in enumerate(runs):
+        trace_events.append({'name': 'thread_name', 'ph': 'M', 'pid': run_ids.index(job) + 1, 'tid': tid,
+                             'args': {'name': run}})
+    return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+
+def summarize(events):
+    """Build a markdown table of per phase timings, aggregated over all runs in the events."""
+    phases = {}
+    for event in events:
+        if event['phase'] == 'api_stats':
+            continue
+        key = (run_id(event), event['run'], event['phase'])
+        phases.setdefault(key, []).append(event)
+
+    lines = [
+        '| job | run | phase | count | errors | total (s) | median (s) | max (s) |',
+        '| --- | --- | --- | ---: | ---: | ---: | ---: | ---: |',
+    ]
+    for (job, run, phase), phase_events in phases.items():
+        durations = [e['duration_secs'] for e in phase_events]
+        errors = sum(1 for e in phase_events if e['outcome'] != 'ok')
+        lines.append(f'| {job} | {run} | {phase} | {len(durations)} | {errors} | {sum(durations):.1f} '
+                     f'| {statistics.median(durations):.1f} | {max(durations):.1f} |')
+
+    for event in events:
+        if event['phase'] == 'api_stats':
+            lines.append('')
+            lines.append(f"OCI API ({run_id(event)} {event['run']}): {event['calls']} calls, {event['retries']} retries, "
+                         f"{event['throttled']} throttled for {event['throttled_secs']:.1f}s")
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    args = parse_arguments()
+
+    events = read_events(args.events_files)
+
+    if args.trace_out != '':
+        Path(args.trace_out).write_text(json.dumps(to_chrome_trace(events)))
+        print(f"Trace saved to {args.trace_out}")
+
+    title = 'Proxy provisioning timings'
+    if args.latest_run_id and events:
+        latest = run_id(events[-1])
+        events = [event for event in events if run_id(event) == latest]
+    if args.summary_run != '':
+        events = [event for event in events if event['run'] == args.summary_run]
+        title += f' ({args.summary_run})'
+    summary = summarize(events)
+    if args.summary_out != '':
+        with open(args.summary_out, 'a') as f:
+            f.write(f'### {title}\n\n' + summary)
+    else:
+        print(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+"""Code shared by the scripts behind the start, stop, rotate and cleanup actions."""
+import sys
+import importlib.util
+
+
+def lazy_import(name):
+    """Import a module that only loads on first attribute access, so --help and bad arguments skip the seconds the OCI SDK takes."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
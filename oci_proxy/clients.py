@@ -0,0 +1,126 @@
+import time
+import uuid
+import random
+import threading
+
+from oci_proxy import lazy_import
+
+oci = lazy_import('oci')
+
+
+class RateLimiter:
+    """Per-service token buckets with jittered exponential retries and a per-run retry budget."""
+
+    def __init__(self, rate_per_sec, burst, retry_budget, max_attempts=8,
+                 base_delay_secs=1.0, max_delay_secs=30.0):
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+        self.retry_budget = retry_budget
+        self.max_attempts = max_attempts
+        self.base_delay_secs = base_delay_secs
+        self.max_delay_secs = max_delay_secs
+        self.buckets = {}
+        # the preflight checks call the API from several threads at once
+        self.lock = threading.Lock()
+        self.metrics = {
+            'calls': 0,
+            'retries': 0,
+            'throttled': 0,
+            'throttled_secs': 0.0,
+            'bucket_wait_secs': 0.0,
+        }
+
+    def acquire(self, service):
+        """Block until the token bucket of the given service has a token to spend."""
+        with self.lock:
+            now = time.monotonic()
+            tokens, last = self.buckets.get(service, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate_per_sec) - 1
+            # the token is taken right away, going negative reserves it for the waiting caller
+            self.buckets[service] = (tokens, now)
+            self.metrics['calls'] += 1
+            wait = -tokens / self.rate_per_sec if tokens < 0 else 0
+            self.metrics['bucket_wait_secs'] += wait
+        if wait > 0:
+            time.sleep(wait)
+
+    def call(self, service, func, *args, **kwargs):
+        """Call func, retrying throttles and 5xx errors until attempts or the run budget run out."""
+        attempt = 0
+        while True:
+            self.acquire(service)
+            try:
+                return func(*args, **kwargs)
+            except oci.exceptions.ServiceError as e:
+                # out of capacity comes back as a 500 but will not clear up within a retry window
+                retryable = (e.status == 429 or (e.status >= 500 and e.status != 501)) \
+                    and 'out of host capacity' not in str(e.message).lower()
+                attempt += 1
+                # full jitter keeps concurrent runs from retrying in lockstep
+                delay = random.uniform(0, min(self.max_delay_secs, self.base_delay_secs * 2 ** attempt))
+                with self.lock:
+                    if not retryable or attempt >= self.max_attempts or self.retry_budget <= 0:
+                        raise
+                    self.retry_budget -= 1
+                    self.metrics['retries'] += 1
+                    if e.status == 429:
+                        self.metrics['throttled'] += 1
+                        self.metrics['throttled_secs'] += delay
+                print(f"{service} call {func.__name__} failed with {e.status} {e.code}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+
+class ThrottledClient:
+    """Wraps an OCI client so that every API method goes through the rate limiter."""
+
+    def __init__(self, client, service, limiter):
+        self._client = client
+        self._service = service
+        self._limiter = limiter
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+
+        def throttled_call(*args, **kwargs):
+            # retried creates must carry the same token so OCI does not create duplicates
+            if name.startswith(('create_', 'launch_')):
+                kwargs.setdefault('opc_retry_token', uuid.uuid4().hex)
+            return self._limiter.call(self._service, attr, *args, **kwargs)
+
+        return throttled_call
+
+    def wait_until(self, response, *args, **kwargs):
+        """Like oci.wait_until, but every poll goes through the rate limiter instead of the SDK retry strategy."""
+        def fetch(response):
+            return self._limiter.call(self._service, self._client.base_client.request, response.request)
+
+        return oci.wait_until(self._client, response, *args, fetch_func=fetch, **kwargs)
+
+
+def create_clients(config, limiter):
+    """Create the compute, network and identity clients behind the rate limiter."""
+    no_retry = oci.retry.NoneRetryStrategy()
+    compute_client = ThrottledClient(oci.core.ComputeClient(config, retry_strategy=no_retry), 'compute', limiter)
+    network_client = ThrottledClient(oci.core.VirtualNetworkClient(config, retry_strategy=no_retry), 'network', limiter)
+    identity_client = ThrottledClient(oci.identity.IdentityClient(config, retry_strategy=no_retry), 'identity', limiter)
+    return compute_client, network_client, identity_client
+
+
+def create_compute_management_client(config, limiter):
+    """Create the compute management client, used for instance pools, behind the rate limiter."""
+    no_retry = oci.retry.NoneRetryStrategy()
+    return ThrottledClient(oci.core.ComputeManagementClient(config, retry_strategy=no_retry), 'compute_management', limiter)
+
+
+def create_limits_client(config, limiter):
+    """Create the limits client, used to check service limits and quotas, behind the rate limiter."""
+    no_retry = oci.retry.NoneRetryStrategy()
+    return ThrottledClient(oci.limits.LimitsClient(config, retry_strategy=no_retry), 'limits', limiter)
+
+
+def create_monitoring_client(config, limiter):
+    """Create the monitoring client, used to read the compute agent metrics, behind the rate limiter."""
+    no_retry = oci.retry.NoneRetryStrategy()
+    return ThrottledClient(oci.monitoring.MonitoringClient(config, retry_strategy=no_retry), 'monitoring', limiter)
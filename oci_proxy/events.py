@@ -0,0 +1,57 @@
+import os
+import json
+import time
+import contextlib
+
+
+def current_run_id():
+    """Identify the job the events come from, so events left in the workspace by earlier jobs are told apart."""
+    run_id = os.environ.get('GITHUB_RUN_ID', '')
+    if run_id == '':
+        return 'local'
+    return f"{run_id}-{os.environ.get('GITHUB_RUN_ATTEMPT', '1')}-{os.environ.get('GITHUB_JOB', '')}"
+
+
+class EventLog:
+    """Writes structured provisioning events as JSON lines."""
+
+    def __init__(self, path, run, run_id=None):
+        self.run = run
+        self.run_id = current_run_id() if run_id is None else run_id
+        self.file = open(path, 'a') if path != '' else None
+        # kept for the run history, which is recorded from the events at the end of the run
+        self.events = []
+
+    def emit(self, phase, resource_type, ocid=None, start=None, duration_secs=0.0, outcome='ok', **extra):
+        """Write one event, timestamped with the monotonic clock."""
+        event = {
+            'ts': time.monotonic() if start is None else start,
+            'wall_time': time.time(),
+            'run_id': self.run_id,
+            'run': self.run,
+            'phase': phase,
+            'resource_type': resource_type,
+            'ocid': ocid,
+            'duration_secs': duration_secs,
+            'outcome': outcome,
+        }
+        event.update(extra)
+        self.events.append(event)
+        if self.file is None:
+            return
+        self.file.write(json.dumps(event) + '\n')
+        self.file.flush()
+
+    @contextlib.contextmanager
+    def phase(self, phase, resource_type):
+        """Time the wrapped block and emit it as an event, with any fields set on the yielded dict."""
+        start = time.monotonic()
+        event = {'ocid': None}
+        try:
+            yield event
+        except Exception as e:
+            ocid = event.pop('ocid')
+            self.emit(phase, resource_type, ocid, start, time.monotonic() - start, 'error', error=str(e), **event)
+            raise
+        ocid = event.pop('ocid')
+        self.emit(phase, resource_type, ocid, start, time.monotonic() - start, **event)
@@ -0,0 +1,17 @@
+from oci_proxy import lazy_import
+
+oci = lazy_import('oci')
+
+
+def get_instance_by_name(compute, compartment_id, instance_name):
+    """Get the instance with the given display name that is not terminated yet."""
+    instances = oci.pagination.list_call_get_all_results(
+        compute.list_instances,
+        compartment_id=compartment_id
+    ).data
+
+    for instance in instances:
+        if instance.display_name == instance_name and instance.lifecycle_state != "TERMINATED":
+            return instance
+
+    raise ValueError(f"Instance with name '{instance_name}' not found.")
@@ -0,0 +1,39 @@
+import time
+import random
+
+from oci_proxy import lazy_import
+
+oci = lazy_import('oci')
+
+SHARE_KEY_TAG = 'proxy-share-key'
+REFCOUNT_TAG = 'proxy-refcount'
+
+
+def update_refcount(compute, instance_id, delta, max_attempts=10):
+    """Change the refcount tag of a shared instance with an etag guarded update, returning the new count.
+
+    No reference is taken on an instance its last user already released, and releasing never goes below 0.
+    """
+    for _ in range(max_attempts):
+        response = compute.get_instance(instance_id)
+        tags = dict(response.data.freeform_tags or {})
+        refcount = int(tags.get(REFCOUNT_TAG, '0'))
+        if delta > 0 and refcount == 0:
+            # the last user already released it and it is being torn down
+            return 0
+
+        refcount = max(refcount + delta, 0)
+        tags[REFCOUNT_TAG] = str(refcount)
+        try:
+            compute.update_instance(
+                instance_id,
+                oci.core.models.UpdateInstanceDetails(freeform_tags=tags),
+                if_match=response.headers['etag']
+            )
+            return refcount
+        except oci.exceptions.ServiceError as e:
+            if e.status not in (409, 412):
+                raise
+            # someone else changed the instance in between, read it again
+            time.sleep(random.uniform(0.5, 2))
+    raise RuntimeError(f"Could not update the refcount of instance {instance_id} after {max_attempts} attempts")
@@ -0,0 +1,45 @@
+from oci_proxy import lazy_import
+
+oci = lazy_import('oci')
+
+
+def terminate_instance(compute, instance_id, wait=True):
+    """Terminate a compute instance, returning it as last seen once terminated, or None when it is gone."""
+    print(f"Terminating instance: {instance_id}...")
+    try:
+        compute.terminate_instance(instance_id)
+        if not wait:
+            return None
+        instance = compute.wait_until(
+            compute.get_instance(instance_id),
+            'lifecycle_state',
+            'TERMINATED',
+            max_wait_seconds=300
+        ).data
+    except oci.exceptions.ServiceError as e:
+        if e.status != 404:
+            raise
+        instance = None
+    print(f"Instance {instance_id} terminated successfully.")
+    return instance
+
+
+def delete_vcn(network, vcn_id, wait=True):
+    """Delete a VCN."""
+    print(f"Deleting VCN: {vcn_id}...")
+    network.delete_vcn(vcn_id)
+
+    if wait:
+        try:
+            network.wait_until(
+                network.get_vcn(vcn_id),
+                'lifecycle_state',
+                'TERMINATED',
+                max_wait_seconds=300
+            )
+            print(f"VCN {vcn_id} deleted successfully.")
+        except oci.exceptions.ServiceError as e:
+            if e.status == 404:
+                print(f"VCN {vcn_id} deleted successfully.")
+            else:
+                raise
@@ -0,0 +1,217 @@
+import sys
+import math
+import time
+import argparse
+import datetime
+from datetime import timezone
+
+from oci_proxy import lazy_import
+from oci_proxy.clients import (RateLimiter, create_clients, create_compute_management_client,
+                               create_monitoring_client)
+from oci_proxy.events import EventLog
+from start import (get_compartment_id_by_name, get_console_output, get_instance_pool_by_name,
+                   wait_for_pool_endpoints, wait_for_endpoints, save_endpoints)
+from proxy_metrics import get_latest_metrics
+
+oci = lazy_import('oci')
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Resize a proxy pool started with --pool-size by schedule or by load.')
+    parser.add_argument('--config-file', required=True, help='Location of config file')
+    parser.add_argument('--compartment-name', required=True, help='Name of the compartment')
+    parser.add_argument('--name-suffix', required=True, help='Suffix the proxy pool was started with')
+    parser.add_argument('--config-profile', default='DEFAULT', help='Config profile the pool was started with (default: DEFAULT)')
+    parser.add_argument('--region', default='', help='Region the pool was started in (empty means the region of the profile)')
+    parser.add_argument('--open-port', required=True, type=int, help='Port the proxies listen on')
+    parser.add_argument('--min-size', type=int, default=1, help='Smallest pool size to scale down to')
+    parser.add_argument('--max-size', type=int, required=True, help='Largest pool size to scale up to')
+    parser.add_argument('--size', type=int, default=0, help='Resize the pool to exactly this size (0 means size it by schedule or load)')
+    parser.add_argument('--schedule', default='', help='Comma separated UTC HH:MM=size entries, e.g. "08:00=4,20:00=1" (empty means size by load)')
+    parser.add_argument('--target-connections', type=float, default=0, help='Open client connections one proxy should serve (0 means do not scale on connections)')
+    parser.add_argument('--target-mbps', type=float, default=0, help='Outbound Mbps one proxy should serve (0 means do not scale on throughput)')
+    parser.add_argument('--watch-interval', type=float, default=0, help='Seconds between resizes, keeps running until killed (0 means resize once)')
+    parser.add_argument('--proxy-check-retry-delay', type=float, default=5, help='Seconds between port checks of new proxies')
+    parser.add_argument('--proxy-check-max-retries', type=int, default=60, help='Number of port checks of new proxies before giving up (0 means do not wait for them)')
+    parser.add_argument('--save-endpoints-to', required=True, help='Path to save the ip:port of every proxy to, one per line')
+    parser.add_argument('--events-file', default='', help='Path to append structured JSON line events to (empty means no events)')
+    parser.add_argument('--api-rate', type=float, default=2.0, help='Sustained OCI API calls per second allowed per service')
+    parser.add_argument('--api-burst', type=int, default=4, help='Burst size of the per service OCI API token bucket')
+    parser.add_argument('--retry-budget', type=int, default=30, help='Total number of OCI API retries allowed for this run')
+
+    return parser.parse_args()
+
+
+def parse_schedule(schedule):
+    """Parse "HH:MM=size,..." into (minute of the day, size) pairs sorted by time."""
+    entries = []
+    for entry in schedule.split(','):
+        if entry.strip() == '':
+            continue
+        start, size = entry.split('=')
+        hours, minutes = start.strip().split(':')
+        entries.append((int(hours) * 60 + int(minutes), int(size)))
+    return sorted(entries)
+
+
+def get_scheduled_size(schedule, now):
+    """Get the size of the last schedule entry started by now, wrapping around to the previous day."""
+    minute = now.hour * 60 + now.minute
+    started = [size for start, size in schedule if start <= minute]
+    return started[-1] if started else schedule[-1][1]
+
+
+def get_pool_instance_ids(compute_management, compartment_id, pool_id):
+    """Get the ids of the running instances of a pool."""
+    instances = oci.pagination.list_call_get_all_results(
+        compute_management.list_instance_pool_instances,
+        compartment_id=compartment_id,
+        instance_pool_id=pool_id
+    ).data
+    return [i.id for i in instances if i.state.upper() == 'RUNNING']
+
+
+def get_connections(compute, instance_ids):
+    """Sum the open client connections the proxies last reported to their consoles."""
+    connections = 0
+    for instance_id in instance_ids:
+        metrics = get_latest_metrics(get_console_output(compute, instance_id))
+        if metrics is None:
+            print(f"No metrics reported by {instance_id} yet")
+            continue
+        connections += metrics.get('connections', 0)
+    return connections
+
+
+def get_throughput_mbps(monitoring, compartment_id, instance_ids, window_minutes=5):
+    """Sum the latest outbound throughput of the instances from the compute agent metrics in OCI Monitoring."""
+    end_time = datetime.datetime.now(timezone.utc)
+    start_time = end_time - datetime.timedelta(minutes=window_minutes)
+    throughput_mbps = 0.0
+    for instance_id in instance_ids:
+        metric_data = monitoring.summarize_metrics_data(
+            compartment_id,
+            oci.monitoring.models.SummarizeMetricsDataDetails(
+                namespace='oci_computeagent',
+                query=f'NetworksBytesOut[1m]{{resourceId = "{instance_id}"}}.rate()',
+                start_time=start_time,
+                end_time=end_time
+            )
+        ).data
+        for metric in metric_data:
+            if metric.aggregated_datapoints:
+                throughput_mbps += metric.aggregated_datapoints[-1].value * 8 / 1e6
+    return throughput_mbps
+
+
+def get_load_size(load, target_per_proxy):
+    """Get the number of proxies needed to serve the load at the target per proxy."""
+    return math.ceil(load / target_per_proxy)
+
+
+def choose_pool_size(args, schedule, current_size, compute, monitoring, compartment_id, instance_ids):
+    """Choose the pool size from the fixed size, the schedule or the load, within the min and max size."""
+    if args.size > 0:
+        size = args.size
+    elif schedule:
+        size = get_scheduled_size(schedule, datetime.datetime.now(timezone.utc))
+    else:
+        size = args.min_size
+        if args.target_connections > 0:
+            connections = get_connections(compute, instance_ids)
+            print(f"Pool serves {connections} connections")
+            size = max(size, get_load_size(connections, args.target_connections))
+        if args.target_mbps > 0:
+            throughput_mbps = get_throughput_mbps(monitoring, compartment_id, instance_ids)
+            print(f"Pool serves {throughput_mbps:.1f} Mbps")
+            size = max(size, get_load_size(throughput_mbps, args.target_mbps))
+        # scale down one proxy at a time so a single quiet reading does not drop capacity
+        size = max(size, current_size - 1)
+    return min(args.max_size, max(args.min_size, size))
+
+
+def resize_instance_pool(compute_management, pool_id, size):
+    """Change the number of instances in a pool."""
+    print(f"Resizing instance pool {pool_id} to {size} instances...")
+    compute_management.update_instance_pool(
+        pool_id,
+        oci.core.models.UpdateInstancePoolDetails(size=size)
+    )
+
+
+def wait_for_scaling(compute_management, pool_id, max_wait_seconds=60):
+    """Wait for the pool to pick up a resize, until then it still reports RUNNING with the old instances."""
+    try:
+        compute_management.wait_until(
+            compute_management.get_instance_pool(pool_id),
+            max_interval_seconds=2,
+            max_wait_seconds=max_wait_seconds,
+            evaluate_response=lambda r: r.data.lifecycle_state != 'RUNNING'
+        )
+    except oci.exceptions.MaximumWaitTimeExceeded:
+        # a small resize can be done between two polls
+        print(f"Instance pool {pool_id} did not report SCALING within {max_wait_seconds}s")
+
+
+def main():
+    args = parse_arguments()
+
+    events = EventLog(args.events_file, 'autoscale')
+    schedule = parse_schedule(args.schedule)
+
+    config = oci.config.from_file(file_location=args.config_file, profile_name=args.config_profile)
+    if args.region != '':
+        config['region'] = args.region
+
+    limiter = RateLimiter(args.api_rate, args.api_burst, args.retry_budget)
+    compute_client, network_client, identity_client = create_clients(config, limiter)
+    compute_management_client = create_compute_management_client(config, limiter)
+    monitoring_client = None
+    if args.target_mbps > 0:
+        monitoring_client = create_monitoring_client(config, limiter)
+
+    try:
+        compartment_id = get_compartment_id_by_name(config,
+                                                    identity_client,
+                                                    args.compartment_name)
+        checked = set()
+        while True:
+            pool = get_instance_pool_by_name(compute_management_client, compartment_id, f'pool-{args.name_suffix}')
+            instance_ids = get_pool_instance_ids(compute_management_client, compartment_id, pool.id)
+            size = choose_pool_size(args, schedule, pool.size, compute_client, monitoring_client,
+                                    compartment_id, instance_ids)
+
+            with events.phase('scale_instance_pool', 'instance_pool') as event:
+                event['ocid'] = pool.id
+                event['from_size'] = pool.size
+                event['to_size'] = size
+                if size != pool.size:
+                    resize_instance_pool(compute_management_client, pool.id, size)
+                    wait_for_scaling(compute_management_client, pool.id)
+                endpoints = wait_for_pool_endpoints(compute_management_client,
+                                                    compute_client,
+                                                    network_client,
+                                                    compartment_id,
+                                                    pool.id,
+                                                    args.open_port)
+                # only endpoints whose proxy is up are handed out
+                if args.proxy_check_max_retries > 0:
+                    wait_for_endpoints(args, [e for e in endpoints if e not in checked])
+                    checked.update(endpoints)
+            save_endpoints(args.save_endpoints_to, endpoints)
+            print(f"Pool pool-{args.name_suffix} has {len(endpoints)} endpoints: {endpoints}")
+
+            if args.watch_interval <= 0:
+                break
+            time.sleep(args.watch_interval)
+    except Exception as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        print(f"OCI API stats: {limiter.metrics}")
+        events.emit('api_stats', 'oci_api', **limiter.metrics)
+
+
+if __name__ == "__main__":
+    main()
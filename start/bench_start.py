@@ -0,0 +1,562 @@
+import sys
+import json
+import time
+import socket
+import argparse
+import datetime
+import tempfile
+import contextlib
+from types import SimpleNamespace
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import start
+import autoscale
+from oci_proxy.clients import ThrottledClient
+
+# stop.py is not next to start.py, it lives with the post hook of the stop action
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'stop' / 'stop_js'))
+import stop  # noqa: E402
+
+COMPARTMENT_NAME = 'proxies'
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Run start.py end to end against a local OCI stand-in.')
+    parser.add_argument('--scenarios', default='instance,preempted,pool,shared,reserved', help='Comma separated scenarios to run')
+    parser.add_argument('--extra-resources', type=int, default=150, help='Unrelated instances and VCNs in the compartment')
+    parser.add_argument('--page-limit', type=int, default=100, help='Items returned per page by the list calls')
+    parser.add_argument('--output', default='start_bench.json', help='Path to save the JSON results to')
+
+    return parser.parse_args()
+
+
+class FakeCloud:
+    """In-memory stand-in for a compartment, counting every API call made against it."""
+
+    def __init__(self, page_limit=100):
+        self.page_limit = page_limit
+        self.calls = Counter()
+        self.resources = defaultdict(dict)
+        self.next_id = 0
+        self.compartment_id = 'ocid1.compartment.fake'
+        # instances launched while this is above zero come up preempted
+        self.preempt = 0
+        # bound but not listening yet, so the port only opens once a proxy runs
+        self.listener = socket.socket()
+        self.listener.bind(('127.0.0.1', 0))
+        self.port = self.listener.getsockname()[1]
+
+    def close(self):
+        self.listener.close()
+
+    def record(self, method):
+        self.calls[method] += 1
+
+    def add(self, kind, **attrs):
+        self.next_id += 1
+        attrs.setdefault('compartment_id', self.compartment_id)
+        attrs.setdefault('freeform_tags', {})
+        attrs.setdefault('time_created', datetime.datetime.now(datetime.timezone.utc) +
+                         datetime.timedelta(microseconds=self.next_id))
+        resource = SimpleNamespace(id=f'ocid1.{kind}.fake.{self.next_id}', etag=0, **attrs)
+        self.resources[kind][resource.id] = resource
+        return resource
+
+    def find(self, resource_id):
+        kind = resource_id.split('.')[1]
+        if resource_id not in self.resources[kind]:
+            raise start.oci.exceptions.ServiceError(404, 'NotAuthorizedOrNotFound', {}, f'{resource_id} not found')
+        return self.resources[kind][resource_id]
+
+    def get(self, resource_id):
+        resource = self.find(resource_id)
+        return start.oci.response.Response(200, {'etag': str(resource.etag)}, resource, None)
+
+    def update(self, resource_id, if_match=None, **attrs):
+        resource = self.find(resource_id)
+        if if_match is not None and if_match != str(resource.etag):
+            raise start.oci.exceptions.ServiceError(412, 'PreconditionFailed', {}, 'etag does not match')
+        for name, value in attrs.items():
+            setattr(resource, name, value)
+        resource.etag += 1
+        return start.oci.response.Response(200, {'etag': str(resource.etag)}, resource, None)
+
+    def list(self, kind, page=None, **filters):
+        """Return one page of the matching resources, with the opc-next-page header set when more follow."""
+        matches = [r for r in self.resources[kind].values()
+                   if all(getattr(r, f, None) == v for f, v in filters.items())]
+        first = int(page or 0)
+        last = first + self.page_limit
+        headers = {'opc-next-page': str(last)} if last < len(matches) else {}
+        return start.oci.response.Response(200, headers, matches[first:last], None)
+
+    def add_from(self, kind, details, lifecycle_state, **attrs):
+        """Add a resource from the create details of a call, like OCI does."""
+        fields = {name: getattr(details, name) for name in details.attribute_map}
+        fields = {name: value for name, value in fields.items() if value is not None}
+        fields.update(attrs)
+        fields['freeform_tags'] = dict(fields.get('freeform_tags') or {})
+        return self.add(kind, lifecycle_state=lifecycle_state, **fields)
+
+    def add_instance(self, display_name, freeform_tags=None, preemptible=False, **attrs):
+        """Add a running instance with the VNIC and addresses a proxy gets."""
+        state = 'RUNNING'
+        if self.preempt > 0:
+            self.preempt -= 1
+            state = 'STOPPED'
+        attrs.setdefault('instance_pool_id', None)
+        instance = self.add('instance', display_name=display_name, lifecycle_state=state,
+                            freeform_tags=dict(freeform_tags or {}),
+                            preemptible_instance_config=object() if preemptible else None, **attrs)
+        vnic = self.add('vnic', public_ip='127.0.0.1')
+        self.add('vnicattachment', instance_id=instance.id, vnic_id=vnic.id)
+        self.add('privateip', vnic_id=vnic.id, is_primary=True)
+        if state == 'RUNNING':
+            self.listener.listen(64)
+        return instance
+
+
+class FakeClient:
+    """Dispatches get_, list_ and delete_ calls of one OCI client to the stand-in."""
+
+    kinds = {}
+
+    def __init__(self, cloud):
+        self.cloud = cloud
+
+    def __getattr__(self, name):
+        action, _, kind = name.partition('_')
+        if kind not in self.kinds:
+            raise AttributeError(name)
+
+        def call(*args, **kwargs):
+            self.cloud.record(name)
+            if action == 'list':
+                return self.cloud.list(self.kinds[kind], **kwargs)
+            # the resource id may be passed by name, like get_instance(instance_id=...)
+            resource_id = args[0] if args else next(iter(kwargs.values()))
+            if action == 'get':
+                return self.cloud.get(resource_id)
+            if action in ('delete', 'terminate'):
+                self.cloud.update(resource_id, lifecycle_state='TERMINATED')
+                return None
+            raise AttributeError(name)
+
+        return call
+
+
+class FakeIdentityClient(FakeClient):
+    def list_compartments(self, compartment_id, compartment_id_in_subtree=False, page=None):
+        self.cloud.record('list_compartments')
+        compartment = SimpleNamespace(id=self.cloud.compartment_id, name=COMPARTMENT_NAME, lifecycle_state='ACTIVE')
+        return start.oci.response.Response(200, {}, [compartment], None)
+
+    def list_availability_domains(self, compartment_id):
+        self.cloud.record('list_availability_domains')
+        ads = [SimpleNamespace(id=f'ocid1.availabilitydomain.fake.{i}', name=f'Xyz:US-ASHBURN-AD-{i}')
+               for i in range(1, 4)]
+        return start.oci.response.Response(200, {}, ads, None)
+
+
+class FakeLimitsClient(FakeClient):
+    def get_resource_availability(self, service_name, limit_name, compartment_id, **kwargs):
+        self.cloud.record('get_resource_availability')
+        return start.oci.response.Response(200, {}, SimpleNamespace(available=None, used=0), None)
+
+
+class FakeComputeClient(FakeClient):
+    kinds = {
+        'instance': 'instance',
+        'instances': 'instance',
+        'vnic_attachments': 'vnicattachment',
+    }
+
+    def list_images(self, compartment_id, **kwargs):
+        self.cloud.record('list_images')
+        return start.oci.response.Response(200, {}, [SimpleNamespace(id='ocid1.image.fake')], None)
+
+    def list_shapes(self, compartment_id, page=None):
+        self.cloud.record('list_shapes')
+        shape = SimpleNamespace(shape='VM.Standard.A1.Flex', is_flexible=True, ocpus=1, memory_in_gbs=6,
+                                ocpu_options=SimpleNamespace(min=1, max=80),
+                                memory_options=SimpleNamespace(default_per_ocpu_in_g_bs=6, min_in_g_bs=1,
+                                                               max_in_g_bs=512, min_per_ocpu_in_gbs=1,
+                                                               max_per_ocpu_in_gbs=64),
+                                baseline_ocpu_utilizations=['BASELINE_1_8', 'BASELINE_1_2'],
+                                quota_names=['standard-a1-core-count', 'standard-a1-memory-count'])
+        return start.oci.response.Response(200, {}, [shape], None)
+
+    def launch_instance(self, launch_instance_details, **kwargs):
+        self.cloud.record('launch_instance')
+        details = launch_instance_details
+        instance = self.cloud.add_instance(details.display_name, details.freeform_tags,
+                                           details.preemptible_instance_config is not None)
+        return start.oci.response.Response(200, {}, instance, None)
+
+    def update_instance(self, instance_id, update_instance_details, if_match=None):
+        self.cloud.record('update_instance')
+        return self.cloud.update(instance_id, if_match, freeform_tags=dict(update_instance_details.freeform_tags))
+
+
+class FakeVirtualNetworkClient(FakeClient):
+    kinds = {
+        'vcn': 'vcn',
+        'vcns': 'vcn',
+        'subnet': 'subnet',
+        'subnets': 'subnet',
+        'route_tables': 'routetable',
+        'security_list': 'securitylist',
+        'security_lists': 'securitylist',
+        'internet_gateway': 'internetgateway',
+        'internet_gateways': 'internetgateway',
+        'vnic': 'vnic',
+        'private_ips': 'privateip',
+        'public_ip': 'publicip',
+        'public_ips': 'publicip',
+    }
+
+    def create_vcn(self, create_vcn_details, **kwargs):
+        self.cloud.record('create_vcn')
+        vcn = self.cloud.add_from('vcn', create_vcn_details, 'AVAILABLE')
+        self.cloud.add('routetable', vcn_id=vcn.id, display_name=f'Default Route Table for {vcn.display_name}',
+                       route_rules=[])
+        return start.oci.response.Response(200, {}, vcn, None)
+
+    def create_internet_gateway(self, create_internet_gateway_details, **kwargs):
+        self.cloud.record('create_internet_gateway')
+        return start.oci.response.Response(200, {}, self.cloud.add_from(
+            'internetgateway', create_internet_gateway_details, 'AVAILABLE'), None)
+
+    def create_security_list(self, create_security_list_details, **kwargs):
+        self.cloud.record('create_security_list')
+        return start.oci.response.Response(200, {}, self.cloud.add_from(
+            'securitylist', create_security_list_details, 'AVAILABLE'), None)
+
+    def create_subnet(self, create_subnet_details, **kwargs):
+        self.cloud.record('create_subnet')
+        return start.oci.response.Response(200, {}, self.cloud.add_from(
+            'subnet', create_subnet_details, 'AVAILABLE'), None)
+
+    def create_public_ip(self, create_public_ip_details, **kwargs):
+        self.cloud.record('create_public_ip')
+        return start.oci.response.Response(200, {}, self.cloud.add_from(
+            'publicip', create_public_ip_details, 'AVAILABLE', scope='REGION', ip_address='127.0.0.1',
+            private_ip_id=None), None)
+
+    def update_public_ip(self, public_ip_id, update_public_ip_details, if_match=None):
+        self.cloud.record('update_public_ip')
+        return self.cloud.update(public_ip_id, if_match, private_ip_id=update_public_ip_details.private_ip_id,
+                                 lifecycle_state='ASSIGNED')
+
+    def update_route_table(self, rt_id, update_route_table_details, **kwargs):
+        self.cloud.record('update_route_table')
+        return self.cloud.update(rt_id, route_rules=update_route_table_details.route_rules)
+
+    def update_vcn(self, vcn_id, update_vcn_details, **kwargs):
+        self.cloud.record('update_vcn')
+        return self.cloud.update(vcn_id, freeform_tags=dict(update_vcn_details.freeform_tags))
+
+
+class FakeComputeManagementClient(FakeClient):
+    kinds = {
+        'instance_pool': 'instancepool',
+        'instance_pools': 'instancepool',
+        'instance_configuration': 'instanceconfiguration',
+        'instance_configurations': 'instanceconfiguration',
+    }
+
+    def create_instance_configuration(self, create_instance_configuration, **kwargs):
+        self.cloud.record('create_instance_configuration')
+        return start.oci.response.Response(200, {}, self.cloud.add_from(
+            'instanceconfiguration', create_instance_configuration, 'ACTIVE'), None)
+
+    def create_instance_pool(self, create_instance_pool_details, **kwargs):
+        self.cloud.record('create_instance_pool')
+        pool = self.cloud.add_from('instancepool', create_instance_pool_details, 'RUNNING', size=0)
+        self.resize(pool, create_instance_pool_details.size)
+        return start.oci.response.Response(200, {}, pool, None)
+
+    def update_instance_pool(self, instance_pool_id, update_instance_pool_details, **kwargs):
+        self.cloud.record('update_instance_pool')
+        pool = self.cloud.find(instance_pool_id)
+        self.resize(pool, update_instance_pool_details.size)
+        return self.cloud.get(instance_pool_id)
+
+    def terminate_instance_pool(self, instance_pool_id, **kwargs):
+        self.cloud.record('terminate_instance_pool')
+        self.resize(self.cloud.find(instance_pool_id), 0)
+        self.cloud.update(instance_pool_id, lifecycle_state='TERMINATED')
+
+    def list_instance_pool_instances(self, compartment_id, instance_pool_id, page=None):
+        self.cloud.record('list_instance_pool_instances')
+        response = self.cloud.list('instance', page, compartment_id=compartment_id, instance_pool_id=instance_pool_id)
+        response.data = [SimpleNamespace(id=i.id, state=i.lifecycle_state.title(), time_created=i.time_created)
+                         for i in response.data]
+        return response
+
+    def resize(self, pool, size):
+        """Launch or terminate pool instances until the pool has size of them, newest go first."""
+        members = sorted((i for i in self.cloud.resources['instance'].values()
+                          if getattr(i, 'instance_pool_id', None) == pool.id and i.lifecycle_state != 'TERMINATED'),
+                         key=lambda i: i.time_created)
+        for i in range(len(members), size):
+            self.cloud.add_instance(f'{pool.display_name}-{i + 1}', instance_pool_id=pool.id)
+        for instance in members[size:]:
+            self.cloud.update(instance.id, lifecycle_state='TERMINATED')
+        pool.size = size
+
+
+def fake_wait_until(client, response, *args, **kwargs):
+    """Resources in the stand-in change state immediately, so waiting is a no-op."""
+    return response
+
+
+def write_config(work_dir):
+    """Write an OCI config whose credentials are never used."""
+    key_file = work_dir / 'key.pem'
+    key_file.write_text('')
+    config_file = work_dir / 'config'
+    config_file.write_text('[DEFAULT]\n'
+                           'user=ocid1.user.oc1..fake\n'
+                           'fingerprint=00:11:22:33:44:55:66:77:88:99:aa:bb:cc:dd:ee:ff\n'
+                           'tenancy=ocid1.tenancy.oc1..fake\n'
+                           'region=us-ashburn-1\n'
+                           f'key_file={key_file}\n')
+    return config_file
+
+
+def build_cloud(extra_resources, page_limit):
+    """Build a compartment with unrelated instances and VCNs, so the proxy is not on the first page."""
+    cloud = FakeCloud(page_limit)
+    for i in range(extra_resources):
+        cloud.add('instance', display_name=f'other-{i}', lifecycle_state='RUNNING')
+        cloud.add('vcn', display_name=f'other-vcn-{i}', lifecycle_state='AVAILABLE')
+    return cloud
+
+
+def use_cloud(cloud, *modules):
+    """Point the client factories the modules imported at the stand-in."""
+    # the limiter is left effectively unthrottled so only the script itself is measured
+    limiter = start.RateLimiter(1e9, 1e9, 0)
+
+    def create_clients(config, _):
+        return (ThrottledClient(FakeComputeClient(cloud), 'compute', limiter),
+                ThrottledClient(FakeVirtualNetworkClient(cloud), 'network', limiter),
+                ThrottledClient(FakeIdentityClient(cloud), 'identity', limiter))
+
+    for module in modules:
+        module.create_clients = create_clients
+        module.create_limits_client = lambda config, _: ThrottledClient(
+            FakeLimitsClient(cloud), 'limits', limiter)
+        module.create_compute_management_client = lambda config, _: ThrottledClient(
+            FakeComputeManagementClient(cloud), 'compute_management', limiter)
+
+
+def run_main(module):
+    """Run the main() of a script, turning its exit on errors into an exception."""
+    try:
+        module.main()
+    except SystemExit as e:
+        raise RuntimeError(f"{module.__name__}.py failed with exit status {e.code}")
+
+
+def run_start(cloud, work_dir, suffix, *extra_args):
+    """Run start.main() against the stand-in, returning the endpoints it saved."""
+    use_cloud(cloud, start)
+    cloud_init = work_dir / 'startup.sh'
+    cloud_init.write_text('#!/bin/bash\n')
+    endpoints_file = work_dir / f'endpoints-{suffix}.txt'
+    sys.argv = ['start.py',
+                f'--config-file={write_config(work_dir)}',
+                f'--compartment-name={COMPARTMENT_NAME}',
+                '--availability-domain=AD-1',
+                f'--name-suffix={suffix}',
+                f'--open-port={cloud.port}',
+                '--shape=VM.Standard.A1.Flex',
+                '--os-name=Canonical Ubuntu',
+                '--os-version=22.04',
+                f'--cloud-init={cloud_init}',
+                f'--save-ip-address-to={work_dir / "ip_address.txt"}',
+                f'--save-name-suffix-to={work_dir / f"name_suffix-{suffix}.txt"}',
+                f'--save-endpoints-to={endpoints_file}',
+                '--proxy-check-max-retries=5',
+                '--proxy-check-retry-delay=0',
+                '--boot-check-interval=0',
+                *extra_args]
+    run_main(start)
+    return endpoints_file.read_text().split()
+
+
+def run_autoscale(cloud, work_dir, suffix, *extra_args):
+    """Run autoscale.main() once against the stand-in, returning the endpoints it saved."""
+    use_cloud(cloud, autoscale)
+    endpoints_file = work_dir / f'endpoints-{suffix}.txt'
+    sys.argv = ['autoscale.py',
+                f'--config-file={write_config(work_dir)}',
+                f'--compartment-name={COMPARTMENT_NAME}',
+                f'--name-suffix={suffix}',
+                f'--open-port={cloud.port}',
+                '--max-size=8',
+                '--proxy-check-retry-delay=0',
+                f'--save-endpoints-to={endpoints_file}',
+                *extra_args]
+    run_main(autoscale)
+    return endpoints_file.read_text().split()
+
+
+def run_stop(cloud, work_dir, suffix, *extra_args):
+    """Run stop.main() against the stand-in."""
+    use_cloud(cloud, stop)
+    sys.argv = ['stop.py',
+                f'--config-file={write_config(work_dir)}',
+                f'--compartment-name={COMPARTMENT_NAME}',
+                f'--name-suffix={suffix}',
+                *extra_args]
+    run_main(stop)
+
+
+def live_vcns(cloud, prefix):
+    """Get the VCNs whose name starts with the prefix and that are not deleted."""
+    return [v for v in cloud.resources['vcn'].values()
+            if v.display_name.startswith(prefix) and v.lifecycle_state != 'TERMINATED']
+
+
+def live_instances(cloud, prefix):
+    """Get the instances whose name starts with the prefix and that are not terminated."""
+    return [i for i in cloud.resources['instance'].values()
+            if i.display_name.startswith(prefix) and i.lifecycle_state != 'TERMINATED']
+
+
+def scenario_instance(cloud, work_dir):
+    """A single on-demand proxy."""
+    endpoints = run_start(cloud, work_dir, '1700000001')
+    if endpoints != [f'127.0.0.1:{cloud.port}'] or len(live_instances(cloud, 'proxy-')) != 1:
+        raise RuntimeError(f"Expected one proxy, got {endpoints}")
+
+    run_stop(cloud, work_dir, '1700000001')
+    if live_instances(cloud, 'proxy-') or live_vcns(cloud, 'vcn-'):
+        raise RuntimeError("Expected the proxy and its VCN to be gone after stop")
+
+
+def scenario_preempted(cloud, work_dir):
+    """A preemptible proxy that is preempted while booting and relaunched."""
+    cloud.preempt = 1
+    run_start(cloud, work_dir, '1700000002', '--capacity-mode=preemptible')
+    instances = [i for i in cloud.resources['instance'].values() if i.display_name == 'proxy-1700000002']
+    states = sorted(i.lifecycle_state for i in instances)
+    if states != ['RUNNING', 'TERMINATED']:
+        raise RuntimeError(f"Expected the preempted instance to be replaced, got {states}")
+
+
+def scenario_pool(cloud, work_dir):
+    """A pool of three proxies launched from one instance configuration, then resized to four."""
+    for i in range(cloud.page_limit + 50):
+        cloud.add('instancepool', display_name=f'other-pool-{i}', lifecycle_state='RUNNING')
+        cloud.add('instanceconfiguration', display_name=f'other-ic-{i}', lifecycle_state='ACTIVE')
+    # small pages so the instances of the pool span several of them too
+    cloud.page_limit = 2
+
+    endpoints = run_start(cloud, work_dir, '1700000003', '--pool-size=3')
+    if endpoints != [f'127.0.0.1:{cloud.port}'] * 3 or len(live_instances(cloud, 'pool-1700000003-')) != 3:
+        raise RuntimeError(f"Expected three pool endpoints, got {endpoints}")
+
+    endpoints = run_autoscale(cloud, work_dir, '1700000003', '--size=4')
+    if endpoints != [f'127.0.0.1:{cloud.port}'] * 4 or len(live_instances(cloud, 'pool-1700000003-')) != 4:
+        raise RuntimeError(f"Expected four pool endpoints after the resize, got {endpoints}")
+
+    run_stop(cloud, work_dir, '1700000003')
+    if live_instances(cloud, 'pool-') or live_vcns(cloud, 'vcn-'):
+        raise RuntimeError("Expected the pool and its VCN to be gone after stop")
+
+
+def scenario_shared(cloud, work_dir):
+    """Two jobs sharing one proxy, with more instances and VCNs in the compartment than fit on a page."""
+    run_start(cloud, work_dir, '1700000004', '--share-key=run-1')
+    run_start(cloud, work_dir, '1700000005', '--share-key=run-1')
+    proxies = live_instances(cloud, 'proxy-')
+    if len(proxies) != 1 or proxies[0].freeform_tags.get(start.REFCOUNT_TAG) != '2':
+        raise RuntimeError(f"Expected one proxy used by two jobs, got {[(i.display_name, i.freeform_tags) for i in proxies]}")
+    if (work_dir / 'name_suffix-1700000005.txt').read_text() != '1700000004':
+        raise RuntimeError("The second job was not handed the name suffix of the shared proxy")
+
+    # a job that timed out attaching is stopped under its own suffix, whose VCN it already deleted
+    run_stop(cloud, work_dir, '1700000005', '--share-key=run-1')
+    if len(live_instances(cloud, 'proxy-')) != 1:
+        raise RuntimeError("Expected the shared proxy to outlive the stop of a job that never attached")
+    for _ in range(2):
+        run_stop(cloud, work_dir, '1700000004', '--share-key=run-1')
+    if live_instances(cloud, 'proxy-') or live_vcns(cloud, 'vcn-'):
+        raise RuntimeError("Expected the shared proxy and its VCN to be gone once both jobs stopped")
+
+
+def scenario_reserved(cloud, work_dir):
+    """A proxy given a reserved IP from a pool kept from earlier runs, behind the reserved IPs of other pools."""
+    for i in range(cloud.page_limit + 50):
+        cloud.add('publicip', display_name=f'other-ip-{i}', scope='REGION', lifetime='RESERVED',
+                  lifecycle_state='AVAILABLE', private_ip_id=None,
+                  freeform_tags={start.RESERVED_IP_POOL_TAG: 'other'})
+    for i in range(2):
+        cloud.add('publicip', display_name=f'proxy-ips-{i}', scope='REGION', lifetime='RESERVED',
+                  lifecycle_state='AVAILABLE', private_ip_id=None, ip_address='127.0.0.1',
+                  freeform_tags={start.RESERVED_IP_POOL_TAG: 'proxy-ips'})
+
+    run_start(cloud, work_dir, '1700000006', '--reserved-ip-pool=proxy-ips')
+    pool_ips = [ip for ip in cloud.resources['publicip'].values()
+                if ip.freeform_tags.get(start.RESERVED_IP_POOL_TAG) == 'proxy-ips']
+    if len(pool_ips) != 2:
+        raise RuntimeError(f"Expected the two reserved IPs of the pool to be reused, got {len(pool_ips)}")
+    if [ip.lifecycle_state for ip in pool_ips].count('ASSIGNED') != 1:
+        raise RuntimeError("Expected one reserved IP of the pool to be assigned to the proxy")
+
+
+SCENARIOS = {
+    'instance': scenario_instance,
+    'preempted': scenario_preempted,
+    'pool': scenario_pool,
+    'shared': scenario_shared,
+    'reserved': scenario_reserved,
+}
+
+
+def measure(name, args):
+    """Run one scenario in a fresh stand-in, recording API calls and wall time."""
+    cloud = build_cloud(args.extra_resources, args.page_limit)
+    try:
+        with tempfile.TemporaryDirectory() as work_dir:
+            start_time = time.perf_counter()
+            with contextlib.redirect_stdout(None):
+                SCENARIOS[name](cloud, Path(work_dir))
+            wall_time = time.perf_counter() - start_time
+    finally:
+        cloud.close()
+    result = {
+        'scenario': name,
+        'api_calls': sum(cloud.calls.values()),
+        'api_calls_by_method': dict(cloud.calls),
+        'wall_time_secs': wall_time,
+    }
+    print(f"{name:<12} api_calls={result['api_calls']:<6} wall={wall_time:.3f}s")
+    return result
+
+
+def main():
+    args = parse_arguments()
+
+    start.oci.wait_until = fake_wait_until
+
+    results = [measure(name, args) for name in args.scenarios.split(',')]
+
+    report = {
+        'python': sys.version.split()[0],
+        'extra_resources': args.extra_resources,
+        'page_limit': args.page_limit,
+        'results': results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2))
+    print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
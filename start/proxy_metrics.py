@@ -0,0 +1,69 @@
+import sys
+import json
+import argparse
+
+from oci_proxy import lazy_import
+from oci_proxy.clients import RateLimiter, create_clients
+from oci_proxy.lookups import get_instance_by_name
+from start import get_compartment_id_by_name, get_console_output
+
+oci = lazy_import('oci')
+
+METRICS_MARKER = 'PROXY-METRICS '
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Read the latest metrics a proxy instance reported to its serial console.')
+    parser.add_argument('--config-file', required=True, help='Location of config file')
+    parser.add_argument('--compartment-name', required=True, help='Name of the compartment')
+    parser.add_argument('--name-suffix', required=True, help='Suffix for all the generated names')
+    parser.add_argument('--config-profile', default='DEFAULT', help='Config profile the proxy was started with (default: DEFAULT)')
+    parser.add_argument('--region', default='', help='Region the proxy was started in (empty means the region of the profile)')
+    parser.add_argument('--summary-out', default='', help='Path to append a markdown summary to, like $GITHUB_STEP_SUMMARY (empty means no summary)')
+    parser.add_argument('--api-rate', type=float, default=2.0, help='Sustained OCI API calls per second allowed per service')
+    parser.add_argument('--api-burst', type=int, default=4, help='Burst size of the per service OCI API token bucket')
+    parser.add_argument('--retry-budget', type=int, default=30, help='Total number of OCI API retries allowed for this run')
+
+    return parser.parse_args()
+
+
+def get_latest_metrics(console_output):
+    """Get the last metrics line the proxy wrote to the console."""
+    for line in reversed(console_output.splitlines()):
+        if METRICS_MARKER in line:
+            return json.loads(line.split(METRICS_MARKER, 1)[1])
+    return None
+
+
+def main():
+    args = parse_arguments()
+
+    config = oci.config.from_file(file_location=args.config_file, profile_name=args.config_profile)
+    if args.region != '':
+        config['region'] = args.region
+
+    limiter = RateLimiter(args.api_rate, args.api_burst, args.retry_budget)
+    compute_client, network_client, identity_client = create_clients(config, limiter)
+
+    compartment_id = get_compartment_id_by_name(config,
+                                                identity_client,
+                                                args.compartment_name)
+    instance = get_instance_by_name(compute_client, compartment_id, f'proxy-{args.name_suffix}')
+
+    metrics = get_latest_metrics(get_console_output(compute_client, instance.id))
+    if metrics is None:
+        print(f"No metrics reported by proxy-{args.name_suffix} yet", file=sys.stderr)
+        sys.exit(1)
+
+    print(json.dumps(metrics, indent=2))
+    if 'dns' in metrics:
+        print(f"DNS: {metrics['dns']['avg_lookup_ms']:.1f}ms per lookup, "
+              f"{metrics['dns']['hit_ratio']:.0%} answered from the local cache")
+    if args.summary_out != '':
+        with open(args.summary_out, 'a') as f:
+            f.write(f"### Proxy metrics for proxy-{args.name_suffix}\n\n```json\n{json.dumps(metrics, indent=2)}\n```\n")
+
+
+if __name__ == "__main__":
+    main()
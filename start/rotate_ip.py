@@ -0,0 +1,106 @@
+import sys
+import time
+import argparse
+
+from pathlib import Path
+
+from oci_proxy import lazy_import
+from oci_proxy.clients import RateLimiter, create_clients
+from oci_proxy.lookups import get_instance_by_name
+from oci_proxy.events import EventLog
+from start import (get_compartment_id_by_name, get_primary_private_ip, list_reserved_ips,
+                   assign_reserved_ip)
+
+oci = lazy_import('oci')
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Swap the reserved public IP of a running proxy for another one from its pool.')
+    parser.add_argument('--config-file', required=True, help='Location of config file')
+    parser.add_argument('--compartment-name', required=True, help='Name of the compartment')
+    parser.add_argument('--name-suffix', required=True, help='Suffix for all the generated names')
+    parser.add_argument('--reserved-ip-pool', required=True, help='Name of the reserved public IP pool the proxy was started with')
+    parser.add_argument('--config-profile', default='DEFAULT', help='Config profile the proxy was started with (default: DEFAULT)')
+    parser.add_argument('--region', default='', help='Region the proxy was started in (empty means the region of the profile)')
+    parser.add_argument('--save-ip-address-to', default='', help='Path to save the new ip address to (empty means do not save)')
+    parser.add_argument('--events-file', default='', help='Path to append structured JSON line events to (empty means no events)')
+    parser.add_argument('--api-rate', type=float, default=2.0, help='Sustained OCI API calls per second allowed per service')
+    parser.add_argument('--api-burst', type=int, default=4, help='Burst size of the per service OCI API token bucket')
+    parser.add_argument('--retry-budget', type=int, default=30, help='Total number of OCI API retries allowed for this run')
+
+    return parser.parse_args()
+
+
+def unassign_public_ip(network, public_ip_id):
+    """Take a reserved public IP off its private IP, keeping it reserved."""
+    print(f"Unassigning public IP: {public_ip_id}...")
+    network.update_public_ip(
+        public_ip_id,
+        oci.core.models.UpdatePublicIpDetails(private_ip_id='')
+    )
+    network.wait_until(
+        network.get_public_ip(public_ip_id),
+        'lifecycle_state',
+        'AVAILABLE',
+        max_wait_seconds=120
+    )
+
+
+def rotate_reserved_ip(network, compartment_id, pool_name, private_ip_id):
+    """Move the private IP over to another free reserved IP of the pool, putting the old one back if none is left."""
+    reserved_ips = list_reserved_ips(network, compartment_id, pool_name)
+    current_ip = next((ip for ip in reserved_ips if ip.private_ip_id == private_ip_id), None)
+    if current_ip is None:
+        return assign_reserved_ip(network, compartment_id, pool_name, private_ip_id)
+    if not any(ip.lifecycle_state in ('AVAILABLE', 'UNASSIGNED') for ip in reserved_ips):
+        raise RuntimeError(f"No free reserved public IP left in pool {pool_name}, raise --reserved-ip-pool-size")
+
+    # a private IP holds one public IP at a time, so the old one has to come off first
+    unassign_public_ip(network, current_ip.id)
+    try:
+        return assign_reserved_ip(network, compartment_id, pool_name, private_ip_id, exclude=(current_ip.id,))
+    except RuntimeError:
+        assign_reserved_ip(network, compartment_id, pool_name, private_ip_id)
+        raise
+
+
+def main():
+    args = parse_arguments()
+
+    events = EventLog(args.events_file, 'rotate')
+
+    config = oci.config.from_file(file_location=args.config_file, profile_name=args.config_profile)
+    if args.region != '':
+        config['region'] = args.region
+
+    limiter = RateLimiter(args.api_rate, args.api_burst, args.retry_budget)
+    compute_client, network_client, identity_client = create_clients(config, limiter)
+
+    run_start = time.monotonic()
+    try:
+        compartment_id = get_compartment_id_by_name(config,
+                                                    identity_client,
+                                                    args.compartment_name)
+        instance = get_instance_by_name(compute_client, compartment_id, f'proxy-{args.name_suffix}')
+        private_ip = get_primary_private_ip(compute_client, network_client, compartment_id, instance.id)
+
+        with events.phase('rotate_public_ip', 'public_ip') as event:
+            public_ip = rotate_reserved_ip(network_client, compartment_id, args.reserved_ip_pool, private_ip.id)
+            event['ocid'] = public_ip.id
+
+        print(f"Proxy proxy-{args.name_suffix} now egresses from {public_ip.ip_address}")
+        if args.save_ip_address_to != '':
+            Path(args.save_ip_address_to).write_text(public_ip.ip_address)
+        events.emit('rotate', 'proxy', instance.id, run_start, time.monotonic() - run_start)
+    except Exception as e:
+        events.emit('rotate', 'proxy', None, run_start, time.monotonic() - run_start, 'error', error=str(e))
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        print(f"OCI API stats: {limiter.metrics}")
+        events.emit('api_stats', 'oci_api', **limiter.metrics)
+
+
+if __name__ == "__main__":
+    main()
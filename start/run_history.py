@@ -0,0 +1,184 @@
+import time
+import sqlite3
+import argparse
+import statistics
+
+from pathlib import Path
+
+# runs older than this are dropped, so choices follow recent capacity
+HISTORY_WINDOW_SECS = 30 * 24 * 3600
+# ready time assumed for placements that have never been tried
+DEFAULT_READY_SECS = 300.0
+LAUNCH_PHASES = ('launch_instance', 'create_instance_pool')
+READY_PHASES = ('wait_for_proxy', 'wait_instance_running', 'wait_pool_running', 'get_public_ip', 'assign_reserved_ip')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    region TEXT NOT NULL,
+    availability_domain TEXT NOT NULL,
+    shape TEXT NOT NULL,
+    ocpus REAL,
+    memory_in_gbs REAL,
+    capacity_mode TEXT,
+    launched INTEGER NOT NULL,
+    outcome TEXT NOT NULL,
+    capacity_errors INTEGER NOT NULL,
+    ready_secs REAL,
+    total_secs REAL
+);
+CREATE INDEX IF NOT EXISTS runs_placement ON runs (region, availability_domain, shape);
+CREATE TABLE IF NOT EXISTS phases (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    phase TEXT NOT NULL,
+    duration_secs REAL NOT NULL,
+    outcome TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS phases_run ON phases (run_id);
+'''
+
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Summarize the run history start.py records per placement.')
+    parser.add_argument('--history-db', required=True, help='Path of the SQLite run history')
+    parser.add_argument('--summary-out', default='', help='Path to append a markdown summary to, like $GITHUB_STEP_SUMMARY (empty means stdout)')
+
+    return parser.parse_args()
+
+
+def open_history(path):
+    """Open the run history, creating it when missing."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path)
+    db.execute('PRAGMA foreign_keys = ON')
+    db.executescript(SCHEMA)
+    return db
+
+
+def summarize_events(events):
+    """Get whether a run launched anything, its capacity errors and its time from launch to ready."""
+    launched = any(e['phase'] in LAUNCH_PHASES for e in events)
+    capacity_errors = sum(1 for e in events
+                          if e['phase'] == 'capacity_error' or
+                          (e['phase'] == 'check_compute_limits' and e['outcome'] != 'ok'))
+
+    ready_secs = None
+    launch_starts = [e['ts'] for e in events if e['phase'] in LAUNCH_PHASES]
+    ready_ends = [e['ts'] + e['duration_secs'] for e in events if e['phase'] in READY_PHASES and e['outcome'] == 'ok']
+    if launch_starts and ready_ends:
+        ready_secs = max(ready_ends) - min(launch_starts)
+    return launched, capacity_errors, ready_secs
+
+
+def record_run(path, region, availability_domain, shape, ocpus, memory_in_gbs, capacity_mode,
+               outcome, total_secs, events):
+    """Record one start run with its phase timings, dropping the runs that fell out of the window."""
+    launched, capacity_errors, ready_secs = summarize_events(events)
+    if outcome == 'capacity_error':
+        capacity_errors += 1
+
+    db = open_history(path)
+    with db:
+        run_id = db.execute(
+            'INSERT INTO runs (started_at, region, availability_domain, shape, ocpus, memory_in_gbs, capacity_mode, '
+            'launched, outcome, capacity_errors, ready_secs, total_secs) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (time.time() - total_secs, region, availability_domain, shape, ocpus, memory_in_gbs, capacity_mode,
+             int(launched), outcome, capacity_errors, ready_secs, total_secs)
+        ).lastrowid
+        db.executemany(
+            'INSERT INTO phases (run_id, phase, duration_secs, outcome) VALUES (?, ?, ?, ?)',
+            [(run_id, e['phase'], e['duration_secs'], e['outcome']) for e in events if e['phase'] != 'api_stats']
+        )
+        db.execute('DELETE FROM runs WHERE started_at < ?', (time.time() - HISTORY_WINDOW_SECS,))
+    db.close()
+
+
+def get_placement_stats(path, region):
+    """Get the runs, successes and ready times per (availability domain, shape) of a region."""
+    db = open_history(path)
+    # runs that failed before launching say nothing about the placement, unless they ran out of capacity
+    rows = db.execute(
+        'SELECT availability_domain, shape, outcome, ready_secs FROM runs '
+        'WHERE region = ? AND started_at >= ? AND (launched = 1 OR capacity_errors > 0)',
+        (region, time.time() - HISTORY_WINDOW_SECS)
+    ).fetchall()
+    db.close()
+
+    stats = {}
+    for availability_domain, shape, outcome, ready_secs in rows:
+        placement = stats.setdefault((availability_domain, shape), {'runs': 0, 'successes': 0, 'ready_secs': []})
+        placement['runs'] += 1
+        if outcome == 'ok':
+            placement['successes'] += 1
+            if ready_secs is not None:
+                placement['ready_secs'].append(ready_secs)
+    return stats
+
+
+def score_placements(stats, candidates):
+    """Score each candidate by its expected seconds to a ready proxy, counting failed attempts as retries."""
+    medians = [statistics.median(s['ready_secs']) for s in stats.values() if s['ready_secs']]
+    untried_ready_secs = min(medians) if medians else DEFAULT_READY_SECS
+
+    scores = {}
+    for candidate in candidates:
+        placement = stats.get(candidate, {'runs': 0, 'successes': 0, 'ready_secs': []})
+        # smoothed so a single lucky or unlucky run does not decide, and untried placements still get picked
+        success_rate = (placement['successes'] + 1) / (placement['runs'] + 2)
+        ready_secs = statistics.median(placement['ready_secs']) if placement['ready_secs'] else untried_ready_secs
+        scores[candidate] = {
+            'runs': placement['runs'],
+            'success_rate': success_rate,
+            'median_ready_secs': ready_secs,
+            'expected_secs': ready_secs / success_rate,
+        }
+    return scores
+
+
+def choose_placement_from_history(path, region, availability_domains, shapes):
+    """Pick the availability domain and shape with the lowest expected time to a ready proxy."""
+    candidates = [(ad, shape) for ad in availability_domains for shape in shapes]
+    scores = score_placements(get_placement_stats(path, region), candidates)
+    for (ad, shape), score in scores.items():
+        print(f"Placement candidate {ad} {shape}: {score['runs']} runs, success {score['success_rate']:.0%}, "
+              f"ready in {score['median_ready_secs']:.0f}s, expected {score['expected_secs']:.0f}s")
+    # ties go to the first candidate, so an empty history keeps the listed order
+    best = min(candidates, key=lambda c: scores[c]['expected_secs'])
+    return best, scores[best]
+
+
+def summarize(path):
+    """Build a markdown table of the recorded runs per placement."""
+    db = open_history(path)
+    rows = db.execute(
+        'SELECT region, availability_domain, shape, COUNT(*), SUM(outcome = \'ok\'), SUM(capacity_errors), '
+        'AVG(ready_secs), MAX(ready_secs) FROM runs GROUP BY region, availability_domain, shape '
+        'ORDER BY region, availability_domain, shape'
+    ).fetchall()
+    db.close()
+
+    lines = [
+        '| region | availability domain | shape | runs | ok | capacity errors | mean ready (s) | max ready (s) |',
+        '| --- | --- | --- | ---: | ---: | ---: | ---: | ---: |',
+    ]
+    for region, ad, shape, runs, ok, capacity_errors, mean_ready, max_ready in rows:
+        lines.append(f'| {region} | {ad} | {shape} | {runs} | {ok} | {capacity_errors} '
+                     f'| {mean_ready or 0:.1f} | {max_ready or 0:.1f} |')
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    args = parse_arguments()
+
+    summary = summarize(args.history_db)
+    if args.summary_out != '':
+        with open(args.summary_out, 'a') as f:
+            f.write('### Proxy run history\n\n' + summary)
+    else:
+        print(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,74 @@
-import oci
 import sys
+import json
+import math
+import time
 import base64
+import random
+import socket
 import argparse
+import concurrent.futures
 
 from pathlib import Path
 
+import run_history
+from oci_proxy import lazy_import
+from oci_proxy.clients import (RateLimiter, create_clients, create_compute_management_client,
+                               create_limits_client)
+from oci_proxy.events import EventLog
+from oci_proxy.sharing import SHARE_KEY_TAG, REFCOUNT_TAG, update_refcount
+from oci_proxy.teardown import terminate_instance, delete_vcn
+
+oci = lazy_import('oci')
+
+RESERVED_IP_POOL_TAG = 'proxy-ip-pool'
+BOOT_MARKER = 'PROXY-BOOT '
+PREFLIGHT_CACHE_TTL_SECS = 24 * 3600
+
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description='Create an Oracle Cloud Infrastructure compute instance.')
     parser.add_argument('--config-file', required=True, help='Location of config file')
     parser.add_argument('--compartment-name', required=True, help='Name of the compartment')
-    parser.add_argument('--availability-domain', required=True, help='Name of the availability domain')
+    parser.add_argument('--availability-domain', required=True, help='Name of the availability domain, just its AD-N suffix, or auto to pick one from the run history')
+    parser.add_argument('--config-profiles', default='DEFAULT', help='Comma separated config profiles to consider for placement (default: DEFAULT)')
+    parser.add_argument('--regions', default='', help='Comma separated regions to consider for placement (empty means the region of each profile)')
+    parser.add_argument('--region-latency-map', default='', help='JSON file mapping region to target latency in ms (regions not in it are probed)')
     parser.add_argument('--name-suffix', required=True, help='Suffix for all the generated names')
     parser.add_argument('--open-port', required=True, type=int, help='open port')
 
     parser.add_argument('--shape', required=True, help='Compute shape')
     parser.add_argument('--shape-ocpus', type=int, required=False, default=-1, help='Compute shape number of ocpus')
     parser.add_argument('--shape-memory-in-gbs', type=int, required=False, default=-1, help='Compute shape memory in GB')
+    parser.add_argument('--capacity-mode', choices=['on-demand', 'preemptible'], default='on-demand', help='Capacity to launch the instance with, preemptible falls back to on-demand (default: on-demand)')
+    parser.add_argument('--baseline-ocpu-utilization', choices=['', 'BASELINE_1_8', 'BASELINE_1_2', 'BASELINE_1_1'], default='', help='Burstable baseline for the shape, falls back to a regular instance (empty means not burstable)')
+    parser.add_argument('--boot-volume-size-in-gbs', type=int, default=-1, help='Boot volume size in GB, e.g. to make room for a proxy cache (-1 means the image default)')
     parser.add_argument('--os-name', required=True, help='OS name')
     parser.add_argument('--os-version', required=True, help='OS version')
     parser.add_argument('--ssh-public-key', default='', help='ssh public key location (empty means no key. default: "")')
     parser.add_argument('--cloud-init', required=True, help='Path to cloud-init script file')
     parser.add_argument('--save-ip-address-to', required=True, help='Path to save ip address to')
+    parser.add_argument('--proxy-check-retry-delay', type=float, default=5, help='Seconds between proxy port checks')
+    parser.add_argument('--proxy-check-max-retries', type=int, default=0, help='Number of proxy port checks before giving up (0 means do not wait for the proxy)')
+    parser.add_argument('--boot-check-interval', type=float, default=15, help='Seconds between reads of the console for boot errors while waiting for the proxy (0 means do not check)')
+    parser.add_argument('--max-relaunches', type=int, default=3, help='Number of times a preempted instance is relaunched while waiting for the proxy')
+    parser.add_argument('--share-key', default='', help='Share one proxy among all runs using this key, e.g. the workflow run id (empty means no sharing)')
+    parser.add_argument('--save-name-suffix-to', default='', help='Path to save the name suffix of the proxy used to, which differs when attaching to a shared proxy (empty means do not save)')
+    parser.add_argument('--pool-size', type=int, default=0, help='Launch this many proxies through an instance pool instead of a single instance (0 means a single instance)')
+    parser.add_argument('--reserved-ip-pool', default='', help='Give the proxy a reserved public IP from the pool with this name, which rotate_ip.py can swap (empty means an ephemeral public IP)')
+    parser.add_argument('--reserved-ip-pool-size', type=int, default=2, help='Number of public IPs to keep reserved in the pool')
+    parser.add_argument('--save-endpoints-to', default='', help='Path to save the ip:port of every proxy to, one per line (empty means do not save)')
+    parser.add_argument('--shape-candidates', default='', help='Comma separated shapes to pick from along with the availability domain when it is auto (empty means just --shape)')
+    parser.add_argument('--history-db', default='', help='Path of a SQLite database to record the run in and to pick the auto availability domain from (empty means no history)')
+    parser.add_argument('--preflight-cache', default='', help='Path of a JSON file caching the compartment, availability domain, image and shape lookups for a day (empty means no cache)')
+    parser.add_argument('--events-file', default='', help='Path to append structured JSON line events to (empty means no events)')
+    parser.add_argument('--save-placement-to', default='', help='Path to save the chosen profile and region to as JSON (empty means do not save)')
     
-    return parser.parse_args()
+    parser.add_argument('--api-rate', type=float, default=2.0, help='Sustained OCI API calls per second allowed per service')
+    parser.add_argument('--api-burst', type=int, default=4, help='Burst size of the per service OCI API token bucket')
+    parser.add_argument('--retry-budget', type=int, default=30, help='Total number of OCI API retries allowed for this run')
 
+    return parser.parse_args()
 
-# Initialize service clients
 
 def get_compartment_id_by_name(config, identity_client, compartment_name):
     """Get compartment ID by name."""
@@ -48,7 +90,7 @@ def get_compartment_id_by_name(config, identity_client, compartment_name):
     raise ValueError(f"Compartment with name '{compartment_name}' not found.")
 
 def get_availability_domain(identity_client, compartment_id, ad_name):
-    """Get availability domain by name or the first one if name not provided."""
+    """Get availability domain by full name, falling back to matching on the AD-N suffix."""
     list_availability_domains_response = identity_client.list_availability_domains(
         compartment_id=compartment_id
     )
@@ -56,9 +98,76 @@ def get_availability_domain(identity_client, compartment_id, ad_name):
     for ad in list_availability_domains_response.data:
         if ad.name == ad_name:
             return ad
+
+    # full names are region specific, so match on the AD number when placed elsewhere
+    if 'AD-' in ad_name:
+        ad_suffix = 'AD-' + ad_name.rsplit('AD-', 1)[1]
+        for ad in list_availability_domains_response.data:
+            if ad.name.endswith(ad_suffix):
+                return ad
     raise ValueError(f"Availability domain '{ad_name}' not found.")
 
 
+def get_placement_candidates(config_file, profiles, regions):
+    """List the (profile, region) pairs the proxy can be placed in."""
+    candidates = []
+    for profile in profiles:
+        config = oci.config.from_file(file_location=config_file, profile_name=profile)
+        for region in (regions or [config['region']]):
+            candidates.append((profile, region))
+    return candidates
+
+
+def probe_region_rtt(region, attempts=3, timeout=2.0):
+    """Measure the best TCP connect time in ms to the OCI endpoint of a region."""
+    host = f'iaas.{region}.oraclecloud.com'
+    best_rtt = None
+    for _ in range(attempts):
+        start = time.monotonic()
+        try:
+            with socket.create_connection((host, 443), timeout=timeout):
+                pass
+        except OSError:
+            continue
+        rtt = (time.monotonic() - start) * 1000
+        if best_rtt is None or rtt < best_rtt:
+            best_rtt = rtt
+    return best_rtt
+
+
+def choose_placement(candidates, latency_map):
+    """Pick the candidate with the lowest latency, taken from the map or from TCP probes."""
+    if len(candidates) == 1:
+        return candidates[0]
+
+    latencies = {}
+    for profile, region in candidates:
+        if region not in latencies:
+            latency = latency_map.get(region)
+            if latency is None:
+                latency = probe_region_rtt(region)
+            latencies[region] = latency
+        print(f"Placement candidate {profile}/{region}: latency {latencies[region]} ms")
+
+    reachable = [c for c in candidates if latencies[c[1]] is not None]
+    if not reachable:
+        raise ValueError(f"None of the regions {sorted(latencies)} are reachable.")
+    return min(reachable, key=lambda c: latencies[c[1]])
+
+
+def choose_availability_domain_and_shape(identity_client, config, args, region):
+    """Pick the availability domain and shape that got a proxy ready fastest and most reliably in past runs."""
+    availability_domains = identity_client.list_availability_domains(
+        compartment_id=config['tenancy']
+    ).data
+
+    shapes = [s.strip() for s in args.shape_candidates.split(',') if s.strip() != ''] or [args.shape]
+    return run_history.choose_placement_from_history(args.history_db,
+                                                     region,
+                                                     [ad.name for ad in availability_domains],
+                                                     shapes)
+
+
 def get_image_id(compute, compartment_id, os_name, os_version, shape):
     """Get the image ID for a specific OS and version."""
     list_images_response = compute.list_images(
@@ -73,36 +182,199 @@ def get_image_id(compute, compartment_id, os_name, os_version, shape):
     
     return list_images_response.data[0].id
 
+def build_instance_metadata(ssh_public_key, cloud_init_file):
+    """Build the instance metadata carrying the cloud-init script and the SSH key."""
+    cloud_init_base64 = base64.b64encode(Path(cloud_init_file).read_bytes()).decode()
+
+    metadata = { 'user_data': cloud_init_base64 }
+    # Read SSH public key from file
+    if ssh_public_key != '':
+        metadata['ssh_authorized_keys'] = Path(ssh_public_key).read_text().strip()
+    return metadata
+
+
+def get_shape_resources(compute, compartment_id, shape_name, ocpus, memory_in_gbs, baseline_ocpu_utilization=''):
+    """Check the shape config against list_shapes and get the ocpus, memory and quota names it launches with."""
+    shapes = compute.list_shapes(compartment_id=compartment_id).data
+    shape = next((s for s in shapes if s.shape == shape_name), None)
+    if shape is None:
+        raise ValueError(f"Shape '{shape_name}' is not available in this region and compartment.")
+
+    if not shape.is_flexible:
+        if ocpus != -1 or memory_in_gbs != -1:
+            raise ValueError(f"Shape '{shape_name}' is not flexible, leave its ocpus and memory unset.")
+        ocpus, memory_in_gbs = shape.ocpus, shape.memory_in_gbs
+    else:
+        if ocpus == -1:
+            ocpus = shape.ocpus
+        if not shape.ocpu_options.min <= ocpus <= shape.ocpu_options.max:
+            raise ValueError(f"Shape '{shape_name}' takes {shape.ocpu_options.min} to {shape.ocpu_options.max} ocpus, not {ocpus}.")
+
+        memory_options = shape.memory_options
+        if memory_in_gbs == -1:
+            memory_in_gbs = ocpus * memory_options.default_per_ocpu_in_g_bs
+        if not memory_options.min_in_g_bs <= memory_in_gbs <= memory_options.max_in_g_bs:
+            raise ValueError(f"Shape '{shape_name}' takes {memory_options.min_in_g_bs} to {memory_options.max_in_g_bs} GB of memory, not {memory_in_gbs}.")
+        if not memory_options.min_per_ocpu_in_gbs <= memory_in_gbs / ocpus <= memory_options.max_per_ocpu_in_gbs:
+            raise ValueError(f"Shape '{shape_name}' takes {memory_options.min_per_ocpu_in_gbs} to {memory_options.max_per_ocpu_in_gbs} GB of memory per ocpu, "
+                             f"not {memory_in_gbs / ocpus:g}.")
+
+    if baseline_ocpu_utilization != '' and baseline_ocpu_utilization not in (shape.baseline_ocpu_utilizations or []):
+        raise ValueError(f"Shape '{shape_name}' can not be burstable with {baseline_ocpu_utilization}.")
+
+    return {'ocpus': ocpus, 'memory_in_gbs': memory_in_gbs, 'quota_names': shape.quota_names or []}
+
+
+def check_resource_availability(limits, compartment_id, service_name, limit_name, needed, availability_domain=None):
+    """Fail when the service limits and quotas of the compartment leave less than needed of a resource."""
+    kwargs = {'availability_domain': availability_domain} if availability_domain is not None else {}
+    try:
+        resource = limits.get_resource_availability(service_name, limit_name, compartment_id, **kwargs).data
+    except oci.exceptions.ServiceError as e:
+        if e.status != 404:
+            raise
+        print(f"No {service_name} limit named {limit_name}, not checking it")
+        return
+    if resource.available is not None and resource.available < needed:
+        raise ValueError(f"Only {resource.available} of {service_name} {limit_name} left "
+                         f"({resource.used} used), {needed} needed.")
+
+
+def check_compute_availability(limits, compartment_id, availability_domain, shape_resources, count):
+    """Check that the core and memory limits of the shape leave room for count instances."""
+    for limit_name in shape_resources['quota_names']:
+        if limit_name.endswith('-core-count'):
+            needed = shape_resources['ocpus'] * count
+        elif limit_name.endswith('-memory-count'):
+            needed = shape_resources['memory_in_gbs'] * count
+        else:
+            continue
+        check_resource_availability(limits, compartment_id, 'compute', limit_name, math.ceil(needed), availability_domain)
+
+
+def load_preflight_cache(path):
+    """Load the cached lookups, dropping the ones older than a day."""
+    if path == '' or not Path(path).exists():
+        return {}
+    try:
+        cache = json.loads(Path(path).read_text())
+    except ValueError:
+        return {}
+    return {key: entry for key, entry in cache.items() if time.time() - entry['ts'] < PREFLIGHT_CACHE_TTL_SECS}
+
+
+def save_preflight_cache(path, cache):
+    """Save the cached lookups."""
+    if path != '':
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps(cache, indent=2))
+
+
+def cached_lookup(cache, key, lookup):
+    """Return the cached value for the key, or run the lookup and cache what it returns."""
+    if key in cache:
+        return cache[key]['value']
+    value = lookup()
+    cache[key] = {'ts': time.time(), 'value': value}
+    return value
+
+
+def run_preflight(config, compute, identity, limits, events, args, region):
+    """Look up and validate everything the launch needs in parallel, before any resource is created."""
+    cache = load_preflight_cache(args.preflight_cache)
+    cache_prefix = f"{config['tenancy']}/{region}/{args.compartment_name}"
+
+    def timed(phase, resource_type, func, *func_args):
+        with events.phase(phase, resource_type) as event:
+            result = func(*func_args)
+            if isinstance(result, str):
+                event['ocid'] = result
+            elif isinstance(result, dict) and 'id' in result:
+                event['ocid'] = result['id']
+            return result
+
+    with events.phase('get_compartment', 'compartment') as event:
+        compartment_id = cached_lookup(cache, f'{cache_prefix}/compartment', lambda: get_compartment_id_by_name(
+            config, identity, args.compartment_name))
+        event['ocid'] = compartment_id
+    print(f"Found compartment ID: {compartment_id}")
+
+    def lookup_availability_domain():
+        ad = get_availability_domain(identity, compartment_id, args.availability_domain)
+        return {'name': ad.name, 'id': ad.id}
+
+    def lookup_image():
+        return get_image_id(compute, compartment_id, args.os_name, args.os_version, args.shape)
+
+    def lookup_shape():
+        return get_shape_resources(compute, compartment_id, args.shape, args.shape_ocpus,
+                                   args.shape_memory_in_gbs, args.baseline_ocpu_utilization)
+
+    shape_key = f'{cache_prefix}/shape/{args.shape}/{args.shape_ocpus}/{args.shape_memory_in_gbs}/{args.baseline_ocpu_utilization}'
+    with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+        ad_future = executor.submit(timed, 'get_availability_domain', 'availability_domain', cached_lookup, cache,
+                                    f'{cache_prefix}/availability_domain/{args.availability_domain}', lookup_availability_domain)
+        image_future = executor.submit(timed, 'get_image', 'image', cached_lookup, cache,
+                                       f'{cache_prefix}/image/{args.os_name}/{args.os_version}/{args.shape}', lookup_image)
+        shape_future = executor.submit(timed, 'validate_shape', 'shape', cached_lookup, cache, shape_key, lookup_shape)
+        # limits and quotas change with every run, so they are never cached
+        checks = [executor.submit(timed, 'check_vcn_limit', 'limits', check_resource_availability,
+                                  limits, compartment_id, 'vcn', 'vcn-count', 1)]
+        if args.share_key == '':
+            # attaching to a shared proxy launches nothing, and the proxy itself already counts against the limits
+            checks.append(executor.submit(lambda: timed('check_compute_limits', 'limits', check_compute_availability,
+                                                        limits, compartment_id, ad_future.result()['name'],
+                                                        shape_future.result(), max(1, args.pool_size))))
+
+        # wait for everything, so a failure is only raised once nothing is left running
+        concurrent.futures.wait([ad_future, image_future, shape_future] + checks)
+        try:
+            availability_domain = oci.identity.models.AvailabilityDomain(**ad_future.result())
+            image_id = image_future.result()
+            shape_future.result()
+            for check in checks:
+                check.result()
+        finally:
+            # only successful lookups went into the cache
+            save_preflight_cache(args.preflight_cache, cache)
+
+    print(f"Using availability domain: {availability_domain.name}")
+    print(f"Using image ID: {image_id}")
+    return compartment_id, availability_domain, image_id
+
+
 def create_instance(compute, compartment_id, subnet_id, image_id,
                     availability_domain, shape, shape_config, 
-                    display_name, ssh_public_key, cloud_init_file):
+                    display_name, ssh_public_key, cloud_init_file,
+                    boot_volume_size_in_gbs=-1, preemptible=False,
+                    freeform_tags=None, assign_public_ip=True):
     """Create a compute instance."""
-    # Read SSH public key from file
-    ssh_key = None
-    if ssh_public_key != '':
-        ssh_key = Path(ssh_public_key).read_text().strip()
-    
     instance_details = oci.core.models.LaunchInstanceDetails(
         compartment_id=compartment_id,
         availability_domain=availability_domain,
         shape=shape,
         shape_config=shape_config,
         display_name=display_name,
+        freeform_tags=freeform_tags,
         source_details=oci.core.models.InstanceSourceViaImageDetails(
             image_id=image_id
         ),
         create_vnic_details=oci.core.models.CreateVnicDetails(
             subnet_id=subnet_id,
-            assign_public_ip=True
+            assign_public_ip=assign_public_ip
         )
     )
-    cloud_init_base64 = base64.b64encode(Path(cloud_init_file).read_bytes()).decode()
+    if boot_volume_size_in_gbs != -1:
+        instance_details.source_details.boot_volume_size_in_gbs = boot_volume_size_in_gbs
 
-    metadata = { 'user_data': cloud_init_base64 }
-    if ssh_key is not None:
-        metadata['ssh_authorized_keys'] = ssh_key
+    instance_details.metadata = build_instance_metadata(ssh_public_key, cloud_init_file)
 
-    instance_details.metadata = metadata
+    if preemptible:
+        instance_details.preemptible_instance_config = oci.core.models.PreemptibleInstanceConfigDetails(
+            preemption_action=oci.core.models.TerminatePreemptionAction(
+                preserve_boot_volume=False
+            )
+        )
     
     launch_instance_response = compute.launch_instance(
         launch_instance_details=instance_details
@@ -110,7 +382,556 @@ def create_instance(compute, compartment_id, subnet_id, image_id,
     
     return launch_instance_response.data
 
-def create_vcn(network, compartment_id, vcn_name, cidr_block="10.0.0.0/16"):
+def is_capacity_error(e):
+    """Whether a launch failed for lack of capacity or quota rather than a bad request."""
+    if not isinstance(e, oci.exceptions.ServiceError):
+        return False
+    return 'out of host capacity' in str(e.message).lower() or e.code in ('LimitExceeded', 'QuotaExceeded')
+
+
+def build_shape_config(ocpus, memory_in_gbs, baseline_ocpu_utilization=''):
+    """Build the shape config, leaving out anything not set."""
+    shape_config = oci.core.models.LaunchInstanceShapeConfigDetails()
+    if ocpus != -1:
+        shape_config.ocpus = ocpus
+
+    if memory_in_gbs != -1:
+        shape_config.memory_in_gbs = memory_in_gbs
+
+    if baseline_ocpu_utilization != '':
+        shape_config.baseline_ocpu_utilization = baseline_ocpu_utilization
+    return shape_config
+
+
+def launch_proxy_instance(compute, events, args, compartment_id, **launch_kwargs):
+    """Launch the proxy with the cheaper capacity asked for, falling back to on-demand when it is not available."""
+    preemptible = args.capacity_mode == 'preemptible'
+    if preemptible or args.baseline_ocpu_utilization != '':
+        try:
+            return create_instance(
+                compute,
+                compartment_id=compartment_id,
+                shape_config=build_shape_config(args.shape_ocpus,
+                                                args.shape_memory_in_gbs,
+                                                args.baseline_ocpu_utilization),
+                preemptible=preemptible,
+                **launch_kwargs
+            )
+        except Exception as e:
+            if not is_capacity_error(e):
+                raise
+            events.emit('capacity_error', 'instance', outcome='fallback', error=str(e.message))
+            print(f"No {args.capacity_mode} capacity ({e.message}), falling back to a regular on-demand instance")
+
+    return create_instance(
+        compute,
+        compartment_id=compartment_id,
+        shape_config=build_shape_config(args.shape_ocpus, args.shape_memory_in_gbs),
+        **launch_kwargs
+    )
+
+
+def get_public_ip(compute, network, compartment_id, instance_id):
+    """Get the public IP address of the primary VNIC of an instance."""
+    vnic_attachments = compute.list_vnic_attachments(
+        compartment_id=compartment_id,
+        instance_id=instance_id
+    ).data
+    
+    return network.get_vnic(vnic_attachments[0].vnic_id).data.public_ip
+
+
+def get_primary_private_ip(compute, network, compartment_id, instance_id):
+    """Get the primary private IP of the primary VNIC of an instance."""
+    vnic_attachments = compute.list_vnic_attachments(
+        compartment_id=compartment_id,
+        instance_id=instance_id
+    ).data
+
+    private_ips = network.list_private_ips(vnic_id=vnic_attachments[0].vnic_id).data
+    return next(ip for ip in private_ips if ip.is_primary)
+
+
+def list_reserved_ips(network, compartment_id, pool_name):
+    """List the reserved public IPs tagged as part of the pool."""
+    public_ips = oci.pagination.list_call_get_all_results(
+        network.list_public_ips,
+        scope='REGION',
+        compartment_id=compartment_id,
+        lifetime='RESERVED'
+    ).data
+
+    return [ip for ip in public_ips
+            if (ip.freeform_tags or {}).get(RESERVED_IP_POOL_TAG) == pool_name and
+            ip.lifecycle_state not in ('TERMINATING', 'TERMINATED')]
+
+
+def ensure_reserved_ip_pool(network, compartment_id, pool_name, size):
+    """Reserve public IPs until the pool has at least size of them, they are kept between runs."""
+    public_ips = list_reserved_ips(network, compartment_id, pool_name)
+    for i in range(len(public_ips), size):
+        print(f"Reserving public IP {pool_name}-{i}...")
+        create_public_ip_details = oci.core.models.CreatePublicIpDetails(
+            compartment_id=compartment_id,
+            display_name=f'{pool_name}-{i}',
+            lifetime='RESERVED',
+            freeform_tags={RESERVED_IP_POOL_TAG: pool_name}
+        )
+        public_ips.append(network.create_public_ip(create_public_ip_details).data)
+    return public_ips
+
+
+def assign_reserved_ip(network, compartment_id, pool_name, private_ip_id, exclude=()):
+    """Assign a free reserved IP of the pool to the private IP, skipping the ones other runs grab meanwhile."""
+    free_ips = [ip for ip in list_reserved_ips(network, compartment_id, pool_name)
+                if ip.lifecycle_state in ('AVAILABLE', 'UNASSIGNED') and ip.id not in exclude]
+    # concurrent runs start from different IPs instead of all racing for the first one
+    random.shuffle(free_ips)
+
+    for free_ip in free_ips:
+        response = network.get_public_ip(free_ip.id)
+        if response.data.private_ip_id is not None:
+            continue
+        try:
+            # assigning moves a reserved IP even when it is in use, the etag makes sure it is still free
+            network.update_public_ip(
+                free_ip.id,
+                oci.core.models.UpdatePublicIpDetails(private_ip_id=private_ip_id),
+                if_match=response.headers['etag']
+            )
+        except oci.exceptions.ServiceError as e:
+            if e.status not in (409, 412):
+                raise
+            continue
+
+        public_ip = network.wait_until(
+            network.get_public_ip(free_ip.id),
+            'lifecycle_state',
+            'ASSIGNED',
+            max_wait_seconds=120
+        ).data
+        print(f"Assigned reserved public IP {public_ip.ip_address} ({public_ip.display_name})")
+        return public_ip
+
+    raise RuntimeError(f"No free reserved public IP left in pool {pool_name}, raise --reserved-ip-pool-size")
+
+
+def is_port_open(ip_address, port, timeout=5):
+    """Check whether a TCP connection to the port can be made."""
+    try:
+        with socket.create_connection((ip_address, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def start_proxy_instance(compute, network, events, args, compartment_id, **launch_kwargs):
+    """Launch the proxy instance, wait for it to run and publish its public IP address."""
+    with events.phase('launch_instance', 'instance') as event:
+        instance = launch_proxy_instance(compute, events, args, compartment_id, **launch_kwargs)
+        event['ocid'] = instance.id
+        event['preemptible'] = instance.preemptible_instance_config is not None
+    
+    print("\nInstance being created:")
+    print(f"OCID: {instance.id}")
+    print(f"Name: {instance.display_name}")
+    print(f"State: {instance.lifecycle_state}")
+    
+    return wait_for_public_ip(compute, network, events, args, compartment_id, instance, args.reserved_ip_pool)
+
+
+def wait_for_public_ip(compute, network, events, args, compartment_id, instance, reserved_ip_pool=''):
+    """Wait for the instance to run and publish its public IP address, assigning one from the pool if given."""
+    print("\nWaiting for instance to be provisioned...")
+    
+    # Wait for the instance to become available
+    with events.phase('wait_instance_running', 'instance') as event:
+        event['ocid'] = instance.id
+        get_instance_response = compute.wait_until(
+            compute.get_instance(instance_id=instance.id),
+            'lifecycle_state',
+            'RUNNING',
+            max_wait_seconds=600
+        )
+    
+    print(f"Instance is now {get_instance_response.data.lifecycle_state}")
+    
+    # Get the public IP address
+    if reserved_ip_pool != '':
+        with events.phase('assign_reserved_ip', 'public_ip') as event:
+            private_ip = get_primary_private_ip(compute, network, compartment_id, instance.id)
+            public_ip = assign_reserved_ip(network, compartment_id, reserved_ip_pool, private_ip.id)
+            event['ocid'] = public_ip.id
+            ip_address = public_ip.ip_address
+    else:
+        with events.phase('get_public_ip', 'instance') as event:
+            event['ocid'] = instance.id
+            ip_address = get_public_ip(compute, network, compartment_id, instance.id)
+    Path(args.save_ip_address_to).write_text(str(ip_address))
+    return instance, ip_address
+
+
+def get_console_output(compute, instance_id):
+    """Capture and return the recent serial console output of an instance."""
+    console_history = compute.capture_console_history(
+        oci.core.models.CaptureConsoleHistoryDetails(instance_id=instance_id)
+    ).data
+    try:
+        compute.wait_until(
+            compute.get_console_history(console_history.id),
+            'lifecycle_state',
+            'SUCCEEDED',
+            max_interval_seconds=2,
+            max_wait_seconds=60
+        )
+        content = compute.get_console_history_content(console_history.id, length=1024 * 1024).data
+    finally:
+        compute.delete_console_history(console_history.id)
+
+    if isinstance(content, bytes):
+        content = content.decode(errors='replace')
+    return content
+
+
+def get_boot_status(console_output):
+    """Get the fields of the last boot progress line the startup script wrote, with the lines before it."""
+    lines = console_output.splitlines()
+    for i in range(len(lines) - 1, -1, -1):
+        if BOOT_MARKER in lines[i]:
+            fields = lines[i].split(BOOT_MARKER, 1)[1].split()
+            return dict(f.split('=', 1) for f in fields if '=' in f), lines[:i + 1]
+    return None, lines
+
+
+def check_boot_progress(compute, events, instance_id, history_lines=60):
+    """Fail right away when the startup script reported a fatal error on the console."""
+    try:
+        console_output = get_console_output(compute, instance_id)
+    except (oci.exceptions.ServiceError, oci.exceptions.MaximumWaitTimeExceeded) as e:
+        # the check is best effort, the port probe still decides whether the proxy is up
+        print(f"Could not read the console of instance {instance_id}: {e}")
+        return
+    status, lines = get_boot_status(console_output)
+    if status is None:
+        print("No boot progress reported on the console yet")
+        return
+
+    if status.get('status') != 'fatal':
+        print(f"Boot progress: {status.get('status')} {status.get('step', '')}")
+        return
+
+    print(f"\nStartup script failed in step {status.get('step')}, last {history_lines} console lines:")
+    for line in lines[-history_lines:]:
+        print(f"    {line}")
+    events.emit('boot_failed', 'instance', instance_id, outcome='error', **status)
+    raise RuntimeError(f"Startup script failed in step {status.get('step')} at line {status.get('line')}")
+
+
+def wait_for_proxy(compute, network, events, args, compartment_id, instance, ip_address, **launch_kwargs):
+    """Wait for the proxy port to open, relaunching the instance if it gets preempted meanwhile."""
+    relaunches = 0
+    counter = 0
+    last_boot_check = time.monotonic()
+    while True:
+        if counter == args.proxy_check_max_retries:
+            raise RuntimeError(f"Reached the retry upper limit of {counter} attempts")
+
+        if is_port_open(ip_address, args.open_port):
+            print("The machine is UP !!!")
+            return instance, ip_address
+
+        current = compute.get_instance(instance.id).data
+        state = current.lifecycle_state
+        if state in ('STOPPING', 'STOPPED', 'TERMINATING', 'TERMINATED'):
+            events.emit('preempted', 'instance', instance.id, outcome=state)
+            if relaunches == args.max_relaunches:
+                raise RuntimeError(f"Instance {instance.id} went {state} after {relaunches} relaunches")
+            relaunches += 1
+            if args.share_key != '' and not launch_kwargs:
+                # attached to a shared proxy, the run that launched it relaunches it
+                print(f"Shared instance {instance.id} is {state}, waiting for its replacement ({relaunches}/{args.max_relaunches})")
+                with events.phase('wait_shared_proxy', 'instance') as event:
+                    replacement = wait_for_replacement_instance(compute, compartment_id, args.share_key, instance.id)
+                    event['ocid'] = replacement.id
+                instance, ip_address = wait_for_public_ip(compute, network, events, args, compartment_id, replacement)
+            else:
+                print(f"Instance {instance.id} is {state}, probably preempted, relaunching ({relaunches}/{args.max_relaunches})")
+                # a stopped instance keeps its name and its cores, the replacement must not live next to it
+                current = terminate_instance(compute, instance.id) or current
+                if (launch_kwargs.get('freeform_tags') or {}).get(SHARE_KEY_TAG):
+                    # the attached jobs still hold their references, the replacement carries them over
+                    launch_kwargs['freeform_tags'] = dict(current.freeform_tags or launch_kwargs['freeform_tags'])
+                instance, ip_address = start_proxy_instance(compute, network, events, args, compartment_id, **launch_kwargs)
+            counter = 0
+            continue
+
+        if args.boot_check_interval > 0 and time.monotonic() - last_boot_check >= args.boot_check_interval:
+            check_boot_progress(compute, events, instance.id)
+            last_boot_check = time.monotonic()
+
+        print(f"sleeping for {args.proxy_check_retry_delay} to check again if machine started.. attempts: {counter}")
+        counter += 1
+        time.sleep(args.proxy_check_retry_delay)
+
+
+def create_instance_configuration(compute_management, configuration_name, compartment_id, subnet_id, image_id,
+                                  availability_domain, shape, shape_config,
+                                  display_name, ssh_public_key, cloud_init_file,
+                                  boot_volume_size_in_gbs=-1, preemptible=False,
+                                  freeform_tags=None, assign_public_ip=True):
+    """Create an instance configuration that launches the same instance create_instance does."""
+    launch_details = oci.core.models.InstanceConfigurationLaunchInstanceDetails(
+        compartment_id=compartment_id,
+        availability_domain=availability_domain,
+        shape=shape,
+        shape_config=oci.core.models.InstanceConfigurationLaunchInstanceShapeConfigDetails(
+            ocpus=shape_config.ocpus,
+            memory_in_gbs=shape_config.memory_in_gbs,
+            baseline_ocpu_utilization=shape_config.baseline_ocpu_utilization
+        ),
+        display_name=display_name,
+        freeform_tags=freeform_tags,
+        metadata=build_instance_metadata(ssh_public_key, cloud_init_file),
+        source_details=oci.core.models.InstanceConfigurationInstanceSourceViaImageDetails(
+            image_id=image_id
+        ),
+        create_vnic_details=oci.core.models.InstanceConfigurationCreateVnicDetails(
+            subnet_id=subnet_id,
+            assign_public_ip=assign_public_ip
+        )
+    )
+    if boot_volume_size_in_gbs != -1:
+        launch_details.source_details.boot_volume_size_in_gbs = boot_volume_size_in_gbs
+
+    if preemptible:
+        launch_details.preemptible_instance_config = oci.core.models.PreemptibleInstanceConfigDetails(
+            preemption_action=oci.core.models.TerminatePreemptionAction(
+                preserve_boot_volume=False
+            )
+        )
+
+    create_details = oci.core.models.CreateInstanceConfigurationDetails(
+        compartment_id=compartment_id,
+        display_name=configuration_name,
+        freeform_tags=freeform_tags,
+        instance_details=oci.core.models.ComputeInstanceDetails(
+            instance_type='compute',
+            launch_details=launch_details
+        )
+    )
+    return compute_management.create_instance_configuration(create_details).data
+
+
+def create_instance_pool(compute_management, compartment_id, instance_configuration_id,
+                         availability_domain, subnet_id, size, pool_name):
+    """Create an instance pool, which launches all of its instances from one API call."""
+    print(f"Creating instance pool {pool_name} with {size} instances...")
+
+    create_details = oci.core.models.CreateInstancePoolDetails(
+        compartment_id=compartment_id,
+        display_name=pool_name,
+        instance_configuration_id=instance_configuration_id,
+        size=size,
+        # not prefixed with proxy- so the cleanup sweep does not terminate pool members one by one
+        instance_display_name_formatter=f'{pool_name}-${{launchCount}}',
+        placement_configurations=[
+            oci.core.models.CreateInstancePoolPlacementConfigurationDetails(
+                availability_domain=availability_domain,
+                primary_subnet_id=subnet_id
+            )
+        ]
+    )
+    return compute_management.create_instance_pool(create_details).data
+
+
+def get_instance_pool_by_name(compute_management, compartment_id, pool_name):
+    """Get a live instance pool by name."""
+    pools = oci.pagination.list_call_get_all_results(
+        compute_management.list_instance_pools,
+        compartment_id=compartment_id
+    ).data
+
+    for pool in pools:
+        if pool.display_name == pool_name and pool.lifecycle_state not in ('TERMINATING', 'TERMINATED'):
+            return pool
+
+    raise ValueError(f"Instance pool with name '{pool_name}' not found.")
+
+
+def get_pool_endpoints(compute_management, compute, network, compartment_id, pool_id, port):
+    """Get the ip:port of every running pool instance, oldest first so existing endpoints keep their place."""
+    instances = oci.pagination.list_call_get_all_results(
+        compute_management.list_instance_pool_instances,
+        compartment_id=compartment_id,
+        instance_pool_id=pool_id
+    ).data
+
+    running = sorted((i for i in instances if i.state.upper() == 'RUNNING'),
+                     key=lambda i: (i.time_created, i.id))
+    return [f'{get_public_ip(compute, network, compartment_id, i.id)}:{port}' for i in running]
+
+
+def wait_for_pool_endpoints(compute_management, compute, network, compartment_id, pool_id, port, max_wait_seconds=900):
+    """Wait for the pool to finish provisioning or scaling and get its endpoints."""
+    compute_management.wait_until(
+        compute_management.get_instance_pool(pool_id),
+        'lifecycle_state',
+        'RUNNING',
+        max_wait_seconds=max_wait_seconds
+    )
+    return get_pool_endpoints(compute_management, compute, network, compartment_id, pool_id, port)
+
+
+def save_endpoints(path, endpoints):
+    """Write the endpoints one per line."""
+    Path(path).write_text(''.join(f'{endpoint}\n' for endpoint in endpoints))
+
+
+def start_proxy_pool(compute_management, compute, network, events, args, compartment_id, **launch_kwargs):
+    """Launch the proxies through an instance pool and publish the public IP address of the first one."""
+    suffix = args.name_suffix
+    launch_kwargs['display_name'] = f'pool-{suffix}'
+
+    # pool instances are launched asynchronously, so there is no capacity error to fall back on here
+    with events.phase('create_instance_configuration', 'instance_configuration') as event:
+        instance_configuration = create_instance_configuration(
+            compute_management,
+            f'ic-{suffix}',
+            compartment_id=compartment_id,
+            shape_config=build_shape_config(args.shape_ocpus,
+                                            args.shape_memory_in_gbs,
+                                            args.baseline_ocpu_utilization),
+            preemptible=args.capacity_mode == 'preemptible',
+            **launch_kwargs
+        )
+        event['ocid'] = instance_configuration.id
+
+    with events.phase('create_instance_pool', 'instance_pool') as event:
+        pool = create_instance_pool(compute_management,
+                                    compartment_id,
+                                    instance_configuration.id,
+                                    launch_kwargs['availability_domain'],
+                                    launch_kwargs['subnet_id'],
+                                    args.pool_size,
+                                    f'pool-{suffix}')
+        event['ocid'] = pool.id
+
+    print("\nWaiting for instance pool to be provisioned...")
+    with events.phase('wait_pool_running', 'instance_pool') as event:
+        event['ocid'] = pool.id
+        endpoints = wait_for_pool_endpoints(compute_management,
+                                            compute,
+                                            network,
+                                            compartment_id,
+                                            pool.id,
+                                            args.open_port)
+        event['size'] = len(endpoints)
+    if not endpoints:
+        raise RuntimeError(f"Instance pool {pool.id} has no running instances")
+
+    print(f"Instance pool is running with endpoints {endpoints}")
+    ip_address = endpoints[0].rsplit(':', 1)[0]
+    Path(args.save_ip_address_to).write_text(ip_address)
+    return pool, endpoints
+
+
+def wait_for_endpoints(args, endpoints):
+    """Wait for the proxy port of every endpoint to open."""
+    pending = list(endpoints)
+    for counter in range(args.proxy_check_max_retries):
+        pending = [e for e in pending if not is_port_open(e.rsplit(':', 1)[0], args.open_port)]
+        if not pending:
+            print("All the machines are UP !!!")
+            return
+        print(f"sleeping for {args.proxy_check_retry_delay} to check again if {pending} started.. attempts: {counter}")
+        time.sleep(args.proxy_check_retry_delay)
+    raise RuntimeError(f"Reached the retry upper limit of {args.proxy_check_max_retries} attempts for {pending}")
+
+
+def get_share_tags(share_key):
+    """Get the freeform tags that mark resources as part of a shared proxy."""
+    if share_key == '':
+        return None
+    return {SHARE_KEY_TAG: share_key, REFCOUNT_TAG: '1'}
+
+
+def find_shared_instance(compute, compartment_id, share_key):
+    """Find a live proxy instance shared under the given key."""
+    instances = oci.pagination.list_call_get_all_results(
+        compute.list_instances,
+        compartment_id=compartment_id
+    ).data
+
+    for instance in instances:
+        tags = instance.freeform_tags or {}
+        if tags.get(SHARE_KEY_TAG) == share_key and \
+                instance.lifecycle_state in ('PROVISIONING', 'STARTING', 'RUNNING') and \
+                int(tags.get(REFCOUNT_TAG, '0')) > 0:
+            return instance
+    return None
+
+
+def attach_shared_instance(compute, compartment_id, share_key):
+    """Take a reference on the proxy shared under the key, if there is one."""
+    instance = find_shared_instance(compute, compartment_id, share_key)
+    if instance is None:
+        return None
+
+    refcount = update_refcount(compute, instance.id, 1)
+    if refcount == 0:
+        return None
+    print(f"Attached to shared proxy {instance.display_name}, now used by {refcount} jobs")
+    return instance
+
+
+def is_share_leader(network, compartment_id, share_key, vcn_id):
+    """Whether our VCN is the oldest one created under the share key, which makes this run provision the proxy."""
+    vcns = oci.pagination.list_call_get_all_results(
+        network.list_vcns,
+        compartment_id=compartment_id
+    ).data
+
+    candidates = [vcn for vcn in vcns
+                  if (vcn.freeform_tags or {}).get(SHARE_KEY_TAG) == share_key and
+                  vcn.lifecycle_state not in ('TERMINATING', 'TERMINATED')]
+    if not candidates:
+        return True
+    leader = min(candidates, key=lambda vcn: (vcn.time_created, vcn.id))
+    return leader.id == vcn_id
+
+
+def wait_for_shared_instance(compute, compartment_id, share_key, retry_delay=10, max_wait_seconds=900):
+    """Wait for the run that won the election to launch the shared proxy, then attach to it."""
+    deadline = time.monotonic() + max_wait_seconds
+    while time.monotonic() < deadline:
+        instance = attach_shared_instance(compute, compartment_id, share_key)
+        if instance is not None:
+            return instance
+        print(f"Shared proxy for {share_key} not launched yet, checking again in {retry_delay}s")
+        time.sleep(retry_delay)
+    raise RuntimeError(f"No shared proxy for {share_key} showed up within {max_wait_seconds}s")
+
+
+def wait_for_replacement_instance(compute, compartment_id, share_key, old_instance_id, retry_delay=10, max_wait_seconds=900):
+    """Wait for the run that launched a shared proxy to relaunch it, the reference we hold moves along with it."""
+    deadline = time.monotonic() + max_wait_seconds
+    while time.monotonic() < deadline:
+        instance = find_shared_instance(compute, compartment_id, share_key)
+        if instance is not None and instance.id != old_instance_id:
+            print(f"Shared proxy {instance.display_name} was relaunched as {instance.id}")
+            return instance
+        print(f"Shared proxy for {share_key} not relaunched yet, checking again in {retry_delay}s")
+        time.sleep(retry_delay)
+    raise RuntimeError(f"Shared proxy for {share_key} was not relaunched within {max_wait_seconds}s")
+
+
+def save_name_suffix(path, suffix):
+    """Save the name suffix of the proxy this run holds, for the stop hook to tear down or release."""
+    if path != '':
+        Path(path).write_text(suffix)
+
+
+def create_vcn(network, compartment_id, vcn_name, cidr_block="10.0.0.0/16", freeform_tags=None):
     """Create a new Virtual Cloud Network (VCN)."""
     print(f"Creating VCN: {vcn_name}...")
     
@@ -118,14 +939,14 @@ def create_vcn(network, compartment_id, vcn_name, cidr_block="10.0.0.0/16"):
         compartment_id=compartment_id,
         display_name=vcn_name,
         cidr_block=cidr_block,
-        dns_label=vcn_name.lower().replace('-', '').replace(' ', '')[:15]
+        dns_label=vcn_name.lower().replace('-', '').replace(' ', '')[:15],
+        freeform_tags=freeform_tags
     )
     
     vcn = network.create_vcn(create_vcn_details).data
     
     # Wait for VCN to be available
-    oci.wait_until(
-        network,
+    network.wait_until(
         network.get_vcn(vcn.id),
         'lifecycle_state',
         'AVAILABLE',
@@ -149,8 +970,7 @@ def create_internet_gateway(network, compartment_id, vcn_id, ig_name):
     ig = network.create_internet_gateway(create_ig_details).data
     
     # Wait for Internet Gateway to be available
-    oci.wait_until(
-        network,
+    network.wait_until(
         network.get_internet_gateway(ig.id),
         'lifecycle_state',
         'AVAILABLE',
@@ -256,8 +1076,7 @@ def create_security_list(network, compartment_id, vcn_id, port, security_list_na
     security_list = network.create_security_list(create_security_list_details).data
     
     # Wait for security list to be available
-    oci.wait_until(
-        network,
+    network.wait_until(
         network.get_security_list(security_list.id),
         'lifecycle_state',
         'AVAILABLE',
@@ -285,8 +1104,7 @@ def create_subnet(network, compartment_id, vcn_id, security_list_id, subnet_name
     subnet = network.create_subnet(create_subnet_details).data
     
     # Wait for subnet to be available
-    oci.wait_until(
-        network,
+    network.wait_until(
         network.get_subnet(subnet.id),
         'lifecycle_state',
         'AVAILABLE',
@@ -296,118 +1114,228 @@ def create_subnet(network, compartment_id, vcn_id, security_list_id, subnet_name
     print(f"Subnet created: {subnet.id}")
     return subnet
 
-def main():
-    # Parse command line arguments
-    args = parse_arguments()
-
-    config = oci.config.from_file(file_location=args.config_file)
-    
-    compute_client = oci.core.ComputeClient(config)
-    network_client = oci.core.VirtualNetworkClient(config)
-    identity_client = oci.identity.IdentityClient(config)
-
-    try:
-        # Get compartment ID from compartment name
-        compartment_id = get_compartment_id_by_name(config,
-                                                    identity_client,
-                                                    args.compartment_name)
-        print(f"Found compartment ID: {compartment_id}")
-        
-        # Get availability domain
-        availability_domain = get_availability_domain(identity_client,
-                                                      compartment_id,
-                                                      args.availability_domain)
-        print(f"Using availability domain: {availability_domain.name}")
-
-        # Get image ID
-        image_id = get_image_id(compute_client,
-                                compartment_id, 
-                                args.os_name, 
-                                args.os_version, 
-                                args.shape)
-        print(f"Using image ID: {image_id}")
-
-        shape_config = oci.core.models.LaunchInstanceShapeConfigDetails()
-        if args.shape_ocpus != -1:
-            shape_config.ocpus = args.shape_ocpus
-
-        if args.shape_memory_in_gbs != -1:
-            shape_config.memory_in_gbs = args.shape_memory_in_gbs
-     
-        suffix = args.name_suffix
-
-        vcn = create_vcn(network_client,
-                         compartment_id, 
-                         f'vcn-{suffix}')
-
-        ig = create_internet_gateway(network_client,
+def create_network(network, events, args, compartment_id, vcn, availability_domain, suffix):
+    """Create the internet gateway, route, security list and subnet of the proxy VCN."""
+    with events.phase('create_internet_gateway', 'internet_gateway') as event:
+        ig = create_internet_gateway(network,
                                      compartment_id, 
                                      vcn.id, 
                                      f'ig-{suffix}')
+        event['ocid'] = ig.id
 
-        update_default_route_table(network_client,
-                                   compartment_id, 
-                                   vcn, 
-                                   ig.id)
+    with events.phase('update_route_table', 'route_table') as event:
+        route_table = update_default_route_table(network,
+                                                 compartment_id, 
+                                                 vcn, 
+                                                 ig.id)
+        event['ocid'] = route_table.id
 
-        security_list = create_security_list(network_client,
+    with events.phase('create_security_list', 'security_list') as event:
+        security_list = create_security_list(network,
                                              compartment_id, 
                                              vcn.id, 
                                              args.open_port, 
                                              f'sl-{suffix}')
+        event['ocid'] = security_list.id
 
-        subnet = create_subnet(network_client,
+    with events.phase('create_subnet', 'subnet') as event:
+        subnet = create_subnet(network,
                                compartment_id, 
                                vcn.id,
                                security_list.id,
                                f'subnet-{suffix}',
                                '10.0.0.0/24',
-                               args.availability_domain)
-   
-        # Create instance
-        instance = create_instance(
-            compute_client,
-            compartment_id=compartment_id,
-            subnet_id=subnet.id,
-            image_id=image_id,
-            availability_domain=args.availability_domain,
-            shape=args.shape,
-            shape_config=shape_config,
-            display_name=f'proxy-{suffix}',
-            ssh_public_key=args.ssh_public_key,
-            cloud_init_file=args.cloud_init
-        )
-        
-        print("\nInstance being created:")
-        print(f"OCID: {instance.id}")
-        print(f"Name: {instance.display_name}")
-        print(f"State: {instance.lifecycle_state}")
-        
-        print("\nWaiting for instance to be provisioned...")
-        
-        # Wait for the instance to become available
-        get_instance_response = oci.wait_until(
-            compute_client,
-            compute_client.get_instance(instance_id=instance.id),
-            'lifecycle_state',
-            'RUNNING',
-            max_wait_seconds=600
-        )
-        
-        print(f"Instance is now {get_instance_response.data.lifecycle_state}")
-        
-        # Get the public IP address
-        vnic_attachments = compute_client.list_vnic_attachments(
-            compartment_id=compartment_id,
-            instance_id=instance.id
-        ).data
-        
-        vnic = network_client.get_vnic(vnic_attachments[0].vnic_id).data
-        Path(args.save_ip_address_to).write_text(str(vnic.public_ip))
+                               availability_domain)
+        event['ocid'] = subnet.id
+    return subnet
+
+
+def main():
+    # Parse command line arguments
+    args = parse_arguments()
+
+    events = EventLog(args.events_file, 'start')
+
+    profiles = [p.strip() for p in args.config_profiles.split(',') if p.strip() != '']
+    regions = [r.strip() for r in args.regions.split(',') if r.strip() != '']
+    latency_map = {}
+    if args.region_latency_map != '':
+        latency_map = json.loads(Path(args.region_latency_map).read_text())
+
+    with events.phase('choose_placement', 'region'):
+        candidates = get_placement_candidates(args.config_file, profiles, regions)
+        profile, region = choose_placement(candidates, latency_map)
+    print(f"Placing proxy in region {region} using profile {profile}")
+    if args.save_placement_to != '':
+        Path(args.save_placement_to).write_text(json.dumps({'profile': profile, 'region': region}))
+
+    config = oci.config.from_file(file_location=args.config_file, profile_name=profile)
+    config['region'] = region
+    
+    limiter = RateLimiter(args.api_rate, args.api_burst, args.retry_budget)
+    compute_client, network_client, identity_client = create_clients(config, limiter)
+
+    run_start = time.monotonic()
+    outcome = 'error'
+    try:
+        if args.pool_size > 0 and args.share_key != '':
+            raise ValueError("A proxy pool can not be shared, use either --pool-size or --share-key")
+        if args.pool_size > 0 and args.reserved_ip_pool != '':
+            raise ValueError("Reserved public IPs are only assigned to a single proxy, use either --pool-size or --reserved-ip-pool")
+
+        if args.availability_domain == 'auto':
+            if args.history_db == '':
+                raise ValueError("Picking the availability domain automatically needs a --history-db")
+            with events.phase('choose_availability_domain', 'availability_domain') as event:
+                (args.availability_domain, args.shape), score = choose_availability_domain_and_shape(identity_client,
+                                                                                                   config,
+                                                                                                   args,
+                                                                                                   region)
+                event.update(availability_domain=args.availability_domain, shape=args.shape, **score)
+            print(f"Picked availability domain {args.availability_domain} and shape {args.shape} from the run history")
+
+        # Look up and validate everything before creating anything, so a bad config leaks nothing
+        with events.phase('preflight', 'preflight'):
+            compartment_id, availability_domain, image_id = run_preflight(config,
+                                                                          compute_client,
+                                                                          identity_client,
+                                                                          create_limits_client(config, limiter),
+                                                                          events,
+                                                                          args,
+                                                                          region)
+        # the run history keys on the full name, not on the AD-N suffix it may have been given as
+        args.availability_domain = availability_domain.name
+
+        suffix = args.name_suffix
+        # saved as soon as it is decided, so the stop hook gets it even when a later step fails
+        save_name_suffix(args.save_name_suffix_to, suffix)
+
+        shared_instance = None
+        if args.share_key != '':
+            with events.phase('attach_shared_proxy', 'instance') as event:
+                shared_instance = attach_shared_instance(compute_client, compartment_id, args.share_key)
+                event['ocid'] = shared_instance.id if shared_instance is not None else None
+            if shared_instance is not None:
+                suffix = shared_instance.display_name[len('proxy-'):]
+                save_name_suffix(args.save_name_suffix_to, suffix)
+
+        if shared_instance is None:
+            with events.phase('create_vcn', 'vcn') as event:
+                vcn = create_vcn(network_client,
+                                 compartment_id, 
+                                 f'vcn-{suffix}',
+                                 freeform_tags=get_share_tags(args.share_key))
+                event['ocid'] = vcn.id
+
+            if args.share_key != '' and not is_share_leader(network_client, compartment_id, args.share_key, vcn.id):
+                print(f"Another run is provisioning the shared proxy for {args.share_key}, waiting for it")
+                delete_vcn(network_client, vcn.id)
+                with events.phase('wait_shared_proxy', 'instance') as event:
+                    shared_instance = wait_for_shared_instance(compute_client, compartment_id, args.share_key)
+                    event['ocid'] = shared_instance.id
+                suffix = shared_instance.display_name[len('proxy-'):]
+                save_name_suffix(args.save_name_suffix_to, suffix)
+
+        if shared_instance is None:
+            subnet = create_network(network_client,
+                                    events,
+                                    args,
+                                    compartment_id,
+                                    vcn,
+                                    availability_domain.name,
+                                    suffix)
+
+            if args.reserved_ip_pool != '':
+                with events.phase('reserve_public_ips', 'public_ip') as event:
+                    reserved_ips = ensure_reserved_ip_pool(network_client,
+                                                           compartment_id,
+                                                           args.reserved_ip_pool,
+                                                           args.reserved_ip_pool_size)
+                    event['size'] = len(reserved_ips)
+
+            # Create instance, the compartment is passed along separately
+            launch_kwargs = dict(
+                subnet_id=subnet.id,
+                image_id=image_id,
+                availability_domain=availability_domain.name,
+                shape=args.shape,
+                display_name=f'proxy-{suffix}',
+                ssh_public_key=args.ssh_public_key,
+                cloud_init_file=args.cloud_init,
+                boot_volume_size_in_gbs=args.boot_volume_size_in_gbs,
+                freeform_tags=get_share_tags(args.share_key),
+                assign_public_ip=args.reserved_ip_pool == ''
+            )
+            if args.pool_size > 0:
+                compute_management_client = create_compute_management_client(config, limiter)
+                instance, endpoints = start_proxy_pool(compute_management_client,
+                                                       compute_client,
+                                                       network_client,
+                                                       events,
+                                                       args,
+                                                       compartment_id,
+                                                       **launch_kwargs)
+                ip_address = endpoints[0].rsplit(':', 1)[0]
+            else:
+                instance, ip_address = start_proxy_instance(compute_client,
+                                                            network_client,
+                                                            events,
+                                                            args,
+                                                            compartment_id,
+                                                            **launch_kwargs)
+        else:
+            # the run that launched a shared proxy owns relaunching it
+            launch_kwargs = {}
+            instance, ip_address = wait_for_public_ip(compute_client,
+                                                      network_client,
+                                                      events,
+                                                      args,
+                                                      compartment_id,
+                                                      shared_instance)
+
+        if args.proxy_check_max_retries > 0 and args.pool_size > 0:
+            with events.phase('wait_for_proxy', 'proxy') as event:
+                event['ocid'] = instance.id
+                wait_for_endpoints(args, endpoints)
+        elif args.proxy_check_max_retries > 0:
+            with events.phase('wait_for_proxy', 'proxy') as event:
+                instance, ip_address = wait_for_proxy(compute_client,
+                                                      network_client,
+                                                      events,
+                                                      args,
+                                                      compartment_id,
+                                                      instance,
+                                                      ip_address,
+                                                      **launch_kwargs)
+                event['ocid'] = instance.id
+
+        if args.pool_size == 0:
+            endpoints = [f'{ip_address}:{args.open_port}']
+        if args.save_endpoints_to != '':
+            save_endpoints(args.save_endpoints_to, endpoints)
+
+        events.emit('start', 'proxy', instance.id, run_start, time.monotonic() - run_start)
+        outcome = 'ok'
         
     except Exception as e:
+        events.emit('start', 'proxy', None, run_start, time.monotonic() - run_start, 'error', error=str(e))
+        outcome = 'capacity_error' if is_capacity_error(e) else 'error'
         print(f"Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        print(f"OCI API stats: {limiter.metrics}")
+        events.emit('api_stats', 'oci_api', **limiter.metrics)
+        if args.history_db != '':
+            run_history.record_run(args.history_db,
+                                   region,
+                                   args.availability_domain,
+                                   args.shape,
+                                   args.shape_ocpus,
+                                   args.shape_memory_in_gbs,
+                                   args.capacity_mode,
+                                   outcome,
+                                   time.monotonic() - run_start,
+                                   events.events)
 
 if __name__ == "__main__":
     main()
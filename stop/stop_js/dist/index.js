@@ -1,3 +1,3 @@
 (()=>{var A={5476:function(A,e,t){"use strict";var r=this&&this.__createBinding||(Object.create?function(A,e,t,r){if(r===undefined)r=t;var s=Object.getOwnPropertyDescriptor(e,t);if(!s||("get"in s?!e.__esModule:s.writable||s.configurable)){s={enumerable:true,get:function(){return e[t]}}}Object.defineProperty(A,r,s)}:function(A,e,t,r){if(r===undefined)r=t;A[r]=e[t]});var s=this&&this.__setModuleDefault||(Object.create?function(A,e){Object.defineProperty(A,"default",{enumerable:true,value:e})}:function(A,e){A["default"]=e});var o=this&&this.__importStar||function(A){if(A&&A.__esModule)return A;var e={};if(A!=null)for(var t in A)if(t!=="default"&&Object.prototype.hasOwnProperty.call(A,t))r(e,A,t);s(e,A);return e};Object.defineProperty(e,"__esModule",{value:true});e.issue=e.issueCommand=void 0;const n=o(t(857));const i=t(5384);function issueCommand(A,e,t){const r=new Command(A,e,t);process.stdout.write(r.toString()+n.EOL)}e.issueCommand=issueCommand;function issue(A,e=""){issueCommand(A,{},e)}e.issue=issue;const a="::";class Command{constructor(A,e,t){if(!A){A="missing.command"}this.command=A;this.properties=e;this.message=t}toString(){let A=a+this.command;if(this.properties&&Object.keys(this.properties).length>0){A+=" ";let e=true;for(const t in this.properties){if(this.properties.hasOwnProperty(t)){const r=this.properties[t];if(r){if(e){e=false}else{A+=","}A+=`${t}=${escapeProperty(r)}`}}}}A+=`${a}${escapeData(this.message)}`;return A}}function escapeData(A){return(0,i.toCommandValue)(A).replace(/%/g,"%25").replace(/\r/g,"%0D").replace(/\n/g,"%0A")}function escapeProperty(A){return(0,i.toCommandValue)(A).replace(/%/g,"%25").replace(/\r/g,"%0D").replace(/\n/g,"%0A").replace(/:/g,"%3A").replace(/,/g,"%2C")}},8770:function(A,e,t){"use strict";var r=this&&this.__createBinding||(Object.create?function(A,e,t,r){if(r===undefined)r=t;var s=Object.getOwnPropertyDescriptor(e,t);if(!s||("get"in s?!e.__esModule:s.writable||s.configurable)){s={enumerable:true,get:function(){return e[t]}}}Object.defineProperty(A,r,s)}:function(A,e,t,r){if(r===undefined)r=t;A[r]=e[t]});var s=this&&this.__setModuleDefault||(Object.create?function(A,e){Object.defineProperty(A,"default",{enumerable:true,value:e})}:function(A,e){A["default"]=e});var o=this&&this.__importStar||function(A){if(A&&A.__esModule)return A;var e={};if(A!=null)for(var t in A)if(t!=="default"&&Object.prototype.hasOwnProperty.call(A,t))r(e,A,t);s(e,A);return e};var n=this&&this.__awaiter||function(A,e,t,r){function adopt(A){return A instanceof t?A:new t((function(e){e(A)}))}return new(t||(t=Promise))((function(t,s){function fulfilled(A){try{step(r.next(A))}catch(A){s(A)}}function rejected(A){try{step(r["throw"](A))}catch(A){s(A)}}function step(A){A.done?t(A.value):adopt(A.value).then(fulfilled,rejected)}step((r=r.apply(A,e||[])).next())}))};Object.defineProperty(e,"__esModule",{value:true});e.platform=e.toPlatformPath=e.toWin32Path=e.toPosixPath=e.markdownSummary=e.summary=e.getIDToken=e.getState=e.saveState=e.group=e.endGroup=e.startGroup=e.info=e.notice=e.warning=e.error=e.debug=e.isDebug=e.setFailed=e.setCommandEcho=e.setOutput=e.getBooleanInput=e.getMultilineInput=e.getInput=e.addPath=e.setSecret=e.exportVariable=e.ExitCode=void 0;const i=t(5476);const a=t(1171);const E=t(5384);const g=o(t(857));const c=o(t(6928));const Q=t(7400);var C;(function(A){A[A["Success"]=0]="Success";A[A["Failure"]=1]="Failure"})(C||(e.ExitCode=C={}));function exportVariable(A,e){const t=(0,E.toCommandValue)(e);process.env[A]=t;const r=process.env["GITHUB_ENV"]||"";if(r){return(0,a.issueFileCommand)("ENV",(0,a.prepareKeyValueMessage)(A,e))}(0,i.issueCommand)("set-env",{name:A},t)}e.exportVariable=exportVariable;function setSecret(A){(0,i.issueCommand)("add-mask",{},A)}e.setSecret=setSecret;function addPath(A){const e=process.env["GITHUB_PATH"]||"";if(e){(0,a.issueFileCommand)("PATH",A)}else{(0,i.issueCommand)("add-path",{},A)}process.env["PATH"]=`${A}${c.delimiter}${process.env["PATH"]}`}e.addPath=addPath;function getInput(A,e){const t=process.env[`INPUT_${A.replace(/ /g,"_").toUpperCase()}`]||"";if(e&&e.required&&!t){throw new Error(`Input required and not supplied: ${A}`)}if(e&&e.trimWhitespace===false){return t}return t.trim()}e.getInput=getInput;function getMultilineInput(A,e){const t=getInput(A,e).split("\n").filter((A=>A!==""));if(e&&e.trimWhitespace===false){return t}return t.map((A=>A.trim()))}e.getMultilineInput=getMultilineInput;function getBooleanInput(A,e){const t=["true","True","TRUE"];const r=["false","False","FALSE"];const s=getInput(A,e);if(t.includes(s))return true;if(r.includes(s))return false;throw new TypeError(`Input does not meet YAML 1.2 "Core Schema" specification: ${A}\n`+`Support boolean input list: \`true | True | TRUE | false | False | FALSE\``)}e.getBooleanInput=getBooleanInput;function setOutput(A,e){const t=process.env["GITHUB_OUTPUT"]||"";if(t){return(0,a.issueFileCommand)("OUTPUT",(0,a.prepareKeyValueMessage)(A,e))}process.stdout.write(g.EOL);(0,i.issueCommand)("set-output",{name:A},(0,E.toCommandValue)(e))}e.setOutput=setOutput;function setCommandEcho(A){(0,i.issue)("echo",A?"on":"off")}e.setCommandEcho=setCommandEcho;function setFailed(A){process.exitCode=C.Failure;error(A)}e.setFailed=setFailed;function isDebug(){return process.env["RUNNER_DEBUG"]==="1"}e.isDebug=isDebug;function debug(A){(0,i.issueCommand)("debug",{},A)}e.debug=debug;function error(A,e={}){(0,i.issueCommand)("error",(0,E.toCommandProperties)(e),A instanceof Error?A.toString():A)}e.error=error;function warning(A,e={}){(0,i.issueCommand)("warning",(0,E.toCommandProperties)(e),A instanceof Error?A.toString():A)}e.warning=warning;function notice(A,e={}){(0,i.issueCommand)("notice",(0,E.toCommandProperties)(e),A instanceof Error?A.toString():A)}e.notice=notice;function info(A){process.stdout.write(A+g.EOL)}e.info=info;function startGroup(A){(0,i.issue)("group",A)}e.startGroup=startGroup;function endGroup(){(0,i.issue)("endgroup")}e.endGroup=endGroup;function group(A,e){return n(this,void 0,void 0,(function*(){startGroup(A);let t;try{t=yield e()}finally{endGroup()}return t}))}e.group=group;function saveState(A,e){const t=process.env["GITHUB_STATE"]||"";if(t){return(0,a.issueFileCommand)("STATE",(0,a.prepareKeyValueMessage)(A,e))}(0,i.issueCommand)("save-state",{name:A},(0,E.toCommandValue)(e))}e.saveState=saveState;function getState(A){return process.env[`STATE_${A}`]||""}e.getState=getState;function getIDToken(A){return n(this,void 0,void 0,(function*(){return yield Q.OidcClient.getIDToken(A)}))}e.getIDToken=getIDToken;var B=t(1602);Object.defineProperty(e,"summary",{enumerable:true,get:function(){return B.summary}});var I=t(1602);Object.defineProperty(e,"markdownSummary",{enumerable:true,get:function(){return I.markdownSummary}});var h=t(278);Object.defineProperty(e,"toPosixPath",{enumerable:true,get:function(){return h.toPosixPath}});Object.defineProperty(e,"toWin32Path",{enumerable:true,get:function(){return h.toWin32Path}});Object.defineProperty(e,"toPlatformPath",{enumerable:true,get:function(){return h.toPlatformPath}});e.platform=o(t(8254))},1171:function(A,e,t){"use strict";var r=this&&this.__createBinding||(Object.create?function(A,e,t,r){if(r===undefined)r=t;var s=Object.getOwnPropertyDescriptor(e,t);if(!s||("get"in s?!e.__esModule:s.writable||s.configurable)){s={enumerable:true,get:function(){return e[t]}}}Object.defineProperty(A,r,s)}:function(A,e,t,r){if(r===undefined)r=t;A[r]=e[t]});var s=this&&this.__setModuleDefault||(Object.create?function(A,e){Object.defineProperty(A,"default",{enumerable:true,value:e})}:function(A,e){A["default"]=e});var o=this&&this.__importStar||function(A){if(A&&A.__esModule)return A;var e={};if(A!=null)for(var t in A)if(t!=="default"&&Object.prototype.hasOwnProperty.call(A,t))r(e,A,t);s(e,A);return e};Object.defineProperty(e,"__esModule",{value:true});e.prepareKeyValueMessage=e.issueFileCommand=void 0;const n=o(t(6982));const i=o(t(9896));const a=o(t(857));const E=t(5384);function issueFileCommand(A,e){const t=process.env[`GITHUB_${A}`];if(!t){throw new Error(`Unable to find environment variable for file command ${A}`)}if(!i.existsSync(t)){throw new Error(`Missing file at path: ${t}`)}i.appendFileSync(t,`${(0,E.toCommandValue)(e)}${a.EOL}`,{encoding:"utf8"})}e.issueFileCommand=issueFileCommand;function prepareKeyValueMessage(A,e){const t=`ghadelimiter_${n.randomUUID()}`;const r=(0,E.toCommandValue)(e);if(A.includes(t)){throw new Error(`Unexpected input: name should not contain the delimiter "${t}"`)}if(r.includes(t)){throw new Error(`Unexpected input: value should not contain the delimiter "${t}"`)}return`${A}<<${t}${a.EOL}${r}${a.EOL}${t}`}e.prepareKeyValueMessage=prepareKeyValueMessage},7400:function(A,e,t){"use strict";var r=this&&this.__awaiter||function(A,e,t,r){function adopt(A){return A instanceof t?A:new t((function(e){e(A)}))}return new(t||(t=Promise))((function(t,s){function fulfilled(A){try{step(r.next(A))}catch(A){s(A)}}function rejected(A){try{step(r["throw"](A))}catch(A){s(A)}}function step(A){A.done?t(A.value):adopt(A.value).then(fulfilled,rejected)}step((r=r.apply(A,e||[])).next())}))};Object.defineProperty(e,"__esModule",{value:true});e.OidcClient=void 0;const s=t(3462);const o=t(3186);const n=t(8770);class OidcClient{static createHttpClient(A=true,e=10){const t={allowRetries:A,maxRetries:e};return new s.HttpClient("actions/oidc-client",[new o.BearerCredentialHandler(OidcClient.getRequestToken())],t)}static getRequestToken(){const A=process.env["ACTIONS_ID_TOKEN_REQUEST_TOKEN"];if(!A){throw new Error("Unable to get ACTIONS_ID_TOKEN_REQUEST_TOKEN env variable")}return A}static getIDTokenUrl(){const A=process.env["ACTIONS_ID_TOKEN_REQUEST_URL"];if(!A){throw new Error("Unable to get ACTIONS_ID_TOKEN_REQUEST_URL env variable")}return A}static getCall(A){var e;return r(this,void 0,void 0,(function*(){const t=OidcClient.createHttpClient();const r=yield t.getJson(A).catch((A=>{throw new Error(`Failed to get ID Token. \n \n        Error Code : ${A.statusCode}\n \n        Error Message: ${A.message}`)}));const s=(e=r.result)===null||e===void 0?void 0:e.value;if(!s){throw new Error("Response json body do not have ID Token field")}return s}))}static getIDToken(A){return r(this,void 0,void 0,(function*(){try{let e=OidcClient.getIDTokenUrl();if(A){const t=encodeURIComponent(A);e=`${e}&audience=${t}`}(0,n.debug)(`ID token url is ${e}`);const t=yield OidcClient.getCall(e);(0,n.setSecret)(t);return t}catch(A){throw new Error(`Error message: ${A.message}`)}}))}}e.OidcClient=OidcClient},278:function(A,e,t){"use strict";var r=this&&this.__createBinding||(Object.create?function(A,e,t,r){if(r===undefined)r=t;var s=Object.getOwnPropertyDescriptor(e,t);if(!s||("get"in s?!e.__esModule:s.writable||s.configurable)){s={enumerable:true,get:function(){return e[t]}}}Object.defineProperty(A,r,s)}:function(A,e,t,r){if(r===undefined)r=t;A[r]=e[t]});var s=this&&this.__setModuleDefault||(Object.create?function(A,e){Object.defineProperty(A,"default",{enumerable:true,value:e})}:function(A,e){A["default"]=e});var o=this&&this.__importStar||function(A){if(A&&A.__esModule)return A;var e={};if(A!=null)for(var t in A)if(t!=="default"&&Object.prototype.hasOwnProperty.call(A,t))r(e,A,t);s(e,A);return e};Object.defineProperty(e,"__esModule",{value:true});e.toPlatformPath=e.toWin32Path=e.toPosixPath=void 0;const n=o(t(6928));function toPosixPath(A){return A.replace(/[\\]/g,"/")}e.toPosixPath=toPosixPath;function toWin32Path(A){return A.replace(/[/]/g,"\\")}e.toWin32Path=toWin32Path;function toPlatformPath(A){return A.replace(/[/\\]/g,n.sep)}e.toPlatformPath=toPlatformPath},8254:function(A,e,t){"use strict";var r=this&&this.__createBinding||(Object.create?function(A,e,t,r){if(r===undefined)r=t;var s=Object.getOwnPropertyDescriptor(e,t);if(!s||("get"in s?!e.__esModule:s.writable||s.configurable)){s={enumerable:true,get:function(){return e[t]}}}Object.defineProperty(A,r,s)}:function(A,e,t,r){if(r===undefined)r=t;A[r]=e[t]});var s=this&&this.__setModuleDefault||(Object.create?function(A,e){Object.defineProperty(A,"default",{enumerable:true,value:e})}:function(A,e){A["default"]=e});var o=this&&this.__importStar||function(A){if(A&&A.__esModule)return A;var e={};if(A!=null)for(var t in A)if(t!=="default"&&Object.prototype.hasOwnProperty.call(A,t))r(e,A,t);s(e,A);return e};var n=this&&this.__awaiter||function(A,e,t,r){function adopt(A){return A instanceof t?A:new t((function(e){e(A)}))}return new(t||(t=Promise))((function(t,s){function fulfilled(A){try{step(r.next(A))}catch(A){s(A)}}function rejected(A){try{step(r["throw"](A))}catch(A){s(A)}}function step(A){A.done?t(A.value):adopt(A.value).then(fulfilled,rejected)}step((r=r.apply(A,e||[])).next())}))};var i=this&&this.__importDefault||function(A){return A&&A.__esModule?A:{default:A}};Object.defineProperty(e,"__esModule",{value:true});e.getDetails=e.isLinux=e.isMacOS=e.isWindows=e.arch=e.platform=void 0;const a=i(t(857));const E=o(t(3474));const getWindowsInfo=()=>n(void 0,void 0,void 0,(function*(){const{stdout:A}=yield E.getExecOutput('powershell -command "(Get-CimInstance -ClassName Win32_OperatingSystem).Version"',undefined,{silent:true});const{stdout:e}=yield E.getExecOutput('powershell -command "(Get-CimInstance -ClassName Win32_OperatingSystem).Caption"',undefined,{silent:true});return{name:e.trim(),version:A.trim()}}));const getMacOsInfo=()=>n(void 0,void 0,void 0,(function*(){var A,e,t,r;const{stdout:s}=yield E.getExecOutput("sw_vers",undefined,{silent:true});const o=(e=(A=s.match(/ProductVersion:\s*(.+)/))===null||A===void 0?void 0:A[1])!==null&&e!==void 0?e:"";const n=(r=(t=s.match(/ProductName:\s*(.+)/))===null||t===void 0?void 0:t[1])!==null&&r!==void 0?r:"";return{name:n,version:o}}));const getLinuxInfo=()=>n(void 0,void 0,void 0,(function*(){const{stdout:A}=yield E.getExecOutput("lsb_release",["-i","-r","-s"],{silent:true});const[e,t]=A.trim().split("\n");return{name:e,version:t}}));e.platform=a.default.platform();e.arch=a.default.arch();e.isWindows=e.platform==="win32";e.isMacOS=e.platform==="darwin";e.isLinux=e.platform==="linux";function getDetails(){return n(this,void 0,void 0,(function*(){return Object.assign(Object.assign({},yield e.isWindows?getWindowsInfo():e.isMacOS?getMacOsInfo():getLinuxInfo()),{platform:e.platform,arch:e.arch,isWindows:e.isWindows,isMacOS:e.isMacOS,isLinux:e.isLinux})}))}e.getDetails=getDetails},1602:function(A,e,t){"use strict";var r=this&&this.__awaiter||function(A,e,t,r){function adopt(A){return A instanceof t?A:new t((function(e){e(A)}))}return new(t||(t=Promise))((function(t,s){function fulfilled(A){try{step(r.next(A))}catch(A){s(A)}}function rejected(A){try{step(r["throw"](A))}catch(A){s(A)}}function step(A){A.done?t(A.value):adopt(A.value).then(fulfilled,rejected)}step((r=r.apply(A,e||[])).next())}))};Object.defineProperty(e,"__esModule",{value:true});e.summary=e.markdownSummary=e.SUMMARY_DOCS_URL=e.SUMMARY_ENV_VAR=void 0;const s=t(857);const o=t(9896);const{access:n,appendFile:i,writeFile:a}=o.promises;e.SUMMARY_ENV_VAR="GITHUB_STEP_SUMMARY";e.SUMMARY_DOCS_URL="https://docs.github.com/actions/using-workflows/workflow-commands-for-github-actions#adding-a-job-summary";class Summary{constructor(){this._buffer=""}filePath(){return r(this,void 0,void 0,(function*(){if(this._filePath){return this._filePath}const A=process.env[e.SUMMARY_ENV_VAR];if(!A){throw new Error(`Unable to find environment variable for $${e.SUMMARY_ENV_VAR}. Check if your runtime environment supports job summaries.`)}try{yield n(A,o.constants.R_OK|o.constants.W_OK)}catch(e){throw new Error(`Unable to access summary file: '${A}'. Check if the file has correct read/write permissions.`)}this._filePath=A;return this._filePath}))}wrap(A,e,t={}){const r=Object.entries(t).map((([A,e])=>` ${A}="${e}"`)).join("");if(!e){return`<${A}${r}>`}return`<${A}${r}>${e}</${A}>`}write(A){return r(this,void 0,void 0,(function*(){const e=!!(A===null||A===void 0?void 0:A.overwrite);const t=yield this.filePath();const r=e?a:i;yield r(t,this._buffer,{encoding:"utf8"});return this.emptyBuffer()}))}clear(){return r(this,void 0,void 0,(function*(){return this.emptyBuffer().write({overwrite:true})}))}stringify(){return this._buffer}isEmptyBuffer(){return this._buffer.length===0}emptyBuffer(){this._buffer="";return this}addRaw(A,e=false){this._buffer+=A;return e?this.addEOL():this}addEOL(){return this.addRaw(s.EOL)}addCodeBlock(A,e){const t=Object.assign({},e&&{lang:e});const r=this.wrap("pre",this.wrap("code",A),t);return this.addRaw(r).addEOL()}addList(A,e=false){const t=e?"ol":"ul";const r=A.map((A=>this.wrap("li",A))).join("");const s=this.wrap(t,r);return this.addRaw(s).addEOL()}addTable(A){const e=A.map((A=>{const e=A.map((A=>{if(typeof A==="string"){return this.wrap("td",A)}const{header:e,data:t,colspan:r,rowspan:s}=A;const o=e?"th":"td";const n=Object.assign(Object.assign({},r&&{colspan:r}),s&&{rowspan:s});return this.wrap(o,t,n)})).join("");return this.wrap("tr",e)})).join("");const t=this.wrap("table",e);return this.addRaw(t).addEOL()}addDetails(A,e){const t=this.wrap("details",this.wrap("summary",A)+e);return this.addRaw(t).addEOL()}addImage(A,e,t){const{width:r,height:s}=t||{};const o=Object.assign(Object.assign({},r&&{width:r}),s&&{height:s});const n=this.wrap("img",null,Object.assign({src:A,alt:e},o));return this.addRaw(n).addEOL()}addHeading(A,e){const t=`h${e}`;const r=["h1","h2","h3","h4","h5","h6"].includes(t)?t:"h1";const s=this.wrap(r,A);return this.addRaw(s).addEOL()}addSeparator(){const A=this.wrap("hr",null);return this.addRaw(A).addEOL()}addBreak(){const A=this.wrap("br",null);return this.addRaw(A).addEOL()}addQuote(A,e){const t=Object.assign({},e&&{cite:e});const r=this.wrap("blockquote",A,t);return this.addRaw(r).addEOL()}addLink(A,e){const t=this.wrap("a",A,{href:e});return this.addRaw(t).addEOL()}}const E=new Summary;e.markdownSummary=E;e.summary=E},5384:(A,e)=>{"use strict";Object.defineProperty(e,"__esModule",{value:true});e.toCommandProperties=e.toCommandValue=void 0;function toCommandValue(A){if(A===null||A===undefined){return""}else if(typeof A==="string"||A instanceof String){return A}return JSON.stringify(A)}e.toCommandValue=toCommandValue;function toCommandProperties(A){if(!Object.keys(A).length){return{}}return{title:A.title,file:A.file,line:A.startLine,endLine:A.endLine,col:A.startColumn,endColumn:A.endColumn}}e.toCommandProperties=toCommandProperties},3474:function(A,e,t){"use strict";var r=this&&this.__createBinding||(Object.create?function(A,e,t,r){if(r===undefined)r=t;Object.defineProperty(A,r,{enumerable:true,get:function(){return e[t]}})}:function(A,e,t,r){if(r===undefined)r=t;A[r]=e[t]});var s=this&&this.__setModuleDefault||(Object.create?function(A,e){Object.defineProperty(A,"default",{enumerable:true,value:e})}:function(A,e){A["default"]=e});var o=this&&this.__importStar||function(A){if(A&&A.__esModule)return A;var e={};if(A!=null)for(var t in A)if(t!=="default"&&Object.hasOwnProperty.call(A,t))r(e,A,t);s(e,A);return e};var n=this&&this.__awaiter||function(A,e,t,r){function adopt(A){return A instanceof t?A:new t((function(e){e(A)}))}return new(t||(t=Promise))((function(t,s){function fulfilled(A){try{step(r.next(A))}catch(A){s(A)}}function rejected(A){try{step(r["throw"](A))}catch(A){s(A)}}function step(A){A.done?t(A.value):adopt(A.value).then(fulfilled,rejected)}step((r=r.apply(A,e||[])).next())}))};Object.defineProperty(e,"__esModule",{value:true});e.getExecOutput=e.exec=void 0;const i=t(3193);const a=o(t(2251));function exec(A,e,t){return n(this,void 0,void 0,(function*(){const r=a.argStringToArray(A);if(r.length===0){throw new Error(`Parameter 'commandLine' cannot be null or empty.`)}const s=r[0];e=r.slice(1).concat(e||[]);const o=new a.ToolRunner(s,e,t);return o.exec()}))}e.exec=exec;function getExecOutput(A,e,t){var r,s;return n(this,void 0,void 0,(function*(){let o="";let n="";const a=new i.StringDecoder("utf8");const E=new i.StringDecoder("utf8");const g=(r=t===null||t===void 0?void 0:t.listeners)===null||r===void 0?void 0:r.stdout;const c=(s=t===null||t===void 0?void 0:t.listeners)===null||s===void 0?void 0:s.stderr;const stdErrListener=A=>{n+=E.write(A);if(c){c(A)}};const stdOutListener=A=>{o+=a.write(A);if(g){g(A)}};const Q=Object.assign(Object.assign({},t===null||t===void 0?void 0:t.listeners),{stdout:stdOutListener,stderr:stdErrListener});const C=yield exec(A,e,Object.assign(Object.assign({},t),{listeners:Q}));o+=a.end();n+=E.end();return{exitCode:C,stdout:o,stderr:n}}))}e.getExecOutput=getExecOutput},2251:function(A,e,t){"use strict";var r=this&&this.__createBinding||(Object.create?function(A,e,t,r){if(r===undefined)r=t;Object.defineProperty(A,r,{enumerable:true,get:function(){return e[t]}})}:function(A,e,t,r){if(r===undefined)r=t;A[r]=e[t]});var s=this&&this.__setModuleDefault||(Object.create?function(A,e){Object.defineProperty(A,"default",{enumerable:true,value:e})}:function(A,e){A["default"]=e});var o=this&&this.__importStar||function(A){if(A&&A.__esModule)return A;var e={};if(A!=null)for(var t in A)if(t!=="default"&&Object.hasOwnProperty.call(A,t))r(e,A,t);s(e,A);return e};var n=this&&this.__awaiter||function(A,e,t,r){function adopt(A){return A instanceof t?A:new t((function(e){e(A)}))}return new(t||(t=Promise))((function(t,s){function fulfilled(A){try{step(r.next(A))}catch(A){s(A)}}function rejected(A){try{step(r["throw"](A))}catch(A){s(A)}}function step(A){A.done?t(A.value):adopt(A.value).then(fulfilled,rejected)}step((r=r.apply(A,e||[])).next())}))};Object.defineProperty(e,"__esModule",{value:true});e.argStringToArray=e.ToolRunner=void 0;const i=o(t(857));const a=o(t(4434));const E=o(t(5317));const g=o(t(6928));const c=o(t(96));const Q=o(t(8409));const C=t(3557);const B=process.platform==="win32";class ToolRunner extends a.EventEmitter{constructor(A,e,t){super();if(!A){throw new Error("Parameter 'toolPath' cannot be null or empty.")}this.toolPath=A;this.args=e||[];this.options=t||{}}_debug(A){if(this.options.listeners&&this.options.listeners.debug){this.options.listeners.debug(A)}}_getCommandString(A,e){const t=this._getSpawnFileName();const r=this._getSpawnArgs(A);let s=e?"":"[command]";if(B){if(this._isCmdFile()){s+=t;for(const A of r){s+=` ${A}`}}else if(A.windowsVerbatimArguments){s+=`"${t}"`;for(const A of r){s+=` ${A}`}}else{s+=this._windowsQuoteCmdArg(t);for(const A of r){s+=` ${this._windowsQuoteCmdArg(A)}`}}}else{s+=t;for(const A of r){s+=` ${A}`}}return s}_processLineBuffer(A,e,t){try{let r=e+A.toString();let s=r.indexOf(i.EOL);while(s>-1){const A=r.substring(0,s);t(A);r=r.substring(s+i.EOL.length);s=r.indexOf(i.EOL)}return r}catch(A){this._debug(`error processing line. Failed with error ${A}`);return""}}_getSpawnFileName(){if(B){if(this._isCmdFile()){return process.env["COMSPEC"]||"cmd.exe"}}return this.toolPath}_getSpawnArgs(A){if(B){if(this._isCmdFile()){let e=`/D /S /C "${this._windowsQuoteCmdArg(this.toolPath)}`;for(const t of this.args){e+=" ";e+=A.windowsVerbatimArguments?t:this._windowsQuoteCmdArg(t)}e+='"';return[e]}}return this.args}_endsWith(A,e){return A.endsWith(e)}_isCmdFile(){const A=this.toolPath.toUpperCase();return this._endsWith(A,".CMD")||this._endsWith(A,".BAT")}_windowsQuoteCmdArg(A){if(!this._isCmdFile()){return this._uvQuoteCmdArg(A)}if(!A){return'""'}const e=[" ","\t","&","(",")","[","]","{","}","^","=",";","!","'","+",",","`","~","|","<",">",'"'];let t=false;for(const r of A){if(e.some((A=>A===r))){t=true;break}}if(!t){return A}let r='"';let s=true;for(let e=A.length;e>0;e--){r+=A[e-1];if(s&&A[e-1]==="\\"){r+="\\"}else if(A[e-1]==='"'){s=true;r+='"'}else{s=false}}r+='"';return r.split("").reverse().join("")}_uvQuoteCmdArg(A){if(!A){return'""'}if(!A.includes(" ")&&!A.includes("\t")&&!A.includes('"')){return A}if(!A.includes('"')&&!A.includes("\\")){return`"${A}"`}let e='"';let t=true;for(let r=A.length;r>0;r--){e+=A[r-1];if(t&&A[r-1]==="\\"){e+="\\"}else if(A[r-1]==='"'){t=true;e+="\\"}else{t=false}}e+='"';return e.split("").reverse().join("")}_cloneExecOptions(A){A=A||{};const e={cwd:A.cwd||process.cwd(),env:A.env||process.env,silent:A.silent||false,windowsVerbatimArguments:A.windowsVerbatimArguments||false,failOnStdErr:A.failOnStdErr||false,ignoreReturnCode:A.ignoreReturnCode||false,delay:A.delay||1e4};e.outStream=A.outStream||process.stdout;e.errStream=A.errStream||process.stderr;return e}_getSpawnOptions(A,e){A=A||{};const t={};t.cwd=A.cwd;t.env=A.env;t["windowsVerbatimArguments"]=A.windowsVerbatimArguments||this._isCmdFile();if(A.windowsVerbatimArguments){t.argv0=`"${e}"`}return t}exec(){return n(this,void 0,void 0,(function*(){if(!Q.isRooted(this.toolPath)&&(this.toolPath.includes("/")||B&&this.toolPath.includes("\\"))){this.toolPath=g.resolve(process.cwd(),this.options.cwd||process.cwd(),this.toolPath)}this.toolPath=yield c.which(this.toolPath,true);return new Promise(((A,e)=>n(this,void 0,void 0,(function*(){this._debug(`exec tool: ${this.toolPath}`);this._debug("arguments:");for(const A of this.args){this._debug(`   ${A}`)}const t=this._cloneExecOptions(this.options);if(!t.silent&&t.outStream){t.outStream.write(this._getCommandString(t)+i.EOL)}const r=new ExecState(t,this.toolPath);r.on("debug",(A=>{this._debug(A)}));if(this.options.cwd&&!(yield Q.exists(this.options.cwd))){return e(new Error(`The cwd: ${this.options.cwd} does not exist!`))}const s=this._getSpawnFileName();const o=E.spawn(s,this._getSpawnArgs(t),this._getSpawnOptions(this.options,s));let n="";if(o.stdout){o.stdout.on("data",(A=>{if(this.options.listeners&&this.options.listeners.stdout){this.options.listeners.stdout(A)}if(!t.silent&&t.outStream){t.outStream.write(A)}n=this._processLineBuffer(A,n,(A=>{if(this.options.listeners&&this.options.listeners.stdline){this.options.listeners.stdline(A)}}))}))}let a="";if(o.stderr){o.stderr.on("data",(A=>{r.processStderr=true;if(this.options.listeners&&this.options.listeners.stderr){this.options.listeners.stderr(A)}if(!t.silent&&t.errStream&&t.outStream){const e=t.failOnStdErr?t.errStream:t.outStream;e.write(A)}a=this._processLineBuffer(A,a,(A=>{if(this.options.listeners&&this.options.listeners.errline){this.options.listeners.errline(A)}}))}))}o.on("error",(A=>{r.processError=A.message;r.processExited=true;r.processClosed=true;r.CheckComplete()}));o.on("exit",(A=>{r.processExitCode=A;r.processExited=true;this._debug(`Exit code ${A} received from tool '${this.toolPath}'`);r.CheckComplete()}));o.on("close",(A=>{r.processExitCode=A;r.processExited=true;r.processClosed=true;this._debug(`STDIO streams have closed for tool '${this.toolPath}'`);r.CheckComplete()}));r.on("done",((t,r)=>{if(n.length>0){this.emit("stdline",n)}if(a.length>0){this.emit("errline",a)}o.removeAllListeners();if(t){e(t)}else{A(r)}}));if(this.options.input){if(!o.stdin){throw new Error("child process missing stdin")}o.stdin.end(this.options.input)}}))))}))}}e.ToolRunner=ToolRunner;function argStringToArray(A){const e=[];let t=false;let r=false;let s="";function append(A){if(r&&A!=='"'){s+="\\"}s+=A;r=false}for(let o=0;o<A.length;o++){const n=A.charAt(o);if(n==='"'){if(!r){t=!t}else{append(n)}continue}if(n==="\\"&&r){append(n);continue}if(n==="\\"&&t){r=true;continue}if(n===" "&&!t){if(s.length>0){e.push(s);s=""}continue}append(n)}if(s.length>0){e.push(s.trim())}return e}e.argStringToArray=argStringToArray;class ExecState extends a.EventEmitter{constructor(A,e){super();this.processClosed=false;this.processError="";this.processExitCode=0;this.processExited=false;this.processStderr=false;this.delay=1e4;this.done=false;this.timeout=null;if(!e){throw new Error("toolPath must not be empty")}this.options=A;this.toolPath=e;if(A.delay){this.delay=A.delay}}CheckComplete(){if(this.done){return}if(this.processClosed){this._setResult()}else if(this.processExited){this.timeout=C.setTimeout(ExecState.HandleTimeout,this.delay,this)}}_debug(A){this.emit("debug",A)}_setResult(){let A;if(this.processExited){if(this.processError){A=new Error(`There was an error when attempting to execute the process '${this.toolPath}'. This may indicate the process failed to start. Error: ${this.processError}`)}else if(this.processExitCode!==0&&!this.options.ignoreReturnCode){A=new Error(`The process '${this.toolPath}' failed with exit code ${this.processExitCode}`)}else if(this.processStderr&&this.options.failOnStdErr){A=new Error(`The process '${this.toolPath}' failed because one or more lines were written to the STDERR stream`)}}if(this.timeout){clearTimeout(this.timeout);this.timeout=null}this.done=true;this.emit("done",A,this.processExitCode)}static HandleTimeout(A){if(A.done){return}if(!A.processClosed&&A.processExited){const e=`The STDIO streams did not close within ${A.delay/1e3} seconds of the exit event from process '${A.toolPath}'. This may indicate a child process inherited the STDIO streams and has not yet exited.`;A._debug(e)}A._setResult()}}},3186:function(A,e){"use strict";var t=this&&this.__awaiter||function(A,e,t,r){function adopt(A){return A instanceof t?A:new t((function(e){e(A)}))}return new(t||(t=Promise))((function(t,s){function fulfilled(A){try{step(r.next(A))}catch(A){s(A)}}function rejected(A){try{step(r["throw"](A))}catch(A){s(A)}}function step(A){A.done?t(A.value):adopt(A.value).then(fulfilled,rejected)}step((r=r.apply(A,e||[])).next())}))};Object.defineProperty(e,"__esModule",{value:true});e.PersonalAccessTokenCredentialHandler=e.BearerCredentialHandler=e.BasicCredentialHandler=void 0;class BasicCredentialHandler{constructor(A,e){this.username=A;this.password=e}prepareRequest(A){if(!A.headers){throw Error("The request has no headers")}A.headers["Authorization"]=`Basic ${Buffer.from(`${this.username}:${this.password}`).toString("base64")}`}canHandleAuthentication(){return false}handleAuthentication(){return t(this,void 0,void 0,(function*(){throw new Error("not implemented")}))}}e.BasicCredentialHandler=BasicCredentialHandler;class BearerCredentialHandler{constructor(A){this.token=A}prepareRequest(A){if(!A.headers){throw Error("The request has no headers")}A.headers["Authorization"]=`Bearer ${this.token}`}canHandleAuthentication(){return false}handleAuthentication(){return t(this,void 0,void 0,(function*(){throw new Error("not implemented")}))}}e.BearerCredentialHandler=BearerCredentialHandler;class PersonalAccessTokenCredentialHandler{constructor(A){this.token=A}prepareRequest(A){if(!A.headers){throw Error("The request has no headers")}A.headers["Authorization"]=`Basic ${Buffer.from(`PAT:${this.token}`).toString("base64")}`}canHandleAuthentication(){return false}handleAuthentication(){return t(this,void 0,void 0,(function*(){throw new Error("not implemented")}))}}e.PersonalAccessTokenCredentialHandler=PersonalAccessTokenCredentialHandler},3462:function(A,e,t){"use strict";var r=this&&this.__createBinding||(Object.create?function(A,e,t,r){if(r===undefined)r=t;var s=Object.getOwnPropertyDescriptor(e,t);if(!s||("get"in s?!e.__esModule:s.writable||s.configurable)){s={enumerable:true,get:function(){return e[t]}}}Object.defineProperty(A,r,s)}:function(A,e,t,r){if(r===undefined)r=t;A[r]=e[t]});var s=this&&this.__setModuleDefault||(Object.create?function(A,e){Object.defineProperty(A,"default",{enumerable:true,value:e})}:function(A,e){A["default"]=e});var o=this&&this.__importStar||function(A){if(A&&A.__esModule)return A;var e={};if(A!=null)for(var t in A)if(t!=="default"&&Object.prototype.hasOwnProperty.call(A,t))r(e,A,t);s(e,A);return e};var n=this&&this.__awaiter||function(A,e,t,r){function adopt(A){return A instanceof t?A:new t((function(e){e(A)}))}return new(t||(t=Promise))((function(t,s){function fulfilled(A){try{step(r.next(A))}catch(A){s(A)}}function rejected(A){try{step(r["throw"](A))}catch(A){s(A)}}function step(A){A.done?t(A.value):adopt(A.value).then(fulfilled,rejected)}step((r=r.apply(A,e||[])).next())}))};Object.defineProperty(e,"__esModule",{value:true});e.HttpClient=e.isHttps=e.HttpClientResponse=e.HttpClientError=e.getProxyUrl=e.MediaTypes=e.Headers=e.HttpCodes=void 0;const i=o(t(8611));const a=o(t(5692));const E=o(t(4418));const g=o(t(3664));const c=t(5494);var Q;(function(A){A[A["OK"]=200]="OK";A[A["MultipleChoices"]=300]="MultipleChoices";A[A["MovedPermanently"]=301]="MovedPermanently";A[A["ResourceMoved"]=302]="ResourceMoved";A[A["SeeOther"]=303]="SeeOther";A[A["NotModified"]=304]="NotModified";A[A["UseProxy"]=305]="UseProxy";A[A["SwitchProxy"]=306]="SwitchProxy";A[A["TemporaryRedirect"]=307]="TemporaryRedirect";A[A["PermanentRedirect"]=308]="PermanentRedirect";A[A["BadRequest"]=400]="BadRequest";A[A["Unauthorized"]=401]="Unauthorized";A[A["PaymentRequired"]=402]="PaymentRequired";A[A["Forbidden"]=403]="Forbidden";A[A["NotFound"]=404]="NotFound";A[A["MethodNotAllowed"]=405]="MethodNotAllowed";A[A["NotAcceptable"]=406]="NotAcceptable";A[A["ProxyAuthenticationRequired"]=407]="ProxyAuthenticationRequired";A[A["RequestTimeout"]=408]="RequestTimeout";A[A["Conflict"]=409]="Conflict";A[A["Gone"]=410]="Gone";A[A["TooManyRequests"]=429]="TooManyRequests";A[A["InternalServerError"]=500]="InternalServerError";A[A["NotImplemented"]=501]="NotImplemented";A[A["BadGateway"]=502]="BadGateway";A[A["ServiceUnavailable"]=503]="ServiceUnavailable";A[A["GatewayTimeout"]=504]="GatewayTimeout"})(Q||(e.HttpCodes=Q={}));var C;(function(A){A["Accept"]="accept";A["ContentType"]="content-type"})(C||(e.Headers=C={}));var B;(function(A){A["ApplicationJson"]="application/json"})(B||(e.MediaTypes=B={}));function getProxyUrl(A){const e=E.getProxyUrl(new URL(A));return e?e.href:""}e.getProxyUrl=getProxyUrl;const I=[Q.MovedPermanently,Q.ResourceMoved,Q.SeeOther,Q.TemporaryRedirect,Q.PermanentRedirect];const h=[Q.BadGateway,Q.ServiceUnavailable,Q.GatewayTimeout];const l=["OPTIONS","GET","DELETE","HEAD"];const u=10;const d=5;class HttpClientError extends Error{constructor(A,e){super(A);this.name="HttpClientError";this.statusCode=e;Object.setPrototypeOf(this,HttpClientError.prototype)}}e.HttpClientError=HttpClientError;class HttpClientResponse{constructor(A){this.message=A}readBody(){return n(this,void 0,void 0,(function*(){return new Promise((A=>n(this,void 0,void 0,(function*(){let e=Buffer.alloc(0);this.message.on("data",(A=>{e=Buffer.concat([e,A])}));this.message.on("end",(()=>{A(e.toString())}))}))))}))}readBodyBuffer(){return n(this,void 0,void 0,(function*(){return new Promise((A=>n(this,void 0,void 0,(function*(){const e=[];this.message.on("data",(A=>{e.push(A)}));this.message.on("end",(()=>{A(Buffer.concat(e))}))}))))}))}}e.HttpClientResponse=HttpClientResponse;function isHttps(A){const e=new URL(A);return e.protocol==="https:"}e.isHttps=isHttps;class HttpClient{constructor(A,e,t){this._ignoreSslError=false;this._allowRedirects=true;this._allowRedirectDowngrade=false;this._maxRedirects=50;this._allowRetries=false;this._maxRetries=1;this._keepAlive=false;this._disposed=false;this.userAgent=A;this.handlers=e||[];this.requestOptions=t;if(t){if(t.ignoreSslError!=null){this._ignoreSslError=t.ignoreSslError}this._socketTimeout=t.socketTimeout;if(t.allowRedirects!=null){this._allowRedirects=t.allowRedirects}if(t.allowRedirectDowngrade!=null){this._allowRedirectDowngrade=t.allowRedirectDowngrade}if(t.maxRedirects!=null){this._maxRedirects=Math.max(t.maxRedirects,0)}if(t.keepAlive!=null){this._keepAlive=t.keepAlive}if(t.allowRetries!=null){this._allowRetries=t.allowRetries}if(t.maxRetries!=null){this._maxRetries=t.maxRetries}}}options(A,e){return n(this,void 0,void 0,(function*(){return this.request("OPTIONS",A,null,e||{})}))}get(A,e){return n(this,void 0,void 0,(function*(){return this.request("GET",A,null,e||{})}))}del(A,e){return n(this,void 0,void 0,(function*(){return this.request("DELETE",A,null,e||{})}))}post(A,e,t){return n(this,void 0,void 0,(function*(){return this.request("POST",A,e,t||{})}))}patch(A,e,t){return n(this,void 0,void 0,(function*(){return this.request("PATCH",A,e,t||{})}))}put(A,e,t){return n(this,void 0,void 0,(function*(){return this.request("PUT",A,e,t||{})}))}head(A,e){return n(this,void 0,void 0,(function*(){return this.request("HEAD",A,null,e||{})}))}sendStream(A,e,t,r){return n(this,void 0,void 0,(function*(){return this.request(A,e,t,r)}))}getJson(A,e={}){return n(this,void 0,void 0,(function*(){e[C.Accept]=this._getExistingOrDefaultHeader(e,C.Accept,B.ApplicationJson);const t=yield this.get(A,e);return this._processResponse(t,this.requestOptions)}))}postJson(A,e,t={}){return n(this,void 0,void 0,(function*(){const r=JSON.stringify(e,null,2);t[C.Accept]=this._getExistingOrDefaultHeader(t,C.Accept,B.ApplicationJson);t[C.ContentType]=this._getExistingOrDefaultHeader(t,C.ContentType,B.ApplicationJson);const s=yield this.post(A,r,t);return this._processResponse(s,this.requestOptions)}))}putJson(A,e,t={}){return n(this,void 0,void 0,(function*(){const r=JSON.stringify(e,null,2);t[C.Accept]=this._getExistingOrDefaultHeader(t,C.Accept,B.ApplicationJson);t[C.ContentType]=this._getExistingOrDefaultHeader(t,C.ContentType,B.ApplicationJson);const s=yield this.put(A,r,t);return this._processResponse(s,this.requestOptions)}))}patchJson(A,e,t={}){return n(this,void 0,void 0,(function*(){const r=JSON.stringify(e,null,2);t[C.Accept]=this._getExistingOrDefaultHeader(t,C.Accept,B.ApplicationJson);t[C.ContentType]=this._getExistingOrDefaultHeader(t,C.ContentType,B.ApplicationJson);const s=yield this.patch(A,r,t);return this._processResponse(s,this.requestOptions)}))}request(A,e,t,r){return n(this,void 0,void 0,(function*(){if(this._disposed){throw new Error("Client has already been disposed.")}const s=new URL(e);let o=this._prepareRequest(A,s,r);const n=this._allowRetries&&l.includes(A)?this._maxRetries+1:1;let i=0;let a;do{a=yield this.requestRaw(o,t);if(a&&a.message&&a.message.statusCode===Q.Unauthorized){let A;for(const e of this.handlers){if(e.canHandleAuthentication(a)){A=e;break}}if(A){return A.handleAuthentication(this,o,t)}else{return a}}let e=this._maxRedirects;while(a.message.statusCode&&I.includes(a.message.statusCode)&&this._allowRedirects&&e>0){const n=a.message.headers["location"];if(!n){break}const i=new URL(n);if(s.protocol==="https:"&&s.protocol!==i.protocol&&!this._allowRedirectDowngrade){throw new Error("Redirect from HTTPS to HTTP protocol. This downgrade is not allowed for security reasons. If you want to allow this behavior, set the allowRedirectDowngrade option to true.")}yield a.readBody();if(i.hostname!==s.hostname){for(const A in r){if(A.toLowerCase()==="authorization"){delete r[A]}}}o=this._prepareRequest(A,i,r);a=yield this.requestRaw(o,t);e--}if(!a.message.statusCode||!h.includes(a.message.statusCode)){return a}i+=1;if(i<n){yield a.readBody();yield this._performExponentialBackoff(i)}}while(i<n);return a}))}dispose(){if(this._agent){this._agent.destroy()}this._disposed=true}requestRaw(A,e){return n(this,void 0,void 0,(function*(){return new Promise(((t,r)=>{function callbackForResult(A,e){if(A){r(A)}else if(!e){r(new Error("Unknown error"))}else{t(e)}}this.requestRawWithCallback(A,e,callbackForResult)}))}))}requestRawWithCallback(A,e,t){if(typeof e==="string"){if(!A.options.headers){A.options.headers={}}A.options.headers["Content-Length"]=Buffer.byteLength(e,"utf8")}let r=false;function handleResult(A,e){if(!r){r=true;t(A,e)}}const s=A.httpModule.request(A.options,(A=>{const e=new HttpClientResponse(A);handleResult(undefined,e)}));let o;s.on("socket",(A=>{o=A}));s.setTimeout(this._socketTimeout||3*6e4,(()=>{if(o){o.end()}handleResult(new Error(`Request timeout: ${A.options.path}`))}));s.on("error",(function(A){handleResult(A)}));if(e&&typeof e==="string"){s.write(e,"utf8")}if(e&&typeof e!=="string"){e.on("close",(function(){s.end()}));e.pipe(s)}else{s.end()}}getAgent(A){const e=new URL(A);return this._getAgent(e)}getAgentDispatcher(A){const e=new URL(A);const t=E.getProxyUrl(e);const r=t&&t.hostname;if(!r){return}return this._getProxyAgentDispatcher(e,t)}_prepareRequest(A,e,t){const r={};r.parsedUrl=e;const s=r.parsedUrl.protocol==="https:";r.httpModule=s?a:i;const o=s?443:80;r.options={};r.options.host=r.parsedUrl.hostname;r.options.port=r.parsedUrl.port?parseInt(r.parsedUrl.port):o;r.options.path=(r.parsedUrl.pathname||"")+(r.parsedUrl.search||"");r.options.method=A;r.options.headers=this._mergeHeaders(t);if(this.userAgent!=null){r.options.headers["user-agent"]=this.userAgent}r.options.agent=this._getAgent(r.parsedUrl);if(this.handlers){for(const A of this.handlers){A.prepareRequest(r.options)}}return r}_mergeHeaders(A){if(this.requestOptions&&this.requestOptions.headers){return Object.assign({},lowercaseKeys(this.requestOptions.headers),lowercaseKeys(A||{}))}return lowercaseKeys(A||{})}_getExistingOrDefaultHeader(A,e,t){let r;if(this.requestOptions&&this.requestOptions.headers){r=lowercaseKeys(this.requestOptions.headers)[e]}return A[e]||r||t}_getAgent(A){let e;const t=E.getProxyUrl(A);const r=t&&t.hostname;if(this._keepAlive&&r){e=this._proxyAgent}if(!r){e=this._agent}if(e){return e}const s=A.protocol==="https:";let o=100;if(this.requestOptions){o=this.requestOptions.maxSockets||i.globalAgent.maxSockets}if(t&&t.hostname){const A={maxSockets:o,keepAlive:this._keepAlive,proxy:Object.assign(Object.assign({},(t.username||t.password)&&{proxyAuth:`${t.username}:${t.password}`}),{host:t.hostname,port:t.port})};let r;const n=t.protocol==="https:";if(s){r=n?g.httpsOverHttps:g.httpsOverHttp}else{r=n?g.httpOverHttps:g.httpOverHttp}e=r(A);this._proxyAgent=e}if(!e){const A={keepAlive:this._keepAlive,maxSockets:o};e=s?new a.Agent(A):new i.Agent(A);this._agent=e}if(s&&this._ignoreSslError){e.options=Object.assign(e.options||{},{rejectUnauthorized:false})}return e}_getProxyAgentDispatcher(A,e){let t;if(this._keepAlive){t=this._proxyAgentDispatcher}if(t){return t}const r=A.protocol==="https:";t=new c.ProxyAgent(Object.assign({uri:e.href,pipelining:!this._keepAlive?0:1},(e.username||e.password)&&{token:`Basic ${Buffer.from(`${e.username}:${e.password}`).toString("base64")}`}));this._proxyAgentDispatcher=t;if(r&&this._ignoreSslError){t.options=Object.assign(t.options.requestTls||{},{rejectUnauthorized:false})}return t}_performExponentialBackoff(A){return n(this,void 0,void 0,(function*(){A=Math.min(u,A);const e=d*Math.pow(2,A);return new Promise((A=>setTimeout((()=>A()),e)))}))}_processResponse(A,e){return n(this,void 0,void 0,(function*(){return new Promise(((t,r)=>n(this,void 0,void 0,(function*(){const s=A.message.statusCode||0;const o={statusCode:s,result:null,headers:{}};if(s===Q.NotFound){t(o)}function dateTimeDeserializer(A,e){if(typeof e==="string"){const A=new Date(e);if(!isNaN(A.valueOf())){return A}}return e}let n;let i;try{i=yield A.readBody();if(i&&i.length>0){if(e&&e.deserializeDates){n=JSON.parse(i,dateTimeDeserializer)}else{n=JSON.parse(i)}o.result=n}o.headers=A.message.headers}catch(A){}if(s>299){let A;if(n&&n.message){A=n.message}else if(i&&i.length>0){A=i}else{A=`Failed request: (${s})`}const e=new HttpClientError(A,s);e.result=o.result;r(e)}else{t(o)}}))))}))}}e.HttpClient=HttpClient;const lowercaseKeys=A=>Object.keys(A).reduce(((e,t)=>(e[t.toLowerCase()]=A[t],e)),{})},4418:(A,e)=>{"use strict";Object.defineProperty(e,"__esModule",{value:true});e.checkBypass=e.getProxyUrl=void 0;function getProxyUrl(A){const e=A.protocol==="https:";if(checkBypass(A)){return undefined}const t=(()=>{if(e){return process.env["https_proxy"]||process.env["HTTPS_PROXY"]}else{return process.env["http_proxy"]||process.env["HTTP_PROXY"]}})();if(t){try{return new DecodedURL(t)}catch(A){if(!t.startsWith("http://")&&!t.startsWith("https://"))return new DecodedURL(`http://${t}`)}}else{return undefined}}e.getProxyUrl=getProxyUrl;function checkBypass(A){if(!A.hostname){return false}const e=A.hostname;if(isLoopbackAddress(e)){return true}const t=process.env["no_proxy"]||process.env["NO_PROXY"]||"";if(!t){return false}let r;if(A.port){r=Number(A.port)}else if(A.protocol==="http:"){r=80}else if(A.protocol==="https:"){r=443}const s=[A.hostname.toUpperCase()];if(typeof r==="number"){s.push(`${s[0]}:${r}`)}for(const A of t.split(",").map((A=>A.trim().toUpperCase())).filter((A=>A))){if(A==="*"||s.some((e=>e===A||e.endsWith(`.${A}`)||A.startsWith(".")&&e.endsWith(`${A}`)))){return true}}return false}e.checkBypass=checkBypass;function isLoopbackAddress(A){const e=A.toLowerCase();return e==="localhost"||e.startsWith("127.")||e.startsWith("[::1]")||e.startsWith("[0:0:0:0:0:0:0:1]")}class DecodedURL extends URL{constructor(A,e){super(A,e);this._decodedUsername=decodeURIComponent(super.username);this._decodedPassword=decodeURIComponent(super.password)}get username(){return this._decodedUsername}get password(){return this._decodedPassword}}},8409:function(A,e,t){"use strict";var r=this&&this.__createBinding||(Object.create?function(A,e,t,r){if(r===undefined)r=t;Object.defineProperty(A,r,{enumerable:true,get:function(){return e[t]}})}:function(A,e,t,r){if(r===undefined)r=t;A[r]=e[t]});var s=this&&this.__setModuleDefault||(Object.create?function(A,e){Object.defineProperty(A,"default",{enumerable:true,value:e})}:function(A,e){A["default"]=e});var o=this&&this.__importStar||function(A){if(A&&A.__esModule)return A;var e={};if(A!=null)for(var t in A)if(t!=="default"&&Object.hasOwnProperty.call(A,t))r(e,A,t);s(e,A);return e};var n=this&&this.__awaiter||function(A,e,t,r){function adopt(A){return A instanceof t?A:new t((function(e){e(A)}))}return new(t||(t=Promise))((function(t,s){function fulfilled(A){try{step(r.next(A))}catch(A){s(A)}}function rejected(A){try{step(r["throw"](A))}catch(A){s(A)}}function step(A){A.done?t(A.value):adopt(A.value).then(fulfilled,rejected)}step((r=r.apply(A,e||[])).next())}))};var i;Object.defineProperty(e,"__esModule",{value:true});e.getCmdPath=e.tryGetExecutablePath=e.isRooted=e.isDirectory=e.exists=e.READONLY=e.UV_FS_O_EXLOCK=e.IS_WINDOWS=e.unlink=e.symlink=e.stat=e.rmdir=e.rm=e.rename=e.readlink=e.readdir=e.open=e.mkdir=e.lstat=e.copyFile=e.chmod=void 0;const a=o(t(9896));const E=o(t(6928));i=a.promises,e.chmod=i.chmod,e.copyFile=i.copyFile,e.lstat=i.lstat,e.mkdir=i.mkdir,e.open=i.open,e.readdir=i.readdir,e.readlink=i.readlink,e.rename=i.rename,e.rm=i.rm,e.rmdir=i.rmdir,e.stat=i.stat,e.symlink=i.symlink,e.unlink=i.unlink;e.IS_WINDOWS=process.platform==="win32";e.UV_FS_O_EXLOCK=268435456;e.READONLY=a.constants.O_RDONLY;function exists(A){return n(this,void 0,void 0,(function*(){try{yield e.stat(A)}catch(A){if(A.code==="ENOENT"){return false}throw A}return true}))}e.exists=exists;function isDirectory(A,t=false){return n(this,void 0,void 0,(function*(){const r=t?yield e.stat(A):yield e.lstat(A);return r.isDirectory()}))}e.isDirectory=isDirectory;function isRooted(A){A=normalizeSeparators(A);if(!A){throw new Error('isRooted() parameter "p" cannot be empty')}if(e.IS_WINDOWS){return A.startsWith("\\")||/^[A-Z]:/i.test(A)}return A.startsWith("/")}e.isRooted=isRooted;function tryGetExecutablePath(A,t){return n(this,void 0,void 0,(function*(){let r=undefined;try{r=yield e.stat(A)}catch(e){if(e.code!=="ENOENT"){console.log(`Unexpected error attempting to determine if executable file exists '${A}': ${e}`)}}if(r&&r.isFile()){if(e.IS_WINDOWS){const e=E.extname(A).toUpperCase();if(t.some((A=>A.toUpperCase()===e))){return A}}else{if(isUnixExecutable(r)){return A}}}const s=A;for(const o of t){A=s+o;r=undefined;try{r=yield e.stat(A)}catch(e){if(e.code!=="ENOENT"){console.log(`Unexpected error attempting to determine if executable file exists '${A}': ${e}`)}}if(r&&r.isFile()){if(e.IS_WINDOWS){try{const t=E.dirname(A);const r=E.basename(A).toUpperCase();for(const s of yield e.readdir(t)){if(r===s.toUpperCase()){A=E.join(t,s);break}}}catch(e){console.log(`Unexpected error attempting to determine the actual case of the file '${A}': ${e}`)}return A}else{if(isUnixExecutable(r)){return A}}}}return""}))}e.tryGetExecutablePath=tryGetExecutablePath;function normalizeSeparators(A){A=A||"";if(e.IS_WINDOWS){A=A.replace(/\//g,"\\");return A.replace(/\\\\+/g,"\\")}return A.replace(/\/\/+/g,"/")}function isUnixExecutable(A){return(A.mode&1)>0||(A.mode&8)>0&&A.gid===process.getgid()||(A.mode&64)>0&&A.uid===process.getuid()}function getCmdPath(){var A;return(A=process.env["COMSPEC"])!==null&&A!==void 0?A:`cmd.exe`}e.getCmdPath=getCmdPath},96:function(A,e,t){"use strict";var r=this&&this.__createBinding||(Object.create?function(A,e,t,r){if(r===undefined)r=t;Object.defineProperty(A,r,{enumerable:true,get:function(){return e[t]}})}:function(A,e,t,r){if(r===undefined)r=t;A[r]=e[t]});var s=this&&this.__setModuleDefault||(Object.create?function(A,e){Object.defineProperty(A,"default",{enumerable:true,value:e})}:function(A,e){A["default"]=e});var o=this&&this.__importStar||function(A){if(A&&A.__esModule)return A;var e={};if(A!=null)for(var t in A)if(t!=="default"&&Object.hasOwnProperty.call(A,t))r(e,A,t);s(e,A);return e};var n=this&&this.__awaiter||function(A,e,t,r){function adopt(A){return A instanceof t?A:new t((function(e){e(A)}))}return new(t||(t=Promise))((function(t,s){function fulfilled(A){try{step(r.next(A))}catch(A){s(A)}}function rejected(A){try{step(r["throw"](A))}catch(A){s(A)}}function step(A){A.done?t(A.value):adopt(A.value).then(fulfilled,rejected)}step((r=r.apply(A,e||[])).next())}))};Object.defineProperty(e,"__esModule",{value:true});e.findInPath=e.which=e.mkdirP=e.rmRF=e.mv=e.cp=void 0;const i=t(2613);const a=o(t(6928));const E=o(t(8409));function cp(A,e,t={}){return n(this,void 0,void 0,(function*(){const{force:r,recursive:s,copySourceDirectory:o}=readCopyOptions(t);const n=(yield E.exists(e))?yield E.stat(e):null;if(n&&n.isFile()&&!r){return}const i=n&&n.isDirectory()&&o?a.join(e,a.basename(A)):e;if(!(yield E.exists(A))){throw new Error(`no such file or directory: ${A}`)}const g=yield E.stat(A);if(g.isDirectory()){if(!s){throw new Error(`Failed to copy. ${A} is a directory, but tried to copy without recursive flag.`)}else{yield cpDirRecursive(A,i,0,r)}}else{if(a.relative(A,i)===""){throw new Error(`'${i}' and '${A}' are the same file`)}yield copyFile(A,i,r)}}))}e.cp=cp;function mv(A,e,t={}){return n(this,void 0,void 0,(function*(){if(yield E.exists(e)){let r=true;if(yield E.isDirectory(e)){e=a.join(e,a.basename(A));r=yield E.exists(e)}if(r){if(t.force==null||t.force){yield rmRF(e)}else{throw new Error("Destination already exists")}}}yield mkdirP(a.dirname(e));yield E.rename(A,e)}))}e.mv=mv;function rmRF(A){return n(this,void 0,void 0,(function*(){if(E.IS_WINDOWS){if(/[*"<>|]/.test(A)){throw new Error('File path must not contain `*`, `"`, `<`, `>` or `|` on Windows')}}try{yield E.rm(A,{force:true,maxRetries:3,recursive:true,retryDelay:300})}catch(A){throw new Error(`File was unable to be removed ${A}`)}}))}e.rmRF=rmRF;function mkdirP(A){return n(this,void 0,void 0,(function*(){i.ok(A,"a path argument must be provided");yield E.mkdir(A,{recursive:true})}))}e.mkdirP=mkdirP;function which(A,e){return n(this,void 0,void 0,(function*(){if(!A){throw new Error("parameter 'tool' is required")}if(e){const e=yield which(A,false);if(!e){if(E.IS_WINDOWS){throw new Error(`Unable to locate executable file: ${A}. Please verify either the file path exists or the file can be found within a directory specified by the PATH environment variable. Also verify the file has a valid extension for an executable file.`)}else{throw new Error(`Unable to locate executable file: ${A}. Please verify either the file path exists or the file can be found within a directory specified by the PATH environment variable. Also check the file mode to verify the file is executable.`)}}return e}const t=yield findInPath(A);if(t&&t.length>0){return t[0]}return""}))}e.which=which;function findInPath(A){return n(this,void 0,void 0,(function*(){if(!A){throw new Error("parameter 'tool' is required")}const e=[];if(E.IS_WINDOWS&&process.env["PATHEXT"]){for(const A of process.env["PATHEXT"].split(a.delimiter)){if(A){e.push(A)}}}if(E.isRooted(A)){const t=yield E.tryGetExecutablePath(A,e);if(t){return[t]}return[]}if(A.includes(a.sep)){return[]}const t=[];if(process.env.PATH){for(const A of process.env.PATH.split(a.delimiter)){if(A){t.push(A)}}}const r=[];for(const s of t){const t=yield E.tryGetExecutablePath(a.join(s,A),e);if(t){r.push(t)}}return r}))}e.findInPath=findInPath;function readCopyOptions(A){const e=A.force==null?true:A.force;const t=Boolean(A.recursive);const r=A.copySourceDirectory==null?true:Boolean(A.copySourceDirectory);return{force:e,recursive:t,copySourceDirectory:r}}function cpDirRecursive(A,e,t,r){return n(this,void 0,void 0,(function*(){if(t>=255)return;t++;yield mkdirP(e);const s=yield E.readdir(A);for(const o of s){const s=`${A}/${o}`;const n=`${e}/${o}`;const i=yield E.lstat(s);if(i.isDirectory()){yield cpDirRecursive(s,n,t,r)}else{yield copyFile(s,n,r)}}yield E.chmod(e,(yield E.stat(A)).mode)}))}function copyFile(A,e,t){return n(this,void 0,void 0,(function*(){if((yield E.lstat(A)).isSymbolicLink()){try{yield E.lstat(e);yield E.unlink(e)}catch(A){if(A.code==="EPERM"){yield E.chmod(e,"0666");yield E.unlink(e)}}const t=yield E.readlink(A);yield E.symlink(t,e,E.IS_WINDOWS?"junction":null)}else if(!(yield E.exists(e))||t){yield E.copyFile(A,e)}}))}},3664:(A,e,t)=>{A.exports=t(6368)},6368:(A,e,t)=>{"use strict";var r=t(9278);var s=t(4756);var o=t(8611);var n=t(5692);var i=t(4434);var a=t(2613);var E=t(9023);e.httpOverHttp=httpOverHttp;e.httpsOverHttp=httpsOverHttp;e.httpOverHttps=httpOverHttps;e.httpsOverHttps=httpsOverHttps;function httpOverHttp(A){var e=new TunnelingAgent(A);e.request=o.request;return e}function httpsOverHttp(A){var e=new TunnelingAgent(A);e.request=o.request;e.createSocket=createSecureSocket;e.defaultPort=443;return e}function httpOverHttps(A){var e=new TunnelingAgent(A);e.request=n.request;return e}function httpsOverHttps(A){var e=new TunnelingAgent(A);e.request=n.request;e.createSocket=createSecureSocket;e.defaultPort=443;return e}function TunnelingAgent(A){var e=this;e.options=A||{};e.proxyOptions=e.options.proxy||{};e.maxSockets=e.options.maxSockets||o.Agent.defaultMaxSockets;e.requests=[];e.sockets=[];e.on("free",(function onFree(A,t,r,s){var o=toOptions(t,r,s);for(var n=0,i=e.requests.length;n<i;++n){var a=e.requests[n];if(a.host===o.host&&a.port===o.port){e.requests.splice(n,1);a.request.onSocket(A);return}}A.destroy();e.removeSocket(A)}))}E.inherits(TunnelingAgent,i.EventEmitter);TunnelingAgent.prototype.addRequest=function addRequest(A,e,t,r){var s=this;var o=mergeOptions({request:A},s.options,toOptions(e,t,r));if(s.sockets.length>=this.maxSockets){s.requests.push(o);return}s.createSocket(o,(function(e){e.on("free",onFree);e.on("close",onCloseOrRemove);e.on("agentRemove",onCloseOrRemove);A.onSocket(e);function onFree(){s.emit("free",e,o)}function onCloseOrRemove(A){s.removeSocket(e);e.removeListener("free",onFree);e.removeListener("close",onCloseOrRemove);e.removeListener("agentRemove",onCloseOrRemove)}}))};TunnelingAgent.prototype.createSocket=function createSocket(A,e){var t=this;var r={};t.sockets.push(r);var s=mergeOptions({},t.proxyOptions,{method:"CONNECT",path:A.host+":"+A.port,agent:false,headers:{host:A.host+":"+A.port}});if(A.localAddress){s.localAddress=A.localAddress}if(s.proxyAuth){s.headers=s.headers||{};s.headers["Proxy-Authorization"]="Basic "+new Buffer(s.proxyAuth).toString("base64")}g("making CONNECT request");var o=t.request(s);o.useChunkedEncodingByDefault=false;o.once("response",onResponse);o.once("upgrade",onUpgrade);o.once("connect",onConnect);o.once("error",onError);o.end();function onResponse(A){A.upgrade=true}function onUpgrade(A,e,t){process.nextTick((function(){onConnect(A,e,t)}))}function onConnect(s,n,i){o.removeAllListeners();n.removeAllListeners();if(s.statusCode!==200){g("tunneling socket could not be established, statusCode=%d",s.statusCode);n.destroy();var a=new Error("tunneling socket could not be established, "+"statusCode="+s.statusCode);a.code="ECONNRESET";A.request.emit("error",a);t.removeSocket(r);return}if(i.length>0){g("got illegal response body from proxy");n.destroy();var a=new Error("got illegal response body from proxy");a.code="ECONNRESET";A.request.emit("error",a);t.removeSocket(r);return}g("tunneling connection has established");t.sockets[t.sockets.indexOf(r)]=n;return e(n)}function onError(e){o.removeAllListeners();g("tunneling socket could not be established, cause=%s\n",e.message,e.stack);var s=new Error("tunneling socket could not be established, "+"cause="+e.message);s.code="ECONNRESET";A.request.emit("error",s);t.removeSocket(r)}};TunnelingAgent.prototype.removeSocket=function removeSocket(A){var e=this.sockets.indexOf(A);if(e===-1){return}this.sockets.splice(e,1);var t=this.requests.shift();if(t){this.createSocket(t,(function(A){t.request.onSocket(A)}))}};function createSecureSocket(A,e){var t=this;TunnelingAgent.prototype.createSocket.call(t,A,(function(r){var o=A.request.getHeader("host");var n=mergeOptions({},t.options,{socket:r,servername:o?o.replace(/:.*$/,""):A.host});var i=s.connect(0,n);t.sockets[t.sockets.indexOf(r)]=i;e(i)}))}function toOptions(A,e,t){if(typeof A==="string"){return{host:A,port:e,localAddress:t}}return A}function mergeOptions(A){for(var e=1,t=arguments.length;e<t;++e){var r=arguments[e];if(typeof r==="object"){var s=Object.keys(r);for(var o=0,n=s.length;o<n;++o){var i=s[o];if(r[i]!==undefined){A[i]=r[i]}}}}return A}var g;if(process.env.NODE_DEBUG&&/\btunnel\b/.test(process.env.NODE_DEBUG)){g=function(){var A=Array.prototype.slice.call(arguments);if(typeof A[0]==="string"){A[0]="TUNNEL: "+A[0]}else{A.unshift("TUNNEL:")}console.error.apply(console,A)}}else{g=function(){}}e.debug=g},5494:(A,e,t)=>{"use strict";const r=t(4291);const s=t(3253);const o=t(1369);const n=t(7258);const i=t(7971);const a=t(2415);const E=t(7586);const{InvalidArgumentError:g}=o;const c=t(6905);const Q=t(4890);const C=t(7327);const B=t(7731);const I=t(8318);const h=t(171);const l=t(6746);const u=t(3783);const{getGlobalDispatcher:d,setGlobalDispatcher:f}=t(4127);const p=t(334);const y=t(9221);const R=t(4193);let D;try{t(6982);D=true}catch{D=false}Object.assign(s.prototype,c);A.exports.Dispatcher=s;A.exports.Client=r;A.exports.Pool=n;A.exports.BalancedPool=i;A.exports.Agent=a;A.exports.ProxyAgent=l;A.exports.RetryHandler=u;A.exports.DecoratorHandler=p;A.exports.RedirectHandler=y;A.exports.createRedirectInterceptor=R;A.exports.buildConnector=Q;A.exports.errors=o;function makeDispatcher(A){return(e,t,r)=>{if(typeof t==="function"){r=t;t=null}if(!e||typeof e!=="string"&&typeof e!=="object"&&!(e instanceof URL)){throw new g("invalid url")}if(t!=null&&typeof t!=="object"){throw new g("invalid opts")}if(t&&t.path!=null){if(typeof t.path!=="string"){throw new g("invalid opts.path")}let A=t.path;if(!t.path.startsWith("/")){A=`/${A}`}e=new URL(E.parseOrigin(e).origin+A)}else{if(!t){t=typeof e==="object"?e:{}}e=E.parseURL(e)}const{agent:s,dispatcher:o=d()}=t;if(s){throw new g("unsupported opts.agent. Did you mean opts.client?")}return A.call(o,{...t,origin:e.origin,path:e.search?`${e.pathname}${e.search}`:e.pathname,method:t.method||(t.body?"PUT":"GET")},r)}}A.exports.setGlobalDispatcher=f;A.exports.getGlobalDispatcher=d;if(E.nodeMajor>16||E.nodeMajor===16&&E.nodeMinor>=8){let e=null;A.exports.fetch=async function fetch(A){if(!e){e=t(8053).fetch}try{return await e(...arguments)}catch(A){if(typeof A==="object"){Error.captureStackTrace(A,this)}throw A}};A.exports.Headers=t(6939).Headers;A.exports.Response=t(5018).Response;A.exports.Request=t(3056).Request;A.exports.FormData=t(1079).FormData;A.exports.File=t(1103).File;A.exports.FileReader=t(170).FileReader;const{setGlobalOrigin:r,getGlobalOrigin:s}=t(7074);A.exports.setGlobalOrigin=r;A.exports.getGlobalOrigin=s;const{CacheStorage:o}=t(9636);const{kConstruct:n}=t(38);A.exports.caches=new o(n)}if(E.nodeMajor>=16){const{deleteCookie:e,getCookies:r,getSetCookies:s,setCookie:o}=t(1982);A.exports.deleteCookie=e;A.exports.getCookies=r;A.exports.getSetCookies=s;A.exports.setCookie=o;const{parseMIMEType:n,serializeAMimeType:i}=t(1620);A.exports.parseMIMEType=n;A.exports.serializeAMimeType=i}if(E.nodeMajor>=18&&D){const{WebSocket:e}=t(7785);A.exports.WebSocket=e}A.exports.request=makeDispatcher(c.request);A.exports.stream=makeDispatcher(c.stream);A.exports.pipeline=makeDispatcher(c.pipeline);A.exports.connect=makeDispatcher(c.connect);A.exports.upgrade=makeDispatcher(c.upgrade);A.exports.MockClient=C;A.exports.MockPool=I;A.exports.MockAgent=B;A.exports.mockErrors=h},2415:(A,e,t)=>{"use strict";const{InvalidArgumentError:r}=t(1369);const{kClients:s,kRunning:o,kClose:n,kDestroy:i,kDispatch:a,kInterceptors:E}=t(5817);const g=t(4743);const c=t(7258);const Q=t(4291);const C=t(7586);const B=t(4193);const{WeakRef:I,FinalizationRegistry:h}=t(2132)();const l=Symbol("onConnect");const u=Symbol("onDisconnect");const d=Symbol("onConnectionError");const f=Symbol("maxRedirections");const p=Symbol("onDrain");const y=Symbol("factory");const R=Symbol("finalizer");const D=Symbol("options");function defaultFactory(A,e){return e&&e.connections===1?new Q(A,e):new c(A,e)}class Agent extends g{constructor({factory:A=defaultFactory,maxRedirections:e=0,connect:t,...o}={}){super();if(typeof A!=="function"){throw new r("factory must be a function.")}if(t!=null&&typeof t!=="function"&&typeof t!=="object"){throw new r("connect must be a function or an object")}if(!Number.isInteger(e)||e<0){throw new r("maxRedirections must be a positive number")}if(t&&typeof t!=="function"){t={...t}}this[E]=o.interceptors&&o.interceptors.Agent&&Array.isArray(o.interceptors.Agent)?o.interceptors.Agent:[B({maxRedirections:e})];this[D]={...C.deepClone(o),connect:t};this[D].interceptors=o.interceptors?{...o.interceptors}:undefined;this[f]=e;this[y]=A;this[s]=new Map;this[R]=new h((A=>{const e=this[s].get(A);if(e!==undefined&&e.deref()===undefined){this[s].delete(A)}}));const n=this;this[p]=(A,e)=>{n.emit("drain",A,[n,...e])};this[l]=(A,e)=>{n.emit("connect",A,[n,...e])};this[u]=(A,e,t)=>{n.emit("disconnect",A,[n,...e],t)};this[d]=(A,e,t)=>{n.emit("connectionError",A,[n,...e],t)}}get[o](){let A=0;for(const e of this[s].values()){const t=e.deref();if(t){A+=t[o]}}return A}[a](A,e){let t;if(A.origin&&(typeof A.origin==="string"||A.origin instanceof URL)){t=String(A.origin)}else{throw new r("opts.origin must be a non-empty string or URL.")}const o=this[s].get(t);let n=o?o.deref():null;if(!n){n=this[y](A.origin,this[D]).on("drain",this[p]).on("connect",this[l]).on("disconnect",this[u]).on("connectionError",this[d]);this[s].set(t,new I(n));this[R].register(n,t)}return n.dispatch(A,e)}async[n](){const A=[];for(const e of this[s].values()){const t=e.deref();if(t){A.push(t.close())}}await Promise.all(A)}async[i](A){const e=[];for(const t of this[s].values()){const r=t.deref();if(r){e.push(r.destroy(A))}}await Promise.all(e)}}A.exports=Agent},2696:(A,e,t)=>{const{addAbortListener:r}=t(7586);const{RequestAbortedError:s}=t(1369);const o=Symbol("kListener");const n=Symbol("kSignal");function abort(A){if(A.abort){A.abort()}else{A.onError(new s)}}function addSignal(A,e){A[n]=null;A[o]=null;if(!e){return}if(e.aborted){abort(A);return}A[n]=e;A[o]=()=>{abort(A)};r(A[n],A[o])}function removeSignal(A){if(!A[n]){return}if("removeEventListener"in A[n]){A[n].removeEventListener("abort",A[o])}else{A[n].removeListener("abort",A[o])}A[n]=null;A[o]=null}A.exports={addSignal:addSignal,removeSignal:removeSignal}},1382:(A,e,t)=>{"use strict";const{AsyncResource:r}=t(290);const{InvalidArgumentError:s,RequestAbortedError:o,SocketError:n}=t(1369);const i=t(7586);const{addSignal:a,removeSignal:E}=t(2696);class ConnectHandler extends r{constructor(A,e){if(!A||typeof A!=="object"){throw new s("invalid opts")}if(typeof e!=="function"){throw new s("invalid callback")}const{signal:t,opaque:r,responseHeaders:o}=A;if(t&&typeof t.on!=="function"&&typeof t.addEventListener!=="function"){throw new s("signal must be an EventEmitter or EventTarget")}super("UNDICI_CONNECT");this.opaque=r||null;this.responseHeaders=o||null;this.callback=e;this.abort=null;a(this,t)}onConnect(A,e){if(!this.callback){throw new o}this.abort=A;this.context=e}onHeaders(){throw new n("bad connect",null)}onUpgrade(A,e,t){const{callback:r,opaque:s,context:o}=this;E(this);this.callback=null;let n=e;if(n!=null){n=this.responseHeaders==="raw"?i.parseRawHeaders(e):i.parseHeaders(e)}this.runInAsyncScope(r,null,null,{statusCode:A,headers:n,socket:t,opaque:s,context:o})}onError(A){const{callback:e,opaque:t}=this;E(this);if(e){this.callback=null;queueMicrotask((()=>{this.runInAsyncScope(e,null,A,{opaque:t})}))}}}function connect(A,e){if(e===undefined){return new Promise(((e,t)=>{connect.call(this,A,((A,r)=>A?t(A):e(r)))}))}try{const t=new ConnectHandler(A,e);this.dispatch({...A,method:"CONNECT"},t)}catch(t){if(typeof e!=="function"){throw t}const r=A&&A.opaque;queueMicrotask((()=>e(t,{opaque:r})))}}A.exports=connect},4428:(A,e,t)=>{"use strict";const{Readable:r,Duplex:s,PassThrough:o}=t(2203);const{InvalidArgumentError:n,InvalidReturnValueError:i,RequestAbortedError:a}=t(1369);const E=t(7586);const{AsyncResource:g}=t(290);const{addSignal:c,removeSignal:Q}=t(2696);const C=t(2613);const B=Symbol("resume");class PipelineRequest extends r{constructor(){super({autoDestroy:true});this[B]=null}_read(){const{[B]:A}=this;if(A){this[B]=null;A()}}_destroy(A,e){this._read();e(A)}}class PipelineResponse extends r{constructor(A){super({autoDestroy:true});this[B]=A}_read(){this[B]()}_destroy(A,e){if(!A&&!this._readableState.endEmitted){A=new a}e(A)}}class PipelineHandler extends g{constructor(A,e){if(!A||typeof A!=="object"){throw new n("invalid opts")}if(typeof e!=="function"){throw new n("invalid handler")}const{signal:t,method:r,opaque:o,onInfo:i,responseHeaders:g}=A;if(t&&typeof t.on!=="function"&&typeof t.addEventListener!=="function"){throw new n("signal must be an EventEmitter or EventTarget")}if(r==="CONNECT"){throw new n("invalid method")}if(i&&typeof i!=="function"){throw new n("invalid onInfo callback")}super("UNDICI_PIPELINE");this.opaque=o||null;this.responseHeaders=g||null;this.handler=e;this.abort=null;this.context=null;this.onInfo=i||null;this.req=(new PipelineRequest).on("error",E.nop);this.ret=new s({readableObjectMode:A.objectMode,autoDestroy:true,read:()=>{const{body:A}=this;if(A&&A.resume){A.resume()}},write:(A,e,t)=>{const{req:r}=this;if(r.push(A,e)||r._readableState.destroyed){t()}else{r[B]=t}},destroy:(A,e)=>{const{body:t,req:r,res:s,ret:o,abort:n}=this;if(!A&&!o._readableState.endEmitted){A=new a}if(n&&A){n()}E.destroy(t,A);E.destroy(r,A);E.destroy(s,A);Q(this);e(A)}}).on("prefinish",(()=>{const{req:A}=this;A.push(null)}));this.res=null;c(this,t)}onConnect(A,e){const{ret:t,res:r}=this;C(!r,"pipeline cannot be retried");if(t.destroyed){throw new a}this.abort=A;this.context=e}onHeaders(A,e,t){const{opaque:r,handler:s,context:o}=this;if(A<200){if(this.onInfo){const t=this.responseHeaders==="raw"?E.parseRawHeaders(e):E.parseHeaders(e);this.onInfo({statusCode:A,headers:t})}return}this.res=new PipelineResponse(t);let n;try{this.handler=null;const t=this.responseHeaders==="raw"?E.parseRawHeaders(e):E.parseHeaders(e);n=this.runInAsyncScope(s,null,{statusCode:A,headers:t,opaque:r,body:this.res,context:o})}catch(A){this.res.on("error",E.nop);throw A}if(!n||typeof n.on!=="function"){throw new i("expected Readable")}n.on("data",(A=>{const{ret:e,body:t}=this;if(!e.push(A)&&t.pause){t.pause()}})).on("error",(A=>{const{ret:e}=this;E.destroy(e,A)})).on("end",(()=>{const{ret:A}=this;A.push(null)})).on("close",(()=>{const{ret:A}=this;if(!A._readableState.ended){E.destroy(A,new a)}}));this.body=n}onData(A){const{res:e}=this;return e.push(A)}onComplete(A){const{res:e}=this;e.push(null)}onError(A){const{ret:e}=this;this.handler=null;E.destroy(e,A)}}function pipeline(A,e){try{const t=new PipelineHandler(A,e);this.dispatch({...A,body:t.req},t);return t.ret}catch(A){return(new o).destroy(A)}}A.exports=pipeline},3705:(A,e,t)=>{"use strict";const r=t(7041);const{InvalidArgumentError:s,RequestAbortedError:o}=t(1369);const n=t(7586);const{getResolveErrorBodyCallback:i}=t(3297);const{AsyncResource:a}=t(290);const{addSignal:E,removeSignal:g}=t(2696);class RequestHandler extends a{constructor(A,e){if(!A||typeof A!=="object"){throw new s("invalid opts")}const{signal:t,method:r,opaque:o,body:i,onInfo:a,responseHeaders:g,throwOnError:c,highWaterMark:Q}=A;try{if(typeof e!=="function"){throw new s("invalid callback")}if(Q&&(typeof Q!=="number"||Q<0)){throw new s("invalid highWaterMark")}if(t&&typeof t.on!=="function"&&typeof t.addEventListener!=="function"){throw new s("signal must be an EventEmitter or EventTarget")}if(r==="CONNECT"){throw new s("invalid method")}if(a&&typeof a!=="function"){throw new s("invalid onInfo callback")}super("UNDICI_REQUEST")}catch(A){if(n.isStream(i)){n.destroy(i.on("error",n.nop),A)}throw A}this.responseHeaders=g||null;this.opaque=o||null;this.callback=e;this.res=null;this.abort=null;this.body=i;this.trailers={};this.context=null;this.onInfo=a||null;this.throwOnError=c;this.highWaterMark=Q;if(n.isStream(i)){i.on("error",(A=>{this.onError(A)}))}E(this,t)}onConnect(A,e){if(!this.callback){throw new o}this.abort=A;this.context=e}onHeaders(A,e,t,s){const{callback:o,opaque:a,abort:E,context:g,responseHeaders:c,highWaterMark:Q}=this;const C=c==="raw"?n.parseRawHeaders(e):n.parseHeaders(e);if(A<200){if(this.onInfo){this.onInfo({statusCode:A,headers:C})}return}const B=c==="raw"?n.parseHeaders(e):C;const I=B["content-type"];const h=new r({resume:t,abort:E,contentType:I,highWaterMark:Q});this.callback=null;this.res=h;if(o!==null){if(this.throwOnError&&A>=400){this.runInAsyncScope(i,null,{callback:o,body:h,contentType:I,statusCode:A,statusMessage:s,headers:C})}else{this.runInAsyncScope(o,null,null,{statusCode:A,headers:C,trailers:this.trailers,opaque:a,body:h,context:g})}}}onData(A){const{res:e}=this;return e.push(A)}onComplete(A){const{res:e}=this;g(this);n.parseHeaders(A,this.trailers);e.push(null)}onError(A){const{res:e,callback:t,body:r,opaque:s}=this;g(this);if(t){this.callback=null;queueMicrotask((()=>{this.runInAsyncScope(t,null,A,{opaque:s})}))}if(e){this.res=null;queueMicrotask((()=>{n.destroy(e,A)}))}if(r){this.body=null;n.destroy(r,A)}}}function request(A,e){if(e===undefined){return new Promise(((e,t)=>{request.call(this,A,((A,r)=>A?t(A):e(r)))}))}try{this.dispatch(A,new RequestHandler(A,e))}catch(t){if(typeof e!=="function"){throw t}const r=A&&A.opaque;queueMicrotask((()=>e(t,{opaque:r})))}}A.exports=request;A.exports.RequestHandler=RequestHandler},8762:(A,e,t)=>{"use strict";const{finished:r,PassThrough:s}=t(2203);const{InvalidArgumentError:o,InvalidReturnValueError:n,RequestAbortedError:i}=t(1369);const a=t(7586);const{getResolveErrorBodyCallback:E}=t(3297);const{AsyncResource:g}=t(290);const{addSignal:c,removeSignal:Q}=t(2696);class StreamHandler extends g{constructor(A,e,t){if(!A||typeof A!=="object"){throw new o("invalid opts")}const{signal:r,method:s,opaque:n,body:i,onInfo:E,responseHeaders:g,throwOnError:Q}=A;try{if(typeof t!=="function"){throw new o("invalid callback")}if(typeof e!=="function"){throw new o("invalid factory")}if(r&&typeof r.on!=="function"&&typeof r.addEventListener!=="function"){throw new o("signal must be an EventEmitter or EventTarget")}if(s==="CONNECT"){throw new o("invalid method")}if(E&&typeof E!=="function"){throw new o("invalid onInfo callback")}super("UNDICI_STREAM")}catch(A){if(a.isStream(i)){a.destroy(i.on("error",a.nop),A)}throw A}this.responseHeaders=g||null;this.opaque=n||null;this.factory=e;this.callback=t;this.res=null;this.abort=null;this.context=null;this.trailers=null;this.body=i;this.onInfo=E||null;this.throwOnError=Q||false;if(a.isStream(i)){i.on("error",(A=>{this.onError(A)}))}c(this,r)}onConnect(A,e){if(!this.callback){throw new i}this.abort=A;this.context=e}onHeaders(A,e,t,o){const{factory:i,opaque:g,context:c,callback:Q,responseHeaders:C}=this;const B=C==="raw"?a.parseRawHeaders(e):a.parseHeaders(e);if(A<200){if(this.onInfo){this.onInfo({statusCode:A,headers:B})}return}this.factory=null;let I;if(this.throwOnError&&A>=400){const t=C==="raw"?a.parseHeaders(e):B;const r=t["content-type"];I=new s;this.callback=null;this.runInAsyncScope(E,null,{callback:Q,body:I,contentType:r,statusCode:A,statusMessage:o,headers:B})}else{if(i===null){return}I=this.runInAsyncScope(i,null,{statusCode:A,headers:B,opaque:g,context:c});if(!I||typeof I.write!=="function"||typeof I.end!=="function"||typeof I.on!=="function"){throw new n("expected Writable")}r(I,{readable:false},(A=>{const{callback:e,res:t,opaque:r,trailers:s,abort:o}=this;this.res=null;if(A||!t.readable){a.destroy(t,A)}this.callback=null;this.runInAsyncScope(e,null,A||null,{opaque:r,trailers:s});if(A){o()}}))}I.on("drain",t);this.res=I;const h=I.writableNeedDrain!==undefined?I.writableNeedDrain:I._writableState&&I._writableState.needDrain;return h!==true}onData(A){const{res:e}=this;return e?e.write(A):true}onComplete(A){const{res:e}=this;Q(this);if(!e){return}this.trailers=a.parseHeaders(A);e.end()}onError(A){const{res:e,callback:t,opaque:r,body:s}=this;Q(this);this.factory=null;if(e){this.res=null;a.destroy(e,A)}else if(t){this.callback=null;queueMicrotask((()=>{this.runInAsyncScope(t,null,A,{opaque:r})}))}if(s){this.body=null;a.destroy(s,A)}}}function stream(A,e,t){if(t===undefined){return new Promise(((t,r)=>{stream.call(this,A,e,((A,e)=>A?r(A):t(e)))}))}try{this.dispatch(A,new StreamHandler(A,e,t))}catch(e){if(typeof t!=="function"){throw e}const r=A&&A.opaque;queueMicrotask((()=>t(e,{opaque:r})))}}A.exports=stream},5864:(A,e,t)=>{"use strict";const{InvalidArgumentError:r,RequestAbortedError:s,SocketError:o}=t(1369);const{AsyncResource:n}=t(290);const i=t(7586);const{addSignal:a,removeSignal:E}=t(2696);const g=t(2613);class UpgradeHandler extends n{constructor(A,e){if(!A||typeof A!=="object"){throw new r("invalid opts")}if(typeof e!=="function"){throw new r("invalid callback")}const{signal:t,opaque:s,responseHeaders:o}=A;if(t&&typeof t.on!=="function"&&typeof t.addEventListener!=="function"){throw new r("signal must be an EventEmitter or EventTarget")}super("UNDICI_UPGRADE");this.responseHeaders=o||null;this.opaque=s||null;this.callback=e;this.abort=null;this.context=null;a(this,t)}onConnect(A,e){if(!this.callback){throw new s}this.abort=A;this.context=null}onHeaders(){throw new o("bad upgrade",null)}onUpgrade(A,e,t){const{callback:r,opaque:s,context:o}=this;g.strictEqual(A,101);E(this);this.callback=null;const n=this.responseHeaders==="raw"?i.parseRawHeaders(e):i.parseHeaders(e);this.runInAsyncScope(r,null,null,{headers:n,socket:t,opaque:s,context:o})}onError(A){const{callback:e,opaque:t}=this;E(this);if(e){this.callback=null;queueMicrotask((()=>{this.runInAsyncScope(e,null,A,{opaque:t})}))}}}function upgrade(A,e){if(e===undefined){return new Promise(((e,t)=>{upgrade.call(this,A,((A,r)=>A?t(A):e(r)))}))}try{const t=new UpgradeHandler(A,e);this.dispatch({...A,method:A.method||"GET",upgrade:A.protocol||"Websocket"},t)}catch(t){if(typeof e!=="function"){throw t}const r=A&&A.opaque;queueMicrotask((()=>e(t,{opaque:r})))}}A.exports=upgrade},6905:(A,e,t)=>{"use strict";A.exports.request=t(3705);A.exports.stream=t(8762);A.exports.pipeline=t(4428);A.exports.upgrade=t(5864);A.exports.connect=t(1382)},7041:(A,e,t)=>{"use strict";const r=t(2613);const{Readable:s}=t(2203);const{RequestAbortedError:o,NotSupportedError:n,InvalidArgumentError:i}=t(1369);const a=t(7586);const{ReadableStreamFrom:E,toUSVString:g}=t(7586);let c;const Q=Symbol("kConsume");const C=Symbol("kReading");const B=Symbol("kBody");const I=Symbol("abort");const h=Symbol("kContentType");const noop=()=>{};A.exports=class BodyReadable extends s{constructor({resume:A,abort:e,contentType:t="",highWaterMark:r=64*1024}){super({autoDestroy:true,read:A,highWaterMark:r});this._readableState.dataEmitted=false;this[I]=e;this[Q]=null;this[B]=null;this[h]=t;this[C]=false}destroy(A){if(this.destroyed){return this}if(!A&&!this._readableState.endEmitted){A=new o}if(A){this[I]()}return super.destroy(A)}emit(A,...e){if(A==="data"){this._readableState.dataEmitted=true}else if(A==="error"){this._readableState.errorEmitted=true}return super.emit(A,...e)}on(A,...e){if(A==="data"||A==="readable"){this[C]=true}return super.on(A,...e)}addListener(A,...e){return this.on(A,...e)}off(A,...e){const t=super.off(A,...e);if(A==="data"||A==="readable"){this[C]=this.listenerCount("data")>0||this.listenerCount("readable")>0}return t}removeListener(A,...e){return this.off(A,...e)}push(A){if(this[Q]&&A!==null&&this.readableLength===0){consumePush(this[Q],A);return this[C]?super.push(A):true}return super.push(A)}async text(){return consume(this,"text")}async json(){return consume(this,"json")}async blob(){return consume(this,"blob")}async arrayBuffer(){return consume(this,"arrayBuffer")}async formData(){throw new n}get bodyUsed(){return a.isDisturbed(this)}get body(){if(!this[B]){this[B]=E(this);if(this[Q]){this[B].getReader();r(this[B].locked)}}return this[B]}dump(A){let e=A&&Number.isFinite(A.limit)?A.limit:262144;const t=A&&A.signal;if(t){try{if(typeof t!=="object"||!("aborted"in t)){throw new i("signal must be an AbortSignal")}a.throwIfAborted(t)}catch(A){return Promise.reject(A)}}if(this.closed){return Promise.resolve(null)}return new Promise(((A,r)=>{const s=t?a.addAbortListener(t,(()=>{this.destroy()})):noop;this.on("close",(function(){s();if(t&&t.aborted){r(t.reason||Object.assign(new Error("The operation was aborted"),{name:"AbortError"}))}else{A(null)}})).on("error",noop).on("data",(function(A){e-=A.length;if(e<=0){this.destroy()}})).resume()}))}};function isLocked(A){return A[B]&&A[B].locked===true||A[Q]}function isUnusable(A){return a.isDisturbed(A)||isLocked(A)}async function consume(A,e){if(isUnusable(A)){throw new TypeError("unusable")}r(!A[Q]);return new Promise(((t,r)=>{A[Q]={type:e,stream:A,resolve:t,reject:r,length:0,body:[]};A.on("error",(function(A){consumeFinish(this[Q],A)})).on("close",(function(){if(this[Q].body!==null){consumeFinish(this[Q],new o)}}));process.nextTick(consumeStart,A[Q])}))}function consumeStart(A){if(A.body===null){return}const{_readableState:e}=A.stream;for(const t of e.buffer){consumePush(A,t)}if(e.endEmitted){consumeEnd(this[Q])}else{A.stream.on("end",(function(){consumeEnd(this[Q])}))}A.stream.resume();while(A.stream.read()!=null){}}function consumeEnd(A){const{type:e,body:r,resolve:s,stream:o,length:n}=A;try{if(e==="text"){s(g(Buffer.concat(r)))}else if(e==="json"){s(JSON.parse(Buffer.concat(r)))}else if(e==="arrayBuffer"){const A=new Uint8Array(n);let e=0;for(const t of r){A.set(t,e);e+=t.byteLength}s(A.buffer)}else if(e==="blob"){if(!c){c=t(181).Blob}s(new c(r,{type:o[h]}))}consumeFinish(A)}catch(A){o.destroy(A)}}function consumePush(A,e){A.length+=e.length;A.body.push(e)}function consumeFinish(A,e){if(A.body===null){return}if(e){A.reject(e)}else{A.resolve()}A.type=null;A.stream=null;A.resolve=null;A.reject=null;A.length=0;A.body=null}},3297:(A,e,t)=>{const r=t(2613);const{ResponseStatusCodeError:s}=t(1369);const{toUSVString:o}=t(7586);async function getResolveErrorBodyCallback({callback:A,body:e,contentType:t,statusCode:n,statusMessage:i,headers:a}){r(e);let E=[];let g=0;for await(const A of e){E.push(A);g+=A.length;if(g>128*1024){E=null;break}}if(n===204||!t||!E){process.nextTick(A,new s(`Response status code ${n}${i?`: ${i}`:""}`,n,a));return}try{if(t.startsWith("application/json")){const e=JSON.parse(o(Buffer.concat(E)));process.nextTick(A,new s(`Response status code ${n}${i?`: ${i}`:""}`,n,a,e));return}if(t.startsWith("text/")){const e=o(Buffer.concat(E));process.nextTick(A,new s(`Response status code ${n}${i?`: ${i}`:""}`,n,a,e));return}}catch(A){}process.nextTick(A,new s(`Response status code ${n}${i?`: ${i}`:""}`,n,a))}A.exports={getResolveErrorBodyCallback:getResolveErrorBodyCallback}},7971:(A,e,t)=>{"use strict";const{BalancedPoolMissingUpstreamError:r,InvalidArgumentError:s}=t(1369);const{PoolBase:o,kClients:n,kNeedDrain:i,kAddClient:a,kRemoveClient:E,kGetDispatcher:g}=t(6962);const c=t(7258);const{kUrl:Q,kInterceptors:C}=t(5817);const{parseOrigin:B}=t(7586);const I=Symbol("factory");const h=Symbol("options");const l=Symbol("kGreatestCommonDivisor");const u=Symbol("kCurrentWeight");const d=Symbol("kIndex");const f=Symbol("kWeight");const p=Symbol("kMaxWeightPerServer");const y=Symbol("kErrorPenalty");function getGreatestCommonDivisor(A,e){if(e===0)return A;return getGreatestCommonDivisor(e,A%e)}function defaultFactory(A,e){return new c(A,e)}class BalancedPool extends o{constructor(A=[],{factory:e=defaultFactory,...t}={}){super();this[h]=t;this[d]=-1;this[u]=0;this[p]=this[h].maxWeightPerServer||100;this[y]=this[h].errorPenalty||15;if(!Array.isArray(A)){A=[A]}if(typeof e!=="function"){throw new s("factory must be a function.")}this[C]=t.interceptors&&t.interceptors.BalancedPool&&Array.isArray(t.interceptors.BalancedPool)?t.interceptors.BalancedPool:[];this[I]=e;for(const e of A){this.addUpstream(e)}this._updateBalancedPoolStats()}addUpstream(A){const e=B(A).origin;if(this[n].find((A=>A[Q].origin===e&&A.closed!==true&&A.destroyed!==true))){return this}const t=this[I](e,Object.assign({},this[h]));this[a](t);t.on("connect",(()=>{t[f]=Math.min(this[p],t[f]+this[y])}));t.on("connectionError",(()=>{t[f]=Math.max(1,t[f]-this[y]);this._updateBalancedPoolStats()}));t.on("disconnect",((...A)=>{const e=A[2];if(e&&e.code==="UND_ERR_SOCKET"){t[f]=Math.max(1,t[f]-this[y]);this._updateBalancedPoolStats()}}));for(const A of this[n]){A[f]=this[p]}this._updateBalancedPoolStats();return this}_updateBalancedPoolStats(){this[l]=this[n].map((A=>A[f])).reduce(getGreatestCommonDivisor,0)}removeUpstream(A){const e=B(A).origin;const t=this[n].find((A=>A[Q].origin===e&&A.closed!==true&&A.destroyed!==true));if(t){this[E](t)}return this}get upstreams(){return this[n].filter((A=>A.closed!==true&&A.destroyed!==true)).map((A=>A[Q].origin))}[g](){if(this[n].length===0){throw new r}const A=this[n].find((A=>!A[i]&&A.closed!==true&&A.destroyed!==true));if(!A){return}const e=this[n].map((A=>A[i])).reduce(((A,e)=>A&&e),true);if(e){return}let t=0;let s=this[n].findIndex((A=>!A[i]));while(t++<this[n].length){this[d]=(this[d]+1)%this[n].length;const A=this[n][this[d]];if(A[f]>this[n][s][f]&&!A[i]){s=this[d]}if(this[d]===0){this[u]=this[u]-this[l];if(this[u]<=0){this[u]=this[p]}}if(A[f]>=this[u]&&!A[i]){return A}}this[u]=this[n][s][f];this[d]=s;return this[n][s]}}A.exports=BalancedPool},1309:(A,e,t)=>{"use strict";const{kConstruct:r}=t(38);const{urlEquals:s,fieldValues:o}=t(2603);const{kEnumerableProperty:n,isDisturbed:i}=t(7586);const{kHeadersList:a}=t(5817);const{webidl:E}=t(9040);const{Response:g,cloneResponse:c}=t(5018);const{Request:Q}=t(3056);const{kState:C,kHeaders:B,kGuard:I,kRealm:h}=t(4012);const{fetching:l}=t(8053);const{urlIsHttpHttpsScheme:u,createDeferredPromise:d,readAllBytes:f}=t(4901);const p=t(2613);const{getGlobalDispatcher:y}=t(4127);class Cache{#A;constructor(){if(arguments[0]!==r){E.illegalConstructor()}this.#A=arguments[1]}async match(A,e={}){E.brandCheck(this,Cache);E.argumentLengthCheck(arguments,1,{header:"Cache.match"});A=E.converters.RequestInfo(A);e=E.converters.CacheQueryOptions(e);const t=await this.matchAll(A,e);if(t.length===0){return}return t[0]}async matchAll(A=undefined,e={}){E.brandCheck(this,Cache);if(A!==undefined)A=E.converters.RequestInfo(A);e=E.converters.CacheQueryOptions(e);let t=null;if(A!==undefined){if(A instanceof Q){t=A[C];if(t.method!=="GET"&&!e.ignoreMethod){return[]}}else if(typeof A==="string"){t=new Q(A)[C]}}const r=[];if(A===undefined){for(const A of this.#A){r.push(A[1])}}else{const A=this.#e(t,e);for(const e of A){r.push(e[1])}}const s=[];for(const A of r){const e=new g(A.body?.source??null);const t=e[C].body;e[C]=A;e[C].body=t;e[B][a]=A.headersList;e[B][I]="immutable";s.push(e)}return Object.freeze(s)}async add(A){E.brandCheck(this,Cache);E.argumentLengthCheck(arguments,1,{header:"Cache.add"});A=E.converters.RequestInfo(A);const e=[A];const t=this.addAll(e);return await t}async addAll(A){E.brandCheck(this,Cache);E.argumentLengthCheck(arguments,1,{header:"Cache.addAll"});A=E.converters["sequence<RequestInfo>"](A);const e=[];const t=[];for(const e of A){if(typeof e==="string"){continue}const A=e[C];if(!u(A.url)||A.method!=="GET"){throw E.errors.exception({header:"Cache.addAll",message:"Expected http/s scheme when method is not GET."})}}const r=[];for(const s of A){const A=new Q(s)[C];if(!u(A.url)){throw E.errors.exception({header:"Cache.addAll",message:"Expected http/s scheme."})}A.initiator="fetch";A.destination="subresource";t.push(A);const n=d();r.push(l({request:A,dispatcher:y(),processResponse(A){if(A.type==="error"||A.status===206||A.status<200||A.status>299){n.reject(E.errors.exception({header:"Cache.addAll",message:"Received an invalid status code or the request failed."}))}else if(A.headersList.contains("vary")){const e=o(A.headersList.get("vary"));for(const A of e){if(A==="*"){n.reject(E.errors.exception({header:"Cache.addAll",message:"invalid vary field value"}));for(const A of r){A.abort()}return}}}},processResponseEndOfBody(A){if(A.aborted){n.reject(new DOMException("aborted","AbortError"));return}n.resolve(A)}}));e.push(n.promise)}const s=Promise.all(e);const n=await s;const i=[];let a=0;for(const A of n){const e={type:"put",request:t[a],response:A};i.push(e);a++}const g=d();let c=null;try{this.#t(i)}catch(A){c=A}queueMicrotask((()=>{if(c===null){g.resolve(undefined)}else{g.reject(c)}}));return g.promise}async put(A,e){E.brandCheck(this,Cache);E.argumentLengthCheck(arguments,2,{header:"Cache.put"});A=E.converters.RequestInfo(A);e=E.converters.Response(e);let t=null;if(A instanceof Q){t=A[C]}else{t=new Q(A)[C]}if(!u(t.url)||t.method!=="GET"){throw E.errors.exception({header:"Cache.put",message:"Expected an http/s scheme when method is not GET"})}const r=e[C];if(r.status===206){throw E.errors.exception({header:"Cache.put",message:"Got 206 status"})}if(r.headersList.contains("vary")){const A=o(r.headersList.get("vary"));for(const e of A){if(e==="*"){throw E.errors.exception({header:"Cache.put",message:"Got * vary field value"})}}}if(r.body&&(i(r.body.stream)||r.body.stream.locked)){throw E.errors.exception({header:"Cache.put",message:"Response body is locked or disturbed"})}const s=c(r);const n=d();if(r.body!=null){const A=r.body.stream;const e=A.getReader();f(e).then(n.resolve,n.reject)}else{n.resolve(undefined)}const a=[];const g={type:"put",request:t,response:s};a.push(g);const B=await n.promise;if(s.body!=null){s.body.source=B}const I=d();let h=null;try{this.#t(a)}catch(A){h=A}queueMicrotask((()=>{if(h===null){I.resolve()}else{I.reject(h)}}));return I.promise}async delete(A,e={}){E.brandCheck(this,Cache);E.argumentLengthCheck(arguments,1,{header:"Cache.delete"});A=E.converters.RequestInfo(A);e=E.converters.CacheQueryOptions(e);let t=null;if(A instanceof Q){t=A[C];if(t.method!=="GET"&&!e.ignoreMethod){return false}}else{p(typeof A==="string");t=new Q(A)[C]}const r=[];const s={type:"delete",request:t,options:e};r.push(s);const o=d();let n=null;let i;try{i=this.#t(r)}catch(A){n=A}queueMicrotask((()=>{if(n===null){o.resolve(!!i?.length)}else{o.reject(n)}}));return o.promise}async keys(A=undefined,e={}){E.brandCheck(this,Cache);if(A!==undefined)A=E.converters.RequestInfo(A);e=E.converters.CacheQueryOptions(e);let t=null;if(A!==undefined){if(A instanceof Q){t=A[C];if(t.method!=="GET"&&!e.ignoreMethod){return[]}}else if(typeof A==="string"){t=new Q(A)[C]}}const r=d();const s=[];if(A===undefined){for(const A of this.#A){s.push(A[0])}}else{const A=this.#e(t,e);for(const e of A){s.push(e[0])}}queueMicrotask((()=>{const A=[];for(const e of s){const t=new Q("https://a");t[C]=e;t[B][a]=e.headersList;t[B][I]="immutable";t[h]=e.client;A.push(t)}r.resolve(Object.freeze(A))}));return r.promise}#t(A){const e=this.#A;const t=[...e];const r=[];const s=[];try{for(const t of A){if(t.type!=="delete"&&t.type!=="put"){throw E.errors.exception({header:"Cache.#batchCacheOperations",message:'operation type does not match "delete" or "put"'})}if(t.type==="delete"&&t.response!=null){throw E.errors.exception({header:"Cache.#batchCacheOperations",message:"delete operation should not have an associated response"})}if(this.#e(t.request,t.options,r).length){throw new DOMException("???","InvalidStateError")}let A;if(t.type==="delete"){A=this.#e(t.request,t.options);if(A.length===0){return[]}for(const t of A){const A=e.indexOf(t);p(A!==-1);e.splice(A,1)}}else if(t.type==="put"){if(t.response==null){throw E.errors.exception({header:"Cache.#batchCacheOperations",message:"put operation should have an associated response"})}const s=t.request;if(!u(s.url)){throw E.errors.exception({header:"Cache.#batchCacheOperations",message:"expected http or https scheme"})}if(s.method!=="GET"){throw E.errors.exception({header:"Cache.#batchCacheOperations",message:"not get method"})}if(t.options!=null){throw E.errors.exception({header:"Cache.#batchCacheOperations",message:"options must not be defined"})}A=this.#e(t.request);for(const t of A){const A=e.indexOf(t);p(A!==-1);e.splice(A,1)}e.push([t.request,t.response]);r.push([t.request,t.response])}s.push([t.request,t.response])}return s}catch(A){this.#A.length=0;this.#A=t;throw A}}#e(A,e,t){const r=[];const s=t??this.#A;for(const t of s){const[s,o]=t;if(this.#r(A,s,o,e)){r.push(t)}}return r}#r(A,e,t=null,r){const n=new URL(A.url);const i=new URL(e.url);if(r?.ignoreSearch){i.search="";n.search=""}if(!s(n,i,true)){return false}if(t==null||r?.ignoreVary||!t.headersList.contains("vary")){return true}const a=o(t.headersList.get("vary"));for(const t of a){if(t==="*"){return false}const r=e.headersList.get(t);const s=A.headersList.get(t);if(r!==s){return false}}return true}}Object.defineProperties(Cache.prototype,{[Symbol.toStringTag]:{value:"Cache",configurable:true},match:n,matchAll:n,add:n,addAll:n,put:n,delete:n,keys:n});const R=[{key:"ignoreSearch",converter:E.converters.boolean,defaultValue:false},{key:"ignoreMethod",converter:E.converters.boolean,defaultValue:false},{key:"ignoreVary",converter:E.converters.boolean,defaultValue:false}];E.converters.CacheQueryOptions=E.dictionaryConverter(R);E.converters.MultiCacheQueryOptions=E.dictionaryConverter([...R,{key:"cacheName",converter:E.converters.DOMString}]);E.converters.Response=E.interfaceConverter(g);E.converters["sequence<RequestInfo>"]=E.sequenceConverter(E.converters.RequestInfo);A.exports={Cache:Cache}},9636:(A,e,t)=>{"use strict";const{kConstruct:r}=t(38);const{Cache:s}=t(1309);const{webidl:o}=t(9040);const{kEnumerableProperty:n}=t(7586);class CacheStorage{#s=new Map;constructor(){if(arguments[0]!==r){o.illegalConstructor()}}async match(A,e={}){o.brandCheck(this,CacheStorage);o.argumentLengthCheck(arguments,1,{header:"CacheStorage.match"});A=o.converters.RequestInfo(A);e=o.converters.MultiCacheQueryOptions(e);if(e.cacheName!=null){if(this.#s.has(e.cacheName)){const t=this.#s.get(e.cacheName);const o=new s(r,t);return await o.match(A,e)}}else{for(const t of this.#s.values()){const o=new s(r,t);const n=await o.match(A,e);if(n!==undefined){return n}}}}async has(A){o.brandCheck(this,CacheStorage);o.argumentLengthCheck(arguments,1,{header:"CacheStorage.has"});A=o.converters.DOMString(A);return this.#s.has(A)}async open(A){o.brandCheck(this,CacheStorage);o.argumentLengthCheck(arguments,1,{header:"CacheStorage.open"});A=o.converters.DOMString(A);if(this.#s.has(A)){const e=this.#s.get(A);return new s(r,e)}const e=[];this.#s.set(A,e);return new s(r,e)}async delete(A){o.brandCheck(this,CacheStorage);o.argumentLengthCheck(arguments,1,{header:"CacheStorage.delete"});A=o.converters.DOMString(A);return this.#s.delete(A)}async keys(){o.brandCheck(this,CacheStorage);const A=this.#s.keys();return[...A]}}Object.defineProperties(CacheStorage.prototype,{[Symbol.toStringTag]:{value:"CacheStorage",configurable:true},match:n,has:n,open:n,delete:n,keys:n});A.exports={CacheStorage:CacheStorage}},38:(A,e,t)=>{"use strict";A.exports={kConstruct:t(5817).kConstruct}},2603:(A,e,t)=>{"use strict";const r=t(2613);const{URLSerializer:s}=t(1620);const{isValidHeaderName:o}=t(4901);function urlEquals(A,e,t=false){const r=s(A,t);const o=s(e,t);return r===o}function fieldValues(A){r(A!==null);const e=[];for(let t of A.split(",")){t=t.trim();if(!t.length){continue}else if(!o(t)){continue}e.push(t)}return e}A.exports={urlEquals:urlEquals,fieldValues:fieldValues}},4291:(A,e,t)=>{"use strict";const r=t(2613);const s=t(9278);const o=t(8611);const{pipeline:n}=t(2203);const i=t(7586);const a=t(7930);const E=t(2261);const g=t(4743);const{RequestContentLengthMismatchError:c,ResponseContentLengthMismatchError:Q,InvalidArgumentError:C,RequestAbortedError:B,HeadersTimeoutError:I,HeadersOverflowError:h,SocketError:l,InformationalError:u,BodyTimeoutError:d,HTTPParserError:f,ResponseExceededMaxSizeError:p,ClientDestroyedError:y}=t(1369);const R=t(4890);const{kUrl:D,kReset:w,kServerName:k,kClient:m,kBusy:b,kParser:F,kConnect:S,kBlocking:N,kResuming:U,kRunning:L,kPending:M,kSize:T,kWriting:Y,kQueue:H,kConnected:J,kConnecting:G,kNeedDrain:v,kNoRef:V,kKeepAliveDefaultTimeout:x,kHostHeader:O,kPendingIdx:P,kRunningIdx:W,kError:q,kPipelining:_,kSocket:Z,kKeepAliveTimeoutValue:X,kMaxHeadersSize:j,kKeepAliveMaxTimeout:K,kKeepAliveTimeoutThreshold:z,kHeadersTimeout:$,kBodyTimeout:AA,kStrictContentLength:eA,kConnector:tA,kMaxRedirections:rA,kMaxRequests:sA,kCounter:oA,kClose:nA,kDestroy:iA,kDispatch:aA,kInterceptors:EA,kLocalAddress:gA,kMaxResponseSize:cA,kHTTPConnVersion:QA,kHost:CA,kHTTP2Session:BA,kHTTP2SessionState:IA,kHTTP2BuildRequest:hA,kHTTP2CopyHeaders:lA,kHTTP1BuildRequest:uA}=t(5817);let dA;try{dA=t(5675)}catch{dA={constants:{}}}const{constants:{HTTP2_HEADER_AUTHORITY:fA,HTTP2_HEADER_METHOD:pA,HTTP2_HEADER_PATH:yA,HTTP2_HEADER_SCHEME:RA,HTTP2_HEADER_CONTENT_LENGTH:DA,HTTP2_HEADER_EXPECT:wA,HTTP2_HEADER_STATUS:kA}}=dA;let mA=false;const bA=Buffer[Symbol.species];const FA=Symbol("kClosedResolve");const SA={};try{const A=t(1637);SA.sendHeaders=A.channel("undici:client:sendHeaders");SA.beforeConnect=A.channel("undici:client:beforeConnect");SA.connectError=A.channel("undici:client:connectError");SA.connected=A.channel("undici:client:connected")}catch{SA.sendHeaders={hasSubscribers:false};SA.beforeConnect={hasSubscribers:false};SA.connectError={hasSubscribers:false};SA.connected={hasSubscribers:false}}class Client extends g{constructor(A,{interceptors:e,maxHeaderSize:t,headersTimeout:r,socketTimeout:n,requestTimeout:a,connectTimeout:E,bodyTimeout:g,idleTimeout:c,keepAlive:Q,keepAliveTimeout:B,maxKeepAliveTimeout:I,keepAliveMaxTimeout:h,keepAliveTimeoutThreshold:l,socketPath:u,pipelining:d,tls:f,strictContentLength:p,maxCachedSessions:y,maxRedirections:w,connect:m,maxRequestsPerClient:b,localAddress:F,maxResponseSize:S,autoSelectFamily:N,autoSelectFamilyAttemptTimeout:L,allowH2:M,maxConcurrentStreams:T}={}){super();if(Q!==undefined){throw new C("unsupported keepAlive, use pipelining=0 instead")}if(n!==undefined){throw new C("unsupported socketTimeout, use headersTimeout & bodyTimeout instead")}if(a!==undefined){throw new C("unsupported requestTimeout, use headersTimeout & bodyTimeout instead")}if(c!==undefined){throw new C("unsupported idleTimeout, use keepAliveTimeout instead")}if(I!==undefined){throw new C("unsupported maxKeepAliveTimeout, use keepAliveMaxTimeout instead")}if(t!=null&&!Number.isFinite(t)){throw new C("invalid maxHeaderSize")}if(u!=null&&typeof u!=="string"){throw new C("invalid socketPath")}if(E!=null&&(!Number.isFinite(E)||E<0)){throw new C("invalid connectTimeout")}if(B!=null&&(!Number.isFinite(B)||B<=0)){throw new C("invalid keepAliveTimeout")}if(h!=null&&(!Number.isFinite(h)||h<=0)){throw new C("invalid keepAliveMaxTimeout")}if(l!=null&&!Number.isFinite(l)){throw new C("invalid keepAliveTimeoutThreshold")}if(r!=null&&(!Number.isInteger(r)||r<0)){throw new C("headersTimeout must be a positive integer or zero")}if(g!=null&&(!Number.isInteger(g)||g<0)){throw new C("bodyTimeout must be a positive integer or zero")}if(m!=null&&typeof m!=="function"&&typeof m!=="object"){throw new C("connect must be a function or an object")}if(w!=null&&(!Number.isInteger(w)||w<0)){throw new C("maxRedirections must be a positive number")}if(b!=null&&(!Number.isInteger(b)||b<0)){throw new C("maxRequestsPerClient must be a positive number")}if(F!=null&&(typeof F!=="string"||s.isIP(F)===0)){throw new C("localAddress must be valid string IP address")}if(S!=null&&(!Number.isInteger(S)||S<-1)){throw new C("maxResponseSize must be a positive number")}if(L!=null&&(!Number.isInteger(L)||L<-1)){throw new C("autoSelectFamilyAttemptTimeout must be a positive number")}if(M!=null&&typeof M!=="boolean"){throw new C("allowH2 must be a valid boolean value")}if(T!=null&&(typeof T!=="number"||T<1)){throw new C("maxConcurrentStreams must be a possitive integer, greater than 0")}if(typeof m!=="function"){m=R({...f,maxCachedSessions:y,allowH2:M,socketPath:u,timeout:E,...i.nodeHasAutoSelectFamily&&N?{autoSelectFamily:N,autoSelectFamilyAttemptTimeout:L}:undefined,...m})}this[EA]=e&&e.Client&&Array.isArray(e.Client)?e.Client:[UA({maxRedirections:w})];this[D]=i.parseOrigin(A);this[tA]=m;this[Z]=null;this[_]=d!=null?d:1;this[j]=t||o.maxHeaderSize;this[x]=B==null?4e3:B;this[K]=h==null?6e5:h;this[z]=l==null?1e3:l;this[X]=this[x];this[k]=null;this[gA]=F!=null?F:null;this[U]=0;this[v]=0;this[O]=`host: ${this[D].hostname}${this[D].port?`:${this[D].port}`:""}\r\n`;this[AA]=g!=null?g:3e5;this[$]=r!=null?r:3e5;this[eA]=p==null?true:p;this[rA]=w;this[sA]=b;this[FA]=null;this[cA]=S>-1?S:-1;this[QA]="h1";this[BA]=null;this[IA]=!M?null:{openStreams:0,maxConcurrentStreams:T!=null?T:100};this[CA]=`${this[D].hostname}${this[D].port?`:${this[D].port}`:""}`;this[H]=[];this[W]=0;this[P]=0}get pipelining(){return this[_]}set pipelining(A){this[_]=A;resume(this,true)}get[M](){return this[H].length-this[P]}get[L](){return this[P]-this[W]}get[T](){return this[H].length-this[W]}get[J](){return!!this[Z]&&!this[G]&&!this[Z].destroyed}get[b](){const A=this[Z];return A&&(A[w]||A[Y]||A[N])||this[T]>=(this[_]||1)||this[M]>0}[S](A){connect(this);this.once("connect",A)}[aA](A,e){const t=A.origin||this[D].origin;const r=this[QA]==="h2"?E[hA](t,A,e):E[uA](t,A,e);this[H].push(r);if(this[U]){}else if(i.bodyLength(r.body)==null&&i.isIterable(r.body)){this[U]=1;process.nextTick(resume,this)}else{resume(this,true)}if(this[U]&&this[v]!==2&&this[b]){this[v]=2}return this[v]<2}async[nA](){return new Promise((A=>{if(!this[T]){A(null)}else{this[FA]=A}}))}async[iA](A){return new Promise((e=>{const t=this[H].splice(this[P]);for(let e=0;e<t.length;e++){const r=t[e];errorRequest(this,r,A)}const callback=()=>{if(this[FA]){this[FA]();this[FA]=null}e()};if(this[BA]!=null){i.destroy(this[BA],A);this[BA]=null;this[IA]=null}if(!this[Z]){queueMicrotask(callback)}else{i.destroy(this[Z].on("close",callback),A)}resume(this)}))}}function onHttp2SessionError(A){r(A.code!=="ERR_TLS_CERT_ALTNAME_INVALID");this[Z][q]=A;onError(this[m],A)}function onHttp2FrameError(A,e,t){const r=new u(`HTTP/2: "frameError" received - type ${A}, code ${e}`);if(t===0){this[Z][q]=r;onError(this[m],r)}}function onHttp2SessionEnd(){i.destroy(this,new l("other side closed"));i.destroy(this[Z],new l("other side closed"))}function onHTTP2GoAway(A){const e=this[m];const t=new u(`HTTP/2: "GOAWAY" frame received with code ${A}`);e[Z]=null;e[BA]=null;if(e.destroyed){r(this[M]===0);const A=e[H].splice(e[W]);for(let e=0;e<A.length;e++){const r=A[e];errorRequest(this,r,t)}}else if(e[L]>0){const A=e[H][e[W]];e[H][e[W]++]=null;errorRequest(e,A,t)}e[P]=e[W];r(e[L]===0);e.emit("disconnect",e[D],[e],t);resume(e)}const NA=t(5418);const UA=t(4193);const LA=Buffer.alloc(0);async function lazyllhttp(){const A=process.env.JEST_WORKER_ID?t(4896):undefined;let e;try{e=await WebAssembly.compile(Buffer.from(t(9096),"base64"))}catch(r){e=await WebAssembly.compile(Buffer.from(A||t(4896),"base64"))}return await WebAssembly.instantiate(e,{env:{wasm_on_url:(A,e,t)=>0,wasm_on_status:(A,e,t)=>{r.strictEqual(YA.ptr,A);const s=e-GA+HA.byteOffset;return YA.onStatus(new bA(HA.buffer,s,t))||0},wasm_on_message_begin:A=>{r.strictEqual(YA.ptr,A);return YA.onMessageBegin()||0},wasm_on_header_field:(A,e,t)=>{r.strictEqual(YA.ptr,A);const s=e-GA+HA.byteOffset;return YA.onHeaderField(new bA(HA.buffer,s,t))||0},wasm_on_header_value:(A,e,t)=>{r.strictEqual(YA.ptr,A);const s=e-GA+HA.byteOffset;return YA.onHeaderValue(new bA(HA.buffer,s,t))||0},wasm_on_headers_complete:(A,e,t,s)=>{r.strictEqual(YA.ptr,A);return YA.onHeadersComplete(e,Boolean(t),Boolean(s))||0},wasm_on_body:(A,e,t)=>{r.strictEqual(YA.ptr,A);const s=e-GA+HA.byteOffset;return YA.onBody(new bA(HA.buffer,s,t))||0},wasm_on_message_complete:A=>{r.strictEqual(YA.ptr,A);return YA.onMessageComplete()||0}}})}let MA=null;let TA=lazyllhttp();TA.catch();let YA=null;let HA=null;let JA=0;let GA=null;const vA=1;const VA=2;const xA=3;class Parser{constructor(A,e,{exports:t}){r(Number.isFinite(A[j])&&A[j]>0);this.llhttp=t;this.ptr=this.llhttp.llhttp_alloc(NA.TYPE.RESPONSE);this.client=A;this.socket=e;this.timeout=null;this.timeoutValue=null;this.timeoutType=null;this.statusCode=null;this.statusText="";this.upgrade=false;this.headers=[];this.headersSize=0;this.headersMaxSize=A[j];this.shouldKeepAlive=false;this.paused=false;this.resume=this.resume.bind(this);this.bytesRead=0;this.keepAlive="";this.contentLength="";this.connection="";this.maxResponseSize=A[cA]}setTimeout(A,e){this.timeoutType=e;if(A!==this.timeoutValue){a.clearTimeout(this.timeout);if(A){this.timeout=a.setTimeout(onParserTimeout,A,this);if(this.timeout.unref){this.timeout.unref()}}else{this.timeout=null}this.timeoutValue=A}else if(this.timeout){if(this.timeout.refresh){this.timeout.refresh()}}}resume(){if(this.socket.destroyed||!this.paused){return}r(this.ptr!=null);r(YA==null);this.llhttp.llhttp_resume(this.ptr);r(this.timeoutType===VA);if(this.timeout){if(this.timeout.refresh){this.timeout.refresh()}}this.paused=false;this.execute(this.socket.read()||LA);this.readMore()}readMore(){while(!this.paused&&this.ptr){const A=this.socket.read();if(A===null){break}this.execute(A)}}execute(A){r(this.ptr!=null);r(YA==null);r(!this.paused);const{socket:e,llhttp:t}=this;if(A.length>JA){if(GA){t.free(GA)}JA=Math.ceil(A.length/4096)*4096;GA=t.malloc(JA)}new Uint8Array(t.memory.buffer,GA,JA).set(A);try{let r;try{HA=A;YA=this;r=t.llhttp_execute(this.ptr,GA,A.length)}catch(A){throw A}finally{YA=null;HA=null}const s=t.llhttp_get_error_pos(this.ptr)-GA;if(r===NA.ERROR.PAUSED_UPGRADE){this.onUpgrade(A.slice(s))}else if(r===NA.ERROR.PAUSED){this.paused=true;e.unshift(A.slice(s))}else if(r!==NA.ERROR.OK){const e=t.llhttp_get_error_reason(this.ptr);let o="";if(e){const A=new Uint8Array(t.memory.buffer,e).indexOf(0);o="Response does not match the HTTP/1.1 protocol ("+Buffer.from(t.memory.buffer,e,A).toString()+")"}throw new f(o,NA.ERROR[r],A.slice(s))}}catch(A){i.destroy(e,A)}}destroy(){r(this.ptr!=null);r(YA==null);this.llhttp.llhttp_free(this.ptr);this.ptr=null;a.clearTimeout(this.timeout);this.timeout=null;this.timeoutValue=null;this.timeoutType=null;this.paused=false}onStatus(A){this.statusText=A.toString()}onMessageBegin(){const{socket:A,client:e}=this;if(A.destroyed){return-1}const t=e[H][e[W]];if(!t){return-1}}onHeaderField(A){const e=this.headers.length;if((e&1)===0){this.headers.push(A)}else{this.headers[e-1]=Buffer.concat([this.headers[e-1],A])}this.trackHeader(A.length)}onHeaderValue(A){let e=this.headers.length;if((e&1)===1){this.headers.push(A);e+=1}else{this.headers[e-1]=Buffer.concat([this.headers[e-1],A])}const t=this.headers[e-2];if(t.length===10&&t.toString().toLowerCase()==="keep-alive"){this.keepAlive+=A.toString()}else if(t.length===10&&t.toString().toLowerCase()==="connection"){this.connection+=A.toString()}else if(t.length===14&&t.toString().toLowerCase()==="content-length"){this.contentLength+=A.toString()}this.trackHeader(A.length)}trackHeader(A){this.headersSize+=A;if(this.headersSize>=this.headersMaxSize){i.destroy(this.socket,new h)}}onUpgrade(A){const{upgrade:e,client:t,socket:s,headers:o,statusCode:n}=this;r(e);const a=t[H][t[W]];r(a);r(!s.destroyed);r(s===t[Z]);r(!this.paused);r(a.upgrade||a.method==="CONNECT");this.statusCode=null;this.statusText="";this.shouldKeepAlive=null;r(this.headers.length%2===0);this.headers=[];this.headersSize=0;s.unshift(A);s[F].destroy();s[F]=null;s[m]=null;s[q]=null;s.removeListener("error",onSocketError).removeListener("readable",onSocketReadable).removeListener("end",onSocketEnd).removeListener("close",onSocketClose);t[Z]=null;t[H][t[W]++]=null;t.emit("disconnect",t[D],[t],new u("upgrade"));try{a.onUpgrade(n,o,s)}catch(A){i.destroy(s,A)}resume(t)}onHeadersComplete(A,e,t){const{client:s,socket:o,headers:n,statusText:a}=this;if(o.destroyed){return-1}const E=s[H][s[W]];if(!E){return-1}r(!this.upgrade);r(this.statusCode<200);if(A===100){i.destroy(o,new l("bad response",i.getSocketInfo(o)));return-1}if(e&&!E.upgrade){i.destroy(o,new l("bad upgrade",i.getSocketInfo(o)));return-1}r.strictEqual(this.timeoutType,vA);this.statusCode=A;this.shouldKeepAlive=t||E.method==="HEAD"&&!o[w]&&this.connection.toLowerCase()==="keep-alive";if(this.statusCode>=200){const A=E.bodyTimeout!=null?E.bodyTimeout:s[AA];this.setTimeout(A,VA)}else if(this.timeout){if(this.timeout.refresh){this.timeout.refresh()}}if(E.method==="CONNECT"){r(s[L]===1);this.upgrade=true;return 2}if(e){r(s[L]===1);this.upgrade=true;return 2}r(this.headers.length%2===0);this.headers=[];this.headersSize=0;if(this.shouldKeepAlive&&s[_]){const A=this.keepAlive?i.parseKeepAliveTimeout(this.keepAlive):null;if(A!=null){const e=Math.min(A-s[z],s[K]);if(e<=0){o[w]=true}else{s[X]=e}}else{s[X]=s[x]}}else{o[w]=true}const g=E.onHeaders(A,n,this.resume,a)===false;if(E.aborted){return-1}if(E.method==="HEAD"){return 1}if(A<200){return 1}if(o[N]){o[N]=false;resume(s)}return g?NA.ERROR.PAUSED:0}onBody(A){const{client:e,socket:t,statusCode:s,maxResponseSize:o}=this;if(t.destroyed){return-1}const n=e[H][e[W]];r(n);r.strictEqual(this.timeoutType,VA);if(this.timeout){if(this.timeout.refresh){this.timeout.refresh()}}r(s>=200);if(o>-1&&this.bytesRead+A.length>o){i.destroy(t,new p);return-1}this.bytesRead+=A.length;if(n.onData(A)===false){return NA.ERROR.PAUSED}}onMessageComplete(){const{client:A,socket:e,statusCode:t,upgrade:s,headers:o,contentLength:n,bytesRead:a,shouldKeepAlive:E}=this;if(e.destroyed&&(!t||E)){return-1}if(s){return}const g=A[H][A[W]];r(g);r(t>=100);this.statusCode=null;this.statusText="";this.bytesRead=0;this.contentLength="";this.keepAlive="";this.connection="";r(this.headers.length%2===0);this.headers=[];this.headersSize=0;if(t<200){return}if(g.method!=="HEAD"&&n&&a!==parseInt(n,10)){i.destroy(e,new Q);return-1}g.onComplete(o);A[H][A[W]++]=null;if(e[Y]){r.strictEqual(A[L],0);i.destroy(e,new u("reset"));return NA.ERROR.PAUSED}else if(!E){i.destroy(e,new u("reset"));return NA.ERROR.PAUSED}else if(e[w]&&A[L]===0){i.destroy(e,new u("reset"));return NA.ERROR.PAUSED}else if(A[_]===1){setImmediate(resume,A)}else{resume(A)}}}function onParserTimeout(A){const{socket:e,timeoutType:t,client:s}=A;if(t===vA){if(!e[Y]||e.writableNeedDrain||s[L]>1){r(!A.paused,"cannot be paused while waiting for headers");i.destroy(e,new I)}}else if(t===VA){if(!A.paused){i.destroy(e,new d)}}else if(t===xA){r(s[L]===0&&s[X]);i.destroy(e,new u("socket idle timeout"))}}function onSocketReadable(){const{[F]:A}=this;if(A){A.readMore()}}function onSocketError(A){const{[m]:e,[F]:t}=this;r(A.code!=="ERR_TLS_CERT_ALTNAME_INVALID");if(e[QA]!=="h2"){if(A.code==="ECONNRESET"&&t.statusCode&&!t.shouldKeepAlive){t.onMessageComplete();return}}this[q]=A;onError(this[m],A)}function onError(A,e){if(A[L]===0&&e.code!=="UND_ERR_INFO"&&e.code!=="UND_ERR_SOCKET"){r(A[P]===A[W]);const t=A[H].splice(A[W]);for(let r=0;r<t.length;r++){const s=t[r];errorRequest(A,s,e)}r(A[T]===0)}}function onSocketEnd(){const{[F]:A,[m]:e}=this;if(e[QA]!=="h2"){if(A.statusCode&&!A.shouldKeepAlive){A.onMessageComplete();return}}i.destroy(this,new l("other side closed",i.getSocketInfo(this)))}function onSocketClose(){const{[m]:A,[F]:e}=this;if(A[QA]==="h1"&&e){if(!this[q]&&e.statusCode&&!e.shouldKeepAlive){e.onMessageComplete()}this[F].destroy();this[F]=null}const t=this[q]||new l("closed",i.getSocketInfo(this));A[Z]=null;if(A.destroyed){r(A[M]===0);const e=A[H].splice(A[W]);for(let r=0;r<e.length;r++){const s=e[r];errorRequest(A,s,t)}}else if(A[L]>0&&t.code!=="UND_ERR_INFO"){const e=A[H][A[W]];A[H][A[W]++]=null;errorRequest(A,e,t)}A[P]=A[W];r(A[L]===0);A.emit("disconnect",A[D],[A],t);resume(A)}async function connect(A){r(!A[G]);r(!A[Z]);let{host:e,hostname:t,protocol:o,port:n}=A[D];if(t[0]==="["){const A=t.indexOf("]");r(A!==-1);const e=t.substring(1,A);r(s.isIP(e));t=e}A[G]=true;if(SA.beforeConnect.hasSubscribers){SA.beforeConnect.publish({connectParams:{host:e,hostname:t,protocol:o,port:n,servername:A[k],localAddress:A[gA]},connector:A[tA]})}try{const s=await new Promise(((r,s)=>{A[tA]({host:e,hostname:t,protocol:o,port:n,servername:A[k],localAddress:A[gA]},((A,e)=>{if(A){s(A)}else{r(e)}}))}));if(A.destroyed){i.destroy(s.on("error",(()=>{})),new y);return}A[G]=false;r(s);const a=s.alpnProtocol==="h2";if(a){if(!mA){mA=true;process.emitWarning("H2 support is experimental, expect them to change at any time.",{code:"UNDICI-H2"})}const e=dA.connect(A[D],{createConnection:()=>s,peerMaxConcurrentStreams:A[IA].maxConcurrentStreams});A[QA]="h2";e[m]=A;e[Z]=s;e.on("error",onHttp2SessionError);e.on("frameError",onHttp2FrameError);e.on("end",onHttp2SessionEnd);e.on("goaway",onHTTP2GoAway);e.on("close",onSocketClose);e.unref();A[BA]=e;s[BA]=e}else{if(!MA){MA=await TA;TA=null}s[V]=false;s[Y]=false;s[w]=false;s[N]=false;s[F]=new Parser(A,s,MA)}s[oA]=0;s[sA]=A[sA];s[m]=A;s[q]=null;s.on("error",onSocketError).on("readable",onSocketReadable).on("end",onSocketEnd).on("close",onSocketClose);A[Z]=s;if(SA.connected.hasSubscribers){SA.connected.publish({connectParams:{host:e,hostname:t,protocol:o,port:n,servername:A[k],localAddress:A[gA]},connector:A[tA],socket:s})}A.emit("connect",A[D],[A])}catch(s){if(A.destroyed){return}A[G]=false;if(SA.connectError.hasSubscribers){SA.connectError.publish({connectParams:{host:e,hostname:t,protocol:o,port:n,servername:A[k],localAddress:A[gA]},connector:A[tA],error:s})}if(s.code==="ERR_TLS_CERT_ALTNAME_INVALID"){r(A[L]===0);while(A[M]>0&&A[H][A[P]].servername===A[k]){const e=A[H][A[P]++];errorRequest(A,e,s)}}else{onError(A,s)}A.emit("connectionError",A[D],[A],s)}resume(A)}function emitDrain(A){A[v]=0;A.emit("drain",A[D],[A])}function resume(A,e){if(A[U]===2){return}A[U]=2;_resume(A,e);A[U]=0;if(A[W]>256){A[H].splice(0,A[W]);A[P]-=A[W];A[W]=0}}function _resume(A,e){while(true){if(A.destroyed){r(A[M]===0);return}if(A[FA]&&!A[T]){A[FA]();A[FA]=null;return}const t=A[Z];if(t&&!t.destroyed&&t.alpnProtocol!=="h2"){if(A[T]===0){if(!t[V]&&t.unref){t.unref();t[V]=true}}else if(t[V]&&t.ref){t.ref();t[V]=false}if(A[T]===0){if(t[F].timeoutType!==xA){t[F].setTimeout(A[X],xA)}}else if(A[L]>0&&t[F].statusCode<200){if(t[F].timeoutType!==vA){const e=A[H][A[W]];const r=e.headersTimeout!=null?e.headersTimeout:A[$];t[F].setTimeout(r,vA)}}}if(A[b]){A[v]=2}else if(A[v]===2){if(e){A[v]=1;process.nextTick(emitDrain,A)}else{emitDrain(A)}continue}if(A[M]===0){return}if(A[L]>=(A[_]||1)){return}const s=A[H][A[P]];if(A[D].protocol==="https:"&&A[k]!==s.servername){if(A[L]>0){return}A[k]=s.servername;if(t&&t.servername!==s.servername){i.destroy(t,new u("servername changed"));return}}if(A[G]){return}if(!t&&!A[BA]){connect(A);return}if(t.destroyed||t[Y]||t[w]||t[N]){return}if(A[L]>0&&!s.idempotent){return}if(A[L]>0&&(s.upgrade||s.method==="CONNECT")){return}if(A[L]>0&&i.bodyLength(s.body)!==0&&(i.isStream(s.body)||i.isAsyncIterable(s.body))){return}if(!s.aborted&&write(A,s)){A[P]++}else{A[H].splice(A[P],1)}}}function shouldSendContentLength(A){return A!=="GET"&&A!=="HEAD"&&A!=="OPTIONS"&&A!=="TRACE"&&A!=="CONNECT"}function write(A,e){if(A[QA]==="h2"){writeH2(A,A[BA],e);return}const{body:t,method:s,path:o,host:n,upgrade:a,headers:E,blocking:g,reset:Q}=e;const C=s==="PUT"||s==="POST"||s==="PATCH";if(t&&typeof t.read==="function"){t.read(0)}const I=i.bodyLength(t);let h=I;if(h===null){h=e.contentLength}if(h===0&&!C){h=null}if(shouldSendContentLength(s)&&h>0&&e.contentLength!==null&&e.contentLength!==h){if(A[eA]){errorRequest(A,e,new c);return false}process.emitWarning(new c)}const l=A[Z];try{e.onConnect((t=>{if(e.aborted||e.completed){return}errorRequest(A,e,t||new B);i.destroy(l,new u("aborted"))}))}catch(t){errorRequest(A,e,t)}if(e.aborted){return false}if(s==="HEAD"){l[w]=true}if(a||s==="CONNECT"){l[w]=true}if(Q!=null){l[w]=Q}if(A[sA]&&l[oA]++>=A[sA]){l[w]=true}if(g){l[N]=true}let d=`${s} ${o} HTTP/1.1\r\n`;if(typeof n==="string"){d+=`host: ${n}\r\n`}else{d+=A[O]}if(a){d+=`connection: upgrade\r\nupgrade: ${a}\r\n`}else if(A[_]&&!l[w]){d+="connection: keep-alive\r\n"}else{d+="connection: close\r\n"}if(E){d+=E}if(SA.sendHeaders.hasSubscribers){SA.sendHeaders.publish({request:e,headers:d,socket:l})}if(!t||I===0){if(h===0){l.write(`${d}content-length: 0\r\n\r\n`,"latin1")}else{r(h===null,"no body must not have content length");l.write(`${d}\r\n`,"latin1")}e.onRequestSent()}else if(i.isBuffer(t)){r(h===t.byteLength,"buffer body must have content length");l.cork();l.write(`${d}content-length: ${h}\r\n\r\n`,"latin1");l.write(t);l.uncork();e.onBodySent(t);e.onRequestSent();if(!C){l[w]=true}}else if(i.isBlobLike(t)){if(typeof t.stream==="function"){writeIterable({body:t.stream(),client:A,request:e,socket:l,contentLength:h,header:d,expectsPayload:C})}else{writeBlob({body:t,client:A,request:e,socket:l,contentLength:h,header:d,expectsPayload:C})}}else if(i.isStream(t)){writeStream({body:t,client:A,request:e,socket:l,contentLength:h,header:d,expectsPayload:C})}else if(i.isIterable(t)){writeIterable({body:t,client:A,request:e,socket:l,contentLength:h,header:d,expectsPayload:C})}else{r(false)}return true}function writeH2(A,e,t){const{body:s,method:o,path:n,host:a,upgrade:g,expectContinue:Q,signal:C,headers:I}=t;let h;if(typeof I==="string")h=E[lA](I.trim());else h=I;if(g){errorRequest(A,t,new Error("Upgrade not supported for H2"));return false}try{t.onConnect((e=>{if(t.aborted||t.completed){return}errorRequest(A,t,e||new B)}))}catch(e){errorRequest(A,t,e)}if(t.aborted){return false}let l;const d=A[IA];h[fA]=a||A[CA];h[pA]=o;if(o==="CONNECT"){e.ref();l=e.request(h,{endStream:false,signal:C});if(l.id&&!l.pending){t.onUpgrade(null,null,l);++d.openStreams}else{l.once("ready",(()=>{t.onUpgrade(null,null,l);++d.openStreams}))}l.once("close",(()=>{d.openStreams-=1;if(d.openStreams===0)e.unref()}));return true}h[yA]=n;h[RA]="https";const f=o==="PUT"||o==="POST"||o==="PATCH";if(s&&typeof s.read==="function"){s.read(0)}let p=i.bodyLength(s);if(p==null){p=t.contentLength}if(p===0||!f){p=null}if(shouldSendContentLength(o)&&p>0&&t.contentLength!=null&&t.contentLength!==p){if(A[eA]){errorRequest(A,t,new c);return false}process.emitWarning(new c)}if(p!=null){r(s,"no body must not have content length");h[DA]=`${p}`}e.ref();const y=o==="GET"||o==="HEAD";if(Q){h[wA]="100-continue";l=e.request(h,{endStream:y,signal:C});l.once("continue",writeBodyH2)}else{l=e.request(h,{endStream:y,signal:C});writeBodyH2()}++d.openStreams;l.once("response",(A=>{const{[kA]:e,...r}=A;if(t.onHeaders(Number(e),r,l.resume.bind(l),"")===false){l.pause()}}));l.once("end",(()=>{t.onComplete([])}));l.on("data",(A=>{if(t.onData(A)===false){l.pause()}}));l.once("close",(()=>{d.openStreams-=1;if(d.openStreams===0){e.unref()}}));l.once("error",(function(e){if(A[BA]&&!A[BA].destroyed&&!this.closed&&!this.destroyed){d.streams-=1;i.destroy(l,e)}}));l.once("frameError",((e,r)=>{const s=new u(`HTTP/2: "frameError" received - type ${e}, code ${r}`);errorRequest(A,t,s);if(A[BA]&&!A[BA].destroyed&&!this.closed&&!this.destroyed){d.streams-=1;i.destroy(l,s)}}));return true;function writeBodyH2(){if(!s){t.onRequestSent()}else if(i.isBuffer(s)){r(p===s.byteLength,"buffer body must have content length");l.cork();l.write(s);l.uncork();l.end();t.onBodySent(s);t.onRequestSent()}else if(i.isBlobLike(s)){if(typeof s.stream==="function"){writeIterable({client:A,request:t,contentLength:p,h2stream:l,expectsPayload:f,body:s.stream(),socket:A[Z],header:""})}else{writeBlob({body:s,client:A,request:t,contentLength:p,expectsPayload:f,h2stream:l,header:"",socket:A[Z]})}}else if(i.isStream(s)){writeStream({body:s,client:A,request:t,contentLength:p,expectsPayload:f,socket:A[Z],h2stream:l,header:""})}else if(i.isIterable(s)){writeIterable({body:s,client:A,request:t,contentLength:p,expectsPayload:f,header:"",h2stream:l,socket:A[Z]})}else{r(false)}}}function writeStream({h2stream:A,body:e,client:t,request:s,socket:o,contentLength:a,header:E,expectsPayload:g}){r(a!==0||t[L]===0,"stream body cannot be pipelined");if(t[QA]==="h2"){const C=n(e,A,(t=>{if(t){i.destroy(e,t);i.destroy(A,t)}else{s.onRequestSent()}}));C.on("data",onPipeData);C.once("end",(()=>{C.removeListener("data",onPipeData);i.destroy(C)}));function onPipeData(A){s.onBodySent(A)}return}let c=false;const Q=new AsyncWriter({socket:o,request:s,contentLength:a,client:t,expectsPayload:g,header:E});const onData=function(A){if(c){return}try{if(!Q.write(A)&&this.pause){this.pause()}}catch(A){i.destroy(this,A)}};const onDrain=function(){if(c){return}if(e.resume){e.resume()}};const onAbort=function(){if(c){return}const A=new B;queueMicrotask((()=>onFinished(A)))};const onFinished=function(A){if(c){return}c=true;r(o.destroyed||o[Y]&&t[L]<=1);o.off("drain",onDrain).off("error",onFinished);e.removeListener("data",onData).removeListener("end",onFinished).removeListener("error",onFinished).removeListener("close",onAbort);if(!A){try{Q.end()}catch(e){A=e}}Q.destroy(A);if(A&&(A.code!=="UND_ERR_INFO"||A.message!=="reset")){i.destroy(e,A)}else{i.destroy(e)}};e.on("data",onData).on("end",onFinished).on("error",onFinished).on("close",onAbort);if(e.resume){e.resume()}o.on("drain",onDrain).on("error",onFinished)}async function writeBlob({h2stream:A,body:e,client:t,request:s,socket:o,contentLength:n,header:a,expectsPayload:E}){r(n===e.size,"blob body must have content length");const g=t[QA]==="h2";try{if(n!=null&&n!==e.size){throw new c}const r=Buffer.from(await e.arrayBuffer());if(g){A.cork();A.write(r);A.uncork()}else{o.cork();o.write(`${a}content-length: ${n}\r\n\r\n`,"latin1");o.write(r);o.uncork()}s.onBodySent(r);s.onRequestSent();if(!E){o[w]=true}resume(t)}catch(e){i.destroy(g?A:o,e)}}async function writeIterable({h2stream:A,body:e,client:t,request:s,socket:o,contentLength:n,header:i,expectsPayload:a}){r(n!==0||t[L]===0,"iterator body cannot be pipelined");let E=null;function onDrain(){if(E){const A=E;E=null;A()}}const waitForDrain=()=>new Promise(((A,e)=>{r(E===null);if(o[q]){e(o[q])}else{E=A}}));if(t[QA]==="h2"){A.on("close",onDrain).on("drain",onDrain);try{for await(const t of e){if(o[q]){throw o[q]}const e=A.write(t);s.onBodySent(t);if(!e){await waitForDrain()}}}catch(e){A.destroy(e)}finally{s.onRequestSent();A.end();A.off("close",onDrain).off("drain",onDrain)}return}o.on("close",onDrain).on("drain",onDrain);const g=new AsyncWriter({socket:o,request:s,contentLength:n,client:t,expectsPayload:a,header:i});try{for await(const A of e){if(o[q]){throw o[q]}if(!g.write(A)){await waitForDrain()}}g.end()}catch(A){g.destroy(A)}finally{o.off("close",onDrain).off("drain",onDrain)}}class AsyncWriter{constructor({socket:A,request:e,contentLength:t,client:r,expectsPayload:s,header:o}){this.socket=A;this.request=e;this.contentLength=t;this.client=r;this.bytesWritten=0;this.expectsPayload=s;this.header=o;A[Y]=true}write(A){const{socket:e,request:t,contentLength:r,client:s,bytesWritten:o,expectsPayload:n,header:i}=this;if(e[q]){throw e[q]}if(e.destroyed){return false}const a=Buffer.byteLength(A);if(!a){return true}if(r!==null&&o+a>r){if(s[eA]){throw new c}process.emitWarning(new c)}e.cork();if(o===0){if(!n){e[w]=true}if(r===null){e.write(`${i}transfer-encoding: chunked\r\n`,"latin1")}else{e.write(`${i}content-length: ${r}\r\n\r\n`,"latin1")}}if(r===null){e.write(`\r\n${a.toString(16)}\r\n`,"latin1")}this.bytesWritten+=a;const E=e.write(A);e.uncork();t.onBodySent(A);if(!E){if(e[F].timeout&&e[F].timeoutType===vA){if(e[F].timeout.refresh){e[F].timeout.refresh()}}}return E}end(){const{socket:A,contentLength:e,client:t,bytesWritten:r,expectsPayload:s,header:o,request:n}=this;n.onRequestSent();A[Y]=false;if(A[q]){throw A[q]}if(A.destroyed){return}if(r===0){if(s){A.write(`${o}content-length: 0\r\n\r\n`,"latin1")}else{A.write(`${o}\r\n`,"latin1")}}else if(e===null){A.write("\r\n0\r\n\r\n","latin1")}if(e!==null&&r!==e){if(t[eA]){throw new c}else{process.emitWarning(new c)}}if(A[F].timeout&&A[F].timeoutType===vA){if(A[F].timeout.refresh){A[F].timeout.refresh()}}resume(t)}destroy(A){const{socket:e,client:t}=this;e[Y]=false;if(A){r(t[L]<=1,"pipeline should only contain this request");i.destroy(e,A)}}}function errorRequest(A,e,t){try{e.onError(t);r(e.aborted)}catch(t){A.emit("error",t)}}A.exports=Client},2132:(A,e,t)=>{"use strict";const{kConnected:r,kSize:s}=t(5817);class CompatWeakRef{constructor(A){this.value=A}deref(){return this.value[r]===0&&this.value[s]===0?undefined:this.value}}class CompatFinalizer{constructor(A){this.finalizer=A}register(A,e){if(A.on){A.on("disconnect",(()=>{if(A[r]===0&&A[s]===0){this.finalizer(e)}}))}}}A.exports=function(){if(process.env.NODE_V8_COVERAGE){return{WeakRef:CompatWeakRef,FinalizationRegistry:CompatFinalizer}}return{WeakRef:global.WeakRef||CompatWeakRef,FinalizationRegistry:global.FinalizationRegistry||CompatFinalizer}}},191:A=>{"use strict";const e=1024;const t=4096;A.exports={maxAttributeValueSize:e,maxNameValuePairSize:t}},1982:(A,e,t)=>{"use strict";const{parseSetCookie:r}=t(5277);const{stringify:s}=t(8608);const{webidl:o}=t(9040);const{Headers:n}=t(6939);function getCookies(A){o.argumentLengthCheck(arguments,1,{header:"getCookies"});o.brandCheck(A,n,{strict:false});const e=A.get("cookie");const t={};if(!e){return t}for(const A of e.split(";")){const[e,...r]=A.split("=");t[e.trim()]=r.join("=")}return t}function deleteCookie(A,e,t){o.argumentLengthCheck(arguments,2,{header:"deleteCookie"});o.brandCheck(A,n,{strict:false});e=o.converters.DOMString(e);t=o.converters.DeleteCookieAttributes(t);setCookie(A,{name:e,value:"",expires:new Date(0),...t})}function getSetCookies(A){o.argumentLengthCheck(arguments,1,{header:"getSetCookies"});o.brandCheck(A,n,{strict:false});const e=A.getSetCookie();if(!e){return[]}return e.map((A=>r(A)))}function setCookie(A,e){o.argumentLengthCheck(arguments,2,{header:"setCookie"});o.brandCheck(A,n,{strict:false});e=o.converters.Cookie(e);const t=s(e);if(t){A.append("Set-Cookie",s(e))}}o.converters.DeleteCookieAttributes=o.dictionaryConverter([{converter:o.nullableConverter(o.converters.DOMString),key:"path",defaultValue:null},{converter:o.nullableConverter(o.converters.DOMString),key:"domain",defaultValue:null}]);o.converters.Cookie=o.dictionaryConverter([{converter:o.converters.DOMString,key:"name"},{converter:o.converters.DOMString,key:"value"},{converter:o.nullableConverter((A=>{if(typeof A==="number"){return o.converters["unsigned long long"](A)}return new Date(A)})),key:"expires",defaultValue:null},{converter:o.nullableConverter(o.converters["long long"]),key:"maxAge",defaultValue:null},{converter:o.nullableConverter(o.converters.DOMString),key:"domain",defaultValue:null},{converter:o.nullableConverter(o.converters.DOMString),key:"path",defaultValue:null},{converter:o.nullableConverter(o.converters.boolean),key:"secure",defaultValue:null},{converter:o.nullableConverter(o.converters.boolean),key:"httpOnly",defaultValue:null},{converter:o.converters.USVString,key:"sameSite",allowedValues:["Strict","Lax","None"]},{converter:o.sequenceConverter(o.converters.DOMString),key:"unparsed",defaultValue:[]}]);A.exports={getCookies:getCookies,deleteCookie:deleteCookie,getSetCookies:getSetCookies,setCookie:setCookie}},5277:(A,e,t)=>{"use strict";const{maxNameValuePairSize:r,maxAttributeValueSize:s}=t(191);const{isCTLExcludingHtab:o}=t(8608);const{collectASequenceOfCodePointsFast:n}=t(1620);const i=t(2613);function parseSetCookie(A){if(o(A)){return null}let e="";let t="";let s="";let i="";if(A.includes(";")){const r={position:0};e=n(";",A,r);t=A.slice(r.position)}else{e=A}if(!e.includes("=")){i=e}else{const A={position:0};s=n("=",e,A);i=e.slice(A.position+1)}s=s.trim();i=i.trim();if(s.length+i.length>r){return null}return{name:s,value:i,...parseUnparsedAttributes(t)}}function parseUnparsedAttributes(A,e={}){if(A.length===0){return e}i(A[0]===";");A=A.slice(1);let t="";if(A.includes(";")){t=n(";",A,{position:0});A=A.slice(t.length)}else{t=A;A=""}let r="";let o="";if(t.includes("=")){const A={position:0};r=n("=",t,A);o=t.slice(A.position+1)}else{r=t}r=r.trim();o=o.trim();if(o.length>s){return parseUnparsedAttributes(A,e)}const a=r.toLowerCase();if(a==="expires"){const A=new Date(o);e.expires=A}else if(a==="max-age"){const t=o.charCodeAt(0);if((t<48||t>57)&&o[0]!=="-"){return parseUnparsedAttributes(A,e)}if(!/^\d+$/.test(o)){return parseUnparsedAttributes(A,e)}const r=Number(o);e.maxAge=r}else if(a==="domain"){let A=o;if(A[0]==="."){A=A.slice(1)}A=A.toLowerCase();e.domain=A}else if(a==="path"){let A="";if(o.length===0||o[0]!=="/"){A="/"}else{A=o}e.path=A}else if(a==="secure"){e.secure=true}else if(a==="httponly"){e.httpOnly=true}else if(a==="samesite"){let A="Default";const t=o.toLowerCase();if(t.includes("none")){A="None"}if(t.includes("strict")){A="Strict"}if(t.includes("lax")){A="Lax"}e.sameSite=A}else{e.unparsed??=[];e.unparsed.push(`${r}=${o}`)}return parseUnparsedAttributes(A,e)}A.exports={parseSetCookie:parseSetCookie,parseUnparsedAttributes:parseUnparsedAttributes}},8608:A=>{"use strict";function isCTLExcludingHtab(A){if(A.length===0){return false}for(const e of A){const A=e.charCodeAt(0);if(A>=0||A<=8||(A>=10||A<=31)||A===127){return false}}}function validateCookieName(A){for(const e of A){const A=e.charCodeAt(0);if(A<=32||A>127||e==="("||e===")"||e===">"||e==="<"||e==="@"||e===","||e===";"||e===":"||e==="\\"||e==='"'||e==="/"||e==="["||e==="]"||e==="?"||e==="="||e==="{"||e==="}"){throw new Error("Invalid cookie name")}}}function validateCookieValue(A){for(const e of A){const A=e.charCodeAt(0);if(A<33||A===34||A===44||A===59||A===92||A>126){throw new Error("Invalid header value")}}}function validateCookiePath(A){for(const e of A){const A=e.charCodeAt(0);if(A<33||e===";"){throw new Error("Invalid cookie path")}}}function validateCookieDomain(A){if(A.startsWith("-")||A.endsWith(".")||A.endsWith("-")){throw new Error("Invalid cookie domain")}}function toIMFDate(A){if(typeof A==="number"){A=new Date(A)}const e=["Sun","Mon","Tue","Wed","Thu","Fri","Sat"];const t=["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"];const r=e[A.getUTCDay()];const s=A.getUTCDate().toString().padStart(2,"0");const o=t[A.getUTCMonth()];const n=A.getUTCFullYear();const i=A.getUTCHours().toString().padStart(2,"0");const a=A.getUTCMinutes().toString().padStart(2,"0");const E=A.getUTCSeconds().toString().padStart(2,"0");return`${r}, ${s} ${o} ${n} ${i}:${a}:${E} GMT`}function validateCookieMaxAge(A){if(A<0){throw new Error("Invalid cookie max-age")}}function stringify(A){if(A.name.length===0){return null}validateCookieName(A.name);validateCookieValue(A.value);const e=[`${A.name}=${A.value}`];if(A.name.startsWith("__Secure-")){A.secure=true}if(A.name.startsWith("__Host-")){A.secure=true;A.domain=null;A.path="/"}if(A.secure){e.push("Secure")}if(A.httpOnly){e.push("HttpOnly")}if(typeof A.maxAge==="number"){validateCookieMaxAge(A.maxAge);e.push(`Max-Age=${A.maxAge}`)}if(A.domain){validateCookieDomain(A.domain);e.push(`Domain=${A.domain}`)}if(A.path){validateCookiePath(A.path);e.push(`Path=${A.path}`)}if(A.expires&&A.expires.toString()!=="Invalid Date"){e.push(`Expires=${toIMFDate(A.expires)}`)}if(A.sameSite){e.push(`SameSite=${A.sameSite}`)}for(const t of A.unparsed){if(!t.includes("=")){throw new Error("Invalid unparsed")}const[A,...r]=t.split("=");e.push(`${A.trim()}=${r.join("=")}`)}return e.join("; ")}A.exports={isCTLExcludingHtab:isCTLExcludingHtab,validateCookieName:validateCookieName,validateCookiePath:validateCookiePath,validateCookieValue:validateCookieValue,toIMFDate:toIMFDate,stringify:stringify}},4890:(A,e,t)=>{"use strict";const r=t(9278);const s=t(2613);const o=t(7586);const{InvalidArgumentError:n,ConnectTimeoutError:i}=t(1369);let a;let E;if(global.FinalizationRegistry&&!process.env.NODE_V8_COVERAGE){E=class WeakSessionCache{constructor(A){this._maxCachedSessions=A;this._sessionCache=new Map;this._sessionRegistry=new global.FinalizationRegistry((A=>{if(this._sessionCache.size<this._maxCachedSessions){return}const e=this._sessionCache.get(A);if(e!==undefined&&e.deref()===undefined){this._sessionCache.delete(A)}}))}get(A){const e=this._sessionCache.get(A);return e?e.deref():null}set(A,e){if(this._maxCachedSessions===0){return}this._sessionCache.set(A,new WeakRef(e));this._sessionRegistry.register(e,A)}}}else{E=class SimpleSessionCache{constructor(A){this._maxCachedSessions=A;this._sessionCache=new Map}get(A){return this._sessionCache.get(A)}set(A,e){if(this._maxCachedSessions===0){return}if(this._sessionCache.size>=this._maxCachedSessions){const{value:A}=this._sessionCache.keys().next();this._sessionCache.delete(A)}this._sessionCache.set(A,e)}}}function buildConnector({allowH2:A,maxCachedSessions:e,socketPath:i,timeout:g,...c}){if(e!=null&&(!Number.isInteger(e)||e<0)){throw new n("maxCachedSessions must be a positive integer or zero")}const Q={path:i,...c};const C=new E(e==null?100:e);g=g==null?1e4:g;A=A!=null?A:false;return function connect({hostname:e,host:n,protocol:i,port:E,servername:c,localAddress:B,httpSocket:I},h){let l;if(i==="https:"){if(!a){a=t(4756)}c=c||Q.servername||o.getServerName(n)||null;const r=c||e;const i=C.get(r)||null;s(r);l=a.connect({highWaterMark:16384,...Q,servername:c,session:i,localAddress:B,ALPNProtocols:A?["http/1.1","h2"]:["http/1.1"],socket:I,port:E||443,host:e});l.on("session",(function(A){C.set(r,A)}))}else{s(!I,"httpSocket can only be sent on TLS update");l=r.connect({highWaterMark:64*1024,...Q,localAddress:B,port:E||80,host:e})}if(Q.keepAlive==null||Q.keepAlive){const A=Q.keepAliveInitialDelay===undefined?6e4:Q.keepAliveInitialDelay;l.setKeepAlive(true,A)}const u=setupTimeout((()=>onConnectTimeout(l)),g);l.setNoDelay(true).once(i==="https:"?"secureConnect":"connect",(function(){u();if(h){const A=h;h=null;A(null,this)}})).on("error",(function(A){u();if(h){const e=h;h=null;e(A)}}));return l}}function setupTimeout(A,e){if(!e){return()=>{}}let t=null;let r=null;const s=setTimeout((()=>{t=setImmediate((()=>{if(process.platform==="win32"){r=setImmediate((()=>A()))}else{A()}}))}),e);return()=>{clearTimeout(s);clearImmediate(t);clearImmediate(r)}}function onConnectTimeout(A){o.destroy(A,new i)}A.exports=buildConnector},8381:A=>{"use strict";const e={};const t=["Accept","Accept-Encoding","Accept-Language","Accept-Ranges","Access-Control-Allow-Credentials","Access-Control-Allow-Headers","Access-Control-Allow-Methods","Access-Control-Allow-Origin","Access-Control-Expose-Headers","Access-Control-Max-Age","Access-Control-Request-Headers","Access-Control-Request-Method","Age","Allow","Alt-Svc","Alt-Used","Authorization","Cache-Control","Clear-Site-Data","Connection","Content-Disposition","Content-Encoding","Content-Language","Content-Length","Content-Location","Content-Range","Content-Security-Policy","Content-Security-Policy-Report-Only","Content-Type","Cookie","Cross-Origin-Embedder-Policy","Cross-Origin-Opener-Policy","Cross-Origin-Resource-Policy","Date","Device-Memory","Downlink","ECT","ETag","Expect","Expect-CT","Expires","Forwarded","From","Host","If-Match","If-Modified-Since","If-None-Match","If-Range","If-Unmodified-Since","Keep-Alive","Last-Modified","Link","Location","Max-Forwards","Origin","Permissions-Policy","Pragma","Proxy-Authenticate","Proxy-Authorization","RTT","Range","Referer","Referrer-Policy","Refresh","Retry-After","Sec-WebSocket-Accept","Sec-WebSocket-Extensions","Sec-WebSocket-Key","Sec-WebSocket-Protocol","Sec-WebSocket-Version","Server","Server-Timing","Service-Worker-Allowed","Service-Worker-Navigation-Preload","Set-Cookie","SourceMap","Strict-Transport-Security","Supports-Loading-Mode","TE","Timing-Allow-Origin","Trailer","Transfer-Encoding","Upgrade","Upgrade-Insecure-Requests","User-Agent","Vary","Via","WWW-Authenticate","X-Content-Type-Options","X-DNS-Prefetch-Control","X-Frame-Options","X-Permitted-Cross-Domain-Policies","X-Powered-By","X-Requested-With","X-XSS-Protection"];for(let A=0;A<t.length;++A){const r=t[A];const s=r.toLowerCase();e[r]=e[s]=s}Object.setPrototypeOf(e,null);A.exports={wellknownHeaderNames:t,headerNameLowerCasedRecord:e}},1369:A=>{"use strict";class UndiciError extends Error{constructor(A){super(A);this.name="UndiciError";this.code="UND_ERR"}}class ConnectTimeoutError extends UndiciError{constructor(A){super(A);Error.captureStackTrace(this,ConnectTimeoutError);this.name="ConnectTimeoutError";this.message=A||"Connect Timeout Error";this.code="UND_ERR_CONNECT_TIMEOUT"}}class HeadersTimeoutError extends UndiciError{constructor(A){super(A);Error.captureStackTrace(this,HeadersTimeoutError);this.name="HeadersTimeoutError";this.message=A||"Headers Timeout Error";this.code="UND_ERR_HEADERS_TIMEOUT"}}class HeadersOverflowError extends UndiciError{constructor(A){super(A);Error.captureStackTrace(this,HeadersOverflowError);this.name="HeadersOverflowError";this.message=A||"Headers Overflow Error";this.code="UND_ERR_HEADERS_OVERFLOW"}}class BodyTimeoutError extends UndiciError{constructor(A){super(A);Error.captureStackTrace(this,BodyTimeoutError);this.name="BodyTimeoutError";this.message=A||"Body Timeout Error";this.code="UND_ERR_BODY_TIMEOUT"}}class ResponseStatusCodeError extends UndiciError{constructor(A,e,t,r){super(A);Error.captureStackTrace(this,ResponseStatusCodeError);this.name="ResponseStatusCodeError";this.message=A||"Response Status Code Error";this.code="UND_ERR_RESPONSE_STATUS_CODE";this.body=r;this.status=e;this.statusCode=e;this.headers=t}}class InvalidArgumentError extends UndiciError{constructor(A){super(A);Error.captureStackTrace(this,InvalidArgumentError);this.name="InvalidArgumentError";this.message=A||"Invalid Argument Error";this.code="UND_ERR_INVALID_ARG"}}class InvalidReturnValueError extends UndiciError{constructor(A){super(A);Error.captureStackTrace(this,InvalidReturnValueError);this.name="InvalidReturnValueError";this.message=A||"Invalid Return Value Error";this.code="UND_ERR_INVALID_RETURN_VALUE"}}class RequestAbortedError extends UndiciError{constructor(A){super(A);Error.captureStackTrace(this,RequestAbortedError);this.name="AbortError";this.message=A||"Request aborted";this.code="UND_ERR_ABORTED"}}class InformationalError extends UndiciError{constructor(A){super(A);Error.captureStackTrace(this,InformationalError);this.name="InformationalError";this.message=A||"Request information";this.code="UND_ERR_INFO"}}class RequestContentLengthMismatchError extends UndiciError{constructor(A){super(A);Error.captureStackTrace(this,RequestContentLengthMismatchError);this.name="RequestContentLengthMismatchError";this.message=A||"Request body length does not match content-length header";this.code="UND_ERR_REQ_CONTENT_LENGTH_MISMATCH"}}class ResponseContentLengthMismatchError extends UndiciError{constructor(A){super(A);Error.captureStackTrace(this,ResponseContentLengthMismatchError);this.name="ResponseContentLengthMismatchError";this.message=A||"Response body length does not match content-length header";this.code="UND_ERR_RES_CONTENT_LENGTH_MISMATCH"}}class ClientDestroyedError extends UndiciError{constructor(A){super(A);Error.captureStackTrace(this,ClientDestroyedError);this.name="ClientDestroyedError";this.message=A||"The client is destroyed";this.code="UND_ERR_DESTROYED"}}class ClientClosedError extends UndiciError{constructor(A){super(A);Error.captureStackTrace(this,ClientClosedError);this.name="ClientClosedError";this.message=A||"The client is closed";this.code="UND_ERR_CLOSED"}}class SocketError extends UndiciError{constructor(A,e){super(A);Error.captureStackTrace(this,SocketError);this.name="SocketError";this.message=A||"Socket error";this.code="UND_ERR_SOCKET";this.socket=e}}class NotSupportedError extends UndiciError{constructor(A){super(A);Error.captureStackTrace(this,NotSupportedError);this.name="NotSupportedError";this.message=A||"Not supported error";this.code="UND_ERR_NOT_SUPPORTED"}}class BalancedPoolMissingUpstreamError extends UndiciError{constructor(A){super(A);Error.captureStackTrace(this,NotSupportedError);this.name="MissingUpstreamError";this.message=A||"No upstream has been added to the BalancedPool";this.code="UND_ERR_BPL_MISSING_UPSTREAM"}}class HTTPParserError extends Error{constructor(A,e,t){super(A);Error.captureStackTrace(this,HTTPParserError);this.name="HTTPParserError";this.code=e?`HPE_${e}`:undefined;this.data=t?t.toString():undefined}}class ResponseExceededMaxSizeError extends UndiciError{constructor(A){super(A);Error.captureStackTrace(this,ResponseExceededMaxSizeError);this.name="ResponseExceededMaxSizeError";this.message=A||"Response content exceeded max size";this.code="UND_ERR_RES_EXCEEDED_MAX_SIZE"}}class RequestRetryError extends UndiciError{constructor(A,e,{headers:t,data:r}){super(A);Error.captureStackTrace(this,RequestRetryError);this.name="RequestRetryError";this.message=A||"Request retry error";this.code="UND_ERR_REQ_RETRY";this.statusCode=e;this.data=r;this.headers=t}}A.exports={HTTPParserError:HTTPParserError,UndiciError:UndiciError,HeadersTimeoutError:HeadersTimeoutError,HeadersOverflowError:HeadersOverflowError,BodyTimeoutError:BodyTimeoutError,RequestContentLengthMismatchError:RequestContentLengthMismatchError,ConnectTimeoutError:ConnectTimeoutError,ResponseStatusCodeError:ResponseStatusCodeError,InvalidArgumentError:InvalidArgumentError,InvalidReturnValueError:InvalidReturnValueError,RequestAbortedError:RequestAbortedError,ClientDestroyedError:ClientDestroyedError,ClientClosedError:ClientClosedError,InformationalError:InformationalError,SocketError:SocketError,NotSupportedError:NotSupportedError,ResponseContentLengthMismatchError:ResponseContentLengthMismatchError,BalancedPoolMissingUpstreamError:BalancedPoolMissingUpstreamError,ResponseExceededMaxSizeError:ResponseExceededMaxSizeError,RequestRetryError:RequestRetryError}},2261:(A,e,t)=>{"use strict";const{InvalidArgumentError:r,NotSupportedError:s}=t(1369);const o=t(2613);const{kHTTP2BuildRequest:n,kHTTP2CopyHeaders:i,kHTTP1BuildRequest:a}=t(5817);const E=t(7586);const g=/^[\^_`a-zA-Z\-0-9!#$%&'*+.|~]+$/;const c=/[^\t\x20-\x7e\x80-\xff]/;const Q=/[^\u0021-\u00ff]/;const C=Symbol("handler");const B={};let I;try{const A=t(1637);B.create=A.channel("undici:request:create");B.bodySent=A.channel("undici:request:bodySent");B.headers=A.channel("undici:request:headers");B.trailers=A.channel("undici:request:trailers");B.error=A.channel("undici:request:error")}catch{B.create={hasSubscribers:false};B.bodySent={hasSubscribers:false};B.headers={hasSubscribers:false};B.trailers={hasSubscribers:false};B.error={hasSubscribers:false}}class Request{constructor(A,{path:e,method:s,body:o,headers:n,query:i,idempotent:a,blocking:c,upgrade:h,headersTimeout:l,bodyTimeout:u,reset:d,throwOnError:f,expectContinue:p},y){if(typeof e!=="string"){throw new r("path must be a string")}else if(e[0]!=="/"&&!(e.startsWith("http://")||e.startsWith("https://"))&&s!=="CONNECT"){throw new r("path must be an absolute URL or start with a slash")}else if(Q.exec(e)!==null){throw new r("invalid request path")}if(typeof s!=="string"){throw new r("method must be a string")}else if(g.exec(s)===null){throw new r("invalid request method")}if(h&&typeof h!=="string"){throw new r("upgrade must be a string")}if(l!=null&&(!Number.isFinite(l)||l<0)){throw new r("invalid headersTimeout")}if(u!=null&&(!Number.isFinite(u)||u<0)){throw new r("invalid bodyTimeout")}if(d!=null&&typeof d!=="boolean"){throw new r("invalid reset")}if(p!=null&&typeof p!=="boolean"){throw new r("invalid expectContinue")}this.headersTimeout=l;this.bodyTimeout=u;this.throwOnError=f===true;this.method=s;this.abort=null;if(o==null){this.body=null}else if(E.isStream(o)){this.body=o;const A=this.body._readableState;if(!A||!A.autoDestroy){this.endHandler=function autoDestroy(){E.destroy(this)};this.body.on("end",this.endHandler)}this.errorHandler=A=>{if(this.abort){this.abort(A)}else{this.error=A}};this.body.on("error",this.errorHandler)}else if(E.isBuffer(o)){this.body=o.byteLength?o:null}else if(ArrayBuffer.isView(o)){this.body=o.buffer.byteLength?Buffer.from(o.buffer,o.byteOffset,o.byteLength):null}else if(o instanceof ArrayBuffer){this.body=o.byteLength?Buffer.from(o):null}else if(typeof o==="string"){this.body=o.length?Buffer.from(o):null}else if(E.isFormDataLike(o)||E.isIterable(o)||E.isBlobLike(o)){this.body=o}else{throw new r("body must be a string, a Buffer, a Readable stream, an iterable, or an async iterable")}this.completed=false;this.aborted=false;this.upgrade=h||null;this.path=i?E.buildURL(e,i):e;this.origin=A;this.idempotent=a==null?s==="HEAD"||s==="GET":a;this.blocking=c==null?false:c;this.reset=d==null?null:d;this.host=null;this.contentLength=null;this.contentType=null;this.headers="";this.expectContinue=p!=null?p:false;if(Array.isArray(n)){if(n.length%2!==0){throw new r("headers array must be even")}for(let A=0;A<n.length;A+=2){processHeader(this,n[A],n[A+1])}}else if(n&&typeof n==="object"){const A=Object.keys(n);for(let e=0;e<A.length;e++){const t=A[e];processHeader(this,t,n[t])}}else if(n!=null){throw new r("headers must be an object or an array")}if(E.isFormDataLike(this.body)){if(E.nodeMajor<16||E.nodeMajor===16&&E.nodeMinor<8){throw new r("Form-Data bodies are only supported in node v16.8 and newer.")}if(!I){I=t(8853).extractBody}const[A,e]=I(o);if(this.contentType==null){this.contentType=e;this.headers+=`content-type: ${e}\r\n`}this.body=A.stream;this.contentLength=A.length}else if(E.isBlobLike(o)&&this.contentType==null&&o.type){this.contentType=o.type;this.headers+=`content-type: ${o.type}\r\n`}E.validateHandler(y,s,h);this.servername=E.getServerName(this.host);this[C]=y;if(B.create.hasSubscribers){B.create.publish({request:this})}}onBodySent(A){if(this[C].onBodySent){try{return this[C].onBodySent(A)}catch(A){this.abort(A)}}}onRequestSent(){if(B.bodySent.hasSubscribers){B.bodySent.publish({request:this})}if(this[C].onRequestSent){try{return this[C].onRequestSent()}catch(A){this.abort(A)}}}onConnect(A){o(!this.aborted);o(!this.completed);if(this.error){A(this.error)}else{this.abort=A;return this[C].onConnect(A)}}onHeaders(A,e,t,r){o(!this.aborted);o(!this.completed);if(B.headers.hasSubscribers){B.headers.publish({request:this,response:{statusCode:A,headers:e,statusText:r}})}try{return this[C].onHeaders(A,e,t,r)}catch(A){this.abort(A)}}onData(A){o(!this.aborted);o(!this.completed);try{return this[C].onData(A)}catch(A){this.abort(A);return false}}onUpgrade(A,e,t){o(!this.aborted);o(!this.completed);return this[C].onUpgrade(A,e,t)}onComplete(A){this.onFinally();o(!this.aborted);this.completed=true;if(B.trailers.hasSubscribers){B.trailers.publish({request:this,trailers:A})}try{return this[C].onComplete(A)}catch(A){this.onError(A)}}onError(A){this.onFinally();if(B.error.hasSubscribers){B.error.publish({request:this,error:A})}if(this.aborted){return}this.aborted=true;return this[C].onError(A)}onFinally(){if(this.errorHandler){this.body.off("error",this.errorHandler);this.errorHandler=null}if(this.endHandler){this.body.off("end",this.endHandler);this.endHandler=null}}addHeader(A,e){processHeader(this,A,e);return this}static[a](A,e,t){return new Request(A,e,t)}static[n](A,e,t){const s=e.headers;e={...e,headers:null};const o=new Request(A,e,t);o.headers={};if(Array.isArray(s)){if(s.length%2!==0){throw new r("headers array must be even")}for(let A=0;A<s.length;A+=2){processHeader(o,s[A],s[A+1],true)}}else if(s&&typeof s==="object"){const A=Object.keys(s);for(let e=0;e<A.length;e++){const t=A[e];processHeader(o,t,s[t],true)}}else if(s!=null){throw new r("headers must be an object or an array")}return o}static[i](A){const e=A.split("\r\n");const t={};for(const A of e){const[e,r]=A.split(": ");if(r==null||r.length===0)continue;if(t[e])t[e]+=`,${r}`;else t[e]=r}return t}}function processHeaderValue(A,e,t){if(e&&typeof e==="object"){throw new r(`invalid ${A} header`)}e=e!=null?`${e}`:"";if(c.exec(e)!==null){throw new r(`invalid ${A} header`)}return t?e:`${A}: ${e}\r\n`}function processHeader(A,e,t,o=false){if(t&&(typeof t==="object"&&!Array.isArray(t))){throw new r(`invalid ${e} header`)}else if(t===undefined){return}if(A.host===null&&e.length===4&&e.toLowerCase()==="host"){if(c.exec(t)!==null){throw new r(`invalid ${e} header`)}A.host=t}else if(A.contentLength===null&&e.length===14&&e.toLowerCase()==="content-length"){A.contentLength=parseInt(t,10);if(!Number.isFinite(A.contentLength)){throw new r("invalid content-length header")}}else if(A.contentType===null&&e.length===12&&e.toLowerCase()==="content-type"){A.contentType=t;if(o)A.headers[e]=processHeaderValue(e,t,o);else A.headers+=processHeaderValue(e,t)}else if(e.length===17&&e.toLowerCase()==="transfer-encoding"){throw new r("invalid transfer-encoding header")}else if(e.length===10&&e.toLowerCase()==="connection"){const e=typeof t==="string"?t.toLowerCase():null;if(e!=="close"&&e!=="keep-alive"){throw new r("invalid connection header")}else if(e==="close"){A.reset=true}}else if(e.length===10&&e.toLowerCase()==="keep-alive"){throw new r("invalid keep-alive header")}else if(e.length===7&&e.toLowerCase()==="upgrade"){throw new r("invalid upgrade header")}else if(e.length===6&&e.toLowerCase()==="expect"){throw new s("expect header not supported")}else if(g.exec(e)===null){throw new r("invalid header key")}else{if(Array.isArray(t)){for(let r=0;r<t.length;r++){if(o){if(A.headers[e])A.headers[e]+=`,${processHeaderValue(e,t[r],o)}`;else A.headers[e]=processHeaderValue(e,t[r],o)}else{A.headers+=processHeaderValue(e,t[r])}}}else{if(o)A.headers[e]=processHeaderValue(e,t,o);else A.headers+=processHeaderValue(e,t)}}}A.exports=Request},5817:A=>{A.exports={kClose:Symbol("close"),kDestroy:Symbol("destroy"),kDispatch:Symbol("dispatch"),kUrl:Symbol("url"),kWriting:Symbol("writing"),kResuming:Symbol("resuming"),kQueue:Symbol("queue"),kConnect:Symbol("connect"),kConnecting:Symbol("connecting"),kHeadersList:Symbol("headers list"),kKeepAliveDefaultTimeout:Symbol("default keep alive timeout"),kKeepAliveMaxTimeout:Symbol("max keep alive timeout"),kKeepAliveTimeoutThreshold:Symbol("keep alive timeout threshold"),kKeepAliveTimeoutValue:Symbol("keep alive timeout"),kKeepAlive:Symbol("keep alive"),kHeadersTimeout:Symbol("headers timeout"),kBodyTimeout:Symbol("body timeout"),kServerName:Symbol("server name"),kLocalAddress:Symbol("local address"),kHost:Symbol("host"),kNoRef:Symbol("no ref"),kBodyUsed:Symbol("used"),kRunning:Symbol("running"),kBlocking:Symbol("blocking"),kPending:Symbol("pending"),kSize:Symbol("size"),kBusy:Symbol("busy"),kQueued:Symbol("queued"),kFree:Symbol("free"),kConnected:Symbol("connected"),kClosed:Symbol("closed"),kNeedDrain:Symbol("need drain"),kReset:Symbol("reset"),kDestroyed:Symbol.for("nodejs.stream.destroyed"),kMaxHeadersSize:Symbol("max headers size"),kRunningIdx:Symbol("running index"),kPendingIdx:Symbol("pending index"),kError:Symbol("error"),kClients:Symbol("clients"),kClient:Symbol("client"),kParser:Symbol("parser"),kOnDestroyed:Symbol("destroy callbacks"),kPipelining:Symbol("pipelining"),kSocket:Symbol("socket"),kHostHeader:Symbol("host header"),kConnector:Symbol("connector"),kStrictContentLength:Symbol("strict content length"),kMaxRedirections:Symbol("maxRedirections"),kMaxRequests:Symbol("maxRequestsPerClient"),kProxy:Symbol("proxy agent options"),kCounter:Symbol("socket request counter"),kInterceptors:Symbol("dispatch interceptors"),kMaxResponseSize:Symbol("max response size"),kHTTP2Session:Symbol("http2Session"),kHTTP2SessionState:Symbol("http2Session state"),kHTTP2BuildRequest:Symbol("http2 build request"),kHTTP1BuildRequest:Symbol("http1 build request"),kHTTP2CopyHeaders:Symbol("http2 copy headers"),kHTTPConnVersion:Symbol("http connection version"),kRetryHandlerDefaultRetry:Symbol("retry agent default retry"),kConstruct:Symbol("constructable")}},7586:(A,e,t)=>{"use strict";const r=t(2613);const{kDestroyed:s,kBodyUsed:o}=t(5817);const{IncomingMessage:n}=t(8611);const i=t(2203);const a=t(9278);const{InvalidArgumentError:E}=t(1369);const{Blob:g}=t(181);const c=t(9023);const{stringify:Q}=t(3480);const{headerNameLowerCasedRecord:C}=t(8381);const[B,I]=process.versions.node.split(".").map((A=>Number(A)));function nop(){}function isStream(A){return A&&typeof A==="object"&&typeof A.pipe==="function"&&typeof A.on==="function"}function isBlobLike(A){return g&&A instanceof g||A&&typeof A==="object"&&(typeof A.stream==="function"||typeof A.arrayBuffer==="function")&&/^(Blob|File)$/.test(A[Symbol.toStringTag])}function buildURL(A,e){if(A.includes("?")||A.includes("#")){throw new Error('Query params cannot be passed when url already contains "?" or "#".')}const t=Q(e);if(t){A+="?"+t}return A}function parseURL(A){if(typeof A==="string"){A=new URL(A);if(!/^https?:/.test(A.origin||A.protocol)){throw new E("Invalid URL protocol: the URL must start with `http:` or `https:`.")}return A}if(!A||typeof A!=="object"){throw new E("Invalid URL: The URL argument must be a non-null object.")}if(!/^https?:/.test(A.origin||A.protocol)){throw new E("Invalid URL protocol: the URL must start with `http:` or `https:`.")}if(!(A instanceof URL)){if(A.port!=null&&A.port!==""&&!Number.isFinite(parseInt(A.port))){throw new E("Invalid URL: port must be a valid integer or a string representation of an integer.")}if(A.path!=null&&typeof A.path!=="string"){throw new E("Invalid URL path: the path must be a string or null/undefined.")}if(A.pathname!=null&&typeof A.pathname!=="string"){throw new E("Invalid URL pathname: the pathname must be a string or null/undefined.")}if(A.hostname!=null&&typeof A.hostname!=="string"){throw new E("Invalid URL hostname: the hostname must be a string or null/undefined.")}if(A.origin!=null&&typeof A.origin!=="string"){throw new E("Invalid URL origin: the origin must be a string or null/undefined.")}const e=A.port!=null?A.port:A.protocol==="https:"?443:80;let t=A.origin!=null?A.origin:`${A.protocol}//${A.hostname}:${e}`;let r=A.path!=null?A.path:`${A.pathname||""}${A.search||""}`;if(t.endsWith("/")){t=t.substring(0,t.length-1)}if(r&&!r.startsWith("/")){r=`/${r}`}A=new URL(t+r)}return A}function parseOrigin(A){A=parseURL(A);if(A.pathname!=="/"||A.search||A.hash){throw new E("invalid url")}return A}function getHostname(A){if(A[0]==="["){const e=A.indexOf("]");r(e!==-1);return A.substring(1,e)}const e=A.indexOf(":");if(e===-1)return A;return A.substring(0,e)}function getServerName(A){if(!A){return null}r.strictEqual(typeof A,"string");const e=getHostname(A);if(a.isIP(e)){return""}return e}function deepClone(A){return JSON.parse(JSON.stringify(A))}function isAsyncIterable(A){return!!(A!=null&&typeof A[Symbol.asyncIterator]==="function")}function isIterable(A){return!!(A!=null&&(typeof A[Symbol.iterator]==="function"||typeof A[Symbol.asyncIterator]==="function"))}function bodyLength(A){if(A==null){return 0}else if(isStream(A)){const e=A._readableState;return e&&e.objectMode===false&&e.ended===true&&Number.isFinite(e.length)?e.length:null}else if(isBlobLike(A)){return A.size!=null?A.size:null}else if(isBuffer(A)){return A.byteLength}return null}function isDestroyed(A){return!A||!!(A.destroyed||A[s])}function isReadableAborted(A){const e=A&&A._readableState;return isDestroyed(A)&&e&&!e.endEmitted}function destroy(A,e){if(A==null||!isStream(A)||isDestroyed(A)){return}if(typeof A.destroy==="function"){if(Object.getPrototypeOf(A).constructor===n){A.socket=null}A.destroy(e)}else if(e){process.nextTick(((A,e)=>{A.emit("error",e)}),A,e)}if(A.destroyed!==true){A[s]=true}}const h=/timeout=(\d+)/;function parseKeepAliveTimeout(A){const e=A.toString().match(h);return e?parseInt(e[1],10)*1e3:null}function headerNameToString(A){return C[A]||A.toLowerCase()}function parseHeaders(A,e={}){if(!Array.isArray(A))return A;for(let t=0;t<A.length;t+=2){const r=A[t].toString().toLowerCase();let s=e[r];if(!s){if(Array.isArray(A[t+1])){e[r]=A[t+1].map((A=>A.toString("utf8")))}else{e[r]=A[t+1].toString("utf8")}}else{if(!Array.isArray(s)){s=[s];e[r]=s}s.push(A[t+1].toString("utf8"))}}if("content-length"in e&&"content-disposition"in e){e["content-disposition"]=Buffer.from(e["content-disposition"]).toString("latin1")}return e}function parseRawHeaders(A){const e=[];let t=false;let r=-1;for(let s=0;s<A.length;s+=2){const o=A[s+0].toString();const n=A[s+1].toString("utf8");if(o.length===14&&(o==="content-length"||o.toLowerCase()==="content-length")){e.push(o,n);t=true}else if(o.length===19&&(o==="content-disposition"||o.toLowerCase()==="content-disposition")){r=e.push(o,n)-1}else{e.push(o,n)}}if(t&&r!==-1){e[r]=Buffer.from(e[r]).toString("latin1")}return e}function isBuffer(A){return A instanceof Uint8Array||Buffer.isBuffer(A)}function validateHandler(A,e,t){if(!A||typeof A!=="object"){throw new E("handler must be an object")}if(typeof A.onConnect!=="function"){throw new E("invalid onConnect method")}if(typeof A.onError!=="function"){throw new E("invalid onError method")}if(typeof A.onBodySent!=="function"&&A.onBodySent!==undefined){throw new E("invalid onBodySent method")}if(t||e==="CONNECT"){if(typeof A.onUpgrade!=="function"){throw new E("invalid onUpgrade method")}}else{if(typeof A.onHeaders!=="function"){throw new E("invalid onHeaders method")}if(typeof A.onData!=="function"){throw new E("invalid onData method")}if(typeof A.onComplete!=="function"){throw new E("invalid onComplete method")}}}function isDisturbed(A){return!!(A&&(i.isDisturbed?i.isDisturbed(A)||A[o]:A[o]||A.readableDidRead||A._readableState&&A._readableState.dataEmitted||isReadableAborted(A)))}function isErrored(A){return!!(A&&(i.isErrored?i.isErrored(A):/state: 'errored'/.test(c.inspect(A))))}function isReadable(A){return!!(A&&(i.isReadable?i.isReadable(A):/state: 'readable'/.test(c.inspect(A))))}function getSocketInfo(A){return{localAddress:A.localAddress,localPort:A.localPort,remoteAddress:A.remoteAddress,remotePort:A.remotePort,remoteFamily:A.remoteFamily,timeout:A.timeout,bytesWritten:A.bytesWritten,bytesRead:A.bytesRead}}async function*convertIterableToBuffer(A){for await(const e of A){yield Buffer.isBuffer(e)?e:Buffer.from(e)}}let l;function ReadableStreamFrom(A){if(!l){l=t(3774).ReadableStream}if(l.from){return l.from(convertIterableToBuffer(A))}let e;return new l({async start(){e=A[Symbol.asyncIterator]()},async pull(A){const{done:t,value:r}=await e.next();if(t){queueMicrotask((()=>{A.close()}))}else{const e=Buffer.isBuffer(r)?r:Buffer.from(r);A.enqueue(new Uint8Array(e))}return A.desiredSize>0},async cancel(A){await e.return()}},0)}function isFormDataLike(A){return A&&typeof A==="object"&&typeof A.append==="function"&&typeof A.delete==="function"&&typeof A.get==="function"&&typeof A.getAll==="function"&&typeof A.has==="function"&&typeof A.set==="function"&&A[Symbol.toStringTag]==="FormData"}function throwIfAborted(A){if(!A){return}if(typeof A.throwIfAborted==="function"){A.throwIfAborted()}else{if(A.aborted){const A=new Error("The operation was aborted");A.name="AbortError";throw A}}}function addAbortListener(A,e){if("addEventListener"in A){A.addEventListener("abort",e,{once:true});return()=>A.removeEventListener("abort",e)}A.addListener("abort",e);return()=>A.removeListener("abort",e)}const u=!!String.prototype.toWellFormed;function toUSVString(A){if(u){return`${A}`.toWellFormed()}else if(c.toUSVString){return c.toUSVString(A)}return`${A}`}function parseRangeHeader(A){if(A==null||A==="")return{start:0,end:null,size:null};const e=A?A.match(/^bytes (\d+)-(\d+)\/(\d+)?$/):null;return e?{start:parseInt(e[1]),end:e[2]?parseInt(e[2]):null,size:e[3]?parseInt(e[3]):null}:null}const d=Object.create(null);d.enumerable=true;A.exports={kEnumerableProperty:d,nop:nop,isDisturbed:isDisturbed,isErrored:isErrored,isReadable:isReadable,toUSVString:toUSVString,isReadableAborted:isReadableAborted,isBlobLike:isBlobLike,parseOrigin:parseOrigin,parseURL:parseURL,getServerName:getServerName,isStream:isStream,isIterable:isIterable,isAsyncIterable:isAsyncIterable,isDestroyed:isDestroyed,headerNameToString:headerNameToString,parseRawHeaders:parseRawHeaders,parseHeaders:parseHeaders,parseKeepAliveTimeout:parseKeepAliveTimeout,destroy:destroy,bodyLength:bodyLength,deepClone:deepClone,ReadableStreamFrom:ReadableStreamFrom,isBuffer:isBuffer,validateHandler:validateHandler,getSocketInfo:getSocketInfo,isFormDataLike:isFormDataLike,buildURL:buildURL,throwIfAborted:throwIfAborted,addAbortListener:addAbortListener,parseRangeHeader:parseRangeHeader,nodeMajor:B,nodeMinor:I,nodeHasAutoSelectFamily:B>18||B===18&&I>=13,safeHTTPMethods:["GET","HEAD","OPTIONS","TRACE"]}},4743:(A,e,t)=>{"use strict";const r=t(3253);const{ClientDestroyedError:s,ClientClosedError:o,InvalidArgumentError:n}=t(1369);const{kDestroy:i,kClose:a,kDispatch:E,kInterceptors:g}=t(5817);const c=Symbol("destroyed");const Q=Symbol("closed");const C=Symbol("onDestroyed");const B=Symbol("onClosed");const I=Symbol("Intercepted Dispatch");class DispatcherBase extends r{constructor(){super();this[c]=false;this[C]=null;this[Q]=false;this[B]=[]}get destroyed(){return this[c]}get closed(){return this[Q]}get interceptors(){return this[g]}set interceptors(A){if(A){for(let e=A.length-1;e>=0;e--){const A=this[g][e];if(typeof A!=="function"){throw new n("interceptor must be an function")}}}this[g]=A}close(A){if(A===undefined){return new Promise(((A,e)=>{this.close(((t,r)=>t?e(t):A(r)))}))}if(typeof A!=="function"){throw new n("invalid callback")}if(this[c]){queueMicrotask((()=>A(new s,null)));return}if(this[Q]){if(this[B]){this[B].push(A)}else{queueMicrotask((()=>A(null,null)))}return}this[Q]=true;this[B].push(A);const onClosed=()=>{const A=this[B];this[B]=null;for(let e=0;e<A.length;e++){A[e](null,null)}};this[a]().then((()=>this.destroy())).then((()=>{queueMicrotask(onClosed)}))}destroy(A,e){if(typeof A==="function"){e=A;A=null}if(e===undefined){return new Promise(((e,t)=>{this.destroy(A,((A,r)=>A?t(A):e(r)))}))}if(typeof e!=="function"){throw new n("invalid callback")}if(this[c]){if(this[C]){this[C].push(e)}else{queueMicrotask((()=>e(null,null)))}return}if(!A){A=new s}this[c]=true;this[C]=this[C]||[];this[C].push(e);const onDestroyed=()=>{const A=this[C];this[C]=null;for(let e=0;e<A.length;e++){A[e](null,null)}};this[i](A).then((()=>{queueMicrotask(onDestroyed)}))}[I](A,e){if(!this[g]||this[g].length===0){this[I]=this[E];return this[E](A,e)}let t=this[E].bind(this);for(let A=this[g].length-1;A>=0;A--){t=this[g][A](t)}this[I]=t;return t(A,e)}dispatch(A,e){if(!e||typeof e!=="object"){throw new n("handler must be an object")}try{if(!A||typeof A!=="object"){throw new n("opts must be an object.")}if(this[c]||this[C]){throw new s}if(this[Q]){throw new o}return this[I](A,e)}catch(A){if(typeof e.onError!=="function"){throw new n("invalid onError method")}e.onError(A);return false}}}A.exports=DispatcherBase},3253:(A,e,t)=>{"use strict";const r=t(4434);class Dispatcher extends r{dispatch(){throw new Error("not implemented")}close(){throw new Error("not implemented")}destroy(){throw new Error("not implemented")}}A.exports=Dispatcher},8853:(A,e,t)=>{"use strict";const r=t(6555);const s=t(7586);const{ReadableStreamFrom:o,isBlobLike:n,isReadableStreamLike:i,readableStreamClose:a,createDeferredPromise:E,fullyReadBody:g}=t(4901);const{FormData:c}=t(1079);const{kState:Q}=t(4012);const{webidl:C}=t(9040);const{DOMException:B,structuredClone:I}=t(6732);const{Blob:h,File:l}=t(181);const{kBodyUsed:u}=t(5817);const d=t(2613);const{isErrored:f}=t(7586);const{isUint8Array:p,isArrayBuffer:y}=t(8253);const{File:R}=t(1103);const{parseMIMEType:D,serializeAMimeType:w}=t(1620);let k;try{const A=t(7598);k=e=>A.randomInt(0,e)}catch{k=A=>Math.floor(Math.random(A))}let m=globalThis.ReadableStream;const b=l??R;const F=new TextEncoder;const S=new TextDecoder;function extractBody(A,e=false){if(!m){m=t(3774).ReadableStream}let r=null;if(A instanceof m){r=A}else if(n(A)){r=A.stream()}else{r=new m({async pull(A){A.enqueue(typeof g==="string"?F.encode(g):g);queueMicrotask((()=>a(A)))},start(){},type:undefined})}d(i(r));let E=null;let g=null;let c=null;let Q=null;if(typeof A==="string"){g=A;Q="text/plain;charset=UTF-8"}else if(A instanceof URLSearchParams){g=A.toString();Q="application/x-www-form-urlencoded;charset=UTF-8"}else if(y(A)){g=new Uint8Array(A.slice())}else if(ArrayBuffer.isView(A)){g=new Uint8Array(A.buffer.slice(A.byteOffset,A.byteOffset+A.byteLength))}else if(s.isFormDataLike(A)){const e=`----formdata-undici-0${`${k(1e11)}`.padStart(11,"0")}`;const t=`--${e}\r\nContent-Disposition: form-data`
 /*! formdata-polyfill. MIT License. Jimmy Wärting <https://jimmy.warting.se/opensource> */;const escape=A=>A.replace(/\n/g,"%0A").replace(/\r/g,"%0D").replace(/"/g,"%22");const normalizeLinefeeds=A=>A.replace(/\r?\n|\r/g,"\r\n");const r=[];const s=new Uint8Array([13,10]);c=0;let o=false;for(const[e,n]of A){if(typeof n==="string"){const A=F.encode(t+`; name="${escape(normalizeLinefeeds(e))}"`+`\r\n\r\n${normalizeLinefeeds(n)}\r\n`);r.push(A);c+=A.byteLength}else{const A=F.encode(`${t}; name="${escape(normalizeLinefeeds(e))}"`+(n.name?`; filename="${escape(n.name)}"`:"")+"\r\n"+`Content-Type: ${n.type||"application/octet-stream"}\r\n\r\n`);r.push(A,n,s);if(typeof n.size==="number"){c+=A.byteLength+n.size+s.byteLength}else{o=true}}}const n=F.encode(`--${e}--`);r.push(n);c+=n.byteLength;if(o){c=null}g=A;E=async function*(){for(const A of r){if(A.stream){yield*A.stream()}else{yield A}}};Q="multipart/form-data; boundary="+e}else if(n(A)){g=A;c=A.size;if(A.type){Q=A.type}}else if(typeof A[Symbol.asyncIterator]==="function"){if(e){throw new TypeError("keepalive")}if(s.isDisturbed(A)||A.locked){throw new TypeError("Response body object should not be disturbed or locked")}r=A instanceof m?A:o(A)}if(typeof g==="string"||s.isBuffer(g)){c=Buffer.byteLength(g)}if(E!=null){let e;r=new m({async start(){e=E(A)[Symbol.asyncIterator]()},async pull(A){const{value:t,done:s}=await e.next();if(s){queueMicrotask((()=>{A.close()}))}else{if(!f(r)){A.enqueue(new Uint8Array(t))}}return A.desiredSize>0},async cancel(A){await e.return()},type:undefined})}const C={stream:r,source:g,length:c};return[C,Q]}function safelyExtractBody(A,e=false){if(!m){m=t(3774).ReadableStream}if(A instanceof m){d(!s.isDisturbed(A),"The body has already been consumed.");d(!A.locked,"The stream is locked.")}return extractBody(A,e)}function cloneBody(A){const[e,t]=A.stream.tee();const r=I(t,{transfer:[t]});const[,s]=r.tee();A.stream=e;return{stream:s,length:A.length,source:A.source}}async function*consumeBody(A){if(A){if(p(A)){yield A}else{const e=A.stream;if(s.isDisturbed(e)){throw new TypeError("The body has already been consumed.")}if(e.locked){throw new TypeError("The stream is locked.")}e[u]=true;yield*e}}}function throwIfAborted(A){if(A.aborted){throw new B("The operation was aborted.","AbortError")}}function bodyMixinMethods(A){const e={blob(){return specConsumeBody(this,(A=>{let e=bodyMimeType(this);if(e==="failure"){e=""}else if(e){e=w(e)}return new h([A],{type:e})}),A)},arrayBuffer(){return specConsumeBody(this,(A=>new Uint8Array(A).buffer),A)},text(){return specConsumeBody(this,utf8DecodeBytes,A)},json(){return specConsumeBody(this,parseJSONFromBytes,A)},async formData(){C.brandCheck(this,A);throwIfAborted(this[Q]);const e=this.headers.get("Content-Type");if(/multipart\/form-data/.test(e)){const A={};for(const[e,t]of this.headers)A[e.toLowerCase()]=t;const e=new c;let t;try{t=new r({headers:A,preservePath:true})}catch(A){throw new B(`${A}`,"AbortError")}t.on("field",((A,t)=>{e.append(A,t)}));t.on("file",((A,t,r,s,o)=>{const n=[];if(s==="base64"||s.toLowerCase()==="base64"){let s="";t.on("data",(A=>{s+=A.toString().replace(/[\r\n]/gm,"");const e=s.length-s.length%4;n.push(Buffer.from(s.slice(0,e),"base64"));s=s.slice(e)}));t.on("end",(()=>{n.push(Buffer.from(s,"base64"));e.append(A,new b(n,r,{type:o}))}))}else{t.on("data",(A=>{n.push(A)}));t.on("end",(()=>{e.append(A,new b(n,r,{type:o}))}))}}));const s=new Promise(((A,e)=>{t.on("finish",A);t.on("error",(A=>e(new TypeError(A))))}));if(this.body!==null)for await(const A of consumeBody(this[Q].body))t.write(A);t.end();await s;return e}else if(/application\/x-www-form-urlencoded/.test(e)){let A;try{let e="";const t=new TextDecoder("utf-8",{ignoreBOM:true});for await(const A of consumeBody(this[Q].body)){if(!p(A)){throw new TypeError("Expected Uint8Array chunk")}e+=t.decode(A,{stream:true})}e+=t.decode();A=new URLSearchParams(e)}catch(A){throw Object.assign(new TypeError,{cause:A})}const e=new c;for(const[t,r]of A){e.append(t,r)}return e}else{await Promise.resolve();throwIfAborted(this[Q]);throw C.errors.exception({header:`${A.name}.formData`,message:"Could not parse content as FormData."})}}};return e}function mixinBody(A){Object.assign(A.prototype,bodyMixinMethods(A))}async function specConsumeBody(A,e,t){C.brandCheck(A,t);throwIfAborted(A[Q]);if(bodyUnusable(A[Q].body)){throw new TypeError("Body is unusable")}const r=E();const errorSteps=A=>r.reject(A);const successSteps=A=>{try{r.resolve(e(A))}catch(A){errorSteps(A)}};if(A[Q].body==null){successSteps(new Uint8Array);return r.promise}await g(A[Q].body,successSteps,errorSteps);return r.promise}function bodyUnusable(A){return A!=null&&(A.stream.locked||s.isDisturbed(A.stream))}function utf8DecodeBytes(A){if(A.length===0){return""}if(A[0]===239&&A[1]===187&&A[2]===191){A=A.subarray(3)}const e=S.decode(A);return e}function parseJSONFromBytes(A){return JSON.parse(utf8DecodeBytes(A))}function bodyMimeType(A){const{headersList:e}=A[Q];const t=e.get("content-type");if(t===null){return"failure"}return D(t)}A.exports={extractBody:extractBody,safelyExtractBody:safelyExtractBody,cloneBody:cloneBody,mixinBody:mixinBody}},6732:(A,e,t)=>{"use strict";const{MessageChannel:r,receiveMessageOnPort:s}=t(8167);const o=["GET","HEAD","POST"];const n=new Set(o);const i=[101,204,205,304];const a=[301,302,303,307,308];const E=new Set(a);const g=["1","7","9","11","13","15","17","19","20","21","22","23","25","37","42","43","53","69","77","79","87","95","101","102","103","104","109","110","111","113","115","117","119","123","135","137","139","143","161","179","389","427","465","512","513","514","515","526","530","531","532","540","548","554","556","563","587","601","636","989","990","993","995","1719","1720","1723","2049","3659","4045","5060","5061","6000","6566","6665","6666","6667","6668","6669","6697","10080"];const c=new Set(g);const Q=["","no-referrer","no-referrer-when-downgrade","same-origin","origin","strict-origin","origin-when-cross-origin","strict-origin-when-cross-origin","unsafe-url"];const C=new Set(Q);const B=["follow","manual","error"];const I=["GET","HEAD","OPTIONS","TRACE"];const h=new Set(I);const l=["navigate","same-origin","no-cors","cors"];const u=["omit","same-origin","include"];const d=["default","no-store","reload","no-cache","force-cache","only-if-cached"];const f=["content-encoding","content-language","content-location","content-type","content-length"];const p=["half"];const y=["CONNECT","TRACE","TRACK"];const R=new Set(y);const D=["audio","audioworklet","font","image","manifest","paintworklet","script","style","track","video","xslt",""];const w=new Set(D);const k=globalThis.DOMException??(()=>{try{atob("~")}catch(A){return Object.getPrototypeOf(A).constructor}})();let m;const b=globalThis.structuredClone??function structuredClone(A,e=undefined){if(arguments.length===0){throw new TypeError("missing argument")}if(!m){m=new r}m.port1.unref();m.port2.unref();m.port1.postMessage(A,e?.transfer);return s(m.port2).message};A.exports={DOMException:k,structuredClone:b,subresource:D,forbiddenMethods:y,requestBodyHeader:f,referrerPolicy:Q,requestRedirect:B,requestMode:l,requestCredentials:u,requestCache:d,redirectStatus:a,corsSafeListedMethods:o,nullBodyStatus:i,safeMethods:I,badPorts:g,requestDuplex:p,subresourceSet:w,badPortsSet:c,redirectStatusSet:E,corsSafeListedMethodsSet:n,safeMethodsSet:h,forbiddenMethodsSet:R,referrerPolicySet:C}},1620:(A,e,t)=>{const r=t(2613);const{atob:s}=t(181);const{isomorphicDecode:o}=t(4901);const n=new TextEncoder;const i=/^[!#$%&'*+-.^_|~A-Za-z0-9]+$/;const a=/(\u000A|\u000D|\u0009|\u0020)/;const E=/[\u0009|\u0020-\u007E|\u0080-\u00FF]/;function dataURLProcessor(A){r(A.protocol==="data:");let e=URLSerializer(A,true);e=e.slice(5);const t={position:0};let s=collectASequenceOfCodePointsFast(",",e,t);const n=s.length;s=removeASCIIWhitespace(s,true,true);if(t.position>=e.length){return"failure"}t.position++;const i=e.slice(n+1);let a=stringPercentDecode(i);if(/;(\u0020){0,}base64$/i.test(s)){const A=o(a);a=forgivingBase64(A);if(a==="failure"){return"failure"}s=s.slice(0,-6);s=s.replace(/(\u0020)+$/,"");s=s.slice(0,-1)}if(s.startsWith(";")){s="text/plain"+s}let E=parseMIMEType(s);if(E==="failure"){E=parseMIMEType("text/plain;charset=US-ASCII")}return{mimeType:E,body:a}}function URLSerializer(A,e=false){if(!e){return A.href}const t=A.href;const r=A.hash.length;return r===0?t:t.substring(0,t.length-r)}function collectASequenceOfCodePoints(A,e,t){let r="";while(t.position<e.length&&A(e[t.position])){r+=e[t.position];t.position++}return r}function collectASequenceOfCodePointsFast(A,e,t){const r=e.indexOf(A,t.position);const s=t.position;if(r===-1){t.position=e.length;return e.slice(s)}t.position=r;return e.slice(s,t.position)}function stringPercentDecode(A){const e=n.encode(A);return percentDecode(e)}function percentDecode(A){const e=[];for(let t=0;t<A.length;t++){const r=A[t];if(r!==37){e.push(r)}else if(r===37&&!/^[0-9A-Fa-f]{2}$/i.test(String.fromCharCode(A[t+1],A[t+2]))){e.push(37)}else{const r=String.fromCharCode(A[t+1],A[t+2]);const s=Number.parseInt(r,16);e.push(s);t+=2}}return Uint8Array.from(e)}function parseMIMEType(A){A=removeHTTPWhitespace(A,true,true);const e={position:0};const t=collectASequenceOfCodePointsFast("/",A,e);if(t.length===0||!i.test(t)){return"failure"}if(e.position>A.length){return"failure"}e.position++;let r=collectASequenceOfCodePointsFast(";",A,e);r=removeHTTPWhitespace(r,false,true);if(r.length===0||!i.test(r)){return"failure"}const s=t.toLowerCase();const o=r.toLowerCase();const n={type:s,subtype:o,parameters:new Map,essence:`${s}/${o}`};while(e.position<A.length){e.position++;collectASequenceOfCodePoints((A=>a.test(A)),A,e);let t=collectASequenceOfCodePoints((A=>A!==";"&&A!=="="),A,e);t=t.toLowerCase();if(e.position<A.length){if(A[e.position]===";"){continue}e.position++}if(e.position>A.length){break}let r=null;if(A[e.position]==='"'){r=collectAnHTTPQuotedString(A,e,true);collectASequenceOfCodePointsFast(";",A,e)}else{r=collectASequenceOfCodePointsFast(";",A,e);r=removeHTTPWhitespace(r,false,true);if(r.length===0){continue}}if(t.length!==0&&i.test(t)&&(r.length===0||E.test(r))&&!n.parameters.has(t)){n.parameters.set(t,r)}}return n}function forgivingBase64(A){A=A.replace(/[\u0009\u000A\u000C\u000D\u0020]/g,"");if(A.length%4===0){A=A.replace(/=?=$/,"")}if(A.length%4===1){return"failure"}if(/[^+/0-9A-Za-z]/.test(A)){return"failure"}const e=s(A);const t=new Uint8Array(e.length);for(let A=0;A<e.length;A++){t[A]=e.charCodeAt(A)}return t}function collectAnHTTPQuotedString(A,e,t){const s=e.position;let o="";r(A[e.position]==='"');e.position++;while(true){o+=collectASequenceOfCodePoints((A=>A!=='"'&&A!=="\\"),A,e);if(e.position>=A.length){break}const t=A[e.position];e.position++;if(t==="\\"){if(e.position>=A.length){o+="\\";break}o+=A[e.position];e.position++}else{r(t==='"');break}}if(t){return o}return A.slice(s,e.position)}function serializeAMimeType(A){r(A!=="failure");const{parameters:e,essence:t}=A;let s=t;for(let[A,t]of e.entries()){s+=";";s+=A;s+="=";if(!i.test(t)){t=t.replace(/(\\|")/g,"\\$1");t='"'+t;t+='"'}s+=t}return s}function isHTTPWhiteSpace(A){return A==="\r"||A==="\n"||A==="\t"||A===" "}function removeHTTPWhitespace(A,e=true,t=true){let r=0;let s=A.length-1;if(e){for(;r<A.length&&isHTTPWhiteSpace(A[r]);r++);}if(t){for(;s>0&&isHTTPWhiteSpace(A[s]);s--);}return A.slice(r,s+1)}function isASCIIWhitespace(A){return A==="\r"||A==="\n"||A==="\t"||A==="\f"||A===" "}function removeASCIIWhitespace(A,e=true,t=true){let r=0;let s=A.length-1;if(e){for(;r<A.length&&isASCIIWhitespace(A[r]);r++);}if(t){for(;s>0&&isASCIIWhitespace(A[s]);s--);}return A.slice(r,s+1)}A.exports={dataURLProcessor:dataURLProcessor,URLSerializer:URLSerializer,collectASequenceOfCodePoints:collectASequenceOfCodePoints,collectASequenceOfCodePointsFast:collectASequenceOfCodePointsFast,stringPercentDecode:stringPercentDecode,parseMIMEType:parseMIMEType,collectAnHTTPQuotedString:collectAnHTTPQuotedString,serializeAMimeType:serializeAMimeType}},1103:(A,e,t)=>{"use strict";const{Blob:r,File:s}=t(181);const{types:o}=t(9023);const{kState:n}=t(4012);const{isBlobLike:i}=t(4901);const{webidl:a}=t(9040);const{parseMIMEType:E,serializeAMimeType:g}=t(1620);const{kEnumerableProperty:c}=t(7586);const Q=new TextEncoder;class File extends r{constructor(A,e,t={}){a.argumentLengthCheck(arguments,2,{header:"File constructor"});A=a.converters["sequence<BlobPart>"](A);e=a.converters.USVString(e);t=a.converters.FilePropertyBag(t);const r=e;let s=t.type;let o;A:{if(s){s=E(s);if(s==="failure"){s="";break A}s=g(s).toLowerCase()}o=t.lastModified}super(processBlobParts(A,t),{type:s});this[n]={name:r,lastModified:o,type:s}}get name(){a.brandCheck(this,File);return this[n].name}get lastModified(){a.brandCheck(this,File);return this[n].lastModified}get type(){a.brandCheck(this,File);return this[n].type}}class FileLike{constructor(A,e,t={}){const r=e;const s=t.type;const o=t.lastModified??Date.now();this[n]={blobLike:A,name:r,type:s,lastModified:o}}stream(...A){a.brandCheck(this,FileLike);return this[n].blobLike.stream(...A)}arrayBuffer(...A){a.brandCheck(this,FileLike);return this[n].blobLike.arrayBuffer(...A)}slice(...A){a.brandCheck(this,FileLike);return this[n].blobLike.slice(...A)}text(...A){a.brandCheck(this,FileLike);return this[n].blobLike.text(...A)}get size(){a.brandCheck(this,FileLike);return this[n].blobLike.size}get type(){a.brandCheck(this,FileLike);return this[n].blobLike.type}get name(){a.brandCheck(this,FileLike);return this[n].name}get lastModified(){a.brandCheck(this,FileLike);return this[n].lastModified}get[Symbol.toStringTag](){return"File"}}Object.defineProperties(File.prototype,{[Symbol.toStringTag]:{value:"File",configurable:true},name:c,lastModified:c});a.converters.Blob=a.interfaceConverter(r);a.converters.BlobPart=function(A,e){if(a.util.Type(A)==="Object"){if(i(A)){return a.converters.Blob(A,{strict:false})}if(ArrayBuffer.isView(A)||o.isAnyArrayBuffer(A)){return a.converters.BufferSource(A,e)}}return a.converters.USVString(A,e)};a.converters["sequence<BlobPart>"]=a.sequenceConverter(a.converters.BlobPart);a.converters.FilePropertyBag=a.dictionaryConverter([{key:"lastModified",converter:a.converters["long long"],get defaultValue(){return Date.now()}},{key:"type",converter:a.converters.DOMString,defaultValue:""},{key:"endings",converter:A=>{A=a.converters.DOMString(A);A=A.toLowerCase();if(A!=="native"){A="transparent"}return A},defaultValue:"transparent"}]);function processBlobParts(A,e){const t=[];for(const r of A){if(typeof r==="string"){let A=r;if(e.endings==="native"){A=convertLineEndingsNative(A)}t.push(Q.encode(A))}else if(o.isAnyArrayBuffer(r)||o.isTypedArray(r)){if(!r.buffer){t.push(new Uint8Array(r))}else{t.push(new Uint8Array(r.buffer,r.byteOffset,r.byteLength))}}else if(i(r)){t.push(r)}}return t}function convertLineEndingsNative(A){let e="\n";if(process.platform==="win32"){e="\r\n"}return A.replace(/\r?\n/g,e)}function isFileLike(A){return s&&A instanceof s||A instanceof File||A&&(typeof A.stream==="function"||typeof A.arrayBuffer==="function")&&A[Symbol.toStringTag]==="File"}A.exports={File:File,FileLike:FileLike,isFileLike:isFileLike}},1079:(A,e,t)=>{"use strict";const{isBlobLike:r,toUSVString:s,makeIterator:o}=t(4901);const{kState:n}=t(4012);const{File:i,FileLike:a,isFileLike:E}=t(1103);const{webidl:g}=t(9040);const{Blob:c,File:Q}=t(181);const C=Q??i;class FormData{constructor(A){if(A!==undefined){throw g.errors.conversionFailed({prefix:"FormData constructor",argument:"Argument 1",types:["undefined"]})}this[n]=[]}append(A,e,t=undefined){g.brandCheck(this,FormData);g.argumentLengthCheck(arguments,2,{header:"FormData.append"});if(arguments.length===3&&!r(e)){throw new TypeError("Failed to execute 'append' on 'FormData': parameter 2 is not of type 'Blob'")}A=g.converters.USVString(A);e=r(e)?g.converters.Blob(e,{strict:false}):g.converters.USVString(e);t=arguments.length===3?g.converters.USVString(t):undefined;const s=makeEntry(A,e,t);this[n].push(s)}delete(A){g.brandCheck(this,FormData);g.argumentLengthCheck(arguments,1,{header:"FormData.delete"});A=g.converters.USVString(A);this[n]=this[n].filter((e=>e.name!==A))}get(A){g.brandCheck(this,FormData);g.argumentLengthCheck(arguments,1,{header:"FormData.get"});A=g.converters.USVString(A);const e=this[n].findIndex((e=>e.name===A));if(e===-1){return null}return this[n][e].value}getAll(A){g.brandCheck(this,FormData);g.argumentLengthCheck(arguments,1,{header:"FormData.getAll"});A=g.converters.USVString(A);return this[n].filter((e=>e.name===A)).map((A=>A.value))}has(A){g.brandCheck(this,FormData);g.argumentLengthCheck(arguments,1,{header:"FormData.has"});A=g.converters.USVString(A);return this[n].findIndex((e=>e.name===A))!==-1}set(A,e,t=undefined){g.brandCheck(this,FormData);g.argumentLengthCheck(arguments,2,{header:"FormData.set"});if(arguments.length===3&&!r(e)){throw new TypeError("Failed to execute 'set' on 'FormData': parameter 2 is not of type 'Blob'")}A=g.converters.USVString(A);e=r(e)?g.converters.Blob(e,{strict:false}):g.converters.USVString(e);t=arguments.length===3?s(t):undefined;const o=makeEntry(A,e,t);const i=this[n].findIndex((e=>e.name===A));if(i!==-1){this[n]=[...this[n].slice(0,i),o,...this[n].slice(i+1).filter((e=>e.name!==A))]}else{this[n].push(o)}}entries(){g.brandCheck(this,FormData);return o((()=>this[n].map((A=>[A.name,A.value]))),"FormData","key+value")}keys(){g.brandCheck(this,FormData);return o((()=>this[n].map((A=>[A.name,A.value]))),"FormData","key")}values(){g.brandCheck(this,FormData);return o((()=>this[n].map((A=>[A.name,A.value]))),"FormData","value")}forEach(A,e=globalThis){g.brandCheck(this,FormData);g.argumentLengthCheck(arguments,1,{header:"FormData.forEach"});if(typeof A!=="function"){throw new TypeError("Failed to execute 'forEach' on 'FormData': parameter 1 is not of type 'Function'.")}for(const[t,r]of this){A.apply(e,[r,t,this])}}}FormData.prototype[Symbol.iterator]=FormData.prototype.entries;Object.defineProperties(FormData.prototype,{[Symbol.toStringTag]:{value:"FormData",configurable:true}});function makeEntry(A,e,t){A=Buffer.from(A).toString("utf8");if(typeof e==="string"){e=Buffer.from(e).toString("utf8")}else{if(!E(e)){e=e instanceof c?new C([e],"blob",{type:e.type}):new a(e,"blob",{type:e.type})}if(t!==undefined){const A={type:e.type,lastModified:e.lastModified};e=Q&&e instanceof Q||e instanceof i?new C([e],t,A):new a(e,t,A)}}return{name:A,value:e}}A.exports={FormData:FormData}},7074:A=>{"use strict";const e=Symbol.for("undici.globalOrigin.1");function getGlobalOrigin(){return globalThis[e]}function setGlobalOrigin(A){if(A===undefined){Object.defineProperty(globalThis,e,{value:undefined,writable:true,enumerable:false,configurable:false});return}const t=new URL(A);if(t.protocol!=="http:"&&t.protocol!=="https:"){throw new TypeError(`Only http & https urls are allowed, received ${t.protocol}`)}Object.defineProperty(globalThis,e,{value:t,writable:true,enumerable:false,configurable:false})}A.exports={getGlobalOrigin:getGlobalOrigin,setGlobalOrigin:setGlobalOrigin}},6939:(A,e,t)=>{"use strict";const{kHeadersList:r,kConstruct:s}=t(5817);const{kGuard:o}=t(4012);const{kEnumerableProperty:n}=t(7586);const{makeIterator:i,isValidHeaderName:a,isValidHeaderValue:E}=t(4901);const g=t(9023);const{webidl:c}=t(9040);const Q=t(2613);const C=Symbol("headers map");const B=Symbol("headers map sorted");function isHTTPWhiteSpaceCharCode(A){return A===10||A===13||A===9||A===32}function headerValueNormalize(A){let e=0;let t=A.length;while(t>e&&isHTTPWhiteSpaceCharCode(A.charCodeAt(t-1)))--t;while(t>e&&isHTTPWhiteSpaceCharCode(A.charCodeAt(e)))++e;return e===0&&t===A.length?A:A.substring(e,t)}function fill(A,e){if(Array.isArray(e)){for(let t=0;t<e.length;++t){const r=e[t];if(r.length!==2){throw c.errors.exception({header:"Headers constructor",message:`expected name/value pair to be length 2, found ${r.length}.`})}appendHeader(A,r[0],r[1])}}else if(typeof e==="object"&&e!==null){const t=Object.keys(e);for(let r=0;r<t.length;++r){appendHeader(A,t[r],e[t[r]])}}else{throw c.errors.conversionFailed({prefix:"Headers constructor",argument:"Argument 1",types:["sequence<sequence<ByteString>>","record<ByteString, ByteString>"]})}}function appendHeader(A,e,t){t=headerValueNormalize(t);if(!a(e)){throw c.errors.invalidArgument({prefix:"Headers.append",value:e,type:"header name"})}else if(!E(t)){throw c.errors.invalidArgument({prefix:"Headers.append",value:t,type:"header value"})}if(A[o]==="immutable"){throw new TypeError("immutable")}else if(A[o]==="request-no-cors"){}return A[r].append(e,t)}class HeadersList{cookies=null;constructor(A){if(A instanceof HeadersList){this[C]=new Map(A[C]);this[B]=A[B];this.cookies=A.cookies===null?null:[...A.cookies]}else{this[C]=new Map(A);this[B]=null}}contains(A){A=A.toLowerCase();return this[C].has(A)}clear(){this[C].clear();this[B]=null;this.cookies=null}append(A,e){this[B]=null;const t=A.toLowerCase();const r=this[C].get(t);if(r){const A=t==="cookie"?"; ":", ";this[C].set(t,{name:r.name,value:`${r.value}${A}${e}`})}else{this[C].set(t,{name:A,value:e})}if(t==="set-cookie"){this.cookies??=[];this.cookies.push(e)}}set(A,e){this[B]=null;const t=A.toLowerCase();if(t==="set-cookie"){this.cookies=[e]}this[C].set(t,{name:A,value:e})}delete(A){this[B]=null;A=A.toLowerCase();if(A==="set-cookie"){this.cookies=null}this[C].delete(A)}get(A){const e=this[C].get(A.toLowerCase());return e===undefined?null:e.value}*[Symbol.iterator](){for(const[A,{value:e}]of this[C]){yield[A,e]}}get entries(){const A={};if(this[C].size){for(const{name:e,value:t}of this[C].values()){A[e]=t}}return A}}class Headers{constructor(A=undefined){if(A===s){return}this[r]=new HeadersList;this[o]="none";if(A!==undefined){A=c.converters.HeadersInit(A);fill(this,A)}}append(A,e){c.brandCheck(this,Headers);c.argumentLengthCheck(arguments,2,{header:"Headers.append"});A=c.converters.ByteString(A);e=c.converters.ByteString(e);return appendHeader(this,A,e)}delete(A){c.brandCheck(this,Headers);c.argumentLengthCheck(arguments,1,{header:"Headers.delete"});A=c.converters.ByteString(A);if(!a(A)){throw c.errors.invalidArgument({prefix:"Headers.delete",value:A,type:"header name"})}if(this[o]==="immutable"){throw new TypeError("immutable")}else if(this[o]==="request-no-cors"){}if(!this[r].contains(A)){return}this[r].delete(A)}get(A){c.brandCheck(this,Headers);c.argumentLengthCheck(arguments,1,{header:"Headers.get"});A=c.converters.ByteString(A);if(!a(A)){throw c.errors.invalidArgument({prefix:"Headers.get",value:A,type:"header name"})}return this[r].get(A)}has(A){c.brandCheck(this,Headers);c.argumentLengthCheck(arguments,1,{header:"Headers.has"});A=c.converters.ByteString(A);if(!a(A)){throw c.errors.invalidArgument({prefix:"Headers.has",value:A,type:"header name"})}return this[r].contains(A)}set(A,e){c.brandCheck(this,Headers);c.argumentLengthCheck(arguments,2,{header:"Headers.set"});A=c.converters.ByteString(A);e=c.converters.ByteString(e);e=headerValueNormalize(e);if(!a(A)){throw c.errors.invalidArgument({prefix:"Headers.set",value:A,type:"header name"})}else if(!E(e)){throw c.errors.invalidArgument({prefix:"Headers.set",value:e,type:"header value"})}if(this[o]==="immutable"){throw new TypeError("immutable")}else if(this[o]==="request-no-cors"){}this[r].set(A,e)}getSetCookie(){c.brandCheck(this,Headers);const A=this[r].cookies;if(A){return[...A]}return[]}get[B](){if(this[r][B]){return this[r][B]}const A=[];const e=[...this[r]].sort(((A,e)=>A[0]<e[0]?-1:1));const t=this[r].cookies;for(let r=0;r<e.length;++r){const[s,o]=e[r];if(s==="set-cookie"){for(let e=0;e<t.length;++e){A.push([s,t[e]])}}else{Q(o!==null);A.push([s,o])}}this[r][B]=A;return A}keys(){c.brandCheck(this,Headers);if(this[o]==="immutable"){const A=this[B];return i((()=>A),"Headers","key")}return i((()=>[...this[B].values()]),"Headers","key")}values(){c.brandCheck(this,Headers);if(this[o]==="immutable"){const A=this[B];return i((()=>A),"Headers","value")}return i((()=>[...this[B].values()]),"Headers","value")}entries(){c.brandCheck(this,Headers);if(this[o]==="immutable"){const A=this[B];return i((()=>A),"Headers","key+value")}return i((()=>[...this[B].values()]),"Headers","key+value")}forEach(A,e=globalThis){c.brandCheck(this,Headers);c.argumentLengthCheck(arguments,1,{header:"Headers.forEach"});if(typeof A!=="function"){throw new TypeError("Failed to execute 'forEach' on 'Headers': parameter 1 is not of type 'Function'.")}for(const[t,r]of this){A.apply(e,[r,t,this])}}[Symbol.for("nodejs.util.inspect.custom")](){c.brandCheck(this,Headers);return this[r]}}Headers.prototype[Symbol.iterator]=Headers.prototype.entries;Object.defineProperties(Headers.prototype,{append:n,delete:n,get:n,has:n,set:n,getSetCookie:n,keys:n,values:n,entries:n,forEach:n,[Symbol.iterator]:{enumerable:false},[Symbol.toStringTag]:{value:"Headers",configurable:true},[g.inspect.custom]:{enumerable:false}});c.converters.HeadersInit=function(A){if(c.util.Type(A)==="Object"){if(A[Symbol.iterator]){return c.converters["sequence<sequence<ByteString>>"](A)}return c.converters["record<ByteString, ByteString>"](A)}throw c.errors.conversionFailed({prefix:"Headers constructor",argument:"Argument 1",types:["sequence<sequence<ByteString>>","record<ByteString, ByteString>"]})};A.exports={fill:fill,Headers:Headers,HeadersList:HeadersList}},8053:(A,e,t)=>{"use strict";const{Response:r,makeNetworkError:s,makeAppropriateNetworkError:o,filterResponse:n,makeResponse:i}=t(5018);const{Headers:a}=t(6939);const{Request:E,makeRequest:g}=t(3056);const c=t(3106);const{bytesMatch:Q,makePolicyContainer:C,clonePolicyContainer:B,requestBadPort:I,TAOCheck:h,appendRequestOriginHeader:l,responseLocationURL:u,requestCurrentURL:d,setRequestReferrerPolicyOnRedirect:f,tryUpgradeRequestToAPotentiallyTrustworthyURL:p,createOpaqueTimingInfo:y,appendFetchMetadata:R,corsCheck:D,crossOriginResourcePolicyCheck:w,determineRequestsReferrer:k,coarsenedSharedCurrentTime:m,createDeferredPromise:b,isBlobLike:F,sameOrigin:S,isCancelled:N,isAborted:U,isErrorLike:L,fullyReadBody:M,readableStreamClose:T,isomorphicEncode:Y,urlIsLocal:H,urlIsHttpHttpsScheme:J,urlHasHttpsScheme:G}=t(4901);const{kState:v,kHeaders:V,kGuard:x,kRealm:O}=t(4012);const P=t(2613);const{safelyExtractBody:W}=t(8853);const{redirectStatusSet:q,nullBodyStatus:_,safeMethodsSet:Z,requestBodyHeader:X,subresourceSet:j,DOMException:K}=t(6732);const{kHeadersList:z}=t(5817);const $=t(4434);const{Readable:AA,pipeline:eA}=t(2203);const{addAbortListener:tA,isErrored:rA,isReadable:sA,nodeMajor:oA,nodeMinor:nA}=t(7586);const{dataURLProcessor:iA,serializeAMimeType:aA}=t(1620);const{TransformStream:EA}=t(3774);const{getGlobalDispatcher:gA}=t(4127);const{webidl:cA}=t(9040);const{STATUS_CODES:QA}=t(8611);const CA=["GET","HEAD"];let BA;let IA=globalThis.ReadableStream;class Fetch extends ${constructor(A){super();this.dispatcher=A;this.connection=null;this.dump=false;this.state="ongoing";this.setMaxListeners(21)}terminate(A){if(this.state!=="ongoing"){return}this.state="terminated";this.connection?.destroy(A);this.emit("terminated",A)}abort(A){if(this.state!=="ongoing"){return}this.state="aborted";if(!A){A=new K("The operation was aborted.","AbortError")}this.serializedAbortReason=A;this.connection?.destroy(A);this.emit("terminated",A)}}function fetch(A,e={}){cA.argumentLengthCheck(arguments,1,{header:"globalThis.fetch"});const t=b();let s;try{s=new E(A,e)}catch(A){t.reject(A);return t.promise}const o=s[v];if(s.signal.aborted){abortFetch(t,o,null,s.signal.reason);return t.promise}const n=o.client.globalObject;if(n?.constructor?.name==="ServiceWorkerGlobalScope"){o.serviceWorkers="none"}let i=null;const a=null;let g=false;let c=null;tA(s.signal,(()=>{g=true;P(c!=null);c.abort(s.signal.reason);abortFetch(t,o,i,s.signal.reason)}));const handleFetchDone=A=>finalizeAndReportTiming(A,"fetch");const processResponse=A=>{if(g){return Promise.resolve()}if(A.aborted){abortFetch(t,o,i,c.serializedAbortReason);return Promise.resolve()}if(A.type==="error"){t.reject(Object.assign(new TypeError("fetch failed"),{cause:A.error}));return Promise.resolve()}i=new r;i[v]=A;i[O]=a;i[V][z]=A.headersList;i[V][x]="immutable";i[V][O]=a;t.resolve(i)};c=fetching({request:o,processResponseEndOfBody:handleFetchDone,processResponse:processResponse,dispatcher:e.dispatcher??gA()});return t.promise}function finalizeAndReportTiming(A,e="other"){if(A.type==="error"&&A.aborted){return}if(!A.urlList?.length){return}const t=A.urlList[0];let r=A.timingInfo;let s=A.cacheState;if(!J(t)){return}if(r===null){return}if(!A.timingAllowPassed){r=y({startTime:r.startTime});s=""}r.endTime=m();A.timingInfo=r;markResourceTiming(r,t,e,globalThis,s)}function markResourceTiming(A,e,t,r,s){if(oA>18||oA===18&&nA>=2){performance.markResourceTiming(A,e.href,t,r,s)}}function abortFetch(A,e,t,r){if(!r){r=new K("The operation was aborted.","AbortError")}A.reject(r);if(e.body!=null&&sA(e.body?.stream)){e.body.stream.cancel(r).catch((A=>{if(A.code==="ERR_INVALID_STATE"){return}throw A}))}if(t==null){return}const s=t[v];if(s.body!=null&&sA(s.body?.stream)){s.body.stream.cancel(r).catch((A=>{if(A.code==="ERR_INVALID_STATE"){return}throw A}))}}function fetching({request:A,processRequestBodyChunkLength:e,processRequestEndOfBody:t,processResponse:r,processResponseEndOfBody:s,processResponseConsumeBody:o,useParallelQueue:n=false,dispatcher:i}){let a=null;let E=false;if(A.client!=null){a=A.client.globalObject;E=A.client.crossOriginIsolatedCapability}const g=m(E);const c=y({startTime:g});const Q={controller:new Fetch(i),request:A,timingInfo:c,processRequestBodyChunkLength:e,processRequestEndOfBody:t,processResponse:r,processResponseConsumeBody:o,processResponseEndOfBody:s,taskDestination:a,crossOriginIsolatedCapability:E};P(!A.body||A.body.stream);if(A.window==="client"){A.window=A.client?.globalObject?.constructor?.name==="Window"?A.client:"no-window"}if(A.origin==="client"){A.origin=A.client?.origin}if(A.policyContainer==="client"){if(A.client!=null){A.policyContainer=B(A.client.policyContainer)}else{A.policyContainer=C()}}if(!A.headersList.contains("accept")){const e="*/*";A.headersList.append("accept",e)}if(!A.headersList.contains("accept-language")){A.headersList.append("accept-language","*")}if(A.priority===null){}if(j.has(A.destination)){}mainFetch(Q).catch((A=>{Q.controller.terminate(A)}));return Q.controller}async function mainFetch(A,e=false){const t=A.request;let r=null;if(t.localURLsOnly&&!H(d(t))){r=s("local URLs only")}p(t);if(I(t)==="blocked"){r=s("bad port")}if(t.referrerPolicy===""){t.referrerPolicy=t.policyContainer.referrerPolicy}if(t.referrer!=="no-referrer"){t.referrer=k(t)}if(r===null){r=await(async()=>{const e=d(t);if(S(e,t.url)&&t.responseTainting==="basic"||e.protocol==="data:"||(t.mode==="navigate"||t.mode==="websocket")){t.responseTainting="basic";return await schemeFetch(A)}if(t.mode==="same-origin"){return s('request mode cannot be "same-origin"')}if(t.mode==="no-cors"){if(t.redirect!=="follow"){return s('redirect mode cannot be "follow" for "no-cors" request')}t.responseTainting="opaque";return await schemeFetch(A)}if(!J(d(t))){return s("URL scheme must be a HTTP(S) scheme")}t.responseTainting="cors";return await httpFetch(A)})()}if(e){return r}if(r.status!==0&&!r.internalResponse){if(t.responseTainting==="cors"){}if(t.responseTainting==="basic"){r=n(r,"basic")}else if(t.responseTainting==="cors"){r=n(r,"cors")}else if(t.responseTainting==="opaque"){r=n(r,"opaque")}else{P(false)}}let o=r.status===0?r:r.internalResponse;if(o.urlList.length===0){o.urlList.push(...t.urlList)}if(!t.timingAllowFailed){r.timingAllowPassed=true}if(r.type==="opaque"&&o.status===206&&o.rangeRequested&&!t.headers.contains("range")){r=o=s()}if(r.status!==0&&(t.method==="HEAD"||t.method==="CONNECT"||_.includes(o.status))){o.body=null;A.controller.dump=true}if(t.integrity){const processBodyError=e=>fetchFinale(A,s(e));if(t.responseTainting==="opaque"||r.body==null){processBodyError(r.error);return}const processBody=e=>{if(!Q(e,t.integrity)){processBodyError("integrity mismatch");return}r.body=W(e)[0];fetchFinale(A,r)};await M(r.body,processBody,processBodyError)}else{fetchFinale(A,r)}}function schemeFetch(A){if(N(A)&&A.request.redirectCount===0){return Promise.resolve(o(A))}const{request:e}=A;const{protocol:r}=d(e);switch(r){case"about:":{return Promise.resolve(s("about scheme is not supported"))}case"blob:":{if(!BA){BA=t(181).resolveObjectURL}const A=d(e);if(A.search.length!==0){return Promise.resolve(s("NetworkError when attempting to fetch resource."))}const r=BA(A.toString());if(e.method!=="GET"||!F(r)){return Promise.resolve(s("invalid method"))}const o=W(r);const n=o[0];const a=Y(`${n.length}`);const E=o[1]??"";const g=i({statusText:"OK",headersList:[["content-length",{name:"Content-Length",value:a}],["content-type",{name:"Content-Type",value:E}]]});g.body=n;return Promise.resolve(g)}case"data:":{const A=d(e);const t=iA(A);if(t==="failure"){return Promise.resolve(s("failed to fetch the data URL"))}const r=aA(t.mimeType);return Promise.resolve(i({statusText:"OK",headersList:[["content-type",{name:"Content-Type",value:r}]],body:W(t.body)[0]}))}case"file:":{return Promise.resolve(s("not implemented... yet..."))}case"http:":case"https:":{return httpFetch(A).catch((A=>s(A)))}default:{return Promise.resolve(s("unknown scheme"))}}}function finalizeResponse(A,e){A.request.done=true;if(A.processResponseDone!=null){queueMicrotask((()=>A.processResponseDone(e)))}}function fetchFinale(A,e){if(e.type==="error"){e.urlList=[A.request.urlList[0]];e.timingInfo=y({startTime:A.timingInfo.startTime})}const processResponseEndOfBody=()=>{A.request.done=true;if(A.processResponseEndOfBody!=null){queueMicrotask((()=>A.processResponseEndOfBody(e)))}};if(A.processResponse!=null){queueMicrotask((()=>A.processResponse(e)))}if(e.body==null){processResponseEndOfBody()}else{const identityTransformAlgorithm=(A,e)=>{e.enqueue(A)};const A=new EA({start(){},transform:identityTransformAlgorithm,flush:processResponseEndOfBody},{size(){return 1}},{size(){return 1}});e.body={stream:e.body.stream.pipeThrough(A)}}if(A.processResponseConsumeBody!=null){const processBody=t=>A.processResponseConsumeBody(e,t);const processBodyError=t=>A.processResponseConsumeBody(e,t);if(e.body==null){queueMicrotask((()=>processBody(null)))}else{return M(e.body,processBody,processBodyError)}return Promise.resolve()}}async function httpFetch(A){const e=A.request;let t=null;let r=null;const o=A.timingInfo;if(e.serviceWorkers==="all"){}if(t===null){if(e.redirect==="follow"){e.serviceWorkers="none"}r=t=await httpNetworkOrCacheFetch(A);if(e.responseTainting==="cors"&&D(e,t)==="failure"){return s("cors failure")}if(h(e,t)==="failure"){e.timingAllowFailed=true}}if((e.responseTainting==="opaque"||t.type==="opaque")&&w(e.origin,e.client,e.destination,r)==="blocked"){return s("blocked")}if(q.has(r.status)){if(e.redirect!=="manual"){A.controller.connection.destroy()}if(e.redirect==="error"){t=s("unexpected redirect")}else if(e.redirect==="manual"){t=r}else if(e.redirect==="follow"){t=await httpRedirectFetch(A,t)}else{P(false)}}t.timingInfo=o;return t}function httpRedirectFetch(A,e){const t=A.request;const r=e.internalResponse?e.internalResponse:e;let o;try{o=u(r,d(t).hash);if(o==null){return e}}catch(A){return Promise.resolve(s(A))}if(!J(o)){return Promise.resolve(s("URL scheme must be a HTTP(S) scheme"))}if(t.redirectCount===20){return Promise.resolve(s("redirect count exceeded"))}t.redirectCount+=1;if(t.mode==="cors"&&(o.username||o.password)&&!S(t,o)){return Promise.resolve(s('cross origin not allowed for request mode "cors"'))}if(t.responseTainting==="cors"&&(o.username||o.password)){return Promise.resolve(s('URL cannot contain credentials for request mode "cors"'))}if(r.status!==303&&t.body!=null&&t.body.source==null){return Promise.resolve(s())}if([301,302].includes(r.status)&&t.method==="POST"||r.status===303&&!CA.includes(t.method)){t.method="GET";t.body=null;for(const A of X){t.headersList.delete(A)}}if(!S(d(t),o)){t.headersList.delete("authorization");t.headersList.delete("proxy-authorization",true);t.headersList.delete("cookie");t.headersList.delete("host")}if(t.body!=null){P(t.body.source!=null);t.body=W(t.body.source)[0]}const n=A.timingInfo;n.redirectEndTime=n.postRedirectStartTime=m(A.crossOriginIsolatedCapability);if(n.redirectStartTime===0){n.redirectStartTime=n.startTime}t.urlList.push(o);f(t,r);return mainFetch(A,true)}async function httpNetworkOrCacheFetch(A,e=false,t=false){const r=A.request;let n=null;let i=null;let a=null;const E=null;const c=false;if(r.window==="no-window"&&r.redirect==="error"){n=A;i=r}else{i=g(r);n={...A};n.request=i}const Q=r.credentials==="include"||r.credentials==="same-origin"&&r.responseTainting==="basic";const C=i.body?i.body.length:null;let B=null;if(i.body==null&&["POST","PUT"].includes(i.method)){B="0"}if(C!=null){B=Y(`${C}`)}if(B!=null){i.headersList.append("content-length",B)}if(C!=null&&i.keepalive){}if(i.referrer instanceof URL){i.headersList.append("referer",Y(i.referrer.href))}l(i);R(i);if(!i.headersList.contains("user-agent")){i.headersList.append("user-agent",typeof esbuildDetection==="undefined"?"undici":"node")}if(i.cache==="default"&&(i.headersList.contains("if-modified-since")||i.headersList.contains("if-none-match")||i.headersList.contains("if-unmodified-since")||i.headersList.contains("if-match")||i.headersList.contains("if-range"))){i.cache="no-store"}if(i.cache==="no-cache"&&!i.preventNoCacheCacheControlHeaderModification&&!i.headersList.contains("cache-control")){i.headersList.append("cache-control","max-age=0")}if(i.cache==="no-store"||i.cache==="reload"){if(!i.headersList.contains("pragma")){i.headersList.append("pragma","no-cache")}if(!i.headersList.contains("cache-control")){i.headersList.append("cache-control","no-cache")}}if(i.headersList.contains("range")){i.headersList.append("accept-encoding","identity")}if(!i.headersList.contains("accept-encoding")){if(G(d(i))){i.headersList.append("accept-encoding","br, gzip, deflate")}else{i.headersList.append("accept-encoding","gzip, deflate")}}i.headersList.delete("host");if(Q){}if(E==null){i.cache="no-store"}if(i.mode!=="no-store"&&i.mode!=="reload"){}if(a==null){if(i.mode==="only-if-cached"){return s("only if cached")}const A=await httpNetworkFetch(n,Q,t);if(!Z.has(i.method)&&A.status>=200&&A.status<=399){}if(c&&A.status===304){}if(a==null){a=A}}a.urlList=[...i.urlList];if(i.headersList.contains("range")){a.rangeRequested=true}a.requestIncludesCredentials=Q;if(a.status===407){if(r.window==="no-window"){return s()}if(N(A)){return o(A)}return s("proxy authentication required")}if(a.status===421&&!t&&(r.body==null||r.body.source!=null)){if(N(A)){return o(A)}A.controller.connection.destroy();a=await httpNetworkOrCacheFetch(A,e,true)}if(e){}return a}async function httpNetworkFetch(A,e=false,r=false){P(!A.controller.connection||A.controller.connection.destroyed);A.controller.connection={abort:null,destroyed:false,destroy(A){if(!this.destroyed){this.destroyed=true;this.abort?.(A??new K("The operation was aborted.","AbortError"))}}};const n=A.request;let E=null;const g=A.timingInfo;const Q=null;if(Q==null){n.cache="no-store"}const C=r?"yes":"no";if(n.mode==="websocket"){}else{}let B=null;if(n.body==null&&A.processRequestEndOfBody){queueMicrotask((()=>A.processRequestEndOfBody()))}else if(n.body!=null){const processBodyChunk=async function*(e){if(N(A)){return}yield e;A.processRequestBodyChunkLength?.(e.byteLength)};const processEndOfBody=()=>{if(N(A)){return}if(A.processRequestEndOfBody){A.processRequestEndOfBody()}};const processBodyError=e=>{if(N(A)){return}if(e.name==="AbortError"){A.controller.abort()}else{A.controller.terminate(e)}};B=async function*(){try{for await(const A of n.body.stream){yield*processBodyChunk(A)}processEndOfBody()}catch(A){processBodyError(A)}}()}try{const{body:e,status:t,statusText:r,headersList:s,socket:o}=await dispatch({body:B});if(o){E=i({status:t,statusText:r,headersList:s,socket:o})}else{const o=e[Symbol.asyncIterator]();A.controller.next=()=>o.next();E=i({status:t,statusText:r,headersList:s})}}catch(e){if(e.name==="AbortError"){A.controller.connection.destroy();return o(A,e)}return s(e)}const pullAlgorithm=()=>{A.controller.resume()};const cancelAlgorithm=e=>{A.controller.abort(e)};if(!IA){IA=t(3774).ReadableStream}const I=new IA({async start(e){A.controller.controller=e},async pull(A){await pullAlgorithm(A)},async cancel(A){await cancelAlgorithm(A)}},{highWaterMark:0,size(){return 1}});E.body={stream:I};A.controller.on("terminated",onAborted);A.controller.resume=async()=>{while(true){let e;let t;try{const{done:t,value:r}=await A.controller.next();if(U(A)){break}e=t?undefined:r}catch(r){if(A.controller.ended&&!g.encodedBodySize){e=undefined}else{e=r;t=true}}if(e===undefined){T(A.controller.controller);finalizeResponse(A,E);return}g.decodedBodySize+=e?.byteLength??0;if(t){A.controller.terminate(e);return}A.controller.controller.enqueue(new Uint8Array(e));if(rA(I)){A.controller.terminate();return}if(!A.controller.controller.desiredSize){return}}};function onAborted(e){if(U(A)){E.aborted=true;if(sA(I)){A.controller.controller.error(A.controller.serializedAbortReason)}}else{if(sA(I)){A.controller.controller.error(new TypeError("terminated",{cause:L(e)?e:undefined}))}}A.controller.connection.destroy()}return E;async function dispatch({body:e}){const t=d(n);const r=A.controller.dispatcher;return new Promise(((s,o)=>r.dispatch({path:t.pathname+t.search,origin:t.origin,method:n.method,body:A.controller.dispatcher.isMockActive?n.body&&(n.body.source||n.body.stream):e,headers:n.headersList.entries,maxRedirections:0,upgrade:n.mode==="websocket"?"websocket":undefined},{body:null,abort:null,onConnect(e){const{connection:t}=A.controller;if(t.destroyed){e(new K("The operation was aborted.","AbortError"))}else{A.controller.on("terminated",e);this.abort=t.abort=e}},onHeaders(A,e,t,r){if(A<200){return}let o=[];let i="";const E=new a;if(Array.isArray(e)){for(let A=0;A<e.length;A+=2){const t=e[A+0].toString("latin1");const r=e[A+1].toString("latin1");if(t.toLowerCase()==="content-encoding"){o=r.toLowerCase().split(",").map((A=>A.trim()))}else if(t.toLowerCase()==="location"){i=r}E[z].append(t,r)}}else{const A=Object.keys(e);for(const t of A){const A=e[t];if(t.toLowerCase()==="content-encoding"){o=A.toLowerCase().split(",").map((A=>A.trim())).reverse()}else if(t.toLowerCase()==="location"){i=A}E[z].append(t,A)}}this.body=new AA({read:t});const g=[];const Q=n.redirect==="follow"&&i&&q.has(A);if(n.method!=="HEAD"&&n.method!=="CONNECT"&&!_.includes(A)&&!Q){for(const A of o){if(A==="x-gzip"||A==="gzip"){g.push(c.createGunzip({flush:c.constants.Z_SYNC_FLUSH,finishFlush:c.constants.Z_SYNC_FLUSH}))}else if(A==="deflate"){g.push(c.createInflate())}else if(A==="br"){g.push(c.createBrotliDecompress())}else{g.length=0;break}}}s({status:A,statusText:r,headersList:E[z],body:g.length?eA(this.body,...g,(()=>{})):this.body.on("error",(()=>{}))});return true},onData(e){if(A.controller.dump){return}const t=e;g.encodedBodySize+=t.byteLength;return this.body.push(t)},onComplete(){if(this.abort){A.controller.off("terminated",this.abort)}A.controller.ended=true;this.body.push(null)},onError(e){if(this.abort){A.controller.off("terminated",this.abort)}this.body?.destroy(e);A.controller.terminate(e);o(e)},onUpgrade(A,e,t){if(A!==101){return}const r=new a;for(let A=0;A<e.length;A+=2){const t=e[A+0].toString("latin1");const s=e[A+1].toString("latin1");r[z].append(t,s)}s({status:A,statusText:QA[A],headersList:r[z],socket:t});return true}})))}}A.exports={fetch:fetch,Fetch:Fetch,fetching:fetching,finalizeAndReportTiming:finalizeAndReportTiming}},3056:(A,e,t)=>{"use strict";const{extractBody:r,mixinBody:s,cloneBody:o}=t(8853);const{Headers:n,fill:i,HeadersList:a}=t(6939);const{FinalizationRegistry:E}=t(2132)();const g=t(7586);const{isValidHTTPToken:c,sameOrigin:Q,normalizeMethod:C,makePolicyContainer:B,normalizeMethodRecord:I}=t(4901);const{forbiddenMethodsSet:h,corsSafeListedMethodsSet:l,referrerPolicy:u,requestRedirect:d,requestMode:f,requestCredentials:p,requestCache:y,requestDuplex:R}=t(6732);const{kEnumerableProperty:D}=g;const{kHeaders:w,kSignal:k,kState:m,kGuard:b,kRealm:F}=t(4012);const{webidl:S}=t(9040);const{getGlobalOrigin:N}=t(7074);const{URLSerializer:U}=t(1620);const{kHeadersList:L,kConstruct:M}=t(5817);const T=t(2613);const{getMaxListeners:Y,setMaxListeners:H,getEventListeners:J,defaultMaxListeners:G}=t(4434);let v=globalThis.TransformStream;const V=Symbol("abortController");const x=new E((({signal:A,abort:e})=>{A.removeEventListener("abort",e)}));class Request{constructor(A,e={}){if(A===M){return}S.argumentLengthCheck(arguments,1,{header:"Request constructor"});A=S.converters.RequestInfo(A);e=S.converters.RequestInit(e);this[F]={settingsObject:{baseUrl:N(),get origin(){return this.baseUrl?.origin},policyContainer:B()}};let s=null;let o=null;const E=this[F].settingsObject.baseUrl;let u=null;if(typeof A==="string"){let e;try{e=new URL(A,E)}catch(e){throw new TypeError("Failed to parse URL from "+A,{cause:e})}if(e.username||e.password){throw new TypeError("Request cannot be constructed from a URL that includes credentials: "+A)}s=makeRequest({urlList:[e]});o="cors"}else{T(A instanceof Request);s=A[m];u=A[k]}const d=this[F].settingsObject.origin;let f="client";if(s.window?.constructor?.name==="EnvironmentSettingsObject"&&Q(s.window,d)){f=s.window}if(e.window!=null){throw new TypeError(`'window' option '${f}' must be null`)}if("window"in e){f="no-window"}s=makeRequest({method:s.method,headersList:s.headersList,unsafeRequest:s.unsafeRequest,client:this[F].settingsObject,window:f,priority:s.priority,origin:s.origin,referrer:s.referrer,referrerPolicy:s.referrerPolicy,mode:s.mode,credentials:s.credentials,cache:s.cache,redirect:s.redirect,integrity:s.integrity,keepalive:s.keepalive,reloadNavigation:s.reloadNavigation,historyNavigation:s.historyNavigation,urlList:[...s.urlList]});const p=Object.keys(e).length!==0;if(p){if(s.mode==="navigate"){s.mode="same-origin"}s.reloadNavigation=false;s.historyNavigation=false;s.origin="client";s.referrer="client";s.referrerPolicy="";s.url=s.urlList[s.urlList.length-1];s.urlList=[s.url]}if(e.referrer!==undefined){const A=e.referrer;if(A===""){s.referrer="no-referrer"}else{let e;try{e=new URL(A,E)}catch(e){throw new TypeError(`Referrer "${A}" is not a valid URL.`,{cause:e})}if(e.protocol==="about:"&&e.hostname==="client"||d&&!Q(e,this[F].settingsObject.baseUrl)){s.referrer="client"}else{s.referrer=e}}}if(e.referrerPolicy!==undefined){s.referrerPolicy=e.referrerPolicy}let y;if(e.mode!==undefined){y=e.mode}else{y=o}if(y==="navigate"){throw S.errors.exception({header:"Request constructor",message:"invalid request mode navigate."})}if(y!=null){s.mode=y}if(e.credentials!==undefined){s.credentials=e.credentials}if(e.cache!==undefined){s.cache=e.cache}if(s.cache==="only-if-cached"&&s.mode!=="same-origin"){throw new TypeError("'only-if-cached' can be set only with 'same-origin' mode")}if(e.redirect!==undefined){s.redirect=e.redirect}if(e.integrity!=null){s.integrity=String(e.integrity)}if(e.keepalive!==undefined){s.keepalive=Boolean(e.keepalive)}if(e.method!==undefined){let A=e.method;if(!c(A)){throw new TypeError(`'${A}' is not a valid HTTP method.`)}if(h.has(A.toUpperCase())){throw new TypeError(`'${A}' HTTP method is unsupported.`)}A=I[A]??C(A);s.method=A}if(e.signal!==undefined){u=e.signal}this[m]=s;const R=new AbortController;this[k]=R.signal;this[k][F]=this[F];if(u!=null){if(!u||typeof u.aborted!=="boolean"||typeof u.addEventListener!=="function"){throw new TypeError("Failed to construct 'Request': member signal is not of type AbortSignal.")}if(u.aborted){R.abort(u.reason)}else{this[V]=R;const A=new WeakRef(R);const abort=function(){const e=A.deref();if(e!==undefined){e.abort(this.reason)}};try{if(typeof Y==="function"&&Y(u)===G){H(100,u)}else if(J(u,"abort").length>=G){H(100,u)}}catch{}g.addAbortListener(u,abort);x.register(R,{signal:u,abort:abort})}}this[w]=new n(M);this[w][L]=s.headersList;this[w][b]="request";this[w][F]=this[F];if(y==="no-cors"){if(!l.has(s.method)){throw new TypeError(`'${s.method} is unsupported in no-cors mode.`)}this[w][b]="request-no-cors"}if(p){const A=this[w][L];const t=e.headers!==undefined?e.headers:new a(A);A.clear();if(t instanceof a){for(const[e,r]of t){A.append(e,r)}A.cookies=t.cookies}else{i(this[w],t)}}const D=A instanceof Request?A[m].body:null;if((e.body!=null||D!=null)&&(s.method==="GET"||s.method==="HEAD")){throw new TypeError("Request with GET/HEAD method cannot have body.")}let U=null;if(e.body!=null){const[A,t]=r(e.body,s.keepalive);U=A;if(t&&!this[w][L].contains("content-type")){this[w].append("content-type",t)}}const O=U??D;if(O!=null&&O.source==null){if(U!=null&&e.duplex==null){throw new TypeError("RequestInit: duplex option is required when sending a body.")}if(s.mode!=="same-origin"&&s.mode!=="cors"){throw new TypeError('If request is made from ReadableStream, mode should be "same-origin" or "cors"')}s.useCORSPreflightFlag=true}let P=O;if(U==null&&D!=null){if(g.isDisturbed(D.stream)||D.stream.locked){throw new TypeError("Cannot construct a Request with a Request object that has already been used.")}if(!v){v=t(3774).TransformStream}const A=new v;D.stream.pipeThrough(A);P={source:D.source,length:D.length,stream:A.readable}}this[m].body=P}get method(){S.brandCheck(this,Request);return this[m].method}get url(){S.brandCheck(this,Request);return U(this[m].url)}get headers(){S.brandCheck(this,Request);return this[w]}get destination(){S.brandCheck(this,Request);return this[m].destination}get referrer(){S.brandCheck(this,Request);if(this[m].referrer==="no-referrer"){return""}if(this[m].referrer==="client"){return"about:client"}return this[m].referrer.toString()}get referrerPolicy(){S.brandCheck(this,Request);return this[m].referrerPolicy}get mode(){S.brandCheck(this,Request);return this[m].mode}get credentials(){return this[m].credentials}get cache(){S.brandCheck(this,Request);return this[m].cache}get redirect(){S.brandCheck(this,Request);return this[m].redirect}get integrity(){S.brandCheck(this,Request);return this[m].integrity}get keepalive(){S.brandCheck(this,Request);return this[m].keepalive}get isReloadNavigation(){S.brandCheck(this,Request);return this[m].reloadNavigation}get isHistoryNavigation(){S.brandCheck(this,Request);return this[m].historyNavigation}get signal(){S.brandCheck(this,Request);return this[k]}get body(){S.brandCheck(this,Request);return this[m].body?this[m].body.stream:null}get bodyUsed(){S.brandCheck(this,Request);return!!this[m].body&&g.isDisturbed(this[m].body.stream)}get duplex(){S.brandCheck(this,Request);return"half"}clone(){S.brandCheck(this,Request);if(this.bodyUsed||this.body?.locked){throw new TypeError("unusable")}const A=cloneRequest(this[m]);const e=new Request(M);e[m]=A;e[F]=this[F];e[w]=new n(M);e[w][L]=A.headersList;e[w][b]=this[w][b];e[w][F]=this[w][F];const t=new AbortController;if(this.signal.aborted){t.abort(this.signal.reason)}else{g.addAbortListener(this.signal,(()=>{t.abort(this.signal.reason)}))}e[k]=t.signal;return e}}s(Request);function makeRequest(A){const e={method:"GET",localURLsOnly:false,unsafeRequest:false,body:null,client:null,reservedClient:null,replacesClientId:"",window:"client",keepalive:false,serviceWorkers:"all",initiator:"",destination:"",priority:null,origin:"client",policyContainer:"client",referrer:"client",referrerPolicy:"",mode:"no-cors",useCORSPreflightFlag:false,credentials:"same-origin",useCredentials:false,cache:"default",redirect:"follow",integrity:"",cryptoGraphicsNonceMetadata:"",parserMetadata:"",reloadNavigation:false,historyNavigation:false,userActivation:false,taintedOrigin:false,redirectCount:0,responseTainting:"basic",preventNoCacheCacheControlHeaderModification:false,done:false,timingAllowFailed:false,...A,headersList:A.headersList?new a(A.headersList):new a};e.url=e.urlList[0];return e}function cloneRequest(A){const e=makeRequest({...A,body:null});if(A.body!=null){e.body=o(A.body)}return e}Object.defineProperties(Request.prototype,{method:D,url:D,headers:D,redirect:D,clone:D,signal:D,duplex:D,destination:D,body:D,bodyUsed:D,isHistoryNavigation:D,isReloadNavigation:D,keepalive:D,integrity:D,cache:D,credentials:D,attribute:D,referrerPolicy:D,referrer:D,mode:D,[Symbol.toStringTag]:{value:"Request",configurable:true}});S.converters.Request=S.interfaceConverter(Request);S.converters.RequestInfo=function(A){if(typeof A==="string"){return S.converters.USVString(A)}if(A instanceof Request){return S.converters.Request(A)}return S.converters.USVString(A)};S.converters.AbortSignal=S.interfaceConverter(AbortSignal);S.converters.RequestInit=S.dictionaryConverter([{key:"method",converter:S.converters.ByteString},{key:"headers",converter:S.converters.HeadersInit},{key:"body",converter:S.nullableConverter(S.converters.BodyInit)},{key:"referrer",converter:S.converters.USVString},{key:"referrerPolicy",converter:S.converters.DOMString,allowedValues:u},{key:"mode",converter:S.converters.DOMString,allowedValues:f},{key:"credentials",converter:S.converters.DOMString,allowedValues:p},{key:"cache",converter:S.converters.DOMString,allowedValues:y},{key:"redirect",converter:S.converters.DOMString,allowedValues:d},{key:"integrity",converter:S.converters.DOMString},{key:"keepalive",converter:S.converters.boolean},{key:"signal",converter:S.nullableConverter((A=>S.converters.AbortSignal(A,{strict:false})))},{key:"window",converter:S.converters.any},{key:"duplex",converter:S.converters.DOMString,allowedValues:R}]);A.exports={Request:Request,makeRequest:makeRequest}},5018:(A,e,t)=>{"use strict";const{Headers:r,HeadersList:s,fill:o}=t(6939);const{extractBody:n,cloneBody:i,mixinBody:a}=t(8853);const E=t(7586);const{kEnumerableProperty:g}=E;const{isValidReasonPhrase:c,isCancelled:Q,isAborted:C,isBlobLike:B,serializeJavascriptValueToJSONString:I,isErrorLike:h,isomorphicEncode:l}=t(4901);const{redirectStatusSet:u,nullBodyStatus:d,DOMException:f}=t(6732);const{kState:p,kHeaders:y,kGuard:R,kRealm:D}=t(4012);const{webidl:w}=t(9040);const{FormData:k}=t(1079);const{getGlobalOrigin:m}=t(7074);const{URLSerializer:b}=t(1620);const{kHeadersList:F,kConstruct:S}=t(5817);const N=t(2613);const{types:U}=t(9023);const L=globalThis.ReadableStream||t(3774).ReadableStream;const M=new TextEncoder("utf-8");class Response{static error(){const A={settingsObject:{}};const e=new Response;e[p]=makeNetworkError();e[D]=A;e[y][F]=e[p].headersList;e[y][R]="immutable";e[y][D]=A;return e}static json(A,e={}){w.argumentLengthCheck(arguments,1,{header:"Response.json"});if(e!==null){e=w.converters.ResponseInit(e)}const t=M.encode(I(A));const r=n(t);const s={settingsObject:{}};const o=new Response;o[D]=s;o[y][R]="response";o[y][D]=s;initializeResponse(o,e,{body:r[0],type:"application/json"});return o}static redirect(A,e=302){const t={settingsObject:{}};w.argumentLengthCheck(arguments,1,{header:"Response.redirect"});A=w.converters.USVString(A);e=w.converters["unsigned short"](e);let r;try{r=new URL(A,m())}catch(e){throw Object.assign(new TypeError("Failed to parse URL from "+A),{cause:e})}if(!u.has(e)){throw new RangeError("Invalid status code "+e)}const s=new Response;s[D]=t;s[y][R]="immutable";s[y][D]=t;s[p].status=e;const o=l(b(r));s[p].headersList.append("location",o);return s}constructor(A=null,e={}){if(A!==null){A=w.converters.BodyInit(A)}e=w.converters.ResponseInit(e);this[D]={settingsObject:{}};this[p]=makeResponse({});this[y]=new r(S);this[y][R]="response";this[y][F]=this[p].headersList;this[y][D]=this[D];let t=null;if(A!=null){const[e,r]=n(A);t={body:e,type:r}}initializeResponse(this,e,t)}get type(){w.brandCheck(this,Response);return this[p].type}get url(){w.brandCheck(this,Response);const A=this[p].urlList;const e=A[A.length-1]??null;if(e===null){return""}return b(e,true)}get redirected(){w.brandCheck(this,Response);return this[p].urlList.length>1}get status(){w.brandCheck(this,Response);return this[p].status}get ok(){w.brandCheck(this,Response);return this[p].status>=200&&this[p].status<=299}get statusText(){w.brandCheck(this,Response);return this[p].statusText}get headers(){w.brandCheck(this,Response);return this[y]}get body(){w.brandCheck(this,Response);return this[p].body?this[p].body.stream:null}get bodyUsed(){w.brandCheck(this,Response);return!!this[p].body&&E.isDisturbed(this[p].body.stream)}clone(){w.brandCheck(this,Response);if(this.bodyUsed||this.body&&this.body.locked){throw w.errors.exception({header:"Response.clone",message:"Body has already been consumed."})}const A=cloneResponse(this[p]);const e=new Response;e[p]=A;e[D]=this[D];e[y][F]=A.headersList;e[y][R]=this[y][R];e[y][D]=this[y][D];return e}}a(Response);Object.defineProperties(Response.prototype,{type:g,url:g,status:g,ok:g,redirected:g,statusText:g,headers:g,clone:g,body:g,bodyUsed:g,[Symbol.toStringTag]:{value:"Response",configurable:true}});Object.defineProperties(Response,{json:g,redirect:g,error:g});function cloneResponse(A){if(A.internalResponse){return filterResponse(cloneResponse(A.internalResponse),A.type)}const e=makeResponse({...A,body:null});if(A.body!=null){e.body=i(A.body)}return e}function makeResponse(A){return{aborted:false,rangeRequested:false,timingAllowPassed:false,requestIncludesCredentials:false,type:"default",status:200,timingInfo:null,cacheState:"",statusText:"",...A,headersList:A.headersList?new s(A.headersList):new s,urlList:A.urlList?[...A.urlList]:[]}}function makeNetworkError(A){const e=h(A);return makeResponse({type:"error",status:0,error:e?A:new Error(A?String(A):A),aborted:A&&A.name==="AbortError"})}function makeFilteredResponse(A,e){e={internalResponse:A,...e};return new Proxy(A,{get(A,t){return t in e?e[t]:A[t]},set(A,t,r){N(!(t in e));A[t]=r;return true}})}function filterResponse(A,e){if(e==="basic"){return makeFilteredResponse(A,{type:"basic",headersList:A.headersList})}else if(e==="cors"){return makeFilteredResponse(A,{type:"cors",headersList:A.headersList})}else if(e==="opaque"){return makeFilteredResponse(A,{type:"opaque",urlList:Object.freeze([]),status:0,statusText:"",body:null})}else if(e==="opaqueredirect"){return makeFilteredResponse(A,{type:"opaqueredirect",status:0,statusText:"",headersList:[],body:null})}else{N(false)}}function makeAppropriateNetworkError(A,e=null){N(Q(A));return C(A)?makeNetworkError(Object.assign(new f("The operation was aborted.","AbortError"),{cause:e})):makeNetworkError(Object.assign(new f("Request was cancelled."),{cause:e}))}function initializeResponse(A,e,t){if(e.status!==null&&(e.status<200||e.status>599)){throw new RangeError('init["status"] must be in the range of 200 to 599, inclusive.')}if("statusText"in e&&e.statusText!=null){if(!c(String(e.statusText))){throw new TypeError("Invalid statusText")}}if("status"in e&&e.status!=null){A[p].status=e.status}if("statusText"in e&&e.statusText!=null){A[p].statusText=e.statusText}if("headers"in e&&e.headers!=null){o(A[y],e.headers)}if(t){if(d.includes(A.status)){throw w.errors.exception({header:"Response constructor",message:"Invalid response status code "+A.status})}A[p].body=t.body;if(t.type!=null&&!A[p].headersList.contains("Content-Type")){A[p].headersList.append("content-type",t.type)}}}w.converters.ReadableStream=w.interfaceConverter(L);w.converters.FormData=w.interfaceConverter(k);w.converters.URLSearchParams=w.interfaceConverter(URLSearchParams);w.converters.XMLHttpRequestBodyInit=function(A){if(typeof A==="string"){return w.converters.USVString(A)}if(B(A)){return w.converters.Blob(A,{strict:false})}if(U.isArrayBuffer(A)||U.isTypedArray(A)||U.isDataView(A)){return w.converters.BufferSource(A)}if(E.isFormDataLike(A)){return w.converters.FormData(A,{strict:false})}if(A instanceof URLSearchParams){return w.converters.URLSearchParams(A)}return w.converters.DOMString(A)};w.converters.BodyInit=function(A){if(A instanceof L){return w.converters.ReadableStream(A)}if(A?.[Symbol.asyncIterator]){return A}return w.converters.XMLHttpRequestBodyInit(A)};w.converters.ResponseInit=w.dictionaryConverter([{key:"status",converter:w.converters["unsigned short"],defaultValue:200},{key:"statusText",converter:w.converters.ByteString,defaultValue:""},{key:"headers",converter:w.converters.HeadersInit}]);A.exports={makeNetworkError:makeNetworkError,makeResponse:makeResponse,makeAppropriateNetworkError:makeAppropriateNetworkError,filterResponse:filterResponse,Response:Response,cloneResponse:cloneResponse}},4012:A=>{"use strict";A.exports={kUrl:Symbol("url"),kHeaders:Symbol("headers"),kSignal:Symbol("signal"),kState:Symbol("state"),kGuard:Symbol("guard"),kRealm:Symbol("realm")}},4901:(A,e,t)=>{"use strict";const{redirectStatusSet:r,referrerPolicySet:s,badPortsSet:o}=t(6732);const{getGlobalOrigin:n}=t(7074);const{performance:i}=t(2987);const{isBlobLike:a,toUSVString:E,ReadableStreamFrom:g}=t(7586);const c=t(2613);const{isUint8Array:Q}=t(8253);let C=[];let B;try{B=t(6982);const A=["sha256","sha384","sha512"];C=B.getHashes().filter((e=>A.includes(e)))}catch{}function responseURL(A){const e=A.urlList;const t=e.length;return t===0?null:e[t-1].toString()}function responseLocationURL(A,e){if(!r.has(A.status)){return null}let t=A.headersList.get("location");if(t!==null&&isValidHeaderValue(t)){t=new URL(t,responseURL(A))}if(t&&!t.hash){t.hash=e}return t}function requestCurrentURL(A){return A.urlList[A.urlList.length-1]}function requestBadPort(A){const e=requestCurrentURL(A);if(urlIsHttpHttpsScheme(e)&&o.has(e.port)){return"blocked"}return"allowed"}function isErrorLike(A){return A instanceof Error||(A?.constructor?.name==="Error"||A?.constructor?.name==="DOMException")}function isValidReasonPhrase(A){for(let e=0;e<A.length;++e){const t=A.charCodeAt(e);if(!(t===9||t>=32&&t<=126||t>=128&&t<=255)){return false}}return true}function isTokenCharCode(A){switch(A){case 34:case 40:case 41:case 44:case 47:case 58:case 59:case 60:case 61:case 62:case 63:case 64:case 91:case 92:case 93:case 123:case 125:return false;default:return A>=33&&A<=126}}function isValidHTTPToken(A){if(A.length===0){return false}for(let e=0;e<A.length;++e){if(!isTokenCharCode(A.charCodeAt(e))){return false}}return true}function isValidHeaderName(A){return isValidHTTPToken(A)}function isValidHeaderValue(A){if(A.startsWith("\t")||A.startsWith(" ")||A.endsWith("\t")||A.endsWith(" ")){return false}if(A.includes("\0")||A.includes("\r")||A.includes("\n")){return false}return true}function setRequestReferrerPolicyOnRedirect(A,e){const{headersList:t}=e;const r=(t.get("referrer-policy")??"").split(",");let o="";if(r.length>0){for(let A=r.length;A!==0;A--){const e=r[A-1].trim();if(s.has(e)){o=e;break}}}if(o!==""){A.referrerPolicy=o}}function crossOriginResourcePolicyCheck(){return"allowed"}function corsCheck(){return"success"}function TAOCheck(){return"success"}function appendFetchMetadata(A){let e=null;e=A.mode;A.headersList.set("sec-fetch-mode",e)}function appendRequestOriginHeader(A){let e=A.origin;if(A.responseTainting==="cors"||A.mode==="websocket"){if(e){A.headersList.append("origin",e)}}else if(A.method!=="GET"&&A.method!=="HEAD"){switch(A.referrerPolicy){case"no-referrer":e=null;break;case"no-referrer-when-downgrade":case"strict-origin":case"strict-origin-when-cross-origin":if(A.origin&&urlHasHttpsScheme(A.origin)&&!urlHasHttpsScheme(requestCurrentURL(A))){e=null}break;case"same-origin":if(!sameOrigin(A,requestCurrentURL(A))){e=null}break;default:}if(e){A.headersList.append("origin",e)}}}function coarsenedSharedCurrentTime(A){return i.now()}function createOpaqueTimingInfo(A){return{startTime:A.startTime??0,redirectStartTime:0,redirectEndTime:0,postRedirectStartTime:A.startTime??0,finalServiceWorkerStartTime:0,finalNetworkResponseStartTime:0,finalNetworkRequestStartTime:0,endTime:0,encodedBodySize:0,decodedBodySize:0,finalConnectionTimingInfo:null}}function makePolicyContainer(){return{referrerPolicy:"strict-origin-when-cross-origin"}}function clonePolicyContainer(A){return{referrerPolicy:A.referrerPolicy}}function determineRequestsReferrer(A){const e=A.referrerPolicy;c(e);let t=null;if(A.referrer==="client"){const A=n();if(!A||A.origin==="null"){return"no-referrer"}t=new URL(A)}else if(A.referrer instanceof URL){t=A.referrer}let r=stripURLForReferrer(t);const s=stripURLForReferrer(t,true);if(r.toString().length>4096){r=s}const o=sameOrigin(A,r);const i=isURLPotentiallyTrustworthy(r)&&!isURLPotentiallyTrustworthy(A.url);switch(e){case"origin":return s!=null?s:stripURLForReferrer(t,true);case"unsafe-url":return r;case"same-origin":return o?s:"no-referrer";case"origin-when-cross-origin":return o?r:s;case"strict-origin-when-cross-origin":{const e=requestCurrentURL(A);if(sameOrigin(r,e)){return r}if(isURLPotentiallyTrustworthy(r)&&!isURLPotentiallyTrustworthy(e)){return"no-referrer"}return s}case"strict-origin":case"no-referrer-when-downgrade":default:return i?"no-referrer":s}}function stripURLForReferrer(A,e){c(A instanceof URL);if(A.protocol==="file:"||A.protocol==="about:"||A.protocol==="blank:"){return"no-referrer"}A.username="";A.password="";A.hash="";if(e){A.pathname="";A.search=""}return A}function isURLPotentiallyTrustworthy(A){if(!(A instanceof URL)){return false}if(A.href==="about:blank"||A.href==="about:srcdoc"){return true}if(A.protocol==="data:")return true;if(A.protocol==="file:")return true;return isOriginPotentiallyTrustworthy(A.origin);function isOriginPotentiallyTrustworthy(A){if(A==null||A==="null")return false;const e=new URL(A);if(e.protocol==="https:"||e.protocol==="wss:"){return true}if(/^127(?:\.[0-9]+){0,2}\.[0-9]+$|^\[(?:0*:)*?:?0*1\]$/.test(e.hostname)||(e.hostname==="localhost"||e.hostname.includes("localhost."))||e.hostname.endsWith(".localhost")){return true}return false}}function bytesMatch(A,e){if(B===undefined){return true}const t=parseMetadata(e);if(t==="no metadata"){return true}if(t.length===0){return true}const r=getStrongestMetadata(t);const s=filterMetadataListByAlgorithm(t,r);for(const e of s){const t=e.algo;const r=e.hash;let s=B.createHash(t).update(A).digest("base64");if(s[s.length-1]==="="){if(s[s.length-2]==="="){s=s.slice(0,-2)}else{s=s.slice(0,-1)}}if(compareBase64Mixed(s,r)){return true}}return false}const I=/(?<algo>sha256|sha384|sha512)-((?<hash>[A-Za-z0-9+/]+|[A-Za-z0-9_-]+)={0,2}(?:\s|$)( +[!-~]*)?)?/i;function parseMetadata(A){const e=[];let t=true;for(const r of A.split(" ")){t=false;const A=I.exec(r);if(A===null||A.groups===undefined||A.groups.algo===undefined){continue}const s=A.groups.algo.toLowerCase();if(C.includes(s)){e.push(A.groups)}}if(t===true){return"no metadata"}return e}function getStrongestMetadata(A){let e=A[0].algo;if(e[3]==="5"){return e}for(let t=1;t<A.length;++t){const r=A[t];if(r.algo[3]==="5"){e="sha512";break}else if(e[3]==="3"){continue}else if(r.algo[3]==="3"){e="sha384"}}return e}function filterMetadataListByAlgorithm(A,e){if(A.length===1){return A}let t=0;for(let r=0;r<A.length;++r){if(A[r].algo===e){A[t++]=A[r]}}A.length=t;return A}function compareBase64Mixed(A,e){if(A.length!==e.length){return false}for(let t=0;t<A.length;++t){if(A[t]!==e[t]){if(A[t]==="+"&&e[t]==="-"||A[t]==="/"&&e[t]==="_"){continue}return false}}return true}function tryUpgradeRequestToAPotentiallyTrustworthyURL(A){}function sameOrigin(A,e){if(A.origin===e.origin&&A.origin==="null"){return true}if(A.protocol===e.protocol&&A.hostname===e.hostname&&A.port===e.port){return true}return false}function createDeferredPromise(){let A;let e;const t=new Promise(((t,r)=>{A=t;e=r}));return{promise:t,resolve:A,reject:e}}function isAborted(A){return A.controller.state==="aborted"}function isCancelled(A){return A.controller.state==="aborted"||A.controller.state==="terminated"}const h={delete:"DELETE",DELETE:"DELETE",get:"GET",GET:"GET",head:"HEAD",HEAD:"HEAD",options:"OPTIONS",OPTIONS:"OPTIONS",post:"POST",POST:"POST",put:"PUT",PUT:"PUT"};Object.setPrototypeOf(h,null);function normalizeMethod(A){return h[A.toLowerCase()]??A}function serializeJavascriptValueToJSONString(A){const e=JSON.stringify(A);if(e===undefined){throw new TypeError("Value is not JSON serializable")}c(typeof e==="string");return e}const l=Object.getPrototypeOf(Object.getPrototypeOf([][Symbol.iterator]()));function makeIterator(A,e,t){const r={index:0,kind:t,target:A};const s={next(){if(Object.getPrototypeOf(this)!==s){throw new TypeError(`'next' called on an object that does not implement interface ${e} Iterator.`)}const{index:A,kind:t,target:o}=r;const n=o();const i=n.length;if(A>=i){return{value:undefined,done:true}}const a=n[A];r.index=A+1;return iteratorResult(a,t)},[Symbol.toStringTag]:`${e} Iterator`};Object.setPrototypeOf(s,l);return Object.setPrototypeOf({},s)}function iteratorResult(A,e){let t;switch(e){case"key":{t=A[0];break}case"value":{t=A[1];break}case"key+value":{t=A;break}}return{value:t,done:false}}async function fullyReadBody(A,e,t){const r=e;const s=t;let o;try{o=A.stream.getReader()}catch(A){s(A);return}try{const A=await readAllBytes(o);r(A)}catch(A){s(A)}}let u=globalThis.ReadableStream;function isReadableStreamLike(A){if(!u){u=t(3774).ReadableStream}return A instanceof u||A[Symbol.toStringTag]==="ReadableStream"&&typeof A.tee==="function"}const d=65535;function isomorphicDecode(A){if(A.length<d){return String.fromCharCode(...A)}return A.reduce(((A,e)=>A+String.fromCharCode(e)),"")}function readableStreamClose(A){try{A.close()}catch(A){if(!A.message.includes("Controller is already closed")){throw A}}}function isomorphicEncode(A){for(let e=0;e<A.length;e++){c(A.charCodeAt(e)<=255)}return A}async function readAllBytes(A){const e=[];let t=0;while(true){const{done:r,value:s}=await A.read();if(r){return Buffer.concat(e,t)}if(!Q(s)){throw new TypeError("Received non-Uint8Array chunk")}e.push(s);t+=s.length}}function urlIsLocal(A){c("protocol"in A);const e=A.protocol;return e==="about:"||e==="blob:"||e==="data:"}function urlHasHttpsScheme(A){if(typeof A==="string"){return A.startsWith("https:")}return A.protocol==="https:"}function urlIsHttpHttpsScheme(A){c("protocol"in A);const e=A.protocol;return e==="http:"||e==="https:"}const f=Object.hasOwn||((A,e)=>Object.prototype.hasOwnProperty.call(A,e));A.exports={isAborted:isAborted,isCancelled:isCancelled,createDeferredPromise:createDeferredPromise,ReadableStreamFrom:g,toUSVString:E,tryUpgradeRequestToAPotentiallyTrustworthyURL:tryUpgradeRequestToAPotentiallyTrustworthyURL,coarsenedSharedCurrentTime:coarsenedSharedCurrentTime,determineRequestsReferrer:determineRequestsReferrer,makePolicyContainer:makePolicyContainer,clonePolicyContainer:clonePolicyContainer,appendFetchMetadata:appendFetchMetadata,appendRequestOriginHeader:appendRequestOriginHeader,TAOCheck:TAOCheck,corsCheck:corsCheck,crossOriginResourcePolicyCheck:crossOriginResourcePolicyCheck,createOpaqueTimingInfo:createOpaqueTimingInfo,setRequestReferrerPolicyOnRedirect:setRequestReferrerPolicyOnRedirect,isValidHTTPToken:isValidHTTPToken,requestBadPort:requestBadPort,requestCurrentURL:requestCurrentURL,responseURL:responseURL,responseLocationURL:responseLocationURL,isBlobLike:a,isURLPotentiallyTrustworthy:isURLPotentiallyTrustworthy,isValidReasonPhrase:isValidReasonPhrase,sameOrigin:sameOrigin,normalizeMethod:normalizeMethod,serializeJavascriptValueToJSONString:serializeJavascriptValueToJSONString,makeIterator:makeIterator,isValidHeaderName:isValidHeaderName,isValidHeaderValue:isValidHeaderValue,hasOwn:f,isErrorLike:isErrorLike,fullyReadBody:fullyReadBody,bytesMatch:bytesMatch,isReadableStreamLike:isReadableStreamLike,readableStreamClose:readableStreamClose,isomorphicEncode:isomorphicEncode,isomorphicDecode:isomorphicDecode,urlIsLocal:urlIsLocal,urlHasHttpsScheme:urlHasHttpsScheme,urlIsHttpHttpsScheme:urlIsHttpHttpsScheme,readAllBytes:readAllBytes,normalizeMethodRecord:h,parseMetadata:parseMetadata}},9040:(A,e,t)=>{"use strict";const{types:r}=t(9023);const{hasOwn:s,toUSVString:o}=t(4901);const n={};n.converters={};n.util={};n.errors={};n.errors.exception=function(A){return new TypeError(`${A.header}: ${A.message}`)};n.errors.conversionFailed=function(A){const e=A.types.length===1?"":" one of";const t=`${A.argument} could not be converted to`+`${e}: ${A.types.join(", ")}.`;return n.errors.exception({header:A.prefix,message:t})};n.errors.invalidArgument=function(A){return n.errors.exception({header:A.prefix,message:`"${A.value}" is an invalid ${A.type}.`})};n.brandCheck=function(A,e,t=undefined){if(t?.strict!==false&&!(A instanceof e)){throw new TypeError("Illegal invocation")}else{return A?.[Symbol.toStringTag]===e.prototype[Symbol.toStringTag]}};n.argumentLengthCheck=function({length:A},e,t){if(A<e){throw n.errors.exception({message:`${e} argument${e!==1?"s":""} required, `+`but${A?" only":""} ${A} found.`,...t})}};n.illegalConstructor=function(){throw n.errors.exception({header:"TypeError",message:"Illegal constructor"})};n.util.Type=function(A){switch(typeof A){case"undefined":return"Undefined";case"boolean":return"Boolean";case"string":return"String";case"symbol":return"Symbol";case"number":return"Number";case"bigint":return"BigInt";case"function":case"object":{if(A===null){return"Null"}return"Object"}}};n.util.ConvertToInt=function(A,e,t,r={}){let s;let o;if(e===64){s=Math.pow(2,53)-1;if(t==="unsigned"){o=0}else{o=Math.pow(-2,53)+1}}else if(t==="unsigned"){o=0;s=Math.pow(2,e)-1}else{o=Math.pow(-2,e)-1;s=Math.pow(2,e-1)-1}let i=Number(A);if(i===0){i=0}if(r.enforceRange===true){if(Number.isNaN(i)||i===Number.POSITIVE_INFINITY||i===Number.NEGATIVE_INFINITY){throw n.errors.exception({header:"Integer conversion",message:`Could not convert ${A} to an integer.`})}i=n.util.IntegerPart(i);if(i<o||i>s){throw n.errors.exception({header:"Integer conversion",message:`Value must be between ${o}-${s}, got ${i}.`})}return i}if(!Number.isNaN(i)&&r.clamp===true){i=Math.min(Math.max(i,o),s);if(Math.floor(i)%2===0){i=Math.floor(i)}else{i=Math.ceil(i)}return i}if(Number.isNaN(i)||i===0&&Object.is(0,i)||i===Number.POSITIVE_INFINITY||i===Number.NEGATIVE_INFINITY){return 0}i=n.util.IntegerPart(i);i=i%Math.pow(2,e);if(t==="signed"&&i>=Math.pow(2,e)-1){return i-Math.pow(2,e)}return i};n.util.IntegerPart=function(A){const e=Math.floor(Math.abs(A));if(A<0){return-1*e}return e};n.sequenceConverter=function(A){return e=>{if(n.util.Type(e)!=="Object"){throw n.errors.exception({header:"Sequence",message:`Value of type ${n.util.Type(e)} is not an Object.`})}const t=e?.[Symbol.iterator]?.();const r=[];if(t===undefined||typeof t.next!=="function"){throw n.errors.exception({header:"Sequence",message:"Object is not an iterator."})}while(true){const{done:e,value:s}=t.next();if(e){break}r.push(A(s))}return r}};n.recordConverter=function(A,e){return t=>{if(n.util.Type(t)!=="Object"){throw n.errors.exception({header:"Record",message:`Value of type ${n.util.Type(t)} is not an Object.`})}const s={};if(!r.isProxy(t)){const r=Object.keys(t);for(const o of r){const r=A(o);const n=e(t[o]);s[r]=n}return s}const o=Reflect.ownKeys(t);for(const r of o){const o=Reflect.getOwnPropertyDescriptor(t,r);if(o?.enumerable){const o=A(r);const n=e(t[r]);s[o]=n}}return s}};n.interfaceConverter=function(A){return(e,t={})=>{if(t.strict!==false&&!(e instanceof A)){throw n.errors.exception({header:A.name,message:`Expected ${e} to be an instance of ${A.name}.`})}return e}};n.dictionaryConverter=function(A){return e=>{const t=n.util.Type(e);const r={};if(t==="Null"||t==="Undefined"){return r}else if(t!=="Object"){throw n.errors.exception({header:"Dictionary",message:`Expected ${e} to be one of: Null, Undefined, Object.`})}for(const t of A){const{key:A,defaultValue:o,required:i,converter:a}=t;if(i===true){if(!s(e,A)){throw n.errors.exception({header:"Dictionary",message:`Missing required key "${A}".`})}}let E=e[A];const g=s(t,"defaultValue");if(g&&E!==null){E=E??o}if(i||g||E!==undefined){E=a(E);if(t.allowedValues&&!t.allowedValues.includes(E)){throw n.errors.exception({header:"Dictionary",message:`${E} is not an accepted type. Expected one of ${t.allowedValues.join(", ")}.`})}r[A]=E}}return r}};n.nullableConverter=function(A){return e=>{if(e===null){return e}return A(e)}};n.converters.DOMString=function(A,e={}){if(A===null&&e.legacyNullToEmptyString){return""}if(typeof A==="symbol"){throw new TypeError("Could not convert argument of type symbol to string.")}return String(A)};n.converters.ByteString=function(A){const e=n.converters.DOMString(A);for(let A=0;A<e.length;A++){if(e.charCodeAt(A)>255){throw new TypeError("Cannot convert argument to a ByteString because the character at "+`index ${A} has a value of ${e.charCodeAt(A)} which is greater than 255.`)}}return e};n.converters.USVString=o;n.converters.boolean=function(A){const e=Boolean(A);return e};n.converters.any=function(A){return A};n.converters["long long"]=function(A){const e=n.util.ConvertToInt(A,64,"signed");return e};n.converters["unsigned long long"]=function(A){const e=n.util.ConvertToInt(A,64,"unsigned");return e};n.converters["unsigned long"]=function(A){const e=n.util.ConvertToInt(A,32,"unsigned");return e};n.converters["unsigned short"]=function(A,e){const t=n.util.ConvertToInt(A,16,"unsigned",e);return t};n.converters.ArrayBuffer=function(A,e={}){if(n.util.Type(A)!=="Object"||!r.isAnyArrayBuffer(A)){throw n.errors.conversionFailed({prefix:`${A}`,argument:`${A}`,types:["ArrayBuffer"]})}if(e.allowShared===false&&r.isSharedArrayBuffer(A)){throw n.errors.exception({header:"ArrayBuffer",message:"SharedArrayBuffer is not allowed."})}return A};n.converters.TypedArray=function(A,e,t={}){if(n.util.Type(A)!=="Object"||!r.isTypedArray(A)||A.constructor.name!==e.name){throw n.errors.conversionFailed({prefix:`${e.name}`,argument:`${A}`,types:[e.name]})}if(t.allowShared===false&&r.isSharedArrayBuffer(A.buffer)){throw n.errors.exception({header:"ArrayBuffer",message:"SharedArrayBuffer is not allowed."})}return A};n.converters.DataView=function(A,e={}){if(n.util.Type(A)!=="Object"||!r.isDataView(A)){throw n.errors.exception({header:"DataView",message:"Object is not a DataView."})}if(e.allowShared===false&&r.isSharedArrayBuffer(A.buffer)){throw n.errors.exception({header:"ArrayBuffer",message:"SharedArrayBuffer is not allowed."})}return A};n.converters.BufferSource=function(A,e={}){if(r.isAnyArrayBuffer(A)){return n.converters.ArrayBuffer(A,e)}if(r.isTypedArray(A)){return n.converters.TypedArray(A,A.constructor)}if(r.isDataView(A)){return n.converters.DataView(A,e)}throw new TypeError(`Could not convert ${A} to a BufferSource.`)};n.converters["sequence<ByteString>"]=n.sequenceConverter(n.converters.ByteString);n.converters["sequence<sequence<ByteString>>"]=n.sequenceConverter(n.converters["sequence<ByteString>"]);n.converters["record<ByteString, ByteString>"]=n.recordConverter(n.converters.ByteString,n.converters.ByteString);A.exports={webidl:n}},1926:A=>{"use strict";function getEncoding(A){if(!A){return"failure"}switch(A.trim().toLowerCase()){case"unicode-1-1-utf-8":case"unicode11utf8":case"unicode20utf8":case"utf-8":case"utf8":case"x-unicode20utf8":return"UTF-8";case"866":case"cp866":case"csibm866":case"ibm866":return"IBM866";case"csisolatin2":case"iso-8859-2":case"iso-ir-101":case"iso8859-2":case"iso88592":case"iso_8859-2":case"iso_8859-2:1987":case"l2":case"latin2":return"ISO-8859-2";case"csisolatin3":case"iso-8859-3":case"iso-ir-109":case"iso8859-3":case"iso88593":case"iso_8859-3":case"iso_8859-3:1988":case"l3":case"latin3":return"ISO-8859-3";case"csisolatin4":case"iso-8859-4":case"iso-ir-110":case"iso8859-4":case"iso88594":case"iso_8859-4":case"iso_8859-4:1988":case"l4":case"latin4":return"ISO-8859-4";case"csisolatincyrillic":case"cyrillic":case"iso-8859-5":case"iso-ir-144":case"iso8859-5":case"iso88595":case"iso_8859-5":case"iso_8859-5:1988":return"ISO-8859-5";case"arabic":case"asmo-708":case"csiso88596e":case"csiso88596i":case"csisolatinarabic":case"ecma-114":case"iso-8859-6":case"iso-8859-6-e":case"iso-8859-6-i":case"iso-ir-127":case"iso8859-6":case"iso88596":case"iso_8859-6":case"iso_8859-6:1987":return"ISO-8859-6";case"csisolatingreek":case"ecma-118":case"elot_928":case"greek":case"greek8":case"iso-8859-7":case"iso-ir-126":case"iso8859-7":case"iso88597":case"iso_8859-7":case"iso_8859-7:1987":case"sun_eu_greek":return"ISO-8859-7";case"csiso88598e":case"csisolatinhebrew":case"hebrew":case"iso-8859-8":case"iso-8859-8-e":case"iso-ir-138":case"iso8859-8":case"iso88598":case"iso_8859-8":case"iso_8859-8:1988":case"visual":return"ISO-8859-8";case"csiso88598i":case"iso-8859-8-i":case"logical":return"ISO-8859-8-I";case"csisolatin6":case"iso-8859-10":case"iso-ir-157":case"iso8859-10":case"iso885910":case"l6":case"latin6":return"ISO-8859-10";case"iso-8859-13":case"iso8859-13":case"iso885913":return"ISO-8859-13";case"iso-8859-14":case"iso8859-14":case"iso885914":return"ISO-8859-14";case"csisolatin9":case"iso-8859-15":case"iso8859-15":case"iso885915":case"iso_8859-15":case"l9":return"ISO-8859-15";case"iso-8859-16":return"ISO-8859-16";case"cskoi8r":case"koi":case"koi8":case"koi8-r":case"koi8_r":return"KOI8-R";case"koi8-ru":case"koi8-u":return"KOI8-U";case"csmacintosh":case"mac":case"macintosh":case"x-mac-roman":return"macintosh";case"iso-8859-11":case"iso8859-11":case"iso885911":case"tis-620":case"windows-874":return"windows-874";case"cp1250":case"windows-1250":case"x-cp1250":return"windows-1250";case"cp1251":case"windows-1251":case"x-cp1251":return"windows-1251";case"ansi_x3.4-1968":case"ascii":case"cp1252":case"cp819":case"csisolatin1":case"ibm819":case"iso-8859-1":case"iso-ir-100":case"iso8859-1":case"iso88591":case"iso_8859-1":case"iso_8859-1:1987":case"l1":case"latin1":case"us-ascii":case"windows-1252":case"x-cp1252":return"windows-1252";case"cp1253":case"windows-1253":case"x-cp1253":return"windows-1253";case"cp1254":case"csisolatin5":case"iso-8859-9":case"iso-ir-148":case"iso8859-9":case"iso88599":case"iso_8859-9":case"iso_8859-9:1989":case"l5":case"latin5":case"windows-1254":case"x-cp1254":return"windows-1254";case"cp1255":case"windows-1255":case"x-cp1255":return"windows-1255";case"cp1256":case"windows-1256":case"x-cp1256":return"windows-1256";case"cp1257":case"windows-1257":case"x-cp1257":return"windows-1257";case"cp1258":case"windows-1258":case"x-cp1258":return"windows-1258";case"x-mac-cyrillic":case"x-mac-ukrainian":return"x-mac-cyrillic";case"chinese":case"csgb2312":case"csiso58gb231280":case"gb2312":case"gb_2312":case"gb_2312-80":case"gbk":case"iso-ir-58":case"x-gbk":return"GBK";case"gb18030":return"gb18030";case"big5":case"big5-hkscs":case"cn-big5":case"csbig5":case"x-x-big5":return"Big5";case"cseucpkdfmtjapanese":case"euc-jp":case"x-euc-jp":return"EUC-JP";case"csiso2022jp":case"iso-2022-jp":return"ISO-2022-JP";case"csshiftjis":case"ms932":case"ms_kanji":case"shift-jis":case"shift_jis":case"sjis":case"windows-31j":case"x-sjis":return"Shift_JIS";case"cseuckr":case"csksc56011987":case"euc-kr":case"iso-ir-149":case"korean":case"ks_c_5601-1987":case"ks_c_5601-1989":case"ksc5601":case"ksc_5601":case"windows-949":return"EUC-KR";case"csiso2022kr":case"hz-gb-2312":case"iso-2022-cn":case"iso-2022-cn-ext":case"iso-2022-kr":case"replacement":return"replacement";case"unicodefffe":case"utf-16be":return"UTF-16BE";case"csunicode":case"iso-10646-ucs-2":case"ucs-2":case"unicode":case"unicodefeff":case"utf-16":case"utf-16le":return"UTF-16LE";case"x-user-defined":return"x-user-defined";default:return"failure"}}A.exports={getEncoding:getEncoding}},170:(A,e,t)=>{"use strict";const{staticPropertyDescriptors:r,readOperation:s,fireAProgressEvent:o}=t(1251);const{kState:n,kError:i,kResult:a,kEvents:E,kAborted:g}=t(4094);const{webidl:c}=t(9040);const{kEnumerableProperty:Q}=t(7586);class FileReader extends EventTarget{constructor(){super();this[n]="empty";this[a]=null;this[i]=null;this[E]={loadend:null,error:null,abort:null,load:null,progress:null,loadstart:null}}readAsArrayBuffer(A){c.brandCheck(this,FileReader);c.argumentLengthCheck(arguments,1,{header:"FileReader.readAsArrayBuffer"});A=c.converters.Blob(A,{strict:false});s(this,A,"ArrayBuffer")}readAsBinaryString(A){c.brandCheck(this,FileReader);c.argumentLengthCheck(arguments,1,{header:"FileReader.readAsBinaryString"});A=c.converters.Blob(A,{strict:false});s(this,A,"BinaryString")}readAsText(A,e=undefined){c.brandCheck(this,FileReader);c.argumentLengthCheck(arguments,1,{header:"FileReader.readAsText"});A=c.converters.Blob(A,{strict:false});if(e!==undefined){e=c.converters.DOMString(e)}s(this,A,"Text",e)}readAsDataURL(A){c.brandCheck(this,FileReader);c.argumentLengthCheck(arguments,1,{header:"FileReader.readAsDataURL"});A=c.converters.Blob(A,{strict:false});s(this,A,"DataURL")}abort(){if(this[n]==="empty"||this[n]==="done"){this[a]=null;return}if(this[n]==="loading"){this[n]="done";this[a]=null}this[g]=true;o("abort",this);if(this[n]!=="loading"){o("loadend",this)}}get readyState(){c.brandCheck(this,FileReader);switch(this[n]){case"empty":return this.EMPTY;case"loading":return this.LOADING;case"done":return this.DONE}}get result(){c.brandCheck(this,FileReader);return this[a]}get error(){c.brandCheck(this,FileReader);return this[i]}get onloadend(){c.brandCheck(this,FileReader);return this[E].loadend}set onloadend(A){c.brandCheck(this,FileReader);if(this[E].loadend){this.removeEventListener("loadend",this[E].loadend)}if(typeof A==="function"){this[E].loadend=A;this.addEventListener("loadend",A)}else{this[E].loadend=null}}get onerror(){c.brandCheck(this,FileReader);return this[E].error}set onerror(A){c.brandCheck(this,FileReader);if(this[E].error){this.removeEventListener("error",this[E].error)}if(typeof A==="function"){this[E].error=A;this.addEventListener("error",A)}else{this[E].error=null}}get onloadstart(){c.brandCheck(this,FileReader);return this[E].loadstart}set onloadstart(A){c.brandCheck(this,FileReader);if(this[E].loadstart){this.removeEventListener("loadstart",this[E].loadstart)}if(typeof A==="function"){this[E].loadstart=A;this.addEventListener("loadstart",A)}else{this[E].loadstart=null}}get onprogress(){c.brandCheck(this,FileReader);return this[E].progress}set onprogress(A){c.brandCheck(this,FileReader);if(this[E].progress){this.removeEventListener("progress",this[E].progress)}if(typeof A==="function"){this[E].progress=A;this.addEventListener("progress",A)}else{this[E].progress=null}}get onload(){c.brandCheck(this,FileReader);return this[E].load}set onload(A){c.brandCheck(this,FileReader);if(this[E].load){this.removeEventListener("load",this[E].load)}if(typeof A==="function"){this[E].load=A;this.addEventListener("load",A)}else{this[E].load=null}}get onabort(){c.brandCheck(this,FileReader);return this[E].abort}set onabort(A){c.brandCheck(this,FileReader);if(this[E].abort){this.removeEventListener("abort",this[E].abort)}if(typeof A==="function"){this[E].abort=A;this.addEventListener("abort",A)}else{this[E].abort=null}}}FileReader.EMPTY=FileReader.prototype.EMPTY=0;FileReader.LOADING=FileReader.prototype.LOADING=1;FileReader.DONE=FileReader.prototype.DONE=2;Object.defineProperties(FileReader.prototype,{EMPTY:r,LOADING:r,DONE:r,readAsArrayBuffer:Q,readAsBinaryString:Q,readAsText:Q,readAsDataURL:Q,abort:Q,readyState:Q,result:Q,error:Q,onloadstart:Q,onprogress:Q,onload:Q,onabort:Q,onerror:Q,onloadend:Q,[Symbol.toStringTag]:{value:"FileReader",writable:false,enumerable:false,configurable:true}});Object.defineProperties(FileReader,{EMPTY:r,LOADING:r,DONE:r});A.exports={FileReader:FileReader}},1258:(A,e,t)=>{"use strict";const{webidl:r}=t(9040);const s=Symbol("ProgressEvent state");class ProgressEvent extends Event{constructor(A,e={}){A=r.converters.DOMString(A);e=r.converters.ProgressEventInit(e??{});super(A,e);this[s]={lengthComputable:e.lengthComputable,loaded:e.loaded,total:e.total}}get lengthComputable(){r.brandCheck(this,ProgressEvent);return this[s].lengthComputable}get loaded(){r.brandCheck(this,ProgressEvent);return this[s].loaded}get total(){r.brandCheck(this,ProgressEvent);return this[s].total}}r.converters.ProgressEventInit=r.dictionaryConverter([{key:"lengthComputable",converter:r.converters.boolean,defaultValue:false},{key:"loaded",converter:r.converters["unsigned long long"],defaultValue:0},{key:"total",converter:r.converters["unsigned long long"],defaultValue:0},{key:"bubbles",converter:r.converters.boolean,defaultValue:false},{key:"cancelable",converter:r.converters.boolean,defaultValue:false},{key:"composed",converter:r.converters.boolean,defaultValue:false}]);A.exports={ProgressEvent:ProgressEvent}},4094:A=>{"use strict";A.exports={kState:Symbol("FileReader state"),kResult:Symbol("FileReader result"),kError:Symbol("FileReader error"),kLastProgressEventFired:Symbol("FileReader last progress event fired timestamp"),kEvents:Symbol("FileReader events"),kAborted:Symbol("FileReader aborted")}},1251:(A,e,t)=>{"use strict";const{kState:r,kError:s,kResult:o,kAborted:n,kLastProgressEventFired:i}=t(4094);const{ProgressEvent:a}=t(1258);const{getEncoding:E}=t(1926);const{DOMException:g}=t(6732);const{serializeAMimeType:c,parseMIMEType:Q}=t(1620);const{types:C}=t(9023);const{StringDecoder:B}=t(3193);const{btoa:I}=t(181);const h={enumerable:true,writable:false,configurable:false};function readOperation(A,e,t,a){if(A[r]==="loading"){throw new g("Invalid state","InvalidStateError")}A[r]="loading";A[o]=null;A[s]=null;const E=e.stream();const c=E.getReader();const Q=[];let B=c.read();let I=true;(async()=>{while(!A[n]){try{const{done:E,value:g}=await B;if(I&&!A[n]){queueMicrotask((()=>{fireAProgressEvent("loadstart",A)}))}I=false;if(!E&&C.isUint8Array(g)){Q.push(g);if((A[i]===undefined||Date.now()-A[i]>=50)&&!A[n]){A[i]=Date.now();queueMicrotask((()=>{fireAProgressEvent("progress",A)}))}B=c.read()}else if(E){queueMicrotask((()=>{A[r]="done";try{const r=packageData(Q,t,e.type,a);if(A[n]){return}A[o]=r;fireAProgressEvent("load",A)}catch(e){A[s]=e;fireAProgressEvent("error",A)}if(A[r]!=="loading"){fireAProgressEvent("loadend",A)}}));break}}catch(e){if(A[n]){return}queueMicrotask((()=>{A[r]="done";A[s]=e;fireAProgressEvent("error",A);if(A[r]!=="loading"){fireAProgressEvent("loadend",A)}}));break}}})()}function fireAProgressEvent(A,e){const t=new a(A,{bubbles:false,cancelable:false});e.dispatchEvent(t)}function packageData(A,e,t,r){switch(e){case"DataURL":{let e="data:";const r=Q(t||"application/octet-stream");if(r!=="failure"){e+=c(r)}e+=";base64,";const s=new B("latin1");for(const t of A){e+=I(s.write(t))}e+=I(s.end());return e}case"Text":{let e="failure";if(r){e=E(r)}if(e==="failure"&&t){const A=Q(t);if(A!=="failure"){e=E(A.parameters.get("charset"))}}if(e==="failure"){e="UTF-8"}return decode(A,e)}case"ArrayBuffer":{const e=combineByteSequences(A);return e.buffer}case"BinaryString":{let e="";const t=new B("latin1");for(const r of A){e+=t.write(r)}e+=t.end();return e}}}function decode(A,e){const t=combineByteSequences(A);const r=BOMSniffing(t);let s=0;if(r!==null){e=r;s=r==="UTF-8"?3:2}const o=t.slice(s);return new TextDecoder(e).decode(o)}function BOMSniffing(A){const[e,t,r]=A;if(e===239&&t===187&&r===191){return"UTF-8"}else if(e===254&&t===255){return"UTF-16BE"}else if(e===255&&t===254){return"UTF-16LE"}return null}function combineByteSequences(A){const e=A.reduce(((A,e)=>A+e.byteLength),0);let t=0;return A.reduce(((A,e)=>{A.set(e,t);t+=e.byteLength;return A}),new Uint8Array(e))}A.exports={staticPropertyDescriptors:h,readOperation:readOperation,fireAProgressEvent:fireAProgressEvent}},4127:(A,e,t)=>{"use strict";const r=Symbol.for("undici.globalDispatcher.1");const{InvalidArgumentError:s}=t(1369);const o=t(2415);if(getGlobalDispatcher()===undefined){setGlobalDispatcher(new o)}function setGlobalDispatcher(A){if(!A||typeof A.dispatch!=="function"){throw new s("Argument agent must implement Agent")}Object.defineProperty(globalThis,r,{value:A,writable:true,enumerable:false,configurable:false})}function getGlobalDispatcher(){return globalThis[r]}A.exports={setGlobalDispatcher:setGlobalDispatcher,getGlobalDispatcher:getGlobalDispatcher}},334:A=>{"use strict";A.exports=class DecoratorHandler{constructor(A){this.handler=A}onConnect(...A){return this.handler.onConnect(...A)}onError(...A){return this.handler.onError(...A)}onUpgrade(...A){return this.handler.onUpgrade(...A)}onHeaders(...A){return this.handler.onHeaders(...A)}onData(...A){return this.handler.onData(...A)}onComplete(...A){return this.handler.onComplete(...A)}onBodySent(...A){return this.handler.onBodySent(...A)}}},9221:(A,e,t)=>{"use strict";const r=t(7586);const{kBodyUsed:s}=t(5817);const o=t(2613);const{InvalidArgumentError:n}=t(1369);const i=t(4434);const a=[300,301,302,303,307,308];const E=Symbol("body");class BodyAsyncIterable{constructor(A){this[E]=A;this[s]=false}async*[Symbol.asyncIterator](){o(!this[s],"disturbed");this[s]=true;yield*this[E]}}class RedirectHandler{constructor(A,e,t,a){if(e!=null&&(!Number.isInteger(e)||e<0)){throw new n("maxRedirections must be a positive number")}r.validateHandler(a,t.method,t.upgrade);this.dispatch=A;this.location=null;this.abort=null;this.opts={...t,maxRedirections:0};this.maxRedirections=e;this.handler=a;this.history=[];if(r.isStream(this.opts.body)){if(r.bodyLength(this.opts.body)===0){this.opts.body.on("data",(function(){o(false)}))}if(typeof this.opts.body.readableDidRead!=="boolean"){this.opts.body[s]=false;i.prototype.on.call(this.opts.body,"data",(function(){this[s]=true}))}}else if(this.opts.body&&typeof this.opts.body.pipeTo==="function"){this.opts.body=new BodyAsyncIterable(this.opts.body)}else if(this.opts.body&&typeof this.opts.body!=="string"&&!ArrayBuffer.isView(this.opts.body)&&r.isIterable(this.opts.body)){this.opts.body=new BodyAsyncIterable(this.opts.body)}}onConnect(A){this.abort=A;this.handler.onConnect(A,{history:this.history})}onUpgrade(A,e,t){this.handler.onUpgrade(A,e,t)}onError(A){this.handler.onError(A)}onHeaders(A,e,t,s){this.location=this.history.length>=this.maxRedirections||r.isDisturbed(this.opts.body)?null:parseLocation(A,e);if(this.opts.origin){this.history.push(new URL(this.opts.path,this.opts.origin))}if(!this.location){return this.handler.onHeaders(A,e,t,s)}const{origin:o,pathname:n,search:i}=r.parseURL(new URL(this.location,this.opts.origin&&new URL(this.opts.path,this.opts.origin)));const a=i?`${n}${i}`:n;this.opts.headers=cleanRequestHeaders(this.opts.headers,A===303,this.opts.origin!==o);this.opts.path=a;this.opts.origin=o;this.opts.maxRedirections=0;this.opts.query=null;if(A===303&&this.opts.method!=="HEAD"){this.opts.method="GET";this.opts.body=null}}onData(A){if(this.location){}else{return this.handler.onData(A)}}onComplete(A){if(this.location){this.location=null;this.abort=null;this.dispatch(this.opts,this)}else{this.handler.onComplete(A)}}onBodySent(A){if(this.handler.onBodySent){this.handler.onBodySent(A)}}}function parseLocation(A,e){if(a.indexOf(A)===-1){return null}for(let A=0;A<e.length;A+=2){if(e[A].toString().toLowerCase()==="location"){return e[A+1]}}}function shouldRemoveHeader(A,e,t){if(A.length===4){return r.headerNameToString(A)==="host"}if(e&&r.headerNameToString(A).startsWith("content-")){return true}if(t&&(A.length===13||A.length===6||A.length===19)){const e=r.headerNameToString(A);return e==="authorization"||e==="cookie"||e==="proxy-authorization"}return false}function cleanRequestHeaders(A,e,t){const r=[];if(Array.isArray(A)){for(let s=0;s<A.length;s+=2){if(!shouldRemoveHeader(A[s],e,t)){r.push(A[s],A[s+1])}}}else if(A&&typeof A==="object"){for(const s of Object.keys(A)){if(!shouldRemoveHeader(s,e,t)){r.push(s,A[s])}}}else{o(A==null,"headers must be an object or an array")}return r}A.exports=RedirectHandler},3783:(A,e,t)=>{const r=t(2613);const{kRetryHandlerDefaultRetry:s}=t(5817);const{RequestRetryError:o}=t(1369);const{isDisturbed:n,parseHeaders:i,parseRangeHeader:a}=t(7586);function calculateRetryAfterHeader(A){const e=Date.now();const t=new Date(A).getTime()-e;return t}class RetryHandler{constructor(A,e){const{retryOptions:t,...r}=A;const{retry:o,maxRetries:n,maxTimeout:i,minTimeout:a,timeoutFactor:E,methods:g,errorCodes:c,retryAfter:Q,statusCodes:C}=t??{};this.dispatch=e.dispatch;this.handler=e.handler;this.opts=r;this.abort=null;this.aborted=false;this.retryOpts={retry:o??RetryHandler[s],retryAfter:Q??true,maxTimeout:i??30*1e3,timeout:a??500,timeoutFactor:E??2,maxRetries:n??5,methods:g??["GET","HEAD","OPTIONS","PUT","DELETE","TRACE"],statusCodes:C??[500,502,503,504,429],errorCodes:c??["ECONNRESET","ECONNREFUSED","ENOTFOUND","ENETDOWN","ENETUNREACH","EHOSTDOWN","EHOSTUNREACH","EPIPE"]};this.retryCount=0;this.start=0;this.end=null;this.etag=null;this.resume=null;this.handler.onConnect((A=>{this.aborted=true;if(this.abort){this.abort(A)}else{this.reason=A}}))}onRequestSent(){if(this.handler.onRequestSent){this.handler.onRequestSent()}}onUpgrade(A,e,t){if(this.handler.onUpgrade){this.handler.onUpgrade(A,e,t)}}onConnect(A){if(this.aborted){A(this.reason)}else{this.abort=A}}onBodySent(A){if(this.handler.onBodySent)return this.handler.onBodySent(A)}static[s](A,{state:e,opts:t},r){const{statusCode:s,code:o,headers:n}=A;const{method:i,retryOptions:a}=t;const{maxRetries:E,timeout:g,maxTimeout:c,timeoutFactor:Q,statusCodes:C,errorCodes:B,methods:I}=a;let{counter:h,currentTimeout:l}=e;l=l!=null&&l>0?l:g;if(o&&o!=="UND_ERR_REQ_RETRY"&&o!=="UND_ERR_SOCKET"&&!B.includes(o)){r(A);return}if(Array.isArray(I)&&!I.includes(i)){r(A);return}if(s!=null&&Array.isArray(C)&&!C.includes(s)){r(A);return}if(h>E){r(A);return}let u=n!=null&&n["retry-after"];if(u){u=Number(u);u=isNaN(u)?calculateRetryAfterHeader(u):u*1e3}const d=u>0?Math.min(u,c):Math.min(l*Q**h,c);e.currentTimeout=d;setTimeout((()=>r(null)),d)}onHeaders(A,e,t,s){const n=i(e);this.retryCount+=1;if(A>=300){this.abort(new o("Request failed",A,{headers:n,count:this.retryCount}));return false}if(this.resume!=null){this.resume=null;if(A!==206){return true}const e=a(n["content-range"]);if(!e){this.abort(new o("Content-Range mismatch",A,{headers:n,count:this.retryCount}));return false}if(this.etag!=null&&this.etag!==n.etag){this.abort(new o("ETag mismatch",A,{headers:n,count:this.retryCount}));return false}const{start:s,size:i,end:E=i}=e;r(this.start===s,"content-range mismatch");r(this.end==null||this.end===E,"content-range mismatch");this.resume=t;return true}if(this.end==null){if(A===206){const o=a(n["content-range"]);if(o==null){return this.handler.onHeaders(A,e,t,s)}const{start:i,size:E,end:g=E}=o;r(i!=null&&Number.isFinite(i)&&this.start!==i,"content-range mismatch");r(Number.isFinite(i));r(g!=null&&Number.isFinite(g)&&this.end!==g,"invalid content-length");this.start=i;this.end=g}if(this.end==null){const A=n["content-length"];this.end=A!=null?Number(A):null}r(Number.isFinite(this.start));r(this.end==null||Number.isFinite(this.end),"invalid content-length");this.resume=t;this.etag=n.etag!=null?n.etag:null;return this.handler.onHeaders(A,e,t,s)}const E=new o("Request failed",A,{headers:n,count:this.retryCount});this.abort(E);return false}onData(A){this.start+=A.length;return this.handler.onData(A)}onComplete(A){this.retryCount=0;return this.handler.onComplete(A)}onError(A){if(this.aborted||n(this.opts.body)){return this.handler.onError(A)}this.retryOpts.retry(A,{state:{counter:this.retryCount++,currentTimeout:this.retryAfter},opts:{retryOptions:this.retryOpts,...this.opts}},onRetry.bind(this));function onRetry(A){if(A!=null||this.aborted||n(this.opts.body)){return this.handler.onError(A)}if(this.start!==0){this.opts={...this.opts,headers:{...this.opts.headers,range:`bytes=${this.start}-${this.end??""}`}}}try{this.dispatch(this.opts,this)}catch(A){this.handler.onError(A)}}}}A.exports=RetryHandler},4193:(A,e,t)=>{"use strict";const r=t(9221);function createRedirectInterceptor({maxRedirections:A}){return e=>function Intercept(t,s){const{maxRedirections:o=A}=t;if(!o){return e(t,s)}const n=new r(e,o,t,s);t={...t,maxRedirections:0};return e(t,n)}}A.exports=createRedirectInterceptor},5418:(A,e,t)=>{"use strict";Object.defineProperty(e,"__esModule",{value:true});e.SPECIAL_HEADERS=e.HEADER_STATE=e.MINOR=e.MAJOR=e.CONNECTION_TOKEN_CHARS=e.HEADER_CHARS=e.TOKEN=e.STRICT_TOKEN=e.HEX=e.URL_CHAR=e.STRICT_URL_CHAR=e.USERINFO_CHARS=e.MARK=e.ALPHANUM=e.NUM=e.HEX_MAP=e.NUM_MAP=e.ALPHA=e.FINISH=e.H_METHOD_MAP=e.METHOD_MAP=e.METHODS_RTSP=e.METHODS_ICE=e.METHODS_HTTP=e.METHODS=e.LENIENT_FLAGS=e.FLAGS=e.TYPE=e.ERROR=void 0;const r=t(2930);var s;(function(A){A[A["OK"]=0]="OK";A[A["INTERNAL"]=1]="INTERNAL";A[A["STRICT"]=2]="STRICT";A[A["LF_EXPECTED"]=3]="LF_EXPECTED";A[A["UNEXPECTED_CONTENT_LENGTH"]=4]="UNEXPECTED_CONTENT_LENGTH";A[A["CLOSED_CONNECTION"]=5]="CLOSED_CONNECTION";A[A["INVALID_METHOD"]=6]="INVALID_METHOD";A[A["INVALID_URL"]=7]="INVALID_URL";A[A["INVALID_CONSTANT"]=8]="INVALID_CONSTANT";A[A["INVALID_VERSION"]=9]="INVALID_VERSION";A[A["INVALID_HEADER_TOKEN"]=10]="INVALID_HEADER_TOKEN";A[A["INVALID_CONTENT_LENGTH"]=11]="INVALID_CONTENT_LENGTH";A[A["INVALID_CHUNK_SIZE"]=12]="INVALID_CHUNK_SIZE";A[A["INVALID_STATUS"]=13]="INVALID_STATUS";A[A["INVALID_EOF_STATE"]=14]="INVALID_EOF_STATE";A[A["INVALID_TRANSFER_ENCODING"]=15]="INVALID_TRANSFER_ENCODING";A[A["CB_MESSAGE_BEGIN"]=16]="CB_MESSAGE_BEGIN";A[A["CB_HEADERS_COMPLETE"]=17]="CB_HEADERS_COMPLETE";A[A["CB_MESSAGE_COMPLETE"]=18]="CB_MESSAGE_COMPLETE";A[A["CB_CHUNK_HEADER"]=19]="CB_CHUNK_HEADER";A[A["CB_CHUNK_COMPLETE"]=20]="CB_CHUNK_COMPLETE";A[A["PAUSED"]=21]="PAUSED";A[A["PAUSED_UPGRADE"]=22]="PAUSED_UPGRADE";A[A["PAUSED_H2_UPGRADE"]=23]="PAUSED_H2_UPGRADE";A[A["USER"]=24]="USER"})(s=e.ERROR||(e.ERROR={}));var o;(function(A){A[A["BOTH"]=0]="BOTH";A[A["REQUEST"]=1]="REQUEST";A[A["RESPONSE"]=2]="RESPONSE"})(o=e.TYPE||(e.TYPE={}));var n;(function(A){A[A["CONNECTION_KEEP_ALIVE"]=1]="CONNECTION_KEEP_ALIVE";A[A["CONNECTION_CLOSE"]=2]="CONNECTION_CLOSE";A[A["CONNECTION_UPGRADE"]=4]="CONNECTION_UPGRADE";A[A["CHUNKED"]=8]="CHUNKED";A[A["UPGRADE"]=16]="UPGRADE";A[A["CONTENT_LENGTH"]=32]="CONTENT_LENGTH";A[A["SKIPBODY"]=64]="SKIPBODY";A[A["TRAILING"]=128]="TRAILING";A[A["TRANSFER_ENCODING"]=512]="TRANSFER_ENCODING"})(n=e.FLAGS||(e.FLAGS={}));var i;(function(A){A[A["HEADERS"]=1]="HEADERS";A[A["CHUNKED_LENGTH"]=2]="CHUNKED_LENGTH";A[A["KEEP_ALIVE"]=4]="KEEP_ALIVE"})(i=e.LENIENT_FLAGS||(e.LENIENT_FLAGS={}));var a;(function(A){A[A["DELETE"]=0]="DELETE";A[A["GET"]=1]="GET";A[A["HEAD"]=2]="HEAD";A[A["POST"]=3]="POST";A[A["PUT"]=4]="PUT";A[A["CONNECT"]=5]="CONNECT";A[A["OPTIONS"]=6]="OPTIONS";A[A["TRACE"]=7]="TRACE";A[A["COPY"]=8]="COPY";A[A["LOCK"]=9]="LOCK";A[A["MKCOL"]=10]="MKCOL";A[A["MOVE"]=11]="MOVE";A[A["PROPFIND"]=12]="PROPFIND";A[A["PROPPATCH"]=13]="PROPPATCH";A[A["SEARCH"]=14]="SEARCH";A[A["UNLOCK"]=15]="UNLOCK";A[A["BIND"]=16]="BIND";A[A["REBIND"]=17]="REBIND";A[A["UNBIND"]=18]="UNBIND";A[A["ACL"]=19]="ACL";A[A["REPORT"]=20]="REPORT";A[A["MKACTIVITY"]=21]="MKACTIVITY";A[A["CHECKOUT"]=22]="CHECKOUT";A[A["MERGE"]=23]="MERGE";A[A["M-SEARCH"]=24]="M-SEARCH";A[A["NOTIFY"]=25]="NOTIFY";A[A["SUBSCRIBE"]=26]="SUBSCRIBE";A[A["UNSUBSCRIBE"]=27]="UNSUBSCRIBE";A[A["PATCH"]=28]="PATCH";A[A["PURGE"]=29]="PURGE";A[A["MKCALENDAR"]=30]="MKCALENDAR";A[A["LINK"]=31]="LINK";A[A["UNLINK"]=32]="UNLINK";A[A["SOURCE"]=33]="SOURCE";A[A["PRI"]=34]="PRI";A[A["DESCRIBE"]=35]="DESCRIBE";A[A["ANNOUNCE"]=36]="ANNOUNCE";A[A["SETUP"]=37]="SETUP";A[A["PLAY"]=38]="PLAY";A[A["PAUSE"]=39]="PAUSE";A[A["TEARDOWN"]=40]="TEARDOWN";A[A["GET_PARAMETER"]=41]="GET_PARAMETER";A[A["SET_PARAMETER"]=42]="SET_PARAMETER";A[A["REDIRECT"]=43]="REDIRECT";A[A["RECORD"]=44]="RECORD";A[A["FLUSH"]=45]="FLUSH"})(a=e.METHODS||(e.METHODS={}));e.METHODS_HTTP=[a.DELETE,a.GET,a.HEAD,a.POST,a.PUT,a.CONNECT,a.OPTIONS,a.TRACE,a.COPY,a.LOCK,a.MKCOL,a.MOVE,a.PROPFIND,a.PROPPATCH,a.SEARCH,a.UNLOCK,a.BIND,a.REBIND,a.UNBIND,a.ACL,a.REPORT,a.MKACTIVITY,a.CHECKOUT,a.MERGE,a["M-SEARCH"],a.NOTIFY,a.SUBSCRIBE,a.UNSUBSCRIBE,a.PATCH,a.PURGE,a.MKCALENDAR,a.LINK,a.UNLINK,a.PRI,a.SOURCE];e.METHODS_ICE=[a.SOURCE];e.METHODS_RTSP=[a.OPTIONS,a.DESCRIBE,a.ANNOUNCE,a.SETUP,a.PLAY,a.PAUSE,a.TEARDOWN,a.GET_PARAMETER,a.SET_PARAMETER,a.REDIRECT,a.RECORD,a.FLUSH,a.GET,a.POST];e.METHOD_MAP=r.enumToMap(a);e.H_METHOD_MAP={};Object.keys(e.METHOD_MAP).forEach((A=>{if(/^H/.test(A)){e.H_METHOD_MAP[A]=e.METHOD_MAP[A]}}));var E;(function(A){A[A["SAFE"]=0]="SAFE";A[A["SAFE_WITH_CB"]=1]="SAFE_WITH_CB";A[A["UNSAFE"]=2]="UNSAFE"})(E=e.FINISH||(e.FINISH={}));e.ALPHA=[];for(let A="A".charCodeAt(0);A<="Z".charCodeAt(0);A++){e.ALPHA.push(String.fromCharCode(A));e.ALPHA.push(String.fromCharCode(A+32))}e.NUM_MAP={0:0,1:1,2:2,3:3,4:4,5:5,6:6,7:7,8:8,9:9};e.HEX_MAP={0:0,1:1,2:2,3:3,4:4,5:5,6:6,7:7,8:8,9:9,A:10,B:11,C:12,D:13,E:14,F:15,a:10,b:11,c:12,d:13,e:14,f:15};e.NUM=["0","1","2","3","4","5","6","7","8","9"];e.ALPHANUM=e.ALPHA.concat(e.NUM);e.MARK=["-","_",".","!","~","*","'","(",")"];e.USERINFO_CHARS=e.ALPHANUM.concat(e.MARK).concat(["%",";",":","&","=","+","$",","]);e.STRICT_URL_CHAR=["!",'"',"$","%","&","'","(",")","*","+",",","-",".","/",":",";","<","=",">","@","[","\\","]","^","_","`","{","|","}","~"].concat(e.ALPHANUM);e.URL_CHAR=e.STRICT_URL_CHAR.concat(["\t","\f"]);for(let A=128;A<=255;A++){e.URL_CHAR.push(A)}e.HEX=e.NUM.concat(["a","b","c","d","e","f","A","B","C","D","E","F"]);e.STRICT_TOKEN=["!","#","$","%","&","'","*","+","-",".","^","_","`","|","~"].concat(e.ALPHANUM);e.TOKEN=e.STRICT_TOKEN.concat([" "]);e.HEADER_CHARS=["\t"];for(let A=32;A<=255;A++){if(A!==127){e.HEADER_CHARS.push(A)}}e.CONNECTION_TOKEN_CHARS=e.HEADER_CHARS.filter((A=>A!==44));e.MAJOR=e.NUM_MAP;e.MINOR=e.MAJOR;var g;(function(A){A[A["GENERAL"]=0]="GENERAL";A[A["CONNECTION"]=1]="CONNECTION";A[A["CONTENT_LENGTH"]=2]="CONTENT_LENGTH";A[A["TRANSFER_ENCODING"]=3]="TRANSFER_ENCODING";A[A["UPGRADE"]=4]="UPGRADE";A[A["CONNECTION_KEEP_ALIVE"]=5]="CONNECTION_KEEP_ALIVE";A[A["CONNECTION_CLOSE"]=6]="CONNECTION_CLOSE";A[A["CONNECTION_UPGRADE"]=7]="CONNECTION_UPGRADE";A[A["TRANSFER_ENCODING_CHUNKED"]=8]="TRANSFER_ENCODING_CHUNKED"})(g=e.HEADER_STATE||(e.HEADER_STATE={}));e.SPECIAL_HEADERS={connection:g.CONNECTION,"content-length":g.CONTENT_LENGTH,"proxy-connection":g.CONNECTION,"transfer-encoding":g.TRANSFER_ENCODING,upgrade:g.UPGRADE}},4896:A=>{A.exports="AGFzbQEAAAABMAhgAX8Bf2ADf39/AX9gBH9/f38Bf2AAAGADf39/AGABfwBgAn9/AGAGf39/f39/AALLAQgDZW52GHdhc21fb25faGVhZGVyc19jb21wbGV0ZQACA2VudhV3YXNtX29uX21lc3NhZ2VfYmVnaW4AAANlbnYLd2FzbV9vbl91cmwAAQNlbnYOd2FzbV9vbl9zdGF0dXMAAQNlbnYUd2FzbV9vbl9oZWFkZXJfZmllbGQAAQNlbnYUd2FzbV9vbl9oZWFkZXJfdmFsdWUAAQNlbnYMd2FzbV9vbl9ib2R5AAEDZW52GHdhc21fb25fbWVzc2FnZV9jb21wbGV0ZQAAA0ZFAwMEAAAFAAAAAAAABQEFAAUFBQAABgAAAAAGBgYGAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQABAAABAQcAAAUFAwABBAUBcAESEgUDAQACBggBfwFBgNQECwfRBSIGbWVtb3J5AgALX2luaXRpYWxpemUACRlfX2luZGlyZWN0X2Z1bmN0aW9uX3RhYmxlAQALbGxodHRwX2luaXQAChhsbGh0dHBfc2hvdWxkX2tlZXBfYWxpdmUAQQxsbGh0dHBfYWxsb2MADAZtYWxsb2MARgtsbGh0dHBfZnJlZQANBGZyZWUASA9sbGh0dHBfZ2V0X3R5cGUADhVsbGh0dHBfZ2V0X2h0dHBfbWFqb3IADxVsbGh0dHBfZ2V0X2h0dHBfbWlub3IAEBFsbGh0dHBfZ2V0X21ldGhvZAARFmxsaHR0cF9nZXRfc3RhdHVzX2NvZGUAEhJsbGh0dHBfZ2V0X3VwZ3JhZGUAEwxsbGh0dHBfcmVzZXQAFA5sbGh0dHBfZXhlY3V0ZQAVFGxsaHR0cF9zZXR0aW5nc19pbml0ABYNbGxodHRwX2ZpbmlzaAAXDGxsaHR0cF9wYXVzZQAYDWxsaHR0cF9yZXN1bWUAGRtsbGh0dHBfcmVzdW1lX2FmdGVyX3VwZ3JhZGUAGhBsbGh0dHBfZ2V0X2Vycm5vABsXbGxodHRwX2dldF9lcnJvcl9yZWFzb24AHBdsbGh0dHBfc2V0X2Vycm9yX3JlYXNvbgAdFGxsaHR0cF9nZXRfZXJyb3JfcG9zAB4RbGxodHRwX2Vycm5vX25hbWUAHxJsbGh0dHBfbWV0aG9kX25hbWUAIBJsbGh0dHBfc3RhdHVzX25hbWUAIRpsbGh0dHBfc2V0X2xlbmllbnRfaGVhZGVycwAiIWxsaHR0cF9zZXRfbGVuaWVudF9jaHVua2VkX2xlbmd0aAAjHWxsaHR0cF9zZXRfbGVuaWVudF9rZWVwX2FsaXZlACQkbGxodHRwX3NldF9sZW5pZW50X3RyYW5zZmVyX2VuY29kaW5nACUYbGxodHRwX21lc3NhZ2VfbmVlZHNfZW9mAD8JFwEAQQELEQECAwQFCwYHNTk3MS8tJyspCsLgAkUCAAsIABCIgICAAAsZACAAEMKAgIAAGiAAIAI2AjggACABOgAoCxwAIAAgAC8BMiAALQAuIAAQwYCAgAAQgICAgAALKgEBf0HAABDGgICAACIBEMKAgIAAGiABQYCIgIAANgI4IAEgADoAKCABCwoAIAAQyICAgAALBwAgAC0AKAsHACAALQAqCwcAIAAtACsLBwAgAC0AKQsHACAALwEyCwcAIAAtAC4LRQEEfyAAKAIYIQEgAC0ALSECIAAtACghAyAAKAI4IQQgABDCgICAABogACAENgI4IAAgAzoAKCAAIAI6AC0gACABNgIYCxEAIAAgASABIAJqEMOAgIAACxAAIABBAEHcABDMgICAABoLZwEBf0EAIQECQCAAKAIMDQACQAJAAkACQCAALQAvDgMBAAMCCyAAKAI4IgFFDQAgASgCLCIBRQ0AIAAgARGAgICAAAAiAQ0DC0EADwsQyoCAgAAACyAAQcOWgIAANgIQQQ4hAQsgAQseAAJAIAAoAgwNACAAQdGbgIAANgIQIABBFTYCDAsLFgACQCAAKAIMQRVHDQAgAEEANgIMCwsWAAJAIAAoAgxBFkcNACAAQQA2AgwLCwcAIAAoAgwLBwAgACgCEAsJACAAIAE2AhALBwAgACgCFAsiAAJAIABBJEkNABDKgICAAAALIABBAnRBoLOAgABqKAIACyIAAkAgAEEuSQ0AEMqAgIAAAAsgAEECdEGwtICAAGooAgAL7gsBAX9B66iAgAAhAQJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAIABBnH9qDvQDY2IAAWFhYWFhYQIDBAVhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhBgcICQoLDA0OD2FhYWFhEGFhYWFhYWFhYWFhEWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYRITFBUWFxgZGhthYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhHB0eHyAhIiMkJSYnKCkqKywtLi8wMTIzNDU2YTc4OTphYWFhYWFhYTthYWE8YWFhYT0+P2FhYWFhYWFhQGFhQWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYUJDREVGR0hJSktMTU5PUFFSU2FhYWFhYWFhVFVWV1hZWlthXF1hYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFeYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhX2BhC0Hhp4CAAA8LQaShgIAADwtBy6yAgAAPC0H+sYCAAA8LQcCkgIAADwtBq6SAgAAPC0GNqICAAA8LQeKmgIAADwtBgLCAgAAPC0G5r4CAAA8LQdekgIAADwtB75+AgAAPC0Hhn4CAAA8LQfqfgIAADwtB8qCAgAAPC0Gor4CAAA8LQa6ygIAADwtBiLCAgAAPC0Hsp4CAAA8LQYKigIAADwtBjp2AgAAPC0HQroCAAA8LQcqjgIAADwtBxbKAgAAPC0HfnICAAA8LQdKcgIAADwtBxKCAgAAPC0HXoICAAA8LQaKfgIAADwtB7a6AgAAPC0GrsICAAA8LQdSlgIAADwtBzK6AgAAPC0H6roCAAA8LQfyrgIAADwtB0rCAgAAPC0HxnYCAAA8LQbuggIAADwtB96uAgAAPC0GQsYCAAA8LQdexgIAADwtBoq2AgAAPC0HUp4CAAA8LQeCrgIAADwtBn6yAgAAPC0HrsYCAAA8LQdWfgIAADwtByrGAgAAPC0HepYCAAA8LQdSegIAADwtB9JyAgAAPC0GnsoCAAA8LQbGdgIAADwtBoJ2AgAAPC0G5sYCAAA8LQbywgIAADwtBkqGAgAAPC0GzpoCAAA8LQemsgIAADwtBrJ6AgAAPC0HUq4CAAA8LQfemgIAADwtBgKaAgAAPC0GwoYCAAA8LQf6egIAADwtBjaOAgAAPC0GJrYCAAA8LQfeigIAADwtBoLGAgAAPC0Gun4CAAA8LQcalgIAADwtB6J6AgAAPC0GTooCAAA8LQcKvgIAADwtBw52AgAAPC0GLrICAAA8LQeGdgIAADwtBja+AgAAPC0HqoYCAAA8LQbStgIAADwtB0q+AgAAPC0HfsoCAAA8LQdKygIAADwtB8LCAgAAPC0GpooCAAA8LQfmjgIAADwtBmZ6AgAAPC0G1rICAAA8LQZuwgIAADwtBkrKAgAAPC0G2q4CAAA8LQcKigIAADwtB+LKAgAAPC0GepYCAAA8LQdCigIAADwtBup6AgAAPC0GBnoCAAA8LEMqAgIAAAAtB1qGAgAAhAQsgAQsWACAAIAAtAC1B/gFxIAFBAEdyOgAtCxkAIAAgAC0ALUH9AXEgAUEAR0EBdHI6AC0LGQAgACAALQAtQfsBcSABQQBHQQJ0cjoALQsZACAAIAAtAC1B9wFxIAFBAEdBA3RyOgAtCy4BAn9BACEDAkAgACgCOCIERQ0AIAQoAgAiBEUNACAAIAQRgICAgAAAIQMLIAMLSQECf0EAIQMCQCAAKAI4IgRFDQAgBCgCBCIERQ0AIAAgASACIAFrIAQRgYCAgAAAIgNBf0cNACAAQcaRgIAANgIQQRghAwsgAwsuAQJ/QQAhAwJAIAAoAjgiBEUNACAEKAIwIgRFDQAgACAEEYCAgIAAACEDCyADC0kBAn9BACEDAkAgACgCOCIERQ0AIAQoAggiBEUNACAAIAEgAiABayAEEYGAgIAAACIDQX9HDQAgAEH2ioCAADYCEEEYIQMLIAMLLgECf0EAIQMCQCAAKAI4IgRFDQAgBCgCNCIERQ0AIAAgBBGAgICAAAAhAwsgAwtJAQJ/QQAhAwJAIAAoAjgiBEUNACAEKAIMIgRFDQAgACABIAIgAWsgBBGBgICAAAAiA0F/Rw0AIABB7ZqAgAA2AhBBGCEDCyADCy4BAn9BACEDAkAgACgCOCIERQ0AIAQoAjgiBEUNACAAIAQRgICAgAAAIQMLIAMLSQECf0EAIQMCQCAAKAI4IgRFDQAgBCgCECIERQ0AIAAgASACIAFrIAQRgYCAgAAAIgNBf0cNACAAQZWQgIAANgIQQRghAwsgAwsuAQJ/QQAhAwJAIAAoAjgiBEUNACAEKAI8IgRFDQAgACAEEYCAgIAAACEDCyADC0kBAn9BACEDAkAgACgCOCIERQ0AIAQoAhQiBEUNACAAIAEgAiABayAEEYGAgIAAACIDQX9HDQAgAEGqm4CAADYCEEEYIQMLIAMLLgECf0EAIQMCQCAAKAI4IgRFDQAgBCgCQCIERQ0AIAAgBBGAgICAAAAhAwsgAwtJAQJ/QQAhAwJAIAAoAjgiBEUNACAEKAIYIgRFDQAgACABIAIgAWsgBBGBgICAAAAiA0F/Rw0AIABB7ZOAgAA2AhBBGCEDCyADCy4BAn9BACEDAkAgACgCOCIERQ0AIAQoAkQiBEUNACAAIAQRgICAgAAAIQMLIAMLLgECf0EAIQMCQCAAKAI4IgRFDQAgBCgCJCIERQ0AIAAgBBGAgICAAAAhAwsgAwsuAQJ/QQAhAwJAIAAoAjgiBEUNACAEKAIsIgRFDQAgACAEEYCAgIAAACEDCyADC0kBAn9BACEDAkAgACgCOCIERQ0AIAQoAigiBEUNACAAIAEgAiABayAEEYGAgIAAACIDQX9HDQAgAEH2iICAADYCEEEYIQMLIAMLLgECf0EAIQMCQCAAKAI4IgRFDQAgBCgCUCIERQ0AIAAgBBGAgICAAAAhAwsgAwtJAQJ/QQAhAwJAIAAoAjgiBEUNACAEKAIcIgRFDQAgACABIAIgAWsgBBGBgICAAAAiA0F/Rw0AIABBwpmAgAA2AhBBGCEDCyADCy4BAn9BACEDAkAgACgCOCIERQ0AIAQoAkgiBEUNACAAIAQRgICAgAAAIQMLIAMLSQECf0EAIQMCQCAAKAI4IgRFDQAgBCgCICIERQ0AIAAgASACIAFrIAQRgYCAgAAAIgNBf0cNACAAQZSUgIAANgIQQRghAwsgAwsuAQJ/QQAhAwJAIAAoAjgiBEUNACAEKAJMIgRFDQAgACAEEYCAgIAAACEDCyADCy4BAn9BACEDAkAgACgCOCIERQ0AIAQoAlQiBEUNACAAIAQRgICAgAAAIQMLIAMLLgECf0EAIQMCQCAAKAI4IgRFDQAgBCgCWCIERQ0AIAAgBBGAgICAAAAhAwsgAwtFAQF/AkACQCAALwEwQRRxQRRHDQBBASEDIAAtAChBAUYNASAALwEyQeUARiEDDAELIAAtAClBBUYhAwsgACADOgAuQQAL/gEBA39BASEDAkAgAC8BMCIEQQhxDQAgACkDIEIAUiEDCwJAAkAgAC0ALkUNAEEBIQUgAC0AKUEFRg0BQQEhBSAEQcAAcUUgA3FBAUcNAQtBACEFIARBwABxDQBBAiEFIARB//8DcSIDQQhxDQACQCADQYAEcUUNAAJAIAAtAChBAUcNACAALQAtQQpxDQBBBQ8LQQQPCwJAIANBIHENAAJAIAAtAChBAUYNACAALwEyQf//A3EiAEGcf2pB5ABJDQAgAEHMAUYNACAAQbACRg0AQQQhBSAEQShxRQ0CIANBiARxQYAERg0CC0EADwtBAEEDIAApAyBQGyEFCyAFC2IBAn9BACEBAkAgAC0AKEEBRg0AIAAvATJB//8DcSICQZx/akHkAEkNACACQcwBRg0AIAJBsAJGDQAgAC8BMCIAQcAAcQ0AQQEhASAAQYgEcUGABEYNACAAQShxRSEBCyABC6cBAQN/AkACQAJAIAAtACpFDQAgAC0AK0UNAEEAIQMgAC8BMCIEQQJxRQ0BDAILQQAhAyAALwEwIgRBAXFFDQELQQEhAyAALQAoQQFGDQAgAC8BMkH//wNxIgVBnH9qQeQASQ0AIAVBzAFGDQAgBUGwAkYNACAEQcAAcQ0AQQAhAyAEQYgEcUGABEYNACAEQShxQQBHIQMLIABBADsBMCAAQQA6AC8gAwuZAQECfwJAAkACQCAALQAqRQ0AIAAtACtFDQBBACEBIAAvATAiAkECcUUNAQwCC0EAIQEgAC8BMCICQQFxRQ0BC0EBIQEgAC0AKEEBRg0AIAAvATJB//8DcSIAQZx/akHkAEkNACAAQcwBRg0AIABBsAJGDQAgAkHAAHENAEEAIQEgAkGIBHFBgARGDQAgAkEocUEARyEBCyABC1kAIABBGGpCADcDACAAQgA3AwAgAEE4akIANwMAIABBMGpCADcDACAAQShqQgA3AwAgAEEgakIANwMAIABBEGpCADcDACAAQQhqQgA3AwAgAEHdATYCHEEAC3sBAX8CQCAAKAIMIgMNAAJAIAAoAgRFDQAgACABNgIECwJAIAAgASACEMSAgIAAIgMNACAAKAIMDwsgACADNgIcQQAhAyAAKAIEIgFFDQAgACABIAIgACgCCBGBgICAAAAiAUUNACAAIAI2AhQgACABNgIMIAEhAwsgAwvk8wEDDn8DfgR/I4CAgIAAQRBrIgMkgICAgAAgASEEIAEhBSABIQYgASEHIAEhCCABIQkgASEKIAEhCyABIQwgASENIAEhDiABIQ8CQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkAgACgCHCIQQX9qDt0B2gEB2QECAwQFBgcICQoLDA0O2AEPENcBERLWARMUFRYXGBkaG+AB3wEcHR7VAR8gISIjJCXUASYnKCkqKyzTAdIBLS7RAdABLzAxMjM0NTY3ODk6Ozw9Pj9AQUJDREVG2wFHSElKzwHOAUvNAUzMAU1OT1BRUlNUVVZXWFlaW1xdXl9gYWJjZGVmZ2hpamtsbW5vcHFyc3R1dnd4eXp7fH1+f4ABgQGCAYMBhAGFAYYBhwGIAYkBigGLAYwBjQGOAY8BkAGRAZIBkwGUAZUBlgGXAZgBmQGaAZsBnAGdAZ4BnwGgAaEBogGjAaQBpQGmAacBqAGpAaoBqwGsAa0BrgGvAbABsQGyAbMBtAG1AbYBtwHLAcoBuAHJAbkByAG6AbsBvAG9Ab4BvwHAAcEBwgHDAcQBxQHGAQDcAQtBACEQDMYBC0EOIRAMxQELQQ0hEAzEAQtBDyEQDMMBC0EQIRAMwgELQRMhEAzBAQtBFCEQDMABC0EVIRAMvwELQRYhEAy+AQtBFyEQDL0BC0EYIRAMvAELQRkhEAy7AQtBGiEQDLoBC0EbIRAMuQELQRwhEAy4AQtBCCEQDLcBC0EdIRAMtgELQSAhEAy1AQtBHyEQDLQBC0EHIRAMswELQSEhEAyyAQtBIiEQDLEBC0EeIRAMsAELQSMhEAyvAQtBEiEQDK4BC0ERIRAMrQELQSQhEAysAQtBJSEQDKsBC0EmIRAMqgELQSchEAypAQtBwwEhEAyoAQtBKSEQDKcBC0ErIRAMpgELQSwhEAylAQtBLSEQDKQBC0EuIRAMowELQS8hEAyiAQtBxAEhEAyhAQtBMCEQDKABC0E0IRAMnwELQQwhEAyeAQtBMSEQDJ0BC0EyIRAMnAELQTMhEAybAQtBOSEQDJoBC0E1IRAMmQELQcUBIRAMmAELQQshEAyXAQtBOiEQDJYBC0E2IRAMlQELQQohEAyUAQtBNyEQDJMBC0E4IRAMkgELQTwhEAyRAQtBOyEQDJABC0E9IRAMjwELQQkhEAyOAQtBKCEQDI0BC0E+IRAMjAELQT8hEAyLAQtBwAAhEAyKAQtBwQAhEAyJAQtBwgAhEAyIAQtBwwAhEAyHAQtBxAAhEAyGAQtBxQAhEAyFAQtBxgAhEAyEAQtBKiEQDIMBC0HHACEQDIIBC0HIACEQDIEBC0HJACEQDIABC0HKACEQDH8LQcsAIRAMfgtBzQAhEAx9C0HMACEQDHwLQc4AIRAMewtBzwAhEAx6C0HQACEQDHkLQdEAIRAMeAtB0gAhEAx3C0HTACEQDHYLQdQAIRAMdQtB1gAhEAx0C0HVACEQDHMLQQYhEAxyC0HXACEQDHELQQUhEAxwC0HYACEQDG8LQQQhEAxuC0HZACEQDG0LQdoAIRAMbAtB2wAhEAxrC0HcACEQDGoLQQMhEAxpC0HdACEQDGgLQd4AIRAMZwtB3wAhEAxmC0HhACEQDGULQeAAIRAMZAtB4gAhEAxjC0HjACEQDGILQQIhEAxhC0HkACEQDGALQeUAIRAMXwtB5gAhEAxeC0HnACEQDF0LQegAIRAMXAtB6QAhEAxbC0HqACEQDFoLQesAIRAMWQtB7AAhEAxYC0HtACEQDFcLQe4AIRAMVgtB7wAhEAxVC0HwACEQDFQLQfEAIRAMUwtB8gAhEAxSC0HzACEQDFELQfQAIRAMUAtB9QAhEAxPC0H2ACEQDE4LQfcAIRAMTQtB+AAhEAxMC0H5ACEQDEsLQfoAIRAMSgtB+wAhEAxJC0H8ACEQDEgLQf0AIRAMRwtB/gAhEAxGC0H/ACEQDEULQYABIRAMRAtBgQEhEAxDC0GCASEQDEILQYMBIRAMQQtBhAEhEAxAC0GFASEQDD8LQYYBIRAMPgtBhwEhEAw9C0GIASEQDDwLQYkBIRAMOwtBigEhEAw6C0GLASEQDDkLQYwBIRAMOAtBjQEhEAw3C0GOASEQDDYLQY8BIRAMNQtBkAEhEAw0C0GRASEQDDMLQZIBIRAMMgtBkwEhEAwxC0GUASEQDDALQZUBIRAMLwtBlgEhEAwuC0GXASEQDC0LQZgBIRAMLAtBmQEhEAwrC0GaASEQDCoLQZsBIRAMKQtBnAEhEAwoC0GdASEQDCcLQZ4BIRAMJgtBnwEhEAwlC0GgASEQDCQLQaEBIRAMIwtBogEhEAwiC0GjASEQDCELQaQBIRAMIAtBpQEhEAwfC0GmASEQDB4LQacBIRAMHQtBqAEhEAwcC0GpASEQDBsLQaoBIRAMGgtBqwEhEAwZC0GsASEQDBgLQa0BIRAMFwtBrgEhEAwWC0EBIRAMFQtBrwEhEAwUC0GwASEQDBMLQbEBIRAMEgtBswEhEAwRC0GyASEQDBALQbQBIRAMDwtBtQEhEAwOC0G2ASEQDA0LQbcBIRAMDAtBuAEhEAwLC0G5ASEQDAoLQboBIRAMCQtBuwEhEAwIC0HGASEQDAcLQbwBIRAMBgtBvQEhEAwFC0G+ASEQDAQLQb8BIRAMAwtBwAEhEAwCC0HCASEQDAELQcEBIRALA0ACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQCAQDscBAAECAwQFBgcICQoLDA0ODxAREhMUFRYXGBkaGxweHyAhIyUoP0BBREVGR0hJSktMTU9QUVJT3gNXWVtcXWBiZWZnaGlqa2xtb3BxcnN0dXZ3eHl6e3x9foABggGFAYYBhwGJAYsBjAGNAY4BjwGQAZEBlAGVAZYBlwGYAZkBmgGbAZwBnQGeAZ8BoAGhAaIBowGkAaUBpgGnAagBqQGqAasBrAGtAa4BrwGwAbEBsgGzAbQBtQG2AbcBuAG5AboBuwG8Ab0BvgG/AcABwQHCAcMBxAHFAcYBxwHIAckBygHLAcwBzQHOAc8B0AHRAdIB0wHUAdUB1gHXAdgB2QHaAdsB3AHdAd4B4AHhAeIB4wHkAeUB5gHnAegB6QHqAesB7AHtAe4B7wHwAfEB8gHzAZkCpAKwAv4C/gILIAEiBCACRw3zAUHdASEQDP8DCyABIhAgAkcN3QFBwwEhEAz+AwsgASIBIAJHDZABQfcAIRAM/QMLIAEiASACRw2GAUHvACEQDPwDCyABIgEgAkcNf0HqACEQDPsDCyABIgEgAkcNe0HoACEQDPoDCyABIgEgAkcNeEHmACEQDPkDCyABIgEgAkcNGkEYIRAM+AMLIAEiASACRw0UQRIhEAz3AwsgASIBIAJHDVlBxQAhEAz2AwsgASIBIAJHDUpBPyEQDPUDCyABIgEgAkcNSEE8IRAM9AMLIAEiASACRw1BQTEhEAzzAwsgAC0ALkEBRg3rAwyHAgsgACABIgEgAhDAgICAAEEBRw3mASAAQgA3AyAM5wELIAAgASIBIAIQtICAgAAiEA3nASABIQEM9QILAkAgASIBIAJHDQBBBiEQDPADCyAAIAFBAWoiASACELuAgIAAIhAN6AEgASEBDDELIABCADcDIEESIRAM1QMLIAEiECACRw0rQR0hEAztAwsCQCABIgEgAkYNACABQQFqIQFBECEQDNQDC0EHIRAM7AMLIABCACAAKQMgIhEgAiABIhBrrSISfSITIBMgEVYbNwMgIBEgElYiFEUN5QFBCCEQDOsDCwJAIAEiASACRg0AIABBiYCAgAA2AgggACABNgIEIAEhAUEUIRAM0gMLQQkhEAzqAwsgASEBIAApAyBQDeQBIAEhAQzyAgsCQCABIgEgAkcNAEELIRAM6QMLIAAgAUEBaiIBIAIQtoCAgAAiEA3lASABIQEM8gILIAAgASIBIAIQuICAgAAiEA3lASABIQEM8gILIAAgASIBIAIQuICAgAAiEA3mASABIQEMDQsgACABIgEgAhC6gICAACIQDecBIAEhAQzwAgsCQCABIgEgAkcNAEEPIRAM5QMLIAEtAAAiEEE7Rg0IIBBBDUcN6AEgAUEBaiEBDO8CCyAAIAEiASACELqAgIAAIhAN6AEgASEBDPICCwNAAkAgAS0AAEHwtYCAAGotAAAiEEEBRg0AIBBBAkcN6wEgACgCBCEQIABBADYCBCAAIBAgAUEBaiIBELmAgIAAIhAN6gEgASEBDPQCCyABQQFqIgEgAkcNAAtBEiEQDOIDCyAAIAEiASACELqAgIAAIhAN6QEgASEBDAoLIAEiASACRw0GQRshEAzgAwsCQCABIgEgAkcNAEEWIRAM4AMLIABBioCAgAA2AgggACABNgIEIAAgASACELiAgIAAIhAN6gEgASEBQSAhEAzGAwsCQCABIgEgAkYNAANAAkAgAS0AAEHwt4CAAGotAAAiEEECRg0AAkAgEEF/ag4E5QHsAQDrAewBCyABQQFqIQFBCCEQDMgDCyABQQFqIgEgAkcNAAtBFSEQDN8DC0EVIRAM3gMLA0ACQCABLQAAQfC5gIAAai0AACIQQQJGDQAgEEF/ag4E3gHsAeAB6wHsAQsgAUEBaiIBIAJHDQALQRghEAzdAwsCQCABIgEgAkYNACAAQYuAgIAANgIIIAAgATYCBCABIQFBByEQDMQDC0EZIRAM3AMLIAFBAWohAQwCCwJAIAEiFCACRw0AQRohEAzbAwsgFCEBAkAgFC0AAEFzag4U3QLuAu4C7gLuAu4C7gLuAu4C7gLuAu4C7gLuAu4C7gLuAu4C7gIA7gILQQAhECAAQQA2AhwgAEGvi4CAADYCECAAQQI2AgwgACAUQQFqNgIUDNoDCwJAIAEtAAAiEEE7Rg0AIBBBDUcN6AEgAUEBaiEBDOUCCyABQQFqIQELQSIhEAy/AwsCQCABIhAgAkcNAEEcIRAM2AMLQgAhESAQIQEgEC0AAEFQag435wHmAQECAwQFBgcIAAAAAAAAAAkKCwwNDgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADxAREhMUAAtBHiEQDL0DC0ICIREM5QELQgMhEQzkAQtCBCERDOMBC0IFIREM4gELQgYhEQzhAQtCByERDOABC0IIIREM3wELQgkhEQzeAQtCCiERDN0BC0ILIREM3AELQgwhEQzbAQtCDSERDNoBC0IOIREM2QELQg8hEQzYAQtCCiERDNcBC0ILIREM1gELQgwhEQzVAQtCDSERDNQBC0IOIREM0wELQg8hEQzSAQtCACERAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQCAQLQAAQVBqDjflAeQBAAECAwQFBgfmAeYB5gHmAeYB5gHmAQgJCgsMDeYB5gHmAeYB5gHmAeYB5gHmAeYB5gHmAeYB5gHmAeYB5gHmAeYB5gHmAeYB5gHmAeYB5gEODxAREhPmAQtCAiERDOQBC0IDIREM4wELQgQhEQziAQtCBSERDOEBC0IGIREM4AELQgchEQzfAQtCCCERDN4BC0IJIREM3QELQgohEQzcAQtCCyERDNsBC0IMIREM2gELQg0hEQzZAQtCDiERDNgBC0IPIREM1wELQgohEQzWAQtCCyERDNUBC0IMIREM1AELQg0hEQzTAQtCDiERDNIBC0IPIREM0QELIABCACAAKQMgIhEgAiABIhBrrSISfSITIBMgEVYbNwMgIBEgElYiFEUN0gFBHyEQDMADCwJAIAEiASACRg0AIABBiYCAgAA2AgggACABNgIEIAEhAUEkIRAMpwMLQSAhEAy/AwsgACABIhAgAhC+gICAAEF/ag4FtgEAxQIB0QHSAQtBESEQDKQDCyAAQQE6AC8gECEBDLsDCyABIgEgAkcN0gFBJCEQDLsDCyABIg0gAkcNHkHGACEQDLoDCyAAIAEiASACELKAgIAAIhAN1AEgASEBDLUBCyABIhAgAkcNJkHQACEQDLgDCwJAIAEiASACRw0AQSghEAy4AwsgAEEANgIEIABBjICAgAA2AgggACABIAEQsYCAgAAiEA3TASABIQEM2AELAkAgASIQIAJHDQBBKSEQDLcDCyAQLQAAIgFBIEYNFCABQQlHDdMBIBBBAWohAQwVCwJAIAEiASACRg0AIAFBAWohAQwXC0EqIRAMtQMLAkAgASIQIAJHDQBBKyEQDLUDCwJAIBAtAAAiAUEJRg0AIAFBIEcN1QELIAAtACxBCEYN0wEgECEBDJEDCwJAIAEiASACRw0AQSwhEAy0AwsgAS0AAEEKRw3VASABQQFqIQEMyQILIAEiDiACRw3VAUEvIRAMsgMLA0ACQCABLQAAIhBBIEYNAAJAIBBBdmoOBADcAdwBANoBCyABIQEM4AELIAFBAWoiASACRw0AC0ExIRAMsQMLQTIhECABIhQgAkYNsAMgAiAUayAAKAIAIgFqIRUgFCABa0EDaiEWAkADQCAULQAAIhdBIHIgFyAXQb9/akH/AXFBGkkbQf8BcSABQfC7gIAAai0AAEcNAQJAIAFBA0cNAEEGIQEMlgMLIAFBAWohASAUQQFqIhQgAkcNAAsgACAVNgIADLEDCyAAQQA2AgAgFCEBDNkBC0EzIRAgASIUIAJGDa8DIAIgFGsgACgCACIBaiEVIBQgAWtBCGohFgJAA0AgFC0AACIXQSByIBcgF0G/f2pB/wFxQRpJG0H/AXEgAUH0u4CAAGotAABHDQECQCABQQhHDQBBBSEBDJUDCyABQQFqIQEgFEEBaiIUIAJHDQALIAAgFTYCAAywAwsgAEEANgIAIBQhAQzYAQtBNCEQIAEiFCACRg2uAyACIBRrIAAoAgAiAWohFSAUIAFrQQVqIRYCQANAIBQtAAAiF0EgciAXIBdBv39qQf8BcUEaSRtB/wFxIAFB0MKAgABqLQAARw0BAkAgAUEFRw0AQQchAQyUAwsgAUEBaiEBIBRBAWoiFCACRw0ACyAAIBU2AgAMrwMLIABBADYCACAUIQEM1wELAkAgASIBIAJGDQADQAJAIAEtAABBgL6AgABqLQAAIhBBAUYNACAQQQJGDQogASEBDN0BCyABQQFqIgEgAkcNAAtBMCEQDK4DC0EwIRAMrQMLAkAgASIBIAJGDQADQAJAIAEtAAAiEEEgRg0AIBBBdmoOBNkB2gHaAdkB2gELIAFBAWoiASACRw0AC0E4IRAMrQMLQTghEAysAwsDQAJAIAEtAAAiEEEgRg0AIBBBCUcNAwsgAUEBaiIBIAJHDQALQTwhEAyrAwsDQAJAIAEtAAAiEEEgRg0AAkACQCAQQXZqDgTaAQEB2gEACyAQQSxGDdsBCyABIQEMBAsgAUEBaiIBIAJHDQALQT8hEAyqAwsgASEBDNsBC0HAACEQIAEiFCACRg2oAyACIBRrIAAoAgAiAWohFiAUIAFrQQZqIRcCQANAIBQtAABBIHIgAUGAwICAAGotAABHDQEgAUEGRg2OAyABQQFqIQEgFEEBaiIUIAJHDQALIAAgFjYCAAypAwsgAEEANgIAIBQhAQtBNiEQDI4DCwJAIAEiDyACRw0AQcEAIRAMpwMLIABBjICAgAA2AgggACAPNgIEIA8hASAALQAsQX9qDgTNAdUB1wHZAYcDCyABQQFqIQEMzAELAkAgASIBIAJGDQADQAJAIAEtAAAiEEEgciAQIBBBv39qQf8BcUEaSRtB/wFxIhBBCUYNACAQQSBGDQACQAJAAkACQCAQQZ1/ag4TAAMDAwMDAwMBAwMDAwMDAwMDAgMLIAFBAWohAUExIRAMkQMLIAFBAWohAUEyIRAMkAMLIAFBAWohAUEzIRAMjwMLIAEhAQzQAQsgAUEBaiIBIAJHDQALQTUhEAylAwtBNSEQDKQDCwJAIAEiASACRg0AA0ACQCABLQAAQYC8gIAAai0AAEEBRg0AIAEhAQzTAQsgAUEBaiIBIAJHDQALQT0hEAykAwtBPSEQDKMDCyAAIAEiASACELCAgIAAIhAN1gEgASEBDAELIBBBAWohAQtBPCEQDIcDCwJAIAEiASACRw0AQcIAIRAMoAMLAkADQAJAIAEtAABBd2oOGAAC/gL+AoQD/gL+Av4C/gL+Av4C/gL+Av4C/gL+Av4C/gL+Av4C/gL+Av4CAP4CCyABQQFqIgEgAkcNAAtBwgAhEAygAwsgAUEBaiEBIAAtAC1BAXFFDb0BIAEhAQtBLCEQDIUDCyABIgEgAkcN0wFBxAAhEAydAwsDQAJAIAEtAABBkMCAgABqLQAAQQFGDQAgASEBDLcCCyABQQFqIgEgAkcNAAtBxQAhEAycAwsgDS0AACIQQSBGDbMBIBBBOkcNgQMgACgCBCEBIABBADYCBCAAIAEgDRCvgICAACIBDdABIA1BAWohAQyzAgtBxwAhECABIg0gAkYNmgMgAiANayAAKAIAIgFqIRYgDSABa0EFaiEXA0AgDS0AACIUQSByIBQgFEG/f2pB/wFxQRpJG0H/AXEgAUGQwoCAAGotAABHDYADIAFBBUYN9AIgAUEBaiEBIA1BAWoiDSACRw0ACyAAIBY2AgAMmgMLQcgAIRAgASINIAJGDZkDIAIgDWsgACgCACIBaiEWIA0gAWtBCWohFwNAIA0tAAAiFEEgciAUIBRBv39qQf8BcUEaSRtB/wFxIAFBlsKAgABqLQAARw3/AgJAIAFBCUcNAEECIQEM9QILIAFBAWohASANQQFqIg0gAkcNAAsgACAWNgIADJkDCwJAIAEiDSACRw0AQckAIRAMmQMLAkACQCANLQAAIgFBIHIgASABQb9/akH/AXFBGkkbQf8BcUGSf2oOBwCAA4ADgAOAA4ADAYADCyANQQFqIQFBPiEQDIADCyANQQFqIQFBPyEQDP8CC0HKACEQIAEiDSACRg2XAyACIA1rIAAoAgAiAWohFiANIAFrQQFqIRcDQCANLQAAIhRBIHIgFCAUQb9/akH/AXFBGkkbQf8BcSABQaDCgIAAai0AAEcN/QIgAUEBRg3wAiABQQFqIQEgDUEBaiINIAJHDQALIAAgFjYCAAyXAwtBywAhECABIg0gAkYNlgMgAiANayAAKAIAIgFqIRYgDSABa0EOaiEXA0AgDS0AACIUQSByIBQgFEG/f2pB/wFxQRpJG0H/AXEgAUGiwoCAAGotAABHDfwCIAFBDkYN8AIgAUEBaiEBIA1BAWoiDSACRw0ACyAAIBY2AgAMlgMLQcwAIRAgASINIAJGDZUDIAIgDWsgACgCACIBaiEWIA0gAWtBD2ohFwNAIA0tAAAiFEEgciAUIBRBv39qQf8BcUEaSRtB/wFxIAFBwMKAgABqLQAARw37AgJAIAFBD0cNAEEDIQEM8QILIAFBAWohASANQQFqIg0gAkcNAAsgACAWNgIADJUDC0HNACEQIAEiDSACRg2UAyACIA1rIAAoAgAiAWohFiANIAFrQQVqIRcDQCANLQAAIhRBIHIgFCAUQb9/akH/AXFBGkkbQf8BcSABQdDCgIAAai0AAEcN+gICQCABQQVHDQBBBCEBDPACCyABQQFqIQEgDUEBaiINIAJHDQALIAAgFjYCAAyUAwsCQCABIg0gAkcNAEHOACEQDJQDCwJAAkACQAJAIA0tAAAiAUEgciABIAFBv39qQf8BcUEaSRtB/wFxQZ1/ag4TAP0C/QL9Av0C/QL9Av0C/QL9Av0C/QL9AgH9Av0C/QICA/0CCyANQQFqIQFBwQAhEAz9AgsgDUEBaiEBQcIAIRAM/AILIA1BAWohAUHDACEQDPsCCyANQQFqIQFBxAAhEAz6AgsCQCABIgEgAkYNACAAQY2AgIAANgIIIAAgATYCBCABIQFBxQAhEAz6AgtBzwAhEAySAwsgECEBAkACQCAQLQAAQXZqDgQBqAKoAgCoAgsgEEEBaiEBC0EnIRAM+AILAkAgASIBIAJHDQBB0QAhEAyRAwsCQCABLQAAQSBGDQAgASEBDI0BCyABQQFqIQEgAC0ALUEBcUUNxwEgASEBDIwBCyABIhcgAkcNyAFB0gAhEAyPAwtB0wAhECABIhQgAkYNjgMgAiAUayAAKAIAIgFqIRYgFCABa0EBaiEXA0AgFC0AACABQdbCgIAAai0AAEcNzAEgAUEBRg3HASABQQFqIQEgFEEBaiIUIAJHDQALIAAgFjYCAAyOAwsCQCABIgEgAkcNAEHVACEQDI4DCyABLQAAQQpHDcwBIAFBAWohAQzHAQsCQCABIgEgAkcNAEHWACEQDI0DCwJAAkAgAS0AAEF2ag4EAM0BzQEBzQELIAFBAWohAQzHAQsgAUEBaiEBQcoAIRAM8wILIAAgASIBIAIQroCAgAAiEA3LASABIQFBzQAhEAzyAgsgAC0AKUEiRg2FAwymAgsCQCABIgEgAkcNAEHbACEQDIoDC0EAIRRBASEXQQEhFkEAIRACQAJAAkACQAJAAkACQAJAAkAgAS0AAEFQag4K1AHTAQABAgMEBQYI1QELQQIhEAwGC0EDIRAMBQtBBCEQDAQLQQUhEAwDC0EGIRAMAgtBByEQDAELQQghEAtBACEXQQAhFkEAIRQMzAELQQkhEEEBIRRBACEXQQAhFgzLAQsCQCABIgEgAkcNAEHdACEQDIkDCyABLQAAQS5HDcwBIAFBAWohAQymAgsgASIBIAJHDcwBQd8AIRAMhwMLAkAgASIBIAJGDQAgAEGOgICAADYCCCAAIAE2AgQgASEBQdAAIRAM7gILQeAAIRAMhgMLQeEAIRAgASIBIAJGDYUDIAIgAWsgACgCACIUaiEWIAEgFGtBA2ohFwNAIAEtAAAgFEHiwoCAAGotAABHDc0BIBRBA0YNzAEgFEEBaiEUIAFBAWoiASACRw0ACyAAIBY2AgAMhQMLQeIAIRAgASIBIAJGDYQDIAIgAWsgACgCACIUaiEWIAEgFGtBAmohFwNAIAEtAAAgFEHmwoCAAGotAABHDcwBIBRBAkYNzgEgFEEBaiEUIAFBAWoiASACRw0ACyAAIBY2AgAMhAMLQeMAIRAgASIBIAJGDYMDIAIgAWsgACgCACIUaiEWIAEgFGtBA2ohFwNAIAEtAAAgFEHpwoCAAGotAABHDcsBIBRBA0YNzgEgFEEBaiEUIAFBAWoiASACRw0ACyAAIBY2AgAMgwMLAkAgASIBIAJHDQBB5QAhEAyDAwsgACABQQFqIgEgAhCogICAACIQDc0BIAEhAUHWACEQDOkCCwJAIAEiASACRg0AA0ACQCABLQAAIhBBIEYNAAJAAkACQCAQQbh/ag4LAAHPAc8BzwHPAc8BzwHPAc8BAs8BCyABQQFqIQFB0gAhEAztAgsgAUEBaiEBQdMAIRAM7AILIAFBAWohAUHUACEQDOsCCyABQQFqIgEgAkcNAAtB5AAhEAyCAwtB5AAhEAyBAwsDQAJAIAEtAABB8MKAgABqLQAAIhBBAUYNACAQQX5qDgPPAdAB0QHSAQsgAUEBaiIBIAJHDQALQeYAIRAMgAMLAkAgASIBIAJGDQAgAUEBaiEBDAMLQecAIRAM/wILA0ACQCABLQAAQfDEgIAAai0AACIQQQFGDQACQCAQQX5qDgTSAdMB1AEA1QELIAEhAUHXACEQDOcCCyABQQFqIgEgAkcNAAtB6AAhEAz+AgsCQCABIgEgAkcNAEHpACEQDP4CCwJAIAEtAAAiEEF2ag4augHVAdUBvAHVAdUB1QHVAdUB1QHVAdUB1QHVAdUB1QHVAdUB1QHVAdUB1QHKAdUB1QEA0wELIAFBAWohAQtBBiEQDOMCCwNAAkAgAS0AAEHwxoCAAGotAABBAUYNACABIQEMngILIAFBAWoiASACRw0AC0HqACEQDPsCCwJAIAEiASACRg0AIAFBAWohAQwDC0HrACEQDPoCCwJAIAEiASACRw0AQewAIRAM+gILIAFBAWohAQwBCwJAIAEiASACRw0AQe0AIRAM+QILIAFBAWohAQtBBCEQDN4CCwJAIAEiFCACRw0AQe4AIRAM9wILIBQhAQJAAkACQCAULQAAQfDIgIAAai0AAEF/ag4H1AHVAdYBAJwCAQLXAQsgFEEBaiEBDAoLIBRBAWohAQzNAQtBACEQIABBADYCHCAAQZuSgIAANgIQIABBBzYCDCAAIBRBAWo2AhQM9gILAkADQAJAIAEtAABB8MiAgABqLQAAIhBBBEYNAAJAAkAgEEF/ag4H0gHTAdQB2QEABAHZAQsgASEBQdoAIRAM4AILIAFBAWohAUHcACEQDN8CCyABQQFqIgEgAkcNAAtB7wAhEAz2AgsgAUEBaiEBDMsBCwJAIAEiFCACRw0AQfAAIRAM9QILIBQtAABBL0cN1AEgFEEBaiEBDAYLAkAgASIUIAJHDQBB8QAhEAz0AgsCQCAULQAAIgFBL0cNACAUQQFqIQFB3QAhEAzbAgsgAUF2aiIEQRZLDdMBQQEgBHRBiYCAAnFFDdMBDMoCCwJAIAEiASACRg0AIAFBAWohAUHeACEQDNoCC0HyACEQDPICCwJAIAEiFCACRw0AQfQAIRAM8gILIBQhAQJAIBQtAABB8MyAgABqLQAAQX9qDgPJApQCANQBC0HhACEQDNgCCwJAIAEiFCACRg0AA0ACQCAULQAAQfDKgIAAai0AACIBQQNGDQACQCABQX9qDgLLAgDVAQsgFCEBQd8AIRAM2gILIBRBAWoiFCACRw0AC0HzACEQDPECC0HzACEQDPACCwJAIAEiASACRg0AIABBj4CAgAA2AgggACABNgIEIAEhAUHgACEQDNcCC0H1ACEQDO8CCwJAIAEiASACRw0AQfYAIRAM7wILIABBj4CAgAA2AgggACABNgIEIAEhAQtBAyEQDNQCCwNAIAEtAABBIEcNwwIgAUEBaiIBIAJHDQALQfcAIRAM7AILAkAgASIBIAJHDQBB+AAhEAzsAgsgAS0AAEEgRw3OASABQQFqIQEM7wELIAAgASIBIAIQrICAgAAiEA3OASABIQEMjgILAkAgASIEIAJHDQBB+gAhEAzqAgsgBC0AAEHMAEcN0QEgBEEBaiEBQRMhEAzPAQsCQCABIgQgAkcNAEH7ACEQDOkCCyACIARrIAAoAgAiAWohFCAEIAFrQQVqIRADQCAELQAAIAFB8M6AgABqLQAARw3QASABQQVGDc4BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQfsAIRAM6AILAkAgASIEIAJHDQBB/AAhEAzoAgsCQAJAIAQtAABBvX9qDgwA0QHRAdEB0QHRAdEB0QHRAdEB0QEB0QELIARBAWohAUHmACEQDM8CCyAEQQFqIQFB5wAhEAzOAgsCQCABIgQgAkcNAEH9ACEQDOcCCyACIARrIAAoAgAiAWohFCAEIAFrQQJqIRACQANAIAQtAAAgAUHtz4CAAGotAABHDc8BIAFBAkYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEH9ACEQDOcCCyAAQQA2AgAgEEEBaiEBQRAhEAzMAQsCQCABIgQgAkcNAEH+ACEQDOYCCyACIARrIAAoAgAiAWohFCAEIAFrQQVqIRACQANAIAQtAAAgAUH2zoCAAGotAABHDc4BIAFBBUYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEH+ACEQDOYCCyAAQQA2AgAgEEEBaiEBQRYhEAzLAQsCQCABIgQgAkcNAEH/ACEQDOUCCyACIARrIAAoAgAiAWohFCAEIAFrQQNqIRACQANAIAQtAAAgAUH8zoCAAGotAABHDc0BIAFBA0YNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEH/ACEQDOUCCyAAQQA2AgAgEEEBaiEBQQUhEAzKAQsCQCABIgQgAkcNAEGAASEQDOQCCyAELQAAQdkARw3LASAEQQFqIQFBCCEQDMkBCwJAIAEiBCACRw0AQYEBIRAM4wILAkACQCAELQAAQbJ/ag4DAMwBAcwBCyAEQQFqIQFB6wAhEAzKAgsgBEEBaiEBQewAIRAMyQILAkAgASIEIAJHDQBBggEhEAziAgsCQAJAIAQtAABBuH9qDggAywHLAcsBywHLAcsBAcsBCyAEQQFqIQFB6gAhEAzJAgsgBEEBaiEBQe0AIRAMyAILAkAgASIEIAJHDQBBgwEhEAzhAgsgAiAEayAAKAIAIgFqIRAgBCABa0ECaiEUAkADQCAELQAAIAFBgM+AgABqLQAARw3JASABQQJGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBA2AgBBgwEhEAzhAgtBACEQIABBADYCACAUQQFqIQEMxgELAkAgASIEIAJHDQBBhAEhEAzgAgsgAiAEayAAKAIAIgFqIRQgBCABa0EEaiEQAkADQCAELQAAIAFBg8+AgABqLQAARw3IASABQQRGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBhAEhEAzgAgsgAEEANgIAIBBBAWohAUEjIRAMxQELAkAgASIEIAJHDQBBhQEhEAzfAgsCQAJAIAQtAABBtH9qDggAyAHIAcgByAHIAcgBAcgBCyAEQQFqIQFB7wAhEAzGAgsgBEEBaiEBQfAAIRAMxQILAkAgASIEIAJHDQBBhgEhEAzeAgsgBC0AAEHFAEcNxQEgBEEBaiEBDIMCCwJAIAEiBCACRw0AQYcBIRAM3QILIAIgBGsgACgCACIBaiEUIAQgAWtBA2ohEAJAA0AgBC0AACABQYjPgIAAai0AAEcNxQEgAUEDRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQYcBIRAM3QILIABBADYCACAQQQFqIQFBLSEQDMIBCwJAIAEiBCACRw0AQYgBIRAM3AILIAIgBGsgACgCACIBaiEUIAQgAWtBCGohEAJAA0AgBC0AACABQdDPgIAAai0AAEcNxAEgAUEIRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQYgBIRAM3AILIABBADYCACAQQQFqIQFBKSEQDMEBCwJAIAEiASACRw0AQYkBIRAM2wILQQEhECABLQAAQd8ARw3AASABQQFqIQEMgQILAkAgASIEIAJHDQBBigEhEAzaAgsgAiAEayAAKAIAIgFqIRQgBCABa0EBaiEQA0AgBC0AACABQYzPgIAAai0AAEcNwQEgAUEBRg2vAiABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEGKASEQDNkCCwJAIAEiBCACRw0AQYsBIRAM2QILIAIgBGsgACgCACIBaiEUIAQgAWtBAmohEAJAA0AgBC0AACABQY7PgIAAai0AAEcNwQEgAUECRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQYsBIRAM2QILIABBADYCACAQQQFqIQFBAiEQDL4BCwJAIAEiBCACRw0AQYwBIRAM2AILIAIgBGsgACgCACIBaiEUIAQgAWtBAWohEAJAA0AgBC0AACABQfDPgIAAai0AAEcNwAEgAUEBRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQYwBIRAM2AILIABBADYCACAQQQFqIQFBHyEQDL0BCwJAIAEiBCACRw0AQY0BIRAM1wILIAIgBGsgACgCACIBaiEUIAQgAWtBAWohEAJAA0AgBC0AACABQfLPgIAAai0AAEcNvwEgAUEBRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQY0BIRAM1wILIABBADYCACAQQQFqIQFBCSEQDLwBCwJAIAEiBCACRw0AQY4BIRAM1gILAkACQCAELQAAQbd/ag4HAL8BvwG/Ab8BvwEBvwELIARBAWohAUH4ACEQDL0CCyAEQQFqIQFB+QAhEAy8AgsCQCABIgQgAkcNAEGPASEQDNUCCyACIARrIAAoAgAiAWohFCAEIAFrQQVqIRACQANAIAQtAAAgAUGRz4CAAGotAABHDb0BIAFBBUYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEGPASEQDNUCCyAAQQA2AgAgEEEBaiEBQRghEAy6AQsCQCABIgQgAkcNAEGQASEQDNQCCyACIARrIAAoAgAiAWohFCAEIAFrQQJqIRACQANAIAQtAAAgAUGXz4CAAGotAABHDbwBIAFBAkYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEGQASEQDNQCCyAAQQA2AgAgEEEBaiEBQRchEAy5AQsCQCABIgQgAkcNAEGRASEQDNMCCyACIARrIAAoAgAiAWohFCAEIAFrQQZqIRACQANAIAQtAAAgAUGaz4CAAGotAABHDbsBIAFBBkYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEGRASEQDNMCCyAAQQA2AgAgEEEBaiEBQRUhEAy4AQsCQCABIgQgAkcNAEGSASEQDNICCyACIARrIAAoAgAiAWohFCAEIAFrQQVqIRACQANAIAQtAAAgAUGhz4CAAGotAABHDboBIAFBBUYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEGSASEQDNICCyAAQQA2AgAgEEEBaiEBQR4hEAy3AQsCQCABIgQgAkcNAEGTASEQDNECCyAELQAAQcwARw24ASAEQQFqIQFBCiEQDLYBCwJAIAQgAkcNAEGUASEQDNACCwJAAkAgBC0AAEG/f2oODwC5AbkBuQG5AbkBuQG5AbkBuQG5AbkBuQG5AQG5AQsgBEEBaiEBQf4AIRAMtwILIARBAWohAUH/ACEQDLYCCwJAIAQgAkcNAEGVASEQDM8CCwJAAkAgBC0AAEG/f2oOAwC4AQG4AQsgBEEBaiEBQf0AIRAMtgILIARBAWohBEGAASEQDLUCCwJAIAQgAkcNAEGWASEQDM4CCyACIARrIAAoAgAiAWohFCAEIAFrQQFqIRACQANAIAQtAAAgAUGnz4CAAGotAABHDbYBIAFBAUYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEGWASEQDM4CCyAAQQA2AgAgEEEBaiEBQQshEAyzAQsCQCAEIAJHDQBBlwEhEAzNAgsCQAJAAkACQCAELQAAQVNqDiMAuAG4AbgBuAG4AbgBuAG4AbgBuAG4AbgBuAG4AbgBuAG4AbgBuAG4AbgBuAG4AQG4AbgBuAG4AbgBArgBuAG4AQO4AQsgBEEBaiEBQfsAIRAMtgILIARBAWohAUH8ACEQDLUCCyAEQQFqIQRBgQEhEAy0AgsgBEEBaiEEQYIBIRAMswILAkAgBCACRw0AQZgBIRAMzAILIAIgBGsgACgCACIBaiEUIAQgAWtBBGohEAJAA0AgBC0AACABQanPgIAAai0AAEcNtAEgAUEERg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQZgBIRAMzAILIABBADYCACAQQQFqIQFBGSEQDLEBCwJAIAQgAkcNAEGZASEQDMsCCyACIARrIAAoAgAiAWohFCAEIAFrQQVqIRACQANAIAQtAAAgAUGuz4CAAGotAABHDbMBIAFBBUYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEGZASEQDMsCCyAAQQA2AgAgEEEBaiEBQQYhEAywAQsCQCAEIAJHDQBBmgEhEAzKAgsgAiAEayAAKAIAIgFqIRQgBCABa0EBaiEQAkADQCAELQAAIAFBtM+AgABqLQAARw2yASABQQFGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBmgEhEAzKAgsgAEEANgIAIBBBAWohAUEcIRAMrwELAkAgBCACRw0AQZsBIRAMyQILIAIgBGsgACgCACIBaiEUIAQgAWtBAWohEAJAA0AgBC0AACABQbbPgIAAai0AAEcNsQEgAUEBRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQZsBIRAMyQILIABBADYCACAQQQFqIQFBJyEQDK4BCwJAIAQgAkcNAEGcASEQDMgCCwJAAkAgBC0AAEGsf2oOAgABsQELIARBAWohBEGGASEQDK8CCyAEQQFqIQRBhwEhEAyuAgsCQCAEIAJHDQBBnQEhEAzHAgsgAiAEayAAKAIAIgFqIRQgBCABa0EBaiEQAkADQCAELQAAIAFBuM+AgABqLQAARw2vASABQQFGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBnQEhEAzHAgsgAEEANgIAIBBBAWohAUEmIRAMrAELAkAgBCACRw0AQZ4BIRAMxgILIAIgBGsgACgCACIBaiEUIAQgAWtBAWohEAJAA0AgBC0AACABQbrPgIAAai0AAEcNrgEgAUEBRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQZ4BIRAMxgILIABBADYCACAQQQFqIQFBAyEQDKsBCwJAIAQgAkcNAEGfASEQDMUCCyACIARrIAAoAgAiAWohFCAEIAFrQQJqIRACQANAIAQtAAAgAUHtz4CAAGotAABHDa0BIAFBAkYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEGfASEQDMUCCyAAQQA2AgAgEEEBaiEBQQwhEAyqAQsCQCAEIAJHDQBBoAEhEAzEAgsgAiAEayAAKAIAIgFqIRQgBCABa0EDaiEQAkADQCAELQAAIAFBvM+AgABqLQAARw2sASABQQNGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBoAEhEAzEAgsgAEEANgIAIBBBAWohAUENIRAMqQELAkAgBCACRw0AQaEBIRAMwwILAkACQCAELQAAQbp/ag4LAKwBrAGsAawBrAGsAawBrAGsAQGsAQsgBEEBaiEEQYsBIRAMqgILIARBAWohBEGMASEQDKkCCwJAIAQgAkcNAEGiASEQDMICCyAELQAAQdAARw2pASAEQQFqIQQM6QELAkAgBCACRw0AQaMBIRAMwQILAkACQCAELQAAQbd/ag4HAaoBqgGqAaoBqgEAqgELIARBAWohBEGOASEQDKgCCyAEQQFqIQFBIiEQDKYBCwJAIAQgAkcNAEGkASEQDMACCyACIARrIAAoAgAiAWohFCAEIAFrQQFqIRACQANAIAQtAAAgAUHAz4CAAGotAABHDagBIAFBAUYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEGkASEQDMACCyAAQQA2AgAgEEEBaiEBQR0hEAylAQsCQCAEIAJHDQBBpQEhEAy/AgsCQAJAIAQtAABBrn9qDgMAqAEBqAELIARBAWohBEGQASEQDKYCCyAEQQFqIQFBBCEQDKQBCwJAIAQgAkcNAEGmASEQDL4CCwJAAkACQAJAAkAgBC0AAEG/f2oOFQCqAaoBqgGqAaoBqgGqAaoBqgGqAQGqAaoBAqoBqgEDqgGqAQSqAQsgBEEBaiEEQYgBIRAMqAILIARBAWohBEGJASEQDKcCCyAEQQFqIQRBigEhEAymAgsgBEEBaiEEQY8BIRAMpQILIARBAWohBEGRASEQDKQCCwJAIAQgAkcNAEGnASEQDL0CCyACIARrIAAoAgAiAWohFCAEIAFrQQJqIRACQANAIAQtAAAgAUHtz4CAAGotAABHDaUBIAFBAkYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEGnASEQDL0CCyAAQQA2AgAgEEEBaiEBQREhEAyiAQsCQCAEIAJHDQBBqAEhEAy8AgsgAiAEayAAKAIAIgFqIRQgBCABa0ECaiEQAkADQCAELQAAIAFBws+AgABqLQAARw2kASABQQJGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBqAEhEAy8AgsgAEEANgIAIBBBAWohAUEsIRAMoQELAkAgBCACRw0AQakBIRAMuwILIAIgBGsgACgCACIBaiEUIAQgAWtBBGohEAJAA0AgBC0AACABQcXPgIAAai0AAEcNowEgAUEERg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQakBIRAMuwILIABBADYCACAQQQFqIQFBKyEQDKABCwJAIAQgAkcNAEGqASEQDLoCCyACIARrIAAoAgAiAWohFCAEIAFrQQJqIRACQANAIAQtAAAgAUHKz4CAAGotAABHDaIBIAFBAkYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEGqASEQDLoCCyAAQQA2AgAgEEEBaiEBQRQhEAyfAQsCQCAEIAJHDQBBqwEhEAy5AgsCQAJAAkACQCAELQAAQb5/ag4PAAECpAGkAaQBpAGkAaQBpAGkAaQBpAGkAQOkAQsgBEEBaiEEQZMBIRAMogILIARBAWohBEGUASEQDKECCyAEQQFqIQRBlQEhEAygAgsgBEEBaiEEQZYBIRAMnwILAkAgBCACRw0AQawBIRAMuAILIAQtAABBxQBHDZ8BIARBAWohBAzgAQsCQCAEIAJHDQBBrQEhEAy3AgsgAiAEayAAKAIAIgFqIRQgBCABa0ECaiEQAkADQCAELQAAIAFBzc+AgABqLQAARw2fASABQQJGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBrQEhEAy3AgsgAEEANgIAIBBBAWohAUEOIRAMnAELAkAgBCACRw0AQa4BIRAMtgILIAQtAABB0ABHDZ0BIARBAWohAUElIRAMmwELAkAgBCACRw0AQa8BIRAMtQILIAIgBGsgACgCACIBaiEUIAQgAWtBCGohEAJAA0AgBC0AACABQdDPgIAAai0AAEcNnQEgAUEIRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQa8BIRAMtQILIABBADYCACAQQQFqIQFBKiEQDJoBCwJAIAQgAkcNAEGwASEQDLQCCwJAAkAgBC0AAEGrf2oOCwCdAZ0BnQGdAZ0BnQGdAZ0BnQEBnQELIARBAWohBEGaASEQDJsCCyAEQQFqIQRBmwEhEAyaAgsCQCAEIAJHDQBBsQEhEAyzAgsCQAJAIAQtAABBv39qDhQAnAGcAZwBnAGcAZwBnAGcAZwBnAGcAZwBnAGcAZwBnAGcAZwBAZwBCyAEQQFqIQRBmQEhEAyaAgsgBEEBaiEEQZwBIRAMmQILAkAgBCACRw0AQbIBIRAMsgILIAIgBGsgACgCACIBaiEUIAQgAWtBA2ohEAJAA0AgBC0AACABQdnPgIAAai0AAEcNmgEgAUEDRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQbIBIRAMsgILIABBADYCACAQQQFqIQFBISEQDJcBCwJAIAQgAkcNAEGzASEQDLECCyACIARrIAAoAgAiAWohFCAEIAFrQQZqIRACQANAIAQtAAAgAUHdz4CAAGotAABHDZkBIAFBBkYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEGzASEQDLECCyAAQQA2AgAgEEEBaiEBQRohEAyWAQsCQCAEIAJHDQBBtAEhEAywAgsCQAJAAkAgBC0AAEG7f2oOEQCaAZoBmgGaAZoBmgGaAZoBmgEBmgGaAZoBmgGaAQKaAQsgBEEBaiEEQZ0BIRAMmAILIARBAWohBEGeASEQDJcCCyAEQQFqIQRBnwEhEAyWAgsCQCAEIAJHDQBBtQEhEAyvAgsgAiAEayAAKAIAIgFqIRQgBCABa0EFaiEQAkADQCAELQAAIAFB5M+AgABqLQAARw2XASABQQVGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBtQEhEAyvAgsgAEEANgIAIBBBAWohAUEoIRAMlAELAkAgBCACRw0AQbYBIRAMrgILIAIgBGsgACgCACIBaiEUIAQgAWtBAmohEAJAA0AgBC0AACABQerPgIAAai0AAEcNlgEgAUECRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQbYBIRAMrgILIABBADYCACAQQQFqIQFBByEQDJMBCwJAIAQgAkcNAEG3ASEQDK0CCwJAAkAgBC0AAEG7f2oODgCWAZYBlgGWAZYBlgGWAZYBlgGWAZYBlgEBlgELIARBAWohBEGhASEQDJQCCyAEQQFqIQRBogEhEAyTAgsCQCAEIAJHDQBBuAEhEAysAgsgAiAEayAAKAIAIgFqIRQgBCABa0ECaiEQAkADQCAELQAAIAFB7c+AgABqLQAARw2UASABQQJGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBuAEhEAysAgsgAEEANgIAIBBBAWohAUESIRAMkQELAkAgBCACRw0AQbkBIRAMqwILIAIgBGsgACgCACIBaiEUIAQgAWtBAWohEAJAA0AgBC0AACABQfDPgIAAai0AAEcNkwEgAUEBRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQbkBIRAMqwILIABBADYCACAQQQFqIQFBICEQDJABCwJAIAQgAkcNAEG6ASEQDKoCCyACIARrIAAoAgAiAWohFCAEIAFrQQFqIRACQANAIAQtAAAgAUHyz4CAAGotAABHDZIBIAFBAUYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEG6ASEQDKoCCyAAQQA2AgAgEEEBaiEBQQ8hEAyPAQsCQCAEIAJHDQBBuwEhEAypAgsCQAJAIAQtAABBt39qDgcAkgGSAZIBkgGSAQGSAQsgBEEBaiEEQaUBIRAMkAILIARBAWohBEGmASEQDI8CCwJAIAQgAkcNAEG8ASEQDKgCCyACIARrIAAoAgAiAWohFCAEIAFrQQdqIRACQANAIAQtAAAgAUH0z4CAAGotAABHDZABIAFBB0YNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEG8ASEQDKgCCyAAQQA2AgAgEEEBaiEBQRshEAyNAQsCQCAEIAJHDQBBvQEhEAynAgsCQAJAAkAgBC0AAEG+f2oOEgCRAZEBkQGRAZEBkQGRAZEBkQEBkQGRAZEBkQGRAZEBApEBCyAEQQFqIQRBpAEhEAyPAgsgBEEBaiEEQacBIRAMjgILIARBAWohBEGoASEQDI0CCwJAIAQgAkcNAEG+ASEQDKYCCyAELQAAQc4ARw2NASAEQQFqIQQMzwELAkAgBCACRw0AQb8BIRAMpQILAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkAgBC0AAEG/f2oOFQABAgOcAQQFBpwBnAGcAQcICQoLnAEMDQ4PnAELIARBAWohAUHoACEQDJoCCyAEQQFqIQFB6QAhEAyZAgsgBEEBaiEBQe4AIRAMmAILIARBAWohAUHyACEQDJcCCyAEQQFqIQFB8wAhEAyWAgsgBEEBaiEBQfYAIRAMlQILIARBAWohAUH3ACEQDJQCCyAEQQFqIQFB+gAhEAyTAgsgBEEBaiEEQYMBIRAMkgILIARBAWohBEGEASEQDJECCyAEQQFqIQRBhQEhEAyQAgsgBEEBaiEEQZIBIRAMjwILIARBAWohBEGYASEQDI4CCyAEQQFqIQRBoAEhEAyNAgsgBEEBaiEEQaMBIRAMjAILIARBAWohBEGqASEQDIsCCwJAIAQgAkYNACAAQZCAgIAANgIIIAAgBDYCBEGrASEQDIsCC0HAASEQDKMCCyAAIAUgAhCqgICAACIBDYsBIAUhAQxcCwJAIAYgAkYNACAGQQFqIQUMjQELQcIBIRAMoQILA0ACQCAQLQAAQXZqDgSMAQAAjwEACyAQQQFqIhAgAkcNAAtBwwEhEAygAgsCQCAHIAJGDQAgAEGRgICAADYCCCAAIAc2AgQgByEBQQEhEAyHAgtBxAEhEAyfAgsCQCAHIAJHDQBBxQEhEAyfAgsCQAJAIActAABBdmoOBAHOAc4BAM4BCyAHQQFqIQYMjQELIAdBAWohBQyJAQsCQCAHIAJHDQBBxgEhEAyeAgsCQAJAIActAABBdmoOFwGPAY8BAY8BjwGPAY8BjwGPAY8BjwGPAY8BjwGPAY8BjwGPAY8BjwGPAQCPAQsgB0EBaiEHC0GwASEQDIQCCwJAIAggAkcNAEHIASEQDJ0CCyAILQAAQSBHDY0BIABBADsBMiAIQQFqIQFBswEhEAyDAgsgASEXAkADQCAXIgcgAkYNASAHLQAAQVBqQf8BcSIQQQpPDcwBAkAgAC8BMiIUQZkzSw0AIAAgFEEKbCIUOwEyIBBB//8DcyAUQf7/A3FJDQAgB0EBaiEXIAAgFCAQaiIQOwEyIBBB//8DcUHoB0kNAQsLQQAhECAAQQA2AhwgAEHBiYCAADYCECAAQQ02AgwgACAHQQFqNgIUDJwCC0HHASEQDJsCCyAAIAggAhCugICAACIQRQ3KASAQQRVHDYwBIABByAE2AhwgACAINgIUIABByZeAgAA2AhAgAEEVNgIMQQAhEAyaAgsCQCAJIAJHDQBBzAEhEAyaAgtBACEUQQEhF0EBIRZBACEQAkACQAJAAkACQAJAAkACQAJAIAktAABBUGoOCpYBlQEAAQIDBAUGCJcBC0ECIRAMBgtBAyEQDAULQQQhEAwEC0EFIRAMAwtBBiEQDAILQQchEAwBC0EIIRALQQAhF0EAIRZBACEUDI4BC0EJIRBBASEUQQAhF0EAIRYMjQELAkAgCiACRw0AQc4BIRAMmQILIAotAABBLkcNjgEgCkEBaiEJDMoBCyALIAJHDY4BQdABIRAMlwILAkAgCyACRg0AIABBjoCAgAA2AgggACALNgIEQbcBIRAM/gELQdEBIRAMlgILAkAgBCACRw0AQdIBIRAMlgILIAIgBGsgACgCACIQaiEUIAQgEGtBBGohCwNAIAQtAAAgEEH8z4CAAGotAABHDY4BIBBBBEYN6QEgEEEBaiEQIARBAWoiBCACRw0ACyAAIBQ2AgBB0gEhEAyVAgsgACAMIAIQrICAgAAiAQ2NASAMIQEMuAELAkAgBCACRw0AQdQBIRAMlAILIAIgBGsgACgCACIQaiEUIAQgEGtBAWohDANAIAQtAAAgEEGB0ICAAGotAABHDY8BIBBBAUYNjgEgEEEBaiEQIARBAWoiBCACRw0ACyAAIBQ2AgBB1AEhEAyTAgsCQCAEIAJHDQBB1gEhEAyTAgsgAiAEayAAKAIAIhBqIRQgBCAQa0ECaiELA0AgBC0AACAQQYPQgIAAai0AAEcNjgEgEEECRg2QASAQQQFqIRAgBEEBaiIEIAJHDQALIAAgFDYCAEHWASEQDJICCwJAIAQgAkcNAEHXASEQDJICCwJAAkAgBC0AAEG7f2oOEACPAY8BjwGPAY8BjwGPAY8BjwGPAY8BjwGPAY8BAY8BCyAEQQFqIQRBuwEhEAz5AQsgBEEBaiEEQbwBIRAM+AELAkAgBCACRw0AQdgBIRAMkQILIAQtAABByABHDYwBIARBAWohBAzEAQsCQCAEIAJGDQAgAEGQgICAADYCCCAAIAQ2AgRBvgEhEAz3AQtB2QEhEAyPAgsCQCAEIAJHDQBB2gEhEAyPAgsgBC0AAEHIAEYNwwEgAEEBOgAoDLkBCyAAQQI6AC8gACAEIAIQpoCAgAAiEA2NAUHCASEQDPQBCyAALQAoQX9qDgK3AbkBuAELA0ACQCAELQAAQXZqDgQAjgGOAQCOAQsgBEEBaiIEIAJHDQALQd0BIRAMiwILIABBADoALyAALQAtQQRxRQ2EAgsgAEEAOgAvIABBAToANCABIQEMjAELIBBBFUYN2gEgAEEANgIcIAAgATYCFCAAQaeOgIAANgIQIABBEjYCDEEAIRAMiAILAkAgACAQIAIQtICAgAAiBA0AIBAhAQyBAgsCQCAEQRVHDQAgAEEDNgIcIAAgEDYCFCAAQbCYgIAANgIQIABBFTYCDEEAIRAMiAILIABBADYCHCAAIBA2AhQgAEGnjoCAADYCECAAQRI2AgxBACEQDIcCCyAQQRVGDdYBIABBADYCHCAAIAE2AhQgAEHajYCAADYCECAAQRQ2AgxBACEQDIYCCyAAKAIEIRcgAEEANgIEIBAgEadqIhYhASAAIBcgECAWIBQbIhAQtYCAgAAiFEUNjQEgAEEHNgIcIAAgEDYCFCAAIBQ2AgxBACEQDIUCCyAAIAAvATBBgAFyOwEwIAEhAQtBKiEQDOoBCyAQQRVGDdEBIABBADYCHCAAIAE2AhQgAEGDjICAADYCECAAQRM2AgxBACEQDIICCyAQQRVGDc8BIABBADYCHCAAIAE2AhQgAEGaj4CAADYCECAAQSI2AgxBACEQDIECCyAAKAIEIRAgAEEANgIEAkAgACAQIAEQt4CAgAAiEA0AIAFBAWohAQyNAQsgAEEMNgIcIAAgEDYCDCAAIAFBAWo2AhRBACEQDIACCyAQQRVGDcwBIABBADYCHCAAIAE2AhQgAEGaj4CAADYCECAAQSI2AgxBACEQDP8BCyAAKAIEIRAgAEEANgIEAkAgACAQIAEQt4CAgAAiEA0AIAFBAWohAQyMAQsgAEENNgIcIAAgEDYCDCAAIAFBAWo2AhRBACEQDP4BCyAQQRVGDckBIABBADYCHCAAIAE2AhQgAEHGjICAADYCECAAQSM2AgxBACEQDP0BCyAAKAIEIRAgAEEANgIEAkAgACAQIAEQuYCAgAAiEA0AIAFBAWohAQyLAQsgAEEONgIcIAAgEDYCDCAAIAFBAWo2AhRBACEQDPwBCyAAQQA2AhwgACABNgIUIABBwJWAgAA2AhAgAEECNgIMQQAhEAz7AQsgEEEVRg3FASAAQQA2AhwgACABNgIUIABBxoyAgAA2AhAgAEEjNgIMQQAhEAz6AQsgAEEQNgIcIAAgATYCFCAAIBA2AgxBACEQDPkBCyAAKAIEIQQgAEEANgIEAkAgACAEIAEQuYCAgAAiBA0AIAFBAWohAQzxAQsgAEERNgIcIAAgBDYCDCAAIAFBAWo2AhRBACEQDPgBCyAQQRVGDcEBIABBADYCHCAAIAE2AhQgAEHGjICAADYCECAAQSM2AgxBACEQDPcBCyAAKAIEIRAgAEEANgIEAkAgACAQIAEQuYCAgAAiEA0AIAFBAWohAQyIAQsgAEETNgIcIAAgEDYCDCAAIAFBAWo2AhRBACEQDPYBCyAAKAIEIQQgAEEANgIEAkAgACAEIAEQuYCAgAAiBA0AIAFBAWohAQztAQsgAEEUNgIcIAAgBDYCDCAAIAFBAWo2AhRBACEQDPUBCyAQQRVGDb0BIABBADYCHCAAIAE2AhQgAEGaj4CAADYCECAAQSI2AgxBACEQDPQBCyAAKAIEIRAgAEEANgIEAkAgACAQIAEQt4CAgAAiEA0AIAFBAWohAQyGAQsgAEEWNgIcIAAgEDYCDCAAIAFBAWo2AhRBACEQDPMBCyAAKAIEIQQgAEEANgIEAkAgACAEIAEQt4CAgAAiBA0AIAFBAWohAQzpAQsgAEEXNgIcIAAgBDYCDCAAIAFBAWo2AhRBACEQDPIBCyAAQQA2AhwgACABNgIUIABBzZOAgAA2AhAgAEEMNgIMQQAhEAzxAQtCASERCyAQQQFqIQECQCAAKQMgIhJC//////////8PVg0AIAAgEkIEhiARhDcDICABIQEMhAELIABBADYCHCAAIAE2AhQgAEGtiYCAADYCECAAQQw2AgxBACEQDO8BCyAAQQA2AhwgACAQNgIUIABBzZOAgAA2AhAgAEEMNgIMQQAhEAzuAQsgACgCBCEXIABBADYCBCAQIBGnaiIWIQEgACAXIBAgFiAUGyIQELWAgIAAIhRFDXMgAEEFNgIcIAAgEDYCFCAAIBQ2AgxBACEQDO0BCyAAQQA2AhwgACAQNgIUIABBqpyAgAA2AhAgAEEPNgIMQQAhEAzsAQsgACAQIAIQtICAgAAiAQ0BIBAhAQtBDiEQDNEBCwJAIAFBFUcNACAAQQI2AhwgACAQNgIUIABBsJiAgAA2AhAgAEEVNgIMQQAhEAzqAQsgAEEANgIcIAAgEDYCFCAAQaeOgIAANgIQIABBEjYCDEEAIRAM6QELIAFBAWohEAJAIAAvATAiAUGAAXFFDQACQCAAIBAgAhC7gICAACIBDQAgECEBDHALIAFBFUcNugEgAEEFNgIcIAAgEDYCFCAAQfmXgIAANgIQIABBFTYCDEEAIRAM6QELAkAgAUGgBHFBoARHDQAgAC0ALUECcQ0AIABBADYCHCAAIBA2AhQgAEGWk4CAADYCECAAQQQ2AgxBACEQDOkBCyAAIBAgAhC9gICAABogECEBAkACQAJAAkACQCAAIBAgAhCzgICAAA4WAgEABAQEBAQEBAQEBAQEBAQEBAQEAwQLIABBAToALgsgACAALwEwQcAAcjsBMCAQIQELQSYhEAzRAQsgAEEjNgIcIAAgEDYCFCAAQaWWgIAANgIQIABBFTYCDEEAIRAM6QELIABBADYCHCAAIBA2AhQgAEHVi4CAADYCECAAQRE2AgxBACEQDOgBCyAALQAtQQFxRQ0BQcMBIRAMzgELAkAgDSACRg0AA0ACQCANLQAAQSBGDQAgDSEBDMQBCyANQQFqIg0gAkcNAAtBJSEQDOcBC0ElIRAM5gELIAAoAgQhBCAAQQA2AgQgACAEIA0Qr4CAgAAiBEUNrQEgAEEmNgIcIAAgBDYCDCAAIA1BAWo2AhRBACEQDOUBCyAQQRVGDasBIABBADYCHCAAIAE2AhQgAEH9jYCAADYCECAAQR02AgxBACEQDOQBCyAAQSc2AhwgACABNgIUIAAgEDYCDEEAIRAM4wELIBAhAUEBIRQCQAJAAkACQAJAAkACQCAALQAsQX5qDgcGBQUDAQIABQsgACAALwEwQQhyOwEwDAMLQQIhFAwBC0EEIRQLIABBAToALCAAIAAvATAgFHI7ATALIBAhAQtBKyEQDMoBCyAAQQA2AhwgACAQNgIUIABBq5KAgAA2AhAgAEELNgIMQQAhEAziAQsgAEEANgIcIAAgATYCFCAAQeGPgIAANgIQIABBCjYCDEEAIRAM4QELIABBADoALCAQIQEMvQELIBAhAUEBIRQCQAJAAkACQAJAIAAtACxBe2oOBAMBAgAFCyAAIAAvATBBCHI7ATAMAwtBAiEUDAELQQQhFAsgAEEBOgAsIAAgAC8BMCAUcjsBMAsgECEBC0EpIRAMxQELIABBADYCHCAAIAE2AhQgAEHwlICAADYCECAAQQM2AgxBACEQDN0BCwJAIA4tAABBDUcNACAAKAIEIQEgAEEANgIEAkAgACABIA4QsYCAgAAiAQ0AIA5BAWohAQx1CyAAQSw2AhwgACABNgIMIAAgDkEBajYCFEEAIRAM3QELIAAtAC1BAXFFDQFBxAEhEAzDAQsCQCAOIAJHDQBBLSEQDNwBCwJAAkADQAJAIA4tAABBdmoOBAIAAAMACyAOQQFqIg4gAkcNAAtBLSEQDN0BCyAAKAIEIQEgAEEANgIEAkAgACABIA4QsYCAgAAiAQ0AIA4hAQx0CyAAQSw2AhwgACAONgIUIAAgATYCDEEAIRAM3AELIAAoAgQhASAAQQA2AgQCQCAAIAEgDhCxgICAACIBDQAgDkEBaiEBDHMLIABBLDYCHCAAIAE2AgwgACAOQQFqNgIUQQAhEAzbAQsgACgCBCEEIABBADYCBCAAIAQgDhCxgICAACIEDaABIA4hAQzOAQsgEEEsRw0BIAFBAWohEEEBIQECQAJAAkACQAJAIAAtACxBe2oOBAMBAgQACyAQIQEMBAtBAiEBDAELQQQhAQsgAEEBOgAsIAAgAC8BMCABcjsBMCAQIQEMAQsgACAALwEwQQhyOwEwIBAhAQtBOSEQDL8BCyAAQQA6ACwgASEBC0E0IRAMvQELIAAgAC8BMEEgcjsBMCABIQEMAgsgACgCBCEEIABBADYCBAJAIAAgBCABELGAgIAAIgQNACABIQEMxwELIABBNzYCHCAAIAE2AhQgACAENgIMQQAhEAzUAQsgAEEIOgAsIAEhAQtBMCEQDLkBCwJAIAAtAChBAUYNACABIQEMBAsgAC0ALUEIcUUNkwEgASEBDAMLIAAtADBBIHENlAFBxQEhEAy3AQsCQCAPIAJGDQACQANAAkAgDy0AAEFQaiIBQf8BcUEKSQ0AIA8hAUE1IRAMugELIAApAyAiEUKZs+bMmbPmzBlWDQEgACARQgp+IhE3AyAgESABrUL/AYMiEkJ/hVYNASAAIBEgEnw3AyAgD0EBaiIPIAJHDQALQTkhEAzRAQsgACgCBCECIABBADYCBCAAIAIgD0EBaiIEELGAgIAAIgINlQEgBCEBDMMBC0E5IRAMzwELAkAgAC8BMCIBQQhxRQ0AIAAtAChBAUcNACAALQAtQQhxRQ2QAQsgACABQff7A3FBgARyOwEwIA8hAQtBNyEQDLQBCyAAIAAvATBBEHI7ATAMqwELIBBBFUYNiwEgAEEANgIcIAAgATYCFCAAQfCOgIAANgIQIABBHDYCDEEAIRAMywELIABBwwA2AhwgACABNgIMIAAgDUEBajYCFEEAIRAMygELAkAgAS0AAEE6Rw0AIAAoAgQhECAAQQA2AgQCQCAAIBAgARCvgICAACIQDQAgAUEBaiEBDGMLIABBwwA2AhwgACAQNgIMIAAgAUEBajYCFEEAIRAMygELIABBADYCHCAAIAE2AhQgAEGxkYCAADYCECAAQQo2AgxBACEQDMkBCyAAQQA2AhwgACABNgIUIABBoJmAgAA2AhAgAEEeNgIMQQAhEAzIAQsgAEEANgIACyAAQYASOwEqIAAgF0EBaiIBIAIQqICAgAAiEA0BIAEhAQtBxwAhEAysAQsgEEEVRw2DASAAQdEANgIcIAAgATYCFCAAQeOXgIAANgIQIABBFTYCDEEAIRAMxAELIAAoAgQhECAAQQA2AgQCQCAAIBAgARCngICAACIQDQAgASEBDF4LIABB0gA2AhwgACABNgIUIAAgEDYCDEEAIRAMwwELIABBADYCHCAAIBQ2AhQgAEHBqICAADYCECAAQQc2AgwgAEEANgIAQQAhEAzCAQsgACgCBCEQIABBADYCBAJAIAAgECABEKeAgIAAIhANACABIQEMXQsgAEHTADYCHCAAIAE2AhQgACAQNgIMQQAhEAzBAQtBACEQIABBADYCHCAAIAE2AhQgAEGAkYCAADYCECAAQQk2AgwMwAELIBBBFUYNfSAAQQA2AhwgACABNgIUIABBlI2AgAA2AhAgAEEhNgIMQQAhEAy/AQtBASEWQQAhF0EAIRRBASEQCyAAIBA6ACsgAUEBaiEBAkACQCAALQAtQRBxDQACQAJAAkAgAC0AKg4DAQACBAsgFkUNAwwCCyAUDQEMAgsgF0UNAQsgACgCBCEQIABBADYCBAJAIAAgECABEK2AgIAAIhANACABIQEMXAsgAEHYADYCHCAAIAE2AhQgACAQNgIMQQAhEAy+AQsgACgCBCEEIABBADYCBAJAIAAgBCABEK2AgIAAIgQNACABIQEMrQELIABB2QA2AhwgACABNgIUIAAgBDYCDEEAIRAMvQELIAAoAgQhBCAAQQA2AgQCQCAAIAQgARCtgICAACIEDQAgASEBDKsBCyAAQdoANgIcIAAgATYCFCAAIAQ2AgxBACEQDLwBCyAAKAIEIQQgAEEANgIEAkAgACAEIAEQrYCAgAAiBA0AIAEhAQypAQsgAEHcADYCHCAAIAE2AhQgACAENgIMQQAhEAy7AQsCQCABLQAAQVBqIhBB/wFxQQpPDQAgACAQOgAqIAFBAWohAUHPACEQDKIBCyAAKAIEIQQgAEEANgIEAkAgACAEIAEQrYCAgAAiBA0AIAEhAQynAQsgAEHeADYCHCAAIAE2AhQgACAENgIMQQAhEAy6AQsgAEEANgIAIBdBAWohAQJAIAAtAClBI08NACABIQEMWQsgAEEANgIcIAAgATYCFCAAQdOJgIAANgIQIABBCDYCDEEAIRAMuQELIABBADYCAAtBACEQIABBADYCHCAAIAE2AhQgAEGQs4CAADYCECAAQQg2AgwMtwELIABBADYCACAXQQFqIQECQCAALQApQSFHDQAgASEBDFYLIABBADYCHCAAIAE2AhQgAEGbioCAADYCECAAQQg2AgxBACEQDLYBCyAAQQA2AgAgF0EBaiEBAkAgAC0AKSIQQV1qQQtPDQAgASEBDFULAkAgEEEGSw0AQQEgEHRBygBxRQ0AIAEhAQxVC0EAIRAgAEEANgIcIAAgATYCFCAAQfeJgIAANgIQIABBCDYCDAy1AQsgEEEVRg1xIABBADYCHCAAIAE2AhQgAEG5jYCAADYCECAAQRo2AgxBACEQDLQBCyAAKAIEIRAgAEEANgIEAkAgACAQIAEQp4CAgAAiEA0AIAEhAQxUCyAAQeUANgIcIAAgATYCFCAAIBA2AgxBACEQDLMBCyAAKAIEIRAgAEEANgIEAkAgACAQIAEQp4CAgAAiEA0AIAEhAQxNCyAAQdIANgIcIAAgATYCFCAAIBA2AgxBACEQDLIBCyAAKAIEIRAgAEEANgIEAkAgACAQIAEQp4CAgAAiEA0AIAEhAQxNCyAAQdMANgIcIAAgATYCFCAAIBA2AgxBACEQDLEBCyAAKAIEIRAgAEEANgIEAkAgACAQIAEQp4CAgAAiEA0AIAEhAQxRCyAAQeUANgIcIAAgATYCFCAAIBA2AgxBACEQDLABCyAAQQA2AhwgACABNgIUIABBxoqAgAA2AhAgAEEHNgIMQQAhEAyvAQsgACgCBCEQIABBADYCBAJAIAAgECABEKeAgIAAIhANACABIQEMSQsgAEHSADYCHCAAIAE2AhQgACAQNgIMQQAhEAyuAQsgACgCBCEQIABBADYCBAJAIAAgECABEKeAgIAAIhANACABIQEMSQsgAEHTADYCHCAAIAE2AhQgACAQNgIMQQAhEAytAQsgACgCBCEQIABBADYCBAJAIAAgECABEKeAgIAAIhANACABIQEMTQsgAEHlADYCHCAAIAE2AhQgACAQNgIMQQAhEAysAQsgAEEANgIcIAAgATYCFCAAQdyIgIAANgIQIABBBzYCDEEAIRAMqwELIBBBP0cNASABQQFqIQELQQUhEAyQAQtBACEQIABBADYCHCAAIAE2AhQgAEH9koCAADYCECAAQQc2AgwMqAELIAAoAgQhECAAQQA2AgQCQCAAIBAgARCngICAACIQDQAgASEBDEILIABB0gA2AhwgACABNgIUIAAgEDYCDEEAIRAMpwELIAAoAgQhECAAQQA2AgQCQCAAIBAgARCngICAACIQDQAgASEBDEILIABB0wA2AhwgACABNgIUIAAgEDYCDEEAIRAMpgELIAAoAgQhECAAQQA2AgQCQCAAIBAgARCngICAACIQDQAgASEBDEYLIABB5QA2AhwgACABNgIUIAAgEDYCDEEAIRAMpQELIAAoAgQhASAAQQA2AgQCQCAAIAEgFBCngICAACIBDQAgFCEBDD8LIABB0gA2AhwgACAUNgIUIAAgATYCDEEAIRAMpAELIAAoAgQhASAAQQA2AgQCQCAAIAEgFBCngICAACIBDQAgFCEBDD8LIABB0wA2AhwgACAUNgIUIAAgATYCDEEAIRAMowELIAAoAgQhASAAQQA2AgQCQCAAIAEgFBCngICAACIBDQAgFCEBDEMLIABB5QA2AhwgACAUNgIUIAAgATYCDEEAIRAMogELIABBADYCHCAAIBQ2AhQgAEHDj4CAADYCECAAQQc2AgxBACEQDKEBCyAAQQA2AhwgACABNgIUIABBw4+AgAA2AhAgAEEHNgIMQQAhEAygAQtBACEQIABBADYCHCAAIBQ2AhQgAEGMnICAADYCECAAQQc2AgwMnwELIABBADYCHCAAIBQ2AhQgAEGMnICAADYCECAAQQc2AgxBACEQDJ4BCyAAQQA2AhwgACAUNgIUIABB/pGAgAA2AhAgAEEHNgIMQQAhEAydAQsgAEEANgIcIAAgATYCFCAAQY6bgIAANgIQIABBBjYCDEEAIRAMnAELIBBBFUYNVyAAQQA2AhwgACABNgIUIABBzI6AgAA2AhAgAEEgNgIMQQAhEAybAQsgAEEANgIAIBBBAWohAUEkIRALIAAgEDoAKSAAKAIEIRAgAEEANgIEIAAgECABEKuAgIAAIhANVCABIQEMPgsgAEEANgIAC0EAIRAgAEEANgIcIAAgBDYCFCAAQfGbgIAANgIQIABBBjYCDAyXAQsgAUEVRg1QIABBADYCHCAAIAU2AhQgAEHwjICAADYCECAAQRs2AgxBACEQDJYBCyAAKAIEIQUgAEEANgIEIAAgBSAQEKmAgIAAIgUNASAQQQFqIQULQa0BIRAMewsgAEHBATYCHCAAIAU2AgwgACAQQQFqNgIUQQAhEAyTAQsgACgCBCEGIABBADYCBCAAIAYgEBCpgICAACIGDQEgEEEBaiEGC0GuASEQDHgLIABBwgE2AhwgACAGNgIMIAAgEEEBajYCFEEAIRAMkAELIABBADYCHCAAIAc2AhQgAEGXi4CAADYCECAAQQ02AgxBACEQDI8BCyAAQQA2AhwgACAINgIUIABB45CAgAA2AhAgAEEJNgIMQQAhEAyOAQsgAEEANgIcIAAgCDYCFCAAQZSNgIAANgIQIABBITYCDEEAIRAMjQELQQEhFkEAIRdBACEUQQEhEAsgACAQOgArIAlBAWohCAJAAkAgAC0ALUEQcQ0AAkACQAJAIAAtACoOAwEAAgQLIBZFDQMMAgsgFA0BDAILIBdFDQELIAAoAgQhECAAQQA2AgQgACAQIAgQrYCAgAAiEEUNPSAAQckBNgIcIAAgCDYCFCAAIBA2AgxBACEQDIwBCyAAKAIEIQQgAEEANgIEIAAgBCAIEK2AgIAAIgRFDXYgAEHKATYCHCAAIAg2AhQgACAENgIMQQAhEAyLAQsgACgCBCEEIABBADYCBCAAIAQgCRCtgICAACIERQ10IABBywE2AhwgACAJNgIUIAAgBDYCDEEAIRAMigELIAAoAgQhBCAAQQA2AgQgACAEIAoQrYCAgAAiBEUNciAAQc0BNgIcIAAgCjYCFCAAIAQ2AgxBACEQDIkBCwJAIAstAABBUGoiEEH/AXFBCk8NACAAIBA6ACogC0EBaiEKQbYBIRAMcAsgACgCBCEEIABBADYCBCAAIAQgCxCtgICAACIERQ1wIABBzwE2AhwgACALNgIUIAAgBDYCDEEAIRAMiAELIABBADYCHCAAIAQ2AhQgAEGQs4CAADYCECAAQQg2AgwgAEEANgIAQQAhEAyHAQsgAUEVRg0/IABBADYCHCAAIAw2AhQgAEHMjoCAADYCECAAQSA2AgxBACEQDIYBCyAAQYEEOwEoIAAoAgQhECAAQgA3AwAgACAQIAxBAWoiDBCrgICAACIQRQ04IABB0wE2AhwgACAMNgIUIAAgEDYCDEEAIRAMhQELIABBADYCAAtBACEQIABBADYCHCAAIAQ2AhQgAEHYm4CAADYCECAAQQg2AgwMgwELIAAoAgQhECAAQgA3AwAgACAQIAtBAWoiCxCrgICAACIQDQFBxgEhEAxpCyAAQQI6ACgMVQsgAEHVATYCHCAAIAs2AhQgACAQNgIMQQAhEAyAAQsgEEEVRg03IABBADYCHCAAIAQ2AhQgAEGkjICAADYCECAAQRA2AgxBACEQDH8LIAAtADRBAUcNNCAAIAQgAhC8gICAACIQRQ00IBBBFUcNNSAAQdwBNgIcIAAgBDYCFCAAQdWWgIAANgIQIABBFTYCDEEAIRAMfgtBACEQIABBADYCHCAAQa+LgIAANgIQIABBAjYCDCAAIBRBAWo2AhQMfQtBACEQDGMLQQIhEAxiC0ENIRAMYQtBDyEQDGALQSUhEAxfC0ETIRAMXgtBFSEQDF0LQRYhEAxcC0EXIRAMWwtBGCEQDFoLQRkhEAxZC0EaIRAMWAtBGyEQDFcLQRwhEAxWC0EdIRAMVQtBHyEQDFQLQSEhEAxTC0EjIRAMUgtBxgAhEAxRC0EuIRAMUAtBLyEQDE8LQTshEAxOC0E9IRAMTQtByAAhEAxMC0HJACEQDEsLQcsAIRAMSgtBzAAhEAxJC0HOACEQDEgLQdEAIRAMRwtB1QAhEAxGC0HYACEQDEULQdkAIRAMRAtB2wAhEAxDC0HkACEQDEILQeUAIRAMQQtB8QAhEAxAC0H0ACEQDD8LQY0BIRAMPgtBlwEhEAw9C0GpASEQDDwLQawBIRAMOwtBwAEhEAw6C0G5ASEQDDkLQa8BIRAMOAtBsQEhEAw3C0GyASEQDDYLQbQBIRAMNQtBtQEhEAw0C0G6ASEQDDMLQb0BIRAMMgtBvwEhEAwxC0HBASEQDDALIABBADYCHCAAIAQ2AhQgAEHpi4CAADYCECAAQR82AgxBACEQDEgLIABB2wE2AhwgACAENgIUIABB+paAgAA2AhAgAEEVNgIMQQAhEAxHCyAAQfgANgIcIAAgDDYCFCAAQcqYgIAANgIQIABBFTYCDEEAIRAMRgsgAEHRADYCHCAAIAU2AhQgAEGwl4CAADYCECAAQRU2AgxBACEQDEULIABB+QA2AhwgACABNgIUIAAgEDYCDEEAIRAMRAsgAEH4ADYCHCAAIAE2AhQgAEHKmICAADYCECAAQRU2AgxBACEQDEMLIABB5AA2AhwgACABNgIUIABB45eAgAA2AhAgAEEVNgIMQQAhEAxCCyAAQdcANgIcIAAgATYCFCAAQcmXgIAANgIQIABBFTYCDEEAIRAMQQsgAEEANgIcIAAgATYCFCAAQbmNgIAANgIQIABBGjYCDEEAIRAMQAsgAEHCADYCHCAAIAE2AhQgAEHjmICAADYCECAAQRU2AgxBACEQDD8LIABBADYCBCAAIA8gDxCxgICAACIERQ0BIABBOjYCHCAAIAQ2AgwgACAPQQFqNgIUQQAhEAw+CyAAKAIEIQQgAEEANgIEAkAgACAEIAEQsYCAgAAiBEUNACAAQTs2AhwgACAENgIMIAAgAUEBajYCFEEAIRAMPgsgAUEBaiEBDC0LIA9BAWohAQwtCyAAQQA2AhwgACAPNgIUIABB5JKAgAA2AhAgAEEENgIMQQAhEAw7CyAAQTY2AhwgACAENgIUIAAgAjYCDEEAIRAMOgsgAEEuNgIcIAAgDjYCFCAAIAQ2AgxBACEQDDkLIABB0AA2AhwgACABNgIUIABBkZiAgAA2AhAgAEEVNgIMQQAhEAw4CyANQQFqIQEMLAsgAEEVNgIcIAAgATYCFCAAQYKZgIAANgIQIABBFTYCDEEAIRAMNgsgAEEbNgIcIAAgATYCFCAAQZGXgIAANgIQIABBFTYCDEEAIRAMNQsgAEEPNgIcIAAgATYCFCAAQZGXgIAANgIQIABBFTYCDEEAIRAMNAsgAEELNgIcIAAgATYCFCAAQZGXgIAANgIQIABBFTYCDEEAIRAMMwsgAEEaNgIcIAAgATYCFCAAQYKZgIAANgIQIABBFTYCDEEAIRAMMgsgAEELNgIcIAAgATYCFCAAQYKZgIAANgIQIABBFTYCDEEAIRAMMQsgAEEKNgIcIAAgATYCFCAAQeSWgIAANgIQIABBFTYCDEEAIRAMMAsgAEEeNgIcIAAgATYCFCAAQfmXgIAANgIQIABBFTYCDEEAIRAMLwsgAEEANgIcIAAgEDYCFCAAQdqNgIAANgIQIABBFDYCDEEAIRAMLgsgAEEENgIcIAAgATYCFCAAQbCYgIAANgIQIABBFTYCDEEAIRAMLQsgAEEANgIAIAtBAWohCwtBuAEhEAwSCyAAQQA2AgAgEEEBaiEBQfUAIRAMEQsgASEBAkAgAC0AKUEFRw0AQeMAIRAMEQtB4gAhEAwQC0EAIRAgAEEANgIcIABB5JGAgAA2AhAgAEEHNgIMIAAgFEEBajYCFAwoCyAAQQA2AgAgF0EBaiEBQcAAIRAMDgtBASEBCyAAIAE6ACwgAEEANgIAIBdBAWohAQtBKCEQDAsLIAEhAQtBOCEQDAkLAkAgASIPIAJGDQADQAJAIA8tAABBgL6AgABqLQAAIgFBAUYNACABQQJHDQMgD0EBaiEBDAQLIA9BAWoiDyACRw0AC0E+IRAMIgtBPiEQDCELIABBADoALCAPIQEMAQtBCyEQDAYLQTohEAwFCyABQQFqIQFBLSEQDAQLIAAgAToALCAAQQA2AgAgFkEBaiEBQQwhEAwDCyAAQQA2AgAgF0EBaiEBQQohEAwCCyAAQQA2AgALIABBADoALCANIQFBCSEQDAALC0EAIRAgAEEANgIcIAAgCzYCFCAAQc2QgIAANgIQIABBCTYCDAwXC0EAIRAgAEEANgIcIAAgCjYCFCAAQemKgIAANgIQIABBCTYCDAwWC0EAIRAgAEEANgIcIAAgCTYCFCAAQbeQgIAANgIQIABBCTYCDAwVC0EAIRAgAEEANgIcIAAgCDYCFCAAQZyRgIAANgIQIABBCTYCDAwUC0EAIRAgAEEANgIcIAAgATYCFCAAQc2QgIAANgIQIABBCTYCDAwTC0EAIRAgAEEANgIcIAAgATYCFCAAQemKgIAANgIQIABBCTYCDAwSC0EAIRAgAEEANgIcIAAgATYCFCAAQbeQgIAANgIQIABBCTYCDAwRC0EAIRAgAEEANgIcIAAgATYCFCAAQZyRgIAANgIQIABBCTYCDAwQC0EAIRAgAEEANgIcIAAgATYCFCAAQZeVgIAANgIQIABBDzYCDAwPC0EAIRAgAEEANgIcIAAgATYCFCAAQZeVgIAANgIQIABBDzYCDAwOC0EAIRAgAEEANgIcIAAgATYCFCAAQcCSgIAANgIQIABBCzYCDAwNC0EAIRAgAEEANgIcIAAgATYCFCAAQZWJgIAANgIQIABBCzYCDAwMC0EAIRAgAEEANgIcIAAgATYCFCAAQeGPgIAANgIQIABBCjYCDAwLC0EAIRAgAEEANgIcIAAgATYCFCAAQfuPgIAANgIQIABBCjYCDAwKC0EAIRAgAEEANgIcIAAgATYCFCAAQfGZgIAANgIQIABBAjYCDAwJC0EAIRAgAEEANgIcIAAgATYCFCAAQcSUgIAANgIQIABBAjYCDAwIC0EAIRAgAEEANgIcIAAgATYCFCAAQfKVgIAANgIQIABBAjYCDAwHCyAAQQI2AhwgACABNgIUIABBnJqAgAA2AhAgAEEWNgIMQQAhEAwGC0EBIRAMBQtB1AAhECABIgQgAkYNBCADQQhqIAAgBCACQdjCgIAAQQoQxYCAgAAgAygCDCEEIAMoAggOAwEEAgALEMqAgIAAAAsgAEEANgIcIABBtZqAgAA2AhAgAEEXNgIMIAAgBEEBajYCFEEAIRAMAgsgAEEANgIcIAAgBDYCFCAAQcqagIAANgIQIABBCTYCDEEAIRAMAQsCQCABIgQgAkcNAEEiIRAMAQsgAEGJgICAADYCCCAAIAQ2AgRBISEQCyADQRBqJICAgIAAIBALrwEBAn8gASgCACEGAkACQCACIANGDQAgBCAGaiEEIAYgA2ogAmshByACIAZBf3MgBWoiBmohBQNAAkAgAi0AACAELQAARg0AQQIhBAwDCwJAIAYNAEEAIQQgBSECDAMLIAZBf2ohBiAEQQFqIQQgAkEBaiICIANHDQALIAchBiADIQILIABBATYCACABIAY2AgAgACACNgIEDwsgAUEANgIAIAAgBDYCACAAIAI2AgQLCgAgABDHgICAAAvyNgELfyOAgICAAEEQayIBJICAgIAAAkBBACgCoNCAgAANAEEAEMuAgIAAQYDUhIAAayICQdkASQ0AQQAhAwJAQQAoAuDTgIAAIgQNAEEAQn83AuzTgIAAQQBCgICEgICAwAA3AuTTgIAAQQAgAUEIakFwcUHYqtWqBXMiBDYC4NOAgABBAEEANgL004CAAEEAQQA2AsTTgIAAC0EAIAI2AszTgIAAQQBBgNSEgAA2AsjTgIAAQQBBgNSEgAA2ApjQgIAAQQAgBDYCrNCAgABBAEF/NgKo0ICAAANAIANBxNCAgABqIANBuNCAgABqIgQ2AgAgBCADQbDQgIAAaiIFNgIAIANBvNCAgABqIAU2AgAgA0HM0ICAAGogA0HA0ICAAGoiBTYCACAFIAQ2AgAgA0HU0ICAAGogA0HI0ICAAGoiBDYCACAEIAU2AgAgA0HQ0ICAAGogBDYCACADQSBqIgNBgAJHDQALQYDUhIAAQXhBgNSEgABrQQ9xQQBBgNSEgABBCGpBD3EbIgNqIgRBBGogAkFIaiIFIANrIgNBAXI2AgBBAEEAKALw04CAADYCpNCAgABBACADNgKU0ICAAEEAIAQ2AqDQgIAAQYDUhIAAIAVqQTg2AgQLAkACQAJAAkACQAJAAkACQAJAAkACQAJAIABB7AFLDQACQEEAKAKI0ICAACIGQRAgAEETakFwcSAAQQtJGyICQQN2IgR2IgNBA3FFDQACQAJAIANBAXEgBHJBAXMiBUEDdCIEQbDQgIAAaiIDIARBuNCAgABqKAIAIgQoAggiAkcNAEEAIAZBfiAFd3E2AojQgIAADAELIAMgAjYCCCACIAM2AgwLIARBCGohAyAEIAVBA3QiBUEDcjYCBCAEIAVqIgQgBCgCBEEBcjYCBAwMCyACQQAoApDQgIAAIgdNDQECQCADRQ0AAkACQCADIAR0QQIgBHQiA0EAIANrcnEiA0EAIANrcUF/aiIDIANBDHZBEHEiA3YiBEEFdkEIcSIFIANyIAQgBXYiA0ECdkEEcSIEciADIAR2IgNBAXZBAnEiBHIgAyAEdiIDQQF2QQFxIgRyIAMgBHZqIgRBA3QiA0Gw0ICAAGoiBSADQbjQgIAAaigCACIDKAIIIgBHDQBBACAGQX4gBHdxIgY2AojQgIAADAELIAUgADYCCCAAIAU2AgwLIAMgAkEDcjYCBCADIARBA3QiBGogBCACayIFNgIAIAMgAmoiACAFQQFyNgIEAkAgB0UNACAHQXhxQbDQgIAAaiECQQAoApzQgIAAIQQCQAJAIAZBASAHQQN2dCIIcQ0AQQAgBiAIcjYCiNCAgAAgAiEIDAELIAIoAgghCAsgCCAENgIMIAIgBDYCCCAEIAI2AgwgBCAINgIICyADQQhqIQNBACAANgKc0ICAAEEAIAU2ApDQgIAADAwLQQAoAozQgIAAIglFDQEgCUEAIAlrcUF/aiIDIANBDHZBEHEiA3YiBEEFdkEIcSIFIANyIAQgBXYiA0ECdkEEcSIEciADIAR2IgNBAXZBAnEiBHIgAyAEdiIDQQF2QQFxIgRyIAMgBHZqQQJ0QbjSgIAAaigCACIAKAIEQXhxIAJrIQQgACEFAkADQAJAIAUoAhAiAw0AIAVBFGooAgAiA0UNAgsgAygCBEF4cSACayIFIAQgBSAESSIFGyEEIAMgACAFGyEAIAMhBQwACwsgACgCGCEKAkAgACgCDCIIIABGDQAgACgCCCIDQQAoApjQgIAASRogCCADNgIIIAMgCDYCDAwLCwJAIABBFGoiBSgCACIDDQAgACgCECIDRQ0DIABBEGohBQsDQCAFIQsgAyIIQRRqIgUoAgAiAw0AIAhBEGohBSAIKAIQIgMNAAsgC0EANgIADAoLQX8hAiAAQb9/Sw0AIABBE2oiA0FwcSECQQAoAozQgIAAIgdFDQBBACELAkAgAkGAAkkNAEEfIQsgAkH///8HSw0AIANBCHYiAyADQYD+P2pBEHZBCHEiA3QiBCAEQYDgH2pBEHZBBHEiBHQiBSAFQYCAD2pBEHZBAnEiBXRBD3YgAyAEciAFcmsiA0EBdCACIANBFWp2QQFxckEcaiELC0EAIAJrIQQCQAJAAkACQCALQQJ0QbjSgIAAaigCACIFDQBBACEDQQAhCAwBC0EAIQMgAkEAQRkgC0EBdmsgC0EfRht0IQBBACEIA0ACQCAFKAIEQXhxIAJrIgYgBE8NACAGIQQgBSEIIAYNAEEAIQQgBSEIIAUhAwwDCyADIAVBFGooAgAiBiAGIAUgAEEddkEEcWpBEGooAgAiBUYbIAMgBhshAyAAQQF0IQAgBQ0ACwsCQCADIAhyDQBBACEIQQIgC3QiA0EAIANrciAHcSIDRQ0DIANBACADa3FBf2oiAyADQQx2QRBxIgN2IgVBBXZBCHEiACADciAFIAB2IgNBAnZBBHEiBXIgAyAFdiIDQQF2QQJxIgVyIAMgBXYiA0EBdkEBcSIFciADIAV2akECdEG40oCAAGooAgAhAwsgA0UNAQsDQCADKAIEQXhxIAJrIgYgBEkhAAJAIAMoAhAiBQ0AIANBFGooAgAhBQsgBiAEIAAbIQQgAyAIIAAbIQggBSEDIAUNAAsLIAhFDQAgBEEAKAKQ0ICAACACa08NACAIKAIYIQsCQCAIKAIMIgAgCEYNACAIKAIIIgNBACgCmNCAgABJGiAAIAM2AgggAyAANgIMDAkLAkAgCEEUaiIFKAIAIgMNACAIKAIQIgNFDQMgCEEQaiEFCwNAIAUhBiADIgBBFGoiBSgCACIDDQAgAEEQaiEFIAAoAhAiAw0ACyAGQQA2AgAMCAsCQEEAKAKQ0ICAACIDIAJJDQBBACgCnNCAgAAhBAJAAkAgAyACayIFQRBJDQAgBCACaiIAIAVBAXI2AgRBACAFNgKQ0ICAAEEAIAA2ApzQgIAAIAQgA2ogBTYCACAEIAJBA3I2AgQMAQsgBCADQQNyNgIEIAQgA2oiAyADKAIEQQFyNgIEQQBBADYCnNCAgABBAEEANgKQ0ICAAAsgBEEIaiEDDAoLAkBBACgClNCAgAAiACACTQ0AQQAoAqDQgIAAIgMgAmoiBCAAIAJrIgVBAXI2AgRBACAFNgKU0ICAAEEAIAQ2AqDQgIAAIAMgAkEDcjYCBCADQQhqIQMMCgsCQAJAQQAoAuDTgIAARQ0AQQAoAujTgIAAIQQMAQtBAEJ/NwLs04CAAEEAQoCAhICAgMAANwLk04CAAEEAIAFBDGpBcHFB2KrVqgVzNgLg04CAAEEAQQA2AvTTgIAAQQBBADYCxNOAgABBgIAEIQQLQQAhAwJAIAQgAkHHAGoiB2oiBkEAIARrIgtxIgggAksNAEEAQTA2AvjTgIAADAoLAkBBACgCwNOAgAAiA0UNAAJAQQAoArjTgIAAIgQgCGoiBSAETQ0AIAUgA00NAQtBACEDQQBBMDYC+NOAgAAMCgtBAC0AxNOAgABBBHENBAJAAkACQEEAKAKg0ICAACIERQ0AQcjTgIAAIQMDQAJAIAMoAgAiBSAESw0AIAUgAygCBGogBEsNAwsgAygCCCIDDQALC0EAEMuAgIAAIgBBf0YNBSAIIQYCQEEAKALk04CAACIDQX9qIgQgAHFFDQAgCCAAayAEIABqQQAgA2txaiEGCyAGIAJNDQUgBkH+////B0sNBQJAQQAoAsDTgIAAIgNFDQBBACgCuNOAgAAiBCAGaiIFIARNDQYgBSADSw0GCyAGEMuAgIAAIgMgAEcNAQwHCyAGIABrIAtxIgZB/v///wdLDQQgBhDLgICAACIAIAMoAgAgAygCBGpGDQMgACEDCwJAIANBf0YNACACQcgAaiAGTQ0AAkAgByAGa0EAKALo04CAACIEakEAIARrcSIEQf7///8HTQ0AIAMhAAwHCwJAIAQQy4CAgABBf0YNACAEIAZqIQYgAyEADAcLQQAgBmsQy4CAgAAaDAQLIAMhACADQX9HDQUMAwtBACEIDAcLQQAhAAwFCyAAQX9HDQILQQBBACgCxNOAgABBBHI2AsTTgIAACyAIQf7///8HSw0BIAgQy4CAgAAhAEEAEMuAgIAAIQMgAEF/Rg0BIANBf0YNASAAIANPDQEgAyAAayIGIAJBOGpNDQELQQBBACgCuNOAgAAgBmoiAzYCuNOAgAACQCADQQAoArzTgIAATQ0AQQAgAzYCvNOAgAALAkACQAJAAkBBACgCoNCAgAAiBEUNAEHI04CAACEDA0AgACADKAIAIgUgAygCBCIIakYNAiADKAIIIgMNAAwDCwsCQAJAQQAoApjQgIAAIgNFDQAgACADTw0BC0EAIAA2ApjQgIAAC0EAIQNBACAGNgLM04CAAEEAIAA2AsjTgIAAQQBBfzYCqNCAgABBAEEAKALg04CAADYCrNCAgABBAEEANgLU04CAAANAIANBxNCAgABqIANBuNCAgABqIgQ2AgAgBCADQbDQgIAAaiIFNgIAIANBvNCAgABqIAU2AgAgA0HM0ICAAGogA0HA0ICAAGoiBTYCACAFIAQ2AgAgA0HU0ICAAGogA0HI0ICAAGoiBDYCACAEIAU2AgAgA0HQ0ICAAGogBDYCACADQSBqIgNBgAJHDQALIABBeCAAa0EPcUEAIABBCGpBD3EbIgNqIgQgBkFIaiIFIANrIgNBAXI2AgRBAEEAKALw04CAADYCpNCAgABBACADNgKU0ICAAEEAIAQ2AqDQgIAAIAAgBWpBODYCBAwCCyADLQAMQQhxDQAgBCAFSQ0AIAQgAE8NACAEQXggBGtBD3FBACAEQQhqQQ9xGyIFaiIAQQAoApTQgIAAIAZqIgsgBWsiBUEBcjYCBCADIAggBmo2AgRBAEEAKALw04CAADYCpNCAgABBACAFNgKU0ICAAEEAIAA2AqDQgIAAIAQgC2pBODYCBAwBCwJAIABBACgCmNCAgAAiCE8NAEEAIAA2ApjQgIAAIAAhCAsgACAGaiEFQcjTgIAAIQMCQAJAAkACQAJAAkACQANAIAMoAgAgBUYNASADKAIIIgMNAAwCCwsgAy0ADEEIcUUNAQtByNOAgAAhAwNAAkAgAygCACIFIARLDQAgBSADKAIEaiIFIARLDQMLIAMoAgghAwwACwsgAyAANgIAIAMgAygCBCAGajYCBCAAQXggAGtBD3FBACAAQQhqQQ9xG2oiCyACQQNyNgIEIAVBeCAFa0EPcUEAIAVBCGpBD3EbaiIGIAsgAmoiAmshAwJAIAYgBEcNAEEAIAI2AqDQgIAAQQBBACgClNCAgAAgA2oiAzYClNCAgAAgAiADQQFyNgIEDAMLAkAgBkEAKAKc0ICAAEcNAEEAIAI2ApzQgIAAQQBBACgCkNCAgAAgA2oiAzYCkNCAgAAgAiADQQFyNgIEIAIgA2ogAzYCAAwDCwJAIAYoAgQiBEEDcUEBRw0AIARBeHEhBwJAAkAgBEH/AUsNACAGKAIIIgUgBEEDdiIIQQN0QbDQgIAAaiIARhoCQCAGKAIMIgQgBUcNAEEAQQAoAojQgIAAQX4gCHdxNgKI0ICAAAwCCyAEIABGGiAEIAU2AgggBSAENgIMDAELIAYoAhghCQJAAkAgBigCDCIAIAZGDQAgBigCCCIEIAhJGiAAIAQ2AgggBCAANgIMDAELAkAgBkEUaiIEKAIAIgUNACAGQRBqIgQoAgAiBQ0AQQAhAAwBCwNAIAQhCCAFIgBBFGoiBCgCACIFDQAgAEEQaiEEIAAoAhAiBQ0ACyAIQQA2AgALIAlFDQACQAJAIAYgBigCHCIFQQJ0QbjSgIAAaiIEKAIARw0AIAQgADYCACAADQFBAEEAKAKM0ICAAEF+IAV3cTYCjNCAgAAMAgsgCUEQQRQgCSgCECAGRhtqIAA2AgAgAEUNAQsgACAJNgIYAkAgBigCECIERQ0AIAAgBDYCECAEIAA2AhgLIAYoAhQiBEUNACAAQRRqIAQ2AgAgBCAANgIYCyAHIANqIQMgBiAHaiIGKAIEIQQLIAYgBEF+cTYCBCACIANqIAM2AgAgAiADQQFyNgIEAkAgA0H/AUsNACADQXhxQbDQgIAAaiEEAkACQEEAKAKI0ICAACIFQQEgA0EDdnQiA3ENAEEAIAUgA3I2AojQgIAAIAQhAwwBCyAEKAIIIQMLIAMgAjYCDCAEIAI2AgggAiAENgIMIAIgAzYCCAwDC0EfIQQCQCADQf///wdLDQAgA0EIdiIEIARBgP4/akEQdkEIcSIEdCIFIAVBgOAfakEQdkEEcSIFdCIAIABBgIAPakEQdkECcSIAdEEPdiAEIAVyIAByayIEQQF0IAMgBEEVanZBAXFyQRxqIQQLIAIgBDYCHCACQgA3AhAgBEECdEG40oCAAGohBQJAQQAoAozQgIAAIgBBASAEdCIIcQ0AIAUgAjYCAEEAIAAgCHI2AozQgIAAIAIgBTYCGCACIAI2AgggAiACNgIMDAMLIANBAEEZIARBAXZrIARBH0YbdCEEIAUoAgAhAANAIAAiBSgCBEF4cSADRg0CIARBHXYhACAEQQF0IQQgBSAAQQRxakEQaiIIKAIAIgANAAsgCCACNgIAIAIgBTYCGCACIAI2AgwgAiACNgIIDAILIABBeCAAa0EPcUEAIABBCGpBD3EbIgNqIgsgBkFIaiIIIANrIgNBAXI2AgQgACAIakE4NgIEIAQgBUE3IAVrQQ9xQQAgBUFJakEPcRtqQUFqIgggCCAEQRBqSRsiCEEjNgIEQQBBACgC8NOAgAA2AqTQgIAAQQAgAzYClNCAgABBACALNgKg0ICAACAIQRBqQQApAtDTgIAANwIAIAhBACkCyNOAgAA3AghBACAIQQhqNgLQ04CAAEEAIAY2AszTgIAAQQAgADYCyNOAgABBAEEANgLU04CAACAIQSRqIQMDQCADQQc2AgAgA0EEaiIDIAVJDQALIAggBEYNAyAIIAgoAgRBfnE2AgQgCCAIIARrIgA2AgAgBCAAQQFyNgIEAkAgAEH/AUsNACAAQXhxQbDQgIAAaiEDAkACQEEAKAKI0ICAACIFQQEgAEEDdnQiAHENAEEAIAUgAHI2AojQgIAAIAMhBQwBCyADKAIIIQULIAUgBDYCDCADIAQ2AgggBCADNgIMIAQgBTYCCAwEC0EfIQMCQCAAQf///wdLDQAgAEEIdiIDIANBgP4/akEQdkEIcSIDdCIFIAVBgOAfakEQdkEEcSIFdCIIIAhBgIAPakEQdkECcSIIdEEPdiADIAVyIAhyayIDQQF0IAAgA0EVanZBAXFyQRxqIQMLIAQgAzYCHCAEQgA3AhAgA0ECdEG40oCAAGohBQJAQQAoAozQgIAAIghBASADdCIGcQ0AIAUgBDYCAEEAIAggBnI2AozQgIAAIAQgBTYCGCAEIAQ2AgggBCAENgIMDAQLIABBAEEZIANBAXZrIANBH0YbdCEDIAUoAgAhCANAIAgiBSgCBEF4cSAARg0DIANBHXYhCCADQQF0IQMgBSAIQQRxakEQaiIGKAIAIggNAAsgBiAENgIAIAQgBTYCGCAEIAQ2AgwgBCAENgIIDAMLIAUoAggiAyACNgIMIAUgAjYCCCACQQA2AhggAiAFNgIMIAIgAzYCCAsgC0EIaiEDDAULIAUoAggiAyAENgIMIAUgBDYCCCAEQQA2AhggBCAFNgIMIAQgAzYCCAtBACgClNCAgAAiAyACTQ0AQQAoAqDQgIAAIgQgAmoiBSADIAJrIgNBAXI2AgRBACADNgKU0ICAAEEAIAU2AqDQgIAAIAQgAkEDcjYCBCAEQQhqIQMMAwtBACEDQQBBMDYC+NOAgAAMAgsCQCALRQ0AAkACQCAIIAgoAhwiBUECdEG40oCAAGoiAygCAEcNACADIAA2AgAgAA0BQQAgB0F+IAV3cSIHNgKM0ICAAAwCCyALQRBBFCALKAIQIAhGG2ogADYCACAARQ0BCyAAIAs2AhgCQCAIKAIQIgNFDQAgACADNgIQIAMgADYCGAsgCEEUaigCACIDRQ0AIABBFGogAzYCACADIAA2AhgLAkACQCAEQQ9LDQAgCCAEIAJqIgNBA3I2AgQgCCADaiIDIAMoAgRBAXI2AgQMAQsgCCACaiIAIARBAXI2AgQgCCACQQNyNgIEIAAgBGogBDYCAAJAIARB/wFLDQAgBEF4cUGw0ICAAGohAwJAAkBBACgCiNCAgAAiBUEBIARBA3Z0IgRxDQBBACAFIARyNgKI0ICAACADIQQMAQsgAygCCCEECyAEIAA2AgwgAyAANgIIIAAgAzYCDCAAIAQ2AggMAQtBHyEDAkAgBEH///8HSw0AIARBCHYiAyADQYD+P2pBEHZBCHEiA3QiBSAFQYDgH2pBEHZBBHEiBXQiAiACQYCAD2pBEHZBAnEiAnRBD3YgAyAFciACcmsiA0EBdCAEIANBFWp2QQFxckEcaiEDCyAAIAM2AhwgAEIANwIQIANBAnRBuNKAgABqIQUCQCAHQQEgA3QiAnENACAFIAA2AgBBACAHIAJyNgKM0ICAACAAIAU2AhggACAANgIIIAAgADYCDAwBCyAEQQBBGSADQQF2ayADQR9GG3QhAyAFKAIAIQICQANAIAIiBSgCBEF4cSAERg0BIANBHXYhAiADQQF0IQMgBSACQQRxakEQaiIGKAIAIgINAAsgBiAANgIAIAAgBTYCGCAAIAA2AgwgACAANgIIDAELIAUoAggiAyAANgIMIAUgADYCCCAAQQA2AhggACAFNgIMIAAgAzYCCAsgCEEIaiEDDAELAkAgCkUNAAJAAkAgACAAKAIcIgVBAnRBuNKAgABqIgMoAgBHDQAgAyAINgIAIAgNAUEAIAlBfiAFd3E2AozQgIAADAILIApBEEEUIAooAhAgAEYbaiAINgIAIAhFDQELIAggCjYCGAJAIAAoAhAiA0UNACAIIAM2AhAgAyAINgIYCyAAQRRqKAIAIgNFDQAgCEEUaiADNgIAIAMgCDYCGAsCQAJAIARBD0sNACAAIAQgAmoiA0EDcjYCBCAAIANqIgMgAygCBEEBcjYCBAwBCyAAIAJqIgUgBEEBcjYCBCAAIAJBA3I2AgQgBSAEaiAENgIAAkAgB0UNACAHQXhxQbDQgIAAaiECQQAoApzQgIAAIQMCQAJAQQEgB0EDdnQiCCAGcQ0AQQAgCCAGcjYCiNCAgAAgAiEIDAELIAIoAgghCAsgCCADNgIMIAIgAzYCCCADIAI2AgwgAyAINgIIC0EAIAU2ApzQgIAAQQAgBDYCkNCAgAALIABBCGohAwsgAUEQaiSAgICAACADCwoAIAAQyYCAgAAL4g0BB38CQCAARQ0AIABBeGoiASAAQXxqKAIAIgJBeHEiAGohAwJAIAJBAXENACACQQNxRQ0BIAEgASgCACICayIBQQAoApjQgIAAIgRJDQEgAiAAaiEAAkAgAUEAKAKc0ICAAEYNAAJAIAJB/wFLDQAgASgCCCIEIAJBA3YiBUEDdEGw0ICAAGoiBkYaAkAgASgCDCICIARHDQBBAEEAKAKI0ICAAEF+IAV3cTYCiNCAgAAMAwsgAiAGRhogAiAENgIIIAQgAjYCDAwCCyABKAIYIQcCQAJAIAEoAgwiBiABRg0AIAEoAggiAiAESRogBiACNgIIIAIgBjYCDAwBCwJAIAFBFGoiAigCACIEDQAgAUEQaiICKAIAIgQNAEEAIQYMAQsDQCACIQUgBCIGQRRqIgIoAgAiBA0AIAZBEGohAiAGKAIQIgQNAAsgBUEANgIACyAHRQ0BAkACQCABIAEoAhwiBEECdEG40oCAAGoiAigCAEcNACACIAY2AgAgBg0BQQBBACgCjNCAgABBfiAEd3E2AozQgIAADAMLIAdBEEEUIAcoAhAgAUYbaiAGNgIAIAZFDQILIAYgBzYCGAJAIAEoAhAiAkUNACAGIAI2AhAgAiAGNgIYCyABKAIUIgJFDQEgBkEUaiACNgIAIAIgBjYCGAwBCyADKAIEIgJBA3FBA0cNACADIAJBfnE2AgRBACAANgKQ0ICAACABIABqIAA2AgAgASAAQQFyNgIEDwsgASADTw0AIAMoAgQiAkEBcUUNAAJAAkAgAkECcQ0AAkAgA0EAKAKg0ICAAEcNAEEAIAE2AqDQgIAAQQBBACgClNCAgAAgAGoiADYClNCAgAAgASAAQQFyNgIEIAFBACgCnNCAgABHDQNBAEEANgKQ0ICAAEEAQQA2ApzQgIAADwsCQCADQQAoApzQgIAARw0AQQAgATYCnNCAgABBAEEAKAKQ0ICAACAAaiIANgKQ0ICAACABIABBAXI2AgQgASAAaiAANgIADwsgAkF4cSAAaiEAAkACQCACQf8BSw0AIAMoAggiBCACQQN2IgVBA3RBsNCAgABqIgZGGgJAIAMoAgwiAiAERw0AQQBBACgCiNCAgABBfiAFd3E2AojQgIAADAILIAIgBkYaIAIgBDYCCCAEIAI2AgwMAQsgAygCGCEHAkACQCADKAIMIgYgA0YNACADKAIIIgJBACgCmNCAgABJGiAGIAI2AgggAiAGNgIMDAELAkAgA0EUaiICKAIAIgQNACADQRBqIgIoAgAiBA0AQQAhBgwBCwNAIAIhBSAEIgZBFGoiAigCACIEDQAgBkEQaiECIAYoAhAiBA0ACyAFQQA2AgALIAdFDQACQAJAIAMgAygCHCIEQQJ0QbjSgIAAaiICKAIARw0AIAIgBjYCACAGDQFBAEEAKAKM0ICAAEF+IAR3cTYCjNCAgAAMAgsgB0EQQRQgBygCECADRhtqIAY2AgAgBkUNAQsgBiAHNgIYAkAgAygCECICRQ0AIAYgAjYCECACIAY2AhgLIAMoAhQiAkUNACAGQRRqIAI2AgAgAiAGNgIYCyABIABqIAA2AgAgASAAQQFyNgIEIAFBACgCnNCAgABHDQFBACAANgKQ0ICAAA8LIAMgAkF+cTYCBCABIABqIAA2AgAgASAAQQFyNgIECwJAIABB/wFLDQAgAEF4cUGw0ICAAGohAgJAAkBBACgCiNCAgAAiBEEBIABBA3Z0IgBxDQBBACAEIAByNgKI0ICAACACIQAMAQsgAigCCCEACyAAIAE2AgwgAiABNgIIIAEgAjYCDCABIAA2AggPC0EfIQICQCAAQf///wdLDQAgAEEIdiICIAJBgP4/akEQdkEIcSICdCIEIARBgOAfakEQdkEEcSIEdCIGIAZBgIAPakEQdkECcSIGdEEPdiACIARyIAZyayICQQF0IAAgAkEVanZBAXFyQRxqIQILIAEgAjYCHCABQgA3AhAgAkECdEG40oCAAGohBAJAAkBBACgCjNCAgAAiBkEBIAJ0IgNxDQAgBCABNgIAQQAgBiADcjYCjNCAgAAgASAENgIYIAEgATYCCCABIAE2AgwMAQsgAEEAQRkgAkEBdmsgAkEfRht0IQIgBCgCACEGAkADQCAGIgQoAgRBeHEgAEYNASACQR12IQYgAkEBdCECIAQgBkEEcWpBEGoiAygCACIGDQALIAMgATYCACABIAQ2AhggASABNgIMIAEgATYCCAwBCyAEKAIIIgAgATYCDCAEIAE2AgggAUEANgIYIAEgBDYCDCABIAA2AggLQQBBACgCqNCAgABBf2oiAUF/IAEbNgKo0ICAAAsLBAAAAAtOAAJAIAANAD8AQRB0DwsCQCAAQf//A3ENACAAQX9MDQACQCAAQRB2QAAiAEF/Rw0AQQBBMDYC+NOAgABBfw8LIABBEHQPCxDKgICAAAAL8gICA38BfgJAIAJFDQAgACABOgAAIAIgAGoiA0F/aiABOgAAIAJBA0kNACAAIAE6AAIgACABOgABIANBfWogAToAACADQX5qIAE6AAAgAkEHSQ0AIAAgAToAAyADQXxqIAE6AAAgAkEJSQ0AIABBACAAa0EDcSIEaiIDIAFB/wFxQYGChAhsIgE2AgAgAyACIARrQXxxIgRqIgJBfGogATYCACAEQQlJDQAgAyABNgIIIAMgATYCBCACQXhqIAE2AgAgAkF0aiABNgIAIARBGUkNACADIAE2AhggAyABNgIUIAMgATYCECADIAE2AgwgAkFwaiABNgIAIAJBbGogATYCACACQWhqIAE2AgAgAkFkaiABNgIAIAQgA0EEcUEYciIFayICQSBJDQAgAa1CgYCAgBB+IQYgAyAFaiEBA0AgASAGNwMYIAEgBjcDECABIAY3AwggASAGNwMAIAFBIGohASACQWBqIgJBH0sNAAsLIAALC45IAQBBgAgLhkgBAAAAAgAAAAMAAAAAAAAAAAAAAAQAAAAFAAAAAAAAAAAAAAAGAAAABwAAAAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEludmFsaWQgY2hhciBpbiB1cmwgcXVlcnkAU3BhbiBjYWxsYmFjayBlcnJvciBpbiBvbl9ib2R5AENvbnRlbnQtTGVuZ3RoIG92ZXJmbG93AENodW5rIHNpemUgb3ZlcmZsb3cAUmVzcG9uc2Ugb3ZlcmZsb3cASW52YWxpZCBtZXRob2QgZm9yIEhUVFAveC54IHJlcXVlc3QASW52YWxpZCBtZXRob2QgZm9yIFJUU1AveC54IHJlcXVlc3QARXhwZWN0ZWQgU09VUkNFIG1ldGhvZCBmb3IgSUNFL3gueCByZXF1ZXN0AEludmFsaWQgY2hhciBpbiB1cmwgZnJhZ21lbnQgc3RhcnQARXhwZWN0ZWQgZG90AFNwYW4gY2FsbGJhY2sgZXJyb3IgaW4gb25fc3RhdHVzAEludmFsaWQgcmVzcG9uc2Ugc3RhdHVzAEludmFsaWQgY2hhcmFjdGVyIGluIGNodW5rIGV4dGVuc2lvbnMAVXNlciBjYWxsYmFjayBlcnJvcgBgb25fcmVzZXRgIGNhbGxiYWNrIGVycm9yAGBvbl9jaHVua19oZWFkZXJgIGNhbGxiYWNrIGVycm9yAGBvbl9tZXNzYWdlX2JlZ2luYCBjYWxsYmFjayBlcnJvcgBgb25fY2h1bmtfZXh0ZW5zaW9uX3ZhbHVlYCBjYWxsYmFjayBlcnJvcgBgb25fc3RhdHVzX2NvbXBsZXRlYCBjYWxsYmFjayBlcnJvcgBgb25fdmVyc2lvbl9jb21wbGV0ZWAgY2FsbGJhY2sgZXJyb3IAYG9uX3VybF9jb21wbGV0ZWAgY2FsbGJhY2sgZXJyb3IAYG9uX2NodW5rX2NvbXBsZXRlYCBjYWxsYmFjayBlcnJvcgBgb25faGVhZGVyX3ZhbHVlX2NvbXBsZXRlYCBjYWxsYmFjayBlcnJvcgBgb25fbWVzc2FnZV9jb21wbGV0ZWAgY2FsbGJhY2sgZXJyb3IAYG9uX21ldGhvZF9jb21wbGV0ZWAgY2FsbGJhY2sgZXJyb3IAYG9uX2hlYWRlcl9maWVsZF9jb21wbGV0ZWAgY2FsbGJhY2sgZXJyb3IAYG9uX2NodW5rX2V4dGVuc2lvbl9uYW1lYCBjYWxsYmFjayBlcnJvcgBVbmV4cGVjdGVkIGNoYXIgaW4gdXJsIHNlcnZlcgBJbnZhbGlkIGhlYWRlciB2YWx1ZSBjaGFyAEludmFsaWQgaGVhZGVyIGZpZWxkIGNoYXIAU3BhbiBjYWxsYmFjayBlcnJvciBpbiBvbl92ZXJzaW9uAEludmFsaWQgbWlub3IgdmVyc2lvbgBJbnZhbGlkIG1ham9yIHZlcnNpb24ARXhwZWN0ZWQgc3BhY2UgYWZ0ZXIgdmVyc2lvbgBFeHBlY3RlZCBDUkxGIGFmdGVyIHZlcnNpb24ASW52YWxpZCBIVFRQIHZlcnNpb24ASW52YWxpZCBoZWFkZXIgdG9rZW4AU3BhbiBjYWxsYmFjayBlcnJvciBpbiBvbl91cmwASW52YWxpZCBjaGFyYWN0ZXJzIGluIHVybABVbmV4cGVjdGVkIHN0YXJ0IGNoYXIgaW4gdXJsAERvdWJsZSBAIGluIHVybABFbXB0eSBDb250ZW50LUxlbmd0aABJbnZhbGlkIGNoYXJhY3RlciBpbiBDb250ZW50LUxlbmd0aABEdXBsaWNhdGUgQ29udGVudC1MZW5ndGgASW52YWxpZCBjaGFyIGluIHVybCBwYXRoAENvbnRlbnQtTGVuZ3RoIGNhbid0IGJlIHByZXNlbnQgd2l0aCBUcmFuc2Zlci1FbmNvZGluZwBJbnZhbGlkIGNoYXJhY3RlciBpbiBjaHVuayBzaXplAFNwYW4gY2FsbGJhY2sgZXJyb3IgaW4gb25faGVhZGVyX3ZhbHVlAFNwYW4gY2FsbGJhY2sgZXJyb3IgaW4gb25fY2h1bmtfZXh0ZW5zaW9uX3ZhbHVlAEludmFsaWQgY2hhcmFjdGVyIGluIGNodW5rIGV4dGVuc2lvbnMgdmFsdWUATWlzc2luZyBleHBlY3RlZCBMRiBhZnRlciBoZWFkZXIgdmFsdWUASW52YWxpZCBgVHJhbnNmZXItRW5jb2RpbmdgIGhlYWRlciB2YWx1ZQBJbnZhbGlkIGNoYXJhY3RlciBpbiBjaHVuayBleHRlbnNpb25zIHF1b3RlIHZhbHVlAEludmFsaWQgY2hhcmFjdGVyIGluIGNodW5rIGV4dGVuc2lvbnMgcXVvdGVkIHZhbHVlAFBhdXNlZCBieSBvbl9oZWFkZXJzX2NvbXBsZXRlAEludmFsaWQgRU9GIHN0YXRlAG9uX3Jlc2V0IHBhdXNlAG9uX2NodW5rX2hlYWRlciBwYXVzZQBvbl9tZXNzYWdlX2JlZ2luIHBhdXNlAG9uX2NodW5rX2V4dGVuc2lvbl92YWx1ZSBwYXVzZQBvbl9zdGF0dXNfY29tcGxldGUgcGF1c2UAb25fdmVyc2lvbl9jb21wbGV0ZSBwYXVzZQBvbl91cmxfY29tcGxldGUgcGF1c2UAb25fY2h1bmtfY29tcGxldGUgcGF1c2UAb25faGVhZGVyX3ZhbHVlX2NvbXBsZXRlIHBhdXNlAG9uX21lc3NhZ2VfY29tcGxldGUgcGF1c2UAb25fbWV0aG9kX2NvbXBsZXRlIHBhdXNlAG9uX2hlYWRlcl9maWVsZF9jb21wbGV0ZSBwYXVzZQBvbl9jaHVua19leHRlbnNpb25fbmFtZSBwYXVzZQBVbmV4cGVjdGVkIHNwYWNlIGFmdGVyIHN0YXJ0IGxpbmUAU3BhbiBjYWxsYmFjayBlcnJvciBpbiBvbl9jaHVua19leHRlbnNpb25fbmFtZQBJbnZhbGlkIGNoYXJhY3RlciBpbiBjaHVuayBleHRlbnNpb25zIG5hbWUAUGF1c2Ugb24gQ09OTkVDVC9VcGdyYWRlAFBhdXNlIG9uIFBSSS9VcGdyYWRlAEV4cGVjdGVkIEhUVFAvMiBDb25uZWN0aW9uIFByZWZhY2UAU3BhbiBjYWxsYmFjayBlcnJvciBpbiBvbl9tZXRob2QARXhwZWN0ZWQgc3BhY2UgYWZ0ZXIgbWV0aG9kAFNwYW4gY2FsbGJhY2sgZXJyb3IgaW4gb25faGVhZGVyX2ZpZWxkAFBhdXNlZABJbnZhbGlkIHdvcmQgZW5jb3VudGVyZWQASW52YWxpZCBtZXRob2QgZW5jb3VudGVyZWQAVW5leHBlY3RlZCBjaGFyIGluIHVybCBzY2hlbWEAUmVxdWVzdCBoYXMgaW52YWxpZCBgVHJhbnNmZXItRW5jb2RpbmdgAFNXSVRDSF9QUk9YWQBVU0VfUFJPWFkATUtBQ1RJVklUWQBVTlBST0NFU1NBQkxFX0VOVElUWQBDT1BZAE1PVkVEX1BFUk1BTkVOVExZAFRPT19FQVJMWQBOT1RJRlkARkFJTEVEX0RFUEVOREVOQ1kAQkFEX0dBVEVXQVkAUExBWQBQVVQAQ0hFQ0tPVVQAR0FURVdBWV9USU1FT1VUAFJFUVVFU1RfVElNRU9VVABORVRXT1JLX0NPTk5FQ1RfVElNRU9VVABDT05ORUNUSU9OX1RJTUVPVVQATE9HSU5fVElNRU9VVABORVRXT1JLX1JFQURfVElNRU9VVABQT1NUAE1JU0RJUkVDVEVEX1JFUVVFU1QAQ0xJRU5UX0NMT1NFRF9SRVFVRVNUAENMSUVOVF9DTE9TRURfTE9BRF9CQUxBTkNFRF9SRVFVRVNUAEJBRF9SRVFVRVNUAEhUVFBfUkVRVUVTVF9TRU5UX1RPX0hUVFBTX1BPUlQAUkVQT1JUAElNX0FfVEVBUE9UAFJFU0VUX0NPTlRFTlQATk9fQ09OVEVOVABQQVJUSUFMX0NPTlRFTlQASFBFX0lOVkFMSURfQ09OU1RBTlQASFBFX0NCX1JFU0VUAEdFVABIUEVfU1RSSUNUAENPTkZMSUNUAFRFTVBPUkFSWV9SRURJUkVDVABQRVJNQU5FTlRfUkVESVJFQ1QAQ09OTkVDVABNVUxUSV9TVEFUVVMASFBFX0lOVkFMSURfU1RBVFVTAFRPT19NQU5ZX1JFUVVFU1RTAEVBUkxZX0hJTlRTAFVOQVZBSUxBQkxFX0ZPUl9MRUdBTF9SRUFTT05TAE9QVElPTlMAU1dJVENISU5HX1BST1RPQ09MUwBWQVJJQU5UX0FMU09fTkVHT1RJQVRFUwBNVUxUSVBMRV9DSE9JQ0VTAElOVEVSTkFMX1NFUlZFUl9FUlJPUgBXRUJfU0VSVkVSX1VOS05PV05fRVJST1IAUkFJTEdVTl9FUlJPUgBJREVOVElUWV9QUk9WSURFUl9BVVRIRU5USUNBVElPTl9FUlJPUgBTU0xfQ0VSVElGSUNBVEVfRVJST1IASU5WQUxJRF9YX0ZPUldBUkRFRF9GT1IAU0VUX1BBUkFNRVRFUgBHRVRfUEFSQU1FVEVSAEhQRV9VU0VSAFNFRV9PVEhFUgBIUEVfQ0JfQ0hVTktfSEVBREVSAE1LQ0FMRU5EQVIAU0VUVVAAV0VCX1NFUlZFUl9JU19ET1dOAFRFQVJET1dOAEhQRV9DTE9TRURfQ09OTkVDVElPTgBIRVVSSVNUSUNfRVhQSVJBVElPTgBESVNDT05ORUNURURfT1BFUkFUSU9OAE5PTl9BVVRIT1JJVEFUSVZFX0lORk9STUFUSU9OAEhQRV9JTlZBTElEX1ZFUlNJT04ASFBFX0NCX01FU1NBR0VfQkVHSU4AU0lURV9JU19GUk9aRU4ASFBFX0lOVkFMSURfSEVBREVSX1RPS0VOAElOVkFMSURfVE9LRU4ARk9SQklEREVOAEVOSEFOQ0VfWU9VUl9DQUxNAEhQRV9JTlZBTElEX1VSTABCTE9DS0VEX0JZX1BBUkVOVEFMX0NPTlRST0wATUtDT0wAQUNMAEhQRV9JTlRFUk5BTABSRVFVRVNUX0hFQURFUl9GSUVMRFNfVE9PX0xBUkdFX1VOT0ZGSUNJQUwASFBFX09LAFVOTElOSwBVTkxPQ0sAUFJJAFJFVFJZX1dJVEgASFBFX0lOVkFMSURfQ09OVEVOVF9MRU5HVEgASFBFX1VORVhQRUNURURfQ09OVEVOVF9MRU5HVEgARkxVU0gAUFJPUFBBVENIAE0tU0VBUkNIAFVSSV9UT09fTE9ORwBQUk9DRVNTSU5HAE1JU0NFTExBTkVPVVNfUEVSU0lTVEVOVF9XQVJOSU5HAE1JU0NFTExBTkVPVVNfV0FSTklORwBIUEVfSU5WQUxJRF9UUkFOU0ZFUl9FTkNPRElORwBFeHBlY3RlZCBDUkxGAEhQRV9JTlZBTElEX0NIVU5LX1NJWkUATU9WRQBDT05USU5VRQBIUEVfQ0JfU1RBVFVTX0NPTVBMRVRFAEhQRV9DQl9IRUFERVJTX0NPTVBMRVRFAEhQRV9DQl9WRVJTSU9OX0NPTVBMRVRFAEhQRV9DQl9VUkxfQ09NUExFVEUASFBFX0NCX0NIVU5LX0NPTVBMRVRFAEhQRV9DQl9IRUFERVJfVkFMVUVfQ09NUExFVEUASFBFX0NCX0NIVU5LX0VYVEVOU0lPTl9WQUxVRV9DT01QTEVURQBIUEVfQ0JfQ0hVTktfRVhURU5TSU9OX05BTUVfQ09NUExFVEUASFBFX0NCX01FU1NBR0VfQ09NUExFVEUASFBFX0NCX01FVEhPRF9DT01QTEVURQBIUEVfQ0JfSEVBREVSX0ZJRUxEX0NPTVBMRVRFAERFTEVURQBIUEVfSU5WQUxJRF9FT0ZfU1RBVEUASU5WQUxJRF9TU0xfQ0VSVElGSUNBVEUAUEFVU0UATk9fUkVTUE9OU0UAVU5TVVBQT1JURURfTUVESUFfVFlQRQBHT05FAE5PVF9BQ0NFUFRBQkxFAFNFUlZJQ0VfVU5BVkFJTEFCTEUAUkFOR0VfTk9UX1NBVElTRklBQkxFAE9SSUdJTl9JU19VTlJFQUNIQUJMRQBSRVNQT05TRV9JU19TVEFMRQBQVVJHRQBNRVJHRQBSRVFVRVNUX0hFQURFUl9GSUVMRFNfVE9PX0xBUkdFAFJFUVVFU1RfSEVBREVSX1RPT19MQVJHRQBQQVlMT0FEX1RPT19MQVJHRQBJTlNVRkZJQ0lFTlRfU1RPUkFHRQBIUEVfUEFVU0VEX1VQR1JBREUASFBFX1BBVVNFRF9IMl9VUEdSQURFAFNPVVJDRQBBTk5PVU5DRQBUUkFDRQBIUEVfVU5FWFBFQ1RFRF9TUEFDRQBERVNDUklCRQBVTlNVQlNDUklCRQBSRUNPUkQASFBFX0lOVkFMSURfTUVUSE9EAE5PVF9GT1VORABQUk9QRklORABVTkJJTkQAUkVCSU5EAFVOQVVUSE9SSVpFRABNRVRIT0RfTk9UX0FMTE9XRUQASFRUUF9WRVJTSU9OX05PVF9TVVBQT1JURUQAQUxSRUFEWV9SRVBPUlRFRABBQ0NFUFRFRABOT1RfSU1QTEVNRU5URUQATE9PUF9ERVRFQ1RFRABIUEVfQ1JfRVhQRUNURUQASFBFX0xGX0VYUEVDVEVEAENSRUFURUQASU1fVVNFRABIUEVfUEFVU0VEAFRJTUVPVVRfT0NDVVJFRABQQVlNRU5UX1JFUVVJUkVEAFBSRUNPTkRJVElPTl9SRVFVSVJFRABQUk9YWV9BVVRIRU5USUNBVElPTl9SRVFVSVJFRABORVRXT1JLX0FVVEhFTlRJQ0FUSU9OX1JFUVVJUkVEAExFTkdUSF9SRVFVSVJFRABTU0xfQ0VSVElGSUNBVEVfUkVRVUlSRUQAVVBHUkFERV9SRVFVSVJFRABQQUdFX0VYUElSRUQAUFJFQ09ORElUSU9OX0ZBSUxFRABFWFBFQ1RBVElPTl9GQUlMRUQAUkVWQUxJREFUSU9OX0ZBSUxFRABTU0xfSEFORFNIQUtFX0ZBSUxFRABMT0NLRUQAVFJBTlNGT1JNQVRJT05fQVBQTElFRABOT1RfTU9ESUZJRUQATk9UX0VYVEVOREVEAEJBTkRXSURUSF9MSU1JVF9FWENFRURFRABTSVRFX0lTX09WRVJMT0FERUQASEVBRABFeHBlY3RlZCBIVFRQLwAAXhMAACYTAAAwEAAA8BcAAJ0TAAAVEgAAORcAAPASAAAKEAAAdRIAAK0SAACCEwAATxQAAH8QAACgFQAAIxQAAIkSAACLFAAATRUAANQRAADPFAAAEBgAAMkWAADcFgAAwREAAOAXAAC7FAAAdBQAAHwVAADlFAAACBcAAB8QAABlFQAAoxQAACgVAAACFQAAmRUAACwQAACLGQAATw8AANQOAABqEAAAzhAAAAIXAACJDgAAbhMAABwTAABmFAAAVhcAAMETAADNEwAAbBMAAGgXAABmFwAAXxcAACITAADODwAAaQ4AANgOAABjFgAAyxMAAKoOAAAoFwAAJhcAAMUTAABdFgAA6BEAAGcTAABlEwAA8hYAAHMTAAAdFwAA+RYAAPMRAADPDgAAzhUAAAwSAACzEQAApREAAGEQAAAyFwAAuxMAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAQIBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEAAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAIDAgICAgIAAAICAAICAAICAgICAgICAgIABAAAAAAAAgICAgICAgICAgICAgICAgICAgICAgICAgIAAAACAgICAgICAgICAgICAgICAgICAgICAgICAgICAgACAAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAACAAICAgICAAACAgACAgACAgICAgICAgICAAMABAAAAAICAgICAgICAgICAgICAgICAgICAgICAgICAAAAAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAAgACAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAbG9zZWVlcC1hbGl2ZQAAAAAAAAAAAAAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEAAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEBAQEBAQEBAQEBAQIBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAAEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBY2h1bmtlZAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQEAAQEBAQEAAAEBAAEBAAEBAQEBAQEBAQEAAAAAAAAAAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEAAAABAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABlY3Rpb25lbnQtbGVuZ3Rob25yb3h5LWNvbm5lY3Rpb24AAAAAAAAAAAAAAAAAAAByYW5zZmVyLWVuY29kaW5ncGdyYWRlDQoNCg0KU00NCg0KVFRQL0NFL1RTUC8AAAAAAAAAAAAAAAABAgABAwAAAAAAAAAAAAAAAAAAAAAAAAQBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAAEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAAAAAAAAAAAAAQIAAQMAAAAAAAAAAAAAAAAAAAAAAAAEAQEFAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQABAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQAAAAAAAAAAAAEAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAEBAAEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQABAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEAAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEAAAAAAAAAAAAAAQAAAgAAAAAAAAAAAAAAAAAAAAAAAAMEAAAEBAQEBAQEBAQEBAUEBAQEBAQEBAQEBAQABAAGBwQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAAEAAQABAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAEAAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIAAAAAAAADAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwAAAAAAAAMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAABAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAIAAAAAAgAAAAAAAAAAAAAAAAAAAAAAAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMAAAAAAAADAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABOT1VOQ0VFQ0tPVVRORUNURVRFQ1JJQkVMVVNIRVRFQURTRUFSQ0hSR0VDVElWSVRZTEVOREFSVkVPVElGWVBUSU9OU0NIU0VBWVNUQVRDSEdFT1JESVJFQ1RPUlRSQ0hQQVJBTUVURVJVUkNFQlNDUklCRUFSRE9XTkFDRUlORE5LQ0tVQlNDUklCRUhUVFAvQURUUC8="},9096:A=>{A.exports="AGFzbQEAAAABMAhgAX8Bf2ADf39/AX9gBH9/f38Bf2AAAGADf39/AGABfwBgAn9/AGAGf39/f39/AALLAQgDZW52GHdhc21fb25faGVhZGVyc19jb21wbGV0ZQACA2VudhV3YXNtX29uX21lc3NhZ2VfYmVnaW4AAANlbnYLd2FzbV9vbl91cmwAAQNlbnYOd2FzbV9vbl9zdGF0dXMAAQNlbnYUd2FzbV9vbl9oZWFkZXJfZmllbGQAAQNlbnYUd2FzbV9vbl9oZWFkZXJfdmFsdWUAAQNlbnYMd2FzbV9vbl9ib2R5AAEDZW52GHdhc21fb25fbWVzc2FnZV9jb21wbGV0ZQAAA0ZFAwMEAAAFAAAAAAAABQEFAAUFBQAABgAAAAAGBgYGAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQABAAABAQcAAAUFAwABBAUBcAESEgUDAQACBggBfwFBgNQECwfRBSIGbWVtb3J5AgALX2luaXRpYWxpemUACRlfX2luZGlyZWN0X2Z1bmN0aW9uX3RhYmxlAQALbGxodHRwX2luaXQAChhsbGh0dHBfc2hvdWxkX2tlZXBfYWxpdmUAQQxsbGh0dHBfYWxsb2MADAZtYWxsb2MARgtsbGh0dHBfZnJlZQANBGZyZWUASA9sbGh0dHBfZ2V0X3R5cGUADhVsbGh0dHBfZ2V0X2h0dHBfbWFqb3IADxVsbGh0dHBfZ2V0X2h0dHBfbWlub3IAEBFsbGh0dHBfZ2V0X21ldGhvZAARFmxsaHR0cF9nZXRfc3RhdHVzX2NvZGUAEhJsbGh0dHBfZ2V0X3VwZ3JhZGUAEwxsbGh0dHBfcmVzZXQAFA5sbGh0dHBfZXhlY3V0ZQAVFGxsaHR0cF9zZXR0aW5nc19pbml0ABYNbGxodHRwX2ZpbmlzaAAXDGxsaHR0cF9wYXVzZQAYDWxsaHR0cF9yZXN1bWUAGRtsbGh0dHBfcmVzdW1lX2FmdGVyX3VwZ3JhZGUAGhBsbGh0dHBfZ2V0X2Vycm5vABsXbGxodHRwX2dldF9lcnJvcl9yZWFzb24AHBdsbGh0dHBfc2V0X2Vycm9yX3JlYXNvbgAdFGxsaHR0cF9nZXRfZXJyb3JfcG9zAB4RbGxodHRwX2Vycm5vX25hbWUAHxJsbGh0dHBfbWV0aG9kX25hbWUAIBJsbGh0dHBfc3RhdHVzX25hbWUAIRpsbGh0dHBfc2V0X2xlbmllbnRfaGVhZGVycwAiIWxsaHR0cF9zZXRfbGVuaWVudF9jaHVua2VkX2xlbmd0aAAjHWxsaHR0cF9zZXRfbGVuaWVudF9rZWVwX2FsaXZlACQkbGxodHRwX3NldF9sZW5pZW50X3RyYW5zZmVyX2VuY29kaW5nACUYbGxodHRwX21lc3NhZ2VfbmVlZHNfZW9mAD8JFwEAQQELEQECAwQFCwYHNTk3MS8tJyspCrLgAkUCAAsIABCIgICAAAsZACAAEMKAgIAAGiAAIAI2AjggACABOgAoCxwAIAAgAC8BMiAALQAuIAAQwYCAgAAQgICAgAALKgEBf0HAABDGgICAACIBEMKAgIAAGiABQYCIgIAANgI4IAEgADoAKCABCwoAIAAQyICAgAALBwAgAC0AKAsHACAALQAqCwcAIAAtACsLBwAgAC0AKQsHACAALwEyCwcAIAAtAC4LRQEEfyAAKAIYIQEgAC0ALSECIAAtACghAyAAKAI4IQQgABDCgICAABogACAENgI4IAAgAzoAKCAAIAI6AC0gACABNgIYCxEAIAAgASABIAJqEMOAgIAACxAAIABBAEHcABDMgICAABoLZwEBf0EAIQECQCAAKAIMDQACQAJAAkACQCAALQAvDgMBAAMCCyAAKAI4IgFFDQAgASgCLCIBRQ0AIAAgARGAgICAAAAiAQ0DC0EADwsQyoCAgAAACyAAQcOWgIAANgIQQQ4hAQsgAQseAAJAIAAoAgwNACAAQdGbgIAANgIQIABBFTYCDAsLFgACQCAAKAIMQRVHDQAgAEEANgIMCwsWAAJAIAAoAgxBFkcNACAAQQA2AgwLCwcAIAAoAgwLBwAgACgCEAsJACAAIAE2AhALBwAgACgCFAsiAAJAIABBJEkNABDKgICAAAALIABBAnRBoLOAgABqKAIACyIAAkAgAEEuSQ0AEMqAgIAAAAsgAEECdEGwtICAAGooAgAL7gsBAX9B66iAgAAhAQJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAIABBnH9qDvQDY2IAAWFhYWFhYQIDBAVhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhBgcICQoLDA0OD2FhYWFhEGFhYWFhYWFhYWFhEWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYRITFBUWFxgZGhthYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhHB0eHyAhIiMkJSYnKCkqKywtLi8wMTIzNDU2YTc4OTphYWFhYWFhYTthYWE8YWFhYT0+P2FhYWFhYWFhQGFhQWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYUJDREVGR0hJSktMTU5PUFFSU2FhYWFhYWFhVFVWV1hZWlthXF1hYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFeYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhYWFhX2BhC0Hhp4CAAA8LQaShgIAADwtBy6yAgAAPC0H+sYCAAA8LQcCkgIAADwtBq6SAgAAPC0GNqICAAA8LQeKmgIAADwtBgLCAgAAPC0G5r4CAAA8LQdekgIAADwtB75+AgAAPC0Hhn4CAAA8LQfqfgIAADwtB8qCAgAAPC0Gor4CAAA8LQa6ygIAADwtBiLCAgAAPC0Hsp4CAAA8LQYKigIAADwtBjp2AgAAPC0HQroCAAA8LQcqjgIAADwtBxbKAgAAPC0HfnICAAA8LQdKcgIAADwtBxKCAgAAPC0HXoICAAA8LQaKfgIAADwtB7a6AgAAPC0GrsICAAA8LQdSlgIAADwtBzK6AgAAPC0H6roCAAA8LQfyrgIAADwtB0rCAgAAPC0HxnYCAAA8LQbuggIAADwtB96uAgAAPC0GQsYCAAA8LQdexgIAADwtBoq2AgAAPC0HUp4CAAA8LQeCrgIAADwtBn6yAgAAPC0HrsYCAAA8LQdWfgIAADwtByrGAgAAPC0HepYCAAA8LQdSegIAADwtB9JyAgAAPC0GnsoCAAA8LQbGdgIAADwtBoJ2AgAAPC0G5sYCAAA8LQbywgIAADwtBkqGAgAAPC0GzpoCAAA8LQemsgIAADwtBrJ6AgAAPC0HUq4CAAA8LQfemgIAADwtBgKaAgAAPC0GwoYCAAA8LQf6egIAADwtBjaOAgAAPC0GJrYCAAA8LQfeigIAADwtBoLGAgAAPC0Gun4CAAA8LQcalgIAADwtB6J6AgAAPC0GTooCAAA8LQcKvgIAADwtBw52AgAAPC0GLrICAAA8LQeGdgIAADwtBja+AgAAPC0HqoYCAAA8LQbStgIAADwtB0q+AgAAPC0HfsoCAAA8LQdKygIAADwtB8LCAgAAPC0GpooCAAA8LQfmjgIAADwtBmZ6AgAAPC0G1rICAAA8LQZuwgIAADwtBkrKAgAAPC0G2q4CAAA8LQcKigIAADwtB+LKAgAAPC0GepYCAAA8LQdCigIAADwtBup6AgAAPC0GBnoCAAA8LEMqAgIAAAAtB1qGAgAAhAQsgAQsWACAAIAAtAC1B/gFxIAFBAEdyOgAtCxkAIAAgAC0ALUH9AXEgAUEAR0EBdHI6AC0LGQAgACAALQAtQfsBcSABQQBHQQJ0cjoALQsZACAAIAAtAC1B9wFxIAFBAEdBA3RyOgAtCy4BAn9BACEDAkAgACgCOCIERQ0AIAQoAgAiBEUNACAAIAQRgICAgAAAIQMLIAMLSQECf0EAIQMCQCAAKAI4IgRFDQAgBCgCBCIERQ0AIAAgASACIAFrIAQRgYCAgAAAIgNBf0cNACAAQcaRgIAANgIQQRghAwsgAwsuAQJ/QQAhAwJAIAAoAjgiBEUNACAEKAIwIgRFDQAgACAEEYCAgIAAACEDCyADC0kBAn9BACEDAkAgACgCOCIERQ0AIAQoAggiBEUNACAAIAEgAiABayAEEYGAgIAAACIDQX9HDQAgAEH2ioCAADYCEEEYIQMLIAMLLgECf0EAIQMCQCAAKAI4IgRFDQAgBCgCNCIERQ0AIAAgBBGAgICAAAAhAwsgAwtJAQJ/QQAhAwJAIAAoAjgiBEUNACAEKAIMIgRFDQAgACABIAIgAWsgBBGBgICAAAAiA0F/Rw0AIABB7ZqAgAA2AhBBGCEDCyADCy4BAn9BACEDAkAgACgCOCIERQ0AIAQoAjgiBEUNACAAIAQRgICAgAAAIQMLIAMLSQECf0EAIQMCQCAAKAI4IgRFDQAgBCgCECIERQ0AIAAgASACIAFrIAQRgYCAgAAAIgNBf0cNACAAQZWQgIAANgIQQRghAwsgAwsuAQJ/QQAhAwJAIAAoAjgiBEUNACAEKAI8IgRFDQAgACAEEYCAgIAAACEDCyADC0kBAn9BACEDAkAgACgCOCIERQ0AIAQoAhQiBEUNACAAIAEgAiABayAEEYGAgIAAACIDQX9HDQAgAEGqm4CAADYCEEEYIQMLIAMLLgECf0EAIQMCQCAAKAI4IgRFDQAgBCgCQCIERQ0AIAAgBBGAgICAAAAhAwsgAwtJAQJ/QQAhAwJAIAAoAjgiBEUNACAEKAIYIgRFDQAgACABIAIgAWsgBBGBgICAAAAiA0F/Rw0AIABB7ZOAgAA2AhBBGCEDCyADCy4BAn9BACEDAkAgACgCOCIERQ0AIAQoAkQiBEUNACAAIAQRgICAgAAAIQMLIAMLLgECf0EAIQMCQCAAKAI4IgRFDQAgBCgCJCIERQ0AIAAgBBGAgICAAAAhAwsgAwsuAQJ/QQAhAwJAIAAoAjgiBEUNACAEKAIsIgRFDQAgACAEEYCAgIAAACEDCyADC0kBAn9BACEDAkAgACgCOCIERQ0AIAQoAigiBEUNACAAIAEgAiABayAEEYGAgIAAACIDQX9HDQAgAEH2iICAADYCEEEYIQMLIAMLLgECf0EAIQMCQCAAKAI4IgRFDQAgBCgCUCIERQ0AIAAgBBGAgICAAAAhAwsgAwtJAQJ/QQAhAwJAIAAoAjgiBEUNACAEKAIcIgRFDQAgACABIAIgAWsgBBGBgICAAAAiA0F/Rw0AIABBwpmAgAA2AhBBGCEDCyADCy4BAn9BACEDAkAgACgCOCIERQ0AIAQoAkgiBEUNACAAIAQRgICAgAAAIQMLIAMLSQECf0EAIQMCQCAAKAI4IgRFDQAgBCgCICIERQ0AIAAgASACIAFrIAQRgYCAgAAAIgNBf0cNACAAQZSUgIAANgIQQRghAwsgAwsuAQJ/QQAhAwJAIAAoAjgiBEUNACAEKAJMIgRFDQAgACAEEYCAgIAAACEDCyADCy4BAn9BACEDAkAgACgCOCIERQ0AIAQoAlQiBEUNACAAIAQRgICAgAAAIQMLIAMLLgECf0EAIQMCQCAAKAI4IgRFDQAgBCgCWCIERQ0AIAAgBBGAgICAAAAhAwsgAwtFAQF/AkACQCAALwEwQRRxQRRHDQBBASEDIAAtAChBAUYNASAALwEyQeUARiEDDAELIAAtAClBBUYhAwsgACADOgAuQQAL/gEBA39BASEDAkAgAC8BMCIEQQhxDQAgACkDIEIAUiEDCwJAAkAgAC0ALkUNAEEBIQUgAC0AKUEFRg0BQQEhBSAEQcAAcUUgA3FBAUcNAQtBACEFIARBwABxDQBBAiEFIARB//8DcSIDQQhxDQACQCADQYAEcUUNAAJAIAAtAChBAUcNACAALQAtQQpxDQBBBQ8LQQQPCwJAIANBIHENAAJAIAAtAChBAUYNACAALwEyQf//A3EiAEGcf2pB5ABJDQAgAEHMAUYNACAAQbACRg0AQQQhBSAEQShxRQ0CIANBiARxQYAERg0CC0EADwtBAEEDIAApAyBQGyEFCyAFC2IBAn9BACEBAkAgAC0AKEEBRg0AIAAvATJB//8DcSICQZx/akHkAEkNACACQcwBRg0AIAJBsAJGDQAgAC8BMCIAQcAAcQ0AQQEhASAAQYgEcUGABEYNACAAQShxRSEBCyABC6cBAQN/AkACQAJAIAAtACpFDQAgAC0AK0UNAEEAIQMgAC8BMCIEQQJxRQ0BDAILQQAhAyAALwEwIgRBAXFFDQELQQEhAyAALQAoQQFGDQAgAC8BMkH//wNxIgVBnH9qQeQASQ0AIAVBzAFGDQAgBUGwAkYNACAEQcAAcQ0AQQAhAyAEQYgEcUGABEYNACAEQShxQQBHIQMLIABBADsBMCAAQQA6AC8gAwuZAQECfwJAAkACQCAALQAqRQ0AIAAtACtFDQBBACEBIAAvATAiAkECcUUNAQwCC0EAIQEgAC8BMCICQQFxRQ0BC0EBIQEgAC0AKEEBRg0AIAAvATJB//8DcSIAQZx/akHkAEkNACAAQcwBRg0AIABBsAJGDQAgAkHAAHENAEEAIQEgAkGIBHFBgARGDQAgAkEocUEARyEBCyABC0kBAXsgAEEQav0MAAAAAAAAAAAAAAAAAAAAACIB/QsDACAAIAH9CwMAIABBMGogAf0LAwAgAEEgaiAB/QsDACAAQd0BNgIcQQALewEBfwJAIAAoAgwiAw0AAkAgACgCBEUNACAAIAE2AgQLAkAgACABIAIQxICAgAAiAw0AIAAoAgwPCyAAIAM2AhxBACEDIAAoAgQiAUUNACAAIAEgAiAAKAIIEYGAgIAAACIBRQ0AIAAgAjYCFCAAIAE2AgwgASEDCyADC+TzAQMOfwN+BH8jgICAgABBEGsiAySAgICAACABIQQgASEFIAEhBiABIQcgASEIIAEhCSABIQogASELIAEhDCABIQ0gASEOIAEhDwJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQCAAKAIcIhBBf2oO3QHaAQHZAQIDBAUGBwgJCgsMDQ7YAQ8Q1wEREtYBExQVFhcYGRob4AHfARwdHtUBHyAhIiMkJdQBJicoKSorLNMB0gEtLtEB0AEvMDEyMzQ1Njc4OTo7PD0+P0BBQkNERUbbAUdISUrPAc4BS80BTMwBTU5PUFFSU1RVVldYWVpbXF1eX2BhYmNkZWZnaGlqa2xtbm9wcXJzdHV2d3h5ent8fX5/gAGBAYIBgwGEAYUBhgGHAYgBiQGKAYsBjAGNAY4BjwGQAZEBkgGTAZQBlQGWAZcBmAGZAZoBmwGcAZ0BngGfAaABoQGiAaMBpAGlAaYBpwGoAakBqgGrAawBrQGuAa8BsAGxAbIBswG0AbUBtgG3AcsBygG4AckBuQHIAboBuwG8Ab0BvgG/AcABwQHCAcMBxAHFAcYBANwBC0EAIRAMxgELQQ4hEAzFAQtBDSEQDMQBC0EPIRAMwwELQRAhEAzCAQtBEyEQDMEBC0EUIRAMwAELQRUhEAy/AQtBFiEQDL4BC0EXIRAMvQELQRghEAy8AQtBGSEQDLsBC0EaIRAMugELQRshEAy5AQtBHCEQDLgBC0EIIRAMtwELQR0hEAy2AQtBICEQDLUBC0EfIRAMtAELQQchEAyzAQtBISEQDLIBC0EiIRAMsQELQR4hEAywAQtBIyEQDK8BC0ESIRAMrgELQREhEAytAQtBJCEQDKwBC0ElIRAMqwELQSYhEAyqAQtBJyEQDKkBC0HDASEQDKgBC0EpIRAMpwELQSshEAymAQtBLCEQDKUBC0EtIRAMpAELQS4hEAyjAQtBLyEQDKIBC0HEASEQDKEBC0EwIRAMoAELQTQhEAyfAQtBDCEQDJ4BC0ExIRAMnQELQTIhEAycAQtBMyEQDJsBC0E5IRAMmgELQTUhEAyZAQtBxQEhEAyYAQtBCyEQDJcBC0E6IRAMlgELQTYhEAyVAQtBCiEQDJQBC0E3IRAMkwELQTghEAySAQtBPCEQDJEBC0E7IRAMkAELQT0hEAyPAQtBCSEQDI4BC0EoIRAMjQELQT4hEAyMAQtBPyEQDIsBC0HAACEQDIoBC0HBACEQDIkBC0HCACEQDIgBC0HDACEQDIcBC0HEACEQDIYBC0HFACEQDIUBC0HGACEQDIQBC0EqIRAMgwELQccAIRAMggELQcgAIRAMgQELQckAIRAMgAELQcoAIRAMfwtBywAhEAx+C0HNACEQDH0LQcwAIRAMfAtBzgAhEAx7C0HPACEQDHoLQdAAIRAMeQtB0QAhEAx4C0HSACEQDHcLQdMAIRAMdgtB1AAhEAx1C0HWACEQDHQLQdUAIRAMcwtBBiEQDHILQdcAIRAMcQtBBSEQDHALQdgAIRAMbwtBBCEQDG4LQdkAIRAMbQtB2gAhEAxsC0HbACEQDGsLQdwAIRAMagtBAyEQDGkLQd0AIRAMaAtB3gAhEAxnC0HfACEQDGYLQeEAIRAMZQtB4AAhEAxkC0HiACEQDGMLQeMAIRAMYgtBAiEQDGELQeQAIRAMYAtB5QAhEAxfC0HmACEQDF4LQecAIRAMXQtB6AAhEAxcC0HpACEQDFsLQeoAIRAMWgtB6wAhEAxZC0HsACEQDFgLQe0AIRAMVwtB7gAhEAxWC0HvACEQDFULQfAAIRAMVAtB8QAhEAxTC0HyACEQDFILQfMAIRAMUQtB9AAhEAxQC0H1ACEQDE8LQfYAIRAMTgtB9wAhEAxNC0H4ACEQDEwLQfkAIRAMSwtB+gAhEAxKC0H7ACEQDEkLQfwAIRAMSAtB/QAhEAxHC0H+ACEQDEYLQf8AIRAMRQtBgAEhEAxEC0GBASEQDEMLQYIBIRAMQgtBgwEhEAxBC0GEASEQDEALQYUBIRAMPwtBhgEhEAw+C0GHASEQDD0LQYgBIRAMPAtBiQEhEAw7C0GKASEQDDoLQYsBIRAMOQtBjAEhEAw4C0GNASEQDDcLQY4BIRAMNgtBjwEhEAw1C0GQASEQDDQLQZEBIRAMMwtBkgEhEAwyC0GTASEQDDELQZQBIRAMMAtBlQEhEAwvC0GWASEQDC4LQZcBIRAMLQtBmAEhEAwsC0GZASEQDCsLQZoBIRAMKgtBmwEhEAwpC0GcASEQDCgLQZ0BIRAMJwtBngEhEAwmC0GfASEQDCULQaABIRAMJAtBoQEhEAwjC0GiASEQDCILQaMBIRAMIQtBpAEhEAwgC0GlASEQDB8LQaYBIRAMHgtBpwEhEAwdC0GoASEQDBwLQakBIRAMGwtBqgEhEAwaC0GrASEQDBkLQawBIRAMGAtBrQEhEAwXC0GuASEQDBYLQQEhEAwVC0GvASEQDBQLQbABIRAMEwtBsQEhEAwSC0GzASEQDBELQbIBIRAMEAtBtAEhEAwPC0G1ASEQDA4LQbYBIRAMDQtBtwEhEAwMC0G4ASEQDAsLQbkBIRAMCgtBugEhEAwJC0G7ASEQDAgLQcYBIRAMBwtBvAEhEAwGC0G9ASEQDAULQb4BIRAMBAtBvwEhEAwDC0HAASEQDAILQcIBIRAMAQtBwQEhEAsDQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAIBAOxwEAAQIDBAUGBwgJCgsMDQ4PEBESExQVFhcYGRobHB4fICEjJSg/QEFERUZHSElKS0xNT1BRUlPeA1dZW1xdYGJlZmdoaWprbG1vcHFyc3R1dnd4eXp7fH1+gAGCAYUBhgGHAYkBiwGMAY0BjgGPAZABkQGUAZUBlgGXAZgBmQGaAZsBnAGdAZ4BnwGgAaEBogGjAaQBpQGmAacBqAGpAaoBqwGsAa0BrgGvAbABsQGyAbMBtAG1AbYBtwG4AbkBugG7AbwBvQG+Ab8BwAHBAcIBwwHEAcUBxgHHAcgByQHKAcsBzAHNAc4BzwHQAdEB0gHTAdQB1QHWAdcB2AHZAdoB2wHcAd0B3gHgAeEB4gHjAeQB5QHmAecB6AHpAeoB6wHsAe0B7gHvAfAB8QHyAfMBmQKkArAC/gL+AgsgASIEIAJHDfMBQd0BIRAM/wMLIAEiECACRw3dAUHDASEQDP4DCyABIgEgAkcNkAFB9wAhEAz9AwsgASIBIAJHDYYBQe8AIRAM/AMLIAEiASACRw1/QeoAIRAM+wMLIAEiASACRw17QegAIRAM+gMLIAEiASACRw14QeYAIRAM+QMLIAEiASACRw0aQRghEAz4AwsgASIBIAJHDRRBEiEQDPcDCyABIgEgAkcNWUHFACEQDPYDCyABIgEgAkcNSkE/IRAM9QMLIAEiASACRw1IQTwhEAz0AwsgASIBIAJHDUFBMSEQDPMDCyAALQAuQQFGDesDDIcCCyAAIAEiASACEMCAgIAAQQFHDeYBIABCADcDIAznAQsgACABIgEgAhC0gICAACIQDecBIAEhAQz1AgsCQCABIgEgAkcNAEEGIRAM8AMLIAAgAUEBaiIBIAIQu4CAgAAiEA3oASABIQEMMQsgAEIANwMgQRIhEAzVAwsgASIQIAJHDStBHSEQDO0DCwJAIAEiASACRg0AIAFBAWohAUEQIRAM1AMLQQchEAzsAwsgAEIAIAApAyAiESACIAEiEGutIhJ9IhMgEyARVhs3AyAgESASViIURQ3lAUEIIRAM6wMLAkAgASIBIAJGDQAgAEGJgICAADYCCCAAIAE2AgQgASEBQRQhEAzSAwtBCSEQDOoDCyABIQEgACkDIFAN5AEgASEBDPICCwJAIAEiASACRw0AQQshEAzpAwsgACABQQFqIgEgAhC2gICAACIQDeUBIAEhAQzyAgsgACABIgEgAhC4gICAACIQDeUBIAEhAQzyAgsgACABIgEgAhC4gICAACIQDeYBIAEhAQwNCyAAIAEiASACELqAgIAAIhAN5wEgASEBDPACCwJAIAEiASACRw0AQQ8hEAzlAwsgAS0AACIQQTtGDQggEEENRw3oASABQQFqIQEM7wILIAAgASIBIAIQuoCAgAAiEA3oASABIQEM8gILA0ACQCABLQAAQfC1gIAAai0AACIQQQFGDQAgEEECRw3rASAAKAIEIRAgAEEANgIEIAAgECABQQFqIgEQuYCAgAAiEA3qASABIQEM9AILIAFBAWoiASACRw0AC0ESIRAM4gMLIAAgASIBIAIQuoCAgAAiEA3pASABIQEMCgsgASIBIAJHDQZBGyEQDOADCwJAIAEiASACRw0AQRYhEAzgAwsgAEGKgICAADYCCCAAIAE2AgQgACABIAIQuICAgAAiEA3qASABIQFBICEQDMYDCwJAIAEiASACRg0AA0ACQCABLQAAQfC3gIAAai0AACIQQQJGDQACQCAQQX9qDgTlAewBAOsB7AELIAFBAWohAUEIIRAMyAMLIAFBAWoiASACRw0AC0EVIRAM3wMLQRUhEAzeAwsDQAJAIAEtAABB8LmAgABqLQAAIhBBAkYNACAQQX9qDgTeAewB4AHrAewBCyABQQFqIgEgAkcNAAtBGCEQDN0DCwJAIAEiASACRg0AIABBi4CAgAA2AgggACABNgIEIAEhAUEHIRAMxAMLQRkhEAzcAwsgAUEBaiEBDAILAkAgASIUIAJHDQBBGiEQDNsDCyAUIQECQCAULQAAQXNqDhTdAu4C7gLuAu4C7gLuAu4C7gLuAu4C7gLuAu4C7gLuAu4C7gLuAgDuAgtBACEQIABBADYCHCAAQa+LgIAANgIQIABBAjYCDCAAIBRBAWo2AhQM2gMLAkAgAS0AACIQQTtGDQAgEEENRw3oASABQQFqIQEM5QILIAFBAWohAQtBIiEQDL8DCwJAIAEiECACRw0AQRwhEAzYAwtCACERIBAhASAQLQAAQVBqDjfnAeYBAQIDBAUGBwgAAAAAAAAACQoLDA0OAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPEBESExQAC0EeIRAMvQMLQgIhEQzlAQtCAyERDOQBC0IEIREM4wELQgUhEQziAQtCBiERDOEBC0IHIREM4AELQgghEQzfAQtCCSERDN4BC0IKIREM3QELQgshEQzcAQtCDCERDNsBC0INIREM2gELQg4hEQzZAQtCDyERDNgBC0IKIREM1wELQgshEQzWAQtCDCERDNUBC0INIREM1AELQg4hEQzTAQtCDyERDNIBC0IAIRECQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAIBAtAABBUGoON+UB5AEAAQIDBAUGB+YB5gHmAeYB5gHmAeYBCAkKCwwN5gHmAeYB5gHmAeYB5gHmAeYB5gHmAeYB5gHmAeYB5gHmAeYB5gHmAeYB5gHmAeYB5gHmAQ4PEBESE+YBC0ICIREM5AELQgMhEQzjAQtCBCERDOIBC0IFIREM4QELQgYhEQzgAQtCByERDN8BC0IIIREM3gELQgkhEQzdAQtCCiERDNwBC0ILIREM2wELQgwhEQzaAQtCDSERDNkBC0IOIREM2AELQg8hEQzXAQtCCiERDNYBC0ILIREM1QELQgwhEQzUAQtCDSERDNMBC0IOIREM0gELQg8hEQzRAQsgAEIAIAApAyAiESACIAEiEGutIhJ9IhMgEyARVhs3AyAgESASViIURQ3SAUEfIRAMwAMLAkAgASIBIAJGDQAgAEGJgICAADYCCCAAIAE2AgQgASEBQSQhEAynAwtBICEQDL8DCyAAIAEiECACEL6AgIAAQX9qDgW2AQDFAgHRAdIBC0ERIRAMpAMLIABBAToALyAQIQEMuwMLIAEiASACRw3SAUEkIRAMuwMLIAEiDSACRw0eQcYAIRAMugMLIAAgASIBIAIQsoCAgAAiEA3UASABIQEMtQELIAEiECACRw0mQdAAIRAMuAMLAkAgASIBIAJHDQBBKCEQDLgDCyAAQQA2AgQgAEGMgICAADYCCCAAIAEgARCxgICAACIQDdMBIAEhAQzYAQsCQCABIhAgAkcNAEEpIRAMtwMLIBAtAAAiAUEgRg0UIAFBCUcN0wEgEEEBaiEBDBULAkAgASIBIAJGDQAgAUEBaiEBDBcLQSohEAy1AwsCQCABIhAgAkcNAEErIRAMtQMLAkAgEC0AACIBQQlGDQAgAUEgRw3VAQsgAC0ALEEIRg3TASAQIQEMkQMLAkAgASIBIAJHDQBBLCEQDLQDCyABLQAAQQpHDdUBIAFBAWohAQzJAgsgASIOIAJHDdUBQS8hEAyyAwsDQAJAIAEtAAAiEEEgRg0AAkAgEEF2ag4EANwB3AEA2gELIAEhAQzgAQsgAUEBaiIBIAJHDQALQTEhEAyxAwtBMiEQIAEiFCACRg2wAyACIBRrIAAoAgAiAWohFSAUIAFrQQNqIRYCQANAIBQtAAAiF0EgciAXIBdBv39qQf8BcUEaSRtB/wFxIAFB8LuAgABqLQAARw0BAkAgAUEDRw0AQQYhAQyWAwsgAUEBaiEBIBRBAWoiFCACRw0ACyAAIBU2AgAMsQMLIABBADYCACAUIQEM2QELQTMhECABIhQgAkYNrwMgAiAUayAAKAIAIgFqIRUgFCABa0EIaiEWAkADQCAULQAAIhdBIHIgFyAXQb9/akH/AXFBGkkbQf8BcSABQfS7gIAAai0AAEcNAQJAIAFBCEcNAEEFIQEMlQMLIAFBAWohASAUQQFqIhQgAkcNAAsgACAVNgIADLADCyAAQQA2AgAgFCEBDNgBC0E0IRAgASIUIAJGDa4DIAIgFGsgACgCACIBaiEVIBQgAWtBBWohFgJAA0AgFC0AACIXQSByIBcgF0G/f2pB/wFxQRpJG0H/AXEgAUHQwoCAAGotAABHDQECQCABQQVHDQBBByEBDJQDCyABQQFqIQEgFEEBaiIUIAJHDQALIAAgFTYCAAyvAwsgAEEANgIAIBQhAQzXAQsCQCABIgEgAkYNAANAAkAgAS0AAEGAvoCAAGotAAAiEEEBRg0AIBBBAkYNCiABIQEM3QELIAFBAWoiASACRw0AC0EwIRAMrgMLQTAhEAytAwsCQCABIgEgAkYNAANAAkAgAS0AACIQQSBGDQAgEEF2ag4E2QHaAdoB2QHaAQsgAUEBaiIBIAJHDQALQTghEAytAwtBOCEQDKwDCwNAAkAgAS0AACIQQSBGDQAgEEEJRw0DCyABQQFqIgEgAkcNAAtBPCEQDKsDCwNAAkAgAS0AACIQQSBGDQACQAJAIBBBdmoOBNoBAQHaAQALIBBBLEYN2wELIAEhAQwECyABQQFqIgEgAkcNAAtBPyEQDKoDCyABIQEM2wELQcAAIRAgASIUIAJGDagDIAIgFGsgACgCACIBaiEWIBQgAWtBBmohFwJAA0AgFC0AAEEgciABQYDAgIAAai0AAEcNASABQQZGDY4DIAFBAWohASAUQQFqIhQgAkcNAAsgACAWNgIADKkDCyAAQQA2AgAgFCEBC0E2IRAMjgMLAkAgASIPIAJHDQBBwQAhEAynAwsgAEGMgICAADYCCCAAIA82AgQgDyEBIAAtACxBf2oOBM0B1QHXAdkBhwMLIAFBAWohAQzMAQsCQCABIgEgAkYNAANAAkAgAS0AACIQQSByIBAgEEG/f2pB/wFxQRpJG0H/AXEiEEEJRg0AIBBBIEYNAAJAAkACQAJAIBBBnX9qDhMAAwMDAwMDAwEDAwMDAwMDAwMCAwsgAUEBaiEBQTEhEAyRAwsgAUEBaiEBQTIhEAyQAwsgAUEBaiEBQTMhEAyPAwsgASEBDNABCyABQQFqIgEgAkcNAAtBNSEQDKUDC0E1IRAMpAMLAkAgASIBIAJGDQADQAJAIAEtAABBgLyAgABqLQAAQQFGDQAgASEBDNMBCyABQQFqIgEgAkcNAAtBPSEQDKQDC0E9IRAMowMLIAAgASIBIAIQsICAgAAiEA3WASABIQEMAQsgEEEBaiEBC0E8IRAMhwMLAkAgASIBIAJHDQBBwgAhEAygAwsCQANAAkAgAS0AAEF3ag4YAAL+Av4ChAP+Av4C/gL+Av4C/gL+Av4C/gL+Av4C/gL+Av4C/gL+Av4C/gIA/gILIAFBAWoiASACRw0AC0HCACEQDKADCyABQQFqIQEgAC0ALUEBcUUNvQEgASEBC0EsIRAMhQMLIAEiASACRw3TAUHEACEQDJ0DCwNAAkAgAS0AAEGQwICAAGotAABBAUYNACABIQEMtwILIAFBAWoiASACRw0AC0HFACEQDJwDCyANLQAAIhBBIEYNswEgEEE6Rw2BAyAAKAIEIQEgAEEANgIEIAAgASANEK+AgIAAIgEN0AEgDUEBaiEBDLMCC0HHACEQIAEiDSACRg2aAyACIA1rIAAoAgAiAWohFiANIAFrQQVqIRcDQCANLQAAIhRBIHIgFCAUQb9/akH/AXFBGkkbQf8BcSABQZDCgIAAai0AAEcNgAMgAUEFRg30AiABQQFqIQEgDUEBaiINIAJHDQALIAAgFjYCAAyaAwtByAAhECABIg0gAkYNmQMgAiANayAAKAIAIgFqIRYgDSABa0EJaiEXA0AgDS0AACIUQSByIBQgFEG/f2pB/wFxQRpJG0H/AXEgAUGWwoCAAGotAABHDf8CAkAgAUEJRw0AQQIhAQz1AgsgAUEBaiEBIA1BAWoiDSACRw0ACyAAIBY2AgAMmQMLAkAgASINIAJHDQBByQAhEAyZAwsCQAJAIA0tAAAiAUEgciABIAFBv39qQf8BcUEaSRtB/wFxQZJ/ag4HAIADgAOAA4ADgAMBgAMLIA1BAWohAUE+IRAMgAMLIA1BAWohAUE/IRAM/wILQcoAIRAgASINIAJGDZcDIAIgDWsgACgCACIBaiEWIA0gAWtBAWohFwNAIA0tAAAiFEEgciAUIBRBv39qQf8BcUEaSRtB/wFxIAFBoMKAgABqLQAARw39AiABQQFGDfACIAFBAWohASANQQFqIg0gAkcNAAsgACAWNgIADJcDC0HLACEQIAEiDSACRg2WAyACIA1rIAAoAgAiAWohFiANIAFrQQ5qIRcDQCANLQAAIhRBIHIgFCAUQb9/akH/AXFBGkkbQf8BcSABQaLCgIAAai0AAEcN/AIgAUEORg3wAiABQQFqIQEgDUEBaiINIAJHDQALIAAgFjYCAAyWAwtBzAAhECABIg0gAkYNlQMgAiANayAAKAIAIgFqIRYgDSABa0EPaiEXA0AgDS0AACIUQSByIBQgFEG/f2pB/wFxQRpJG0H/AXEgAUHAwoCAAGotAABHDfsCAkAgAUEPRw0AQQMhAQzxAgsgAUEBaiEBIA1BAWoiDSACRw0ACyAAIBY2AgAMlQMLQc0AIRAgASINIAJGDZQDIAIgDWsgACgCACIBaiEWIA0gAWtBBWohFwNAIA0tAAAiFEEgciAUIBRBv39qQf8BcUEaSRtB/wFxIAFB0MKAgABqLQAARw36AgJAIAFBBUcNAEEEIQEM8AILIAFBAWohASANQQFqIg0gAkcNAAsgACAWNgIADJQDCwJAIAEiDSACRw0AQc4AIRAMlAMLAkACQAJAAkAgDS0AACIBQSByIAEgAUG/f2pB/wFxQRpJG0H/AXFBnX9qDhMA/QL9Av0C/QL9Av0C/QL9Av0C/QL9Av0CAf0C/QL9AgID/QILIA1BAWohAUHBACEQDP0CCyANQQFqIQFBwgAhEAz8AgsgDUEBaiEBQcMAIRAM+wILIA1BAWohAUHEACEQDPoCCwJAIAEiASACRg0AIABBjYCAgAA2AgggACABNgIEIAEhAUHFACEQDPoCC0HPACEQDJIDCyAQIQECQAJAIBAtAABBdmoOBAGoAqgCAKgCCyAQQQFqIQELQSchEAz4AgsCQCABIgEgAkcNAEHRACEQDJEDCwJAIAEtAABBIEYNACABIQEMjQELIAFBAWohASAALQAtQQFxRQ3HASABIQEMjAELIAEiFyACRw3IAUHSACEQDI8DC0HTACEQIAEiFCACRg2OAyACIBRrIAAoAgAiAWohFiAUIAFrQQFqIRcDQCAULQAAIAFB1sKAgABqLQAARw3MASABQQFGDccBIAFBAWohASAUQQFqIhQgAkcNAAsgACAWNgIADI4DCwJAIAEiASACRw0AQdUAIRAMjgMLIAEtAABBCkcNzAEgAUEBaiEBDMcBCwJAIAEiASACRw0AQdYAIRAMjQMLAkACQCABLQAAQXZqDgQAzQHNAQHNAQsgAUEBaiEBDMcBCyABQQFqIQFBygAhEAzzAgsgACABIgEgAhCugICAACIQDcsBIAEhAUHNACEQDPICCyAALQApQSJGDYUDDKYCCwJAIAEiASACRw0AQdsAIRAMigMLQQAhFEEBIRdBASEWQQAhEAJAAkACQAJAAkACQAJAAkACQCABLQAAQVBqDgrUAdMBAAECAwQFBgjVAQtBAiEQDAYLQQMhEAwFC0EEIRAMBAtBBSEQDAMLQQYhEAwCC0EHIRAMAQtBCCEQC0EAIRdBACEWQQAhFAzMAQtBCSEQQQEhFEEAIRdBACEWDMsBCwJAIAEiASACRw0AQd0AIRAMiQMLIAEtAABBLkcNzAEgAUEBaiEBDKYCCyABIgEgAkcNzAFB3wAhEAyHAwsCQCABIgEgAkYNACAAQY6AgIAANgIIIAAgATYCBCABIQFB0AAhEAzuAgtB4AAhEAyGAwtB4QAhECABIgEgAkYNhQMgAiABayAAKAIAIhRqIRYgASAUa0EDaiEXA0AgAS0AACAUQeLCgIAAai0AAEcNzQEgFEEDRg3MASAUQQFqIRQgAUEBaiIBIAJHDQALIAAgFjYCAAyFAwtB4gAhECABIgEgAkYNhAMgAiABayAAKAIAIhRqIRYgASAUa0ECaiEXA0AgAS0AACAUQebCgIAAai0AAEcNzAEgFEECRg3OASAUQQFqIRQgAUEBaiIBIAJHDQALIAAgFjYCAAyEAwtB4wAhECABIgEgAkYNgwMgAiABayAAKAIAIhRqIRYgASAUa0EDaiEXA0AgAS0AACAUQenCgIAAai0AAEcNywEgFEEDRg3OASAUQQFqIRQgAUEBaiIBIAJHDQALIAAgFjYCAAyDAwsCQCABIgEgAkcNAEHlACEQDIMDCyAAIAFBAWoiASACEKiAgIAAIhANzQEgASEBQdYAIRAM6QILAkAgASIBIAJGDQADQAJAIAEtAAAiEEEgRg0AAkACQAJAIBBBuH9qDgsAAc8BzwHPAc8BzwHPAc8BzwECzwELIAFBAWohAUHSACEQDO0CCyABQQFqIQFB0wAhEAzsAgsgAUEBaiEBQdQAIRAM6wILIAFBAWoiASACRw0AC0HkACEQDIIDC0HkACEQDIEDCwNAAkAgAS0AAEHwwoCAAGotAAAiEEEBRg0AIBBBfmoOA88B0AHRAdIBCyABQQFqIgEgAkcNAAtB5gAhEAyAAwsCQCABIgEgAkYNACABQQFqIQEMAwtB5wAhEAz/AgsDQAJAIAEtAABB8MSAgABqLQAAIhBBAUYNAAJAIBBBfmoOBNIB0wHUAQDVAQsgASEBQdcAIRAM5wILIAFBAWoiASACRw0AC0HoACEQDP4CCwJAIAEiASACRw0AQekAIRAM/gILAkAgAS0AACIQQXZqDhq6AdUB1QG8AdUB1QHVAdUB1QHVAdUB1QHVAdUB1QHVAdUB1QHVAdUB1QHVAcoB1QHVAQDTAQsgAUEBaiEBC0EGIRAM4wILA0ACQCABLQAAQfDGgIAAai0AAEEBRg0AIAEhAQyeAgsgAUEBaiIBIAJHDQALQeoAIRAM+wILAkAgASIBIAJGDQAgAUEBaiEBDAMLQesAIRAM+gILAkAgASIBIAJHDQBB7AAhEAz6AgsgAUEBaiEBDAELAkAgASIBIAJHDQBB7QAhEAz5AgsgAUEBaiEBC0EEIRAM3gILAkAgASIUIAJHDQBB7gAhEAz3AgsgFCEBAkACQAJAIBQtAABB8MiAgABqLQAAQX9qDgfUAdUB1gEAnAIBAtcBCyAUQQFqIQEMCgsgFEEBaiEBDM0BC0EAIRAgAEEANgIcIABBm5KAgAA2AhAgAEEHNgIMIAAgFEEBajYCFAz2AgsCQANAAkAgAS0AAEHwyICAAGotAAAiEEEERg0AAkACQCAQQX9qDgfSAdMB1AHZAQAEAdkBCyABIQFB2gAhEAzgAgsgAUEBaiEBQdwAIRAM3wILIAFBAWoiASACRw0AC0HvACEQDPYCCyABQQFqIQEMywELAkAgASIUIAJHDQBB8AAhEAz1AgsgFC0AAEEvRw3UASAUQQFqIQEMBgsCQCABIhQgAkcNAEHxACEQDPQCCwJAIBQtAAAiAUEvRw0AIBRBAWohAUHdACEQDNsCCyABQXZqIgRBFksN0wFBASAEdEGJgIACcUUN0wEMygILAkAgASIBIAJGDQAgAUEBaiEBQd4AIRAM2gILQfIAIRAM8gILAkAgASIUIAJHDQBB9AAhEAzyAgsgFCEBAkAgFC0AAEHwzICAAGotAABBf2oOA8kClAIA1AELQeEAIRAM2AILAkAgASIUIAJGDQADQAJAIBQtAABB8MqAgABqLQAAIgFBA0YNAAJAIAFBf2oOAssCANUBCyAUIQFB3wAhEAzaAgsgFEEBaiIUIAJHDQALQfMAIRAM8QILQfMAIRAM8AILAkAgASIBIAJGDQAgAEGPgICAADYCCCAAIAE2AgQgASEBQeAAIRAM1wILQfUAIRAM7wILAkAgASIBIAJHDQBB9gAhEAzvAgsgAEGPgICAADYCCCAAIAE2AgQgASEBC0EDIRAM1AILA0AgAS0AAEEgRw3DAiABQQFqIgEgAkcNAAtB9wAhEAzsAgsCQCABIgEgAkcNAEH4ACEQDOwCCyABLQAAQSBHDc4BIAFBAWohAQzvAQsgACABIgEgAhCsgICAACIQDc4BIAEhAQyOAgsCQCABIgQgAkcNAEH6ACEQDOoCCyAELQAAQcwARw3RASAEQQFqIQFBEyEQDM8BCwJAIAEiBCACRw0AQfsAIRAM6QILIAIgBGsgACgCACIBaiEUIAQgAWtBBWohEANAIAQtAAAgAUHwzoCAAGotAABHDdABIAFBBUYNzgEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBB+wAhEAzoAgsCQCABIgQgAkcNAEH8ACEQDOgCCwJAAkAgBC0AAEG9f2oODADRAdEB0QHRAdEB0QHRAdEB0QHRAQHRAQsgBEEBaiEBQeYAIRAMzwILIARBAWohAUHnACEQDM4CCwJAIAEiBCACRw0AQf0AIRAM5wILIAIgBGsgACgCACIBaiEUIAQgAWtBAmohEAJAA0AgBC0AACABQe3PgIAAai0AAEcNzwEgAUECRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQf0AIRAM5wILIABBADYCACAQQQFqIQFBECEQDMwBCwJAIAEiBCACRw0AQf4AIRAM5gILIAIgBGsgACgCACIBaiEUIAQgAWtBBWohEAJAA0AgBC0AACABQfbOgIAAai0AAEcNzgEgAUEFRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQf4AIRAM5gILIABBADYCACAQQQFqIQFBFiEQDMsBCwJAIAEiBCACRw0AQf8AIRAM5QILIAIgBGsgACgCACIBaiEUIAQgAWtBA2ohEAJAA0AgBC0AACABQfzOgIAAai0AAEcNzQEgAUEDRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQf8AIRAM5QILIABBADYCACAQQQFqIQFBBSEQDMoBCwJAIAEiBCACRw0AQYABIRAM5AILIAQtAABB2QBHDcsBIARBAWohAUEIIRAMyQELAkAgASIEIAJHDQBBgQEhEAzjAgsCQAJAIAQtAABBsn9qDgMAzAEBzAELIARBAWohAUHrACEQDMoCCyAEQQFqIQFB7AAhEAzJAgsCQCABIgQgAkcNAEGCASEQDOICCwJAAkAgBC0AAEG4f2oOCADLAcsBywHLAcsBywEBywELIARBAWohAUHqACEQDMkCCyAEQQFqIQFB7QAhEAzIAgsCQCABIgQgAkcNAEGDASEQDOECCyACIARrIAAoAgAiAWohECAEIAFrQQJqIRQCQANAIAQtAAAgAUGAz4CAAGotAABHDckBIAFBAkYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgEDYCAEGDASEQDOECC0EAIRAgAEEANgIAIBRBAWohAQzGAQsCQCABIgQgAkcNAEGEASEQDOACCyACIARrIAAoAgAiAWohFCAEIAFrQQRqIRACQANAIAQtAAAgAUGDz4CAAGotAABHDcgBIAFBBEYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEGEASEQDOACCyAAQQA2AgAgEEEBaiEBQSMhEAzFAQsCQCABIgQgAkcNAEGFASEQDN8CCwJAAkAgBC0AAEG0f2oOCADIAcgByAHIAcgByAEByAELIARBAWohAUHvACEQDMYCCyAEQQFqIQFB8AAhEAzFAgsCQCABIgQgAkcNAEGGASEQDN4CCyAELQAAQcUARw3FASAEQQFqIQEMgwILAkAgASIEIAJHDQBBhwEhEAzdAgsgAiAEayAAKAIAIgFqIRQgBCABa0EDaiEQAkADQCAELQAAIAFBiM+AgABqLQAARw3FASABQQNGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBhwEhEAzdAgsgAEEANgIAIBBBAWohAUEtIRAMwgELAkAgASIEIAJHDQBBiAEhEAzcAgsgAiAEayAAKAIAIgFqIRQgBCABa0EIaiEQAkADQCAELQAAIAFB0M+AgABqLQAARw3EASABQQhGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBiAEhEAzcAgsgAEEANgIAIBBBAWohAUEpIRAMwQELAkAgASIBIAJHDQBBiQEhEAzbAgtBASEQIAEtAABB3wBHDcABIAFBAWohAQyBAgsCQCABIgQgAkcNAEGKASEQDNoCCyACIARrIAAoAgAiAWohFCAEIAFrQQFqIRADQCAELQAAIAFBjM+AgABqLQAARw3BASABQQFGDa8CIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQYoBIRAM2QILAkAgASIEIAJHDQBBiwEhEAzZAgsgAiAEayAAKAIAIgFqIRQgBCABa0ECaiEQAkADQCAELQAAIAFBjs+AgABqLQAARw3BASABQQJGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBiwEhEAzZAgsgAEEANgIAIBBBAWohAUECIRAMvgELAkAgASIEIAJHDQBBjAEhEAzYAgsgAiAEayAAKAIAIgFqIRQgBCABa0EBaiEQAkADQCAELQAAIAFB8M+AgABqLQAARw3AASABQQFGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBjAEhEAzYAgsgAEEANgIAIBBBAWohAUEfIRAMvQELAkAgASIEIAJHDQBBjQEhEAzXAgsgAiAEayAAKAIAIgFqIRQgBCABa0EBaiEQAkADQCAELQAAIAFB8s+AgABqLQAARw2/ASABQQFGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBjQEhEAzXAgsgAEEANgIAIBBBAWohAUEJIRAMvAELAkAgASIEIAJHDQBBjgEhEAzWAgsCQAJAIAQtAABBt39qDgcAvwG/Ab8BvwG/AQG/AQsgBEEBaiEBQfgAIRAMvQILIARBAWohAUH5ACEQDLwCCwJAIAEiBCACRw0AQY8BIRAM1QILIAIgBGsgACgCACIBaiEUIAQgAWtBBWohEAJAA0AgBC0AACABQZHPgIAAai0AAEcNvQEgAUEFRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQY8BIRAM1QILIABBADYCACAQQQFqIQFBGCEQDLoBCwJAIAEiBCACRw0AQZABIRAM1AILIAIgBGsgACgCACIBaiEUIAQgAWtBAmohEAJAA0AgBC0AACABQZfPgIAAai0AAEcNvAEgAUECRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQZABIRAM1AILIABBADYCACAQQQFqIQFBFyEQDLkBCwJAIAEiBCACRw0AQZEBIRAM0wILIAIgBGsgACgCACIBaiEUIAQgAWtBBmohEAJAA0AgBC0AACABQZrPgIAAai0AAEcNuwEgAUEGRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQZEBIRAM0wILIABBADYCACAQQQFqIQFBFSEQDLgBCwJAIAEiBCACRw0AQZIBIRAM0gILIAIgBGsgACgCACIBaiEUIAQgAWtBBWohEAJAA0AgBC0AACABQaHPgIAAai0AAEcNugEgAUEFRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQZIBIRAM0gILIABBADYCACAQQQFqIQFBHiEQDLcBCwJAIAEiBCACRw0AQZMBIRAM0QILIAQtAABBzABHDbgBIARBAWohAUEKIRAMtgELAkAgBCACRw0AQZQBIRAM0AILAkACQCAELQAAQb9/ag4PALkBuQG5AbkBuQG5AbkBuQG5AbkBuQG5AbkBAbkBCyAEQQFqIQFB/gAhEAy3AgsgBEEBaiEBQf8AIRAMtgILAkAgBCACRw0AQZUBIRAMzwILAkACQCAELQAAQb9/ag4DALgBAbgBCyAEQQFqIQFB/QAhEAy2AgsgBEEBaiEEQYABIRAMtQILAkAgBCACRw0AQZYBIRAMzgILIAIgBGsgACgCACIBaiEUIAQgAWtBAWohEAJAA0AgBC0AACABQafPgIAAai0AAEcNtgEgAUEBRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQZYBIRAMzgILIABBADYCACAQQQFqIQFBCyEQDLMBCwJAIAQgAkcNAEGXASEQDM0CCwJAAkACQAJAIAQtAABBU2oOIwC4AbgBuAG4AbgBuAG4AbgBuAG4AbgBuAG4AbgBuAG4AbgBuAG4AbgBuAG4AbgBAbgBuAG4AbgBuAECuAG4AbgBA7gBCyAEQQFqIQFB+wAhEAy2AgsgBEEBaiEBQfwAIRAMtQILIARBAWohBEGBASEQDLQCCyAEQQFqIQRBggEhEAyzAgsCQCAEIAJHDQBBmAEhEAzMAgsgAiAEayAAKAIAIgFqIRQgBCABa0EEaiEQAkADQCAELQAAIAFBqc+AgABqLQAARw20ASABQQRGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBmAEhEAzMAgsgAEEANgIAIBBBAWohAUEZIRAMsQELAkAgBCACRw0AQZkBIRAMywILIAIgBGsgACgCACIBaiEUIAQgAWtBBWohEAJAA0AgBC0AACABQa7PgIAAai0AAEcNswEgAUEFRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQZkBIRAMywILIABBADYCACAQQQFqIQFBBiEQDLABCwJAIAQgAkcNAEGaASEQDMoCCyACIARrIAAoAgAiAWohFCAEIAFrQQFqIRACQANAIAQtAAAgAUG0z4CAAGotAABHDbIBIAFBAUYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEGaASEQDMoCCyAAQQA2AgAgEEEBaiEBQRwhEAyvAQsCQCAEIAJHDQBBmwEhEAzJAgsgAiAEayAAKAIAIgFqIRQgBCABa0EBaiEQAkADQCAELQAAIAFBts+AgABqLQAARw2xASABQQFGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBmwEhEAzJAgsgAEEANgIAIBBBAWohAUEnIRAMrgELAkAgBCACRw0AQZwBIRAMyAILAkACQCAELQAAQax/ag4CAAGxAQsgBEEBaiEEQYYBIRAMrwILIARBAWohBEGHASEQDK4CCwJAIAQgAkcNAEGdASEQDMcCCyACIARrIAAoAgAiAWohFCAEIAFrQQFqIRACQANAIAQtAAAgAUG4z4CAAGotAABHDa8BIAFBAUYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEGdASEQDMcCCyAAQQA2AgAgEEEBaiEBQSYhEAysAQsCQCAEIAJHDQBBngEhEAzGAgsgAiAEayAAKAIAIgFqIRQgBCABa0EBaiEQAkADQCAELQAAIAFBus+AgABqLQAARw2uASABQQFGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBngEhEAzGAgsgAEEANgIAIBBBAWohAUEDIRAMqwELAkAgBCACRw0AQZ8BIRAMxQILIAIgBGsgACgCACIBaiEUIAQgAWtBAmohEAJAA0AgBC0AACABQe3PgIAAai0AAEcNrQEgAUECRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQZ8BIRAMxQILIABBADYCACAQQQFqIQFBDCEQDKoBCwJAIAQgAkcNAEGgASEQDMQCCyACIARrIAAoAgAiAWohFCAEIAFrQQNqIRACQANAIAQtAAAgAUG8z4CAAGotAABHDawBIAFBA0YNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEGgASEQDMQCCyAAQQA2AgAgEEEBaiEBQQ0hEAypAQsCQCAEIAJHDQBBoQEhEAzDAgsCQAJAIAQtAABBun9qDgsArAGsAawBrAGsAawBrAGsAawBAawBCyAEQQFqIQRBiwEhEAyqAgsgBEEBaiEEQYwBIRAMqQILAkAgBCACRw0AQaIBIRAMwgILIAQtAABB0ABHDakBIARBAWohBAzpAQsCQCAEIAJHDQBBowEhEAzBAgsCQAJAIAQtAABBt39qDgcBqgGqAaoBqgGqAQCqAQsgBEEBaiEEQY4BIRAMqAILIARBAWohAUEiIRAMpgELAkAgBCACRw0AQaQBIRAMwAILIAIgBGsgACgCACIBaiEUIAQgAWtBAWohEAJAA0AgBC0AACABQcDPgIAAai0AAEcNqAEgAUEBRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQaQBIRAMwAILIABBADYCACAQQQFqIQFBHSEQDKUBCwJAIAQgAkcNAEGlASEQDL8CCwJAAkAgBC0AAEGuf2oOAwCoAQGoAQsgBEEBaiEEQZABIRAMpgILIARBAWohAUEEIRAMpAELAkAgBCACRw0AQaYBIRAMvgILAkACQAJAAkACQCAELQAAQb9/ag4VAKoBqgGqAaoBqgGqAaoBqgGqAaoBAaoBqgECqgGqAQOqAaoBBKoBCyAEQQFqIQRBiAEhEAyoAgsgBEEBaiEEQYkBIRAMpwILIARBAWohBEGKASEQDKYCCyAEQQFqIQRBjwEhEAylAgsgBEEBaiEEQZEBIRAMpAILAkAgBCACRw0AQacBIRAMvQILIAIgBGsgACgCACIBaiEUIAQgAWtBAmohEAJAA0AgBC0AACABQe3PgIAAai0AAEcNpQEgAUECRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQacBIRAMvQILIABBADYCACAQQQFqIQFBESEQDKIBCwJAIAQgAkcNAEGoASEQDLwCCyACIARrIAAoAgAiAWohFCAEIAFrQQJqIRACQANAIAQtAAAgAUHCz4CAAGotAABHDaQBIAFBAkYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEGoASEQDLwCCyAAQQA2AgAgEEEBaiEBQSwhEAyhAQsCQCAEIAJHDQBBqQEhEAy7AgsgAiAEayAAKAIAIgFqIRQgBCABa0EEaiEQAkADQCAELQAAIAFBxc+AgABqLQAARw2jASABQQRGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBqQEhEAy7AgsgAEEANgIAIBBBAWohAUErIRAMoAELAkAgBCACRw0AQaoBIRAMugILIAIgBGsgACgCACIBaiEUIAQgAWtBAmohEAJAA0AgBC0AACABQcrPgIAAai0AAEcNogEgAUECRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQaoBIRAMugILIABBADYCACAQQQFqIQFBFCEQDJ8BCwJAIAQgAkcNAEGrASEQDLkCCwJAAkACQAJAIAQtAABBvn9qDg8AAQKkAaQBpAGkAaQBpAGkAaQBpAGkAaQBA6QBCyAEQQFqIQRBkwEhEAyiAgsgBEEBaiEEQZQBIRAMoQILIARBAWohBEGVASEQDKACCyAEQQFqIQRBlgEhEAyfAgsCQCAEIAJHDQBBrAEhEAy4AgsgBC0AAEHFAEcNnwEgBEEBaiEEDOABCwJAIAQgAkcNAEGtASEQDLcCCyACIARrIAAoAgAiAWohFCAEIAFrQQJqIRACQANAIAQtAAAgAUHNz4CAAGotAABHDZ8BIAFBAkYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEGtASEQDLcCCyAAQQA2AgAgEEEBaiEBQQ4hEAycAQsCQCAEIAJHDQBBrgEhEAy2AgsgBC0AAEHQAEcNnQEgBEEBaiEBQSUhEAybAQsCQCAEIAJHDQBBrwEhEAy1AgsgAiAEayAAKAIAIgFqIRQgBCABa0EIaiEQAkADQCAELQAAIAFB0M+AgABqLQAARw2dASABQQhGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBrwEhEAy1AgsgAEEANgIAIBBBAWohAUEqIRAMmgELAkAgBCACRw0AQbABIRAMtAILAkACQCAELQAAQat/ag4LAJ0BnQGdAZ0BnQGdAZ0BnQGdAQGdAQsgBEEBaiEEQZoBIRAMmwILIARBAWohBEGbASEQDJoCCwJAIAQgAkcNAEGxASEQDLMCCwJAAkAgBC0AAEG/f2oOFACcAZwBnAGcAZwBnAGcAZwBnAGcAZwBnAGcAZwBnAGcAZwBnAEBnAELIARBAWohBEGZASEQDJoCCyAEQQFqIQRBnAEhEAyZAgsCQCAEIAJHDQBBsgEhEAyyAgsgAiAEayAAKAIAIgFqIRQgBCABa0EDaiEQAkADQCAELQAAIAFB2c+AgABqLQAARw2aASABQQNGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBsgEhEAyyAgsgAEEANgIAIBBBAWohAUEhIRAMlwELAkAgBCACRw0AQbMBIRAMsQILIAIgBGsgACgCACIBaiEUIAQgAWtBBmohEAJAA0AgBC0AACABQd3PgIAAai0AAEcNmQEgAUEGRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQbMBIRAMsQILIABBADYCACAQQQFqIQFBGiEQDJYBCwJAIAQgAkcNAEG0ASEQDLACCwJAAkACQCAELQAAQbt/ag4RAJoBmgGaAZoBmgGaAZoBmgGaAQGaAZoBmgGaAZoBApoBCyAEQQFqIQRBnQEhEAyYAgsgBEEBaiEEQZ4BIRAMlwILIARBAWohBEGfASEQDJYCCwJAIAQgAkcNAEG1ASEQDK8CCyACIARrIAAoAgAiAWohFCAEIAFrQQVqIRACQANAIAQtAAAgAUHkz4CAAGotAABHDZcBIAFBBUYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEG1ASEQDK8CCyAAQQA2AgAgEEEBaiEBQSghEAyUAQsCQCAEIAJHDQBBtgEhEAyuAgsgAiAEayAAKAIAIgFqIRQgBCABa0ECaiEQAkADQCAELQAAIAFB6s+AgABqLQAARw2WASABQQJGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBtgEhEAyuAgsgAEEANgIAIBBBAWohAUEHIRAMkwELAkAgBCACRw0AQbcBIRAMrQILAkACQCAELQAAQbt/ag4OAJYBlgGWAZYBlgGWAZYBlgGWAZYBlgGWAQGWAQsgBEEBaiEEQaEBIRAMlAILIARBAWohBEGiASEQDJMCCwJAIAQgAkcNAEG4ASEQDKwCCyACIARrIAAoAgAiAWohFCAEIAFrQQJqIRACQANAIAQtAAAgAUHtz4CAAGotAABHDZQBIAFBAkYNASABQQFqIQEgBEEBaiIEIAJHDQALIAAgFDYCAEG4ASEQDKwCCyAAQQA2AgAgEEEBaiEBQRIhEAyRAQsCQCAEIAJHDQBBuQEhEAyrAgsgAiAEayAAKAIAIgFqIRQgBCABa0EBaiEQAkADQCAELQAAIAFB8M+AgABqLQAARw2TASABQQFGDQEgAUEBaiEBIARBAWoiBCACRw0ACyAAIBQ2AgBBuQEhEAyrAgsgAEEANgIAIBBBAWohAUEgIRAMkAELAkAgBCACRw0AQboBIRAMqgILIAIgBGsgACgCACIBaiEUIAQgAWtBAWohEAJAA0AgBC0AACABQfLPgIAAai0AAEcNkgEgAUEBRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQboBIRAMqgILIABBADYCACAQQQFqIQFBDyEQDI8BCwJAIAQgAkcNAEG7ASEQDKkCCwJAAkAgBC0AAEG3f2oOBwCSAZIBkgGSAZIBAZIBCyAEQQFqIQRBpQEhEAyQAgsgBEEBaiEEQaYBIRAMjwILAkAgBCACRw0AQbwBIRAMqAILIAIgBGsgACgCACIBaiEUIAQgAWtBB2ohEAJAA0AgBC0AACABQfTPgIAAai0AAEcNkAEgAUEHRg0BIAFBAWohASAEQQFqIgQgAkcNAAsgACAUNgIAQbwBIRAMqAILIABBADYCACAQQQFqIQFBGyEQDI0BCwJAIAQgAkcNAEG9ASEQDKcCCwJAAkACQCAELQAAQb5/ag4SAJEBkQGRAZEBkQGRAZEBkQGRAQGRAZEBkQGRAZEBkQECkQELIARBAWohBEGkASEQDI8CCyAEQQFqIQRBpwEhEAyOAgsgBEEBaiEEQagBIRAMjQILAkAgBCACRw0AQb4BIRAMpgILIAQtAABBzgBHDY0BIARBAWohBAzPAQsCQCAEIAJHDQBBvwEhEAylAgsCQAJAAkACQAJAAkACQAJAAkACQAJAAkACQAJAAkACQCAELQAAQb9/ag4VAAECA5wBBAUGnAGcAZwBBwgJCgucAQwNDg+cAQsgBEEBaiEBQegAIRAMmgILIARBAWohAUHpACEQDJkCCyAEQQFqIQFB7gAhEAyYAgsgBEEBaiEBQfIAIRAMlwILIARBAWohAUHzACEQDJYCCyAEQQFqIQFB9gAhEAyVAgsgBEEBaiEBQfcAIRAMlAILIARBAWohAUH6ACEQDJMCCyAEQQFqIQRBgwEhEAySAgsgBEEBaiEEQYQBIRAMkQILIARBAWohBEGFASEQDJACCyAEQQFqIQRBkgEhEAyPAgsgBEEBaiEEQZgBIRAMjgILIARBAWohBEGgASEQDI0CCyAEQQFqIQRBowEhEAyMAgsgBEEBaiEEQaoBIRAMiwILAkAgBCACRg0AIABBkICAgAA2AgggACAENgIEQasBIRAMiwILQcABIRAMowILIAAgBSACEKqAgIAAIgENiwEgBSEBDFwLAkAgBiACRg0AIAZBAWohBQyNAQtBwgEhEAyhAgsDQAJAIBAtAABBdmoOBIwBAACPAQALIBBBAWoiECACRw0AC0HDASEQDKACCwJAIAcgAkYNACAAQZGAgIAANgIIIAAgBzYCBCAHIQFBASEQDIcCC0HEASEQDJ8CCwJAIAcgAkcNAEHFASEQDJ8CCwJAAkAgBy0AAEF2ag4EAc4BzgEAzgELIAdBAWohBgyNAQsgB0EBaiEFDIkBCwJAIAcgAkcNAEHGASEQDJ4CCwJAAkAgBy0AAEF2ag4XAY8BjwEBjwGPAY8BjwGPAY8BjwGPAY8BjwGPAY8BjwGPAY8BjwGPAY8BAI8BCyAHQQFqIQcLQbABIRAMhAILAkAgCCACRw0AQcgBIRAMnQILIAgtAABBIEcNjQEgAEEAOwEyIAhBAWohAUGzASEQDIMCCyABIRcCQANAIBciByACRg0BIActAABBUGpB/wFxIhBBCk8NzAECQCAALwEyIhRBmTNLDQAgACAUQQpsIhQ7ATIgEEH//wNzIBRB/v8DcUkNACAHQQFqIRcgACAUIBBqIhA7ATIgEEH//wNxQegHSQ0BCwtBACEQIABBADYCHCAAQcGJgIAANgIQIABBDTYCDCAAIAdBAWo2AhQMnAILQccBIRAMmwILIAAgCCACEK6AgIAAIhBFDcoBIBBBFUcNjAEgAEHIATYCHCAAIAg2AhQgAEHJl4CAADYCECAAQRU2AgxBACEQDJoCCwJAIAkgAkcNAEHMASEQDJoCC0EAIRRBASEXQQEhFkEAIRACQAJAAkACQAJAAkACQAJAAkAgCS0AAEFQag4KlgGVAQABAgMEBQYIlwELQQIhEAwGC0EDIRAMBQtBBCEQDAQLQQUhEAwDC0EGIRAMAgtBByEQDAELQQghEAtBACEXQQAhFkEAIRQMjgELQQkhEEEBIRRBACEXQQAhFgyNAQsCQCAKIAJHDQBBzgEhEAyZAgsgCi0AAEEuRw2OASAKQQFqIQkMygELIAsgAkcNjgFB0AEhEAyXAgsCQCALIAJGDQAgAEGOgICAADYCCCAAIAs2AgRBtwEhEAz+AQtB0QEhEAyWAgsCQCAEIAJHDQBB0gEhEAyWAgsgAiAEayAAKAIAIhBqIRQgBCAQa0EEaiELA0AgBC0AACAQQfzPgIAAai0AAEcNjgEgEEEERg3pASAQQQFqIRAgBEEBaiIEIAJHDQALIAAgFDYCAEHSASEQDJUCCyAAIAwgAhCsgICAACIBDY0BIAwhAQy4AQsCQCAEIAJHDQBB1AEhEAyUAgsgAiAEayAAKAIAIhBqIRQgBCAQa0EBaiEMA0AgBC0AACAQQYHQgIAAai0AAEcNjwEgEEEBRg2OASAQQQFqIRAgBEEBaiIEIAJHDQALIAAgFDYCAEHUASEQDJMCCwJAIAQgAkcNAEHWASEQDJMCCyACIARrIAAoAgAiEGohFCAEIBBrQQJqIQsDQCAELQAAIBBBg9CAgABqLQAARw2OASAQQQJGDZABIBBBAWohECAEQQFqIgQgAkcNAAsgACAUNgIAQdYBIRAMkgILAkAgBCACRw0AQdcBIRAMkgILAkACQCAELQAAQbt/ag4QAI8BjwGPAY8BjwGPAY8BjwGPAY8BjwGPAY8BjwEBjwELIARBAWohBEG7ASEQDPkBCyAEQQFqIQRBvAEhEAz4AQsCQCAEIAJHDQBB2AEhEAyRAgsgBC0AAEHIAEcNjAEgBEEBaiEEDMQBCwJAIAQgAkYNACAAQZCAgIAANgIIIAAgBDYCBEG+ASEQDPcBC0HZASEQDI8CCwJAIAQgAkcNAEHaASEQDI8CCyAELQAAQcgARg3DASAAQQE6ACgMuQELIABBAjoALyAAIAQgAhCmgICAACIQDY0BQcIBIRAM9AELIAAtAChBf2oOArcBuQG4AQsDQAJAIAQtAABBdmoOBACOAY4BAI4BCyAEQQFqIgQgAkcNAAtB3QEhEAyLAgsgAEEAOgAvIAAtAC1BBHFFDYQCCyAAQQA6AC8gAEEBOgA0IAEhAQyMAQsgEEEVRg3aASAAQQA2AhwgACABNgIUIABBp46AgAA2AhAgAEESNgIMQQAhEAyIAgsCQCAAIBAgAhC0gICAACIEDQAgECEBDIECCwJAIARBFUcNACAAQQM2AhwgACAQNgIUIABBsJiAgAA2AhAgAEEVNgIMQQAhEAyIAgsgAEEANgIcIAAgEDYCFCAAQaeOgIAANgIQIABBEjYCDEEAIRAMhwILIBBBFUYN1gEgAEEANgIcIAAgATYCFCAAQdqNgIAANgIQIABBFDYCDEEAIRAMhgILIAAoAgQhFyAAQQA2AgQgECARp2oiFiEBIAAgFyAQIBYgFBsiEBC1gICAACIURQ2NASAAQQc2AhwgACAQNgIUIAAgFDYCDEEAIRAMhQILIAAgAC8BMEGAAXI7ATAgASEBC0EqIRAM6gELIBBBFUYN0QEgAEEANgIcIAAgATYCFCAAQYOMgIAANgIQIABBEzYCDEEAIRAMggILIBBBFUYNzwEgAEEANgIcIAAgATYCFCAAQZqPgIAANgIQIABBIjYCDEEAIRAMgQILIAAoAgQhECAAQQA2AgQCQCAAIBAgARC3gICAACIQDQAgAUEBaiEBDI0BCyAAQQw2AhwgACAQNgIMIAAgAUEBajYCFEEAIRAMgAILIBBBFUYNzAEgAEEANgIcIAAgATYCFCAAQZqPgIAANgIQIABBIjYCDEEAIRAM/wELIAAoAgQhECAAQQA2AgQCQCAAIBAgARC3gICAACIQDQAgAUEBaiEBDIwBCyAAQQ02AhwgACAQNgIMIAAgAUEBajYCFEEAIRAM/gELIBBBFUYNyQEgAEEANgIcIAAgATYCFCAAQcaMgIAANgIQIABBIzYCDEEAIRAM/QELIAAoAgQhECAAQQA2AgQCQCAAIBAgARC5gICAACIQDQAgAUEBaiEBDIsBCyAAQQ42AhwgACAQNgIMIAAgAUEBajYCFEEAIRAM/AELIABBADYCHCAAIAE2AhQgAEHAlYCAADYCECAAQQI2AgxBACEQDPsBCyAQQRVGDcUBIABBADYCHCAAIAE2AhQgAEHGjICAADYCECAAQSM2AgxBACEQDPoBCyAAQRA2AhwgACABNgIUIAAgEDYCDEEAIRAM+QELIAAoAgQhBCAAQQA2AgQCQCAAIAQgARC5gICAACIEDQAgAUEBaiEBDPEBCyAAQRE2AhwgACAENgIMIAAgAUEBajYCFEEAIRAM+AELIBBBFUYNwQEgAEEANgIcIAAgATYCFCAAQcaMgIAANgIQIABBIzYCDEEAIRAM9wELIAAoAgQhECAAQQA2AgQCQCAAIBAgARC5gICAACIQDQAgAUEBaiEBDIgBCyAAQRM2AhwgACAQNgIMIAAgAUEBajYCFEEAIRAM9gELIAAoAgQhBCAAQQA2AgQCQCAAIAQgARC5gICAACIEDQAgAUEBaiEBDO0BCyAAQRQ2AhwgACAENgIMIAAgAUEBajYCFEEAIRAM9QELIBBBFUYNvQEgAEEANgIcIAAgATYCFCAAQZqPgIAANgIQIABBIjYCDEEAIRAM9AELIAAoAgQhECAAQQA2AgQCQCAAIBAgARC3gICAACIQDQAgAUEBaiEBDIYBCyAAQRY2AhwgACAQNgIMIAAgAUEBajYCFEEAIRAM8wELIAAoAgQhBCAAQQA2AgQCQCAAIAQgARC3gICAACIEDQAgAUEBaiEBDOkBCyAAQRc2AhwgACAENgIMIAAgAUEBajYCFEEAIRAM8gELIABBADYCHCAAIAE2AhQgAEHNk4CAADYCECAAQQw2AgxBACEQDPEBC0IBIRELIBBBAWohAQJAIAApAyAiEkL//////////w9WDQAgACASQgSGIBGENwMgIAEhAQyEAQsgAEEANgIcIAAgATYCFCAAQa2JgIAANgIQIABBDDYCDEEAIRAM7wELIABBADYCHCAAIBA2AhQgAEHNk4CAADYCECAAQQw2AgxBACEQDO4BCyAAKAIEIRcgAEEANgIEIBAgEadqIhYhASAAIBcgECAWIBQbIhAQtYCAgAAiFEUNcyAAQQU2AhwgACAQNgIUIAAgFDYCDEEAIRAM7QELIABBADYCHCAAIBA2AhQgAEGqnICAADYCECAAQQ82AgxBACEQDOwBCyAAIBAgAhC0gICAACIBDQEgECEBC0EOIRAM0QELAkAgAUEVRw0AIABBAjYCHCAAIBA2AhQgAEGwmICAADYCECAAQRU2AgxBACEQDOoBCyAAQQA2AhwgACAQNgIUIABBp46AgAA2AhAgAEESNgIMQQAhEAzpAQsgAUEBaiEQAkAgAC8BMCIBQYABcUUNAAJAIAAgECACELuAgIAAIgENACAQIQEMcAsgAUEVRw26ASAAQQU2AhwgACAQNgIUIABB+ZeAgAA2AhAgAEEVNgIMQQAhEAzpAQsCQCABQaAEcUGgBEcNACAALQAtQQJxDQAgAEEANgIcIAAgEDYCFCAAQZaTgIAANgIQIABBBDYCDEEAIRAM6QELIAAgECACEL2AgIAAGiAQIQECQAJAAkACQAJAIAAgECACELOAgIAADhYCAQAEBAQEBAQEBAQEBAQEBAQEBAQDBAsgAEEBOgAuCyAAIAAvATBBwAByOwEwIBAhAQtBJiEQDNEBCyAAQSM2AhwgACAQNgIUIABBpZaAgAA2AhAgAEEVNgIMQQAhEAzpAQsgAEEANgIcIAAgEDYCFCAAQdWLgIAANgIQIABBETYCDEEAIRAM6AELIAAtAC1BAXFFDQFBwwEhEAzOAQsCQCANIAJGDQADQAJAIA0tAABBIEYNACANIQEMxAELIA1BAWoiDSACRw0AC0ElIRAM5wELQSUhEAzmAQsgACgCBCEEIABBADYCBCAAIAQgDRCvgICAACIERQ2tASAAQSY2AhwgACAENgIMIAAgDUEBajYCFEEAIRAM5QELIBBBFUYNqwEgAEEANgIcIAAgATYCFCAAQf2NgIAANgIQIABBHTYCDEEAIRAM5AELIABBJzYCHCAAIAE2AhQgACAQNgIMQQAhEAzjAQsgECEBQQEhFAJAAkACQAJAAkACQAJAIAAtACxBfmoOBwYFBQMBAgAFCyAAIAAvATBBCHI7ATAMAwtBAiEUDAELQQQhFAsgAEEBOgAsIAAgAC8BMCAUcjsBMAsgECEBC0ErIRAMygELIABBADYCHCAAIBA2AhQgAEGrkoCAADYCECAAQQs2AgxBACEQDOIBCyAAQQA2AhwgACABNgIUIABB4Y+AgAA2AhAgAEEKNgIMQQAhEAzhAQsgAEEAOgAsIBAhAQy9AQsgECEBQQEhFAJAAkACQAJAAkAgAC0ALEF7ag4EAwECAAULIAAgAC8BMEEIcjsBMAwDC0ECIRQMAQtBBCEUCyAAQQE6ACwgACAALwEwIBRyOwEwCyAQIQELQSkhEAzFAQsgAEEANgIcIAAgATYCFCAAQfCUgIAANgIQIABBAzYCDEEAIRAM3QELAkAgDi0AAEENRw0AIAAoAgQhASAAQQA2AgQCQCAAIAEgDhCxgICAACIBDQAgDkEBaiEBDHULIABBLDYCHCAAIAE2AgwgACAOQQFqNgIUQQAhEAzdAQsgAC0ALUEBcUUNAUHEASEQDMMBCwJAIA4gAkcNAEEtIRAM3AELAkACQANAAkAgDi0AAEF2ag4EAgAAAwALIA5BAWoiDiACRw0AC0EtIRAM3QELIAAoAgQhASAAQQA2AgQCQCAAIAEgDhCxgICAACIBDQAgDiEBDHQLIABBLDYCHCAAIA42AhQgACABNgIMQQAhEAzcAQsgACgCBCEBIABBADYCBAJAIAAgASAOELGAgIAAIgENACAOQQFqIQEMcwsgAEEsNgIcIAAgATYCDCAAIA5BAWo2AhRBACEQDNsBCyAAKAIEIQQgAEEANgIEIAAgBCAOELGAgIAAIgQNoAEgDiEBDM4BCyAQQSxHDQEgAUEBaiEQQQEhAQJAAkACQAJAAkAgAC0ALEF7ag4EAwECBAALIBAhAQwEC0ECIQEMAQtBBCEBCyAAQQE6ACwgACAALwEwIAFyOwEwIBAhAQwBCyAAIAAvATBBCHI7ATAgECEBC0E5IRAMvwELIABBADoALCABIQELQTQhEAy9AQsgACAALwEwQSByOwEwIAEhAQwCCyAAKAIEIQQgAEEANgIEAkAgACAEIAEQsYCAgAAiBA0AIAEhAQzHAQsgAEE3NgIcIAAgATYCFCAAIAQ2AgxBACEQDNQBCyAAQQg6ACwgASEBC0EwIRAMuQELAkAgAC0AKEEBRg0AIAEhAQwECyAALQAtQQhxRQ2TASABIQEMAwsgAC0AMEEgcQ2UAUHFASEQDLcBCwJAIA8gAkYNAAJAA0ACQCAPLQAAQVBqIgFB/wFxQQpJDQAgDyEBQTUhEAy6AQsgACkDICIRQpmz5syZs+bMGVYNASAAIBFCCn4iETcDICARIAGtQv8BgyISQn+FVg0BIAAgESASfDcDICAPQQFqIg8gAkcNAAtBOSEQDNEBCyAAKAIEIQIgAEEANgIEIAAgAiAPQQFqIgQQsYCAgAAiAg2VASAEIQEMwwELQTkhEAzPAQsCQCAALwEwIgFBCHFFDQAgAC0AKEEBRw0AIAAtAC1BCHFFDZABCyAAIAFB9/sDcUGABHI7ATAgDyEBC0E3IRAMtAELIAAgAC8BMEEQcjsBMAyrAQsgEEEVRg2LASAAQQA2AhwgACABNgIUIABB8I6AgAA2AhAgAEEcNgIMQQAhEAzLAQsgAEHDADYCHCAAIAE2AgwgACANQQFqNgIUQQAhEAzKAQsCQCABLQAAQTpHDQAgACgCBCEQIABBADYCBAJAIAAgECABEK+AgIAAIhANACABQQFqIQEMYwsgAEHDADYCHCAAIBA2AgwgACABQQFqNgIUQQAhEAzKAQsgAEEANgIcIAAgATYCFCAAQbGRgIAANgIQIABBCjYCDEEAIRAMyQELIABBADYCHCAAIAE2AhQgAEGgmYCAADYCECAAQR42AgxBACEQDMgBCyAAQQA2AgALIABBgBI7ASogACAXQQFqIgEgAhCogICAACIQDQEgASEBC0HHACEQDKwBCyAQQRVHDYMBIABB0QA2AhwgACABNgIUIABB45eAgAA2AhAgAEEVNgIMQQAhEAzEAQsgACgCBCEQIABBADYCBAJAIAAgECABEKeAgIAAIhANACABIQEMXgsgAEHSADYCHCAAIAE2AhQgACAQNgIMQQAhEAzDAQsgAEEANgIcIAAgFDYCFCAAQcGogIAANgIQIABBBzYCDCAAQQA2AgBBACEQDMIBCyAAKAIEIRAgAEEANgIEAkAgACAQIAEQp4CAgAAiEA0AIAEhAQxdCyAAQdMANgIcIAAgATYCFCAAIBA2AgxBACEQDMEBC0EAIRAgAEEANgIcIAAgATYCFCAAQYCRgIAANgIQIABBCTYCDAzAAQsgEEEVRg19IABBADYCHCAAIAE2AhQgAEGUjYCAADYCECAAQSE2AgxBACEQDL8BC0EBIRZBACEXQQAhFEEBIRALIAAgEDoAKyABQQFqIQECQAJAIAAtAC1BEHENAAJAAkACQCAALQAqDgMBAAIECyAWRQ0DDAILIBQNAQwCCyAXRQ0BCyAAKAIEIRAgAEEANgIEAkAgACAQIAEQrYCAgAAiEA0AIAEhAQxcCyAAQdgANgIcIAAgATYCFCAAIBA2AgxBACEQDL4BCyAAKAIEIQQgAEEANgIEAkAgACAEIAEQrYCAgAAiBA0AIAEhAQytAQsgAEHZADYCHCAAIAE2AhQgACAENgIMQQAhEAy9AQsgACgCBCEEIABBADYCBAJAIAAgBCABEK2AgIAAIgQNACABIQEMqwELIABB2gA2AhwgACABNgIUIAAgBDYCDEEAIRAMvAELIAAoAgQhBCAAQQA2AgQCQCAAIAQgARCtgICAACIEDQAgASEBDKkBCyAAQdwANgIcIAAgATYCFCAAIAQ2AgxBACEQDLsBCwJAIAEtAABBUGoiEEH/AXFBCk8NACAAIBA6ACogAUEBaiEBQc8AIRAMogELIAAoAgQhBCAAQQA2AgQCQCAAIAQgARCtgICAACIEDQAgASEBDKcBCyAAQd4ANgIcIAAgATYCFCAAIAQ2AgxBACEQDLoBCyAAQQA2AgAgF0EBaiEBAkAgAC0AKUEjTw0AIAEhAQxZCyAAQQA2AhwgACABNgIUIABB04mAgAA2AhAgAEEINgIMQQAhEAy5AQsgAEEANgIAC0EAIRAgAEEANgIcIAAgATYCFCAAQZCzgIAANgIQIABBCDYCDAy3AQsgAEEANgIAIBdBAWohAQJAIAAtAClBIUcNACABIQEMVgsgAEEANgIcIAAgATYCFCAAQZuKgIAANgIQIABBCDYCDEEAIRAMtgELIABBADYCACAXQQFqIQECQCAALQApIhBBXWpBC08NACABIQEMVQsCQCAQQQZLDQBBASAQdEHKAHFFDQAgASEBDFULQQAhECAAQQA2AhwgACABNgIUIABB94mAgAA2AhAgAEEINgIMDLUBCyAQQRVGDXEgAEEANgIcIAAgATYCFCAAQbmNgIAANgIQIABBGjYCDEEAIRAMtAELIAAoAgQhECAAQQA2AgQCQCAAIBAgARCngICAACIQDQAgASEBDFQLIABB5QA2AhwgACABNgIUIAAgEDYCDEEAIRAMswELIAAoAgQhECAAQQA2AgQCQCAAIBAgARCngICAACIQDQAgASEBDE0LIABB0gA2AhwgACABNgIUIAAgEDYCDEEAIRAMsgELIAAoAgQhECAAQQA2AgQCQCAAIBAgARCngICAACIQDQAgASEBDE0LIABB0wA2AhwgACABNgIUIAAgEDYCDEEAIRAMsQELIAAoAgQhECAAQQA2AgQCQCAAIBAgARCngICAACIQDQAgASEBDFELIABB5QA2AhwgACABNgIUIAAgEDYCDEEAIRAMsAELIABBADYCHCAAIAE2AhQgAEHGioCAADYCECAAQQc2AgxBACEQDK8BCyAAKAIEIRAgAEEANgIEAkAgACAQIAEQp4CAgAAiEA0AIAEhAQxJCyAAQdIANgIcIAAgATYCFCAAIBA2AgxBACEQDK4BCyAAKAIEIRAgAEEANgIEAkAgACAQIAEQp4CAgAAiEA0AIAEhAQxJCyAAQdMANgIcIAAgATYCFCAAIBA2AgxBACEQDK0BCyAAKAIEIRAgAEEANgIEAkAgACAQIAEQp4CAgAAiEA0AIAEhAQxNCyAAQeUANgIcIAAgATYCFCAAIBA2AgxBACEQDKwBCyAAQQA2AhwgACABNgIUIABB3IiAgAA2AhAgAEEHNgIMQQAhEAyrAQsgEEE/Rw0BIAFBAWohAQtBBSEQDJABC0EAIRAgAEEANgIcIAAgATYCFCAAQf2SgIAANgIQIABBBzYCDAyoAQsgACgCBCEQIABBADYCBAJAIAAgECABEKeAgIAAIhANACABIQEMQgsgAEHSADYCHCAAIAE2AhQgACAQNgIMQQAhEAynAQsgACgCBCEQIABBADYCBAJAIAAgECABEKeAgIAAIhANACABIQEMQgsgAEHTADYCHCAAIAE2AhQgACAQNgIMQQAhEAymAQsgACgCBCEQIABBADYCBAJAIAAgECABEKeAgIAAIhANACABIQEMRgsgAEHlADYCHCAAIAE2AhQgACAQNgIMQQAhEAylAQsgACgCBCEBIABBADYCBAJAIAAgASAUEKeAgIAAIgENACAUIQEMPwsgAEHSADYCHCAAIBQ2AhQgACABNgIMQQAhEAykAQsgACgCBCEBIABBADYCBAJAIAAgASAUEKeAgIAAIgENACAUIQEMPwsgAEHTADYCHCAAIBQ2AhQgACABNgIMQQAhEAyjAQsgACgCBCEBIABBADYCBAJAIAAgASAUEKeAgIAAIgENACAUIQEMQwsgAEHlADYCHCAAIBQ2AhQgACABNgIMQQAhEAyiAQsgAEEANgIcIAAgFDYCFCAAQcOPgIAANgIQIABBBzYCDEEAIRAMoQELIABBADYCHCAAIAE2AhQgAEHDj4CAADYCECAAQQc2AgxBACEQDKABC0EAIRAgAEEANgIcIAAgFDYCFCAAQYycgIAANgIQIABBBzYCDAyfAQsgAEEANgIcIAAgFDYCFCAAQYycgIAANgIQIABBBzYCDEEAIRAMngELIABBADYCHCAAIBQ2AhQgAEH+kYCAADYCECAAQQc2AgxBACEQDJ0BCyAAQQA2AhwgACABNgIUIABBjpuAgAA2AhAgAEEGNgIMQQAhEAycAQsgEEEVRg1XIABBADYCHCAAIAE2AhQgAEHMjoCAADYCECAAQSA2AgxBACEQDJsBCyAAQQA2AgAgEEEBaiEBQSQhEAsgACAQOgApIAAoAgQhECAAQQA2AgQgACAQIAEQq4CAgAAiEA1UIAEhAQw+CyAAQQA2AgALQQAhECAAQQA2AhwgACAENgIUIABB8ZuAgAA2AhAgAEEGNgIMDJcBCyABQRVGDVAgAEEANgIcIAAgBTYCFCAAQfCMgIAANgIQIABBGzYCDEEAIRAMlgELIAAoAgQhBSAAQQA2AgQgACAFIBAQqYCAgAAiBQ0BIBBBAWohBQtBrQEhEAx7CyAAQcEBNgIcIAAgBTYCDCAAIBBBAWo2AhRBACEQDJMBCyAAKAIEIQYgAEEANgIEIAAgBiAQEKmAgIAAIgYNASAQQQFqIQYLQa4BIRAMeAsgAEHCATYCHCAAIAY2AgwgACAQQQFqNgIUQQAhEAyQAQsgAEEANgIcIAAgBzYCFCAAQZeLgIAANgIQIABBDTYCDEEAIRAMjwELIABBADYCHCAAIAg2AhQgAEHjkICAADYCECAAQQk2AgxBACEQDI4BCyAAQQA2AhwgACAINgIUIABBlI2AgAA2AhAgAEEhNgIMQQAhEAyNAQtBASEWQQAhF0EAIRRBASEQCyAAIBA6ACsgCUEBaiEIAkACQCAALQAtQRBxDQACQAJAAkAgAC0AKg4DAQACBAsgFkUNAwwCCyAUDQEMAgsgF0UNAQsgACgCBCEQIABBADYCBCAAIBAgCBCtgICAACIQRQ09IABByQE2AhwgACAINgIUIAAgEDYCDEEAIRAMjAELIAAoAgQhBCAAQQA2AgQgACAEIAgQrYCAgAAiBEUNdiAAQcoBNgIcIAAgCDYCFCAAIAQ2AgxBACEQDIsBCyAAKAIEIQQgAEEANgIEIAAgBCAJEK2AgIAAIgRFDXQgAEHLATYCHCAAIAk2AhQgACAENgIMQQAhEAyKAQsgACgCBCEEIABBADYCBCAAIAQgChCtgICAACIERQ1yIABBzQE2AhwgACAKNgIUIAAgBDYCDEEAIRAMiQELAkAgCy0AAEFQaiIQQf8BcUEKTw0AIAAgEDoAKiALQQFqIQpBtgEhEAxwCyAAKAIEIQQgAEEANgIEIAAgBCALEK2AgIAAIgRFDXAgAEHPATYCHCAAIAs2AhQgACAENgIMQQAhEAyIAQsgAEEANgIcIAAgBDYCFCAAQZCzgIAANgIQIABBCDYCDCAAQQA2AgBBACEQDIcBCyABQRVGDT8gAEEANgIcIAAgDDYCFCAAQcyOgIAANgIQIABBIDYCDEEAIRAMhgELIABBgQQ7ASggACgCBCEQIABCADcDACAAIBAgDEEBaiIMEKuAgIAAIhBFDTggAEHTATYCHCAAIAw2AhQgACAQNgIMQQAhEAyFAQsgAEEANgIAC0EAIRAgAEEANgIcIAAgBDYCFCAAQdibgIAANgIQIABBCDYCDAyDAQsgACgCBCEQIABCADcDACAAIBAgC0EBaiILEKuAgIAAIhANAUHGASEQDGkLIABBAjoAKAxVCyAAQdUBNgIcIAAgCzYCFCAAIBA2AgxBACEQDIABCyAQQRVGDTcgAEEANgIcIAAgBDYCFCAAQaSMgIAANgIQIABBEDYCDEEAIRAMfwsgAC0ANEEBRw00IAAgBCACELyAgIAAIhBFDTQgEEEVRw01IABB3AE2AhwgACAENgIUIABB1ZaAgAA2AhAgAEEVNgIMQQAhEAx+C0EAIRAgAEEANgIcIABBr4uAgAA2AhAgAEECNgIMIAAgFEEBajYCFAx9C0EAIRAMYwtBAiEQDGILQQ0hEAxhC0EPIRAMYAtBJSEQDF8LQRMhEAxeC0EVIRAMXQtBFiEQDFwLQRchEAxbC0EYIRAMWgtBGSEQDFkLQRohEAxYC0EbIRAMVwtBHCEQDFYLQR0hEAxVC0EfIRAMVAtBISEQDFMLQSMhEAxSC0HGACEQDFELQS4hEAxQC0EvIRAMTwtBOyEQDE4LQT0hEAxNC0HIACEQDEwLQckAIRAMSwtBywAhEAxKC0HMACEQDEkLQc4AIRAMSAtB0QAhEAxHC0HVACEQDEYLQdgAIRAMRQtB2QAhEAxEC0HbACEQDEMLQeQAIRAMQgtB5QAhEAxBC0HxACEQDEALQfQAIRAMPwtBjQEhEAw+C0GXASEQDD0LQakBIRAMPAtBrAEhEAw7C0HAASEQDDoLQbkBIRAMOQtBrwEhEAw4C0GxASEQDDcLQbIBIRAMNgtBtAEhEAw1C0G1ASEQDDQLQboBIRAMMwtBvQEhEAwyC0G/ASEQDDELQcEBIRAMMAsgAEEANgIcIAAgBDYCFCAAQemLgIAANgIQIABBHzYCDEEAIRAMSAsgAEHbATYCHCAAIAQ2AhQgAEH6loCAADYCECAAQRU2AgxBACEQDEcLIABB+AA2AhwgACAMNgIUIABBypiAgAA2AhAgAEEVNgIMQQAhEAxGCyAAQdEANgIcIAAgBTYCFCAAQbCXgIAANgIQIABBFTYCDEEAIRAMRQsgAEH5ADYCHCAAIAE2AhQgACAQNgIMQQAhEAxECyAAQfgANgIcIAAgATYCFCAAQcqYgIAANgIQIABBFTYCDEEAIRAMQwsgAEHkADYCHCAAIAE2AhQgAEHjl4CAADYCECAAQRU2AgxBACEQDEILIABB1wA2AhwgACABNgIUIABByZeAgAA2AhAgAEEVNgIMQQAhEAxBCyAAQQA2AhwgACABNgIUIABBuY2AgAA2AhAgAEEaNgIMQQAhEAxACyAAQcIANgIcIAAgATYCFCAAQeOYgIAANgIQIABBFTYCDEEAIRAMPwsgAEEANgIEIAAgDyAPELGAgIAAIgRFDQEgAEE6NgIcIAAgBDYCDCAAIA9BAWo2AhRBACEQDD4LIAAoAgQhBCAAQQA2AgQCQCAAIAQgARCxgICAACIERQ0AIABBOzYCHCAAIAQ2AgwgACABQQFqNgIUQQAhEAw+CyABQQFqIQEMLQsgD0EBaiEBDC0LIABBADYCHCAAIA82AhQgAEHkkoCAADYCECAAQQQ2AgxBACEQDDsLIABBNjYCHCAAIAQ2AhQgACACNgIMQQAhEAw6CyAAQS42AhwgACAONgIUIAAgBDYCDEEAIRAMOQsgAEHQADYCHCAAIAE2AhQgAEGRmICAADYCECAAQRU2AgxBACEQDDgLIA1BAWohAQwsCyAAQRU2AhwgACABNgIUIABBgpmAgAA2AhAgAEEVNgIMQQAhEAw2CyAAQRs2AhwgACABNgIUIABBkZeAgAA2AhAgAEEVNgIMQQAhEAw1CyAAQQ82AhwgACABNgIUIABBkZeAgAA2AhAgAEEVNgIMQQAhEAw0CyAAQQs2AhwgACABNgIUIABBkZeAgAA2AhAgAEEVNgIMQQAhEAwzCyAAQRo2AhwgACABNgIUIABBgpmAgAA2AhAgAEEVNgIMQQAhEAwyCyAAQQs2AhwgACABNgIUIABBgpmAgAA2AhAgAEEVNgIMQQAhEAwxCyAAQQo2AhwgACABNgIUIABB5JaAgAA2AhAgAEEVNgIMQQAhEAwwCyAAQR42AhwgACABNgIUIABB+ZeAgAA2AhAgAEEVNgIMQQAhEAwvCyAAQQA2AhwgACAQNgIUIABB2o2AgAA2AhAgAEEUNgIMQQAhEAwuCyAAQQQ2AhwgACABNgIUIABBsJiAgAA2AhAgAEEVNgIMQQAhEAwtCyAAQQA2AgAgC0EBaiELC0G4ASEQDBILIABBADYCACAQQQFqIQFB9QAhEAwRCyABIQECQCAALQApQQVHDQBB4wAhEAwRC0HiACEQDBALQQAhECAAQQA2AhwgAEHkkYCAADYCECAAQQc2AgwgACAUQQFqNgIUDCgLIABBADYCACAXQQFqIQFBwAAhEAwOC0EBIQELIAAgAToALCAAQQA2AgAgF0EBaiEBC0EoIRAMCwsgASEBC0E4IRAMCQsCQCABIg8gAkYNAANAAkAgDy0AAEGAvoCAAGotAAAiAUEBRg0AIAFBAkcNAyAPQQFqIQEMBAsgD0EBaiIPIAJHDQALQT4hEAwiC0E+IRAMIQsgAEEAOgAsIA8hAQwBC0ELIRAMBgtBOiEQDAULIAFBAWohAUEtIRAMBAsgACABOgAsIABBADYCACAWQQFqIQFBDCEQDAMLIABBADYCACAXQQFqIQFBCiEQDAILIABBADYCAAsgAEEAOgAsIA0hAUEJIRAMAAsLQQAhECAAQQA2AhwgACALNgIUIABBzZCAgAA2AhAgAEEJNgIMDBcLQQAhECAAQQA2AhwgACAKNgIUIABB6YqAgAA2AhAgAEEJNgIMDBYLQQAhECAAQQA2AhwgACAJNgIUIABBt5CAgAA2AhAgAEEJNgIMDBULQQAhECAAQQA2AhwgACAINgIUIABBnJGAgAA2AhAgAEEJNgIMDBQLQQAhECAAQQA2AhwgACABNgIUIABBzZCAgAA2AhAgAEEJNgIMDBMLQQAhECAAQQA2AhwgACABNgIUIABB6YqAgAA2AhAgAEEJNgIMDBILQQAhECAAQQA2AhwgACABNgIUIABBt5CAgAA2AhAgAEEJNgIMDBELQQAhECAAQQA2AhwgACABNgIUIABBnJGAgAA2AhAgAEEJNgIMDBALQQAhECAAQQA2AhwgACABNgIUIABBl5WAgAA2AhAgAEEPNgIMDA8LQQAhECAAQQA2AhwgACABNgIUIABBl5WAgAA2AhAgAEEPNgIMDA4LQQAhECAAQQA2AhwgACABNgIUIABBwJKAgAA2AhAgAEELNgIMDA0LQQAhECAAQQA2AhwgACABNgIUIABBlYmAgAA2AhAgAEELNgIMDAwLQQAhECAAQQA2AhwgACABNgIUIABB4Y+AgAA2AhAgAEEKNgIMDAsLQQAhECAAQQA2AhwgACABNgIUIABB+4+AgAA2AhAgAEEKNgIMDAoLQQAhECAAQQA2AhwgACABNgIUIABB8ZmAgAA2AhAgAEECNgIMDAkLQQAhECAAQQA2AhwgACABNgIUIABBxJSAgAA2AhAgAEECNgIMDAgLQQAhECAAQQA2AhwgACABNgIUIABB8pWAgAA2AhAgAEECNgIMDAcLIABBAjYCHCAAIAE2AhQgAEGcmoCAADYCECAAQRY2AgxBACEQDAYLQQEhEAwFC0HUACEQIAEiBCACRg0EIANBCGogACAEIAJB2MKAgABBChDFgICAACADKAIMIQQgAygCCA4DAQQCAAsQyoCAgAAACyAAQQA2AhwgAEG1moCAADYCECAAQRc2AgwgACAEQQFqNgIUQQAhEAwCCyAAQQA2AhwgACAENgIUIABBypqAgAA2AhAgAEEJNgIMQQAhEAwBCwJAIAEiBCACRw0AQSIhEAwBCyAAQYmAgIAANgIIIAAgBDYCBEEhIRALIANBEGokgICAgAAgEAuvAQECfyABKAIAIQYCQAJAIAIgA0YNACAEIAZqIQQgBiADaiACayEHIAIgBkF/cyAFaiIGaiEFA0ACQCACLQAAIAQtAABGDQBBAiEEDAMLAkAgBg0AQQAhBCAFIQIMAwsgBkF/aiEGIARBAWohBCACQQFqIgIgA0cNAAsgByEGIAMhAgsgAEEBNgIAIAEgBjYCACAAIAI2AgQPCyABQQA2AgAgACAENgIAIAAgAjYCBAsKACAAEMeAgIAAC/I2AQt/I4CAgIAAQRBrIgEkgICAgAACQEEAKAKg0ICAAA0AQQAQy4CAgABBgNSEgABrIgJB2QBJDQBBACEDAkBBACgC4NOAgAAiBA0AQQBCfzcC7NOAgABBAEKAgISAgIDAADcC5NOAgABBACABQQhqQXBxQdiq1aoFcyIENgLg04CAAEEAQQA2AvTTgIAAQQBBADYCxNOAgAALQQAgAjYCzNOAgABBAEGA1ISAADYCyNOAgABBAEGA1ISAADYCmNCAgABBACAENgKs0ICAAEEAQX82AqjQgIAAA0AgA0HE0ICAAGogA0G40ICAAGoiBDYCACAEIANBsNCAgABqIgU2AgAgA0G80ICAAGogBTYCACADQczQgIAAaiADQcDQgIAAaiIFNgIAIAUgBDYCACADQdTQgIAAaiADQcjQgIAAaiIENgIAIAQgBTYCACADQdDQgIAAaiAENgIAIANBIGoiA0GAAkcNAAtBgNSEgABBeEGA1ISAAGtBD3FBAEGA1ISAAEEIakEPcRsiA2oiBEEEaiACQUhqIgUgA2siA0EBcjYCAEEAQQAoAvDTgIAANgKk0ICAAEEAIAM2ApTQgIAAQQAgBDYCoNCAgABBgNSEgAAgBWpBODYCBAsCQAJAAkACQAJAAkACQAJAAkACQAJAAkAgAEHsAUsNAAJAQQAoAojQgIAAIgZBECAAQRNqQXBxIABBC0kbIgJBA3YiBHYiA0EDcUUNAAJAAkAgA0EBcSAEckEBcyIFQQN0IgRBsNCAgABqIgMgBEG40ICAAGooAgAiBCgCCCICRw0AQQAgBkF+IAV3cTYCiNCAgAAMAQsgAyACNgIIIAIgAzYCDAsgBEEIaiEDIAQgBUEDdCIFQQNyNgIEIAQgBWoiBCAEKAIEQQFyNgIEDAwLIAJBACgCkNCAgAAiB00NAQJAIANFDQACQAJAIAMgBHRBAiAEdCIDQQAgA2tycSIDQQAgA2txQX9qIgMgA0EMdkEQcSIDdiIEQQV2QQhxIgUgA3IgBCAFdiIDQQJ2QQRxIgRyIAMgBHYiA0EBdkECcSIEciADIAR2IgNBAXZBAXEiBHIgAyAEdmoiBEEDdCIDQbDQgIAAaiIFIANBuNCAgABqKAIAIgMoAggiAEcNAEEAIAZBfiAEd3EiBjYCiNCAgAAMAQsgBSAANgIIIAAgBTYCDAsgAyACQQNyNgIEIAMgBEEDdCIEaiAEIAJrIgU2AgAgAyACaiIAIAVBAXI2AgQCQCAHRQ0AIAdBeHFBsNCAgABqIQJBACgCnNCAgAAhBAJAAkAgBkEBIAdBA3Z0IghxDQBBACAGIAhyNgKI0ICAACACIQgMAQsgAigCCCEICyAIIAQ2AgwgAiAENgIIIAQgAjYCDCAEIAg2AggLIANBCGohA0EAIAA2ApzQgIAAQQAgBTYCkNCAgAAMDAtBACgCjNCAgAAiCUUNASAJQQAgCWtxQX9qIgMgA0EMdkEQcSIDdiIEQQV2QQhxIgUgA3IgBCAFdiIDQQJ2QQRxIgRyIAMgBHYiA0EBdkECcSIEciADIAR2IgNBAXZBAXEiBHIgAyAEdmpBAnRBuNKAgABqKAIAIgAoAgRBeHEgAmshBCAAIQUCQANAAkAgBSgCECIDDQAgBUEUaigCACIDRQ0CCyADKAIEQXhxIAJrIgUgBCAFIARJIgUbIQQgAyAAIAUbIQAgAyEFDAALCyAAKAIYIQoCQCAAKAIMIgggAEYNACAAKAIIIgNBACgCmNCAgABJGiAIIAM2AgggAyAINgIMDAsLAkAgAEEUaiIFKAIAIgMNACAAKAIQIgNFDQMgAEEQaiEFCwNAIAUhCyADIghBFGoiBSgCACIDDQAgCEEQaiEFIAgoAhAiAw0ACyALQQA2AgAMCgtBfyECIABBv39LDQAgAEETaiIDQXBxIQJBACgCjNCAgAAiB0UNAEEAIQsCQCACQYACSQ0AQR8hCyACQf///wdLDQAgA0EIdiIDIANBgP4/akEQdkEIcSIDdCIEIARBgOAfakEQdkEEcSIEdCIFIAVBgIAPakEQdkECcSIFdEEPdiADIARyIAVyayIDQQF0IAIgA0EVanZBAXFyQRxqIQsLQQAgAmshBAJAAkACQAJAIAtBAnRBuNKAgABqKAIAIgUNAEEAIQNBACEIDAELQQAhAyACQQBBGSALQQF2ayALQR9GG3QhAEEAIQgDQAJAIAUoAgRBeHEgAmsiBiAETw0AIAYhBCAFIQggBg0AQQAhBCAFIQggBSEDDAMLIAMgBUEUaigCACIGIAYgBSAAQR12QQRxakEQaigCACIFRhsgAyAGGyEDIABBAXQhACAFDQALCwJAIAMgCHINAEEAIQhBAiALdCIDQQAgA2tyIAdxIgNFDQMgA0EAIANrcUF/aiIDIANBDHZBEHEiA3YiBUEFdkEIcSIAIANyIAUgAHYiA0ECdkEEcSIFciADIAV2IgNBAXZBAnEiBXIgAyAFdiIDQQF2QQFxIgVyIAMgBXZqQQJ0QbjSgIAAaigCACEDCyADRQ0BCwNAIAMoAgRBeHEgAmsiBiAESSEAAkAgAygCECIFDQAgA0EUaigCACEFCyAGIAQgABshBCADIAggABshCCAFIQMgBQ0ACwsgCEUNACAEQQAoApDQgIAAIAJrTw0AIAgoAhghCwJAIAgoAgwiACAIRg0AIAgoAggiA0EAKAKY0ICAAEkaIAAgAzYCCCADIAA2AgwMCQsCQCAIQRRqIgUoAgAiAw0AIAgoAhAiA0UNAyAIQRBqIQULA0AgBSEGIAMiAEEUaiIFKAIAIgMNACAAQRBqIQUgACgCECIDDQALIAZBADYCAAwICwJAQQAoApDQgIAAIgMgAkkNAEEAKAKc0ICAACEEAkACQCADIAJrIgVBEEkNACAEIAJqIgAgBUEBcjYCBEEAIAU2ApDQgIAAQQAgADYCnNCAgAAgBCADaiAFNgIAIAQgAkEDcjYCBAwBCyAEIANBA3I2AgQgBCADaiIDIAMoAgRBAXI2AgRBAEEANgKc0ICAAEEAQQA2ApDQgIAACyAEQQhqIQMMCgsCQEEAKAKU0ICAACIAIAJNDQBBACgCoNCAgAAiAyACaiIEIAAgAmsiBUEBcjYCBEEAIAU2ApTQgIAAQQAgBDYCoNCAgAAgAyACQQNyNgIEIANBCGohAwwKCwJAAkBBACgC4NOAgABFDQBBACgC6NOAgAAhBAwBC0EAQn83AuzTgIAAQQBCgICEgICAwAA3AuTTgIAAQQAgAUEMakFwcUHYqtWqBXM2AuDTgIAAQQBBADYC9NOAgABBAEEANgLE04CAAEGAgAQhBAtBACEDAkAgBCACQccAaiIHaiIGQQAgBGsiC3EiCCACSw0AQQBBMDYC+NOAgAAMCgsCQEEAKALA04CAACIDRQ0AAkBBACgCuNOAgAAiBCAIaiIFIARNDQAgBSADTQ0BC0EAIQNBAEEwNgL404CAAAwKC0EALQDE04CAAEEEcQ0EAkACQAJAQQAoAqDQgIAAIgRFDQBByNOAgAAhAwNAAkAgAygCACIFIARLDQAgBSADKAIEaiAESw0DCyADKAIIIgMNAAsLQQAQy4CAgAAiAEF/Rg0FIAghBgJAQQAoAuTTgIAAIgNBf2oiBCAAcUUNACAIIABrIAQgAGpBACADa3FqIQYLIAYgAk0NBSAGQf7///8HSw0FAkBBACgCwNOAgAAiA0UNAEEAKAK404CAACIEIAZqIgUgBE0NBiAFIANLDQYLIAYQy4CAgAAiAyAARw0BDAcLIAYgAGsgC3EiBkH+////B0sNBCAGEMuAgIAAIgAgAygCACADKAIEakYNAyAAIQMLAkAgA0F/Rg0AIAJByABqIAZNDQACQCAHIAZrQQAoAujTgIAAIgRqQQAgBGtxIgRB/v///wdNDQAgAyEADAcLAkAgBBDLgICAAEF/Rg0AIAQgBmohBiADIQAMBwtBACAGaxDLgICAABoMBAsgAyEAIANBf0cNBQwDC0EAIQgMBwtBACEADAULIABBf0cNAgtBAEEAKALE04CAAEEEcjYCxNOAgAALIAhB/v///wdLDQEgCBDLgICAACEAQQAQy4CAgAAhAyAAQX9GDQEgA0F/Rg0BIAAgA08NASADIABrIgYgAkE4ak0NAQtBAEEAKAK404CAACAGaiIDNgK404CAAAJAIANBACgCvNOAgABNDQBBACADNgK804CAAAsCQAJAAkACQEEAKAKg0ICAACIERQ0AQcjTgIAAIQMDQCAAIAMoAgAiBSADKAIEIghqRg0CIAMoAggiAw0ADAMLCwJAAkBBACgCmNCAgAAiA0UNACAAIANPDQELQQAgADYCmNCAgAALQQAhA0EAIAY2AszTgIAAQQAgADYCyNOAgABBAEF/NgKo0ICAAEEAQQAoAuDTgIAANgKs0ICAAEEAQQA2AtTTgIAAA0AgA0HE0ICAAGogA0G40ICAAGoiBDYCACAEIANBsNCAgABqIgU2AgAgA0G80ICAAGogBTYCACADQczQgIAAaiADQcDQgIAAaiIFNgIAIAUgBDYCACADQdTQgIAAaiADQcjQgIAAaiIENgIAIAQgBTYCACADQdDQgIAAaiAENgIAIANBIGoiA0GAAkcNAAsgAEF4IABrQQ9xQQAgAEEIakEPcRsiA2oiBCAGQUhqIgUgA2siA0EBcjYCBEEAQQAoAvDTgIAANgKk0ICAAEEAIAM2ApTQgIAAQQAgBDYCoNCAgAAgACAFakE4NgIEDAILIAMtAAxBCHENACAEIAVJDQAgBCAATw0AIARBeCAEa0EPcUEAIARBCGpBD3EbIgVqIgBBACgClNCAgAAgBmoiCyAFayIFQQFyNgIEIAMgCCAGajYCBEEAQQAoAvDTgIAANgKk0ICAAEEAIAU2ApTQgIAAQQAgADYCoNCAgAAgBCALakE4NgIEDAELAkAgAEEAKAKY0ICAACIITw0AQQAgADYCmNCAgAAgACEICyAAIAZqIQVByNOAgAAhAwJAAkACQAJAAkACQAJAA0AgAygCACAFRg0BIAMoAggiAw0ADAILCyADLQAMQQhxRQ0BC0HI04CAACEDA0ACQCADKAIAIgUgBEsNACAFIAMoAgRqIgUgBEsNAwsgAygCCCEDDAALCyADIAA2AgAgAyADKAIEIAZqNgIEIABBeCAAa0EPcUEAIABBCGpBD3EbaiILIAJBA3I2AgQgBUF4IAVrQQ9xQQAgBUEIakEPcRtqIgYgCyACaiICayEDAkAgBiAERw0AQQAgAjYCoNCAgABBAEEAKAKU0ICAACADaiIDNgKU0ICAACACIANBAXI2AgQMAwsCQCAGQQAoApzQgIAARw0AQQAgAjYCnNCAgABBAEEAKAKQ0ICAACADaiIDNgKQ0ICAACACIANBAXI2AgQgAiADaiADNgIADAMLAkAgBigCBCIEQQNxQQFHDQAgBEF4cSEHAkACQCAEQf8BSw0AIAYoAggiBSAEQQN2IghBA3RBsNCAgABqIgBGGgJAIAYoAgwiBCAFRw0AQQBBACgCiNCAgABBfiAId3E2AojQgIAADAILIAQgAEYaIAQgBTYCCCAFIAQ2AgwMAQsgBigCGCEJAkACQCAGKAIMIgAgBkYNACAGKAIIIgQgCEkaIAAgBDYCCCAEIAA2AgwMAQsCQCAGQRRqIgQoAgAiBQ0AIAZBEGoiBCgCACIFDQBBACEADAELA0AgBCEIIAUiAEEUaiIEKAIAIgUNACAAQRBqIQQgACgCECIFDQALIAhBADYCAAsgCUUNAAJAAkAgBiAGKAIcIgVBAnRBuNKAgABqIgQoAgBHDQAgBCAANgIAIAANAUEAQQAoAozQgIAAQX4gBXdxNgKM0ICAAAwCCyAJQRBBFCAJKAIQIAZGG2ogADYCACAARQ0BCyAAIAk2AhgCQCAGKAIQIgRFDQAgACAENgIQIAQgADYCGAsgBigCFCIERQ0AIABBFGogBDYCACAEIAA2AhgLIAcgA2ohAyAGIAdqIgYoAgQhBAsgBiAEQX5xNgIEIAIgA2ogAzYCACACIANBAXI2AgQCQCADQf8BSw0AIANBeHFBsNCAgABqIQQCQAJAQQAoAojQgIAAIgVBASADQQN2dCIDcQ0AQQAgBSADcjYCiNCAgAAgBCEDDAELIAQoAgghAwsgAyACNgIMIAQgAjYCCCACIAQ2AgwgAiADNgIIDAMLQR8hBAJAIANB////B0sNACADQQh2IgQgBEGA/j9qQRB2QQhxIgR0IgUgBUGA4B9qQRB2QQRxIgV0IgAgAEGAgA9qQRB2QQJxIgB0QQ92IAQgBXIgAHJrIgRBAXQgAyAEQRVqdkEBcXJBHGohBAsgAiAENgIcIAJCADcCECAEQQJ0QbjSgIAAaiEFAkBBACgCjNCAgAAiAEEBIAR0IghxDQAgBSACNgIAQQAgACAIcjYCjNCAgAAgAiAFNgIYIAIgAjYCCCACIAI2AgwMAwsgA0EAQRkgBEEBdmsgBEEfRht0IQQgBSgCACEAA0AgACIFKAIEQXhxIANGDQIgBEEddiEAIARBAXQhBCAFIABBBHFqQRBqIggoAgAiAA0ACyAIIAI2AgAgAiAFNgIYIAIgAjYCDCACIAI2AggMAgsgAEF4IABrQQ9xQQAgAEEIakEPcRsiA2oiCyAGQUhqIgggA2siA0EBcjYCBCAAIAhqQTg2AgQgBCAFQTcgBWtBD3FBACAFQUlqQQ9xG2pBQWoiCCAIIARBEGpJGyIIQSM2AgRBAEEAKALw04CAADYCpNCAgABBACADNgKU0ICAAEEAIAs2AqDQgIAAIAhBEGpBACkC0NOAgAA3AgAgCEEAKQLI04CAADcCCEEAIAhBCGo2AtDTgIAAQQAgBjYCzNOAgABBACAANgLI04CAAEEAQQA2AtTTgIAAIAhBJGohAwNAIANBBzYCACADQQRqIgMgBUkNAAsgCCAERg0DIAggCCgCBEF+cTYCBCAIIAggBGsiADYCACAEIABBAXI2AgQCQCAAQf8BSw0AIABBeHFBsNCAgABqIQMCQAJAQQAoAojQgIAAIgVBASAAQQN2dCIAcQ0AQQAgBSAAcjYCiNCAgAAgAyEFDAELIAMoAgghBQsgBSAENgIMIAMgBDYCCCAEIAM2AgwgBCAFNgIIDAQLQR8hAwJAIABB////B0sNACAAQQh2IgMgA0GA/j9qQRB2QQhxIgN0IgUgBUGA4B9qQRB2QQRxIgV0IgggCEGAgA9qQRB2QQJxIgh0QQ92IAMgBXIgCHJrIgNBAXQgACADQRVqdkEBcXJBHGohAwsgBCADNgIcIARCADcCECADQQJ0QbjSgIAAaiEFAkBBACgCjNCAgAAiCEEBIAN0IgZxDQAgBSAENgIAQQAgCCAGcjYCjNCAgAAgBCAFNgIYIAQgBDYCCCAEIAQ2AgwMBAsgAEEAQRkgA0EBdmsgA0EfRht0IQMgBSgCACEIA0AgCCIFKAIEQXhxIABGDQMgA0EddiEIIANBAXQhAyAFIAhBBHFqQRBqIgYoAgAiCA0ACyAGIAQ2AgAgBCAFNgIYIAQgBDYCDCAEIAQ2AggMAwsgBSgCCCIDIAI2AgwgBSACNgIIIAJBADYCGCACIAU2AgwgAiADNgIICyALQQhqIQMMBQsgBSgCCCIDIAQ2AgwgBSAENgIIIARBADYCGCAEIAU2AgwgBCADNgIIC0EAKAKU0ICAACIDIAJNDQBBACgCoNCAgAAiBCACaiIFIAMgAmsiA0EBcjYCBEEAIAM2ApTQgIAAQQAgBTYCoNCAgAAgBCACQQNyNgIEIARBCGohAwwDC0EAIQNBAEEwNgL404CAAAwCCwJAIAtFDQACQAJAIAggCCgCHCIFQQJ0QbjSgIAAaiIDKAIARw0AIAMgADYCACAADQFBACAHQX4gBXdxIgc2AozQgIAADAILIAtBEEEUIAsoAhAgCEYbaiAANgIAIABFDQELIAAgCzYCGAJAIAgoAhAiA0UNACAAIAM2AhAgAyAANgIYCyAIQRRqKAIAIgNFDQAgAEEUaiADNgIAIAMgADYCGAsCQAJAIARBD0sNACAIIAQgAmoiA0EDcjYCBCAIIANqIgMgAygCBEEBcjYCBAwBCyAIIAJqIgAgBEEBcjYCBCAIIAJBA3I2AgQgACAEaiAENgIAAkAgBEH/AUsNACAEQXhxQbDQgIAAaiEDAkACQEEAKAKI0ICAACIFQQEgBEEDdnQiBHENAEEAIAUgBHI2AojQgIAAIAMhBAwBCyADKAIIIQQLIAQgADYCDCADIAA2AgggACADNgIMIAAgBDYCCAwBC0EfIQMCQCAEQf///wdLDQAgBEEIdiIDIANBgP4/akEQdkEIcSIDdCIFIAVBgOAfakEQdkEEcSIFdCICIAJBgIAPakEQdkECcSICdEEPdiADIAVyIAJyayIDQQF0IAQgA0EVanZBAXFyQRxqIQMLIAAgAzYCHCAAQgA3AhAgA0ECdEG40oCAAGohBQJAIAdBASADdCICcQ0AIAUgADYCAEEAIAcgAnI2AozQgIAAIAAgBTYCGCAAIAA2AgggACAANgIMDAELIARBAEEZIANBAXZrIANBH0YbdCEDIAUoAgAhAgJAA0AgAiIFKAIEQXhxIARGDQEgA0EddiECIANBAXQhAyAFIAJBBHFqQRBqIgYoAgAiAg0ACyAGIAA2AgAgACAFNgIYIAAgADYCDCAAIAA2AggMAQsgBSgCCCIDIAA2AgwgBSAANgIIIABBADYCGCAAIAU2AgwgACADNgIICyAIQQhqIQMMAQsCQCAKRQ0AAkACQCAAIAAoAhwiBUECdEG40oCAAGoiAygCAEcNACADIAg2AgAgCA0BQQAgCUF+IAV3cTYCjNCAgAAMAgsgCkEQQRQgCigCECAARhtqIAg2AgAgCEUNAQsgCCAKNgIYAkAgACgCECIDRQ0AIAggAzYCECADIAg2AhgLIABBFGooAgAiA0UNACAIQRRqIAM2AgAgAyAINgIYCwJAAkAgBEEPSw0AIAAgBCACaiIDQQNyNgIEIAAgA2oiAyADKAIEQQFyNgIEDAELIAAgAmoiBSAEQQFyNgIEIAAgAkEDcjYCBCAFIARqIAQ2AgACQCAHRQ0AIAdBeHFBsNCAgABqIQJBACgCnNCAgAAhAwJAAkBBASAHQQN2dCIIIAZxDQBBACAIIAZyNgKI0ICAACACIQgMAQsgAigCCCEICyAIIAM2AgwgAiADNgIIIAMgAjYCDCADIAg2AggLQQAgBTYCnNCAgABBACAENgKQ0ICAAAsgAEEIaiEDCyABQRBqJICAgIAAIAMLCgAgABDJgICAAAviDQEHfwJAIABFDQAgAEF4aiIBIABBfGooAgAiAkF4cSIAaiEDAkAgAkEBcQ0AIAJBA3FFDQEgASABKAIAIgJrIgFBACgCmNCAgAAiBEkNASACIABqIQACQCABQQAoApzQgIAARg0AAkAgAkH/AUsNACABKAIIIgQgAkEDdiIFQQN0QbDQgIAAaiIGRhoCQCABKAIMIgIgBEcNAEEAQQAoAojQgIAAQX4gBXdxNgKI0ICAAAwDCyACIAZGGiACIAQ2AgggBCACNgIMDAILIAEoAhghBwJAAkAgASgCDCIGIAFGDQAgASgCCCICIARJGiAGIAI2AgggAiAGNgIMDAELAkAgAUEUaiICKAIAIgQNACABQRBqIgIoAgAiBA0AQQAhBgwBCwNAIAIhBSAEIgZBFGoiAigCACIEDQAgBkEQaiECIAYoAhAiBA0ACyAFQQA2AgALIAdFDQECQAJAIAEgASgCHCIEQQJ0QbjSgIAAaiICKAIARw0AIAIgBjYCACAGDQFBAEEAKAKM0ICAAEF+IAR3cTYCjNCAgAAMAwsgB0EQQRQgBygCECABRhtqIAY2AgAgBkUNAgsgBiAHNgIYAkAgASgCECICRQ0AIAYgAjYCECACIAY2AhgLIAEoAhQiAkUNASAGQRRqIAI2AgAgAiAGNgIYDAELIAMoAgQiAkEDcUEDRw0AIAMgAkF+cTYCBEEAIAA2ApDQgIAAIAEgAGogADYCACABIABBAXI2AgQPCyABIANPDQAgAygCBCICQQFxRQ0AAkACQCACQQJxDQACQCADQQAoAqDQgIAARw0AQQAgATYCoNCAgABBAEEAKAKU0ICAACAAaiIANgKU0ICAACABIABBAXI2AgQgAUEAKAKc0ICAAEcNA0EAQQA2ApDQgIAAQQBBADYCnNCAgAAPCwJAIANBACgCnNCAgABHDQBBACABNgKc0ICAAEEAQQAoApDQgIAAIABqIgA2ApDQgIAAIAEgAEEBcjYCBCABIABqIAA2AgAPCyACQXhxIABqIQACQAJAIAJB/wFLDQAgAygCCCIEIAJBA3YiBUEDdEGw0ICAAGoiBkYaAkAgAygCDCICIARHDQBBAEEAKAKI0ICAAEF+IAV3cTYCiNCAgAAMAgsgAiAGRhogAiAENgIIIAQgAjYCDAwBCyADKAIYIQcCQAJAIAMoAgwiBiADRg0AIAMoAggiAkEAKAKY0ICAAEkaIAYgAjYCCCACIAY2AgwMAQsCQCADQRRqIgIoAgAiBA0AIANBEGoiAigCACIEDQBBACEGDAELA0AgAiEFIAQiBkEUaiICKAIAIgQNACAGQRBqIQIgBigCECIEDQALIAVBADYCAAsgB0UNAAJAAkAgAyADKAIcIgRBAnRBuNKAgABqIgIoAgBHDQAgAiAGNgIAIAYNAUEAQQAoAozQgIAAQX4gBHdxNgKM0ICAAAwCCyAHQRBBFCAHKAIQIANGG2ogBjYCACAGRQ0BCyAGIAc2AhgCQCADKAIQIgJFDQAgBiACNgIQIAIgBjYCGAsgAygCFCICRQ0AIAZBFGogAjYCACACIAY2AhgLIAEgAGogADYCACABIABBAXI2AgQgAUEAKAKc0ICAAEcNAUEAIAA2ApDQgIAADwsgAyACQX5xNgIEIAEgAGogADYCACABIABBAXI2AgQLAkAgAEH/AUsNACAAQXhxQbDQgIAAaiECAkACQEEAKAKI0ICAACIEQQEgAEEDdnQiAHENAEEAIAQgAHI2AojQgIAAIAIhAAwBCyACKAIIIQALIAAgATYCDCACIAE2AgggASACNgIMIAEgADYCCA8LQR8hAgJAIABB////B0sNACAAQQh2IgIgAkGA/j9qQRB2QQhxIgJ0IgQgBEGA4B9qQRB2QQRxIgR0IgYgBkGAgA9qQRB2QQJxIgZ0QQ92IAIgBHIgBnJrIgJBAXQgACACQRVqdkEBcXJBHGohAgsgASACNgIcIAFCADcCECACQQJ0QbjSgIAAaiEEAkACQEEAKAKM0ICAACIGQQEgAnQiA3ENACAEIAE2AgBBACAGIANyNgKM0ICAACABIAQ2AhggASABNgIIIAEgATYCDAwBCyAAQQBBGSACQQF2ayACQR9GG3QhAiAEKAIAIQYCQANAIAYiBCgCBEF4cSAARg0BIAJBHXYhBiACQQF0IQIgBCAGQQRxakEQaiIDKAIAIgYNAAsgAyABNgIAIAEgBDYCGCABIAE2AgwgASABNgIIDAELIAQoAggiACABNgIMIAQgATYCCCABQQA2AhggASAENgIMIAEgADYCCAtBAEEAKAKo0ICAAEF/aiIBQX8gARs2AqjQgIAACwsEAAAAC04AAkAgAA0APwBBEHQPCwJAIABB//8DcQ0AIABBf0wNAAJAIABBEHZAACIAQX9HDQBBAEEwNgL404CAAEF/DwsgAEEQdA8LEMqAgIAAAAvyAgIDfwF+AkAgAkUNACAAIAE6AAAgAiAAaiIDQX9qIAE6AAAgAkEDSQ0AIAAgAToAAiAAIAE6AAEgA0F9aiABOgAAIANBfmogAToAACACQQdJDQAgACABOgADIANBfGogAToAACACQQlJDQAgAEEAIABrQQNxIgRqIgMgAUH/AXFBgYKECGwiATYCACADIAIgBGtBfHEiBGoiAkF8aiABNgIAIARBCUkNACADIAE2AgggAyABNgIEIAJBeGogATYCACACQXRqIAE2AgAgBEEZSQ0AIAMgATYCGCADIAE2AhQgAyABNgIQIAMgATYCDCACQXBqIAE2AgAgAkFsaiABNgIAIAJBaGogATYCACACQWRqIAE2AgAgBCADQQRxQRhyIgVrIgJBIEkNACABrUKBgICAEH4hBiADIAVqIQEDQCABIAY3AxggASAGNwMQIAEgBjcDCCABIAY3AwAgAUEgaiEBIAJBYGoiAkEfSw0ACwsgAAsLjkgBAEGACAuGSAEAAAACAAAAAwAAAAAAAAAAAAAABAAAAAUAAAAAAAAAAAAAAAYAAAAHAAAACAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAASW52YWxpZCBjaGFyIGluIHVybCBxdWVyeQBTcGFuIGNhbGxiYWNrIGVycm9yIGluIG9uX2JvZHkAQ29udGVudC1MZW5ndGggb3ZlcmZsb3cAQ2h1bmsgc2l6ZSBvdmVyZmxvdwBSZXNwb25zZSBvdmVyZmxvdwBJbnZhbGlkIG1ldGhvZCBmb3IgSFRUUC94LnggcmVxdWVzdABJbnZhbGlkIG1ldGhvZCBmb3IgUlRTUC94LnggcmVxdWVzdABFeHBlY3RlZCBTT1VSQ0UgbWV0aG9kIGZvciBJQ0UveC54IHJlcXVlc3QASW52YWxpZCBjaGFyIGluIHVybCBmcmFnbWVudCBzdGFydABFeHBlY3RlZCBkb3QAU3BhbiBjYWxsYmFjayBlcnJvciBpbiBvbl9zdGF0dXMASW52YWxpZCByZXNwb25zZSBzdGF0dXMASW52YWxpZCBjaGFyYWN0ZXIgaW4gY2h1bmsgZXh0ZW5zaW9ucwBVc2VyIGNhbGxiYWNrIGVycm9yAGBvbl9yZXNldGAgY2FsbGJhY2sgZXJyb3IAYG9uX2NodW5rX2hlYWRlcmAgY2FsbGJhY2sgZXJyb3IAYG9uX21lc3NhZ2VfYmVnaW5gIGNhbGxiYWNrIGVycm9yAGBvbl9jaHVua19leHRlbnNpb25fdmFsdWVgIGNhbGxiYWNrIGVycm9yAGBvbl9zdGF0dXNfY29tcGxldGVgIGNhbGxiYWNrIGVycm9yAGBvbl92ZXJzaW9uX2NvbXBsZXRlYCBjYWxsYmFjayBlcnJvcgBgb25fdXJsX2NvbXBsZXRlYCBjYWxsYmFjayBlcnJvcgBgb25fY2h1bmtfY29tcGxldGVgIGNhbGxiYWNrIGVycm9yAGBvbl9oZWFkZXJfdmFsdWVfY29tcGxldGVgIGNhbGxiYWNrIGVycm9yAGBvbl9tZXNzYWdlX2NvbXBsZXRlYCBjYWxsYmFjayBlcnJvcgBgb25fbWV0aG9kX2NvbXBsZXRlYCBjYWxsYmFjayBlcnJvcgBgb25faGVhZGVyX2ZpZWxkX2NvbXBsZXRlYCBjYWxsYmFjayBlcnJvcgBgb25fY2h1bmtfZXh0ZW5zaW9uX25hbWVgIGNhbGxiYWNrIGVycm9yAFVuZXhwZWN0ZWQgY2hhciBpbiB1cmwgc2VydmVyAEludmFsaWQgaGVhZGVyIHZhbHVlIGNoYXIASW52YWxpZCBoZWFkZXIgZmllbGQgY2hhcgBTcGFuIGNhbGxiYWNrIGVycm9yIGluIG9uX3ZlcnNpb24ASW52YWxpZCBtaW5vciB2ZXJzaW9uAEludmFsaWQgbWFqb3IgdmVyc2lvbgBFeHBlY3RlZCBzcGFjZSBhZnRlciB2ZXJzaW9uAEV4cGVjdGVkIENSTEYgYWZ0ZXIgdmVyc2lvbgBJbnZhbGlkIEhUVFAgdmVyc2lvbgBJbnZhbGlkIGhlYWRlciB0b2tlbgBTcGFuIGNhbGxiYWNrIGVycm9yIGluIG9uX3VybABJbnZhbGlkIGNoYXJhY3RlcnMgaW4gdXJsAFVuZXhwZWN0ZWQgc3RhcnQgY2hhciBpbiB1cmwARG91YmxlIEAgaW4gdXJsAEVtcHR5IENvbnRlbnQtTGVuZ3RoAEludmFsaWQgY2hhcmFjdGVyIGluIENvbnRlbnQtTGVuZ3RoAER1cGxpY2F0ZSBDb250ZW50LUxlbmd0aABJbnZhbGlkIGNoYXIgaW4gdXJsIHBhdGgAQ29udGVudC1MZW5ndGggY2FuJ3QgYmUgcHJlc2VudCB3aXRoIFRyYW5zZmVyLUVuY29kaW5nAEludmFsaWQgY2hhcmFjdGVyIGluIGNodW5rIHNpemUAU3BhbiBjYWxsYmFjayBlcnJvciBpbiBvbl9oZWFkZXJfdmFsdWUAU3BhbiBjYWxsYmFjayBlcnJvciBpbiBvbl9jaHVua19leHRlbnNpb25fdmFsdWUASW52YWxpZCBjaGFyYWN0ZXIgaW4gY2h1bmsgZXh0ZW5zaW9ucyB2YWx1ZQBNaXNzaW5nIGV4cGVjdGVkIExGIGFmdGVyIGhlYWRlciB2YWx1ZQBJbnZhbGlkIGBUcmFuc2Zlci1FbmNvZGluZ2AgaGVhZGVyIHZhbHVlAEludmFsaWQgY2hhcmFjdGVyIGluIGNodW5rIGV4dGVuc2lvbnMgcXVvdGUgdmFsdWUASW52YWxpZCBjaGFyYWN0ZXIgaW4gY2h1bmsgZXh0ZW5zaW9ucyBxdW90ZWQgdmFsdWUAUGF1c2VkIGJ5IG9uX2hlYWRlcnNfY29tcGxldGUASW52YWxpZCBFT0Ygc3RhdGUAb25fcmVzZXQgcGF1c2UAb25fY2h1bmtfaGVhZGVyIHBhdXNlAG9uX21lc3NhZ2VfYmVnaW4gcGF1c2UAb25fY2h1bmtfZXh0ZW5zaW9uX3ZhbHVlIHBhdXNlAG9uX3N0YXR1c19jb21wbGV0ZSBwYXVzZQBvbl92ZXJzaW9uX2NvbXBsZXRlIHBhdXNlAG9uX3VybF9jb21wbGV0ZSBwYXVzZQBvbl9jaHVua19jb21wbGV0ZSBwYXVzZQBvbl9oZWFkZXJfdmFsdWVfY29tcGxldGUgcGF1c2UAb25fbWVzc2FnZV9jb21wbGV0ZSBwYXVzZQBvbl9tZXRob2RfY29tcGxldGUgcGF1c2UAb25faGVhZGVyX2ZpZWxkX2NvbXBsZXRlIHBhdXNlAG9uX2NodW5rX2V4dGVuc2lvbl9uYW1lIHBhdXNlAFVuZXhwZWN0ZWQgc3BhY2UgYWZ0ZXIgc3RhcnQgbGluZQBTcGFuIGNhbGxiYWNrIGVycm9yIGluIG9uX2NodW5rX2V4dGVuc2lvbl9uYW1lAEludmFsaWQgY2hhcmFjdGVyIGluIGNodW5rIGV4dGVuc2lvbnMgbmFtZQBQYXVzZSBvbiBDT05ORUNUL1VwZ3JhZGUAUGF1c2Ugb24gUFJJL1VwZ3JhZGUARXhwZWN0ZWQgSFRUUC8yIENvbm5lY3Rpb24gUHJlZmFjZQBTcGFuIGNhbGxiYWNrIGVycm9yIGluIG9uX21ldGhvZABFeHBlY3RlZCBzcGFjZSBhZnRlciBtZXRob2QAU3BhbiBjYWxsYmFjayBlcnJvciBpbiBvbl9oZWFkZXJfZmllbGQAUGF1c2VkAEludmFsaWQgd29yZCBlbmNvdW50ZXJlZABJbnZhbGlkIG1ldGhvZCBlbmNvdW50ZXJlZABVbmV4cGVjdGVkIGNoYXIgaW4gdXJsIHNjaGVtYQBSZXF1ZXN0IGhhcyBpbnZhbGlkIGBUcmFuc2Zlci1FbmNvZGluZ2AAU1dJVENIX1BST1hZAFVTRV9QUk9YWQBNS0FDVElWSVRZAFVOUFJPQ0VTU0FCTEVfRU5USVRZAENPUFkATU9WRURfUEVSTUFORU5UTFkAVE9PX0VBUkxZAE5PVElGWQBGQUlMRURfREVQRU5ERU5DWQBCQURfR0FURVdBWQBQTEFZAFBVVABDSEVDS09VVABHQVRFV0FZX1RJTUVPVVQAUkVRVUVTVF9USU1FT1VUAE5FVFdPUktfQ09OTkVDVF9USU1FT1VUAENPTk5FQ1RJT05fVElNRU9VVABMT0dJTl9USU1FT1VUAE5FVFdPUktfUkVBRF9USU1FT1VUAFBPU1QATUlTRElSRUNURURfUkVRVUVTVABDTElFTlRfQ0xPU0VEX1JFUVVFU1QAQ0xJRU5UX0NMT1NFRF9MT0FEX0JBTEFOQ0VEX1JFUVVFU1QAQkFEX1JFUVVFU1QASFRUUF9SRVFVRVNUX1NFTlRfVE9fSFRUUFNfUE9SVABSRVBPUlQASU1fQV9URUFQT1QAUkVTRVRfQ09OVEVOVABOT19DT05URU5UAFBBUlRJQUxfQ09OVEVOVABIUEVfSU5WQUxJRF9DT05TVEFOVABIUEVfQ0JfUkVTRVQAR0VUAEhQRV9TVFJJQ1QAQ09ORkxJQ1QAVEVNUE9SQVJZX1JFRElSRUNUAFBFUk1BTkVOVF9SRURJUkVDVABDT05ORUNUAE1VTFRJX1NUQVRVUwBIUEVfSU5WQUxJRF9TVEFUVVMAVE9PX01BTllfUkVRVUVTVFMARUFSTFlfSElOVFMAVU5BVkFJTEFCTEVfRk9SX0xFR0FMX1JFQVNPTlMAT1BUSU9OUwBTV0lUQ0hJTkdfUFJPVE9DT0xTAFZBUklBTlRfQUxTT19ORUdPVElBVEVTAE1VTFRJUExFX0NIT0lDRVMASU5URVJOQUxfU0VSVkVSX0VSUk9SAFdFQl9TRVJWRVJfVU5LTk9XTl9FUlJPUgBSQUlMR1VOX0VSUk9SAElERU5USVRZX1BST1ZJREVSX0FVVEhFTlRJQ0FUSU9OX0VSUk9SAFNTTF9DRVJUSUZJQ0FURV9FUlJPUgBJTlZBTElEX1hfRk9SV0FSREVEX0ZPUgBTRVRfUEFSQU1FVEVSAEdFVF9QQVJBTUVURVIASFBFX1VTRVIAU0VFX09USEVSAEhQRV9DQl9DSFVOS19IRUFERVIATUtDQUxFTkRBUgBTRVRVUABXRUJfU0VSVkVSX0lTX0RPV04AVEVBUkRPV04ASFBFX0NMT1NFRF9DT05ORUNUSU9OAEhFVVJJU1RJQ19FWFBJUkFUSU9OAERJU0NPTk5FQ1RFRF9PUEVSQVRJT04ATk9OX0FVVEhPUklUQVRJVkVfSU5GT1JNQVRJT04ASFBFX0lOVkFMSURfVkVSU0lPTgBIUEVfQ0JfTUVTU0FHRV9CRUdJTgBTSVRFX0lTX0ZST1pFTgBIUEVfSU5WQUxJRF9IRUFERVJfVE9LRU4ASU5WQUxJRF9UT0tFTgBGT1JCSURERU4ARU5IQU5DRV9ZT1VSX0NBTE0ASFBFX0lOVkFMSURfVVJMAEJMT0NLRURfQllfUEFSRU5UQUxfQ09OVFJPTABNS0NPTABBQ0wASFBFX0lOVEVSTkFMAFJFUVVFU1RfSEVBREVSX0ZJRUxEU19UT09fTEFSR0VfVU5PRkZJQ0lBTABIUEVfT0sAVU5MSU5LAFVOTE9DSwBQUkkAUkVUUllfV0lUSABIUEVfSU5WQUxJRF9DT05URU5UX0xFTkdUSABIUEVfVU5FWFBFQ1RFRF9DT05URU5UX0xFTkdUSABGTFVTSABQUk9QUEFUQ0gATS1TRUFSQ0gAVVJJX1RPT19MT05HAFBST0NFU1NJTkcATUlTQ0VMTEFORU9VU19QRVJTSVNURU5UX1dBUk5JTkcATUlTQ0VMTEFORU9VU19XQVJOSU5HAEhQRV9JTlZBTElEX1RSQU5TRkVSX0VOQ09ESU5HAEV4cGVjdGVkIENSTEYASFBFX0lOVkFMSURfQ0hVTktfU0laRQBNT1ZFAENPTlRJTlVFAEhQRV9DQl9TVEFUVVNfQ09NUExFVEUASFBFX0NCX0hFQURFUlNfQ09NUExFVEUASFBFX0NCX1ZFUlNJT05fQ09NUExFVEUASFBFX0NCX1VSTF9DT01QTEVURQBIUEVfQ0JfQ0hVTktfQ09NUExFVEUASFBFX0NCX0hFQURFUl9WQUxVRV9DT01QTEVURQBIUEVfQ0JfQ0hVTktfRVhURU5TSU9OX1ZBTFVFX0NPTVBMRVRFAEhQRV9DQl9DSFVOS19FWFRFTlNJT05fTkFNRV9DT01QTEVURQBIUEVfQ0JfTUVTU0FHRV9DT01QTEVURQBIUEVfQ0JfTUVUSE9EX0NPTVBMRVRFAEhQRV9DQl9IRUFERVJfRklFTERfQ09NUExFVEUAREVMRVRFAEhQRV9JTlZBTElEX0VPRl9TVEFURQBJTlZBTElEX1NTTF9DRVJUSUZJQ0FURQBQQVVTRQBOT19SRVNQT05TRQBVTlNVUFBPUlRFRF9NRURJQV9UWVBFAEdPTkUATk9UX0FDQ0VQVEFCTEUAU0VSVklDRV9VTkFWQUlMQUJMRQBSQU5HRV9OT1RfU0FUSVNGSUFCTEUAT1JJR0lOX0lTX1VOUkVBQ0hBQkxFAFJFU1BPTlNFX0lTX1NUQUxFAFBVUkdFAE1FUkdFAFJFUVVFU1RfSEVBREVSX0ZJRUxEU19UT09fTEFSR0UAUkVRVUVTVF9IRUFERVJfVE9PX0xBUkdFAFBBWUxPQURfVE9PX0xBUkdFAElOU1VGRklDSUVOVF9TVE9SQUdFAEhQRV9QQVVTRURfVVBHUkFERQBIUEVfUEFVU0VEX0gyX1VQR1JBREUAU09VUkNFAEFOTk9VTkNFAFRSQUNFAEhQRV9VTkVYUEVDVEVEX1NQQUNFAERFU0NSSUJFAFVOU1VCU0NSSUJFAFJFQ09SRABIUEVfSU5WQUxJRF9NRVRIT0QATk9UX0ZPVU5EAFBST1BGSU5EAFVOQklORABSRUJJTkQAVU5BVVRIT1JJWkVEAE1FVEhPRF9OT1RfQUxMT1dFRABIVFRQX1ZFUlNJT05fTk9UX1NVUFBPUlRFRABBTFJFQURZX1JFUE9SVEVEAEFDQ0VQVEVEAE5PVF9JTVBMRU1FTlRFRABMT09QX0RFVEVDVEVEAEhQRV9DUl9FWFBFQ1RFRABIUEVfTEZfRVhQRUNURUQAQ1JFQVRFRABJTV9VU0VEAEhQRV9QQVVTRUQAVElNRU9VVF9PQ0NVUkVEAFBBWU1FTlRfUkVRVUlSRUQAUFJFQ09ORElUSU9OX1JFUVVJUkVEAFBST1hZX0FVVEhFTlRJQ0FUSU9OX1JFUVVJUkVEAE5FVFdPUktfQVVUSEVOVElDQVRJT05fUkVRVUlSRUQATEVOR1RIX1JFUVVJUkVEAFNTTF9DRVJUSUZJQ0FURV9SRVFVSVJFRABVUEdSQURFX1JFUVVJUkVEAFBBR0VfRVhQSVJFRABQUkVDT05ESVRJT05fRkFJTEVEAEVYUEVDVEFUSU9OX0ZBSUxFRABSRVZBTElEQVRJT05fRkFJTEVEAFNTTF9IQU5EU0hBS0VfRkFJTEVEAExPQ0tFRABUUkFOU0ZPUk1BVElPTl9BUFBMSUVEAE5PVF9NT0RJRklFRABOT1RfRVhURU5ERUQAQkFORFdJRFRIX0xJTUlUX0VYQ0VFREVEAFNJVEVfSVNfT1ZFUkxPQURFRABIRUFEAEV4cGVjdGVkIEhUVFAvAABeEwAAJhMAADAQAADwFwAAnRMAABUSAAA5FwAA8BIAAAoQAAB1EgAArRIAAIITAABPFAAAfxAAAKAVAAAjFAAAiRIAAIsUAABNFQAA1BEAAM8UAAAQGAAAyRYAANwWAADBEQAA4BcAALsUAAB0FAAAfBUAAOUUAAAIFwAAHxAAAGUVAACjFAAAKBUAAAIVAACZFQAALBAAAIsZAABPDwAA1A4AAGoQAADOEAAAAhcAAIkOAABuEwAAHBMAAGYUAABWFwAAwRMAAM0TAABsEwAAaBcAAGYXAABfFwAAIhMAAM4PAABpDgAA2A4AAGMWAADLEwAAqg4AACgXAAAmFwAAxRMAAF0WAADoEQAAZxMAAGUTAADyFgAAcxMAAB0XAAD5FgAA8xEAAM8OAADOFQAADBIAALMRAAClEQAAYRAAADIXAAC7EwAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEBAgEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQABAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAAAAAAAAAAAAAAAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAgMCAgICAgAAAgIAAgIAAgICAgICAgICAgAEAAAAAAACAgICAgICAgICAgICAgICAgICAgICAgICAgAAAAICAgICAgICAgICAgICAgICAgICAgICAgICAgICAAIAAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAIAAgICAgIAAAICAAICAAICAgICAgICAgIAAwAEAAAAAgICAgICAgICAgICAgICAgICAgICAgICAgIAAAACAgICAgICAgICAgICAgICAgICAgICAgICAgICAgACAAIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABsb3NlZWVwLWFsaXZlAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQABAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQAAAAAAAAAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQEBAQEBAQEBAQEBAgEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEAAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQFjaHVua2VkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAQABAQEBAQAAAQEAAQEAAQEBAQEBAQEBAQAAAAAAAAABAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQAAAAEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGVjdGlvbmVudC1sZW5ndGhvbnJveHktY29ubmVjdGlvbgAAAAAAAAAAAAAAAAAAAHJhbnNmZXItZW5jb2RpbmdwZ3JhZGUNCg0KDQpTTQ0KDQpUVFAvQ0UvVFNQLwAAAAAAAAAAAAAAAAECAAEDAAAAAAAAAAAAAAAAAAAAAAAABAEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEAAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEAAAAAAAAAAAABAgABAwAAAAAAAAAAAAAAAAAAAAAAAAQBAQUBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAAEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAAAAAAAAAAAAAQAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAQEAAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAAEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQABAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQAAAAAAAAAAAAABAAACAAAAAAAAAAAAAAAAAAAAAAAAAwQAAAQEBAQEBAQEBAQEBQQEBAQEBAQEBAQEBAAEAAYHBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEAAQABAAEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAQAAAAAAAAAAAAAAAAAAAAAAAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgAAAAAAAAMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAAAAAAAAAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAEAAAEAAAAAAAAAAAAAAAAAAAAAAAABAAAAAAAAAAAAAgAAAAACAAAAAAAAAAAAAAAAAAAAAAADAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwAAAAAAAAMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAE5PVU5DRUVDS09VVE5FQ1RFVEVDUklCRUxVU0hFVEVBRFNFQVJDSFJHRUNUSVZJVFlMRU5EQVJWRU9USUZZUFRJT05TQ0hTRUFZU1RBVENIR0VPUkRJUkVDVE9SVFJDSFBBUkFNRVRFUlVSQ0VCU0NSSUJFQVJET1dOQUNFSU5ETktDS1VCU0NSSUJFSFRUUC9BRFRQLw=="},2930:(A,e)=>{"use strict";Object.defineProperty(e,"__esModule",{value:true});e.enumToMap=void 0;function enumToMap(A){const e={};Object.keys(A).forEach((t=>{const r=A[t];if(typeof r==="number"){e[t]=r}}));return e}e.enumToMap=enumToMap},7731:(A,e,t)=>{"use strict";const{kClients:r}=t(5817);const s=t(2415);const{kAgent:o,kMockAgentSet:n,kMockAgentGet:i,kDispatches:a,kIsMockActive:E,kNetConnect:g,kGetNetConnect:c,kOptions:Q,kFactory:C}=t(2131);const B=t(7327);const I=t(8318);const{matchValue:h,buildMockOptions:l}=t(9159);const{InvalidArgumentError:u,UndiciError:d}=t(1369);const f=t(3253);const p=t(5503);const y=t(9900);class FakeWeakRef{constructor(A){this.value=A}deref(){return this.value}}class MockAgent extends f{constructor(A){super(A);this[g]=true;this[E]=true;if(A&&A.agent&&typeof A.agent.dispatch!=="function"){throw new u("Argument opts.agent must implement Agent")}const e=A&&A.agent?A.agent:new s(A);this[o]=e;this[r]=e[r];this[Q]=l(A)}get(A){let e=this[i](A);if(!e){e=this[C](A);this[n](A,e)}return e}dispatch(A,e){this.get(A.origin);return this[o].dispatch(A,e)}async close(){await this[o].close();this[r].clear()}deactivate(){this[E]=false}activate(){this[E]=true}enableNetConnect(A){if(typeof A==="string"||typeof A==="function"||A instanceof RegExp){if(Array.isArray(this[g])){this[g].push(A)}else{this[g]=[A]}}else if(typeof A==="undefined"){this[g]=true}else{throw new u("Unsupported matcher. Must be one of String|Function|RegExp.")}}disableNetConnect(){this[g]=false}get isMockActive(){return this[E]}[n](A,e){this[r].set(A,new FakeWeakRef(e))}[C](A){const e=Object.assign({agent:this},this[Q]);return this[Q]&&this[Q].connections===1?new B(A,e):new I(A,e)}[i](A){const e=this[r].get(A);if(e){return e.deref()}if(typeof A!=="string"){const e=this[C]("http://localhost:9999");this[n](A,e);return e}for(const[e,t]of Array.from(this[r])){const r=t.deref();if(r&&typeof e!=="string"&&h(e,A)){const e=this[C](A);this[n](A,e);e[a]=r[a];return e}}}[c](){return this[g]}pendingInterceptors(){const A=this[r];return Array.from(A.entries()).flatMap((([A,e])=>e.deref()[a].map((e=>({...e,origin:A}))))).filter((({pending:A})=>A))}assertNoPendingInterceptors({pendingInterceptorsFormatter:A=new y}={}){const e=this.pendingInterceptors();if(e.length===0){return}const t=new p("interceptor","interceptors").pluralize(e.length);throw new d(`\n${t.count} ${t.noun} ${t.is} pending:\n\n${A.format(e)}\n`.trim())}}A.exports=MockAgent},7327:(A,e,t)=>{"use strict";const{promisify:r}=t(9023);const s=t(4291);const{buildMockDispatch:o}=t(9159);const{kDispatches:n,kMockAgent:i,kClose:a,kOriginalClose:E,kOrigin:g,kOriginalDispatch:c,kConnected:Q}=t(2131);const{MockInterceptor:C}=t(7913);const B=t(5817);const{InvalidArgumentError:I}=t(1369);class MockClient extends s{constructor(A,e){super(A,e);if(!e||!e.agent||typeof e.agent.dispatch!=="function"){throw new I("Argument opts.agent must implement Agent")}this[i]=e.agent;this[g]=A;this[n]=[];this[Q]=1;this[c]=this.dispatch;this[E]=this.close.bind(this);this.dispatch=o.call(this);this.close=this[a]}get[B.kConnected](){return this[Q]}intercept(A){return new C(A,this[n])}async[a](){await r(this[E])();this[Q]=0;this[i][B.kClients].delete(this[g])}}A.exports=MockClient},171:(A,e,t)=>{"use strict";const{UndiciError:r}=t(1369);class MockNotMatchedError extends r{constructor(A){super(A);Error.captureStackTrace(this,MockNotMatchedError);this.name="MockNotMatchedError";this.message=A||"The request does not match any registered mock dispatches";this.code="UND_MOCK_ERR_MOCK_NOT_MATCHED"}}A.exports={MockNotMatchedError:MockNotMatchedError}},7913:(A,e,t)=>{"use strict";const{getResponseData:r,buildKey:s,addMockDispatch:o}=t(9159);const{kDispatches:n,kDispatchKey:i,kDefaultHeaders:a,kDefaultTrailers:E,kContentLength:g,kMockDispatch:c}=t(2131);const{InvalidArgumentError:Q}=t(1369);const{buildURL:C}=t(7586);class MockScope{constructor(A){this[c]=A}delay(A){if(typeof A!=="number"||!Number.isInteger(A)||A<=0){throw new Q("waitInMs must be a valid integer > 0")}this[c].delay=A;return this}persist(){this[c].persist=true;return this}times(A){if(typeof A!=="number"||!Number.isInteger(A)||A<=0){throw new Q("repeatTimes must be a valid integer > 0")}this[c].times=A;return this}}class MockInterceptor{constructor(A,e){if(typeof A!=="object"){throw new Q("opts must be an object")}if(typeof A.path==="undefined"){throw new Q("opts.path must be defined")}if(typeof A.method==="undefined"){A.method="GET"}if(typeof A.path==="string"){if(A.query){A.path=C(A.path,A.query)}else{const e=new URL(A.path,"data://");A.path=e.pathname+e.search}}if(typeof A.method==="string"){A.method=A.method.toUpperCase()}this[i]=s(A);this[n]=e;this[a]={};this[E]={};this[g]=false}createMockScopeDispatchData(A,e,t={}){const s=r(e);const o=this[g]?{"content-length":s.length}:{};const n={...this[a],...o,...t.headers};const i={...this[E],...t.trailers};return{statusCode:A,data:e,headers:n,trailers:i}}validateReplyParameters(A,e,t){if(typeof A==="undefined"){throw new Q("statusCode must be defined")}if(typeof e==="undefined"){throw new Q("data must be defined")}if(typeof t!=="object"){throw new Q("responseOptions must be an object")}}reply(A){if(typeof A==="function"){const wrappedDefaultsCallback=e=>{const t=A(e);if(typeof t!=="object"){throw new Q("reply options callback must return an object")}const{statusCode:r,data:s="",responseOptions:o={}}=t;this.validateReplyParameters(r,s,o);return{...this.createMockScopeDispatchData(r,s,o)}};const e=o(this[n],this[i],wrappedDefaultsCallback);return new MockScope(e)}const[e,t="",r={}]=[...arguments];this.validateReplyParameters(e,t,r);const s=this.createMockScopeDispatchData(e,t,r);const a=o(this[n],this[i],s);return new MockScope(a)}replyWithError(A){if(typeof A==="undefined"){throw new Q("error must be defined")}const e=o(this[n],this[i],{error:A});return new MockScope(e)}defaultReplyHeaders(A){if(typeof A==="undefined"){throw new Q("headers must be defined")}this[a]=A;return this}defaultReplyTrailers(A){if(typeof A==="undefined"){throw new Q("trailers must be defined")}this[E]=A;return this}replyContentLength(){this[g]=true;return this}}A.exports.MockInterceptor=MockInterceptor;A.exports.MockScope=MockScope},8318:(A,e,t)=>{"use strict";const{promisify:r}=t(9023);const s=t(7258);const{buildMockDispatch:o}=t(9159);const{kDispatches:n,kMockAgent:i,kClose:a,kOriginalClose:E,kOrigin:g,kOriginalDispatch:c,kConnected:Q}=t(2131);const{MockInterceptor:C}=t(7913);const B=t(5817);const{InvalidArgumentError:I}=t(1369);class MockPool extends s{constructor(A,e){super(A,e);if(!e||!e.agent||typeof e.agent.dispatch!=="function"){throw new I("Argument opts.agent must implement Agent")}this[i]=e.agent;this[g]=A;this[n]=[];this[Q]=1;this[c]=this.dispatch;this[E]=this.close.bind(this);this.dispatch=o.call(this);this.close=this[a]}get[B.kConnected](){return this[Q]}intercept(A){return new C(A,this[n])}async[a](){await r(this[E])();this[Q]=0;this[i][B.kClients].delete(this[g])}}A.exports=MockPool},2131:A=>{"use strict";A.exports={kAgent:Symbol("agent"),kOptions:Symbol("options"),kFactory:Symbol("factory"),kDispatches:Symbol("dispatches"),kDispatchKey:Symbol("dispatch key"),kDefaultHeaders:Symbol("default headers"),kDefaultTrailers:Symbol("default trailers"),kContentLength:Symbol("content length"),kMockAgent:Symbol("mock agent"),kMockAgentSet:Symbol("mock agent set"),kMockAgentGet:Symbol("mock agent get"),kMockDispatch:Symbol("mock dispatch"),kClose:Symbol("close"),kOriginalClose:Symbol("original agent close"),kOrigin:Symbol("origin"),kIsMockActive:Symbol("is mock active"),kNetConnect:Symbol("net connect"),kGetNetConnect:Symbol("get net connect"),kConnected:Symbol("connected")}},9159:(A,e,t)=>{"use strict";const{MockNotMatchedError:r}=t(171);const{kDispatches:s,kMockAgent:o,kOriginalDispatch:n,kOrigin:i,kGetNetConnect:a}=t(2131);const{buildURL:E,nop:g}=t(7586);const{STATUS_CODES:c}=t(8611);const{types:{isPromise:Q}}=t(9023);function matchValue(A,e){if(typeof A==="string"){return A===e}if(A instanceof RegExp){return A.test(e)}if(typeof A==="function"){return A(e)===true}return false}function lowerCaseEntries(A){return Object.fromEntries(Object.entries(A).map((([A,e])=>[A.toLocaleLowerCase(),e])))}function getHeaderByName(A,e){if(Array.isArray(A)){for(let t=0;t<A.length;t+=2){if(A[t].toLocaleLowerCase()===e.toLocaleLowerCase()){return A[t+1]}}return undefined}else if(typeof A.get==="function"){return A.get(e)}else{return lowerCaseEntries(A)[e.toLocaleLowerCase()]}}function buildHeadersFromArray(A){const e=A.slice();const t=[];for(let A=0;A<e.length;A+=2){t.push([e[A],e[A+1]])}return Object.fromEntries(t)}function matchHeaders(A,e){if(typeof A.headers==="function"){if(Array.isArray(e)){e=buildHeadersFromArray(e)}return A.headers(e?lowerCaseEntries(e):{})}if(typeof A.headers==="undefined"){return true}if(typeof e!=="object"||typeof A.headers!=="object"){return false}for(const[t,r]of Object.entries(A.headers)){const A=getHeaderByName(e,t);if(!matchValue(r,A)){return false}}return true}function safeUrl(A){if(typeof A!=="string"){return A}const e=A.split("?");if(e.length!==2){return A}const t=new URLSearchParams(e.pop());t.sort();return[...e,t.toString()].join("?")}function matchKey(A,{path:e,method:t,body:r,headers:s}){const o=matchValue(A.path,e);const n=matchValue(A.method,t);const i=typeof A.body!=="undefined"?matchValue(A.body,r):true;const a=matchHeaders(A,s);return o&&n&&i&&a}function getResponseData(A){if(Buffer.isBuffer(A)){return A}else if(typeof A==="object"){return JSON.stringify(A)}else{return A.toString()}}function getMockDispatch(A,e){const t=e.query?E(e.path,e.query):e.path;const s=typeof t==="string"?safeUrl(t):t;let o=A.filter((({consumed:A})=>!A)).filter((({path:A})=>matchValue(safeUrl(A),s)));if(o.length===0){throw new r(`Mock dispatch not matched for path '${s}'`)}o=o.filter((({method:A})=>matchValue(A,e.method)));if(o.length===0){throw new r(`Mock dispatch not matched for method '${e.method}'`)}o=o.filter((({body:A})=>typeof A!=="undefined"?matchValue(A,e.body):true));if(o.length===0){throw new r(`Mock dispatch not matched for body '${e.body}'`)}o=o.filter((A=>matchHeaders(A,e.headers)));if(o.length===0){throw new r(`Mock dispatch not matched for headers '${typeof e.headers==="object"?JSON.stringify(e.headers):e.headers}'`)}return o[0]}function addMockDispatch(A,e,t){const r={timesInvoked:0,times:1,persist:false,consumed:false};const s=typeof t==="function"?{callback:t}:{...t};const o={...r,...e,pending:true,data:{error:null,...s}};A.push(o);return o}function deleteMockDispatch(A,e){const t=A.findIndex((A=>{if(!A.consumed){return false}return matchKey(A,e)}));if(t!==-1){A.splice(t,1)}}function buildKey(A){const{path:e,method:t,body:r,headers:s,query:o}=A;return{path:e,method:t,body:r,headers:s,query:o}}function generateKeyValues(A){return Object.entries(A).reduce(((A,[e,t])=>[...A,Buffer.from(`${e}`),Array.isArray(t)?t.map((A=>Buffer.from(`${A}`))):Buffer.from(`${t}`)]),[])}function getStatusText(A){return c[A]||"unknown"}async function getResponse(A){const e=[];for await(const t of A){e.push(t)}return Buffer.concat(e).toString("utf8")}function mockDispatch(A,e){const t=buildKey(A);const r=getMockDispatch(this[s],t);r.timesInvoked++;if(r.data.callback){r.data={...r.data,...r.data.callback(A)}}const{data:{statusCode:o,data:n,headers:i,trailers:a,error:E},delay:c,persist:C}=r;const{timesInvoked:B,times:I}=r;r.consumed=!C&&B>=I;r.pending=B<I;if(E!==null){deleteMockDispatch(this[s],t);e.onError(E);return true}if(typeof c==="number"&&c>0){setTimeout((()=>{handleReply(this[s])}),c)}else{handleReply(this[s])}function handleReply(r,s=n){const E=Array.isArray(A.headers)?buildHeadersFromArray(A.headers):A.headers;const c=typeof s==="function"?s({...A,headers:E}):s;if(Q(c)){c.then((A=>handleReply(r,A)));return}const C=getResponseData(c);const B=generateKeyValues(i);const I=generateKeyValues(a);e.abort=g;e.onHeaders(o,B,resume,getStatusText(o));e.onData(Buffer.from(C));e.onComplete(I);deleteMockDispatch(r,t)}function resume(){}return true}function buildMockDispatch(){const A=this[o];const e=this[i];const t=this[n];return function dispatch(s,o){if(A.isMockActive){try{mockDispatch.call(this,s,o)}catch(n){if(n instanceof r){const i=A[a]();if(i===false){throw new r(`${n.message}: subsequent request to origin ${e} was not allowed (net.connect disabled)`)}if(checkNetConnect(i,e)){t.call(this,s,o)}else{throw new r(`${n.message}: subsequent request to origin ${e} was not allowed (net.connect is not enabled for this origin)`)}}else{throw n}}}else{t.call(this,s,o)}}}function checkNetConnect(A,e){const t=new URL(e);if(A===true){return true}else if(Array.isArray(A)&&A.some((A=>matchValue(A,t.host)))){return true}return false}function buildMockOptions(A){if(A){const{agent:e,...t}=A;return t}}A.exports={getResponseData:getResponseData,getMockDispatch:getMockDispatch,addMockDispatch:addMockDispatch,deleteMockDispatch:deleteMockDispatch,buildKey:buildKey,generateKeyValues:generateKeyValues,matchValue:matchValue,getResponse:getResponse,getStatusText:getStatusText,mockDispatch:mockDispatch,buildMockDispatch:buildMockDispatch,checkNetConnect:checkNetConnect,buildMockOptions:buildMockOptions,getHeaderByName:getHeaderByName}},9900:(A,e,t)=>{"use strict";const{Transform:r}=t(2203);const{Console:s}=t(4236);A.exports=class PendingInterceptorsFormatter{constructor({disableColors:A}={}){this.transform=new r({transform(A,e,t){t(null,A)}});this.logger=new s({stdout:this.transform,inspectOptions:{colors:!A&&!process.env.CI}})}format(A){const e=A.map((({method:A,path:e,data:{statusCode:t},persist:r,times:s,timesInvoked:o,origin:n})=>({Method:A,Origin:n,Path:e,"Status code":t,Persistent:r?"✅":"❌",Invocations:o,Remaining:r?Infinity:s-o})));this.logger.table(e);return this.transform.read().toString()}}},5503:A=>{"use strict";const e={pronoun:"it",is:"is",was:"was",this:"this"};const t={pronoun:"they",is:"are",was:"were",this:"these"};A.exports=class Pluralizer{constructor(A,e){this.singular=A;this.plural=e}pluralize(A){const r=A===1;const s=r?e:t;const o=r?this.singular:this.plural;return{...s,count:A,noun:o}}}},7739:A=>{"use strict";const e=2048;const t=e-1;class FixedCircularBuffer{constructor(){this.bottom=0;this.top=0;this.list=new Array(e);this.next=null}isEmpty(){return this.top===this.bottom}isFull(){return(this.top+1&t)===this.bottom}push(A){this.list[this.top]=A;this.top=this.top+1&t}shift(){const A=this.list[this.bottom];if(A===undefined)return null;this.list[this.bottom]=undefined;this.bottom=this.bottom+1&t;return A}}A.exports=class FixedQueue{constructor(){this.head=this.tail=new FixedCircularBuffer}isEmpty(){return this.head.isEmpty()}push(A){if(this.head.isFull()){this.head=this.head.next=new FixedCircularBuffer}this.head.push(A)}shift(){const A=this.tail;const e=A.shift();if(A.isEmpty()&&A.next!==null){this.tail=A.next}return e}}},6962:(A,e,t)=>{"use strict";const r=t(4743);const s=t(7739);const{kConnected:o,kSize:n,kRunning:i,kPending:a,kQueued:E,kBusy:g,kFree:c,kUrl:Q,kClose:C,kDestroy:B,kDispatch:I}=t(5817);const h=t(3348);const l=Symbol("clients");const u=Symbol("needDrain");const d=Symbol("queue");const f=Symbol("closed resolve");const p=Symbol("onDrain");const y=Symbol("onConnect");const R=Symbol("onDisconnect");const D=Symbol("onConnectionError");const w=Symbol("get dispatcher");const k=Symbol("add client");const m=Symbol("remove client");const b=Symbol("stats");class PoolBase extends r{constructor(){super();this[d]=new s;this[l]=[];this[E]=0;const A=this;this[p]=function onDrain(e,t){const r=A[d];let s=false;while(!s){const e=r.shift();if(!e){break}A[E]--;s=!this.dispatch(e.opts,e.handler)}this[u]=s;if(!this[u]&&A[u]){A[u]=false;A.emit("drain",e,[A,...t])}if(A[f]&&r.isEmpty()){Promise.all(A[l].map((A=>A.close()))).then(A[f])}};this[y]=(e,t)=>{A.emit("connect",e,[A,...t])};this[R]=(e,t,r)=>{A.emit("disconnect",e,[A,...t],r)};this[D]=(e,t,r)=>{A.emit("connectionError",e,[A,...t],r)};this[b]=new h(this)}get[g](){return this[u]}get[o](){return this[l].filter((A=>A[o])).length}get[c](){return this[l].filter((A=>A[o]&&!A[u])).length}get[a](){let A=this[E];for(const{[a]:e}of this[l]){A+=e}return A}get[i](){let A=0;for(const{[i]:e}of this[l]){A+=e}return A}get[n](){let A=this[E];for(const{[n]:e}of this[l]){A+=e}return A}get stats(){return this[b]}async[C](){if(this[d].isEmpty()){return Promise.all(this[l].map((A=>A.close())))}else{return new Promise((A=>{this[f]=A}))}}async[B](A){while(true){const e=this[d].shift();if(!e){break}e.handler.onError(A)}return Promise.all(this[l].map((e=>e.destroy(A))))}[I](A,e){const t=this[w]();if(!t){this[u]=true;this[d].push({opts:A,handler:e});this[E]++}else if(!t.dispatch(A,e)){t[u]=true;this[u]=!this[w]()}return!this[u]}[k](A){A.on("drain",this[p]).on("connect",this[y]).on("disconnect",this[R]).on("connectionError",this[D]);this[l].push(A);if(this[u]){process.nextTick((()=>{if(this[u]){this[p](A[Q],[this,A])}}))}return this}[m](A){A.close((()=>{const e=this[l].indexOf(A);if(e!==-1){this[l].splice(e,1)}}));this[u]=this[l].some((A=>!A[u]&&A.closed!==true&&A.destroyed!==true))}}A.exports={PoolBase:PoolBase,kClients:l,kNeedDrain:u,kAddClient:k,kRemoveClient:m,kGetDispatcher:w}},3348:(A,e,t)=>{const{kFree:r,kConnected:s,kPending:o,kQueued:n,kRunning:i,kSize:a}=t(5817);const E=Symbol("pool");class PoolStats{constructor(A){this[E]=A}get connected(){return this[E][s]}get free(){return this[E][r]}get pending(){return this[E][o]}get queued(){return this[E][n]}get running(){return this[E][i]}get size(){return this[E][a]}}A.exports=PoolStats},7258:(A,e,t)=>{"use strict";const{PoolBase:r,kClients:s,kNeedDrain:o,kAddClient:n,kGetDispatcher:i}=t(6962);const a=t(4291);const{InvalidArgumentError:E}=t(1369);const g=t(7586);const{kUrl:c,kInterceptors:Q}=t(5817);const C=t(4890);const B=Symbol("options");const I=Symbol("connections");const h=Symbol("factory");function defaultFactory(A,e){return new a(A,e)}class Pool extends r{constructor(A,{connections:e,factory:t=defaultFactory,connect:r,connectTimeout:o,tls:n,maxCachedSessions:i,socketPath:a,autoSelectFamily:l,autoSelectFamilyAttemptTimeout:u,allowH2:d,...f}={}){super();if(e!=null&&(!Number.isFinite(e)||e<0)){throw new E("invalid connections")}if(typeof t!=="function"){throw new E("factory must be a function.")}if(r!=null&&typeof r!=="function"&&typeof r!=="object"){throw new E("connect must be a function or an object")}if(typeof r!=="function"){r=C({...n,maxCachedSessions:i,allowH2:d,socketPath:a,timeout:o,...g.nodeHasAutoSelectFamily&&l?{autoSelectFamily:l,autoSelectFamilyAttemptTimeout:u}:undefined,...r})}this[Q]=f.interceptors&&f.interceptors.Pool&&Array.isArray(f.interceptors.Pool)?f.interceptors.Pool:[];this[I]=e||null;this[c]=g.parseOrigin(A);this[B]={...g.deepClone(f),connect:r,allowH2:d};this[B].interceptors=f.interceptors?{...f.interceptors}:undefined;this[h]=t;this.on("connectionError",((A,e,t)=>{for(const A of e){const e=this[s].indexOf(A);if(e!==-1){this[s].splice(e,1)}}}))}[i](){let A=this[s].find((A=>!A[o]));if(A){return A}if(!this[I]||this[s].length<this[I]){A=this[h](this[c],this[B]);this[n](A)}return A}}A.exports=Pool},6746:(A,e,t)=>{"use strict";const{kProxy:r,kClose:s,kDestroy:o,kInterceptors:n}=t(5817);const{URL:i}=t(7016);const a=t(2415);const E=t(7258);const g=t(4743);const{InvalidArgumentError:c,RequestAbortedError:Q}=t(1369);const C=t(4890);const B=Symbol("proxy agent");const I=Symbol("proxy client");const h=Symbol("proxy headers");const l=Symbol("request tls settings");const u=Symbol("proxy tls settings");const d=Symbol("connect endpoint function");function defaultProtocolPort(A){return A==="https:"?443:80}function buildProxyOptions(A){if(typeof A==="string"){A={uri:A}}if(!A||!A.uri){throw new c("Proxy opts.uri is mandatory")}return{uri:A.uri,protocol:A.protocol||"https"}}function defaultFactory(A,e){return new E(A,e)}class ProxyAgent extends g{constructor(A){super(A);this[r]=buildProxyOptions(A);this[B]=new a(A);this[n]=A.interceptors&&A.interceptors.ProxyAgent&&Array.isArray(A.interceptors.ProxyAgent)?A.interceptors.ProxyAgent:[];if(typeof A==="string"){A={uri:A}}if(!A||!A.uri){throw new c("Proxy opts.uri is mandatory")}const{clientFactory:e=defaultFactory}=A;if(typeof e!=="function"){throw new c("Proxy opts.clientFactory must be a function.")}this[l]=A.requestTls;this[u]=A.proxyTls;this[h]=A.headers||{};const t=new i(A.uri);const{origin:s,port:o,host:E,username:g,password:f}=t;if(A.auth&&A.token){throw new c("opts.auth cannot be used in combination with opts.token")}else if(A.auth){this[h]["proxy-authorization"]=`Basic ${A.auth}`}else if(A.token){this[h]["proxy-authorization"]=A.token}else if(g&&f){this[h]["proxy-authorization"]=`Basic ${Buffer.from(`${decodeURIComponent(g)}:${decodeURIComponent(f)}`).toString("base64")}`}const p=C({...A.proxyTls});this[d]=C({...A.requestTls});this[I]=e(t,{connect:p});this[B]=new a({...A,connect:async(A,e)=>{let t=A.host;if(!A.port){t+=`:${defaultProtocolPort(A.protocol)}`}try{const{socket:r,statusCode:n}=await this[I].connect({origin:s,port:o,path:t,signal:A.signal,headers:{...this[h],host:E}});if(n!==200){r.on("error",(()=>{})).destroy();e(new Q(`Proxy response (${n}) !== 200 when HTTP Tunneling`))}if(A.protocol!=="https:"){e(null,r);return}let i;if(this[l]){i=this[l].servername}else{i=A.servername}this[d]({...A,servername:i,httpSocket:r},e)}catch(A){e(A)}}})}dispatch(A,e){const{host:t}=new i(A.origin);const r=buildHeaders(A.headers);throwIfProxyAuthIsSent(r);return this[B].dispatch({...A,headers:{...r,host:t}},e)}async[s](){await this[B].close();await this[I].close()}async[o](){await this[B].destroy();await this[I].destroy()}}function buildHeaders(A){if(Array.isArray(A)){const e={};for(let t=0;t<A.length;t+=2){e[A[t]]=A[t+1]}return e}return A}function throwIfProxyAuthIsSent(A){const e=A&&Object.keys(A).find((A=>A.toLowerCase()==="proxy-authorization"));if(e){throw new c("Proxy-Authorization should be sent in ProxyAgent constructor")}}A.exports=ProxyAgent},7930:A=>{"use strict";let e=Date.now();let t;const r=[];function onTimeout(){e=Date.now();let A=r.length;let t=0;while(t<A){const s=r[t];if(s.state===0){s.state=e+s.delay}else if(s.state>0&&e>=s.state){s.state=-1;s.callback(s.opaque)}if(s.state===-1){s.state=-2;if(t!==A-1){r[t]=r.pop()}else{r.pop()}A-=1}else{t+=1}}if(r.length>0){refreshTimeout()}}function refreshTimeout(){if(t&&t.refresh){t.refresh()}else{clearTimeout(t);t=setTimeout(onTimeout,1e3);if(t.unref){t.unref()}}}class Timeout{constructor(A,e,t){this.callback=A;this.delay=e;this.opaque=t;this.state=-2;this.refresh()}refresh(){if(this.state===-2){r.push(this);if(!t||r.length===1){refreshTimeout()}}this.state=0}clear(){this.state=-1}}A.exports={setTimeout(A,e,t){return e<1e3?setTimeout(A,e,t):new Timeout(A,e,t)},clearTimeout(A){if(A instanceof Timeout){A.clear()}else{clearTimeout(A)}}}},3412:(A,e,t)=>{"use strict";const r=t(1637);const{uid:s,states:o}=t(2559);const{kReadyState:n,kSentClose:i,kByteParser:a,kReceivedClose:E}=t(5851);const{fireEvent:g,failWebsocketConnection:c}=t(6256);const{CloseEvent:Q}=t(9741);const{makeRequest:C}=t(3056);const{fetching:B}=t(8053);const{Headers:I}=t(6939);const{getGlobalDispatcher:h}=t(4127);const{kHeadersList:l}=t(5817);const u={};u.open=r.channel("undici:websocket:open");u.close=r.channel("undici:websocket:close");u.socketError=r.channel("undici:websocket:socket_error");let d;try{d=t(6982)}catch{}function establishWebSocketConnection(A,e,t,r,o){const n=A;n.protocol=A.protocol==="ws:"?"http:":"https:";const i=C({urlList:[n],serviceWorkers:"none",referrer:"no-referrer",mode:"websocket",credentials:"include",cache:"no-store",redirect:"error"});if(o.headers){const A=new I(o.headers)[l];i.headersList=A}const a=d.randomBytes(16).toString("base64");i.headersList.append("sec-websocket-key",a);i.headersList.append("sec-websocket-version","13");for(const A of e){i.headersList.append("sec-websocket-protocol",A)}const E="";const g=B({request:i,useParallelQueue:true,dispatcher:o.dispatcher??h(),processResponse(A){if(A.type==="error"||A.status!==101){c(t,"Received network error or non-101 status code.");return}if(e.length!==0&&!A.headersList.get("Sec-WebSocket-Protocol")){c(t,"Server did not respond with sent protocols.");return}if(A.headersList.get("Upgrade")?.toLowerCase()!=="websocket"){c(t,'Server did not set Upgrade header to "websocket".');return}if(A.headersList.get("Connection")?.toLowerCase()!=="upgrade"){c(t,'Server did not set Connection header to "upgrade".');return}const o=A.headersList.get("Sec-WebSocket-Accept");const n=d.createHash("sha1").update(a+s).digest("base64");if(o!==n){c(t,"Incorrect hash received in Sec-WebSocket-Accept header.");return}const g=A.headersList.get("Sec-WebSocket-Extensions");if(g!==null&&g!==E){c(t,"Received different permessage-deflate than the one set.");return}const Q=A.headersList.get("Sec-WebSocket-Protocol");if(Q!==null&&Q!==i.headersList.get("Sec-WebSocket-Protocol")){c(t,"Protocol was not set in the opening handshake.");return}A.socket.on("data",onSocketData);A.socket.on("close",onSocketClose);A.socket.on("error",onSocketError);if(u.open.hasSubscribers){u.open.publish({address:A.socket.address(),protocol:Q,extensions:g})}r(A)}});return g}function onSocketData(A){if(!this.ws[a].write(A)){this.pause()}}function onSocketClose(){const{ws:A}=this;const e=A[i]&&A[E];let t=1005;let r="";const s=A[a].closingInfo;if(s){t=s.code??1005;r=s.reason}else if(!A[i]){t=1006}A[n]=o.CLOSED;g("close",A,Q,{wasClean:e,code:t,reason:r});if(u.close.hasSubscribers){u.close.publish({websocket:A,code:t,reason:r})}}function onSocketError(A){const{ws:e}=this;e[n]=o.CLOSING;if(u.socketError.hasSubscribers){u.socketError.publish(A)}this.destroy()}A.exports={establishWebSocketConnection:establishWebSocketConnection}},2559:A=>{"use strict";const e="258EAFA5-E914-47DA-95CA-C5AB0DC85B11";const t={enumerable:true,writable:false,configurable:false};const r={CONNECTING:0,OPEN:1,CLOSING:2,CLOSED:3};const s={CONTINUATION:0,TEXT:1,BINARY:2,CLOSE:8,PING:9,PONG:10};const o=2**16-1;const n={INFO:0,PAYLOADLENGTH_16:2,PAYLOADLENGTH_64:3,READ_DATA:4};const i=Buffer.allocUnsafe(0);A.exports={uid:e,staticPropertyDescriptors:t,states:r,opcodes:s,maxUnsigned16Bit:o,parserStates:n,emptyBuffer:i}},9741:(A,e,t)=>{"use strict";const{webidl:r}=t(9040);const{kEnumerableProperty:s}=t(7586);const{MessagePort:o}=t(8167);class MessageEvent extends Event{#o;constructor(A,e={}){r.argumentLengthCheck(arguments,1,{header:"MessageEvent constructor"});A=r.converters.DOMString(A);e=r.converters.MessageEventInit(e);super(A,e);this.#o=e}get data(){r.brandCheck(this,MessageEvent);return this.#o.data}get origin(){r.brandCheck(this,MessageEvent);return this.#o.origin}get lastEventId(){r.brandCheck(this,MessageEvent);return this.#o.lastEventId}get source(){r.brandCheck(this,MessageEvent);return this.#o.source}get ports(){r.brandCheck(this,MessageEvent);if(!Object.isFrozen(this.#o.ports)){Object.freeze(this.#o.ports)}return this.#o.ports}initMessageEvent(A,e=false,t=false,s=null,o="",n="",i=null,a=[]){r.brandCheck(this,MessageEvent);r.argumentLengthCheck(arguments,1,{header:"MessageEvent.initMessageEvent"});return new MessageEvent(A,{bubbles:e,cancelable:t,data:s,origin:o,lastEventId:n,source:i,ports:a})}}class CloseEvent extends Event{#o;constructor(A,e={}){r.argumentLengthCheck(arguments,1,{header:"CloseEvent constructor"});A=r.converters.DOMString(A);e=r.converters.CloseEventInit(e);super(A,e);this.#o=e}get wasClean(){r.brandCheck(this,CloseEvent);return this.#o.wasClean}get code(){r.brandCheck(this,CloseEvent);return this.#o.code}get reason(){r.brandCheck(this,CloseEvent);return this.#o.reason}}class ErrorEvent extends Event{#o;constructor(A,e){r.argumentLengthCheck(arguments,1,{header:"ErrorEvent constructor"});super(A,e);A=r.converters.DOMString(A);e=r.converters.ErrorEventInit(e??{});this.#o=e}get message(){r.brandCheck(this,ErrorEvent);return this.#o.message}get filename(){r.brandCheck(this,ErrorEvent);return this.#o.filename}get lineno(){r.brandCheck(this,ErrorEvent);return this.#o.lineno}get colno(){r.brandCheck(this,ErrorEvent);return this.#o.colno}get error(){r.brandCheck(this,ErrorEvent);return this.#o.error}}Object.defineProperties(MessageEvent.prototype,{[Symbol.toStringTag]:{value:"MessageEvent",configurable:true},data:s,origin:s,lastEventId:s,source:s,ports:s,initMessageEvent:s});Object.defineProperties(CloseEvent.prototype,{[Symbol.toStringTag]:{value:"CloseEvent",configurable:true},reason:s,code:s,wasClean:s});Object.defineProperties(ErrorEvent.prototype,{[Symbol.toStringTag]:{value:"ErrorEvent",configurable:true},message:s,filename:s,lineno:s,colno:s,error:s});r.converters.MessagePort=r.interfaceConverter(o);r.converters["sequence<MessagePort>"]=r.sequenceConverter(r.converters.MessagePort);const n=[{key:"bubbles",converter:r.converters.boolean,defaultValue:false},{key:"cancelable",converter:r.converters.boolean,defaultValue:false},{key:"composed",converter:r.converters.boolean,defaultValue:false}];r.converters.MessageEventInit=r.dictionaryConverter([...n,{key:"data",converter:r.converters.any,defaultValue:null},{key:"origin",converter:r.converters.USVString,defaultValue:""},{key:"lastEventId",converter:r.converters.DOMString,defaultValue:""},{key:"source",converter:r.nullableConverter(r.converters.MessagePort),defaultValue:null},{key:"ports",converter:r.converters["sequence<MessagePort>"],get defaultValue(){return[]}}]);r.converters.CloseEventInit=r.dictionaryConverter([...n,{key:"wasClean",converter:r.converters.boolean,defaultValue:false},{key:"code",converter:r.converters["unsigned short"],defaultValue:0},{key:"reason",converter:r.converters.USVString,defaultValue:""}]);r.converters.ErrorEventInit=r.dictionaryConverter([...n,{key:"message",converter:r.converters.DOMString,defaultValue:""},{key:"filename",converter:r.converters.USVString,defaultValue:""},{key:"lineno",converter:r.converters["unsigned long"],defaultValue:0},{key:"colno",converter:r.converters["unsigned long"],defaultValue:0},{key:"error",converter:r.converters.any}]);A.exports={MessageEvent:MessageEvent,CloseEvent:CloseEvent,ErrorEvent:ErrorEvent}},7059:(A,e,t)=>{"use strict";const{maxUnsigned16Bit:r}=t(2559);let s;try{s=t(6982)}catch{}class WebsocketFrameSend{constructor(A){this.frameData=A;this.maskKey=s.randomBytes(4)}createFrame(A){const e=this.frameData?.byteLength??0;let t=e;let s=6;if(e>r){s+=8;t=127}else if(e>125){s+=2;t=126}const o=Buffer.allocUnsafe(e+s);o[0]=o[1]=0;o[0]|=128;o[0]=(o[0]&240)+A;
-/*! ws. MIT License. Einar Otto Stangvik <einaros@gmail.com> */o[s-4]=this.maskKey[0];o[s-3]=this.maskKey[1];o[s-2]=this.maskKey[2];o[s-1]=this.maskKey[3];o[1]=t;if(t===126){o.writeUInt16BE(e,2)}else if(t===127){o[2]=o[3]=0;o.writeUIntBE(e,4,6)}o[1]|=128;for(let A=0;A<e;A++){o[s+A]=this.frameData[A]^this.maskKey[A%4]}return o}}A.exports={WebsocketFrameSend:WebsocketFrameSend}},1821:(A,e,t)=>{"use strict";const{Writable:r}=t(2203);const s=t(1637);const{parserStates:o,opcodes:n,states:i,emptyBuffer:a}=t(2559);const{kReadyState:E,kSentClose:g,kResponse:c,kReceivedClose:Q}=t(5851);const{isValidStatusCode:C,failWebsocketConnection:B,websocketMessageReceived:I}=t(6256);const{WebsocketFrameSend:h}=t(7059);const l={};l.ping=s.channel("undici:websocket:ping");l.pong=s.channel("undici:websocket:pong");class ByteParser extends r{#n=[];#i=0;#a=o.INFO;#E={};#g=[];constructor(A){super();this.ws=A}_write(A,e,t){this.#n.push(A);this.#i+=A.length;this.run(t)}run(A){while(true){if(this.#a===o.INFO){if(this.#i<2){return A()}const e=this.consume(2);this.#E.fin=(e[0]&128)!==0;this.#E.opcode=e[0]&15;this.#E.originalOpcode??=this.#E.opcode;this.#E.fragmented=!this.#E.fin&&this.#E.opcode!==n.CONTINUATION;if(this.#E.fragmented&&this.#E.opcode!==n.BINARY&&this.#E.opcode!==n.TEXT){B(this.ws,"Invalid frame type was fragmented.");return}const t=e[1]&127;if(t<=125){this.#E.payloadLength=t;this.#a=o.READ_DATA}else if(t===126){this.#a=o.PAYLOADLENGTH_16}else if(t===127){this.#a=o.PAYLOADLENGTH_64}if(this.#E.fragmented&&t>125){B(this.ws,"Fragmented frame exceeded 125 bytes.");return}else if((this.#E.opcode===n.PING||this.#E.opcode===n.PONG||this.#E.opcode===n.CLOSE)&&t>125){B(this.ws,"Payload length for control frame exceeded 125 bytes.");return}else if(this.#E.opcode===n.CLOSE){if(t===1){B(this.ws,"Received close frame with a 1-byte body.");return}const A=this.consume(t);this.#E.closeInfo=this.parseCloseBody(false,A);if(!this.ws[g]){const A=Buffer.allocUnsafe(2);A.writeUInt16BE(this.#E.closeInfo.code,0);const e=new h(A);this.ws[c].socket.write(e.createFrame(n.CLOSE),(A=>{if(!A){this.ws[g]=true}}))}this.ws[E]=i.CLOSING;this.ws[Q]=true;this.end();return}else if(this.#E.opcode===n.PING){const e=this.consume(t);if(!this.ws[Q]){const A=new h(e);this.ws[c].socket.write(A.createFrame(n.PONG));if(l.ping.hasSubscribers){l.ping.publish({payload:e})}}this.#a=o.INFO;if(this.#i>0){continue}else{A();return}}else if(this.#E.opcode===n.PONG){const e=this.consume(t);if(l.pong.hasSubscribers){l.pong.publish({payload:e})}if(this.#i>0){continue}else{A();return}}}else if(this.#a===o.PAYLOADLENGTH_16){if(this.#i<2){return A()}const e=this.consume(2);this.#E.payloadLength=e.readUInt16BE(0);this.#a=o.READ_DATA}else if(this.#a===o.PAYLOADLENGTH_64){if(this.#i<8){return A()}const e=this.consume(8);const t=e.readUInt32BE(0);if(t>2**31-1){B(this.ws,"Received payload length > 2^31 bytes.");return}const r=e.readUInt32BE(4);this.#E.payloadLength=(t<<8)+r;this.#a=o.READ_DATA}else if(this.#a===o.READ_DATA){if(this.#i<this.#E.payloadLength){return A()}else if(this.#i>=this.#E.payloadLength){const A=this.consume(this.#E.payloadLength);this.#g.push(A);if(!this.#E.fragmented||this.#E.fin&&this.#E.opcode===n.CONTINUATION){const A=Buffer.concat(this.#g);I(this.ws,this.#E.originalOpcode,A);this.#E={};this.#g.length=0}this.#a=o.INFO}}if(this.#i>0){continue}else{A();break}}}consume(A){if(A>this.#i){return null}else if(A===0){return a}if(this.#n[0].length===A){this.#i-=this.#n[0].length;return this.#n.shift()}const e=Buffer.allocUnsafe(A);let t=0;while(t!==A){const r=this.#n[0];const{length:s}=r;if(s+t===A){e.set(this.#n.shift(),t);break}else if(s+t>A){e.set(r.subarray(0,A-t),t);this.#n[0]=r.subarray(A-t);break}else{e.set(this.#n.shift(),t);t+=r.length}}this.#i-=A;return e}parseCloseBody(A,e){let t;if(e.length>=2){t=e.readUInt16BE(0)}if(A){if(!C(t)){return null}return{code:t}}let r=e.subarray(2);if(r[0]===239&&r[1]===187&&r[2]===191){r=r.subarray(3)}if(t!==undefined&&!C(t)){return null}try{r=new TextDecoder("utf-8",{fatal:true}).decode(r)}catch{return null}return{code:t,reason:r}}get closingInfo(){return this.#E.closeInfo}}A.exports={ByteParser:ByteParser}},5851:A=>{"use strict";A.exports={kWebSocketURL:Symbol("url"),kReadyState:Symbol("ready state"),kController:Symbol("controller"),kResponse:Symbol("response"),kBinaryType:Symbol("binary type"),kSentClose:Symbol("sent close"),kReceivedClose:Symbol("received close"),kByteParser:Symbol("byte parser")}},6256:(A,e,t)=>{"use strict";const{kReadyState:r,kController:s,kResponse:o,kBinaryType:n,kWebSocketURL:i}=t(5851);const{states:a,opcodes:E}=t(2559);const{MessageEvent:g,ErrorEvent:c}=t(9741);function isEstablished(A){return A[r]===a.OPEN}function isClosing(A){return A[r]===a.CLOSING}function isClosed(A){return A[r]===a.CLOSED}function fireEvent(A,e,t=Event,r){const s=new t(A,r);e.dispatchEvent(s)}function websocketMessageReceived(A,e,t){if(A[r]!==a.OPEN){return}let s;if(e===E.TEXT){try{s=new TextDecoder("utf-8",{fatal:true}).decode(t)}catch{failWebsocketConnection(A,"Received invalid UTF-8 in text frame.");return}}else if(e===E.BINARY){if(A[n]==="blob"){s=new Blob([t])}else{s=new Uint8Array(t).buffer}}fireEvent("message",A,g,{origin:A[i].origin,data:s})}function isValidSubprotocol(A){if(A.length===0){return false}for(const e of A){const A=e.charCodeAt(0);if(A<33||A>126||e==="("||e===")"||e==="<"||e===">"||e==="@"||e===","||e===";"||e===":"||e==="\\"||e==='"'||e==="/"||e==="["||e==="]"||e==="?"||e==="="||e==="{"||e==="}"||A===32||A===9){return false}}return true}function isValidStatusCode(A){if(A>=1e3&&A<1015){return A!==1004&&A!==1005&&A!==1006}return A>=3e3&&A<=4999}function failWebsocketConnection(A,e){const{[s]:t,[o]:r}=A;t.abort();if(r?.socket&&!r.socket.destroyed){r.socket.destroy()}if(e){fireEvent("error",A,c,{error:new Error(e)})}}A.exports={isEstablished:isEstablished,isClosing:isClosing,isClosed:isClosed,fireEvent:fireEvent,isValidSubprotocol:isValidSubprotocol,isValidStatusCode:isValidStatusCode,failWebsocketConnection:failWebsocketConnection,websocketMessageReceived:websocketMessageReceived}},7785:(A,e,t)=>{"use strict";const{webidl:r}=t(9040);const{DOMException:s}=t(6732);const{URLSerializer:o}=t(1620);const{getGlobalOrigin:n}=t(7074);const{staticPropertyDescriptors:i,states:a,opcodes:E,emptyBuffer:g}=t(2559);const{kWebSocketURL:c,kReadyState:Q,kController:C,kBinaryType:B,kResponse:I,kSentClose:h,kByteParser:l}=t(5851);const{isEstablished:u,isClosing:d,isValidSubprotocol:f,failWebsocketConnection:p,fireEvent:y}=t(6256);const{establishWebSocketConnection:R}=t(3412);const{WebsocketFrameSend:D}=t(7059);const{ByteParser:w}=t(1821);const{kEnumerableProperty:k,isBlobLike:m}=t(7586);const{getGlobalDispatcher:b}=t(4127);const{types:F}=t(9023);let S=false;class WebSocket extends EventTarget{#c={open:null,error:null,close:null,message:null};#Q=0;#C="";#B="";constructor(A,e=[]){super();r.argumentLengthCheck(arguments,1,{header:"WebSocket constructor"});if(!S){S=true;process.emitWarning("WebSockets are experimental, expect them to change at any time.",{code:"UNDICI-WS"})}const t=r.converters["DOMString or sequence<DOMString> or WebSocketInit"](e);A=r.converters.USVString(A);e=t.protocols;const o=n();let i;try{i=new URL(A,o)}catch(A){throw new s(A,"SyntaxError")}if(i.protocol==="http:"){i.protocol="ws:"}else if(i.protocol==="https:"){i.protocol="wss:"}if(i.protocol!=="ws:"&&i.protocol!=="wss:"){throw new s(`Expected a ws: or wss: protocol, got ${i.protocol}`,"SyntaxError")}if(i.hash||i.href.endsWith("#")){throw new s("Got fragment","SyntaxError")}if(typeof e==="string"){e=[e]}if(e.length!==new Set(e.map((A=>A.toLowerCase()))).size){throw new s("Invalid Sec-WebSocket-Protocol value","SyntaxError")}if(e.length>0&&!e.every((A=>f(A)))){throw new s("Invalid Sec-WebSocket-Protocol value","SyntaxError")}this[c]=new URL(i.href);this[C]=R(i,e,this,(A=>this.#I(A)),t);this[Q]=WebSocket.CONNECTING;this[B]="blob"}close(A=undefined,e=undefined){r.brandCheck(this,WebSocket);if(A!==undefined){A=r.converters["unsigned short"](A,{clamp:true})}if(e!==undefined){e=r.converters.USVString(e)}if(A!==undefined){if(A!==1e3&&(A<3e3||A>4999)){throw new s("invalid code","InvalidAccessError")}}let t=0;if(e!==undefined){t=Buffer.byteLength(e);if(t>123){throw new s(`Reason must be less than 123 bytes; received ${t}`,"SyntaxError")}}if(this[Q]===WebSocket.CLOSING||this[Q]===WebSocket.CLOSED){}else if(!u(this)){p(this,"Connection was closed before it was established.");this[Q]=WebSocket.CLOSING}else if(!d(this)){const r=new D;if(A!==undefined&&e===undefined){r.frameData=Buffer.allocUnsafe(2);r.frameData.writeUInt16BE(A,0)}else if(A!==undefined&&e!==undefined){r.frameData=Buffer.allocUnsafe(2+t);r.frameData.writeUInt16BE(A,0);r.frameData.write(e,2,"utf-8")}else{r.frameData=g}const s=this[I].socket;s.write(r.createFrame(E.CLOSE),(A=>{if(!A){this[h]=true}}));this[Q]=a.CLOSING}else{this[Q]=WebSocket.CLOSING}}send(A){r.brandCheck(this,WebSocket);r.argumentLengthCheck(arguments,1,{header:"WebSocket.send"});A=r.converters.WebSocketSendData(A);if(this[Q]===WebSocket.CONNECTING){throw new s("Sent before connected.","InvalidStateError")}if(!u(this)||d(this)){return}const e=this[I].socket;if(typeof A==="string"){const t=Buffer.from(A);const r=new D(t);const s=r.createFrame(E.TEXT);this.#Q+=t.byteLength;e.write(s,(()=>{this.#Q-=t.byteLength}))}else if(F.isArrayBuffer(A)){const t=Buffer.from(A);const r=new D(t);const s=r.createFrame(E.BINARY);this.#Q+=t.byteLength;e.write(s,(()=>{this.#Q-=t.byteLength}))}else if(ArrayBuffer.isView(A)){const t=Buffer.from(A,A.byteOffset,A.byteLength);const r=new D(t);const s=r.createFrame(E.BINARY);this.#Q+=t.byteLength;e.write(s,(()=>{this.#Q-=t.byteLength}))}else if(m(A)){const t=new D;A.arrayBuffer().then((A=>{const r=Buffer.from(A);t.frameData=r;const s=t.createFrame(E.BINARY);this.#Q+=r.byteLength;e.write(s,(()=>{this.#Q-=r.byteLength}))}))}}get readyState(){r.brandCheck(this,WebSocket);return this[Q]}get bufferedAmount(){r.brandCheck(this,WebSocket);return this.#Q}get url(){r.brandCheck(this,WebSocket);return o(this[c])}get extensions(){r.brandCheck(this,WebSocket);return this.#B}get protocol(){r.brandCheck(this,WebSocket);return this.#C}get onopen(){r.brandCheck(this,WebSocket);return this.#c.open}set onopen(A){r.brandCheck(this,WebSocket);if(this.#c.open){this.removeEventListener("open",this.#c.open)}if(typeof A==="function"){this.#c.open=A;this.addEventListener("open",A)}else{this.#c.open=null}}get onerror(){r.brandCheck(this,WebSocket);return this.#c.error}set onerror(A){r.brandCheck(this,WebSocket);if(this.#c.error){this.removeEventListener("error",this.#c.error)}if(typeof A==="function"){this.#c.error=A;this.addEventListener("error",A)}else{this.#c.error=null}}get onclose(){r.brandCheck(this,WebSocket);return this.#c.close}set onclose(A){r.brandCheck(this,WebSocket);if(this.#c.close){this.removeEventListener("close",this.#c.close)}if(typeof A==="function"){this.#c.close=A;this.addEventListener("close",A)}else{this.#c.close=null}}get onmessage(){r.brandCheck(this,WebSocket);return this.#c.message}set onmessage(A){r.brandCheck(this,WebSocket);if(this.#c.message){this.removeEventListener("message",this.#c.message)}if(typeof A==="function"){this.#c.message=A;this.addEventListener("message",A)}else{this.#c.message=null}}get binaryType(){r.brandCheck(this,WebSocket);return this[B]}set binaryType(A){r.brandCheck(this,WebSocket);if(A!=="blob"&&A!=="arraybuffer"){this[B]="blob"}else{this[B]=A}}#I(A){this[I]=A;const e=new w(this);e.on("drain",(function onParserDrain(){this.ws[I].socket.resume()}));A.socket.ws=this;this[l]=e;this[Q]=a.OPEN;const t=A.headersList.get("sec-websocket-extensions");if(t!==null){this.#B=t}const r=A.headersList.get("sec-websocket-protocol");if(r!==null){this.#C=r}y("open",this)}}WebSocket.CONNECTING=WebSocket.prototype.CONNECTING=a.CONNECTING;WebSocket.OPEN=WebSocket.prototype.OPEN=a.OPEN;WebSocket.CLOSING=WebSocket.prototype.CLOSING=a.CLOSING;WebSocket.CLOSED=WebSocket.prototype.CLOSED=a.CLOSED;Object.defineProperties(WebSocket.prototype,{CONNECTING:i,OPEN:i,CLOSING:i,CLOSED:i,url:k,readyState:k,bufferedAmount:k,onopen:k,onerror:k,onclose:k,close:k,onmessage:k,binaryType:k,send:k,extensions:k,protocol:k,[Symbol.toStringTag]:{value:"WebSocket",writable:false,enumerable:false,configurable:true}});Object.defineProperties(WebSocket,{CONNECTING:i,OPEN:i,CLOSING:i,CLOSED:i});r.converters["sequence<DOMString>"]=r.sequenceConverter(r.converters.DOMString);r.converters["DOMString or sequence<DOMString>"]=function(A){if(r.util.Type(A)==="Object"&&Symbol.iterator in A){return r.converters["sequence<DOMString>"](A)}return r.converters.DOMString(A)};r.converters.WebSocketInit=r.dictionaryConverter([{key:"protocols",converter:r.converters["DOMString or sequence<DOMString>"],get defaultValue(){return[]}},{key:"dispatcher",converter:A=>A,get defaultValue(){return b()}},{key:"headers",converter:r.nullableConverter(r.converters.HeadersInit)}]);r.converters["DOMString or sequence<DOMString> or WebSocketInit"]=function(A){if(r.util.Type(A)==="Object"&&!(Symbol.iterator in A)){return r.converters.WebSocketInit(A)}return{protocols:r.converters["DOMString or sequence<DOMString>"](A)}};r.converters.WebSocketSendData=function(A){if(r.util.Type(A)==="Object"){if(m(A)){return r.converters.Blob(A,{strict:false})}if(ArrayBuffer.isView(A)||F.isAnyArrayBuffer(A)){return r.converters.BufferSource(A)}}return r.converters.USVString(A)};A.exports={WebSocket:WebSocket}},2613:A=>{"use strict";A.exports=require("assert")},290:A=>{"use strict";A.exports=require("async_hooks")},181:A=>{"use strict";A.exports=require("buffer")},5317:A=>{"use strict";A.exports=require("child_process")},4236:A=>{"use strict";A.exports=require("console")},6982:A=>{"use strict";A.exports=require("crypto")},1637:A=>{"use strict";A.exports=require("diagnostics_channel")},4434:A=>{"use strict";A.exports=require("events")},9896:A=>{"use strict";A.exports=require("fs")},8611:A=>{"use strict";A.exports=require("http")},5675:A=>{"use strict";A.exports=require("http2")},5692:A=>{"use strict";A.exports=require("https")},9278:A=>{"use strict";A.exports=require("net")},7598:A=>{"use strict";A.exports=require("node:crypto")},8474:A=>{"use strict";A.exports=require("node:events")},7075:A=>{"use strict";A.exports=require("node:stream")},7975:A=>{"use strict";A.exports=require("node:util")},857:A=>{"use strict";A.exports=require("os")},6928:A=>{"use strict";A.exports=require("path")},2987:A=>{"use strict";A.exports=require("perf_hooks")},3480:A=>{"use strict";A.exports=require("querystring")},2203:A=>{"use strict";A.exports=require("stream")},3774:A=>{"use strict";A.exports=require("stream/web")},3193:A=>{"use strict";A.exports=require("string_decoder")},3557:A=>{"use strict";A.exports=require("timers")},4756:A=>{"use strict";A.exports=require("tls")},7016:A=>{"use strict";A.exports=require("url")},9023:A=>{"use strict";A.exports=require("util")},8253:A=>{"use strict";A.exports=require("util/types")},8167:A=>{"use strict";A.exports=require("worker_threads")},3106:A=>{"use strict";A.exports=require("zlib")},4020:(A,e,t)=>{"use strict";const r=t(7075).Writable;const s=t(7975).inherits;const o=t(9330);const n=t(9858);const i=t(1033);const a=45;const E=Buffer.from("-");const g=Buffer.from("\r\n");const EMPTY_FN=function(){};function Dicer(A){if(!(this instanceof Dicer)){return new Dicer(A)}r.call(this,A);if(!A||!A.headerFirst&&typeof A.boundary!=="string"){throw new TypeError("Boundary required")}if(typeof A.boundary==="string"){this.setBoundary(A.boundary)}else{this._bparser=undefined}this._headerFirst=A.headerFirst;this._dashes=0;this._parts=0;this._finished=false;this._realFinish=false;this._isPreamble=true;this._justMatched=false;this._firstWrite=true;this._inHeader=true;this._part=undefined;this._cb=undefined;this._ignoreData=false;this._partOpts={highWaterMark:A.partHwm};this._pause=false;const e=this;this._hparser=new i(A);this._hparser.on("header",(function(A){e._inHeader=false;e._part.emit("header",A)}))}s(Dicer,r);Dicer.prototype.emit=function(A){if(A==="finish"&&!this._realFinish){if(!this._finished){const A=this;process.nextTick((function(){A.emit("error",new Error("Unexpected end of multipart data"));if(A._part&&!A._ignoreData){const e=A._isPreamble?"Preamble":"Part";A._part.emit("error",new Error(e+" terminated early due to unexpected end of multipart data"));A._part.push(null);process.nextTick((function(){A._realFinish=true;A.emit("finish");A._realFinish=false}));return}A._realFinish=true;A.emit("finish");A._realFinish=false}))}}else{r.prototype.emit.apply(this,arguments)}};Dicer.prototype._write=function(A,e,t){if(!this._hparser&&!this._bparser){return t()}if(this._headerFirst&&this._isPreamble){if(!this._part){this._part=new n(this._partOpts);if(this.listenerCount("preamble")!==0){this.emit("preamble",this._part)}else{this._ignore()}}const e=this._hparser.push(A);if(!this._inHeader&&e!==undefined&&e<A.length){A=A.slice(e)}else{return t()}}if(this._firstWrite){this._bparser.push(g);this._firstWrite=false}this._bparser.push(A);if(this._pause){this._cb=t}else{t()}};Dicer.prototype.reset=function(){this._part=undefined;this._bparser=undefined;this._hparser=undefined};Dicer.prototype.setBoundary=function(A){const e=this;this._bparser=new o("\r\n--"+A);this._bparser.on("info",(function(A,t,r,s){e._oninfo(A,t,r,s)}))};Dicer.prototype._ignore=function(){if(this._part&&!this._ignoreData){this._ignoreData=true;this._part.on("error",EMPTY_FN);this._part.resume()}};Dicer.prototype._oninfo=function(A,e,t,r){let s;const o=this;let i=0;let g;let c=true;if(!this._part&&this._justMatched&&e){while(this._dashes<2&&t+i<r){if(e[t+i]===a){++i;++this._dashes}else{if(this._dashes){s=E}this._dashes=0;break}}if(this._dashes===2){if(t+i<r&&this.listenerCount("trailer")!==0){this.emit("trailer",e.slice(t+i,r))}this.reset();this._finished=true;if(o._parts===0){o._realFinish=true;o.emit("finish");o._realFinish=false}}if(this._dashes){return}}if(this._justMatched){this._justMatched=false}if(!this._part){this._part=new n(this._partOpts);this._part._read=function(A){o._unpause()};if(this._isPreamble&&this.listenerCount("preamble")!==0){this.emit("preamble",this._part)}else if(this._isPreamble!==true&&this.listenerCount("part")!==0){this.emit("part",this._part)}else{this._ignore()}if(!this._isPreamble){this._inHeader=true}}if(e&&t<r&&!this._ignoreData){if(this._isPreamble||!this._inHeader){if(s){c=this._part.push(s)}c=this._part.push(e.slice(t,r));if(!c){this._pause=true}}else if(!this._isPreamble&&this._inHeader){if(s){this._hparser.push(s)}g=this._hparser.push(e.slice(t,r));if(!this._inHeader&&g!==undefined&&g<r){this._oninfo(false,e,t+g,r)}}}if(A){this._hparser.reset();if(this._isPreamble){this._isPreamble=false}else{if(t!==r){++this._parts;this._part.on("end",(function(){if(--o._parts===0){if(o._finished){o._realFinish=true;o.emit("finish");o._realFinish=false}else{o._unpause()}}}))}}this._part.push(null);this._part=undefined;this._ignoreData=false;this._justMatched=true;this._dashes=0}};Dicer.prototype._unpause=function(){if(!this._pause){return}this._pause=false;if(this._cb){const A=this._cb;this._cb=undefined;A()}};A.exports=Dicer},1033:(A,e,t)=>{"use strict";const r=t(8474).EventEmitter;const s=t(7975).inherits;const o=t(5943);const n=t(9330);const i=Buffer.from("\r\n\r\n");const a=/\r\n/g;const E=/^([^:]+):[ \t]?([\x00-\xFF]+)?$/;function HeaderParser(A){r.call(this);A=A||{};const e=this;this.nread=0;this.maxed=false;this.npairs=0;this.maxHeaderPairs=o(A,"maxHeaderPairs",2e3);this.maxHeaderSize=o(A,"maxHeaderSize",80*1024);this.buffer="";this.header={};this.finished=false;this.ss=new n(i);this.ss.on("info",(function(A,t,r,s){if(t&&!e.maxed){if(e.nread+s-r>=e.maxHeaderSize){s=e.maxHeaderSize-e.nread+r;e.nread=e.maxHeaderSize;e.maxed=true}else{e.nread+=s-r}e.buffer+=t.toString("binary",r,s)}if(A){e._finish()}}))}s(HeaderParser,r);HeaderParser.prototype.push=function(A){const e=this.ss.push(A);if(this.finished){return e}};HeaderParser.prototype.reset=function(){this.finished=false;this.buffer="";this.header={};this.ss.reset()};HeaderParser.prototype._finish=function(){if(this.buffer){this._parseHeader()}this.ss.matches=this.ss.maxMatches;const A=this.header;this.header={};this.buffer="";this.finished=true;this.nread=this.npairs=0;this.maxed=false;this.emit("header",A)};HeaderParser.prototype._parseHeader=function(){if(this.npairs===this.maxHeaderPairs){return}const A=this.buffer.split(a);const e=A.length;let t,r;for(var s=0;s<e;++s){if(A[s].length===0){continue}if(A[s][0]==="\t"||A[s][0]===" "){if(r){this.header[r][this.header[r].length-1]+=A[s];continue}}const e=A[s].indexOf(":");if(e===-1||e===0){return}t=E.exec(A[s]);r=t[1].toLowerCase();this.header[r]=this.header[r]||[];this.header[r].push(t[2]||"");if(++this.npairs===this.maxHeaderPairs){break}}};A.exports=HeaderParser},9858:(A,e,t)=>{"use strict";const r=t(7975).inherits;const s=t(7075).Readable;function PartStream(A){s.call(this,A)}r(PartStream,s);PartStream.prototype._read=function(A){};A.exports=PartStream},9330:(A,e,t)=>{"use strict";const r=t(8474).EventEmitter;const s=t(7975).inherits;function SBMH(A){if(typeof A==="string"){A=Buffer.from(A)}if(!Buffer.isBuffer(A)){throw new TypeError("The needle has to be a String or a Buffer.")}const e=A.length;if(e===0){throw new Error("The needle cannot be an empty String/Buffer.")}if(e>256){throw new Error("The needle cannot have a length bigger than 256.")}this.maxMatches=Infinity;this.matches=0;this._occ=new Array(256).fill(e);this._lookbehind_size=0;this._needle=A;this._bufpos=0;this._lookbehind=Buffer.alloc(e);for(var t=0;t<e-1;++t){this._occ[A[t]]=e-1-t}}s(SBMH,r);SBMH.prototype.reset=function(){this._lookbehind_size=0;this.matches=0;this._bufpos=0};SBMH.prototype.push=function(A,e){if(!Buffer.isBuffer(A)){A=Buffer.from(A,"binary")}const t=A.length;this._bufpos=e||0;let r;while(r!==t&&this.matches<this.maxMatches){r=this._sbmh_feed(A)}return r};SBMH.prototype._sbmh_feed=function(A){const e=A.length;const t=this._needle;const r=t.length;const s=t[r-1];let o=-this._lookbehind_size;let n;if(o<0){while(o<0&&o<=e-r){n=this._sbmh_lookup_char(A,o+r-1);if(n===s&&this._sbmh_memcmp(A,o,r-1)){this._lookbehind_size=0;++this.matches;this.emit("info",true);return this._bufpos=o+r}o+=this._occ[n]}if(o<0){while(o<0&&!this._sbmh_memcmp(A,o,e-o)){++o}}if(o>=0){this.emit("info",false,this._lookbehind,0,this._lookbehind_size);this._lookbehind_size=0}else{const t=this._lookbehind_size+o;if(t>0){this.emit("info",false,this._lookbehind,0,t)}this._lookbehind.copy(this._lookbehind,0,t,this._lookbehind_size-t);this._lookbehind_size-=t;A.copy(this._lookbehind,this._lookbehind_size);this._lookbehind_size+=e;this._bufpos=e;return e}}o+=(o>=0)*this._bufpos;if(A.indexOf(t,o)!==-1){o=A.indexOf(t,o);++this.matches;if(o>0){this.emit("info",true,A,this._bufpos,o)}else{this.emit("info",true)}return this._bufpos=o+r}else{o=e-r}while(o<e&&(A[o]!==t[0]||Buffer.compare(A.subarray(o,o+e-o),t.subarray(0,e-o))!==0)){++o}if(o<e){A.copy(this._lookbehind,0,o,o+(e-o));this._lookbehind_size=e-o}if(o>0){this.emit("info",false,A,this._bufpos,o<e?o:e)}this._bufpos=e;return e};SBMH.prototype._sbmh_lookup_char=function(A,e){return e<0?this._lookbehind[this._lookbehind_size+e]:A[e]};SBMH.prototype._sbmh_memcmp=function(A,e,t){for(var r=0;r<t;++r){if(this._sbmh_lookup_char(A,e+r)!==this._needle[r]){return false}}return true};A.exports=SBMH},6555:(A,e,t)=>{"use strict";const r=t(7075).Writable;const{inherits:s}=t(7975);const o=t(4020);const n=t(4914);const i=t(8377);const a=t(55);function Busboy(A){if(!(this instanceof Busboy)){return new Busboy(A)}if(typeof A!=="object"){throw new TypeError("Busboy expected an options-Object.")}if(typeof A.headers!=="object"){throw new TypeError("Busboy expected an options-Object with headers-attribute.")}if(typeof A.headers["content-type"]!=="string"){throw new TypeError("Missing Content-Type-header.")}const{headers:e,...t}=A;this.opts={autoDestroy:false,...t};r.call(this,this.opts);this._done=false;this._parser=this.getParserByHeaders(e);this._finished=false}s(Busboy,r);Busboy.prototype.emit=function(A){if(A==="finish"){if(!this._done){this._parser?.end();return}else if(this._finished){return}this._finished=true}r.prototype.emit.apply(this,arguments)};Busboy.prototype.getParserByHeaders=function(A){const e=a(A["content-type"]);const t={defCharset:this.opts.defCharset,fileHwm:this.opts.fileHwm,headers:A,highWaterMark:this.opts.highWaterMark,isPartAFile:this.opts.isPartAFile,limits:this.opts.limits,parsedConType:e,preservePath:this.opts.preservePath};if(n.detect.test(e[0])){return new n(this,t)}if(i.detect.test(e[0])){return new i(this,t)}throw new Error("Unsupported Content-Type.")};Busboy.prototype._write=function(A,e,t){this._parser.write(A,t)};A.exports=Busboy;A.exports["default"]=Busboy;A.exports.Busboy=Busboy;A.exports.Dicer=o},4914:(A,e,t)=>{"use strict";const{Readable:r}=t(7075);const{inherits:s}=t(7975);const o=t(4020);const n=t(55);const i=t(5021);const a=t(1458);const E=t(5943);const g=/^boundary$/i;const c=/^form-data$/i;const Q=/^charset$/i;const C=/^filename$/i;const B=/^name$/i;Multipart.detect=/^multipart\/form-data/i;function Multipart(A,e){let t;let r;const s=this;let I;const h=e.limits;const l=e.isPartAFile||((A,e,t)=>e==="application/octet-stream"||t!==undefined);const u=e.parsedConType||[];const d=e.defCharset||"utf8";const f=e.preservePath;const p={highWaterMark:e.fileHwm};for(t=0,r=u.length;t<r;++t){if(Array.isArray(u[t])&&g.test(u[t][0])){I=u[t][1];break}}function checkFinished(){if(N===0&&M&&!A._done){M=false;s.end()}}if(typeof I!=="string"){throw new Error("Multipart: Boundary not found")}const y=E(h,"fieldSize",1*1024*1024);const R=E(h,"fileSize",Infinity);const D=E(h,"files",Infinity);const w=E(h,"fields",Infinity);const k=E(h,"parts",Infinity);const m=E(h,"headerPairs",2e3);const b=E(h,"headerSize",80*1024);let F=0;let S=0;let N=0;let U;let L;let M=false;this._needDrain=false;this._pause=false;this._cb=undefined;this._nparts=0;this._boy=A;const T={boundary:I,maxHeaderPairs:m,maxHeaderSize:b,partHwm:p.highWaterMark,highWaterMark:e.highWaterMark};this.parser=new o(T);this.parser.on("drain",(function(){s._needDrain=false;if(s._cb&&!s._pause){const A=s._cb;s._cb=undefined;A()}})).on("part",(function onPart(e){if(++s._nparts>k){s.parser.removeListener("part",onPart);s.parser.on("part",skipPart);A.hitPartsLimit=true;A.emit("partsLimit");return skipPart(e)}if(L){const A=L;A.emit("end");A.removeAllListeners("end")}e.on("header",(function(o){let E;let g;let I;let h;let u;let k;let m=0;if(o["content-type"]){I=n(o["content-type"][0]);if(I[0]){E=I[0].toLowerCase();for(t=0,r=I.length;t<r;++t){if(Q.test(I[t][0])){h=I[t][1].toLowerCase();break}}}}if(E===undefined){E="text/plain"}if(h===undefined){h=d}if(o["content-disposition"]){I=n(o["content-disposition"][0]);if(!c.test(I[0])){return skipPart(e)}for(t=0,r=I.length;t<r;++t){if(B.test(I[t][0])){g=I[t][1]}else if(C.test(I[t][0])){k=I[t][1];if(!f){k=a(k)}}}}else{return skipPart(e)}if(o["content-transfer-encoding"]){u=o["content-transfer-encoding"][0].toLowerCase()}else{u="7bit"}let b,M;if(l(g,E,k)){if(F===D){if(!A.hitFilesLimit){A.hitFilesLimit=true;A.emit("filesLimit")}return skipPart(e)}++F;if(A.listenerCount("file")===0){s.parser._ignore();return}++N;const t=new FileStream(p);U=t;t.on("end",(function(){--N;s._pause=false;checkFinished();if(s._cb&&!s._needDrain){const A=s._cb;s._cb=undefined;A()}}));t._read=function(A){if(!s._pause){return}s._pause=false;if(s._cb&&!s._needDrain){const A=s._cb;s._cb=undefined;A()}};A.emit("file",g,t,k,u,E);b=function(A){if((m+=A.length)>R){const r=R-m+A.length;if(r>0){t.push(A.slice(0,r))}t.truncated=true;t.bytesRead=R;e.removeAllListeners("data");t.emit("limit");return}else if(!t.push(A)){s._pause=true}t.bytesRead=m};M=function(){U=undefined;t.push(null)}}else{if(S===w){if(!A.hitFieldsLimit){A.hitFieldsLimit=true;A.emit("fieldsLimit")}return skipPart(e)}++S;++N;let t="";let r=false;L=e;b=function(A){if((m+=A.length)>y){const s=y-(m-A.length);t+=A.toString("binary",0,s);r=true;e.removeAllListeners("data")}else{t+=A.toString("binary")}};M=function(){L=undefined;if(t.length){t=i(t,"binary",h)}A.emit("field",g,t,false,r,u,E);--N;checkFinished()}}e._readableState.sync=false;e.on("data",b);e.on("end",M)})).on("error",(function(A){if(U){U.emit("error",A)}}))})).on("error",(function(e){A.emit("error",e)})).on("finish",(function(){M=true;checkFinished()}))}Multipart.prototype.write=function(A,e){const t=this.parser.write(A);if(t&&!this._pause){e()}else{this._needDrain=!t;this._cb=e}};Multipart.prototype.end=function(){const A=this;if(A.parser.writable){A.parser.end()}else if(!A._boy._done){process.nextTick((function(){A._boy._done=true;A._boy.emit("finish")}))}};function skipPart(A){A.resume()}function FileStream(A){r.call(this,A);this.bytesRead=0;this.truncated=false}s(FileStream,r);FileStream.prototype._read=function(A){};A.exports=Multipart},8377:(A,e,t)=>{"use strict";const r=t(9818);const s=t(5021);const o=t(5943);const n=/^charset$/i;UrlEncoded.detect=/^application\/x-www-form-urlencoded/i;function UrlEncoded(A,e){const t=e.limits;const s=e.parsedConType;this.boy=A;this.fieldSizeLimit=o(t,"fieldSize",1*1024*1024);this.fieldNameSizeLimit=o(t,"fieldNameSize",100);this.fieldsLimit=o(t,"fields",Infinity);let i;for(var a=0,E=s.length;a<E;++a){if(Array.isArray(s[a])&&n.test(s[a][0])){i=s[a][1].toLowerCase();break}}if(i===undefined){i=e.defCharset||"utf8"}this.decoder=new r;this.charset=i;this._fields=0;this._state="key";this._checkingBytes=true;this._bytesKey=0;this._bytesVal=0;this._key="";this._val="";this._keyTrunc=false;this._valTrunc=false;this._hitLimit=false}UrlEncoded.prototype.write=function(A,e){if(this._fields===this.fieldsLimit){if(!this.boy.hitFieldsLimit){this.boy.hitFieldsLimit=true;this.boy.emit("fieldsLimit")}return e()}let t;let r;let o;let n=0;const i=A.length;while(n<i){if(this._state==="key"){t=r=undefined;for(o=n;o<i;++o){if(!this._checkingBytes){++n}if(A[o]===61){t=o;break}else if(A[o]===38){r=o;break}if(this._checkingBytes&&this._bytesKey===this.fieldNameSizeLimit){this._hitLimit=true;break}else if(this._checkingBytes){++this._bytesKey}}if(t!==undefined){if(t>n){this._key+=this.decoder.write(A.toString("binary",n,t))}this._state="val";this._hitLimit=false;this._checkingBytes=true;this._val="";this._bytesVal=0;this._valTrunc=false;this.decoder.reset();n=t+1}else if(r!==undefined){++this._fields;let t;const o=this._keyTrunc;if(r>n){t=this._key+=this.decoder.write(A.toString("binary",n,r))}else{t=this._key}this._hitLimit=false;this._checkingBytes=true;this._key="";this._bytesKey=0;this._keyTrunc=false;this.decoder.reset();if(t.length){this.boy.emit("field",s(t,"binary",this.charset),"",o,false)}n=r+1;if(this._fields===this.fieldsLimit){return e()}}else if(this._hitLimit){if(o>n){this._key+=this.decoder.write(A.toString("binary",n,o))}n=o;if((this._bytesKey=this._key.length)===this.fieldNameSizeLimit){this._checkingBytes=false;this._keyTrunc=true}}else{if(n<i){this._key+=this.decoder.write(A.toString("binary",n))}n=i}}else{r=undefined;for(o=n;o<i;++o){if(!this._checkingBytes){++n}if(A[o]===38){r=o;break}if(this._checkingBytes&&this._bytesVal===this.fieldSizeLimit){this._hitLimit=true;break}else if(this._checkingBytes){++this._bytesVal}}if(r!==undefined){++this._fields;if(r>n){this._val+=this.decoder.write(A.toString("binary",n,r))}this.boy.emit("field",s(this._key,"binary",this.charset),s(this._val,"binary",this.charset),this._keyTrunc,this._valTrunc);this._state="key";this._hitLimit=false;this._checkingBytes=true;this._key="";this._bytesKey=0;this._keyTrunc=false;this.decoder.reset();n=r+1;if(this._fields===this.fieldsLimit){return e()}}else if(this._hitLimit){if(o>n){this._val+=this.decoder.write(A.toString("binary",n,o))}n=o;if(this._val===""&&this.fieldSizeLimit===0||(this._bytesVal=this._val.length)===this.fieldSizeLimit){this._checkingBytes=false;this._valTrunc=true}}else{if(n<i){this._val+=this.decoder.write(A.toString("binary",n))}n=i}}}e()};UrlEncoded.prototype.end=function(){if(this.boy._done){return}if(this._state==="key"&&this._key.length>0){this.boy.emit("field",s(this._key,"binary",this.charset),"",this._keyTrunc,false)}else if(this._state==="val"){this.boy.emit("field",s(this._key,"binary",this.charset),s(this._val,"binary",this.charset),this._keyTrunc,this._valTrunc)}this.boy._done=true;this.boy.emit("finish")};A.exports=UrlEncoded},9818:A=>{"use strict";const e=/\+/g;const t=[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0];function Decoder(){this.buffer=undefined}Decoder.prototype.write=function(A){A=A.replace(e," ");let r="";let s=0;let o=0;const n=A.length;for(;s<n;++s){if(this.buffer!==undefined){if(!t[A.charCodeAt(s)]){r+="%"+this.buffer;this.buffer=undefined;--s}else{this.buffer+=A[s];++o;if(this.buffer.length===2){r+=String.fromCharCode(parseInt(this.buffer,16));this.buffer=undefined}}}else if(A[s]==="%"){if(s>o){r+=A.substring(o,s);o=s}this.buffer="";++o}}if(o<n&&this.buffer===undefined){r+=A.substring(o)}return r};Decoder.prototype.reset=function(){this.buffer=undefined};A.exports=Decoder},1458:A=>{"use strict";A.exports=function basename(A){if(typeof A!=="string"){return""}for(var e=A.length-1;e>=0;--e){switch(A.charCodeAt(e)){case 47:case 92:A=A.slice(e+1);return A===".."||A==="."?"":A}}return A===".."||A==="."?"":A}},5021:function(A){"use strict";const e=new TextDecoder("utf-8");const t=new Map([["utf-8",e],["utf8",e]]);function getDecoder(A){let e;while(true){switch(A){case"utf-8":case"utf8":return r.utf8;case"latin1":case"ascii":case"us-ascii":case"iso-8859-1":case"iso8859-1":case"iso88591":case"iso_8859-1":case"windows-1252":case"iso_8859-1:1987":case"cp1252":case"x-cp1252":return r.latin1;case"utf16le":case"utf-16le":case"ucs2":case"ucs-2":return r.utf16le;case"base64":return r.base64;default:if(e===undefined){e=true;A=A.toLowerCase();continue}return r.other.bind(A)}}}const r={utf8:(A,e)=>{if(A.length===0){return""}if(typeof A==="string"){A=Buffer.from(A,e)}return A.utf8Slice(0,A.length)},latin1:(A,e)=>{if(A.length===0){return""}if(typeof A==="string"){return A}return A.latin1Slice(0,A.length)},utf16le:(A,e)=>{if(A.length===0){return""}if(typeof A==="string"){A=Buffer.from(A,e)}return A.ucs2Slice(0,A.length)},base64:(A,e)=>{if(A.length===0){return""}if(typeof A==="string"){A=Buffer.from(A,e)}return A.base64Slice(0,A.length)},other:(A,e)=>{if(A.length===0){return""}if(typeof A==="string"){A=Buffer.from(A,e)}if(t.has(this.toString())){try{return t.get(this).decode(A)}catch{}}return typeof A==="string"?A:A.toString()}};function decodeText(A,e,t){if(A){return getDecoder(t)(A,e)}return A}A.exports=decodeText},5943:A=>{"use strict";A.exports=function getLimit(A,e,t){if(!A||A[e]===undefined||A[e]===null){return t}if(typeof A[e]!=="number"||isNaN(A[e])){throw new TypeError("Limit "+e+" is not a valid number")}return A[e]}},55:(A,e,t)=>{"use strict";const r=t(5021);const s=/%[a-fA-F0-9][a-fA-F0-9]/g;const o={"%00":"\0","%01":"","%02":"","%03":"","%04":"","%05":"","%06":"","%07":"","%08":"\b","%09":"\t","%0a":"\n","%0A":"\n","%0b":"\v","%0B":"\v","%0c":"\f","%0C":"\f","%0d":"\r","%0D":"\r","%0e":"","%0E":"","%0f":"","%0F":"","%10":"","%11":"","%12":"","%13":"","%14":"","%15":"","%16":"","%17":"","%18":"","%19":"","%1a":"","%1A":"","%1b":"","%1B":"","%1c":"","%1C":"","%1d":"","%1D":"","%1e":"","%1E":"","%1f":"","%1F":"","%20":" ","%21":"!","%22":'"',"%23":"#","%24":"$","%25":"%","%26":"&","%27":"'","%28":"(","%29":")","%2a":"*","%2A":"*","%2b":"+","%2B":"+","%2c":",","%2C":",","%2d":"-","%2D":"-","%2e":".","%2E":".","%2f":"/","%2F":"/","%30":"0","%31":"1","%32":"2","%33":"3","%34":"4","%35":"5","%36":"6","%37":"7","%38":"8","%39":"9","%3a":":","%3A":":","%3b":";","%3B":";","%3c":"<","%3C":"<","%3d":"=","%3D":"=","%3e":">","%3E":">","%3f":"?","%3F":"?","%40":"@","%41":"A","%42":"B","%43":"C","%44":"D","%45":"E","%46":"F","%47":"G","%48":"H","%49":"I","%4a":"J","%4A":"J","%4b":"K","%4B":"K","%4c":"L","%4C":"L","%4d":"M","%4D":"M","%4e":"N","%4E":"N","%4f":"O","%4F":"O","%50":"P","%51":"Q","%52":"R","%53":"S","%54":"T","%55":"U","%56":"V","%57":"W","%58":"X","%59":"Y","%5a":"Z","%5A":"Z","%5b":"[","%5B":"[","%5c":"\\","%5C":"\\","%5d":"]","%5D":"]","%5e":"^","%5E":"^","%5f":"_","%5F":"_","%60":"`","%61":"a","%62":"b","%63":"c","%64":"d","%65":"e","%66":"f","%67":"g","%68":"h","%69":"i","%6a":"j","%6A":"j","%6b":"k","%6B":"k","%6c":"l","%6C":"l","%6d":"m","%6D":"m","%6e":"n","%6E":"n","%6f":"o","%6F":"o","%70":"p","%71":"q","%72":"r","%73":"s","%74":"t","%75":"u","%76":"v","%77":"w","%78":"x","%79":"y","%7a":"z","%7A":"z","%7b":"{","%7B":"{","%7c":"|","%7C":"|","%7d":"}","%7D":"}","%7e":"~","%7E":"~","%7f":"","%7F":"","%80":"","%81":"","%82":"","%83":"","%84":"","%85":"","%86":"","%87":"","%88":"","%89":"","%8a":"","%8A":"","%8b":"","%8B":"","%8c":"","%8C":"","%8d":"","%8D":"","%8e":"","%8E":"","%8f":"","%8F":"","%90":"","%91":"","%92":"","%93":"","%94":"","%95":"","%96":"","%97":"","%98":"","%99":"","%9a":"","%9A":"","%9b":"","%9B":"","%9c":"","%9C":"","%9d":"","%9D":"","%9e":"","%9E":"","%9f":"","%9F":"","%a0":" ","%A0":" ","%a1":"¡","%A1":"¡","%a2":"¢","%A2":"¢","%a3":"£","%A3":"£","%a4":"¤","%A4":"¤","%a5":"¥","%A5":"¥","%a6":"¦","%A6":"¦","%a7":"§","%A7":"§","%a8":"¨","%A8":"¨","%a9":"©","%A9":"©","%aa":"ª","%Aa":"ª","%aA":"ª","%AA":"ª","%ab":"«","%Ab":"«","%aB":"«","%AB":"«","%ac":"¬","%Ac":"¬","%aC":"¬","%AC":"¬","%ad":"­","%Ad":"­","%aD":"­","%AD":"­","%ae":"®","%Ae":"®","%aE":"®","%AE":"®","%af":"¯","%Af":"¯","%aF":"¯","%AF":"¯","%b0":"°","%B0":"°","%b1":"±","%B1":"±","%b2":"²","%B2":"²","%b3":"³","%B3":"³","%b4":"´","%B4":"´","%b5":"µ","%B5":"µ","%b6":"¶","%B6":"¶","%b7":"·","%B7":"·","%b8":"¸","%B8":"¸","%b9":"¹","%B9":"¹","%ba":"º","%Ba":"º","%bA":"º","%BA":"º","%bb":"»","%Bb":"»","%bB":"»","%BB":"»","%bc":"¼","%Bc":"¼","%bC":"¼","%BC":"¼","%bd":"½","%Bd":"½","%bD":"½","%BD":"½","%be":"¾","%Be":"¾","%bE":"¾","%BE":"¾","%bf":"¿","%Bf":"¿","%bF":"¿","%BF":"¿","%c0":"À","%C0":"À","%c1":"Á","%C1":"Á","%c2":"Â","%C2":"Â","%c3":"Ã","%C3":"Ã","%c4":"Ä","%C4":"Ä","%c5":"Å","%C5":"Å","%c6":"Æ","%C6":"Æ","%c7":"Ç","%C7":"Ç","%c8":"È","%C8":"È","%c9":"É","%C9":"É","%ca":"Ê","%Ca":"Ê","%cA":"Ê","%CA":"Ê","%cb":"Ë","%Cb":"Ë","%cB":"Ë","%CB":"Ë","%cc":"Ì","%Cc":"Ì","%cC":"Ì","%CC":"Ì","%cd":"Í","%Cd":"Í","%cD":"Í","%CD":"Í","%ce":"Î","%Ce":"Î","%cE":"Î","%CE":"Î","%cf":"Ï","%Cf":"Ï","%cF":"Ï","%CF":"Ï","%d0":"Ð","%D0":"Ð","%d1":"Ñ","%D1":"Ñ","%d2":"Ò","%D2":"Ò","%d3":"Ó","%D3":"Ó","%d4":"Ô","%D4":"Ô","%d5":"Õ","%D5":"Õ","%d6":"Ö","%D6":"Ö","%d7":"×","%D7":"×","%d8":"Ø","%D8":"Ø","%d9":"Ù","%D9":"Ù","%da":"Ú","%Da":"Ú","%dA":"Ú","%DA":"Ú","%db":"Û","%Db":"Û","%dB":"Û","%DB":"Û","%dc":"Ü","%Dc":"Ü","%dC":"Ü","%DC":"Ü","%dd":"Ý","%Dd":"Ý","%dD":"Ý","%DD":"Ý","%de":"Þ","%De":"Þ","%dE":"Þ","%DE":"Þ","%df":"ß","%Df":"ß","%dF":"ß","%DF":"ß","%e0":"à","%E0":"à","%e1":"á","%E1":"á","%e2":"â","%E2":"â","%e3":"ã","%E3":"ã","%e4":"ä","%E4":"ä","%e5":"å","%E5":"å","%e6":"æ","%E6":"æ","%e7":"ç","%E7":"ç","%e8":"è","%E8":"è","%e9":"é","%E9":"é","%ea":"ê","%Ea":"ê","%eA":"ê","%EA":"ê","%eb":"ë","%Eb":"ë","%eB":"ë","%EB":"ë","%ec":"ì","%Ec":"ì","%eC":"ì","%EC":"ì","%ed":"í","%Ed":"í","%eD":"í","%ED":"í","%ee":"î","%Ee":"î","%eE":"î","%EE":"î","%ef":"ï","%Ef":"ï","%eF":"ï","%EF":"ï","%f0":"ð","%F0":"ð","%f1":"ñ","%F1":"ñ","%f2":"ò","%F2":"ò","%f3":"ó","%F3":"ó","%f4":"ô","%F4":"ô","%f5":"õ","%F5":"õ","%f6":"ö","%F6":"ö","%f7":"÷","%F7":"÷","%f8":"ø","%F8":"ø","%f9":"ù","%F9":"ù","%fa":"ú","%Fa":"ú","%fA":"ú","%FA":"ú","%fb":"û","%Fb":"û","%fB":"û","%FB":"û","%fc":"ü","%Fc":"ü","%fC":"ü","%FC":"ü","%fd":"ý","%Fd":"ý","%fD":"ý","%FD":"ý","%fe":"þ","%Fe":"þ","%fE":"þ","%FE":"þ","%ff":"ÿ","%Ff":"ÿ","%fF":"ÿ","%FF":"ÿ"};function encodedReplacer(A){return o[A]}const n=0;const i=1;const a=2;const E=3;function parseParams(A){const e=[];let t=n;let o="";let g=false;let c=false;let Q=0;let C="";const B=A.length;for(var I=0;I<B;++I){const B=A[I];if(B==="\\"&&g){if(c){c=false}else{c=true;continue}}else if(B==='"'){if(!c){if(g){g=false;t=n}else{g=true}continue}else{c=false}}else{if(c&&g){C+="\\"}c=false;if((t===a||t===E)&&B==="'"){if(t===a){t=E;o=C.substring(1)}else{t=i}C="";continue}else if(t===n&&(B==="*"||B==="=")&&e.length){t=B==="*"?a:i;e[Q]=[C,undefined];C="";continue}else if(!g&&B===";"){t=n;if(o){if(C.length){C=r(C.replace(s,encodedReplacer),"binary",o)}o=""}else if(C.length){C=r(C,"binary","utf8")}if(e[Q]===undefined){e[Q]=C}else{e[Q][1]=C}C="";++Q;continue}else if(!g&&(B===" "||B==="\t")){continue}}C+=B}if(o&&C.length){C=r(C.replace(s,encodedReplacer),"binary",o)}else if(C){C=r(C,"binary","utf8")}if(e[Q]===undefined){if(C){e[Q]=C}}else{e[Q][1]=C}return e}A.exports=parseParams}};var e={};function __nccwpck_require__(t){var r=e[t];if(r!==undefined){return r.exports}var s=e[t]={exports:{}};var o=true;try{A[t].call(s.exports,s,s.exports,__nccwpck_require__);o=false}finally{if(o)delete e[t]}return s.exports}if(typeof __nccwpck_require__!=="undefined")__nccwpck_require__.ab=__dirname+"/";var t={};const r=__nccwpck_require__(8770);const{spawn:s}=__nccwpck_require__(5317);function run(A){const e=s(A,{stdio:"inherit",shell:true});e.on("exit",(A=>{process.exitCode=A}))}try{const A=process.env.GITHUB_ACTION_PATH;const e=r.getInput("oci-compartment-name");const t=r.getInput("oci-name-suffix");run(`uv run --with=oci ${A}/stop/stop_js/stop.py --config-file='.oci/config' --name-suffix=${t} --compartment-name=${e}`)}catch(A){r.setFailed(A.message)}module.exports=t})();
\ No newline at end of file
+/*! ws. MIT License. Einar Otto Stangvik <einaros@gmail.com> */o[s-4]=this.maskKey[0];o[s-3]=this.maskKey[1];o[s-2]=this.maskKey[2];o[s-1]=this.maskKey[3];o[1]=t;if(t===126){o.writeUInt16BE(e,2)}else if(t===127){o[2]=o[3]=0;o.writeUIntBE(e,4,6)}o[1]|=128;for(let A=0;A<e;A++){o[s+A]=this.frameData[A]^this.maskKey[A%4]}return o}}A.exports={WebsocketFrameSend:WebsocketFrameSend}},1821:(A,e,t)=>{"use strict";const{Writable:r}=t(2203);const s=t(1637);const{parserStates:o,opcodes:n,states:i,emptyBuffer:a}=t(2559);const{kReadyState:E,kSentClose:g,kResponse:c,kReceivedClose:Q}=t(5851);const{isValidStatusCode:C,failWebsocketConnection:B,websocketMessageReceived:I}=t(6256);const{WebsocketFrameSend:h}=t(7059);const l={};l.ping=s.channel("undici:websocket:ping");l.pong=s.channel("undici:websocket:pong");class ByteParser extends r{#n=[];#i=0;#a=o.INFO;#E={};#g=[];constructor(A){super();this.ws=A}_write(A,e,t){this.#n.push(A);this.#i+=A.length;this.run(t)}run(A){while(true){if(this.#a===o.INFO){if(this.#i<2){return A()}const e=this.consume(2);this.#E.fin=(e[0]&128)!==0;this.#E.opcode=e[0]&15;this.#E.originalOpcode??=this.#E.opcode;this.#E.fragmented=!this.#E.fin&&this.#E.opcode!==n.CONTINUATION;if(this.#E.fragmented&&this.#E.opcode!==n.BINARY&&this.#E.opcode!==n.TEXT){B(this.ws,"Invalid frame type was fragmented.");return}const t=e[1]&127;if(t<=125){this.#E.payloadLength=t;this.#a=o.READ_DATA}else if(t===126){this.#a=o.PAYLOADLENGTH_16}else if(t===127){this.#a=o.PAYLOADLENGTH_64}if(this.#E.fragmented&&t>125){B(this.ws,"Fragmented frame exceeded 125 bytes.");return}else if((this.#E.opcode===n.PING||this.#E.opcode===n.PONG||this.#E.opcode===n.CLOSE)&&t>125){B(this.ws,"Payload length for control frame exceeded 125 bytes.");return}else if(this.#E.opcode===n.CLOSE){if(t===1){B(this.ws,"Received close frame with a 1-byte body.");return}const A=this.consume(t);this.#E.closeInfo=this.parseCloseBody(false,A);if(!this.ws[g]){const A=Buffer.allocUnsafe(2);A.writeUInt16BE(this.#E.closeInfo.code,0);const e=new h(A);this.ws[c].socket.write(e.createFrame(n.CLOSE),(A=>{if(!A){this.ws[g]=true}}))}this.ws[E]=i.CLOSING;this.ws[Q]=true;this.end();return}else if(this.#E.opcode===n.PING){const e=this.consume(t);if(!this.ws[Q]){const A=new h(e);this.ws[c].socket.write(A.createFrame(n.PONG));if(l.ping.hasSubscribers){l.ping.publish({payload:e})}}this.#a=o.INFO;if(this.#i>0){continue}else{A();return}}else if(this.#E.opcode===n.PONG){const e=this.consume(t);if(l.pong.hasSubscribers){l.pong.publish({payload:e})}if(this.#i>0){continue}else{A();return}}}else if(this.#a===o.PAYLOADLENGTH_16){if(this.#i<2){return A()}const e=this.consume(2);this.#E.payloadLength=e.readUInt16BE(0);this.#a=o.READ_DATA}else if(this.#a===o.PAYLOADLENGTH_64){if(this.#i<8){return A()}const e=this.consume(8);const t=e.readUInt32BE(0);if(t>2**31-1){B(this.ws,"Received payload length > 2^31 bytes.");return}const r=e.readUInt32BE(4);this.#E.payloadLength=(t<<8)+r;this.#a=o.READ_DATA}else if(this.#a===o.READ_DATA){if(this.#i<this.#E.payloadLength){return A()}else if(this.#i>=this.#E.payloadLength){const A=this.consume(this.#E.payloadLength);this.#g.push(A);if(!this.#E.fragmented||this.#E.fin&&this.#E.opcode===n.CONTINUATION){const A=Buffer.concat(this.#g);I(this.ws,this.#E.originalOpcode,A);this.#E={};this.#g.length=0}this.#a=o.INFO}}if(this.#i>0){continue}else{A();break}}}consume(A){if(A>this.#i){return null}else if(A===0){return a}if(this.#n[0].length===A){this.#i-=this.#n[0].length;return this.#n.shift()}const e=Buffer.allocUnsafe(A);let t=0;while(t!==A){const r=this.#n[0];const{length:s}=r;if(s+t===A){e.set(this.#n.shift(),t);break}else if(s+t>A){e.set(r.subarray(0,A-t),t);this.#n[0]=r.subarray(A-t);break}else{e.set(this.#n.shift(),t);t+=r.length}}this.#i-=A;return e}parseCloseBody(A,e){let t;if(e.length>=2){t=e.readUInt16BE(0)}if(A){if(!C(t)){return null}return{code:t}}let r=e.subarray(2);if(r[0]===239&&r[1]===187&&r[2]===191){r=r.subarray(3)}if(t!==undefined&&!C(t)){return null}try{r=new TextDecoder("utf-8",{fatal:true}).decode(r)}catch{return null}return{code:t,reason:r}}get closingInfo(){return this.#E.closeInfo}}A.exports={ByteParser:ByteParser}},5851:A=>{"use strict";A.exports={kWebSocketURL:Symbol("url"),kReadyState:Symbol("ready state"),kController:Symbol("controller"),kResponse:Symbol("response"),kBinaryType:Symbol("binary type"),kSentClose:Symbol("sent close"),kReceivedClose:Symbol("received close"),kByteParser:Symbol("byte parser")}},6256:(A,e,t)=>{"use strict";const{kReadyState:r,kController:s,kResponse:o,kBinaryType:n,kWebSocketURL:i}=t(5851);const{states:a,opcodes:E}=t(2559);const{MessageEvent:g,ErrorEvent:c}=t(9741);function isEstablished(A){return A[r]===a.OPEN}function isClosing(A){return A[r]===a.CLOSING}function isClosed(A){return A[r]===a.CLOSED}function fireEvent(A,e,t=Event,r){const s=new t(A,r);e.dispatchEvent(s)}function websocketMessageReceived(A,e,t){if(A[r]!==a.OPEN){return}let s;if(e===E.TEXT){try{s=new TextDecoder("utf-8",{fatal:true}).decode(t)}catch{failWebsocketConnection(A,"Received invalid UTF-8 in text frame.");return}}else if(e===E.BINARY){if(A[n]==="blob"){s=new Blob([t])}else{s=new Uint8Array(t).buffer}}fireEvent("message",A,g,{origin:A[i].origin,data:s})}function isValidSubprotocol(A){if(A.length===0){return false}for(const e of A){const A=e.charCodeAt(0);if(A<33||A>126||e==="("||e===")"||e==="<"||e===">"||e==="@"||e===","||e===";"||e===":"||e==="\\"||e==='"'||e==="/"||e==="["||e==="]"||e==="?"||e==="="||e==="{"||e==="}"||A===32||A===9){return false}}return true}function isValidStatusCode(A){if(A>=1e3&&A<1015){return A!==1004&&A!==1005&&A!==1006}return A>=3e3&&A<=4999}function failWebsocketConnection(A,e){const{[s]:t,[o]:r}=A;t.abort();if(r?.socket&&!r.socket.destroyed){r.socket.destroy()}if(e){fireEvent("error",A,c,{error:new Error(e)})}}A.exports={isEstablished:isEstablished,isClosing:isClosing,isClosed:isClosed,fireEvent:fireEvent,isValidSubprotocol:isValidSubprotocol,isValidStatusCode:isValidStatusCode,failWebsocketConnection:failWebsocketConnection,websocketMessageReceived:websocketMessageReceived}},7785:(A,e,t)=>{"use strict";const{webidl:r}=t(9040);const{DOMException:s}=t(6732);const{URLSerializer:o}=t(1620);const{getGlobalOrigin:n}=t(7074);const{staticPropertyDescriptors:i,states:a,opcodes:E,emptyBuffer:g}=t(2559);const{kWebSocketURL:c,kReadyState:Q,kController:C,kBinaryType:B,kResponse:I,kSentClose:h,kByteParser:l}=t(5851);const{isEstablished:u,isClosing:d,isValidSubprotocol:f,failWebsocketConnection:p,fireEvent:y}=t(6256);const{establishWebSocketConnection:R}=t(3412);const{WebsocketFrameSend:D}=t(7059);const{ByteParser:w}=t(1821);const{kEnumerableProperty:k,isBlobLike:m}=t(7586);const{getGlobalDispatcher:b}=t(4127);const{types:F}=t(9023);let S=false;class WebSocket extends EventTarget{#c={open:null,error:null,close:null,message:null};#Q=0;#C="";#B="";constructor(A,e=[]){super();r.argumentLengthCheck(arguments,1,{header:"WebSocket constructor"});if(!S){S=true;process.emitWarning("WebSockets are experimental, expect them to change at any time.",{code:"UNDICI-WS"})}const t=r.converters["DOMString or sequence<DOMString> or WebSocketInit"](e);A=r.converters.USVString(A);e=t.protocols;const o=n();let i;try{i=new URL(A,o)}catch(A){throw new s(A,"SyntaxError")}if(i.protocol==="http:"){i.protocol="ws:"}else if(i.protocol==="https:"){i.protocol="wss:"}if(i.protocol!=="ws:"&&i.protocol!=="wss:"){throw new s(`Expected a ws: or wss: protocol, got ${i.protocol}`,"SyntaxError")}if(i.hash||i.href.endsWith("#")){throw new s("Got fragment","SyntaxError")}if(typeof e==="string"){e=[e]}if(e.length!==new Set(e.map((A=>A.toLowerCase()))).size){throw new s("Invalid Sec-WebSocket-Protocol value","SyntaxError")}if(e.length>0&&!e.every((A=>f(A)))){throw new s("Invalid Sec-WebSocket-Protocol value","SyntaxError")}this[c]=new URL(i.href);this[C]=R(i,e,this,(A=>this.#I(A)),t);this[Q]=WebSocket.CONNECTING;this[B]="blob"}close(A=undefined,e=undefined){r.brandCheck(this,WebSocket);if(A!==undefined){A=r.converters["unsigned short"](A,{clamp:true})}if(e!==undefined){e=r.converters.USVString(e)}if(A!==undefined){if(A!==1e3&&(A<3e3||A>4999)){throw new s("invalid code","InvalidAccessError")}}let t=0;if(e!==undefined){t=Buffer.byteLength(e);if(t>123){throw new s(`Reason must be less than 123 bytes; received ${t}`,"SyntaxError")}}if(this[Q]===WebSocket.CLOSING||this[Q]===WebSocket.CLOSED){}else if(!u(this)){p(this,"Connection was closed before it was established.");this[Q]=WebSocket.CLOSING}else if(!d(this)){const r=new D;if(A!==undefined&&e===undefined){r.frameData=Buffer.allocUnsafe(2);r.frameData.writeUInt16BE(A,0)}else if(A!==undefined&&e!==undefined){r.frameData=Buffer.allocUnsafe(2+t);r.frameData.writeUInt16BE(A,0);r.frameData.write(e,2,"utf-8")}else{r.frameData=g}const s=this[I].socket;s.write(r.createFrame(E.CLOSE),(A=>{if(!A){this[h]=true}}));this[Q]=a.CLOSING}else{this[Q]=WebSocket.CLOSING}}send(A){r.brandCheck(this,WebSocket);r.argumentLengthCheck(arguments,1,{header:"WebSocket.send"});A=r.converters.WebSocketSendData(A);if(this[Q]===WebSocket.CONNECTING){throw new s("Sent before connected.","InvalidStateError")}if(!u(this)||d(this)){return}const e=this[I].socket;if(typeof A==="string"){const t=Buffer.from(A);const r=new D(t);const s=r.createFrame(E.TEXT);this.#Q+=t.byteLength;e.write(s,(()=>{this.#Q-=t.byteLength}))}else if(F.isArrayBuffer(A)){const t=Buffer.from(A);const r=new D(t);const s=r.createFrame(E.BINARY);this.#Q+=t.byteLength;e.write(s,(()=>{this.#Q-=t.byteLength}))}else if(ArrayBuffer.isView(A)){const t=Buffer.from(A,A.byteOffset,A.byteLength);const r=new D(t);const s=r.createFrame(E.BINARY);this.#Q+=t.byteLength;e.write(s,(()=>{this.#Q-=t.byteLength}))}else if(m(A)){const t=new D;A.arrayBuffer().then((A=>{const r=Buffer.from(A);t.frameData=r;const s=t.createFrame(E.BINARY);this.#Q+=r.byteLength;e.write(s,(()=>{this.#Q-=r.byteLength}))}))}}get readyState(){r.brandCheck(this,WebSocket);return this[Q]}get bufferedAmount(){r.brandCheck(this,WebSocket);return this.#Q}get url(){r.brandCheck(this,WebSocket);return o(this[c])}get extensions(){r.brandCheck(this,WebSocket);return this.#B}get protocol(){r.brandCheck(this,WebSocket);return this.#C}get onopen(){r.brandCheck(this,WebSocket);return this.#c.open}set onopen(A){r.brandCheck(this,WebSocket);if(this.#c.open){this.removeEventListener("open",this.#c.open)}if(typeof A==="function"){this.#c.open=A;this.addEventListener("open",A)}else{this.#c.open=null}}get onerror(){r.brandCheck(this,WebSocket);return this.#c.error}set onerror(A){r.brandCheck(this,WebSocket);if(this.#c.error){this.removeEventListener("error",this.#c.error)}if(typeof A==="function"){this.#c.error=A;this.addEventListener("error",A)}else{this.#c.error=null}}get onclose(){r.brandCheck(this,WebSocket);return this.#c.close}set onclose(A){r.brandCheck(this,WebSocket);if(this.#c.close){this.removeEventListener("close",this.#c.close)}if(typeof A==="function"){this.#c.close=A;this.addEventListener("close",A)}else{this.#c.close=null}}get onmessage(){r.brandCheck(this,WebSocket);return this.#c.message}set onmessage(A){r.brandCheck(this,WebSocket);if(this.#c.message){this.removeEventListener("message",this.#c.message)}if(typeof A==="function"){this.#c.message=A;this.addEventListener("message",A)}else{this.#c.message=null}}get binaryType(){r.brandCheck(this,WebSocket);return this[B]}set binaryType(A){r.brandCheck(this,WebSocket);if(A!=="blob"&&A!=="arraybuffer"){this[B]="blob"}else{this[B]=A}}#I(A){this[I]=A;const e=new w(this);e.on("drain",(function onParserDrain(){this.ws[I].socket.resume()}));A.socket.ws=this;this[l]=e;this[Q]=a.OPEN;const t=A.headersList.get("sec-websocket-extensions");if(t!==null){this.#B=t}const r=A.headersList.get("sec-websocket-protocol");if(r!==null){this.#C=r}y("open",this)}}WebSocket.CONNECTING=WebSocket.prototype.CONNECTING=a.CONNECTING;WebSocket.OPEN=WebSocket.prototype.OPEN=a.OPEN;WebSocket.CLOSING=WebSocket.prototype.CLOSING=a.CLOSING;WebSocket.CLOSED=WebSocket.prototype.CLOSED=a.CLOSED;Object.defineProperties(WebSocket.prototype,{CONNECTING:i,OPEN:i,CLOSING:i,CLOSED:i,url:k,readyState:k,bufferedAmount:k,onopen:k,onerror:k,onclose:k,close:k,onmessage:k,binaryType:k,send:k,extensions:k,protocol:k,[Symbol.toStringTag]:{value:"WebSocket",writable:false,enumerable:false,configurable:true}});Object.defineProperties(WebSocket,{CONNECTING:i,OPEN:i,CLOSING:i,CLOSED:i});r.converters["sequence<DOMString>"]=r.sequenceConverter(r.converters.DOMString);r.converters["DOMString or sequence<DOMString>"]=function(A){if(r.util.Type(A)==="Object"&&Symbol.iterator in A){return r.converters["sequence<DOMString>"](A)}return r.converters.DOMString(A)};r.converters.WebSocketInit=r.dictionaryConverter([{key:"protocols",converter:r.converters["DOMString or sequence<DOMString>"],get defaultValue(){return[]}},{key:"dispatcher",converter:A=>A,get defaultValue(){return b()}},{key:"headers",converter:r.nullableConverter(r.converters.HeadersInit)}]);r.converters["DOMString or sequence<DOMString> or WebSocketInit"]=function(A){if(r.util.Type(A)==="Object"&&!(Symbol.iterator in A)){return r.converters.WebSocketInit(A)}return{protocols:r.converters["DOMString or sequence<DOMString>"](A)}};r.converters.WebSocketSendData=function(A){if(r.util.Type(A)==="Object"){if(m(A)){return r.converters.Blob(A,{strict:false})}if(ArrayBuffer.isView(A)||F.isAnyArrayBuffer(A)){return r.converters.BufferSource(A)}}return r.converters.USVString(A)};A.exports={WebSocket:WebSocket}},2613:A=>{"use strict";A.exports=require("assert")},290:A=>{"use strict";A.exports=require("async_hooks")},181:A=>{"use strict";A.exports=require("buffer")},5317:A=>{"use strict";A.exports=require("child_process")},4236:A=>{"use strict";A.exports=require("console")},6982:A=>{"use strict";A.exports=require("crypto")},1637:A=>{"use strict";A.exports=require("diagnostics_channel")},4434:A=>{"use strict";A.exports=require("events")},9896:A=>{"use strict";A.exports=require("fs")},8611:A=>{"use strict";A.exports=require("http")},5675:A=>{"use strict";A.exports=require("http2")},5692:A=>{"use strict";A.exports=require("https")},9278:A=>{"use strict";A.exports=require("net")},7598:A=>{"use strict";A.exports=require("node:crypto")},8474:A=>{"use strict";A.exports=require("node:events")},7075:A=>{"use strict";A.exports=require("node:stream")},7975:A=>{"use strict";A.exports=require("node:util")},857:A=>{"use strict";A.exports=require("os")},6928:A=>{"use strict";A.exports=require("path")},2987:A=>{"use strict";A.exports=require("perf_hooks")},3480:A=>{"use strict";A.exports=require("querystring")},2203:A=>{"use strict";A.exports=require("stream")},3774:A=>{"use strict";A.exports=require("stream/web")},3193:A=>{"use strict";A.exports=require("string_decoder")},3557:A=>{"use strict";A.exports=require("timers")},4756:A=>{"use strict";A.exports=require("tls")},7016:A=>{"use strict";A.exports=require("url")},9023:A=>{"use strict";A.exports=require("util")},8253:A=>{"use strict";A.exports=require("util/types")},8167:A=>{"use strict";A.exports=require("worker_threads")},3106:A=>{"use strict";A.exports=require("zlib")},4020:(A,e,t)=>{"use strict";const r=t(7075).Writable;const s=t(7975).inherits;const o=t(9330);const n=t(9858);const i=t(1033);const a=45;const E=Buffer.from("-");const g=Buffer.from("\r\n");const EMPTY_FN=function(){};function Dicer(A){if(!(this instanceof Dicer)){return new Dicer(A)}r.call(this,A);if(!A||!A.headerFirst&&typeof A.boundary!=="string"){throw new TypeError("Boundary required")}if(typeof A.boundary==="string"){this.setBoundary(A.boundary)}else{this._bparser=undefined}this._headerFirst=A.headerFirst;this._dashes=0;this._parts=0;this._finished=false;this._realFinish=false;this._isPreamble=true;this._justMatched=false;this._firstWrite=true;this._inHeader=true;this._part=undefined;this._cb=undefined;this._ignoreData=false;this._partOpts={highWaterMark:A.partHwm};this._pause=false;const e=this;this._hparser=new i(A);this._hparser.on("header",(function(A){e._inHeader=false;e._part.emit("header",A)}))}s(Dicer,r);Dicer.prototype.emit=function(A){if(A==="finish"&&!this._realFinish){if(!this._finished){const A=this;process.nextTick((function(){A.emit("error",new Error("Unexpected end of multipart data"));if(A._part&&!A._ignoreData){const e=A._isPreamble?"Preamble":"Part";A._part.emit("error",new Error(e+" terminated early due to unexpected end of multipart data"));A._part.push(null);process.nextTick((function(){A._realFinish=true;A.emit("finish");A._realFinish=false}));return}A._realFinish=true;A.emit("finish");A._realFinish=false}))}}else{r.prototype.emit.apply(this,arguments)}};Dicer.prototype._write=function(A,e,t){if(!this._hparser&&!this._bparser){return t()}if(this._headerFirst&&this._isPreamble){if(!this._part){this._part=new n(this._partOpts);if(this.listenerCount("preamble")!==0){this.emit("preamble",this._part)}else{this._ignore()}}const e=this._hparser.push(A);if(!this._inHeader&&e!==undefined&&e<A.length){A=A.slice(e)}else{return t()}}if(this._firstWrite){this._bparser.push(g);this._firstWrite=false}this._bparser.push(A);if(this._pause){this._cb=t}else{t()}};Dicer.prototype.reset=function(){this._part=undefined;this._bparser=undefined;this._hparser=undefined};Dicer.prototype.setBoundary=function(A){const e=this;this._bparser=new o("\r\n--"+A);this._bparser.on("info",(function(A,t,r,s){e._oninfo(A,t,r,s)}))};Dicer.prototype._ignore=function(){if(this._part&&!this._ignoreData){this._ignoreData=true;this._part.on("error",EMPTY_FN);this._part.resume()}};Dicer.prototype._oninfo=function(A,e,t,r){let s;const o=this;let i=0;let g;let c=true;if(!this._part&&this._justMatched&&e){while(this._dashes<2&&t+i<r){if(e[t+i]===a){++i;++this._dashes}else{if(this._dashes){s=E}this._dashes=0;break}}if(this._dashes===2){if(t+i<r&&this.listenerCount("trailer")!==0){this.emit("trailer",e.slice(t+i,r))}this.reset();this._finished=true;if(o._parts===0){o._realFinish=true;o.emit("finish");o._realFinish=false}}if(this._dashes){return}}if(this._justMatched){this._justMatched=false}if(!this._part){this._part=new n(this._partOpts);this._part._read=function(A){o._unpause()};if(this._isPreamble&&this.listenerCount("preamble")!==0){this.emit("preamble",this._part)}else if(this._isPreamble!==true&&this.listenerCount("part")!==0){this.emit("part",this._part)}else{this._ignore()}if(!this._isPreamble){this._inHeader=true}}if(e&&t<r&&!this._ignoreData){if(this._isPreamble||!this._inHeader){if(s){c=this._part.push(s)}c=this._part.push(e.slice(t,r));if(!c){this._pause=true}}else if(!this._isPreamble&&this._inHeader){if(s){this._hparser.push(s)}g=this._hparser.push(e.slice(t,r));if(!this._inHeader&&g!==undefined&&g<r){this._oninfo(false,e,t+g,r)}}}if(A){this._hparser.reset();if(this._isPreamble){this._isPreamble=false}else{if(t!==r){++this._parts;this._part.on("end",(function(){if(--o._parts===0){if(o._finished){o._realFinish=true;o.emit("finish");o._realFinish=false}else{o._unpause()}}}))}}this._part.push(null);this._part=undefined;this._ignoreData=false;this._justMatched=true;this._dashes=0}};Dicer.prototype._unpause=function(){if(!this._pause){return}this._pause=false;if(this._cb){const A=this._cb;this._cb=undefined;A()}};A.exports=Dicer},1033:(A,e,t)=>{"use strict";const r=t(8474).EventEmitter;const s=t(7975).inherits;const o=t(5943);const n=t(9330);const i=Buffer.from("\r\n\r\n");const a=/\r\n/g;const E=/^([^:]+):[ \t]?([\x00-\xFF]+)?$/;function HeaderParser(A){r.call(this);A=A||{};const e=this;this.nread=0;this.maxed=false;this.npairs=0;this.maxHeaderPairs=o(A,"maxHeaderPairs",2e3);this.maxHeaderSize=o(A,"maxHeaderSize",80*1024);this.buffer="";this.header={};this.finished=false;this.ss=new n(i);this.ss.on("info",(function(A,t,r,s){if(t&&!e.maxed){if(e.nread+s-r>=e.maxHeaderSize){s=e.maxHeaderSize-e.nread+r;e.nread=e.maxHeaderSize;e.maxed=true}else{e.nread+=s-r}e.buffer+=t.toString("binary",r,s)}if(A){e._finish()}}))}s(HeaderParser,r);HeaderParser.prototype.push=function(A){const e=this.ss.push(A);if(this.finished){return e}};HeaderParser.prototype.reset=function(){this.finished=false;this.buffer="";this.header={};this.ss.reset()};HeaderParser.prototype._finish=function(){if(this.buffer){this._parseHeader()}this.ss.matches=this.ss.maxMatches;const A=this.header;this.header={};this.buffer="";this.finished=true;this.nread=this.npairs=0;this.maxed=false;this.emit("header",A)};HeaderParser.prototype._parseHeader=function(){if(this.npairs===this.maxHeaderPairs){return}const A=this.buffer.split(a);const e=A.length;let t,r;for(var s=0;s<e;++s){if(A[s].length===0){continue}if(A[s][0]==="\t"||A[s][0]===" "){if(r){this.header[r][this.header[r].length-1]+=A[s];continue}}const e=A[s].indexOf(":");if(e===-1||e===0){return}t=E.exec(A[s]);r=t[1].toLowerCase();this.header[r]=this.header[r]||[];this.header[r].push(t[2]||"");if(++this.npairs===this.maxHeaderPairs){break}}};A.exports=HeaderParser},9858:(A,e,t)=>{"use strict";const r=t(7975).inherits;const s=t(7075).Readable;function PartStream(A){s.call(this,A)}r(PartStream,s);PartStream.prototype._read=function(A){};A.exports=PartStream},9330:(A,e,t)=>{"use strict";const r=t(8474).EventEmitter;const s=t(7975).inherits;function SBMH(A){if(typeof A==="string"){A=Buffer.from(A)}if(!Buffer.isBuffer(A)){throw new TypeError("The needle has to be a String or a Buffer.")}const e=A.length;if(e===0){throw new Error("The needle cannot be an empty String/Buffer.")}if(e>256){throw new Error("The needle cannot have a length bigger than 256.")}this.maxMatches=Infinity;this.matches=0;this._occ=new Array(256).fill(e);this._lookbehind_size=0;this._needle=A;this._bufpos=0;this._lookbehind=Buffer.alloc(e);for(var t=0;t<e-1;++t){this._occ[A[t]]=e-1-t}}s(SBMH,r);SBMH.prototype.reset=function(){this._lookbehind_size=0;this.matches=0;this._bufpos=0};SBMH.prototype.push=function(A,e){if(!Buffer.isBuffer(A)){A=Buffer.from(A,"binary")}const t=A.length;this._bufpos=e||0;let r;while(r!==t&&this.matches<this.maxMatches){r=this._sbmh_feed(A)}return r};SBMH.prototype._sbmh_feed=function(A){const e=A.length;const t=this._needle;const r=t.length;const s=t[r-1];let o=-this._lookbehind_size;let n;if(o<0){while(o<0&&o<=e-r){n=this._sbmh_lookup_char(A,o+r-1);if(n===s&&this._sbmh_memcmp(A,o,r-1)){this._lookbehind_size=0;++this.matches;this.emit("info",true);return this._bufpos=o+r}o+=this._occ[n]}if(o<0){while(o<0&&!this._sbmh_memcmp(A,o,e-o)){++o}}if(o>=0){this.emit("info",false,this._lookbehind,0,this._lookbehind_size);this._lookbehind_size=0}else{const t=this._lookbehind_size+o;if(t>0){this.emit("info",false,this._lookbehind,0,t)}this._lookbehind.copy(this._lookbehind,0,t,this._lookbehind_size-t);this._lookbehind_size-=t;A.copy(this._lookbehind,this._lookbehind_size);this._lookbehind_size+=e;this._bufpos=e;return e}}o+=(o>=0)*this._bufpos;if(A.indexOf(t,o)!==-1){o=A.indexOf(t,o);++this.matches;if(o>0){this.emit("info",true,A,this._bufpos,o)}else{this.emit("info",true)}return this._bufpos=o+r}else{o=e-r}while(o<e&&(A[o]!==t[0]||Buffer.compare(A.subarray(o,o+e-o),t.subarray(0,e-o))!==0)){++o}if(o<e){A.copy(this._lookbehind,0,o,o+(e-o));this._lookbehind_size=e-o}if(o>0){this.emit("info",false,A,this._bufpos,o<e?o:e)}this._bufpos=e;return e};SBMH.prototype._sbmh_lookup_char=function(A,e){return e<0?this._lookbehind[this._lookbehind_size+e]:A[e]};SBMH.prototype._sbmh_memcmp=function(A,e,t){for(var r=0;r<t;++r){if(this._sbmh_lookup_char(A,e+r)!==this._needle[r]){return false}}return true};A.exports=SBMH},6555:(A,e,t)=>{"use strict";const r=t(7075).Writable;const{inherits:s}=t(7975);const o=t(4020);const n=t(4914);const i=t(8377);const a=t(55);function Busboy(A){if(!(this instanceof Busboy)){return new Busboy(A)}if(typeof A!=="object"){throw new TypeError("Busboy expected an options-Object.")}if(typeof A.headers!=="object"){throw new TypeError("Busboy expected an options-Object with headers-attribute.")}if(typeof A.headers["content-type"]!=="string"){throw new TypeError("Missing Content-Type-header.")}const{headers:e,...t}=A;this.opts={autoDestroy:false,...t};r.call(this,this.opts);this._done=false;this._parser=this.getParserByHeaders(e);this._finished=false}s(Busboy,r);Busboy.prototype.emit=function(A){if(A==="finish"){if(!this._done){this._parser?.end();return}else if(this._finished){return}this._finished=true}r.prototype.emit.apply(this,arguments)};Busboy.prototype.getParserByHeaders=function(A){const e=a(A["content-type"]);const t={defCharset:this.opts.defCharset,fileHwm:this.opts.fileHwm,headers:A,highWaterMark:this.opts.highWaterMark,isPartAFile:this.opts.isPartAFile,limits:this.opts.limits,parsedConType:e,preservePath:this.opts.preservePath};if(n.detect.test(e[0])){return new n(this,t)}if(i.detect.test(e[0])){return new i(this,t)}throw new Error("Unsupported Content-Type.")};Busboy.prototype._write=function(A,e,t){this._parser.write(A,t)};A.exports=Busboy;A.exports["default"]=Busboy;A.exports.Busboy=Busboy;A.exports.Dicer=o},4914:(A,e,t)=>{"use strict";const{Readable:r}=t(7075);const{inherits:s}=t(7975);const o=t(4020);const n=t(55);const i=t(5021);const a=t(1458);const E=t(5943);const g=/^boundary$/i;const c=/^form-data$/i;const Q=/^charset$/i;const C=/^filename$/i;const B=/^name$/i;Multipart.detect=/^multipart\/form-data/i;function Multipart(A,e){let t;let r;const s=this;let I;const h=e.limits;const l=e.isPartAFile||((A,e,t)=>e==="application/octet-stream"||t!==undefined);const u=e.parsedConType||[];const d=e.defCharset||"utf8";const f=e.preservePath;const p={highWaterMark:e.fileHwm};for(t=0,r=u.length;t<r;++t){if(Array.isArray(u[t])&&g.test(u[t][0])){I=u[t][1];break}}function checkFinished(){if(N===0&&M&&!A._done){M=false;s.end()}}if(typeof I!=="string"){throw new Error("Multipart: Boundary not found")}const y=E(h,"fieldSize",1*1024*1024);const R=E(h,"fileSize",Infinity);const D=E(h,"files",Infinity);const w=E(h,"fields",Infinity);const k=E(h,"parts",Infinity);const m=E(h,"headerPairs",2e3);const b=E(h,"headerSize",80*1024);let F=0;let S=0;let N=0;let U;let L;let M=false;this._needDrain=false;this._pause=false;this._cb=undefined;this._nparts=0;this._boy=A;const T={boundary:I,maxHeaderPairs:m,maxHeaderSize:b,partHwm:p.highWaterMark,highWaterMark:e.highWaterMark};this.parser=new o(T);this.parser.on("drain",(function(){s._needDrain=false;if(s._cb&&!s._pause){const A=s._cb;s._cb=undefined;A()}})).on("part",(function onPart(e){if(++s._nparts>k){s.parser.removeListener("part",onPart);s.parser.on("part",skipPart);A.hitPartsLimit=true;A.emit("partsLimit");return skipPart(e)}if(L){const A=L;A.emit("end");A.removeAllListeners("end")}e.on("header",(function(o){let E;let g;let I;let h;let u;let k;let m=0;if(o["content-type"]){I=n(o["content-type"][0]);if(I[0]){E=I[0].toLowerCase();for(t=0,r=I.length;t<r;++t){if(Q.test(I[t][0])){h=I[t][1].toLowerCase();break}}}}if(E===undefined){E="text/plain"}if(h===undefined){h=d}if(o["content-disposition"]){I=n(o["content-disposition"][0]);if(!c.test(I[0])){return skipPart(e)}for(t=0,r=I.length;t<r;++t){if(B.test(I[t][0])){g=I[t][1]}else if(C.test(I[t][0])){k=I[t][1];if(!f){k=a(k)}}}}else{return skipPart(e)}if(o["content-transfer-encoding"]){u=o["content-transfer-encoding"][0].toLowerCase()}else{u="7bit"}let b,M;if(l(g,E,k)){if(F===D){if(!A.hitFilesLimit){A.hitFilesLimit=true;A.emit("filesLimit")}return skipPart(e)}++F;if(A.listenerCount("file")===0){s.parser._ignore();return}++N;const t=new FileStream(p);U=t;t.on("end",(function(){--N;s._pause=false;checkFinished();if(s._cb&&!s._needDrain){const A=s._cb;s._cb=undefined;A()}}));t._read=function(A){if(!s._pause){return}s._pause=false;if(s._cb&&!s._needDrain){const A=s._cb;s._cb=undefined;A()}};A.emit("file",g,t,k,u,E);b=function(A){if((m+=A.length)>R){const r=R-m+A.length;if(r>0){t.push(A.slice(0,r))}t.truncated=true;t.bytesRead=R;e.removeAllListeners("data");t.emit("limit");return}else if(!t.push(A)){s._pause=true}t.bytesRead=m};M=function(){U=undefined;t.push(null)}}else{if(S===w){if(!A.hitFieldsLimit){A.hitFieldsLimit=true;A.emit("fieldsLimit")}return skipPart(e)}++S;++N;let t="";let r=false;L=e;b=function(A){if((m+=A.length)>y){const s=y-(m-A.length);t+=A.toString("binary",0,s);r=true;e.removeAllListeners("data")}else{t+=A.toString("binary")}};M=function(){L=undefined;if(t.length){t=i(t,"binary",h)}A.emit("field",g,t,false,r,u,E);--N;checkFinished()}}e._readableState.sync=false;e.on("data",b);e.on("end",M)})).on("error",(function(A){if(U){U.emit("error",A)}}))})).on("error",(function(e){A.emit("error",e)})).on("finish",(function(){M=true;checkFinished()}))}Multipart.prototype.write=function(A,e){const t=this.parser.write(A);if(t&&!this._pause){e()}else{this._needDrain=!t;this._cb=e}};Multipart.prototype.end=function(){const A=this;if(A.parser.writable){A.parser.end()}else if(!A._boy._done){process.nextTick((function(){A._boy._done=true;A._boy.emit("finish")}))}};function skipPart(A){A.resume()}function FileStream(A){r.call(this,A);this.bytesRead=0;this.truncated=false}s(FileStream,r);FileStream.prototype._read=function(A){};A.exports=Multipart},8377:(A,e,t)=>{"use strict";const r=t(9818);const s=t(5021);const o=t(5943);const n=/^charset$/i;UrlEncoded.detect=/^application\/x-www-form-urlencoded/i;function UrlEncoded(A,e){const t=e.limits;const s=e.parsedConType;this.boy=A;this.fieldSizeLimit=o(t,"fieldSize",1*1024*1024);this.fieldNameSizeLimit=o(t,"fieldNameSize",100);this.fieldsLimit=o(t,"fields",Infinity);let i;for(var a=0,E=s.length;a<E;++a){if(Array.isArray(s[a])&&n.test(s[a][0])){i=s[a][1].toLowerCase();break}}if(i===undefined){i=e.defCharset||"utf8"}this.decoder=new r;this.charset=i;this._fields=0;this._state="key";this._checkingBytes=true;this._bytesKey=0;this._bytesVal=0;this._key="";this._val="";this._keyTrunc=false;this._valTrunc=false;this._hitLimit=false}UrlEncoded.prototype.write=function(A,e){if(this._fields===this.fieldsLimit){if(!this.boy.hitFieldsLimit){this.boy.hitFieldsLimit=true;this.boy.emit("fieldsLimit")}return e()}let t;let r;let o;let n=0;const i=A.length;while(n<i){if(this._state==="key"){t=r=undefined;for(o=n;o<i;++o){if(!this._checkingBytes){++n}if(A[o]===61){t=o;break}else if(A[o]===38){r=o;break}if(this._checkingBytes&&this._bytesKey===this.fieldNameSizeLimit){this._hitLimit=true;break}else if(this._checkingBytes){++this._bytesKey}}if(t!==undefined){if(t>n){this._key+=this.decoder.write(A.toString("binary",n,t))}this._state="val";this._hitLimit=false;this._checkingBytes=true;this._val="";this._bytesVal=0;this._valTrunc=false;this.decoder.reset();n=t+1}else if(r!==undefined){++this._fields;let t;const o=this._keyTrunc;if(r>n){t=this._key+=this.decoder.write(A.toString("binary",n,r))}else{t=this._key}this._hitLimit=false;this._checkingBytes=true;this._key="";this._bytesKey=0;this._keyTrunc=false;this.decoder.reset();if(t.length){this.boy.emit("field",s(t,"binary",this.charset),"",o,false)}n=r+1;if(this._fields===this.fieldsLimit){return e()}}else if(this._hitLimit){if(o>n){this._key+=this.decoder.write(A.toString("binary",n,o))}n=o;if((this._bytesKey=this._key.length)===this.fieldNameSizeLimit){this._checkingBytes=false;this._keyTrunc=true}}else{if(n<i){this._key+=this.decoder.write(A.toString("binary",n))}n=i}}else{r=undefined;for(o=n;o<i;++o){if(!this._checkingBytes){++n}if(A[o]===38){r=o;break}if(this._checkingBytes&&this._bytesVal===this.fieldSizeLimit){this._hitLimit=true;break}else if(this._checkingBytes){++this._bytesVal}}if(r!==undefined){++this._fields;if(r>n){this._val+=this.decoder.write(A.toString("binary",n,r))}this.boy.emit("field",s(this._key,"binary",this.charset),s(this._val,"binary",this.charset),this._keyTrunc,this._valTrunc);this._state="key";this._hitLimit=false;this._checkingBytes=true;this._key="";this._bytesKey=0;this._keyTrunc=false;this.decoder.reset();n=r+1;if(this._fields===this.fieldsLimit){return e()}}else if(this._hitLimit){if(o>n){this._val+=this.decoder.write(A.toString("binary",n,o))}n=o;if(this._val===""&&this.fieldSizeLimit===0||(this._bytesVal=this._val.length)===this.fieldSizeLimit){this._checkingBytes=false;this._valTrunc=true}}else{if(n<i){this._val+=this.decoder.write(A.toString("binary",n))}n=i}}}e()};UrlEncoded.prototype.end=function(){if(this.boy._done){return}if(this._state==="key"&&this._key.length>0){this.boy.emit("field",s(this._key,"binary",this.charset),"",this._keyTrunc,false)}else if(this._state==="val"){this.boy.emit("field",s(this._key,"binary",this.charset),s(this._val,"binary",this.charset),this._keyTrunc,this._valTrunc)}this.boy._done=true;this.boy.emit("finish")};A.exports=UrlEncoded},9818:A=>{"use strict";const e=/\+/g;const t=[0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0];function Decoder(){this.buffer=undefined}Decoder.prototype.write=function(A){A=A.replace(e," ");let r="";let s=0;let o=0;const n=A.length;for(;s<n;++s){if(this.buffer!==undefined){if(!t[A.charCodeAt(s)]){r+="%"+this.buffer;this.buffer=undefined;--s}else{this.buffer+=A[s];++o;if(this.buffer.length===2){r+=String.fromCharCode(parseInt(this.buffer,16));this.buffer=undefined}}}else if(A[s]==="%"){if(s>o){r+=A.substring(o,s);o=s}this.buffer="";++o}}if(o<n&&this.buffer===undefined){r+=A.substring(o)}return r};Decoder.prototype.reset=function(){this.buffer=undefined};A.exports=Decoder},1458:A=>{"use strict";A.exports=function basename(A){if(typeof A!=="string"){return""}for(var e=A.length-1;e>=0;--e){switch(A.charCodeAt(e)){case 47:case 92:A=A.slice(e+1);return A===".."||A==="."?"":A}}return A===".."||A==="."?"":A}},5021:function(A){"use strict";const e=new TextDecoder("utf-8");const t=new Map([["utf-8",e],["utf8",e]]);function getDecoder(A){let e;while(true){switch(A){case"utf-8":case"utf8":return r.utf8;case"latin1":case"ascii":case"us-ascii":case"iso-8859-1":case"iso8859-1":case"iso88591":case"iso_8859-1":case"windows-1252":case"iso_8859-1:1987":case"cp1252":case"x-cp1252":return r.latin1;case"utf16le":case"utf-16le":case"ucs2":case"ucs-2":return r.utf16le;case"base64":return r.base64;default:if(e===undefined){e=true;A=A.toLowerCase();continue}return r.other.bind(A)}}}const r={utf8:(A,e)=>{if(A.length===0){return""}if(typeof A==="string"){A=Buffer.from(A,e)}return A.utf8Slice(0,A.length)},latin1:(A,e)=>{if(A.length===0){return""}if(typeof A==="string"){return A}return A.latin1Slice(0,A.length)},utf16le:(A,e)=>{if(A.length===0){return""}if(typeof A==="string"){A=Buffer.from(A,e)}return A.ucs2Slice(0,A.length)},base64:(A,e)=>{if(A.length===0){return""}if(typeof A==="string"){A=Buffer.from(A,e)}return A.base64Slice(0,A.length)},other:(A,e)=>{if(A.length===0){return""}if(typeof A==="string"){A=Buffer.from(A,e)}if(t.has(this.toString())){try{return t.get(this).decode(A)}catch{}}return typeof A==="string"?A:A.toString()}};function decodeText(A,e,t){if(A){return getDecoder(t)(A,e)}return A}A.exports=decodeText},5943:A=>{"use strict";A.exports=function getLimit(A,e,t){if(!A||A[e]===undefined||A[e]===null){return t}if(typeof A[e]!=="number"||isNaN(A[e])){throw new TypeError("Limit "+e+" is not a valid number")}return A[e]}},55:(A,e,t)=>{"use strict";const r=t(5021);const s=/%[a-fA-F0-9][a-fA-F0-9]/g;const o={"%00":"\0","%01":"","%02":"","%03":"","%04":"","%05":"","%06":"","%07":"","%08":"\b","%09":"\t","%0a":"\n","%0A":"\n","%0b":"\v","%0B":"\v","%0c":"\f","%0C":"\f","%0d":"\r","%0D":"\r","%0e":"","%0E":"","%0f":"","%0F":"","%10":"","%11":"","%12":"","%13":"","%14":"","%15":"","%16":"","%17":"","%18":"","%19":"","%1a":"","%1A":"","%1b":"","%1B":"","%1c":"","%1C":"","%1d":"","%1D":"","%1e":"","%1E":"","%1f":"","%1F":"","%20":" ","%21":"!","%22":'"',"%23":"#","%24":"$","%25":"%","%26":"&","%27":"'","%28":"(","%29":")","%2a":"*","%2A":"*","%2b":"+","%2B":"+","%2c":",","%2C":",","%2d":"-","%2D":"-","%2e":".","%2E":".","%2f":"/","%2F":"/","%30":"0","%31":"1","%32":"2","%33":"3","%34":"4","%35":"5","%36":"6","%37":"7","%38":"8","%39":"9","%3a":":","%3A":":","%3b":";","%3B":";","%3c":"<","%3C":"<","%3d":"=","%3D":"=","%3e":">","%3E":">","%3f":"?","%3F":"?","%40":"@","%41":"A","%42":"B","%43":"C","%44":"D","%45":"E","%46":"F","%47":"G","%48":"H","%49":"I","%4a":"J","%4A":"J","%4b":"K","%4B":"K","%4c":"L","%4C":"L","%4d":"M","%4D":"M","%4e":"N","%4E":"N","%4f":"O","%4F":"O","%50":"P","%51":"Q","%52":"R","%53":"S","%54":"T","%55":"U","%56":"V","%57":"W","%58":"X","%59":"Y","%5a":"Z","%5A":"Z","%5b":"[","%5B":"[","%5c":"\\","%5C":"\\","%5d":"]","%5D":"]","%5e":"^","%5E":"^","%5f":"_","%5F":"_","%60":"`","%61":"a","%62":"b","%63":"c","%64":"d","%65":"e","%66":"f","%67":"g","%68":"h","%69":"i","%6a":"j","%6A":"j","%6b":"k","%6B":"k","%6c":"l","%6C":"l","%6d":"m","%6D":"m","%6e":"n","%6E":"n","%6f":"o","%6F":"o","%70":"p","%71":"q","%72":"r","%73":"s","%74":"t","%75":"u","%76":"v","%77":"w","%78":"x","%79":"y","%7a":"z","%7A":"z","%7b":"{","%7B":"{","%7c":"|","%7C":"|","%7d":"}","%7D":"}","%7e":"~","%7E":"~","%7f":"","%7F":"","%80":"","%81":"","%82":"","%83":"","%84":"","%85":"","%86":"","%87":"","%88":"","%89":"","%8a":"","%8A":"","%8b":"","%8B":"","%8c":"","%8C":"","%8d":"","%8D":"","%8e":"","%8E":"","%8f":"","%8F":"","%90":"","%91":"","%92":"","%93":"","%94":"","%95":"","%96":"","%97":"","%98":"","%99":"","%9a":"","%9A":"","%9b":"","%9B":"","%9c":"","%9C":"","%9d":"","%9D":"","%9e":"","%9E":"","%9f":"","%9F":"","%a0":" ","%A0":" ","%a1":"¡","%A1":"¡","%a2":"¢","%A2":"¢","%a3":"£","%A3":"£","%a4":"¤","%A4":"¤","%a5":"¥","%A5":"¥","%a6":"¦","%A6":"¦","%a7":"§","%A7":"§","%a8":"¨","%A8":"¨","%a9":"©","%A9":"©","%aa":"ª","%Aa":"ª","%aA":"ª","%AA":"ª","%ab":"«","%Ab":"«","%aB":"«","%AB":"«","%ac":"¬","%Ac":"¬","%aC":"¬","%AC":"¬","%ad":"­","%Ad":"­","%aD":"­","%AD":"­","%ae":"®","%Ae":"®","%aE":"®","%AE":"®","%af":"¯","%Af":"¯","%aF":"¯","%AF":"¯","%b0":"°","%B0":"°","%b1":"±","%B1":"±","%b2":"²","%B2":"²","%b3":"³","%B3":"³","%b4":"´","%B4":"´","%b5":"µ","%B5":"µ","%b6":"¶","%B6":"¶","%b7":"·","%B7":"·","%b8":"¸","%B8":"¸","%b9":"¹","%B9":"¹","%ba":"º","%Ba":"º","%bA":"º","%BA":"º","%bb":"»","%Bb":"»","%bB":"»","%BB":"»","%bc":"¼","%Bc":"¼","%bC":"¼","%BC":"¼","%bd":"½","%Bd":"½","%bD":"½","%BD":"½","%be":"¾","%Be":"¾","%bE":"¾","%BE":"¾","%bf":"¿","%Bf":"¿","%bF":"¿","%BF":"¿","%c0":"À","%C0":"À","%c1":"Á","%C1":"Á","%c2":"Â","%C2":"Â","%c3":"Ã","%C3":"Ã","%c4":"Ä","%C4":"Ä","%c5":"Å","%C5":"Å","%c6":"Æ","%C6":"Æ","%c7":"Ç","%C7":"Ç","%c8":"È","%C8":"È","%c9":"É","%C9":"É","%ca":"Ê","%Ca":"Ê","%cA":"Ê","%CA":"Ê","%cb":"Ë","%Cb":"Ë","%cB":"Ë","%CB":"Ë","%cc":"Ì","%Cc":"Ì","%cC":"Ì","%CC":"Ì","%cd":"Í","%Cd":"Í","%cD":"Í","%CD":"Í","%ce":"Î","%Ce":"Î","%cE":"Î","%CE":"Î","%cf":"Ï","%Cf":"Ï","%cF":"Ï","%CF":"Ï","%d0":"Ð","%D0":"Ð","%d1":"Ñ","%D1":"Ñ","%d2":"Ò","%D2":"Ò","%d3":"Ó","%D3":"Ó","%d4":"Ô","%D4":"Ô","%d5":"Õ","%D5":"Õ","%d6":"Ö","%D6":"Ö","%d7":"×","%D7":"×","%d8":"Ø","%D8":"Ø","%d9":"Ù","%D9":"Ù","%da":"Ú","%Da":"Ú","%dA":"Ú","%DA":"Ú","%db":"Û","%Db":"Û","%dB":"Û","%DB":"Û","%dc":"Ü","%Dc":"Ü","%dC":"Ü","%DC":"Ü","%dd":"Ý","%Dd":"Ý","%dD":"Ý","%DD":"Ý","%de":"Þ","%De":"Þ","%dE":"Þ","%DE":"Þ","%df":"ß","%Df":"ß","%dF":"ß","%DF":"ß","%e0":"à","%E0":"à","%e1":"á","%E1":"á","%e2":"â","%E2":"â","%e3":"ã","%E3":"ã","%e4":"ä","%E4":"ä","%e5":"å","%E5":"å","%e6":"æ","%E6":"æ","%e7":"ç","%E7":"ç","%e8":"è","%E8":"è","%e9":"é","%E9":"é","%ea":"ê","%Ea":"ê","%eA":"ê","%EA":"ê","%eb":"ë","%Eb":"ë","%eB":"ë","%EB":"ë","%ec":"ì","%Ec":"ì","%eC":"ì","%EC":"ì","%ed":"í","%Ed":"í","%eD":"í","%ED":"í","%ee":"î","%Ee":"î","%eE":"î","%EE":"î","%ef":"ï","%Ef":"ï","%eF":"ï","%EF":"ï","%f0":"ð","%F0":"ð","%f1":"ñ","%F1":"ñ","%f2":"ò","%F2":"ò","%f3":"ó","%F3":"ó","%f4":"ô","%F4":"ô","%f5":"õ","%F5":"õ","%f6":"ö","%F6":"ö","%f7":"÷","%F7":"÷","%f8":"ø","%F8":"ø","%f9":"ù","%F9":"ù","%fa":"ú","%Fa":"ú","%fA":"ú","%FA":"ú","%fb":"û","%Fb":"û","%fB":"û","%FB":"û","%fc":"ü","%Fc":"ü","%fC":"ü","%FC":"ü","%fd":"ý","%Fd":"ý","%fD":"ý","%FD":"ý","%fe":"þ","%Fe":"þ","%fE":"þ","%FE":"þ","%ff":"ÿ","%Ff":"ÿ","%fF":"ÿ","%FF":"ÿ"};function encodedReplacer(A){return o[A]}const n=0;const i=1;const a=2;const E=3;function parseParams(A){const e=[];let t=n;let o="";let g=false;let c=false;let Q=0;let C="";const B=A.length;for(var I=0;I<B;++I){const B=A[I];if(B==="\\"&&g){if(c){c=false}else{c=true;continue}}else if(B==='"'){if(!c){if(g){g=false;t=n}else{g=true}continue}else{c=false}}else{if(c&&g){C+="\\"}c=false;if((t===a||t===E)&&B==="'"){if(t===a){t=E;o=C.substring(1)}else{t=i}C="";continue}else if(t===n&&(B==="*"||B==="=")&&e.length){t=B==="*"?a:i;e[Q]=[C,undefined];C="";continue}else if(!g&&B===";"){t=n;if(o){if(C.length){C=r(C.replace(s,encodedReplacer),"binary",o)}o=""}else if(C.length){C=r(C,"binary","utf8")}if(e[Q]===undefined){e[Q]=C}else{e[Q][1]=C}C="";++Q;continue}else if(!g&&(B===" "||B==="\t")){continue}}C+=B}if(o&&C.length){C=r(C.replace(s,encodedReplacer),"binary",o)}else if(C){C=r(C,"binary","utf8")}if(e[Q]===undefined){if(C){e[Q]=C}}else{e[Q][1]=C}return e}A.exports=parseParams}};var e={};function __nccwpck_require__(t){var r=e[t];if(r!==undefined){return r.exports}var s=e[t]={exports:{}};var o=true;try{A[t].call(s.exports,s,s.exports,__nccwpck_require__);o=false}finally{if(o)delete e[t]}return s.exports}if(typeof __nccwpck_require__!=="undefined")__nccwpck_require__.ab=__dirname+"/";var t={};const r=__nccwpck_require__(8770);const{spawn:s}=__nccwpck_require__(5317);function run(A){const e=s(A,{stdio:"inherit",shell:true});e.on("exit",(A=>{process.exitCode=A}))}try{const A=process.env.GITHUB_ACTION_PATH;const e=r.getInput("oci-compartment-name");const t=r.getInput("oci-name-suffix");const i=r.getInput("oci-region");const o=r.getInput("oci-config-profile")||"DEFAULT";const n=r.getInput("oci-share-key");run(`uv run --frozen --project=${A} ${A}/stop/stop_js/stop.py --config-file='.oci/config' --name-suffix=${t} --compartment-name=${e} --region='${i}' --config-profile='${o}' --share-key='${n}' --events-file=proxy_events.jsonl; status=$?; if [ -e proxy_events.jsonl ]; then python3 ${A}/events/convert_events.py proxy_events.jsonl --trace-out=proxy_trace.json --summary-run=stop --latest-run-id --summary-out="$GITHUB_STEP_SUMMARY"; fi; exit $status`)}catch(A){r.setFailed(A.message)}module.exports=t})();
\ No newline at end of file
@@ -13,8 +13,14 @@ try {
 
   const ociCompartmentName = core.getInput('oci-compartment-name');
   const ociNameSuffix = core.getInput('oci-name-suffix');
-
-  run(`uv run --with=oci ${action_dir}/stop/stop_js/stop.py --config-file='.oci/config' --name-suffix=${ociNameSuffix} --compartment-name=${ociCompartmentName}`);
+  const ociRegion = core.getInput('oci-region');
+  const ociConfigProfile = core.getInput('oci-config-profile') || 'DEFAULT';
+  const ociShareKey = core.getInput('oci-share-key');
+
+  const stop = `uv run --frozen --project=${action_dir} ${action_dir}/stop/stop_js/stop.py --config-file='.oci/config' --name-suffix=${ociNameSuffix} --compartment-name=${ociCompartmentName} --region='${ociRegion}' --config-profile='${ociConfigProfile}' --share-key='${ociShareKey}' --events-file=proxy_events.jsonl`;
+  // the start action summarized its events before teardown, the stop events are added here
+  const report = `python3 ${action_dir}/events/convert_events.py proxy_events.jsonl --trace-out=proxy_trace.json --summary-run=stop --latest-run-id --summary-out="$GITHUB_STEP_SUMMARY"`;
+  run(`${stop}; status=$?; if [ -e proxy_events.jsonl ]; then ${report}; fi; exit $status`);
 
 } catch (error) {
   core.setFailed(error.message);
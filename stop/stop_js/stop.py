@@ -1,6 +1,16 @@
+import sys
+import time
 import argparse
 
-import oci
+from oci_proxy import lazy_import
+from oci_proxy.clients import RateLimiter, create_clients, create_compute_management_client
+from oci_proxy.events import EventLog
+from oci_proxy.lookups import get_instance_by_name
+from oci_proxy.sharing import SHARE_KEY_TAG, update_refcount
+from oci_proxy.teardown import terminate_instance, delete_vcn
+
+oci = lazy_import('oci')
+
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -8,9 +18,17 @@ def parse_arguments():
     parser.add_argument('--config-file', required=True, help='Location of config file')
     parser.add_argument('--compartment-name', required=True, help='Name of the compartment')
     parser.add_argument('--name-suffix', required=True, help='Suffix for all the generated names')
+    parser.add_argument('--config-profile', default='DEFAULT', help='Config profile the proxy was started with (default: DEFAULT)')
+    parser.add_argument('--region', default='', help='Region the proxy was started in (empty means the region of the profile)')
+    parser.add_argument('--share-key', default='', help='Key the proxy was shared under, it is only torn down when the last user releases it (empty means not shared)')
+    parser.add_argument('--events-file', default='', help='Path to append structured JSON line events to (empty means no events)')
+    parser.add_argument('--api-rate', type=float, default=2.0, help='Sustained OCI API calls per second allowed per service')
+    parser.add_argument('--api-burst', type=int, default=4, help='Burst size of the per service OCI API token bucket')
+    parser.add_argument('--retry-budget', type=int, default=30, help='Total number of OCI API retries allowed for this run')
 
     return parser.parse_args()
- 
+
+
 def get_compartment_id_by_name(config, identity_client, compartment_name):
     """Get compartment ID by name."""
     # First, get the root compartment (tenancy) ID
@@ -30,65 +48,81 @@ def get_compartment_id_by_name(config, identity_client, compartment_name):
     # If not found
     raise ValueError(f"Compartment with name '{compartment_name}' not found.")
 
-def get_instance_by_name(compute, compartment_id, instance_name):
-    """Get instance by name."""
-    instances = compute.list_instances(
+def find_instance_pool(compute_management, compartment_id, pool_name):
+    """Find a live instance pool by name, None when the proxy was not launched through a pool."""
+    pools = oci.pagination.list_call_get_all_results(
+        compute_management.list_instance_pools,
         compartment_id=compartment_id
     ).data
-    
-    for instance in instances:
-        if instance.display_name == instance_name and instance.lifecycle_state != "TERMINATED":
-            return instance
-    
-    raise ValueError(f"Instance with name '{instance_name}' not found.")
 
+    for pool in pools:
+        if pool.display_name == pool_name and pool.lifecycle_state not in ('TERMINATING', 'TERMINATED'):
+            return pool
+    return None
 
-def terminate_instance(compute, instance_id, wait=True):
-    """Terminate a compute instance."""
-    print(f"Terminating instance: {instance_id}...")
-    compute.terminate_instance(instance_id)
-    
-    if wait:
-        try:
-            oci.wait_until(
-                compute,
-                compute.get_instance(instance_id),
-                'lifecycle_state',
-                'TERMINATED',
-                max_wait_seconds=300
-            )
-            print(f"Instance {instance_id} terminated successfully.")
-        except oci.exceptions.ServiceError as e:
-            if e.status == 404:
-                print(f"Instance {instance_id} terminated successfully.")
-            else:
-                raise
 
-def delete_vcn(network, vcn_id, wait=True):
-    """Delete a VCN."""
-    print(f"Deleting VCN: {vcn_id}...")
-    network.delete_vcn(vcn_id)
-    
+def terminate_instance_pool(compute_management, pool_id, wait=True):
+    """Terminate an instance pool together with all of its instances."""
+    print(f"Terminating instance pool: {pool_id}...")
+    compute_management.terminate_instance_pool(pool_id)
+
     if wait:
         try:
-            oci.wait_until(
-                network,
-                network.get_vcn(vcn_id),
+            compute_management.wait_until(
+                compute_management.get_instance_pool(pool_id),
                 'lifecycle_state',
                 'TERMINATED',
-                max_wait_seconds=300
+                max_wait_seconds=600
             )
-            print(f"VCN {vcn_id} deleted successfully.")
+            print(f"Instance pool {pool_id} terminated successfully.")
         except oci.exceptions.ServiceError as e:
             if e.status == 404:
-                print(f"VCN {vcn_id} deleted successfully.")
+                print(f"Instance pool {pool_id} terminated successfully.")
             else:
                 raise
 
 
+def delete_instance_configuration(compute_management, compartment_id, configuration_name):
+    """Delete the instance configuration a pool was launched from, if there is one."""
+    configurations = oci.pagination.list_call_get_all_results(
+        compute_management.list_instance_configurations,
+        compartment_id=compartment_id
+    ).data
+
+    for configuration in configurations:
+        if configuration.display_name == configuration_name:
+            print(f"Deleting instance configuration: {configuration.id}...")
+            compute_management.delete_instance_configuration(configuration.id)
+
+
+def release_shared_instance(compute, network, compartment_id, suffix, share_key):
+    """Drop our reference on a shared proxy, returning whether we were the last user."""
+    try:
+        instance = get_instance_by_name(compute, compartment_id, f'proxy-{suffix}')
+    except ValueError:
+        return True
+
+    if (instance.freeform_tags or {}).get(SHARE_KEY_TAG) != share_key:
+        return True
+
+    refcount = update_refcount(compute, instance.id, -1)
+    if refcount > 0:
+        print(f"Shared proxy proxy-{suffix} is still used by {refcount} jobs, leaving it running")
+        return False
+
+    # untag the VCN so that new runs do not wait on a proxy that is going away
+    try:
+        vcn = get_vcn_by_name(network, compartment_id, f'vcn-{suffix}')
+    except ValueError:
+        return True
+    network.update_vcn(vcn.id, oci.core.models.UpdateVcnDetails(freeform_tags={}))
+    return True
+
+
 def get_vcn_by_name(network, compartment_id, vcn_name):
     """Get VCN by name."""
-    vcns = network.list_vcns(
+    vcns = oci.pagination.list_call_get_all_results(
+        network.list_vcns,
         compartment_id=compartment_id
     ).data
     
@@ -105,8 +139,7 @@ def delete_internet_gateway(network, ig_id, wait=True):
     
     if wait:
         try:
-            oci.wait_until(
-                network,
+            network.wait_until(
                 network.get_internet_gateway(ig_id),
                 'lifecycle_state',
                 'TERMINATED',
@@ -144,8 +177,7 @@ def delete_security_list(network, security_list_id, wait=True):
     
     if wait:
         try:
-            oci.wait_until(
-                network,
+            network.wait_until(
                 network.get_security_list(security_list_id),
                 'lifecycle_state',
                 'TERMINATED',
@@ -192,8 +224,7 @@ def delete_subnet(network, subnet_id, wait=True):
     
     if wait:
         try:
-            oci.wait_until(
-                network,
+            network.wait_until(
                 network.get_subnet(subnet_id),
                 'lifecycle_state',
                 'TERMINATED',
@@ -210,51 +241,110 @@ def main():
     # Parse command line arguments
     args = parse_arguments()
 
-    config = oci.config.from_file(file_location=args.config_file)
+    events = EventLog(args.events_file, 'stop')
+
+    config = oci.config.from_file(file_location=args.config_file, profile_name=args.config_profile)
+    if args.region != '':
+        config['region'] = args.region
     
-    compute_client = oci.core.ComputeClient(config)
-    network_client = oci.core.VirtualNetworkClient(config)
-    identity_client = oci.identity.IdentityClient(config)
+    limiter = RateLimiter(args.api_rate, args.api_burst, args.retry_budget)
+    compute_client, network_client, identity_client = create_clients(config, limiter)
 
     suffix = args.name_suffix
-
-    compartment_id = get_compartment_id_by_name(config,
-                                                identity_client,
-                                                args.compartment_name)
+    run_start = time.monotonic()
 
     try:
-        instance = get_instance_by_name(compute_client, compartment_id, f'proxy-{suffix}')
-        terminate_instance(compute_client, instance.id)
-    except Exception as ex:
-        print(f'ERROR: deleting instance proxy-{suffix} failed with ex: {ex}.. continuing')
-
-    vcn = get_vcn_by_name(network_client, compartment_id, f'vcn-{suffix}')
-
-    subnet = get_subnet_by_name(network_client, compartment_id, vcn.id, f'subnet-{suffix}')
-    print(f"Found subnet: {subnet.id} ({subnet.display_name})")
-
-    # deleting subnet
-    delete_subnet(network_client, subnet.id)
-
-    # clear routing tables
-    route_tables = get_route_tables(network_client, compartment_id, vcn.id)
-    for rt in route_tables:
-        if len(rt.route_rules) > 0:
-            update_route_table(network_client, rt.id)
-
-    # delete security lists
-    security_lists = get_security_lists(network_client, compartment_id, vcn.id)
-    for sl in security_lists:
-        if sl.display_name != f"Default Security List for {vcn.display_name}":
-            delete_security_list(network_client, sl.id)
-
-    # delete internet_gateways
-    internet_gateways = get_internet_gateways(network_client, compartment_id, vcn.id)
-    for ig in internet_gateways:
-        delete_internet_gateway(network_client, ig.id)
-
-    # delete vcn
-    delete_vcn(network_client, vcn.id)
+        with events.phase('get_compartment', 'compartment') as event:
+            compartment_id = get_compartment_id_by_name(config,
+                                                        identity_client,
+                                                        args.compartment_name)
+            event['ocid'] = compartment_id
+
+        if args.share_key != '':
+            with events.phase('release_shared_proxy', 'instance') as event:
+                is_last_user = release_shared_instance(compute_client,
+                                                       network_client,
+                                                       compartment_id,
+                                                       suffix,
+                                                       args.share_key)
+                event['last_user'] = is_last_user
+            if not is_last_user:
+                events.emit('stop', 'proxy', None, run_start, time.monotonic() - run_start)
+                return
+
+        compute_management_client = create_compute_management_client(config, limiter)
+        pool = find_instance_pool(compute_management_client, compartment_id, f'pool-{suffix}')
+        if pool is not None:
+            try:
+                with events.phase('terminate_instance_pool', 'instance_pool') as event:
+                    event['ocid'] = pool.id
+                    terminate_instance_pool(compute_management_client, pool.id)
+                with events.phase('delete_instance_configuration', 'instance_configuration') as event:
+                    event['ocid'] = pool.instance_configuration_id
+                    delete_instance_configuration(compute_management_client, compartment_id, f'ic-{suffix}')
+            except Exception as ex:
+                print(f'ERROR: deleting instance pool pool-{suffix} failed with ex: {ex}.. continuing')
+        else:
+            try:
+                with events.phase('terminate_instance', 'instance') as event:
+                    instance = get_instance_by_name(compute_client, compartment_id, f'proxy-{suffix}')
+                    event['ocid'] = instance.id
+                    terminate_instance(compute_client, instance.id)
+            except Exception as ex:
+                print(f'ERROR: deleting instance proxy-{suffix} failed with ex: {ex}.. continuing')
+
+        try:
+            vcn = get_vcn_by_name(network_client, compartment_id, f'vcn-{suffix}')
+        except ValueError:
+            # a job that attached to a shared proxy deletes its own VCN right away
+            print(f"VCN vcn-{suffix} is already gone, nothing left to clean up")
+            events.emit('stop', 'proxy', None, run_start, time.monotonic() - run_start)
+            return
+
+        subnet = get_subnet_by_name(network_client, compartment_id, vcn.id, f'subnet-{suffix}')
+        print(f"Found subnet: {subnet.id} ({subnet.display_name})")
+
+        # deleting subnet
+        with events.phase('delete_subnet', 'subnet') as event:
+            event['ocid'] = subnet.id
+            delete_subnet(network_client, subnet.id)
+
+        # clear routing tables
+        route_tables = get_route_tables(network_client, compartment_id, vcn.id)
+        for rt in route_tables:
+            if len(rt.route_rules) > 0:
+                with events.phase('update_route_table', 'route_table') as event:
+                    event['ocid'] = rt.id
+                    update_route_table(network_client, rt.id)
+
+        # delete security lists
+        security_lists = get_security_lists(network_client, compartment_id, vcn.id)
+        for sl in security_lists:
+            if sl.display_name != f"Default Security List for {vcn.display_name}":
+                with events.phase('delete_security_list', 'security_list') as event:
+                    event['ocid'] = sl.id
+                    delete_security_list(network_client, sl.id)
+
+        # delete internet_gateways
+        internet_gateways = get_internet_gateways(network_client, compartment_id, vcn.id)
+        for ig in internet_gateways:
+            with events.phase('delete_internet_gateway', 'internet_gateway') as event:
+                event['ocid'] = ig.id
+                delete_internet_gateway(network_client, ig.id)
+
+        # delete vcn
+        with events.phase('delete_vcn', 'vcn') as event:
+            event['ocid'] = vcn.id
+            delete_vcn(network_client, vcn.id)
+
+        events.emit('stop', 'proxy', None, run_start, time.monotonic() - run_start)
+    except Exception as e:
+        events.emit('stop', 'proxy', None, run_start, time.monotonic() - run_start, 'error', error=str(e))
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        print(f"OCI API stats: {limiter.metrics}")
+        events.emit('api_stats', 'oci_api', **limiter.metrics)
 
 
 if __name__ == "__main__":